@@ -0,0 +1,142 @@
+"""
+Per-method cost benchmarks for AarnaRegistry, and for deploying one
+through AarnaFactory.
+
+    python -m benchmarks                     # emulator + LocalNet simulate
+    python -m benchmarks --backend emulator  # offline only
+    python -m benchmarks --update-baseline   # accept the current numbers
+    python -m benchmarks --check             # exit 1 if a cost went up
+
+Prints one JSON document with the metrics per case and their difference
+from the stored baseline. Build the contracts first: the simulate backend
+runs the current TEAL, and program sizes are read from the bytecode the
+build writes. With the simulate backend, a fresh factory also uploads the
+registry build and creates a registry from it, which fails the run if the
+child does not come up as the factory set it up.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any
+
+from benchmarks import program
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+# Metrics that --check treats as regressions when they increase
+GATED_METRICS = ("opcode_cost", "mbr", "inner_txns", "approval_bytes", "approval_pages")
+# Reported in results but left out of the diff; wall time varies run to run
+UNDIFFED_METRICS = ("wall_us",)
+
+
+def collect(backend: str) -> dict[str, Any]:
+    """Run the requested backends and return their metrics keyed by backend."""
+    results: dict[str, Any] = {}
+    if backend in ("emulator", "all"):
+        from benchmarks import emulator
+
+        results["emulator"] = emulator.run()
+    if backend in ("simulate", "all"):
+        from benchmarks import factory, simulate
+
+        results["simulate"] = simulate.run()
+        results["factory"] = factory.run()
+    results["program"] = program.sizes()
+    return results
+
+
+def _flatten(results: dict[str, Any], prefix: str = "") -> dict[str, int]:
+    flat: dict[str, int] = {}
+    for key, value in results.items():
+        path = f"{prefix}/{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(_flatten(value, path))
+        else:
+            flat[path] = value
+    return flat
+
+
+def diff(results: dict[str, Any], baseline: dict[str, Any]) -> dict[str, dict[str, int | None]]:
+    """
+    Metrics that differ from the baseline, keyed "backend/case/metric".
+    A metric missing on one side is reported with None on that side.
+    """
+    current, previous = _flatten(results), _flatten(baseline)
+    changes: dict[str, dict[str, int | None]] = {}
+    for path in sorted(current.keys() | previous.keys()):
+        if path.split("/")[0] not in results or path.rsplit("/", 1)[-1] in UNDIFFED_METRICS:
+            continue  # backend not run this time, or too noisy to compare
+        before, after = previous.get(path), current.get(path)
+        if before == after:
+            continue
+        change: dict[str, int | None] = {"baseline": before, "current": after}
+        if before is not None and after is not None:
+            change["delta"] = after - before
+        changes[path] = change
+    return changes
+
+
+def regressions(changes: dict[str, dict[str, int | None]]) -> list[str]:
+    return [
+        path
+        for path, change in changes.items()
+        if path.rsplit("/", 1)[-1] in GATED_METRICS and (change.get("delta") or 0) > 0
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--backend", choices=("emulator", "simulate", "all"), default="all")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--output", type=Path, help="write the report here instead of stdout")
+    parser.add_argument(
+        "--update-baseline", action="store_true", help="store this run as the new baseline"
+    )
+    parser.add_argument(
+        "--check", action="store_true", help="fail if any gated metric increased"
+    )
+    options = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    results = collect(options.backend)
+
+    baseline: dict[str, Any] = {}
+    if options.baseline.exists():
+        baseline = json.loads(options.baseline.read_text())
+    else:
+        logger.info(f"No baseline at {options.baseline}")
+    changes = diff(results, baseline)
+
+    report = json.dumps({"results": results, "diff": changes}, indent=2, sort_keys=True)
+    if options.output:
+        options.output.write_text(report + "\n")
+    else:
+        print(report)
+
+    if options.update_baseline:
+        # Keep backends that were not run this time
+        options.baseline.write_text(
+            json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n"
+        )
+        logger.info(f"Baseline updated: {options.baseline}")
+        return 0
+    if options.check:
+        failed = regressions(changes)
+        for path in failed:
+            change = changes[path]
+            logger.error(f"Regression: {path} {change['baseline']} -> {change['current']}")
+        return 1 if failed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
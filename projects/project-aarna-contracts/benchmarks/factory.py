@@ -0,0 +1,200 @@
+"""
+Runs the AarnaFactory deployment path against the compiled TEAL on LocalNet.
+
+A fresh factory takes the current AarnaRegistry build, creates a regional
+registry from it and syncs it back, the way its deploy config does. Each
+step reports opcode cost, inner transactions and the MBR it adds to the
+factory, like the simulate backend. The child is then checked end to end:
+it must run the uploaded program, hold its own AARNA asset, and answer to
+the factory as admin and to the validator it was given.
+
+The emulator cannot run this path, as it does not compile the child.
+"""
+
+from collections.abc import Callable
+from typing import Any
+
+import algokit_utils
+from algokit_utils import AlgoAmount
+
+from benchmarks.program import ARTIFACTS
+from benchmarks.simulate import SimulateBench, _count_inner
+from smart_contracts.aarna_factory.contract import REGISTRY_FUNDING
+from smart_contracts.aarna_factory.deploy_config import (
+    CREATE_REGISTRY_INNER_TXNS,
+    FACTORY_FUNDING,
+    PROGRAM_CHUNK_BYTES,
+    create_registry_mbr,
+    program_box_mbr,
+    registry_program,
+    registry_program_digest,
+)
+
+APP_SPEC = ARTIFACTS.parent / "aarna_factory" / "AarnaFactory.arc56.json"
+REGISTRY_APP_SPEC = ARTIFACTS / "AarnaRegistry.arc56.json"
+REGION = "benchmark"
+
+
+class FactoryBench(SimulateBench):
+    def __init__(self, algorand: algokit_utils.AlgorandClient) -> None:
+        super().__init__(algorand)
+        self.validator = self._funded_account()
+
+    def create(self) -> None:
+        factory = self.algorand.client.get_app_factory(
+            app_spec=APP_SPEC.read_text(), default_sender=self.admin.address
+        )
+        self.client, _result = factory.send.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(method="init()void")
+        )
+        self.algorand.send.payment(
+            algokit_utils.PaymentParams(
+                sender=self.admin.address,
+                receiver=self.client.app_address,
+                amount=FACTORY_FUNDING,
+            )
+        )
+
+    def _method(
+        self, method: str, args: list[Any], **params: Any
+    ) -> algokit_utils.AppCallMethodCallParams:
+        return self.client.params.call(
+            algokit_utils.AppClientMethodCallParams(method=method, args=args, **params)
+        )
+
+    def _payment(self, micro_algo: int) -> Any:
+        return self.algorand.create_transaction.payment(
+            algokit_utils.PaymentParams(
+                sender=self.admin.address,
+                receiver=self.client.app_address,
+                amount=AlgoAmount(micro_algo=micro_algo),
+            )
+        )
+
+    def send(
+        self, case: str, compose: Callable[[], algokit_utils.TransactionComposer]
+    ) -> Any:
+        """Measure the group `compose` builds, send it and return its first return."""
+        group = self._simulate(case, compose())
+        metrics = {
+            "opcode_cost": group.get("app-budget-consumed", 0),
+            "inner_txns": sum(
+                _count_inner(result["txn-result"]) for result in group["txn-results"]
+            ),
+        }
+        mbr_before = self._app_min_balance()
+        result = compose().send(algokit_utils.SendParams(populate_app_call_resources=True))
+        metrics["mbr"] = self._app_min_balance() - mbr_before
+        self.results[case] = metrics
+        return result.returns[0].value if result.returns else None
+
+    def read(self, client: algokit_utils.AppClient, method: str, args: list[Any]) -> Any:
+        params = client.params.call(
+            algokit_utils.AppClientMethodCallParams(method=method, args=args)
+        )
+        result = (
+            self.algorand.new_group()
+            .add_app_call_method_call(params)
+            .simulate(allow_unnamed_resources=True, skip_signatures=True)
+        )
+        return result.returns[-1].value
+
+    def upload(self) -> None:
+        approval, _clear = registry_program()
+
+        def compose() -> algokit_utils.TransactionComposer:
+            group = self.algorand.new_group().add_app_call_method_call(
+                self._method(
+                    "set_registry_program",
+                    [
+                        len(approval),
+                        registry_program_digest(approval),
+                        self._payment(program_box_mbr(len(approval))),
+                    ],
+                )
+            )
+            for offset in range(0, len(approval), PROGRAM_CHUNK_BYTES):
+                group.add_app_call_method_call(
+                    self._method(
+                        "write_registry_program",
+                        [offset, approval[offset : offset + PROGRAM_CHUNK_BYTES]],
+                    )
+                )
+            return group
+
+        self.send("upload_registry_program", compose)
+
+    def create_registry(self) -> int:
+        # The read-only call holds the box references the program box
+        # leaves no room for, as in the deploy config.
+        app_id: int = self.send(
+            "create_registry",
+            lambda: self.algorand.new_group()
+            .add_app_call_method_call(
+                self._method(
+                    "create_registry",
+                    [
+                        REGION,
+                        self.validator.address,
+                        self._payment(create_registry_mbr(REGION) + REGISTRY_FUNDING),
+                    ],
+                    extra_fee=AlgoAmount(micro_algo=1000 * CREATE_REGISTRY_INNER_TXNS),
+                )
+            )
+            .add_app_call_method_call(self._method("get_registry_count", [])),
+        )
+        metrics = self.results["create_registry"]
+        if metrics["inner_txns"] != CREATE_REGISTRY_INNER_TXNS:
+            raise Exception(
+                f"create_registry sent {metrics['inner_txns']} inner transactions, "
+                f"expected {CREATE_REGISTRY_INNER_TXNS}"
+            )
+        if metrics["mbr"] != create_registry_mbr(REGION):
+            raise Exception(
+                f"create_registry added {metrics['mbr']} µALGO of MBR, "
+                f"expected {create_registry_mbr(REGION)}"
+            )
+        return app_id
+
+    def verify(self, app_id: int) -> None:
+        """Check the registry created for REGION against the factory's routing."""
+        info = self.read(self.client, "get_registry", [REGION])
+        child = self.algorand.client.get_app_client_by_id(
+            app_spec=REGISTRY_APP_SPEC.read_text(),
+            app_id=app_id,
+            default_sender=self.admin.address,
+        )
+        checks = {
+            "routed app id": (info["app_id"], app_id),
+            "registry count": (self.read(self.client, "get_registry_count", []), 1),
+            "asset id": (self.read(child, "get_asset_id", []), info["asset_id"]),
+            "validator": (self.read(child, "get_validator", []), self.validator.address),
+            "admin": (self.read(child, "get_admin", []), self.client.app_address),
+        }
+        mismatched = [
+            f"{name} {actual} != {expected}"
+            for name, (actual, expected) in checks.items()
+            if actual != expected
+        ]
+        if not info["asset_id"]:
+            mismatched.append("no AARNA asset")
+        if mismatched:
+            raise Exception(f"Registry {app_id} for {REGION}: {', '.join(mismatched)}")
+
+    def sync_registry(self) -> None:
+        self.send(
+            "sync_registry",
+            lambda: self.algorand.new_group().add_app_call_method_call(
+                self._method("sync_registry", [REGION])
+            ),
+        )
+
+
+def run() -> dict[str, dict[str, int]]:
+    """Per-step metrics from deploying one registry through a fresh factory."""
+    bench = FactoryBench(algokit_utils.AlgorandClient.default_localnet())
+    bench.create()
+    bench.upload()
+    bench.verify(bench.create_registry())
+    bench.sync_registry()
+    return bench.results
@@ -0,0 +1,62 @@
+"""
+Deterministic synthetic data for the benchmark and load tooling, shaped
+like the frontend's mockProjects.
+"""
+
+import base64
+import hashlib
+
+# (name, location, ecosystem) in the style of MOCK_PROJECTS
+SAMPLE_PROJECTS = [
+    ("Sundarbans Mangrove Restoration", "West Bengal, India", "Mangrove"),
+    ("Pichavaram Mangrove Conservation", "Tamil Nadu, India", "Mangrove"),
+    ("Gulf of Kutch Seagrass Monitoring", "Gujarat, India", "Seagrass"),
+    ("Chilika Wetland Carbon Assessment", "Odisha, India", "Wetland"),
+    ("Vembanad Salt Marsh Survey", "Kerala, India", "Salt Marsh"),
+]
+
+# CIDv1 header for raw content addressed by a sha2-256 multihash
+_CID_V1_RAW_SHA256 = bytes([0x01, 0x55, 0x12, 0x20])
+
+
+def evidence_cid(seed: str) -> str:
+    """A valid base32 CIDv1 ("bafk…") derived from `seed`."""
+    binary = _CID_V1_RAW_SHA256 + hashlib.sha256(seed.encode()).digest()
+    return "b" + base64.b32encode(binary).decode().lower().rstrip("=")
+
+
+def project_submission(index: int) -> tuple[str, str, str, str]:
+    """The (name, location, ecosystem, cid) of synthetic project `index`."""
+    name, location, ecosystem = SAMPLE_PROJECTS[index % len(SAMPLE_PROJECTS)]
+    return f"{name} #{index}", location, ecosystem, evidence_cid(f"aarna-project-{index}")
+
+
+def _leaf_hash(record: bytes) -> bytes:
+    return hashlib.sha256(b"\x00" + record).digest()
+
+
+def _node_hash(a: bytes, b: bytes) -> bytes:
+    low, high = sorted((a, b))
+    return hashlib.sha256(b"\x01" + low + high).digest()
+
+
+def merkle_tree(records: list[bytes]) -> tuple[bytes, list[list[bytes]]]:
+    """
+    The evidence root over `records` and each record's proof, built the way
+    AarnaRegistry.verify_inclusion checks them. An odd node out is carried
+    up a level unchanged.
+    """
+    level = [_leaf_hash(record) for record in records]
+    positions = list(range(len(records)))
+    proofs: list[list[bytes]] = [[] for _ in records]
+    while len(level) > 1:
+        for leaf, position in enumerate(positions):
+            sibling = position ^ 1
+            if sibling < len(level):
+                proofs[leaf].append(level[sibling])
+        level = [
+            _node_hash(level[i], level[i + 1]) if i + 1 < len(level) else level[i]
+            for i in range(0, len(level), 2)
+        ]
+        positions = [position // 2 for position in positions]
+    return level[0], proofs
@@ -0,0 +1,496 @@
+"""
+Offline load harness for AarnaRegistry on the algorand-python-testing emulator.
+
+    python -m benchmarks.load                                  # 5,000 projects
+    python -m benchmarks.load --projects 20000 --step 2000 --output load.json
+
+Thousands of synthetic actors drive the registry from one seeded random
+stream, with projects shaped like the frontend's mockProjects:
+
+- developers submit projects, some with an evidence root;
+- validators take review shifts (the admin rotates the active validator),
+  approving or rejecting the oldest pending projects and issuing credits;
+- sellers, anyone holding credits, list lots near the market price, some
+  with an expiry;
+- buyers pick listings from a periodically refreshed (so sometimes stale)
+  market view, sweep the book with market_buy, and place bids;
+- anyone cancels their own orders or sweeps expired listings.
+
+Every time the project count passes a multiple of --step, a checkpoint
+records methods per second, failures by method, box count and bytes, and
+the minimum balance those boxes hold. The rows are printed as JSON.
+
+Everything but wall-clock rates is deterministic for a given seed. The
+emulator does not roll back a failed call, so actors only make mistakes
+the contract rejects before it writes: stale listing and bid ids, stale
+price hints on orders that do not cross, and oversized fills.
+"""
+
+import argparse
+import bisect
+import json
+import logging
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any
+
+import algopy
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from algosdk.encoding import encode_address
+
+from benchmarks.emulator import ACCOUNT_BALANCE, EmulatorBench, _to_python
+from benchmarks.fixtures import merkle_tree, project_submission
+from benchmarks.scenario import (
+    BASE_PRICE,
+    BID_PAYMENT,
+    BOX_BYTE_MBR,
+    BOX_FLAT_MBR,
+    EVIDENCE_PAYMENT,
+    LISTING_PAYMENT,
+    SUBMIT_PAYMENT,
+)
+from smart_contracts.aarna_registry.contract import (
+    MAX_FILLS,
+    MAX_LISTING_PAGE,
+    NO_BID,
+    NO_LISTING,
+)
+
+logger = logging.getLogger(__name__)
+
+ROUND_SECONDS = 3
+
+# Box key prefixes, longest first so the account indexes match before "p"
+BOX_PREFIXES = {
+    b"sp": "submitter_index",
+    b"sl": "seller_index",
+    b"p": "projects",
+    b"e": "ecosystem_totals",
+    b"c": "cid_index",
+    b"m": "evidence_roots",
+    b"q": "pending_queue",
+    b"l": "listings",
+    b"b": "bids",
+    b"k": "claims",
+}
+
+# Relative frequency of each actor action
+ACTIONS = {
+    "submit": 3.0,
+    "review": 1.0,
+    "sell": 2.0,
+    "buy": 3.0,
+    "market_buy": 1.0,
+    "bid": 1.5,
+    "cancel_listing": 0.3,
+    "cancel_bid": 0.3,
+    "sweep": 0.5,
+}
+
+REVIEW_BATCH = 8
+APPROVE_SHARE = 0.85
+EVIDENCE_SHARE = 0.3
+EXPIRING_SHARE = 0.2
+MARKET_REFRESH_TICKS = 50
+MAX_LOT = 50
+SWEEP_BATCH = 16
+
+
+def _app_boxes(context: AlgopyTestContext, app: algopy.Application) -> dict[bytes, bytes]:
+    # The emulator has no public way to list an app's boxes
+    return context.ledger._get_app_data(app).boxes  # noqa: SLF001
+
+
+def _prefix_name(key: bytes) -> str:
+    for prefix, name in BOX_PREFIXES.items():
+        if key.startswith(prefix):
+            return name
+    return "other"
+
+
+class LoadBench(EmulatorBench):
+    """EmulatorBench with seeded, funded actor addresses and a clock that follows the round."""
+
+    def __init__(self, context: AlgopyTestContext, rng: random.Random) -> None:
+        self.rng = rng
+        super().__init__(context)
+
+    def new_account(self, asset_id: int) -> algopy.Account:
+        return self.context.any.account(
+            address=encode_address(self.rng.randbytes(32)),
+            balance=algopy.UInt64(ACCOUNT_BALANCE),
+            opted_asset_balances={algopy.UInt64(asset_id): algopy.UInt64(0)},
+        )
+
+    def advance_rounds(self, count: int) -> None:
+        super().advance_rounds(count)
+        self.context.ledger.patch_global_fields(
+            latest_timestamp=algopy.UInt64(self._round * ROUND_SECONDS)
+        )
+
+
+class LoadHarness:
+    def __init__(self, bench: LoadBench, options: argparse.Namespace) -> None:
+        self.bench = bench
+        self.rng = bench.rng
+        self.options = options
+        admin = bench.admin
+        bench.create()
+        bench.call(None, admin, "set_validator", [admin])
+        self.asset_id = int(bench.call(None, admin, "ensure_token", []))
+
+        self.developers = [bench.new_account(self.asset_id) for _ in range(options.developers)]
+        self.validators = [bench.new_account(self.asset_id) for _ in range(options.validators)]
+        self.buyers = [bench.new_account(self.asset_id) for _ in range(options.buyers)]
+
+        self.submitted = 0
+        self.owners: dict[int, algopy.Account] = {}
+        # Credits each actor is known to hold. Tokens that return by other
+        # routes (cancels, sweeps, bid fills) are not counted, so sellers
+        # never list more than they hold.
+        self.holdings: dict[str, int] = {}
+        self.holders: list[algopy.Account] = []
+        # Orders the actors placed, and may later try to cancel
+        self.placed_listings: list[tuple[algopy.Account, int]] = []
+        self.placed_bids: list[tuple[algopy.Account, int]] = []
+        self.expiring: list[tuple[int, int]] = []
+        # Open bids as (price, id), and the last market view of the asks
+        self.bid_book: list[tuple[int, int]] = []
+        self.market: list[tuple[int, int, int]] = []  # (price, id, amount)
+        self.ticks = 0
+
+        self.calls: Counter[str] = Counter()
+        self.failed: Counter[str] = Counter()
+        self.elapsed_ns: Counter[str] = Counter()
+        self.reasons: Counter[str] = Counter()
+        self.rows: list[dict[str, Any]] = []
+        self._window_start = time.perf_counter_ns()
+
+    # ── Calls ──
+
+    def _try(
+        self, method: str, sender: algopy.Account, args: list[Any], pay: int | None = None
+    ) -> tuple[bool, Any]:
+        """Call `method`, counting it; returns whether it succeeded and its result."""
+        start = time.perf_counter_ns()
+        try:
+            result = self.bench.call(None, sender, method, args, pay=pay)
+            ok = True
+        except Exception as error:
+            self.failed[method] += 1
+            self.reasons[f"{method}: {error}"] += 1
+            result, ok = None, False
+        self.elapsed_ns[method] += time.perf_counter_ns() - start
+        self.calls[method] += 1
+        return ok, result
+
+    def _call(
+        self, method: str, sender: algopy.Account, args: list[Any], pay: int | None = None
+    ) -> Any:
+        """Call `method`, counting it; returns None if the contract rejects it."""
+        return self._try(method, sender, args, pay)[1]
+
+    def _credit(self, account: algopy.Account, amount: int) -> None:
+        key = str(account)
+        if key not in self.holdings:
+            self.holders.append(account)
+        self.holdings[key] = self.holdings.get(key, 0) + amount
+
+    # ── Actions ──
+
+    def submit(self) -> None:
+        developer = self.rng.choice(self.developers)
+        index = self.submitted
+        project_id = self._call(
+            "submit_project", developer, list(project_submission(index)), pay=SUBMIT_PAYMENT
+        )
+        if project_id is None:
+            return
+        self.submitted += 1
+        self.owners[int(project_id)] = developer
+        if self.rng.random() < EVIDENCE_SHARE:
+            records = [
+                f"{index}-plot-{plot}".encode() for plot in range(self.rng.randint(1, 16))
+            ]
+            root, _proofs = merkle_tree(records)
+            self._call(
+                "commit_evidence_root",
+                developer,
+                [project_id, root, len(records)],
+                pay=EVIDENCE_PAYMENT,
+            )
+
+    def review(self) -> None:
+        validator = self.rng.choice(self.validators)
+        self._call("set_validator", self.bench.admin, [validator])
+        pending = self._call("get_pending", validator, [0, REVIEW_BATCH]) or []
+        for item in pending:
+            project_id = _to_python(item)
+            if self.rng.random() >= APPROVE_SHARE:
+                self._call("reject_project", validator, [project_id])
+                continue
+            credits = self.rng.randint(10, 500)
+            self._call("approve_project", validator, [project_id, credits])
+            issued = self._call("issue_credits", validator, [project_id])
+            if issued is not None:
+                self._credit(self.owners[project_id], int(issued))
+
+    def sell(self) -> None:
+        if not self.holders:
+            return
+        seller = self.rng.choice(self.holders)
+        holding = self.holdings[str(seller)]
+        if not holding:
+            self.holders.remove(seller)
+            del self.holdings[str(seller)]
+            return
+        amount = self.rng.randint(1, min(holding, MAX_LOT))
+        price = self.rng.randint(BASE_PRICE * 8 // 10, BASE_PRICE * 13 // 10)
+        expires = 0
+        if self.rng.random() < EXPIRING_SHARE:
+            expires = self.bench.current_round() + self.rng.randint(20, 400)
+
+        # A crossing listing fills bids before it reads the hint, so it
+        # must not fail on a stale one
+        best_bid = self._call("get_best_bid", seller, [])
+        hint = NO_LISTING
+        if best_bid is None or _to_python(best_bid.price) < price:
+            below = bisect.bisect_right(self.market, (price, NO_LISTING, 0))
+            if below:
+                hint = self.market[below - 1][1]
+
+        listing_id = self._call(
+            "list_for_sale",
+            seller,
+            [amount, price, expires, hint, MAX_FILLS],
+            pay=LISTING_PAYMENT,
+        )
+        if listing_id is None:
+            return
+        self.holdings[str(seller)] -= amount
+        if listing_id != NO_LISTING:
+            self.placed_listings.append((seller, listing_id))
+            if expires:
+                self.expiring.append((expires, listing_id))
+
+    def buy(self) -> None:
+        if not self.market:
+            return
+        buyer = self.rng.choice(self.buyers)
+        price, listing_id, amount = self.rng.choice(self.market)
+        quantity = self.rng.randint(1, amount)
+        # A listing's price never changes and its id is never reused, so a
+        # stale view can only point at a listing that has since closed
+        ok, _result = self._try(
+            "buy_listing", buyer, [listing_id, quantity], pay=quantity * price
+        )
+        if ok:
+            self._credit(buyer, quantity)
+
+    def market_buy(self) -> None:
+        buyer = self.rng.choice(self.buyers)
+        best_ask = self._call("get_best_ask", buyer, [])
+        if best_ask is None or _to_python(best_ask.listing_id) == NO_LISTING:
+            return
+        max_price = _to_python(best_ask.price) + self.rng.randint(0, BASE_PRICE // 10)
+        quantity = self.rng.randint(1, MAX_LOT)
+        bought = self._call(
+            "market_buy", buyer, [quantity, max_price, MAX_FILLS], pay=quantity * max_price
+        )
+        if bought:
+            self._credit(buyer, int(bought))
+
+    def bid(self) -> None:
+        buyer = self.rng.choice(self.buyers)
+        quantity = self.rng.randint(1, MAX_LOT)
+        price = self.rng.randint(BASE_PRICE * 6 // 10, BASE_PRICE * 11 // 10)
+
+        # Like listings, a bid that crosses the book buys before it reads
+        # the hint
+        best_ask = self._call("get_best_ask", buyer, [])
+        hint = NO_BID
+        if best_ask is None or _to_python(best_ask.listing_id) == NO_LISTING or (
+            price < _to_python(best_ask.price)
+        ):
+            above = bisect.bisect_left(self.bid_book, (price, -1))
+            if above < len(self.bid_book):
+                hint = self.bid_book[above][1]
+
+        ok, bid_id = self._try(
+            "place_bid",
+            buyer,
+            [quantity, price, hint, MAX_FILLS],
+            pay=quantity * price + BID_PAYMENT,
+        )
+        if not ok:
+            # Bids filled by listings stay in the book until a hint fails
+            self.bid_book = [entry for entry in self.bid_book if entry[1] != hint]
+        elif bid_id != NO_BID:
+            bisect.insort(self.bid_book, (price, bid_id))
+            self.placed_bids.append((buyer, bid_id))
+
+    def cancel_listing(self) -> None:
+        if not self.placed_listings:
+            return
+        index = self.rng.randrange(len(self.placed_listings))
+        seller, listing_id = self.placed_listings.pop(index)
+        self._call("cancel_listing", seller, [listing_id])
+
+    def cancel_bid(self) -> None:
+        if not self.placed_bids:
+            return
+        index = self.rng.randrange(len(self.placed_bids))
+        bidder, bid_id = self.placed_bids.pop(index)
+        ok, _result = self._try("cancel_bid", bidder, [bid_id])
+        if ok:
+            self.bid_book = [entry for entry in self.bid_book if entry[1] != bid_id]
+
+    def sweep(self) -> None:
+        now = self.bench.current_round()
+        due = [listing_id for expires, listing_id in self.expiring if expires < now]
+        if not due:
+            return
+        batch = due[:SWEEP_BATCH]
+        self.expiring = [entry for entry in self.expiring if entry[1] not in batch]
+        self._call("sweep_expired", self.rng.choice(self.buyers), [batch])
+
+    # ── Market view ──
+
+    def refresh_market(self) -> None:
+        """Page through the active listings, as a client polling the app would."""
+        reader = self.bench.admin
+        market: list[tuple[int, int, int]] = []
+        while True:
+            page = self._call(
+                "get_active_listings", reader, [len(market), MAX_LISTING_PAGE]
+            )
+            views = list(page or [])
+            for view in views:
+                market.append(
+                    (
+                        _to_python(view.price),
+                        _to_python(view.listing_id),
+                        _to_python(view.amount),
+                    )
+                )
+            # Pages of MAX_LISTING_PAGE are never cut short, so a short one is the last
+            if len(views) < MAX_LISTING_PAGE:
+                break
+        market.sort()
+        self.market = market
+
+    # ── Checkpoints ──
+
+    def checkpoint(self) -> dict[str, Any]:
+        elapsed = (time.perf_counter_ns() - self._window_start) / 1e9
+        boxes = _app_boxes(self.bench.context, self.bench.app)
+        box_bytes = sum(len(key) + len(value) for key, value in boxes.items())
+        by_prefix = Counter(_prefix_name(key) for key in boxes)
+        box_mbr = BOX_FLAT_MBR * len(boxes) + BOX_BYTE_MBR * box_bytes
+
+        calls = sum(self.calls.values())
+        failures = sum(self.failed.values())
+        previous = self.rows[-1]["state"] if self.rows else {"box_bytes": 0, "box_mbr": 0}
+        status = self.bench.call(None, self.bench.admin, "get_status_counts", [])
+        row = {
+            "projects": self.submitted,
+            "ticks": self.ticks,
+            "round": self.bench.current_round(),
+            "open_listings": by_prefix["listings"],
+            "open_bids": by_prefix["bids"],
+            "status_counts": [_to_python(count) for count in status],
+            "calls": calls,
+            "calls_per_sec": round(calls / elapsed) if elapsed else 0,
+            "failures": failures,
+            "failure_rate": round(failures / calls, 4) if calls else 0.0,
+            "methods": {
+                method: {
+                    "calls": self.calls[method],
+                    "failures": self.failed[method],
+                    "mean_us": round(self.elapsed_ns[method] / self.calls[method] / 1000, 1),
+                }
+                for method in sorted(self.calls)
+            },
+            "state": {
+                "box_count": len(boxes),
+                "box_bytes": box_bytes,
+                "box_mbr": box_mbr,
+                "box_bytes_growth": box_bytes - previous["box_bytes"],
+                "box_mbr_growth": box_mbr - previous["box_mbr"],
+                "boxes_by_kind": dict(sorted(by_prefix.items())),
+            },
+        }
+        logger.info(
+            f"{row['projects']:>7} projects {row['open_listings']:>6} listings "
+            f"{row['calls_per_sec']:>7} calls/s {row['failure_rate']:>7.2%} failed "
+            f"{box_mbr / 1e6:>10.3f} ALGO box MBR"
+        )
+        self.rows.append(row)
+        self.calls.clear()
+        self.failed.clear()
+        self.elapsed_ns.clear()
+        self._window_start = time.perf_counter_ns()
+        return row
+
+    def run(self) -> dict[str, Any]:
+        actions = list(ACTIONS)
+        weights = list(ACTIONS.values())
+        next_checkpoint = self.options.step
+        max_ticks = 100 * self.options.projects
+        while self.submitted < self.options.projects and self.ticks < max_ticks:
+            self.ticks += 1
+            self.bench.advance_rounds(1)
+            if self.ticks % MARKET_REFRESH_TICKS == 0:
+                self.refresh_market()
+            getattr(self, self.rng.choices(actions, weights)[0])()
+            if self.submitted >= next_checkpoint:
+                self.checkpoint()
+                next_checkpoint += self.options.step
+        if not self.rows or self.rows[-1]["projects"] != self.submitted:
+            self.checkpoint()
+        return {
+            "seed": self.options.seed,
+            "actors": {
+                "developers": len(self.developers),
+                "validators": len(self.validators),
+                "buyers": len(self.buyers),
+                "holders": len(self.holders),
+            },
+            "checkpoints": self.rows,
+            "top_failures": dict(self.reasons.most_common(10)),
+        }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("--projects", type=int, default=5_000, help="stop at this many")
+    parser.add_argument("--step", type=int, default=500, help="projects per checkpoint")
+    parser.add_argument("--developers", type=int, default=2_000)
+    parser.add_argument("--validators", type=int, default=25)
+    parser.add_argument("--buyers", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", type=Path, help="write the report here instead of stdout")
+    options = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    with algopy_testing_context() as context:
+        bench = LoadBench(context, random.Random(options.seed))
+        report = LoadHarness(bench, options).run()
+
+    text = json.dumps(report, indent=2)
+    if options.output:
+        options.output.write_text(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
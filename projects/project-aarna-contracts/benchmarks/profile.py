@@ -0,0 +1,279 @@
+"""
+Source-mapped AVM cost profile for AarnaRegistry.
+
+    python -m benchmarks.profile "buy_listing[slot=31]"      # per-line report
+    python -m benchmarks.profile market_buy --folded out.txt  # flamegraph input
+    python -m benchmarks.profile --pc 4245                    # where did it fail?
+
+Runs the benchmark scenario on LocalNet and simulates the named cases with
+execution traces. Every program counter in the trace is mapped back to a
+contract.py line through AarnaRegistry.approval.puya.map, and to its call
+stack through the map's subroutine events. The folded output ("a;b;c cost"
+per line) feeds flamegraph.pl or speedscope directly.
+
+Costs are per-opcode AVM costs for fixed-cost opcodes (OPCODE_COSTS) and 1
+for everything else; the difference from the budget algod reports, such
+as inner op-up calls, is shown as unattributed.
+"""
+
+import argparse
+import json
+import sys
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+SOURCE_MAP = (
+    Path(__file__).parent.parent
+    / "smart_contracts"
+    / "artifacts"
+    / "aarna_registry"
+    / "AarnaRegistry.approval.puya.map"
+)
+SUBROUTINE_PREFIX = "smart_contracts.aarna_registry.contract."
+
+# Opcodes whose cost is fixed and above 1 (AVM v10). Variable-cost opcodes
+# count as 1 and their remainder ends up unattributed.
+OPCODE_COSTS = {
+    "sha256": 35,
+    "keccak256": 130,
+    "sha512_256": 45,
+    "sha3_256": 130,
+    "ed25519verify": 1900,
+    "ed25519verify_bare": 1900,
+    "ecdsa_pk_recover": 2000,
+    "vrf_verify": 5700,
+    "falcon_verify": 1700,
+    "divmodw": 20,
+    "sqrt": 4,
+    "bsqrt": 40,
+    "b+": 10,
+    "b-": 10,
+    "b*": 20,
+    "b/": 20,
+    "b%": 20,
+    "b|": 6,
+    "b&": 6,
+    "b^": 6,
+    "b~": 4,
+}
+
+_BASE64 = "ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/"
+
+
+def _decode_vlq(segment: str) -> list[int]:
+    values: list[int] = []
+    value = shift = 0
+    for char in segment:
+        digit = _BASE64.index(char)
+        value += (digit & 31) << shift
+        if digit & 32:
+            shift += 5
+            continue
+        values.append(-(value >> 1) if value & 1 else value >> 1)
+        value = shift = 0
+    return values
+
+
+@dataclass
+class Location:
+    path: Path
+    line: int  # 1-based
+
+    def __str__(self) -> str:
+        return f"{self.path.name}:{self.line}"
+
+
+class SourceMap:
+    """A puya .puya.map: program counter -> source line, op and events."""
+
+    def __init__(self, path: Path) -> None:
+        data = json.loads(path.read_text())
+        self.sources = [(path.parent / source).resolve() for source in data["sources"]]
+        self.pc_offset: int = data.get("op_pc_offset", 0)
+        self.events: dict[int, dict[str, Any]] = {
+            int(pc): event for pc, event in data["pc_events"].items()
+        }
+        self.locations: dict[int, Location] = {}
+        # Each ";"-separated group is one pc; source fields are deltas that
+        # carry across groups, as in any v3 source map
+        source = line = 0
+        for pc, group in enumerate(data["mappings"].split(";")):
+            if not group:
+                continue
+            fields = _decode_vlq(group.split(",")[0])
+            if len(fields) >= 4:
+                source += fields[1]
+                line += fields[2]
+                self.locations[pc] = Location(self.sources[source], line + 1)
+        self._lines: dict[Path, list[str]] = {}
+
+    def location(self, pc: int) -> Location | None:
+        # Template values shift the compiled program against the map
+        return self.locations.get(pc - self.pc_offset)
+
+    def event(self, pc: int) -> dict[str, Any]:
+        return self.events.get(pc - self.pc_offset, {})
+
+    def source_line(self, location: Location) -> str:
+        if location.path not in self._lines:
+            self._lines[location.path] = location.path.read_text().splitlines()
+        lines = self._lines[location.path]
+        return lines[location.line - 1].strip() if location.line <= len(lines) else ""
+
+
+def _frame(subroutine: str) -> str:
+    return subroutine.removeprefix(SUBROUTINE_PREFIX)
+
+
+@dataclass
+class Profile:
+    line_costs: Counter[str]
+    line_hits: Counter[str]
+    folded: Counter[str]
+    locations: dict[str, Location]
+    attributed: int
+    budget: int
+
+
+def profile_trace(source_map: SourceMap, pcs: list[int], budget: int) -> Profile:
+    """Attribute each executed op in `pcs` to its source line and call stack."""
+    line_costs: Counter[str] = Counter()
+    line_hits: Counter[str] = Counter()
+    folded: Counter[str] = Counter()
+    locations: dict[str, Location] = {}
+    stack: list[str] = []
+    entering = False
+    for pc in pcs:
+        event = source_map.event(pc)
+        if "subroutine" in event:
+            # callsub pushes a frame; method routing is jumped into from
+            # the approval program, so it nests under it too
+            if entering or len(stack) < 2:
+                stack.append(_frame(event["subroutine"]))
+            else:
+                stack[-1] = _frame(event["subroutine"])
+        op = event.get("op", "").split(" ", 1)[0]
+        cost = OPCODE_COSTS.get(op, 1)
+        location = source_map.location(pc)
+        if location:
+            key = str(location)
+            locations[key] = location
+        else:
+            key = f"<{stack[-1] if stack else 'unmapped'}>"
+        line_costs[key] += cost
+        line_hits[key] += 1
+        folded[";".join([*stack, key])] += cost
+        entering = "callsub" in event
+        if event.get("retsub") and stack:
+            stack.pop()
+    attributed = sum(line_costs.values())
+    return Profile(
+        line_costs, line_hits, folded, locations, attributed, max(budget, attributed)
+    )
+
+
+def report(source_map: SourceMap, case: str, result: Profile, top: int) -> str:
+    lines = [
+        f"{case}: {result.budget} budget consumed, "
+        f"{result.budget - result.attributed} unattributed",
+        f"{'cost':>7} {'%':>5} {'ops':>6}  location",
+    ]
+    for key, cost in result.line_costs.most_common(top):
+        share = 100 * cost / result.budget if result.budget else 0
+        location = result.locations.get(key)
+        source = source_map.source_line(location) if location else ""
+        lines.append(f"{cost:>7} {share:>5.1f} {result.line_hits[key]:>6}  {key:<18} {source}")
+    return "\n".join(lines)
+
+
+def describe_pc(source_map: SourceMap, pc: int) -> str:
+    """Where a program counter from a logic error points in the source."""
+    location = source_map.location(pc)
+    event = source_map.event(pc)
+    parts = [f"pc={pc}"]
+    if location:
+        parts.append(f"{location}  {source_map.source_line(location)}")
+    if "op" in event:
+        parts.append(f"op: {event['op']}")
+    if "error" in event:
+        parts.append(f"error: {event['error']}")
+    return "\n".join(parts)
+
+
+def collect_traces(cases: list[str]) -> dict[str, tuple[list[int], int]]:
+    """Run the scenario on LocalNet, tracing the named cases."""
+    from algokit_utils import AlgorandClient
+    from algosdk.v2client.models import SimulateTraceConfig
+
+    from benchmarks import scenario
+    from benchmarks.simulate import SimulateBench
+
+    traces: dict[str, tuple[list[int], int]] = {}
+
+    class TracingBench(SimulateBench):
+        def _simulate(self, case: str | None, composer: Any) -> dict[str, Any]:
+            if case not in cases:
+                return super()._simulate(case, composer)
+            simulated = composer.simulate(
+                allow_unnamed_resources=True,
+                skip_signatures=True,
+                exec_trace_config=SimulateTraceConfig(enable=True),
+            )
+            group = simulated.simulate_response["txn-groups"][0]
+            pcs = [
+                step["pc"]
+                for txn in group["txn-results"]
+                for step in txn.get("exec-trace", {}).get("approval-program-trace", [])
+            ]
+            traces[case] = (pcs, group.get("app-budget-consumed", 0))
+            return group
+
+    bench = TracingBench(AlgorandClient.default_localnet())
+    scenario.run(bench)
+    missing = sorted(set(cases) - traces.keys())
+    if missing:
+        known = ", ".join(sorted(bench.results))
+        raise SystemExit(f"Unknown case(s): {', '.join(missing)}. Known cases: {known}")
+    return traces
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.profile",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("cases", nargs="*", help="benchmark case names to profile")
+    parser.add_argument("--pc", type=int, help="describe a program counter and exit")
+    parser.add_argument("--source-map", type=Path, default=SOURCE_MAP)
+    parser.add_argument("--top", type=int, default=25, help="lines to show per case")
+    parser.add_argument("--folded", type=Path, help="write folded stacks here")
+    parser.add_argument("--json", type=Path, help="write per-line costs here")
+    options = parser.parse_args()
+
+    source_map = SourceMap(options.source_map)
+    if options.pc is not None:
+        print(describe_pc(source_map, options.pc))
+        return 0
+    if not options.cases:
+        parser.error("name at least one case, or pass --pc")
+
+    folded: list[str] = []
+    costs: dict[str, dict[str, int]] = {}
+    for case, (pcs, budget) in collect_traces(options.cases).items():
+        result = profile_trace(source_map, pcs, budget)
+        print(report(source_map, case, result, options.top), end="\n\n")
+        folded.extend(f"{case};{stack} {cost}" for stack, cost in result.folded.items())
+        costs[case] = dict(result.line_costs.most_common())
+
+    if options.folded:
+        options.folded.write_text("\n".join(folded) + "\n")
+    if options.json:
+        options.json.write_text(json.dumps(costs, indent=2) + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
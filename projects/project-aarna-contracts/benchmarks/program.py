@@ -0,0 +1,18 @@
+"""
+Compiled size of the registry's programs, read from the bytecode the build
+writes next to the TEAL, so it needs no network.
+"""
+
+from pathlib import Path
+
+ARTIFACTS = Path(__file__).parent.parent / "smart_contracts" / "artifacts" / "aarna_registry"
+PROGRAM_PAGE_BYTES = 2048
+
+
+def sizes() -> dict[str, int]:
+    """Compiled size of the registry's programs, and the pages the approval needs."""
+    program: dict[str, int] = {}
+    for kind in ("approval", "clear"):
+        program[f"{kind}_bytes"] = (ARTIFACTS / f"AarnaRegistry.{kind}.bin").stat().st_size
+    program["approval_pages"] = -(-program["approval_bytes"] // PROGRAM_PAGE_BYTES)
+    return program
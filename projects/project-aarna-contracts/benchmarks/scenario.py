@@ -0,0 +1,268 @@
+"""
+The benchmark scenario: one pass over the AarnaRegistry ABI, run the same
+way against every backend so their numbers line up case by case.
+
+Per-slot cases ("method[slot=N]") repeat a method at growing ids. Storage
+is keyed by id, so their costs should match; a cost that climbs with the
+slot points at a scan.
+"""
+
+from typing import Any, Protocol
+
+from benchmarks.fixtures import merkle_tree, project_submission
+from smart_contracts.aarna_registry.contract import (
+    MAX_CID_LENGTH,
+    MAX_LOCATION_LENGTH,
+    MAX_NAME_LENGTH,
+    NO_BID,
+    NO_LISTING,
+)
+
+SLOTS = (0, 1, 7, 31)
+
+# Box minimum balance: a flat amount per box plus a rate per key and value byte
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+
+
+def box_mbr(key_bytes: int, value_bytes: int) -> int:
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (key_bytes + value_bytes)
+
+
+# An account index ("sp"/"sl" + address): its length box plus a new page
+# holding one id
+INDEX_MBR = box_mbr(2 + 32, 8) + box_mbr(2 + 32 + 2, 8)
+
+# A ProjectRecord with every text field at its limit: the fixed fields, then
+# a 2-byte head and a 2-byte length per text field
+PROJECT_RECORD_BYTES = (
+    32 + 8 + 1 + 3 * (2 + 2) + MAX_CID_LENGTH + MAX_NAME_LENGTH + MAX_LOCATION_LENGTH
+)
+
+# Payments cover the most MBR each call can add, from the box layouts in
+# the contract; MBR itself is measured from the app account, not from these.
+SUBMIT_PAYMENT = (
+    box_mbr(1 + 8, PROJECT_RECORD_BYTES)
+    + box_mbr(1 + 32, 8)  # cid index
+    + box_mbr(1 + 8, 16)  # PendingLink
+    + box_mbr(1 + 8, 5 * 8 + 8)  # first ProjectTotals of its ecosystem
+    + INDEX_MBR
+)
+LISTING_PAYMENT = box_mbr(1 + 8, 32 + 6 * 8) + INDEX_MBR  # Listing
+BID_PAYMENT = box_mbr(1 + 8, 32 + 4 * 8)  # Bid
+EVIDENCE_PAYMENT = box_mbr(1 + 8, 32 + 8)  # EvidenceRoot
+
+CREDITS = 100
+LISTING_AMOUNT = 10
+BASE_PRICE = 1_000
+EVIDENCE_RECORDS = 8
+# market_buy crosses three asks; resting bids cross none
+MARKET_FILLS = 4
+
+
+class Bench(Protocol):
+    """What a backend provides to the scenario."""
+
+    admin: Any
+
+    def create(self) -> None:
+        """Create the app, recording the "init" case."""
+
+    def call(
+        self,
+        case: str | None,
+        sender: Any,
+        method: str,
+        args: list[Any],
+        *,
+        pay: int | None = None,
+        inner_txns: int = 0,
+        readonly: bool = False,
+    ) -> Any:
+        """
+        Call `method` as `sender`, recording its metrics under `case` unless
+        that is None. `pay` appends a payment to the app as the last
+        argument; `inner_txns` is how many inner fees the call must cover.
+        Returns the ABI return value as a plain Python value.
+        """
+
+    def new_account(self, asset_id: int) -> Any:
+        """A funded account opted in to `asset_id`."""
+
+    def opt_in(self, account: Any, asset_id: int) -> None: ...
+
+    def current_round(self) -> int: ...
+
+    def advance_rounds(self, count: int) -> None: ...
+
+
+def _slot_case(method: str, slot: int) -> str | None:
+    return f"{method}[slot={slot}]" if slot in SLOTS else None
+
+
+def run(bench: Bench) -> None:
+    admin = bench.admin
+    bench.create()
+    bench.call("set_validator", admin, "set_validator", [admin])
+    asset_id = int(bench.call("ensure_token", admin, "ensure_token", [], inner_txns=1))
+    bench.opt_in(admin, asset_id)
+
+    # ── Project lifecycle; the admin doubles as developer and validator ──
+    project_count = max(SLOTS) + 1
+    for project_id in range(project_count):
+        bench.call(
+            _slot_case("submit_project", project_id),
+            admin,
+            "submit_project",
+            list(project_submission(project_id)),
+            pay=SUBMIT_PAYMENT,
+            inner_txns=4,
+        )
+    for project_id in range(project_count):
+        bench.call(
+            _slot_case("approve_project", project_id),
+            admin,
+            "approve_project",
+            [project_id, CREDITS],
+            inner_txns=1,
+        )
+    for project_id in range(project_count):
+        bench.call(
+            _slot_case("issue_credits", project_id),
+            admin,
+            "issue_credits",
+            [project_id],
+            inner_txns=1,
+        )
+
+    records = [f"plot-{index}".encode() for index in range(EVIDENCE_RECORDS)]
+    root, proofs = merkle_tree(records)
+    pending_id = project_count
+    bench.call(
+        None,
+        admin,
+        "submit_project",
+        list(project_submission(pending_id)),
+        pay=SUBMIT_PAYMENT,
+        inner_txns=4,
+    )
+    bench.call(
+        "commit_evidence_root",
+        admin,
+        "commit_evidence_root",
+        [pending_id, root, len(records)],
+        pay=EVIDENCE_PAYMENT,
+    )
+    bench.call(
+        "verify_inclusion",
+        admin,
+        "verify_inclusion",
+        [pending_id, records[3], proofs[3]],
+        readonly=True,
+    )
+    bench.call("reject_project", admin, "reject_project", [pending_id], inner_txns=1)
+
+    bench.call("get_project", admin, "get_project", [0], readonly=True)
+    bench.call("get_projects_page", admin, "get_projects_page", [0, 8], readonly=True)
+    bench.call(
+        "find_project_by_cid",
+        admin,
+        "find_project_by_cid",
+        [project_submission(0)[3]],
+        readonly=True,
+    )
+    bench.call("get_pending", admin, "get_pending", [0, 16], readonly=True)
+    bench.call(
+        "get_ecosystem_totals", admin, "get_ecosystem_totals", ["Mangrove"], readonly=True
+    )
+
+    # ── Marketplace: asks at rising prices, each hinted after the last ──
+    buyer = bench.new_account(asset_id)
+    listing_ids: list[int] = []
+    previous = NO_LISTING
+    for slot in range(project_count):
+        listing_id = int(
+            bench.call(
+                _slot_case("list_for_sale", slot),
+                admin,
+                "list_for_sale",
+                [LISTING_AMOUNT, BASE_PRICE + slot, 0, previous, 0],
+                pay=LISTING_PAYMENT,
+                inner_txns=2,
+            )
+        )
+        listing_ids.append(listing_id)
+        previous = listing_id
+
+    for slot in SLOTS:
+        bench.call(
+            _slot_case("buy_listing", slot),
+            buyer,
+            "buy_listing",
+            [listing_ids[slot], 1],
+            pay=BASE_PRICE + slot,
+            inner_txns=2,
+        )
+
+    max_price = BASE_PRICE + project_count
+    bench.call(
+        "market_buy",
+        buyer,
+        "market_buy",
+        [2 * LISTING_AMOUNT, max_price, MARKET_FILLS],
+        pay=2 * LISTING_AMOUNT * max_price,
+        inner_txns=10,
+    )
+
+    # A bid below every ask rests; a crossing listing then fills it
+    bid_price = BASE_PRICE // 2
+    bench.call(
+        "place_bid",
+        buyer,
+        "place_bid",
+        [5, bid_price, NO_BID, 0],
+        pay=5 * bid_price + BID_PAYMENT,
+        inner_txns=1,
+    )
+    bench.call(
+        "list_for_sale[match]",
+        admin,
+        "list_for_sale",
+        [5, bid_price, 0, NO_LISTING, 1],
+        pay=LISTING_PAYMENT,
+        inner_txns=4,
+    )
+    bid_id = int(
+        bench.call(
+            None,
+            buyer,
+            "place_bid",
+            [5, bid_price, NO_BID, 0],
+            pay=5 * bid_price + BID_PAYMENT,
+            inner_txns=1,
+        )
+    )
+    bench.call("cancel_bid", buyer, "cancel_bid", [bid_id], inner_txns=1)
+
+    # An ask that expires, swept by a third party
+    expiring_id = int(
+        bench.call(
+            None,
+            admin,
+            "list_for_sale",
+            [LISTING_AMOUNT, 10 * BASE_PRICE, bench.current_round() + 2, listing_ids[-1], 0],
+            pay=LISTING_PAYMENT,
+            inner_txns=2,
+        )
+    )
+    bench.advance_rounds(3)
+    bench.call("sweep_expired", buyer, "sweep_expired", [[expiring_id]], inner_txns=2)
+    bench.call("cancel_listing", admin, "cancel_listing", [listing_ids[-1]], inner_txns=2)
+
+    bench.call("get_best_ask", admin, "get_best_ask", [], readonly=True)
+    bench.call("get_best_bid", admin, "get_best_bid", [], readonly=True)
+    bench.call("get_active_listings", admin, "get_active_listings", [0, 16], readonly=True)
+    bench.call(
+        "get_account_listings", admin, "get_account_listings", [admin, 0, 16], readonly=True
+    )
+    bench.call("get_market_stats", admin, "get_market_stats", [], readonly=True)
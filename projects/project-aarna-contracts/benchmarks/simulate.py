@@ -0,0 +1,161 @@
+"""
+Runs the benchmark scenario against the compiled TEAL on LocalNet.
+
+Each call is first simulated to read its opcode cost (including any
+op-up budget it buys) and inner transactions, then sent for real so the
+scenario can move on; the app account's minimum balance before and after
+gives the MBR the call added or released.
+"""
+
+from typing import Any
+
+import algokit_utils
+from algokit_utils import AlgoAmount, SigningAccount
+
+from benchmarks import scenario
+from benchmarks.program import ARTIFACTS
+
+APP_SPEC = ARTIFACTS / "AarnaRegistry.arc56.json"
+
+
+def _count_inner(txn_result: dict[str, Any]) -> int:
+    inner = txn_result.get("inner-txns", [])
+    return len(inner) + sum(_count_inner(itxn) for itxn in inner)
+
+
+class SimulateBench:
+    def __init__(self, algorand: algokit_utils.AlgorandClient) -> None:
+        self.algorand = algorand
+        self.admin = self._funded_account()
+        self.results: dict[str, dict[str, int]] = {}
+
+    def _funded_account(self) -> SigningAccount:
+        account = self.algorand.account.random()
+        self.algorand.account.ensure_funded_from_environment(
+            account, AlgoAmount(algo=100)
+        )
+        return account
+
+    def _app_min_balance(self) -> int:
+        info = self.algorand.account.get_information(self.client.app_address)
+        return info.min_balance.micro_algo
+
+    def _simulate(
+        self, case: str | None, composer: algokit_utils.TransactionComposer
+    ) -> dict[str, Any]:
+        """Simulate the group for `case` and return its simulate result."""
+        simulated = composer.simulate(allow_unnamed_resources=True, skip_signatures=True)
+        return simulated.simulate_response["txn-groups"][0]
+
+    def _measure(
+        self, case: str | None, composer: algokit_utils.TransactionComposer
+    ) -> dict[str, int]:
+        group = self._simulate(case, composer)
+        return {
+            "opcode_cost": group.get("app-budget-consumed", 0),
+            "inner_txns": _count_inner(group["txn-results"][-1]["txn-result"]),
+        }
+
+    def create(self) -> None:
+        factory = self.algorand.client.get_app_factory(
+            app_spec=APP_SPEC.read_text(), default_sender=self.admin.address
+        )
+        create_params = algokit_utils.AppFactoryCreateMethodCallParams(method="init()void")
+        metrics = self._measure(
+            "init",
+            self.algorand.new_group().add_app_create_method_call(
+                factory.params.create(create_params)
+            ),
+        )
+        self.client, _result = factory.send.create(create_params)
+        metrics["mbr"] = self._app_min_balance()
+        self.results["init"] = metrics
+        # Base balance for the app account and the asset it creates
+        self.algorand.send.payment(
+            algokit_utils.PaymentParams(
+                sender=self.admin.address,
+                receiver=self.client.app_address,
+                amount=AlgoAmount(algo=1),
+            )
+        )
+
+    def call(
+        self,
+        case: str | None,
+        sender: SigningAccount,
+        method: str,
+        args: list[Any],
+        *,
+        pay: int | None = None,
+        inner_txns: int = 0,
+        readonly: bool = False,
+    ) -> Any:
+        def compose() -> algokit_utils.TransactionComposer:
+            call_args: list[Any] = [
+                arg.address if isinstance(arg, SigningAccount) else arg for arg in args
+            ]
+            if pay is not None:
+                call_args.append(
+                    self.algorand.create_transaction.payment(
+                        algokit_utils.PaymentParams(
+                            sender=sender.address,
+                            receiver=self.client.app_address,
+                            amount=AlgoAmount(micro_algo=pay),
+                        )
+                    )
+                )
+            params = self.client.params.call(
+                algokit_utils.AppClientMethodCallParams(
+                    method=method,
+                    args=call_args,
+                    sender=sender.address,
+                    signer=sender.signer,
+                    static_fee=AlgoAmount(micro_algo=1000 * (1 + inner_txns)),
+                )
+            )
+            return self.algorand.new_group().add_app_call_method_call(params)
+
+        metrics = self._measure(case, compose())
+        if readonly:
+            result = compose().simulate(allow_unnamed_resources=True, skip_signatures=True)
+        else:
+            mbr_before = self._app_min_balance()
+            result = compose().send(
+                algokit_utils.SendParams(populate_app_call_resources=True)
+            )
+            metrics["mbr"] = self._app_min_balance() - mbr_before
+        if case is not None:
+            self.results[case] = metrics
+        return result.returns[-1].value if result.returns else None
+
+    def new_account(self, asset_id: int) -> SigningAccount:
+        account = self._funded_account()
+        self.opt_in(account, asset_id)
+        return account
+
+    def opt_in(self, account: SigningAccount, asset_id: int) -> None:
+        self.algorand.send.asset_opt_in(
+            algokit_utils.AssetOptInParams(sender=account.address, asset_id=asset_id)
+        )
+
+    def current_round(self) -> int:
+        return int(self.algorand.client.algod.status()["last-round"])
+
+    def advance_rounds(self, count: int) -> None:
+        # LocalNet closes a round per transaction
+        for _ in range(count):
+            self.algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    sender=self.admin.address,
+                    receiver=self.admin.address,
+                    amount=AlgoAmount(micro_algo=0),
+                    note=f"advance {self.current_round()}".encode(),
+                )
+            )
+
+
+def run() -> dict[str, dict[str, int]]:
+    """Per-case metrics from one scenario run on LocalNet."""
+    bench = SimulateBench(algokit_utils.AlgorandClient.default_localnet())
+    scenario.run(bench)
+    return bench.results
@@ -1,27 +1,44 @@
 import dataclasses
+import functools
+import hashlib
 import importlib
+import json
 import logging
+import os
+import re
 import subprocess
 import sys
+import threading
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from shutil import rmtree
 
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+# Load environment variables first, so .env can select the production profile.
+load_dotenv()
+
+# The production profile (--production or AARNA_PRODUCTION=1) turns off debug
+# tracing, which costs extra simulate calls per transaction, and logs at INFO.
+production_flag = "--production"
+production = production_flag in sys.argv[1:] or os.getenv(
+    "AARNA_PRODUCTION", ""
+) not in ("", "0")
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
-config.configure(debug=True, trace_all=False)
+config.configure(debug=not production, trace_all=False)
 
-# Set up logging and load environment variables.
+# Set up logging.
 logging.basicConfig(
-    level=logging.DEBUG, format="%(asctime)s %(levelname)-10s: %(message)s"
+    level=logging.INFO if production else logging.DEBUG,
+    format="%(asctime)s %(levelname)-10s: %(message)s",
 )
 logger = logging.getLogger(__name__)
-logger.info("Loading .env")
-load_dotenv()
+logger.info("Loaded .env" + (" (production profile)" if production else ""))
 
 # Determine the root path based on this file's location.
 root_path = Path(__file__).parent
@@ -33,7 +50,11 @@ root_path = Path(__file__).parent
 class SmartContract:
     path: Path
     name: str
-    deploy: Callable[[], None] | None = None
+
+    @functools.cached_property
+    def deploy(self) -> Callable[[], None] | None:
+        """The contract's deploy function, imported on first use."""
+        return import_deploy_if_exists(self.path.parent)
 
 
 def import_contract(folder: Path) -> Path:
@@ -60,22 +81,50 @@ def has_contract_file(directory: Path) -> bool:
     return (directory / "contract.py").exists()
 
 
-# Use the current directory (root_path) as the base for contract folders and exclude
-# folders that start with '_' (internal helpers).
-contracts: list[SmartContract] = [
-    SmartContract(
-        path=import_contract(folder),
-        name=folder.name,
-        deploy=import_deploy_if_exists(folder),
-    )
-    for folder in root_path.iterdir()
-    if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
-]
+def discover_contracts(contract_name: str | None = None) -> list[SmartContract]:
+    """
+    Finds the contract folders under the current directory (root_path),
+    excluding folders that start with '_' (internal helpers). Given a
+    `contract_name`, only that folder is looked at. Deploy modules are not
+    imported here; see `SmartContract.deploy`.
+    """
+    if contract_name is not None:
+        folders = [root_path / contract_name]
+    else:
+        folders = sorted(root_path.iterdir())
+    return [
+        SmartContract(path=import_contract(folder), name=folder.name)
+        for folder in folders
+        if folder.is_dir() and has_contract_file(folder) and not folder.name.startswith("_")
+    ]
 
 # -------------------------- Build Logic -------------------------- #
 
 deployment_extension = "py"
 
+# Build fingerprints are kept next to the artifacts they describe. Set
+# AARNA_FULL_BUILD=1 to ignore them and rebuild everything.
+build_cache_file_name = ".build-cache.json"
+full_build = os.getenv("AARNA_FULL_BUILD", "") not in ("", "0")
+
+# Contracts are compiled and their clients generated in parallel, this many
+# at a time (defaults to the CPU count).
+build_workers = int(os.getenv("AARNA_BUILD_WORKERS", "0")) or os.cpu_count() or 1
+
+# The AVM caps an app's approval and clear programs at 8192 bytes together
+# (four 2048-byte pages); builds fail past this.
+max_program_bytes = 8192
+
+# Serialises streamed subprocess output so lines from parallel builds do not
+# interleave mid-line.
+_output_lock = threading.Lock()
+
+# Matches module imports from sibling packages, e.g. the factory's import
+# of smart_contracts.aarna_registry.contract, as (package, module).
+_contract_import = re.compile(
+    r"^\s*(?:from|import)\s+smart_contracts\.(\w+)\.(\w+)", re.MULTILINE
+)
+
 
 def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     """Constructs the output path for the generated client file."""
@@ -86,53 +135,173 @@ def _get_output_path(output_dir: Path, deployment_extension: str) -> Path:
     )
 
 
+@functools.cache
+def _compiler_version() -> str:
+    """The compiler version reported by AlgoKit, part of every build fingerprint."""
+    result = subprocess.run(
+        ["algokit", "--no-color", "compile", "python", "--version"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+    )
+    return result.stdout.strip()
+
+
+def _imported_contract_modules(source: Path) -> list[Path]:
+    """
+    The modules of contract packages that `source` imports. Other packages,
+    such as the generated clients under artifacts, are not compiled in.
+    """
+    modules: list[Path] = []
+    for package, module in _contract_import.findall(source.read_text()):
+        folder = root_path.resolve() / package
+        if has_contract_file(folder) and (folder / f"{module}.py").exists():
+            modules.append(folder / f"{module}.py")
+    return modules
+
+
+def _contract_sources(contract_path: Path) -> list[Path]:
+    """
+    The Python sources a contract is built from: its contract.py plus the
+    contract-package modules it imports, followed transitively. Deploy
+    configs and other files next to it do not affect the build.
+    """
+    sources: list[Path] = []
+    pending = [contract_path.resolve()]
+    while pending:
+        source = pending.pop()
+        if source in sources:
+            continue
+        sources.append(source)
+        pending.extend(_imported_contract_modules(source))
+    return sorted(sources)
+
+
+def _source_fingerprint(contract_path: Path, options: list[str]) -> str:
+    """Hash of the contract's sources, the compiler version and the compile options."""
+    digest = hashlib.sha256()
+    digest.update(_compiler_version().encode())
+    digest.update("\0".join(options).encode())
+    for source in _contract_sources(contract_path):
+        digest.update(str(source.relative_to(root_path.resolve())).encode())
+        digest.update(source.read_bytes())
+    return digest.hexdigest()
+
+
+def _contract_dependencies(contract_path: Path) -> set[str]:
+    """Names of the sibling contracts whose modules this contract imports."""
+    folder = contract_path.parent.resolve()
+    return {
+        module.parent.name
+        for module in _imported_contract_modules(contract_path)
+        if module.parent != folder
+    }
+
+
+def _run_streamed(command: list[str], prefix: str) -> subprocess.CompletedProcess[str]:
+    """
+    Run `command`, echoing each output line as it arrives, prefixed with
+    `prefix` so parallel builds stay readable. Returns the completed process
+    with the full output captured.
+    """
+    lines: list[str] = []
+    with subprocess.Popen(
+        command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True
+    ) as process:
+        assert process.stdout is not None
+        for line in process.stdout:
+            lines.append(line)
+            with _output_lock:
+                print(f"[{prefix}] {line}", end="", flush=True)
+    return subprocess.CompletedProcess(command, process.returncode, "".join(lines))
+
+
+def _file_fingerprint(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def _read_build_cache(output_dir: Path) -> dict[str, str]:
+    cache_path = output_dir / build_cache_file_name
+    if full_build or not cache_path.exists():
+        return {}
+    try:
+        return json.loads(cache_path.read_text())  # type: ignore[no-any-return]
+    except (OSError, ValueError):
+        return {}
+
+
+def _check_program_sizes(output_dir: Path) -> None:
+    """Fails the build if a contract's programs outgrow `max_program_bytes`."""
+    for approval in sorted(output_dir.glob("*.approval.bin")):
+        name = approval.name.removesuffix(".approval.bin")
+        clear = output_dir / f"{name}.clear.bin"
+        size = approval.stat().st_size + clear.stat().st_size
+        logger.info(f"[{output_dir.name}] {name} programs: {size} of {max_program_bytes} bytes")
+        if size > max_program_bytes:
+            raise Exception(
+                f"{name} programs are {size} bytes, over the {max_program_bytes}-byte limit"
+            )
+
+
 def build(output_dir: Path, contract_path: Path) -> Path:
     """
     Builds the contract by exporting (compiling) its source and generating a client.
-    If the output directory already exists, it is cleared.
+
+    Builds are incremental: compilation is skipped when the contract's
+    sources, the compiler version and the options all match the last build,
+    and client generation is skipped when the app spec is unchanged. When
+    the contract is recompiled, the output directory is cleared first.
     """
     output_dir = output_dir.resolve()
-    if output_dir.exists():
-        rmtree(output_dir)
-    output_dir.mkdir(exist_ok=True, parents=True)
-    logger.info(f"Exporting {contract_path} to {output_dir}")
-
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
+    options = ["--output-source-map", "--output-bytecode"]
+    cache = _read_build_cache(output_dir)
+    source_fingerprint = _source_fingerprint(contract_path, options)
 
-    if build_result.stdout:
-        print(build_result.stdout)
+    if cache.get("source") == source_fingerprint:
+        logger.info(f"{contract_path} unchanged since last build, skipping compile")
+    else:
+        if output_dir.exists():
+            rmtree(output_dir)
+        output_dir.mkdir(exist_ok=True, parents=True)
+        logger.info(f"Exporting {contract_path} to {output_dir}")
+
+        build_result = _run_streamed(
+            [
+                "algokit",
+                "--no-color",
+                "compile",
+                "python",
+                str(contract_path.resolve()),
+                f"--out-dir={output_dir}",
+                *options,
+            ],
+            output_dir.name,
+        )
 
-    if build_result.returncode:
-        raise Exception(f"Could not build contract:\n{build_result.stdout}")
+        if build_result.returncode:
+            raise Exception(f"Could not build contract:\n{build_result.stdout}")
+        _check_program_sizes(output_dir)
 
     # Look for arc56.json files and generate the client based on them.
-    app_spec_file_names: list[str] = [
-        file.name for file in output_dir.glob("*.arc56.json")
-    ]
+    app_spec_files = sorted(output_dir.glob("*.arc56.json"))
+    app_spec_file_names: list[str] = [file.name for file in app_spec_files]
+    app_spec_fingerprint = "".join(_file_fingerprint(file) for file in app_spec_files)
 
     client_file: str | None = None
     if not app_spec_file_names:
         logger.warning(
             "No '*.arc56.json' file found (likely a logic signature being compiled). Skipping client generation."
         )
+    elif cache.get("app_spec") == app_spec_fingerprint and any(
+        output_dir.glob(f"*.{deployment_extension}")
+    ):
+        client_file = app_spec_file_names[-1]
+        logger.info(f"App spec for {contract_path} unchanged, skipping client generation")
     else:
         for file_name in app_spec_file_names:
             client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
+            logger.info(f"[{output_dir.name}] Generating client for {file_name}")
+            generate_result = _run_streamed(
                 [
                     "algokit",
                     "generate",
@@ -141,14 +310,9 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     "--output",
                     str(_get_output_path(output_dir, deployment_extension)),
                 ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
+                output_dir.name,
             )
 
-            if generate_result.stdout:
-                print(generate_result.stdout)
-
             if generate_result.returncode:
                 if "No such command" in generate_result.stdout:
                     raise Exception(
@@ -158,31 +322,75 @@ def build(output_dir: Path, contract_path: Path) -> Path:
                     raise Exception(
                         f"Could not generate typed client:\n{generate_result.stdout}"
                     )
+
+    (output_dir / build_cache_file_name).write_text(
+        json.dumps({"source": source_fingerprint, "app_spec": app_spec_fingerprint})
+    )
     if client_file:
         return output_dir / client_file
     return output_dir
 
 
+def build_all(artifact_path: Path, to_build: list[SmartContract]) -> None:
+    """
+    Builds the given contracts on a pool of `build_workers` threads; each
+    build spends its time in compiler subprocesses. Every build runs to the
+    end, then the first failure, if any, is raised.
+    """
+    if not to_build:
+        return
+    _compiler_version()  # resolve once up front rather than in every worker
+    with ThreadPoolExecutor(max_workers=build_workers) as pool:
+        futures = []
+        for contract in to_build:
+            logger.info(f"Building app at {contract.path}")
+            futures.append(
+                pool.submit(build, artifact_path / contract.name, contract.path)
+            )
+    errors = [future.exception() for future in futures if future.exception()]
+    if errors:
+        raise errors[0]  # type: ignore[misc]
+
+
+def deploy_order(to_deploy: list[SmartContract]) -> list[SmartContract]:
+    """
+    Orders contracts so that each comes after the contracts it imports
+    (among those being deployed), keeping discovery order otherwise.
+    """
+    by_name = {contract.name: contract for contract in to_deploy}
+    ordered: list[SmartContract] = []
+    visiting: set[str] = set()
+
+    def visit(contract: SmartContract) -> None:
+        if contract in ordered:
+            return
+        if contract.name in visiting:
+            raise Exception(f"Circular contract dependency at {contract.name}")
+        visiting.add(contract.name)
+        for name in sorted(_contract_dependencies(contract.path)):
+            if name in by_name:
+                visit(by_name[name])
+        ordered.append(contract)
+
+    for contract in to_deploy:
+        visit(contract)
+    return ordered
+
+
 # --------------------------- Main Logic --------------------------- #
 
 
 def main(action: str, contract_name: str | None = None) -> None:
     """Main entry point to build and/or deploy smart contracts."""
     artifact_path = root_path / "artifacts"
-    # Filter contracts based on an optional specific contract name.
-    filtered_contracts = [
-        contract
-        for contract in contracts
-        if contract_name is None or contract.name == contract_name
-    ]
+    # Discover only the requested contract when one is named.
+    filtered_contracts = discover_contracts(contract_name)
 
     match action:
         case "build":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(artifact_path, filtered_contracts)
         case "deploy":
-            for contract in filtered_contracts:
+            for contract in deploy_order(filtered_contracts):
                 output_dir = artifact_path / contract.name
                 app_spec_file_name = next(
                     (
@@ -198,9 +406,8 @@ def main(action: str, contract_name: str | None = None) -> None:
                     logger.info(f"Deploying app {contract.name}")
                     contract.deploy()
         case "all":
-            for contract in filtered_contracts:
-                logger.info(f"Building app at {contract.path}")
-                build(artifact_path / contract.name, contract.path)
+            build_all(artifact_path, filtered_contracts)
+            for contract in deploy_order(filtered_contracts):
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
                     contract.deploy()
@@ -209,9 +416,10 @@ def main(action: str, contract_name: str | None = None) -> None:
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
+    args = [arg for arg in sys.argv[1:] if arg != production_flag]
+    if len(args) > 1:
+        main(args[0], args[1])
+    elif args:
+        main(args[0])
     else:
         main("all")
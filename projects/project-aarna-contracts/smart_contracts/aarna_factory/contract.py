@@ -0,0 +1,353 @@
+"""
+AarnaFactory — Regional shards of the Aarna registry
+Algorand ARC-4 Smart Contract (AlgoPy / Puya)
+
+One AarnaRegistry app is bounded by its own state and by the write traffic
+a single application can take. The factory spreads registration out by
+deploying one child AarnaRegistry per region through inner app-create
+transactions, each with its own AARNA asset, and keeps a routing table
+from region to child app plus aggregate totals across all children.
+
+The factory is admin of every child it creates, so children are managed
+through it (see `set_registry_validator`).
+
+Child program:
+  A registry's approval program is too large to embed in the factory's
+  own, so the admin uploads it once into the "code" box with
+  `set_registry_program` and `write_registry_program`. The clear program
+  and state schema come from the compiled AarnaRegistry.
+  `set_registry_program` also records the program's length and digest,
+  and `create_registry` checks the box against both, so a partial or
+  corrupted upload is never deployed.
+  A box reference covers 1 KB of box I/O, so a call that creates or reads
+  the whole box needs one reference per KB: 8 for an 8 KB program, spread
+  over the group.
+
+Storage:
+  Box "r" + region holds the region's `RegistryInfo`; box "i" + index lists
+  the regions in creation order. Whoever creates a box covers its MBR with
+  a payment to the app.
+"""
+
+from algopy import (
+    ARC4Contract,
+    Account,
+    Application,
+    BoxMap,
+    Bytes,
+    UInt64,
+    Txn,
+    Global,
+    itxn,
+    arc4,
+    compile_contract,
+    op,
+    subroutine,
+    String,
+    gtxn,
+)
+
+from smart_contracts.aarna_registry.contract import AarnaRegistry
+
+# Box holding the child registry's approval program.
+REGISTRY_PROGRAM_KEY = b"code"
+# Largest approval program an app can have (with all 3 extra pages), and
+# the most one stack value can hold.
+MAX_PROGRAM_BYTES = 8192
+MAX_STACK_BYTES = 4096
+DIGEST_BYTES = 32
+
+# Region names key the routing boxes (box names max 64 bytes).
+MAX_REGION_LENGTH = 32
+
+# ALGO forwarded to a new child: its own minimum balance plus the AARNA
+# asset it creates.
+REGISTRY_FUNDING = 300_000
+
+
+class RegistryInfo(arc4.Struct):
+    """
+    A child registry and its totals as of the last `sync_registry`.
+    """
+
+    app_id: arc4.UInt64
+    asset_id: arc4.UInt64
+    project_count: arc4.UInt64
+    credits_issued: arc4.UInt64
+
+
+# ── ARC-28 events ──
+
+
+class RegistryCreated(arc4.Struct):
+    region: arc4.String
+    app_id: arc4.UInt64
+    asset_id: arc4.UInt64
+
+
+class RegistrySynced(arc4.Struct):
+    region: arc4.String
+    project_count: arc4.UInt64
+    credits_issued: arc4.UInt64
+
+
+class AarnaFactory(ARC4Contract):
+    """
+    Deploys and routes to regional AarnaRegistry apps.
+
+    Roles:
+      - admin: uploads the child program, creates registries, assigns
+        their validators
+      - anyone: syncs a registry's totals into the aggregate
+    """
+
+    def __init__(self) -> None:
+        self.admin: Account = Global.zero_address
+
+        # ── Expected child program, checked by create_registry ──
+        self.registry_program_size: UInt64 = UInt64(0)
+        self.registry_program_digest: Bytes = Bytes()
+
+        # ── Aggregate totals across all child registries ──
+        self.registry_count: UInt64 = UInt64(0)
+        self.total_projects: UInt64 = UInt64(0)
+        self.total_credits_issued: UInt64 = UInt64(0)
+
+        # ── Routing table: region → child registry ──
+        self.registries = BoxMap(String, RegistryInfo, key_prefix=b"r")
+        # Region names by creation index, for enumeration
+        self.regions = BoxMap(UInt64, String, key_prefix=b"i")
+
+    # ═══════════════════════════════════════════════════
+    #  Initialization
+    # ═══════════════════════════════════════════════════
+
+    @arc4.abimethod(create="require")
+    def init(self) -> None:
+        """Deploy the factory and set the caller as admin."""
+        self.admin = Txn.sender
+
+    # ═══════════════════════════════════════════════════
+    #  Access Control
+    # ═══════════════════════════════════════════════════
+
+    @subroutine
+    def _only_admin(self) -> None:
+        assert Txn.sender == self.admin, "unauthorized: admin only"
+
+    # ═══════════════════════════════════════════════════
+    #  Storage Helpers
+    # ═══════════════════════════════════════════════════
+
+    @subroutine
+    def _load_registry(self, region: String) -> RegistryInfo:
+        assert region in self.registries, "unknown region"
+        return self.registries[region].copy()
+
+    @subroutine
+    def _program_pages(self, program_size: UInt64) -> tuple[Bytes, Bytes]:
+        """The child program in the "code" box, split to fit on the stack."""
+        first_page_size = program_size
+        if first_page_size > MAX_STACK_BYTES:
+            first_page_size = UInt64(MAX_STACK_BYTES)
+        return (
+            op.Box.extract(REGISTRY_PROGRAM_KEY, 0, first_page_size),
+            op.Box.extract(
+                REGISTRY_PROGRAM_KEY, first_page_size, program_size - first_page_size
+            ),
+        )
+
+    @subroutine
+    def _check_mbr_payment(
+        self, payment: gtxn.PaymentTransaction, mbr_before: UInt64
+    ) -> None:
+        """Assert `payment` covers any MBR growth since `mbr_before`."""
+        assert payment.receiver == Global.current_application_address, "pay the contract"
+        mbr_after = Global.current_application_address.min_balance
+        if mbr_after > mbr_before:
+            assert payment.amount >= mbr_after - mbr_before, "insufficient mbr payment"
+
+    # ═══════════════════════════════════════════════════
+    #  Admin Methods
+    # ═══════════════════════════════════════════════════
+
+    @arc4.abimethod
+    def transfer_admin(self, new_admin: Account) -> None:
+        """Admin transfers ownership to a new admin account."""
+        self._only_admin()
+        assert new_admin != Global.zero_address, "invalid: zero address"
+        self.admin = new_admin
+
+    @arc4.abimethod
+    def set_registry_program(
+        self,
+        size: UInt64,
+        digest: Bytes,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """
+        Admin (re)allocates the child approval program box as `size` zero
+        bytes, to be filled with write_registry_program, and records the
+        program's `digest`: sha512_256 over the sha512_256 of its first
+        MAX_STACK_BYTES and of the rest, since 8 KB does not fit one stack
+        value. `mbr_payment` must cover any MBR growth.
+        """
+        self._only_admin()
+        assert size > UInt64(0), "size must be > 0"
+        assert size <= MAX_PROGRAM_BYTES, "program too large"
+        assert digest.length == DIGEST_BYTES, "invalid digest"
+        mbr_before = Global.current_application_address.min_balance
+        _deleted = op.Box.delete(REGISTRY_PROGRAM_KEY)
+        _created = op.Box.create(REGISTRY_PROGRAM_KEY, size)
+        self.registry_program_size = size
+        self.registry_program_digest = digest
+        self._check_mbr_payment(mbr_payment, mbr_before)
+
+    @arc4.abimethod
+    def write_registry_program(self, offset: UInt64, chunk: Bytes) -> None:
+        """Admin writes `chunk` into the child approval program at `offset`."""
+        self._only_admin()
+        op.Box.replace(REGISTRY_PROGRAM_KEY, offset, chunk)
+
+    @arc4.abimethod
+    def create_registry(
+        self,
+        region: arc4.String,
+        validator: Account,
+        payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt64:
+        """
+        Admin deploys a child AarnaRegistry for `region`, funds it, assigns
+        its validator and has it create its AARNA asset.
+
+        `payment` covers the routing boxes, the MBR the new app adds to the
+        factory as its creator, and at least REGISTRY_FUNDING, which is
+        forwarded to the child. The outer transaction covers the inner fees.
+        The "code" box must match the length and digest given to
+        set_registry_program; reading it takes one box reference per KB.
+        Returns the child app id.
+        """
+        self._only_admin()
+        assert region.native.bytes.length <= MAX_REGION_LENGTH, "region too long"
+        assert region.native not in self.registries, "region exists"
+        assert payment.receiver == Global.current_application_address, "pay the contract"
+
+        program_size, has_program = op.Box.length(REGISTRY_PROGRAM_KEY)
+        assert has_program, "no registry program"
+        assert program_size == self.registry_program_size, "registry program size mismatch"
+        first_page, rest = self._program_pages(program_size)
+        assert (
+            op.sha512_256(op.sha512_256(first_page) + op.sha512_256(rest))
+            == self.registry_program_digest
+        ), "registry program digest mismatch"
+
+        mbr_before = Global.current_application_address.min_balance
+        compiled = compile_contract(AarnaRegistry)
+        child = (
+            itxn.ApplicationCall(
+                approval_program=(first_page, rest),
+                clear_state_program=compiled.clear_state_program,
+                global_num_uint=compiled.global_uints,
+                global_num_bytes=compiled.global_bytes,
+                extra_program_pages=compiled.extra_program_pages,
+                app_args=(arc4.arc4_signature("init()void"),),
+            )
+            .submit()
+            .created_app
+        )
+
+        self.registries[region.native] = RegistryInfo(
+            app_id=arc4.UInt64(child.id),
+            asset_id=arc4.UInt64(0),
+            project_count=arc4.UInt64(0),
+            credits_issued=arc4.UInt64(0),
+        )
+        self.regions[self.registry_count] = region.native
+        self.registry_count += 1
+
+        mbr_delta = Global.current_application_address.min_balance - mbr_before
+        assert payment.amount >= mbr_delta + REGISTRY_FUNDING, "insufficient payment"
+        itxn.Payment(receiver=child.address, amount=payment.amount - mbr_delta).submit()
+
+        arc4.abi_call(AarnaRegistry.set_validator, validator, app_id=child)
+        asset_id, _txn = arc4.abi_call(AarnaRegistry.ensure_token, app_id=child)
+
+        info = self.registries[region.native].copy()
+        info.asset_id = asset_id
+        self.registries[region.native] = info.copy()
+        arc4.emit(
+            RegistryCreated(region=region, app_id=info.app_id, asset_id=asset_id)
+        )
+        return info.app_id
+
+    @arc4.abimethod
+    def set_registry_validator(self, region: arc4.String, validator: Account) -> None:
+        """Admin assigns the validator of a region's registry."""
+        self._only_admin()
+        info = self._load_registry(region.native)
+        arc4.abi_call(
+            AarnaRegistry.set_validator,
+            validator,
+            app_id=Application(info.app_id.native),
+        )
+
+    # ═══════════════════════════════════════════════════
+    #  Aggregation
+    # ═══════════════════════════════════════════════════
+
+    @arc4.abimethod
+    def sync_registry(self, region: arc4.String) -> None:
+        """
+        Pull a region's project count and credits issued into the aggregate
+        totals. Anyone may call this; both figures only ever grow.
+        """
+        info = self._load_registry(region.native)
+        child = Application(info.app_id.native)
+        project_count, _exists = op.AppGlobal.get_ex_uint64(child, b"project_count")
+        credits_issued, _exists = op.AppGlobal.get_ex_uint64(
+            child, b"total_credits_issued"
+        )
+
+        self.total_projects += project_count - info.project_count.native
+        self.total_credits_issued += credits_issued - info.credits_issued.native
+        info.project_count = arc4.UInt64(project_count)
+        info.credits_issued = arc4.UInt64(credits_issued)
+        self.registries[region.native] = info.copy()
+        arc4.emit(
+            RegistrySynced(
+                region=region,
+                project_count=info.project_count,
+                credits_issued=info.credits_issued,
+            )
+        )
+
+    # ═══════════════════════════════════════════════════
+    #  Read-Only Getters
+    # ═══════════════════════════════════════════════════
+
+    @arc4.abimethod(readonly=True)
+    def get_admin(self) -> Account:
+        return self.admin
+
+    @arc4.abimethod(readonly=True)
+    def get_registry_count(self) -> arc4.UInt64:
+        return arc4.UInt64(self.registry_count)
+
+    @arc4.abimethod(readonly=True)
+    def get_total_projects(self) -> arc4.UInt64:
+        return arc4.UInt64(self.total_projects)
+
+    @arc4.abimethod(readonly=True)
+    def get_total_credits_issued(self) -> arc4.UInt64:
+        return arc4.UInt64(self.total_credits_issued)
+
+    @arc4.abimethod(readonly=True)
+    def get_registry(self, region: arc4.String) -> RegistryInfo:
+        """The child registry serving `region`."""
+        return self._load_registry(region.native)
+
+    @arc4.abimethod(readonly=True)
+    def get_region(self, index: UInt64) -> arc4.String:
+        """Name of the `index`-th region created."""
+        assert index < self.registry_count, "invalid region index"
+        return arc4.String(self.regions[index])
@@ -0,0 +1,212 @@
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+
+import algokit_utils
+
+from smart_contracts.aarna_factory.contract import MAX_STACK_BYTES, REGISTRY_PROGRAM_KEY
+from smart_contracts.aarna_registry.deploy_config import APP_FUNDING
+
+logger = logging.getLogger(__name__)
+
+REGISTRY_ARTIFACTS = (
+    Path(__file__).parent.parent / "artifacts" / "aarna_registry" / "AarnaRegistry"
+)
+
+# The factory account keeps its own minimum balance; boxes and children are
+# paid for by the payment in the call that creates them.
+FACTORY_FUNDING = algokit_utils.AlgoAmount(micro_algo=100_000)
+
+# Application arguments are capped at 2048 bytes per call, less the
+# selector, the uint64 offset and the chunk's length prefix.
+PROGRAM_CHUNK_BYTES = 2048 - 4 - 8 - 2
+PROGRAM_PAGE_BYTES = 2048
+
+# Inner transactions of create_registry: the app create, its funding, the
+# set_validator call, and ensure_token with the asset it creates.
+CREATE_REGISTRY_INNER_TXNS = 5
+
+# Minimum balance the AVM requires per box, per byte of its name and value,
+# per created app page and per global state slot.
+BOX_FLAT_MBR = 2_500
+BOX_BYTE_MBR = 400
+APP_PAGE_MBR = 100_000
+GLOBAL_UINT_MBR = 28_500
+GLOBAL_BYTES_MBR = 50_000
+
+
+def registry_program() -> tuple[bytes, bytes]:
+    """The registry's approval and clear programs, as the build wrote them."""
+    return (
+        REGISTRY_ARTIFACTS.with_suffix(".approval.bin").read_bytes(),
+        REGISTRY_ARTIFACTS.with_suffix(".clear.bin").read_bytes(),
+    )
+
+
+def registry_program_digest(approval: bytes) -> bytes:
+    """The digest set_registry_program expects for `approval`."""
+
+    def sha512_256(data: bytes) -> bytes:
+        return hashlib.new("sha512_256", data).digest()
+
+    return sha512_256(
+        sha512_256(approval[:MAX_STACK_BYTES]) + sha512_256(approval[MAX_STACK_BYTES:])
+    )
+
+
+def program_box_mbr(size: int) -> int:
+    """MBR of the factory's program box holding a `size` byte program."""
+    return BOX_FLAT_MBR + BOX_BYTE_MBR * (len(REGISTRY_PROGRAM_KEY) + size) if size else 0
+
+
+def create_registry_mbr(region: str) -> int:
+    """
+    MBR create_registry adds to the factory for `region`: the child app it
+    creates and the two routing boxes.
+    """
+    approval, clear = registry_program()
+    schema = json.loads(REGISTRY_ARTIFACTS.with_suffix(".arc56.json").read_text())
+    global_schema = schema["state"]["schema"]["global"]
+    pages = -(-(len(approval) + len(clear)) // PROGRAM_PAGE_BYTES)
+    region_bytes = len(region.encode())
+    return (
+        APP_PAGE_MBR * pages
+        + GLOBAL_UINT_MBR * global_schema["ints"]
+        + GLOBAL_BYTES_MBR * global_schema["bytes"]
+        # "r" + region -> RegistryInfo
+        + BOX_FLAT_MBR
+        + BOX_BYTE_MBR * (1 + region_bytes + 32)
+        # "i" + index -> region
+        + BOX_FLAT_MBR
+        + BOX_BYTE_MBR * (1 + 8 + region_bytes)
+    )
+
+
+# Bring the factory up, then upload the registry program if the factory does
+# not hold the current build, then create a registry for every region in
+# AARNA_REGIONS (comma separated) that it does not have yet. Re-running
+# against an up-to-date factory sends nothing after the lookups.
+def deploy() -> None:
+    from smart_contracts.artifacts.aarna_factory.aarna_factory_client import (
+        AarnaFactoryFactory,
+        AarnaFactoryMethodCallCreateParams,
+        CreateRegistryArgs,
+        SetRegistryProgramArgs,
+        WriteRegistryProgramArgs,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer_ = algorand.account.from_environment("DEPLOYER")
+    # Defaults to the deployer, which suits LocalNet
+    validator = os.getenv("AARNA_VALIDATOR_ADDRESS", deployer_.address)
+    regions = [
+        region.strip() for region in os.getenv("AARNA_REGIONS", "").split(",") if region.strip()
+    ]
+
+    factory = algorand.client.get_typed_app_factory(
+        AarnaFactoryFactory, default_sender=deployer_.address
+    )
+    app_client, result = factory.deploy(
+        create_params=AarnaFactoryMethodCallCreateParams(method="init()void"),
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+    logger.info(
+        f"{result.operation_performed.name} {app_client.app_name} ({app_client.app_id})"
+    )
+
+    # Funding and the program upload go out as one group. Every write needs
+    # the whole box in its I/O budget, which populating resources spreads
+    # over the group's calls.
+    group = algorand.new_group()
+    steps: list[str] = []
+
+    balance = algorand.account.get_information(app_client.app_address).amount
+    if balance.micro_algo < FACTORY_FUNDING.micro_algo:
+        group.add_payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(
+                    micro_algo=FACTORY_FUNDING.micro_algo - balance.micro_algo
+                ),
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+        steps.append("fund")
+
+    approval, _clear = registry_program()
+    digest = registry_program_digest(approval)
+    state = app_client.state.global_state
+    if state.registry_program_digest != digest or state.registry_program_size != len(
+        approval
+    ):
+        mbr_growth = program_box_mbr(len(approval)) - program_box_mbr(
+            state.registry_program_size or 0
+        )
+        group.add_app_call_method_call(
+            app_client.params.set_registry_program(
+                args=SetRegistryProgramArgs(
+                    size=len(approval),
+                    digest=digest,
+                    mbr_payment=algorand.create_transaction.payment(
+                        algokit_utils.PaymentParams(
+                            amount=algokit_utils.AlgoAmount(micro_algo=max(mbr_growth, 0)),
+                            sender=deployer_.address,
+                            receiver=app_client.app_address,
+                        )
+                    ),
+                )
+            )
+        )
+        for offset in range(0, len(approval), PROGRAM_CHUNK_BYTES):
+            group.add_app_call_method_call(
+                app_client.params.write_registry_program(
+                    args=WriteRegistryProgramArgs(
+                        offset=offset,
+                        chunk=approval[offset : offset + PROGRAM_CHUNK_BYTES],
+                    )
+                )
+            )
+        steps.append("upload_registry_program")
+
+    if steps:
+        group.send(algokit_utils.SendParams(populate_app_call_resources=True))
+        logger.info(f"Set up {app_client.app_name} in one group: {', '.join(steps)}")
+
+    existing = {box.name_raw for box in algorand.app.get_box_names(app_client.app_id)}
+    for region in regions:
+        if b"r" + region.encode() in existing:
+            continue
+        # Reading the 8 KB program box takes all 8 references one call can
+        # carry, so a read-only call rides along to hold the routing boxes.
+        created = (
+            algorand.new_group()
+            .add_app_call_method_call(
+                app_client.params.create_registry(
+                    args=CreateRegistryArgs(
+                        region=region,
+                        validator=validator,
+                        payment=algorand.create_transaction.payment(
+                            algokit_utils.PaymentParams(
+                                amount=algokit_utils.AlgoAmount(
+                                    micro_algo=create_registry_mbr(region)
+                                    + APP_FUNDING.micro_algo
+                                ),
+                                sender=deployer_.address,
+                                receiver=app_client.app_address,
+                            )
+                        ),
+                    ),
+                    params=algokit_utils.CommonAppCallParams(
+                        extra_fee=algokit_utils.AlgoAmount(
+                            micro_algo=1000 * CREATE_REGISTRY_INNER_TXNS
+                        )
+                    ),
+                )
+            )
+            .add_app_call_method_call(app_client.params.get_registry_count())
+            .send(algokit_utils.SendParams(populate_app_call_resources=True))
+        )
+        logger.info(f"Created the {region} registry ({created.returns[0].value})")
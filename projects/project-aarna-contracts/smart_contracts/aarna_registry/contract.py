@@ -7,6 +7,42 @@ Developers submit project evidence (IPFS CID), validators review and approve,
 and AARNA tokens are issued as carbon credits.
 
 Marketplace: token holders can list credits for sale, buyers pay ALGO.
+Buyers may also post standing bids, which new listings fill first.
+
+Market statistics: every fill, whether against a listing or a bid, updates
+running volume, notional and last price plus hourly trade windows, so a
+price and volume summary is one read (`get_market_stats`).
+
+Events: every state transition emits a typed ARC-28 event (see the event
+structs below), so indexers can follow changes round by round.
+
+Storage:
+  Each project lives in its own box ("p" + project id) holding a compact
+  `ProjectRecord`, each open listing in a box ("l" + listing id) holding a `Listing`
+  and each standing bid in a box ("b" + bid id) holding a `Bid`, so none has
+  a fixed upper bound. Whoever creates a box covers its minimum balance
+  requirement (MBR) with a payment to the app; closing a listing or bid
+  deletes its box and hands the MBR back. A listing may carry an expiry
+  round, after which it can no longer be bought; anyone may then sweep it,
+  returning the escrow to the seller and collecting the MBR.
+  A payout the app cannot deliver, such as a refund to a closed account,
+  is held in box "k" + address until that account calls `claim`, so one
+  unreachable counterparty never blocks the order book.
+
+  Project records are packed for size: a base32 CIDv1 is kept as its binary
+  CID (version, codec, multihash), the ecosystem as a one-byte code, status
+  and credits share one uint64 and the free-text fields are length-bounded.
+  Getters decode them back to strings and separate integers, drawing the
+  opcode budget for encoding a binary CID as base32 from the fee credit.
+
+  Box "c" + sha256(packed cid) maps evidence to its project, so a CID can
+  only be submitted once. Box "m" + project id optionally holds the Merkle
+  root of the project's measurement records, so a batch of any size costs
+  one transaction yet each record can be checked with `verify_inclusion`.
+  Reverse indexes give each account's own items without a scan: box
+  "sp" + address pages the account's project ids and "sl" + address its
+  open listing ids, as packed big-endian uint64s in fixed-size pages, so
+  an update touches at most two pages however long the index grows.
 
 Status codes:
   0 = none (uninitialised slot)
@@ -16,21 +52,367 @@ Status codes:
   4 = issued   — carbon credits transferred to submitter
 """
 
+import typing
+
 from algopy import (
     ARC4Contract,
     Account,
     Asset,
+    BigUInt,
+    BoxMap,
+    Bytes,
+    OpUpFeeSource,
+    TransactionType,
     UInt64,
     Txn,
     Global,
     itxn,
     arc4,
+    ensure_budget,
+    op,
     subroutine,
     String,
     gtxn,
-    log,
+    urange,
 )
 
+STATUS_PENDING = 1
+STATUS_VERIFIED = 2
+STATUS_REJECTED = 3
+STATUS_ISSUED = 4
+
+# Ecosystem codes, stored in one byte per project record (0 = unknown).
+ECOSYSTEM_MANGROVE = 1
+ECOSYSTEM_SEAGRASS = 2
+ECOSYSTEM_WETLAND = 3
+ECOSYSTEM_SALT_MARSH = 4
+
+# A record's state word holds the status code in its top byte and the
+# credit amount in the low 56 bits.
+STATUS_SHIFT = 56
+CREDITS_MASK = (1 << STATUS_SHIFT) - 1
+
+# Upper bounds on the free-text fields of a project record, in bytes.
+MAX_NAME_LENGTH = 64
+MAX_LOCATION_LENGTH = 64
+MAX_CID_LENGTH = 96
+
+# Domain separation for evidence Merkle trees: leaf = sha256(0x00 || record),
+# node = sha256(0x01 || lower child || higher child). Sorting each pair means
+# a proof is just the sibling hashes, with no left/right flags.
+MERKLE_LEAF_PREFIX = b"\x00"
+MERKLE_NODE_PREFIX = b"\x01"
+# Opcode budget reserved by verify_inclusion: the leaf hash and result plus
+# one sha256 per proof level, measured on the compiled TEAL at about 100 and
+# 56 opcodes.
+VERIFY_BUDGET = 150
+VERIFY_BUDGET_PER_LEVEL = 60
+
+# Multibase prefix of a base32 CID, and the leading byte of a binary CIDv1.
+# Text CIDs never start with 0x01, so a packed CID tells the two apart.
+CID_BASE32_PREFIX = b"b"
+CID_V1_PREFIX = b"\x01"
+BASE32_ALPHABET = b"abcdefghijklmnopqrstuvwxyz234567"
+
+# Paged getters stop before their encoded result outgrows the 1 KB log that
+# carries an ABI return value (less the 4-byte return prefix and some slack).
+MAX_PAGE_BYTES = 1000
+# A ListingView is 64 bytes, so a page of 15 of them always fits.
+LISTING_VIEW_BYTES = 8 + 32 + 8 + 8 + 8
+MAX_LISTING_PAGE = (MAX_PAGE_BYTES - 2) // LISTING_VIEW_BYTES
+
+# Opcode budget reserved by the submit methods: a fixed part per project
+# plus a part per CID character for decoding base32, measured on the
+# compiled TEAL at about 510 and 56 opcodes.
+SUBMIT_BUDGET_PER_PROJECT = 550
+SUBMIT_BUDGET_PER_CID_CHAR = 60
+# Opcode budget reserved per byte of a binary CID by the getters that encode
+# it back to base32, measured on the compiled TEAL at about 50.
+UNPACK_BUDGET_PER_CID_BYTE = 60
+# Opcode budget reserved per project by issue_credits_batch.
+ISSUE_BUDGET_PER_PROJECT = 200
+# Opcode budget reserved per project by the approve and reject batches,
+# measured on the compiled TEAL at about 280 for an approval.
+REVIEW_BUDGET_PER_PROJECT = 300
+# Opcode budget reserved per listing id by sweep_expired.
+SWEEP_BUDGET_PER_LISTING = 300
+# The AVM caps an inner transaction group at 16 transactions.
+MAX_INNER_GROUP_SIZE = 16
+
+# A transaction may log at most 32 times and 1024 bytes in total; events and
+# the ABI return value (4-byte prefix + encoding) both count.
+MAX_LOGS = 32
+MAX_LOG_BYTES = 1024
+# ProjectSubmitted is 4 (selector) + 8 + 32 + 2 (head) + 2 (length) bytes plus
+# the CID text: 107 bytes for a 59-character base32 CIDv1. With the 8 bytes
+# each id adds to the return value, 8 such projects fill a transaction's logs.
+SUBMIT_EVENT_BYTES = 48
+MAX_SUBMIT_BATCH = 8
+# The other batch methods log one fixed-size event per entry: ProjectApproved
+# (20 bytes) and ProjectRejected (12 bytes) run into MAX_LOGS first, and
+# CreditsIssued and ListingExpired are 52 bytes next to a uint64 return value.
+MAX_APPROVE_BATCH = MAX_LOGS
+MAX_REJECT_BATCH = MAX_LOGS
+MAX_ISSUE_BATCH = (MAX_LOG_BYTES - 12) // (4 + 8 + 32 + 8)
+MAX_SWEEP_BATCH = (MAX_LOG_BYTES - 12) // (4 + 8 + 32 + 8)
+
+# Opcode budget reserved per fill by the order book sweeps; each fill (or
+# expired ask swept on the way) relinks the book, records the trade and
+# submits inner transfers. Measured on the compiled TEAL at up to about 700
+# opcodes for an ask and 440 for a bid.
+FILL_BUDGET = 700
+# A fill logs a 68-byte ListingFilled or BidFilled event. 14 of them, the
+# placing method's own event and its return value fit in MAX_LOG_BYTES.
+MAX_FILLS = 14
+
+# MBR of a claim box: "k" + 32-byte address, holding a 16-byte Claim.
+CLAIM_BOX_MBR = 2500 + 400 * (1 + 32 + 16)
+
+# Reverse index box name prefixes, followed by the owning account's address.
+# That box holds the index length; the entries are packed uint64s in pages
+# of INDEX_PAGE_ENTRIES, each in a box named by the same key and a 2-byte
+# page number, so one page fits in the 1 KB a box reference may read.
+SUBMITTER_INDEX_PREFIX = b"sp"
+SELLER_INDEX_PREFIX = b"sl"
+INDEX_PAGE_ENTRIES = 128
+
+# Market statistics are bucketed into windows of this many seconds.
+STATS_WINDOW_SECONDS = 3600
+
+# Null links in the pending-review queue and the price-ordered ask and
+# bid indexes.
+NO_PROJECT = 0xFFFF_FFFF_FFFF_FFFF
+NO_LISTING = 0xFFFF_FFFF_FFFF_FFFF
+NO_BID = 0xFFFF_FFFF_FFFF_FFFF
+
+
+class ProjectRecord(arc4.Struct):
+    """A submitted project as stored in its box (see `Project` for the decoded form)."""
+
+    submitter: arc4.Address
+    state: arc4.UInt64  # status << STATUS_SHIFT | credits
+    ecosystem: arc4.UInt8  # ECOSYSTEM_* code
+    cid: arc4.DynamicBytes  # binary CIDv1, or the CID text as submitted
+    name: arc4.String
+    location: arc4.String
+
+
+class Project(arc4.Struct):
+    """A submitted project, decoded from its `ProjectRecord`."""
+
+    submitter: arc4.Address
+    cid: arc4.String
+    name: arc4.String
+    location: arc4.String
+    ecosystem: arc4.String
+    status: arc4.UInt64
+    credits: arc4.UInt64
+
+
+Hash: typing.TypeAlias = arc4.StaticArray[arc4.Byte, typing.Literal[32]]
+
+StatusCounts: typing.TypeAlias = arc4.StaticArray[arc4.UInt64, typing.Literal[5]]
+
+
+class ProjectTotals(arc4.Struct):
+    """Running totals for one ecosystem, updated as its projects move."""
+
+    by_status: StatusCounts  # project count per status code, index 0 unused
+    credits_issued: arc4.UInt64
+
+
+class EvidenceRoot(arc4.Struct):
+    """Merkle root committing to a project's measurement records."""
+
+    root: Hash
+    leaf_count: arc4.UInt64
+
+
+class PendingLink(arc4.Struct):
+    """A pending project's place in the review queue (NO_PROJECT at either end)."""
+
+    prev_pending: arc4.UInt64
+    next_pending: arc4.UInt64
+
+
+class ProjectSubmission(arc4.Struct):
+    """One entry of a submit_projects_batch call."""
+
+    name: arc4.String
+    location: arc4.String
+    ecosystem: arc4.String
+    cid: arc4.String
+
+
+class ProjectApproval(arc4.Struct):
+    """One entry of an approve_projects_batch call."""
+
+    project_id: arc4.UInt64
+    credits: arc4.UInt64
+
+
+class Listing(arc4.Struct):
+    """
+    An active marketplace listing; the box is deleted once it closes.
+    `prev_ask` / `next_ask` link it into the ask index, ordered by price
+    and then by listing time (NO_LISTING at either end).
+    """
+
+    seller: arc4.Address
+    amount: arc4.UInt64
+    price: arc4.UInt64
+    expires_round: arc4.UInt64  # last round it can be bought, 0 = never
+    prev_ask: arc4.UInt64
+    next_ask: arc4.UInt64
+    seller_slot: arc4.UInt64  # position in the seller's listing index
+
+
+class ListingView(arc4.Struct):
+    """A listing together with its id, as returned by paged getters."""
+
+    listing_id: arc4.UInt64
+    seller: arc4.Address
+    amount: arc4.UInt64
+    price: arc4.UInt64
+    expires_round: arc4.UInt64
+
+
+class Bid(arc4.Struct):
+    """
+    A standing buy order with its ALGO escrowed in the app (quantity * price).
+    `prev_bid` / `next_bid` link it into the bid index, ordered by price
+    (highest first) and then by bid time (NO_BID at either end).
+    """
+
+    bidder: arc4.Address
+    quantity: arc4.UInt64
+    price: arc4.UInt64
+    prev_bid: arc4.UInt64
+    next_bid: arc4.UInt64
+
+
+class BidView(arc4.Struct):
+    """A bid together with its id, as returned by getters."""
+
+    bid_id: arc4.UInt64
+    bidder: arc4.Address
+    quantity: arc4.UInt64
+    price: arc4.UInt64
+
+
+class Claim(arc4.Struct):
+    """Payouts the app could not deliver to an account, held until it claims them."""
+
+    algo: arc4.UInt64  # microALGO
+    tokens: arc4.UInt64  # AARNA
+
+
+class TradeWindow(arc4.Struct):
+    """Trades in the STATS_WINDOW_SECONDS window starting at `start` (unix time)."""
+
+    start: arc4.UInt64
+    volume: arc4.UInt64  # tokens traded
+    notional: arc4.UInt64  # microALGO paid
+    high: arc4.UInt64
+    low: arc4.UInt64  # 0 until the first trade
+
+
+class MarketStats(arc4.Struct):
+    """Running market statistics; prices are microALGO per token."""
+
+    volume: arc4.UInt64
+    notional: arc4.UInt64
+    trade_count: arc4.UInt64
+    vwap: arc4.UInt64  # notional / volume, 0 before the first trade
+    last_price: arc4.UInt64
+    last_trade_time: arc4.UInt64
+    current: TradeWindow
+    previous: TradeWindow
+
+
+# ── ARC-28 events, one per state transition ──
+
+
+class ProjectSubmitted(arc4.Struct):
+    project_id: arc4.UInt64
+    submitter: arc4.Address
+    cid: arc4.String
+
+
+class ProjectApproved(arc4.Struct):
+    project_id: arc4.UInt64
+    credits: arc4.UInt64
+
+
+class EvidenceCommitted(arc4.Struct):
+    project_id: arc4.UInt64
+    root: Hash
+    leaf_count: arc4.UInt64
+
+
+class ProjectRejected(arc4.Struct):
+    project_id: arc4.UInt64
+
+
+class CreditsIssued(arc4.Struct):
+    project_id: arc4.UInt64
+    submitter: arc4.Address
+    credits: arc4.UInt64
+
+
+class Listed(arc4.Struct):
+    listing_id: arc4.UInt64
+    seller: arc4.Address
+    amount: arc4.UInt64
+    price: arc4.UInt64
+
+
+class ListingFilled(arc4.Struct):
+    listing_id: arc4.UInt64
+    buyer: arc4.Address
+    quantity: arc4.UInt64
+    price: arc4.UInt64
+    remaining: arc4.UInt64
+
+
+class ListingCancelled(arc4.Struct):
+    listing_id: arc4.UInt64
+    seller: arc4.Address
+    amount: arc4.UInt64
+
+
+class ListingExpired(arc4.Struct):
+    listing_id: arc4.UInt64
+    seller: arc4.Address
+    amount: arc4.UInt64
+
+
+class BidPlaced(arc4.Struct):
+    bid_id: arc4.UInt64
+    bidder: arc4.Address
+    quantity: arc4.UInt64
+    price: arc4.UInt64
+
+
+class BidFilled(arc4.Struct):
+    bid_id: arc4.UInt64
+    seller: arc4.Address
+    quantity: arc4.UInt64
+    price: arc4.UInt64
+    remaining: arc4.UInt64
+
+
+class BidCancelled(arc4.Struct):
+    bid_id: arc4.UInt64
+    bidder: arc4.Address
+    quantity: arc4.UInt64
+
+
+class Claimed(arc4.Struct):
+    account: arc4.Address
+    algo: arc4.UInt64
+    tokens: arc4.UInt64
+
 
 class AarnaRegistry(ARC4Contract):
     """
@@ -57,61 +439,48 @@ class AarnaRegistry(ARC4Contract):
         self.project_count: UInt64 = UInt64(0)
         self.total_credits_issued: UInt64 = UInt64(0)
 
-        # ── Flat project storage (4 slots) ──
-        self.p0_submitter: Account = Global.zero_address
-        self.p0_cid: arc4.String = arc4.String("")
-        self.p0_name: arc4.String = arc4.String("")
-        self.p0_location: arc4.String = arc4.String("")
-        self.p0_ecosystem: arc4.String = arc4.String("")
-        self.p0_status: UInt64 = UInt64(0)
-        self.p0_credits: UInt64 = UInt64(0)
-
-        self.p1_submitter: Account = Global.zero_address
-        self.p1_cid: arc4.String = arc4.String("")
-        self.p1_name: arc4.String = arc4.String("")
-        self.p1_location: arc4.String = arc4.String("")
-        self.p1_ecosystem: arc4.String = arc4.String("")
-        self.p1_status: UInt64 = UInt64(0)
-        self.p1_credits: UInt64 = UInt64(0)
-
-        self.p2_submitter: Account = Global.zero_address
-        self.p2_cid: arc4.String = arc4.String("")
-        self.p2_name: arc4.String = arc4.String("")
-        self.p2_location: arc4.String = arc4.String("")
-        self.p2_ecosystem: arc4.String = arc4.String("")
-        self.p2_status: UInt64 = UInt64(0)
-        self.p2_credits: UInt64 = UInt64(0)
-
-        self.p3_submitter: Account = Global.zero_address
-        self.p3_cid: arc4.String = arc4.String("")
-        self.p3_name: arc4.String = arc4.String("")
-        self.p3_location: arc4.String = arc4.String("")
-        self.p3_ecosystem: arc4.String = arc4.String("")
-        self.p3_status: UInt64 = UInt64(0)
-        self.p3_credits: UInt64 = UInt64(0)
-
-        # ── Marketplace listing storage (4 slots) ──
+        # Project count per status code (index 0 unused)
+        self.status_counts = StatusCounts.from_bytes(op.bzero(5 * 8))
+
+        # ── Project storage: one box per project, keyed by project id ──
+        self.projects = BoxMap(UInt64, ProjectRecord, key_prefix=b"p")
+        # Running totals per ecosystem code
+        self.ecosystem_totals = BoxMap(UInt64, ProjectTotals, key_prefix=b"e")
+        # sha256(packed cid) → project id, to reject duplicate evidence
+        self.cid_index = BoxMap(Bytes, UInt64, key_prefix=b"c")
+        # Merkle roots of per-project measurement batches
+        self.evidence_roots = BoxMap(UInt64, EvidenceRoot, key_prefix=b"m")
+
+        # ── Pending-review queue: FIFO linked list of pending project ids ──
+        self.pending_queue = BoxMap(UInt64, PendingLink, key_prefix=b"q")
+        self.pending_head: UInt64 = UInt64(NO_PROJECT)
+        self.pending_tail: UInt64 = UInt64(NO_PROJECT)
+
+        # ── Marketplace listing storage: one box per listing ──
+        # listing_count is the next listing id; ids are never reused, so a
+        # closed listing releases all of its box MBR.
         self.listing_count: UInt64 = UInt64(0)
-
-        self.l0_seller: Account = Global.zero_address
-        self.l0_amount: UInt64 = UInt64(0)
-        self.l0_price: UInt64 = UInt64(0)
-        self.l0_active: UInt64 = UInt64(0)
-
-        self.l1_seller: Account = Global.zero_address
-        self.l1_amount: UInt64 = UInt64(0)
-        self.l1_price: UInt64 = UInt64(0)
-        self.l1_active: UInt64 = UInt64(0)
-
-        self.l2_seller: Account = Global.zero_address
-        self.l2_amount: UInt64 = UInt64(0)
-        self.l2_price: UInt64 = UInt64(0)
-        self.l2_active: UInt64 = UInt64(0)
-
-        self.l3_seller: Account = Global.zero_address
-        self.l3_amount: UInt64 = UInt64(0)
-        self.l3_price: UInt64 = UInt64(0)
-        self.l3_active: UInt64 = UInt64(0)
+        self.listings = BoxMap(UInt64, Listing, key_prefix=b"l")
+        # Head of the price-ordered ask index (cheapest, oldest listing)
+        self.best_ask_id: UInt64 = UInt64(NO_LISTING)
+
+        # ── Standing bids: one box per open bid ──
+        self.bid_count: UInt64 = UInt64(0)
+        self.bids = BoxMap(UInt64, Bid, key_prefix=b"b")
+        # Head of the price-ordered bid index (highest, oldest bid)
+        self.best_bid_id: UInt64 = UInt64(NO_BID)
+
+        # ── Claims: payouts held for accounts that could not receive them ──
+        self.claims = BoxMap(Account, Claim, key_prefix=b"k")
+
+        # ── Market statistics, updated by every fill ──
+        self.trade_volume: UInt64 = UInt64(0)
+        self.trade_notional: UInt64 = UInt64(0)
+        self.trade_count: UInt64 = UInt64(0)
+        self.last_price: UInt64 = UInt64(0)
+        self.last_trade_time: UInt64 = UInt64(0)
+        self.current_window = TradeWindow.from_bytes(op.bzero(5 * 8))
+        self.previous_window = TradeWindow.from_bytes(op.bzero(5 * 8))
 
     # ═══════════════════════════════════════════════════
     #  Initialization
@@ -134,6 +503,787 @@ class AarnaRegistry(ARC4Contract):
     def _only_validator(self) -> None:
         assert Txn.sender == self.validator, "unauthorized: validator only"
 
+    # ═══════════════════════════════════════════════════
+    #  Storage Helpers
+    # ═══════════════════════════════════════════════════
+
+    @subroutine
+    def _load_project(self, project_id: UInt64) -> ProjectRecord:
+        assert project_id < self.project_count, "invalid project id"
+        return self.projects[project_id].copy()
+
+    @subroutine
+    def _create_project(
+        self,
+        name: arc4.String,
+        location: arc4.String,
+        ecosystem: arc4.String,
+        cid: arc4.String,
+    ) -> UInt64:
+        assert name.native.bytes.length <= MAX_NAME_LENGTH, "name too long"
+        assert location.native.bytes.length <= MAX_LOCATION_LENGTH, "location too long"
+        ecosystem_code = self._ecosystem_code(ecosystem.native)
+        assert ecosystem_code, "unknown ecosystem"
+        packed_cid = self._pack_cid(cid.native)
+        assert packed_cid.length <= MAX_CID_LENGTH, "cid too long"
+
+        project_id = self.project_count
+        cid_hash = op.sha256(packed_cid)
+        assert cid_hash not in self.cid_index, "duplicate evidence cid"
+        self.cid_index[cid_hash] = project_id
+        self.projects[project_id] = ProjectRecord(
+            submitter=arc4.Address(Txn.sender),
+            state=self._pack_state(UInt64(STATUS_PENDING), UInt64(0)),
+            ecosystem=arc4.UInt8(ecosystem_code),
+            cid=arc4.DynamicBytes(packed_cid),
+            name=name,
+            location=location,
+        )
+        self.project_count = project_id + UInt64(1)
+        _slot = self._index_append(Bytes(SUBMITTER_INDEX_PREFIX) + Txn.sender.bytes, project_id)
+        self._enqueue_pending(project_id)
+        self._tally(ecosystem_code, UInt64(0), UInt64(STATUS_PENDING), UInt64(0))
+        arc4.emit(
+            ProjectSubmitted(
+                project_id=arc4.UInt64(project_id),
+                submitter=arc4.Address(Txn.sender),
+                cid=cid,
+            )
+        )
+        return project_id
+
+    @subroutine
+    def _approve(self, project_id: UInt64, credits: UInt64) -> None:
+        assert credits > UInt64(0), "credits must be > 0"
+        assert credits <= CREDITS_MASK, "credits too large"
+        project = self._load_project(project_id)
+        assert project.state.native >> STATUS_SHIFT == STATUS_PENDING, "project not pending"
+        project.state = self._pack_state(UInt64(STATUS_VERIFIED), credits)
+        self.projects[project_id] = project.copy()
+        self._dequeue_pending(project_id, project.submitter.native)
+        self._tally(
+            project.ecosystem.native,
+            UInt64(STATUS_PENDING),
+            UInt64(STATUS_VERIFIED),
+            UInt64(0),
+        )
+        arc4.emit(
+            ProjectApproved(
+                project_id=arc4.UInt64(project_id), credits=arc4.UInt64(credits)
+            )
+        )
+
+    @subroutine
+    def _reject(self, project_id: UInt64) -> None:
+        project = self._load_project(project_id)
+        assert project.state.native >> STATUS_SHIFT == STATUS_PENDING, "project not pending"
+        project.state = self._pack_state(UInt64(STATUS_REJECTED), UInt64(0))
+        self.projects[project_id] = project.copy()
+        self._dequeue_pending(project_id, project.submitter.native)
+        self._tally(
+            project.ecosystem.native,
+            UInt64(STATUS_PENDING),
+            UInt64(STATUS_REJECTED),
+            UInt64(0),
+        )
+        arc4.emit(ProjectRejected(project_id=arc4.UInt64(project_id)))
+
+    @subroutine
+    def _mark_issued(self, project_id: UInt64) -> tuple[Account, UInt64]:
+        """
+        Move a verified project to issued; the caller transfers the credits.
+        Returns the (submitter, credits) to transfer.
+        """
+        project = self._load_project(project_id)
+        assert project.state.native >> STATUS_SHIFT == STATUS_VERIFIED, "project not verified"
+        credits = project.state.native & CREDITS_MASK
+        project.state = self._pack_state(UInt64(STATUS_ISSUED), credits)
+        self.projects[project_id] = project.copy()
+        self._tally(
+            project.ecosystem.native,
+            UInt64(STATUS_VERIFIED),
+            UInt64(STATUS_ISSUED),
+            credits,
+        )
+        arc4.emit(
+            CreditsIssued(
+                project_id=arc4.UInt64(project_id),
+                submitter=project.submitter,
+                credits=arc4.UInt64(credits),
+            )
+        )
+        return project.submitter.native, credits
+
+    @subroutine
+    def _pack_state(self, status: UInt64, credits: UInt64) -> arc4.UInt64:
+        """A record's state word for `status` and `credits`."""
+        return arc4.UInt64((status << STATUS_SHIFT) | credits)
+
+    @subroutine
+    def _decode_project(self, project: ProjectRecord) -> Project:
+        """Expand a stored record into the `Project` returned by getters."""
+        return Project(
+            submitter=project.submitter,
+            cid=arc4.String(self._unpack_cid(project.cid.native)),
+            name=project.name,
+            location=project.location,
+            ecosystem=arc4.String(self._ecosystem_name(project.ecosystem.native)),
+            status=arc4.UInt64(project.state.native >> STATUS_SHIFT),
+            credits=arc4.UInt64(project.state.native & CREDITS_MASK),
+        )
+
+    @subroutine
+    def _ecosystem_code(self, ecosystem: String) -> UInt64:
+        """ECOSYSTEM_* code for an ecosystem name, or 0 if it is not tracked."""
+        if ecosystem == "Mangrove":
+            return UInt64(ECOSYSTEM_MANGROVE)
+        if ecosystem == "Seagrass":
+            return UInt64(ECOSYSTEM_SEAGRASS)
+        if ecosystem == "Wetland":
+            return UInt64(ECOSYSTEM_WETLAND)
+        if ecosystem == "Salt Marsh":
+            return UInt64(ECOSYSTEM_SALT_MARSH)
+        return UInt64(0)
+
+    @subroutine
+    def _ecosystem_name(self, code: UInt64) -> String:
+        if code == ECOSYSTEM_MANGROVE:
+            return String("Mangrove")
+        if code == ECOSYSTEM_SEAGRASS:
+            return String("Seagrass")
+        if code == ECOSYSTEM_WETLAND:
+            return String("Wetland")
+        if code == ECOSYSTEM_SALT_MARSH:
+            return String("Salt Marsh")
+        return String()
+
+    @subroutine
+    def _pack_cid(self, cid: String) -> Bytes:
+        """
+        Compact form of an evidence CID: a base32 CIDv1 ("b…") becomes its
+        binary CID, any other CID is kept as text.
+        """
+        text = cid.bytes
+        if text[:1] != CID_BASE32_PREFIX:
+            return text
+        packed = self._base32_decode(text[1:])
+        assert packed[:1] == CID_V1_PREFIX, "invalid cid"
+        return packed
+
+    @subroutine
+    def _unpack_cid(self, packed: Bytes) -> String:
+        """
+        The CID text for a packed CID. Encoding a binary CID draws its
+        opcode budget from the group's fee credit when the call does not
+        already have it.
+        """
+        if packed[:1] == CID_V1_PREFIX:
+            ensure_budget(
+                UNPACK_BUDGET_PER_CID_BYTE * packed.length, OpUpFeeSource.GroupCredit
+            )
+            return String.from_bytes(
+                Bytes(CID_BASE32_PREFIX) + self._base32_encode(packed)
+            )
+        return String.from_bytes(packed)
+
+    @subroutine
+    def _base32_decode(self, text: Bytes) -> Bytes:
+        """
+        Decode unpadded lowercase RFC 4648 base32. Input that would not
+        encode back to the same text is rejected.
+        """
+        decoded = Bytes()
+        buffer = UInt64(0)
+        bits = UInt64(0)
+        for i in urange(text.length):
+            char = op.getbyte(text, i)
+            if char >= 97 and char <= 122:  # a-z
+                value = char - 97
+            else:
+                assert char >= 50 and char <= 55, "invalid cid"  # 2-7
+                value = char - 24
+            buffer = (buffer << 5) | value
+            bits += 5
+            if bits >= 8:
+                bits -= 8
+                decoded += op.extract(op.itob(buffer >> bits), 7, 1)
+                buffer &= (UInt64(1) << bits) - 1
+        # Leftover bits are padding and must be zero
+        assert bits < 5 and buffer == 0, "invalid cid"
+        return decoded
+
+    @subroutine
+    def _base32_encode(self, data: Bytes) -> Bytes:
+        """Encode bytes as unpadded lowercase RFC 4648 base32."""
+        alphabet = Bytes(BASE32_ALPHABET)
+        text = Bytes()
+        buffer = UInt64(0)
+        bits = UInt64(0)
+        for i in urange(data.length):
+            buffer = (buffer << 8) | op.getbyte(data, i)
+            bits += 8
+            while bits >= 5:
+                bits -= 5
+                text += op.extract(alphabet, (buffer >> bits) & 31, 1)
+            buffer &= (UInt64(1) << bits) - 1
+        if bits:
+            text += op.extract(alphabet, (buffer << (UInt64(5) - bits)) & 31, 1)
+        return text
+
+    @subroutine
+    def _enqueue_pending(self, project_id: UInt64) -> None:
+        """Append a project to the tail of the pending-review queue."""
+        tail = self.pending_tail
+        self.pending_queue[project_id] = PendingLink(
+            prev_pending=arc4.UInt64(tail),
+            next_pending=arc4.UInt64(NO_PROJECT),
+        )
+        if tail == NO_PROJECT:
+            self.pending_head = project_id
+        else:
+            self._set_pending_next(tail, project_id)
+        self.pending_tail = project_id
+
+    @subroutine
+    def _set_pending_next(self, project_id: UInt64, next_id: UInt64) -> None:
+        link = self.pending_queue[project_id].copy()
+        link.next_pending = arc4.UInt64(next_id)
+        self.pending_queue[project_id] = link.copy()
+
+    @subroutine
+    def _dequeue_pending(self, project_id: UInt64, submitter: Account) -> None:
+        """
+        Unlink a reviewed project from the pending-review queue and return
+        the queue entry's MBR to its submitter.
+        """
+        link = self.pending_queue[project_id].copy()
+        prev_id = link.prev_pending.native
+        next_id = link.next_pending.native
+        if prev_id == NO_PROJECT:
+            self.pending_head = next_id
+        else:
+            self._set_pending_next(prev_id, next_id)
+        if next_id == NO_PROJECT:
+            self.pending_tail = prev_id
+        else:
+            following = self.pending_queue[next_id].copy()
+            following.prev_pending = arc4.UInt64(prev_id)
+            self.pending_queue[next_id] = following.copy()
+
+        mbr_before = Global.current_application_address.min_balance
+        del self.pending_queue[project_id]
+        self._pay_out(
+            submitter, mbr_before - Global.current_application_address.min_balance
+        )
+
+    @subroutine
+    def _tally(
+        self,
+        ecosystem: UInt64,
+        from_status: UInt64,
+        to_status: UInt64,
+        credits: UInt64,
+    ) -> None:
+        """
+        Move one project from `from_status` (0 for a new project) to
+        `to_status` in the global and per-ecosystem counters, adding
+        `credits` to the ecosystem's issued total.
+        """
+        counts = self.status_counts.copy()
+        if from_status:
+            counts[from_status] = arc4.UInt64(counts[from_status].native - 1)
+        counts[to_status] = arc4.UInt64(counts[to_status].native + 1)
+        self.status_counts = counts.copy()
+
+        if ecosystem in self.ecosystem_totals:
+            totals = self.ecosystem_totals[ecosystem].copy()
+        else:
+            totals = ProjectTotals(
+                by_status=StatusCounts.from_bytes(op.bzero(5 * 8)),
+                credits_issued=arc4.UInt64(0),
+            )
+        if from_status:
+            totals.by_status[from_status] = arc4.UInt64(
+                totals.by_status[from_status].native - 1
+            )
+        totals.by_status[to_status] = arc4.UInt64(totals.by_status[to_status].native + 1)
+        totals.credits_issued = arc4.UInt64(totals.credits_issued.native + credits)
+        self.ecosystem_totals[ecosystem] = totals.copy()
+
+    @subroutine
+    def _check_mbr_payment(
+        self, payment: gtxn.PaymentTransaction, mbr_before: UInt64
+    ) -> None:
+        """Assert `payment` covers the MBR growth since `mbr_before`."""
+        assert payment.receiver == Global.current_application_address, "pay the contract"
+        mbr_delta = Global.current_application_address.min_balance - mbr_before
+        assert payment.amount >= mbr_delta, "insufficient mbr payment"
+
+    @subroutine
+    def _load_listing(self, listing_id: UInt64) -> Listing:
+        """An open listing; past its expiry round it counts as closed."""
+        assert listing_id in self.listings, "listing not active"
+        listing = self.listings[listing_id].copy()
+        assert not self._is_expired(listing.expires_round.native), "listing expired"
+        return listing
+
+    @subroutine
+    def _is_expired(self, expires_round: UInt64) -> bool:
+        return expires_round != 0 and Global.round > expires_round
+
+    @subroutine
+    def _active_ask(self, listing_id: UInt64) -> UInt64:
+        """
+        The first unexpired listing at or after `listing_id` in the ask
+        index, or NO_LISTING if there is none.
+        """
+        while listing_id != NO_LISTING and self._is_expired(
+            self.listings[listing_id].expires_round.native
+        ):
+            listing_id = self.listings[listing_id].next_ask.native
+        return listing_id
+
+    @subroutine
+    def _listing_view(self, listing_id: UInt64) -> ListingView:
+        listing = self.listings[listing_id].copy()
+        return ListingView(
+            listing_id=arc4.UInt64(listing_id),
+            seller=listing.seller,
+            amount=listing.amount,
+            price=listing.price,
+            expires_round=listing.expires_round,
+        )
+
+    @subroutine
+    def _expire_listing(self, listing_id: UInt64) -> UInt64:
+        """
+        Close an expired listing: return its escrow to the seller and delete
+        it. A seller no longer opted in to the token gets the escrow as a
+        claim, whose box MBR comes out of the listing's. Returns the MBR
+        released, for the caller to pay to the sweeper.
+        """
+        listing = self.listings[listing_id].copy()
+        mbr_before = Global.current_application_address.min_balance
+        if listing.seller.native.is_opted_in(self.aarna_asset):
+            itxn.AssetTransfer(
+                xfer_asset=self.aarna_asset,
+                asset_receiver=listing.seller.native,
+                asset_amount=listing.amount.native,
+            ).submit()
+        else:
+            self._hold_claim(listing.seller.native, UInt64(0), listing.amount.native)
+        arc4.emit(
+            ListingExpired(
+                listing_id=arc4.UInt64(listing_id),
+                seller=listing.seller,
+                amount=listing.amount,
+            )
+        )
+        _released = self._delete_listing(listing_id)
+        mbr_after = Global.current_application_address.min_balance
+        return mbr_before - mbr_after if mbr_before > mbr_after else UInt64(0)
+
+    @subroutine
+    def _fill_listing(
+        self, listing_id: UInt64, listing: Listing, quantity: UInt64
+    ) -> UInt64:
+        """
+        Take `quantity` escrowed tokens off a listing and pay the seller,
+        closing the listing once it is sold out. `listing` is the open
+        listing as the caller loaded it. The caller delivers the tokens.
+        Returns the ALGO cost.
+        """
+        assert quantity > UInt64(0), "quantity must be > 0"
+        assert quantity <= listing.amount.native, "quantity exceeds listing"
+        total_cost = quantity * listing.price.native
+        self._record_trade(quantity, listing.price.native)
+
+        seller_payout = total_cost
+        remaining = listing.amount.native - quantity
+        arc4.emit(
+            ListingFilled(
+                listing_id=arc4.UInt64(listing_id),
+                buyer=arc4.Address(Txn.sender),
+                quantity=arc4.UInt64(quantity),
+                price=listing.price,
+                remaining=arc4.UInt64(remaining),
+            )
+        )
+        if remaining:
+            listing.amount = arc4.UInt64(remaining)
+            self.listings[listing_id] = listing.copy()
+        else:
+            # Sold out: the released listing MBR goes back to the seller
+            seller_payout += self._delete_listing(listing_id)
+        # Forward ALGO to seller
+        self._pay_out(listing.seller.native, seller_payout)
+        return total_cost
+
+    @subroutine
+    def _find_ask_slot(self, price: UInt64, after_hint: UInt64) -> tuple[UInt64, UInt64]:
+        """
+        Find where a new ask at `price` belongs in the ask index, walking
+        forward from `after_hint` (NO_LISTING starts at the best ask).
+        Equal prices stay in listing order. Returns the (prev, next) ids.
+        """
+        prev_id = after_hint
+        if prev_id == NO_LISTING:
+            next_id = self.best_ask_id
+        else:
+            # An expired hint is still in the index, so it still serves
+            assert prev_id in self.listings, "listing not active"
+            hint = self.listings[prev_id].copy()
+            assert hint.price.native <= price, "bad price hint"
+            next_id = hint.next_ask.native
+        while next_id != NO_LISTING:
+            following = self.listings[next_id].copy()
+            if following.price.native > price:
+                break
+            prev_id = next_id
+            next_id = following.next_ask.native
+        return prev_id, next_id
+
+    @subroutine
+    def _set_ask_next(self, listing_id: UInt64, next_id: UInt64) -> None:
+        """Point `listing_id` (NO_LISTING for the index head) at `next_id`."""
+        if listing_id == NO_LISTING:
+            self.best_ask_id = next_id
+        else:
+            listing = self.listings[listing_id].copy()
+            listing.next_ask = arc4.UInt64(next_id)
+            self.listings[listing_id] = listing.copy()
+
+    @subroutine
+    def _set_ask_prev(self, listing_id: UInt64, prev_id: UInt64) -> None:
+        """Point `listing_id` back at `prev_id`; no-op past the index tail."""
+        if listing_id != NO_LISTING:
+            listing = self.listings[listing_id].copy()
+            listing.prev_ask = arc4.UInt64(prev_id)
+            self.listings[listing_id] = listing.copy()
+
+    @subroutine
+    def _index_length(self, key: Bytes) -> UInt64:
+        """Number of entries in the paged uint64 index at `key`."""
+        length, exists = op.Box.get(key)
+        return op.btoi(length) if exists else UInt64(0)
+
+    @subroutine
+    def _index_page_key(self, key: Bytes, slot: UInt64) -> Bytes:
+        """Name of the index page box holding `slot`."""
+        return key + op.extract(op.itob(slot // INDEX_PAGE_ENTRIES), 6, 2)
+
+    @subroutine
+    def _index_append(self, key: Bytes, item_id: UInt64) -> UInt64:
+        """Append `item_id` to the paged uint64 index at `key`. Returns its slot."""
+        slot = self._index_length(key)
+        page_key = self._index_page_key(key, slot)
+        offset = (slot % INDEX_PAGE_ENTRIES) * UInt64(8)
+        if offset:
+            op.Box.resize(page_key, offset + UInt64(8))
+            op.Box.replace(page_key, offset, op.itob(item_id))
+        else:
+            op.Box.put(page_key, op.itob(item_id))
+        op.Box.put(key, op.itob(slot + UInt64(1)))
+        return slot
+
+    @subroutine
+    def _index_remove(self, key: Bytes, slot: UInt64) -> UInt64:
+        """
+        Remove the entry at `slot` from the paged uint64 index at `key` by
+        moving the last entry into it; pages are deleted once empty, and
+        the length box with the last page. Returns the id of the moved
+        entry, or NO_LISTING if none moved.
+        """
+        last = self._index_length(key) - UInt64(1)
+        last_key = self._index_page_key(key, last)
+        last_offset = (last % INDEX_PAGE_ENTRIES) * UInt64(8)
+        moved_id = UInt64(NO_LISTING)
+        if slot != last:
+            moved = op.Box.extract(last_key, last_offset, UInt64(8))
+            op.Box.replace(
+                self._index_page_key(key, slot),
+                (slot % INDEX_PAGE_ENTRIES) * UInt64(8),
+                moved,
+            )
+            moved_id = op.btoi(moved)
+        if last_offset:
+            op.Box.resize(last_key, last_offset)
+        else:
+            _deleted = op.Box.delete(last_key)
+        if last:
+            op.Box.put(key, op.itob(last))
+        else:
+            _deleted = op.Box.delete(key)
+        return moved_id
+
+    @subroutine
+    def _index_page(
+        self, key: Bytes, start: UInt64, count: UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Entries `start` .. `start + count - 1` of the paged uint64 index at `key`."""
+        end = self._page_end(start, count, self._index_length(key))
+        # Keep the page within the ABI return value
+        max_entries = UInt64(MAX_PAGE_BYTES // 8)
+        if end - start > max_entries:
+            end = start + max_entries
+        packed = Bytes()
+        slot = start
+        while slot < end:
+            # Read up to the end of the index page holding `slot`
+            page_end = (slot // INDEX_PAGE_ENTRIES + 1) * INDEX_PAGE_ENTRIES
+            if page_end > end:
+                page_end = end
+            packed += op.Box.extract(
+                self._index_page_key(key, slot),
+                (slot % INDEX_PAGE_ENTRIES) * UInt64(8),
+                (page_end - slot) * UInt64(8),
+            )
+            slot = page_end
+        return arc4.DynamicArray[arc4.UInt64].from_bytes(
+            arc4.UInt16(end - start).bytes + packed
+        )
+
+    @subroutine
+    def _page_end(self, start: UInt64, count: UInt64, limit: UInt64) -> UInt64:
+        """Exclusive end of the id range [start, start + count) clamped to `limit`."""
+        if start >= limit:
+            return start
+        return start + count if count < limit - start else limit
+
+    @subroutine
+    def _delete_listing(self, listing_id: UInt64) -> UInt64:
+        """
+        Unlink a listing from the ask index and its seller's index, delete
+        its box. Returns the MBR released, for the caller
+        to pay out. If another listing moves into the vacated seller index
+        slot, its box is updated too and must be referenced.
+        """
+        listing = self.listings[listing_id].copy()
+        self._set_ask_next(listing.prev_ask.native, listing.next_ask.native)
+        self._set_ask_prev(listing.next_ask.native, listing.prev_ask.native)
+
+        mbr_before = Global.current_application_address.min_balance
+        moved_id = self._index_remove(
+            Bytes(SELLER_INDEX_PREFIX) + listing.seller.bytes,
+            listing.seller_slot.native,
+        )
+        if moved_id != NO_LISTING:
+            moved = self.listings[moved_id].copy()
+            moved.seller_slot = listing.seller_slot
+            self.listings[moved_id] = moved.copy()
+        del self.listings[listing_id]
+        return mbr_before - Global.current_application_address.min_balance
+
+    @subroutine
+    def _sweep_asks(
+        self, max_quantity: UInt64, max_price: UInt64, max_fills: UInt64
+    ) -> tuple[UInt64, UInt64]:
+        """
+        Fill up to `max_quantity` from the best asks priced at or below
+        `max_price`, paying each seller. Expired asks met on the way are
+        swept, and their MBR paid to the caller. Stops after `max_fills`
+        asks, filled or swept. The caller delivers the tokens.
+        Returns the (quantity bought, ALGO spent).
+        """
+        remaining = max_quantity
+        spent = UInt64(0)
+        reclaimed = UInt64(0)
+        fills = UInt64(0)
+        while remaining and self.best_ask_id != NO_LISTING and fills < max_fills:
+            fills += 1
+            listing_id = self.best_ask_id
+            listing = self.listings[listing_id].copy()
+            if listing.price.native > max_price:
+                break
+            if self._is_expired(listing.expires_round.native):
+                reclaimed += self._expire_listing(listing_id)
+                continue
+            quantity = remaining if remaining < listing.amount.native else listing.amount.native
+            spent += self._fill_listing(listing_id, listing, quantity)
+            remaining -= quantity
+        if reclaimed:
+            itxn.Payment(receiver=Txn.sender, amount=reclaimed).submit()
+        return max_quantity - remaining, spent
+
+    @subroutine
+    def _record_trade(self, quantity: UInt64, price: UInt64) -> None:
+        """Add a fill of `quantity` tokens at `price` to the market statistics."""
+        notional = quantity * price
+        self.trade_volume += quantity
+        self.trade_notional += notional
+        self.trade_count += 1
+        self.last_price = price
+        self.last_trade_time = Global.latest_timestamp
+
+        current, previous = self._trade_windows()
+        current.volume = arc4.UInt64(current.volume.native + quantity)
+        current.notional = arc4.UInt64(current.notional.native + notional)
+        if price > current.high.native:
+            current.high = arc4.UInt64(price)
+        if not current.low.native or price < current.low.native:
+            current.low = arc4.UInt64(price)
+        self.current_window = current.copy()
+        self.previous_window = previous.copy()
+
+    @subroutine
+    def _trade_windows(self) -> tuple[TradeWindow, TradeWindow]:
+        """
+        The (current, previous) trade windows as of now. Stored windows that
+        have gone stale are rolled forward, and empty ones filled in.
+        """
+        now = Global.latest_timestamp
+        start = now - now % STATS_WINDOW_SECONDS
+        current = self.current_window.copy()
+        previous = self.previous_window.copy()
+        if current.start.native != start:
+            if current.start.native + STATS_WINDOW_SECONDS == start:
+                previous = current.copy()
+            else:
+                previous = TradeWindow.from_bytes(op.bzero(5 * 8))
+                previous.start = arc4.UInt64(start - STATS_WINDOW_SECONDS)
+            current = TradeWindow.from_bytes(op.bzero(5 * 8))
+            current.start = arc4.UInt64(start)
+        return current.copy(), previous.copy()
+
+    @subroutine
+    def _load_bid(self, bid_id: UInt64) -> Bid:
+        assert bid_id in self.bids, "bid not active"
+        return self.bids[bid_id].copy()
+
+    @subroutine
+    def _fill_bid(self, bid_id: UInt64, seller: Account, quantity: UInt64) -> UInt64:
+        """
+        Claw `quantity` tokens from `seller` straight to a bidder, closing the
+        bid once it is filled. The caller pays the seller. Returns the ALGO
+        proceeds, released from the bid's escrow.
+        """
+        bid = self._load_bid(bid_id)
+        self._record_trade(quantity, bid.price.native)
+        itxn.AssetTransfer(
+            xfer_asset=self.aarna_asset,
+            asset_sender=seller,
+            asset_receiver=bid.bidder.native,
+            asset_amount=quantity,
+        ).submit()
+
+        remaining = bid.quantity.native - quantity
+        arc4.emit(
+            BidFilled(
+                bid_id=arc4.UInt64(bid_id),
+                seller=arc4.Address(seller),
+                quantity=arc4.UInt64(quantity),
+                price=bid.price,
+                remaining=arc4.UInt64(remaining),
+            )
+        )
+        if remaining:
+            bid.quantity = arc4.UInt64(remaining)
+            self.bids[bid_id] = bid.copy()
+        else:
+            # Filled: the released bid MBR goes back to the bidder
+            released_mbr = self._delete_bid(bid_id)
+            if released_mbr:
+                self._pay_out(bid.bidder.native, released_mbr)
+        return quantity * bid.price.native
+
+    @subroutine
+    def _find_bid_slot(self, price: UInt64, after_hint: UInt64) -> tuple[UInt64, UInt64]:
+        """
+        Find where a new bid at `price` belongs in the bid index, walking
+        forward from `after_hint` (NO_BID starts at the best bid).
+        Equal prices stay in bid order. Returns the (prev, next) ids.
+        """
+        prev_id = after_hint
+        if prev_id == NO_BID:
+            next_id = self.best_bid_id
+        else:
+            hint = self._load_bid(prev_id)
+            assert hint.price.native >= price, "bad price hint"
+            next_id = hint.next_bid.native
+        while next_id != NO_BID:
+            following = self.bids[next_id].copy()
+            if following.price.native < price:
+                break
+            prev_id = next_id
+            next_id = following.next_bid.native
+        return prev_id, next_id
+
+    @subroutine
+    def _set_bid_next(self, bid_id: UInt64, next_id: UInt64) -> None:
+        """Point `bid_id` (NO_BID for the index head) at `next_id`."""
+        if bid_id == NO_BID:
+            self.best_bid_id = next_id
+        else:
+            bid = self.bids[bid_id].copy()
+            bid.next_bid = arc4.UInt64(next_id)
+            self.bids[bid_id] = bid.copy()
+
+    @subroutine
+    def _set_bid_prev(self, bid_id: UInt64, prev_id: UInt64) -> None:
+        """Point `bid_id` back at `prev_id`; no-op past the index tail."""
+        if bid_id != NO_BID:
+            bid = self.bids[bid_id].copy()
+            bid.prev_bid = arc4.UInt64(prev_id)
+            self.bids[bid_id] = bid.copy()
+
+    @subroutine
+    def _delete_bid(self, bid_id: UInt64) -> UInt64:
+        """
+        Unlink a bid from the bid index and delete its box.
+        Returns the MBR released, for the caller to pay out.
+        """
+        bid = self.bids[bid_id].copy()
+        self._set_bid_next(bid.prev_bid.native, bid.next_bid.native)
+        self._set_bid_prev(bid.next_bid.native, bid.prev_bid.native)
+
+        mbr_before = Global.current_application_address.min_balance
+        del self.bids[bid_id]
+        return mbr_before - Global.current_application_address.min_balance
+
+    @subroutine
+    def _evict_bid(self, bid_id: UInt64) -> None:
+        """
+        Close a bid whose bidder has opted out of the token, so it can no
+        longer be filled. Its escrow and MBR are refunded through `_pay_out`.
+        """
+        bid = self.bids[bid_id].copy()
+        refund = bid.quantity.native * bid.price.native + self._delete_bid(bid_id)
+        self._pay_out(bid.bidder.native, refund)
+        arc4.emit(
+            BidCancelled(bid_id=arc4.UInt64(bid_id), bidder=bid.bidder, quantity=bid.quantity)
+        )
+
+    @subroutine
+    def _pay_out(self, receiver: Account, amount: UInt64) -> None:
+        """
+        Pay `amount` to `receiver`, or hold it as a claim if the payment
+        would fail: an account below its minimum balance, such as a closed
+        one, cannot take a payment that leaves it short.
+        """
+        if receiver.balance + amount >= receiver.min_balance:
+            itxn.Payment(receiver=receiver, amount=amount).submit()
+        else:
+            self._hold_claim(receiver, amount, UInt64(0))
+
+    @subroutine
+    def _hold_claim(self, account: Account, algo: UInt64, tokens: UInt64) -> None:
+        """
+        Add ALGO and tokens to what the app holds for `account` until it
+        calls `claim`. A new claim box's MBR comes out of `algo`; ALGO too
+        little to cover it, with no tokens to hold, stays with the app.
+        """
+        if account in self.claims:
+            claim = self.claims[account].copy()
+            claim.algo = arc4.UInt64(claim.algo.native + algo)
+        elif algo > CLAIM_BOX_MBR:
+            claim = Claim(algo=arc4.UInt64(algo - CLAIM_BOX_MBR), tokens=arc4.UInt64(0))
+        elif tokens:
+            claim = Claim(algo=arc4.UInt64(0), tokens=arc4.UInt64(0))
+        else:
+            return
+        claim.tokens = arc4.UInt64(claim.tokens.native + tokens)
+        self.claims[account] = claim.copy()
+
     # ═══════════════════════════════════════════════════
     #  Admin Methods
     # ═══════════════════════════════════════════════════
@@ -185,50 +1335,99 @@ class AarnaRegistry(ARC4Contract):
         location: arc4.String,
         ecosystem: arc4.String,
         cid: arc4.String,
+        mbr_payment: gtxn.PaymentTransaction,
     ) -> arc4.UInt64:
         """
         Developer submits a new project for review.
-        Returns the project index (0-3).
-        """
-        idx = self.project_count
-        assert idx < UInt64(4), "max projects reached (4)"
-        sender = Txn.sender
-
-        if idx == UInt64(0):
-            self.p0_submitter = sender
-            self.p0_name = name
-            self.p0_location = location
-            self.p0_ecosystem = ecosystem
-            self.p0_cid = cid
-            self.p0_status = UInt64(1)
-            self.p0_credits = UInt64(0)
-        elif idx == UInt64(1):
-            self.p1_submitter = sender
-            self.p1_name = name
-            self.p1_location = location
-            self.p1_ecosystem = ecosystem
-            self.p1_cid = cid
-            self.p1_status = UInt64(1)
-            self.p1_credits = UInt64(0)
-        elif idx == UInt64(2):
-            self.p2_submitter = sender
-            self.p2_name = name
-            self.p2_location = location
-            self.p2_ecosystem = ecosystem
-            self.p2_cid = cid
-            self.p2_status = UInt64(1)
-            self.p2_credits = UInt64(0)
-        else:
-            self.p3_submitter = sender
-            self.p3_name = name
-            self.p3_location = location
-            self.p3_ecosystem = ecosystem
-            self.p3_cid = cid
-            self.p3_status = UInt64(1)
-            self.p3_credits = UInt64(0)
-
-        self.project_count = idx + UInt64(1)
-        return arc4.UInt64(idx)
+        `mbr_payment` must cover the MBR of the new project box. Extra
+        opcode budget for packing the CID is drawn from the group's fee
+        credit, so the outer transaction must cover the resulting inner fees.
+        Returns the project id.
+        """
+        ensure_budget(
+            SUBMIT_BUDGET_PER_PROJECT + SUBMIT_BUDGET_PER_CID_CHAR * cid.native.bytes.length,
+            OpUpFeeSource.GroupCredit,
+        )
+        mbr_before = Global.current_application_address.min_balance
+        project_id = self._create_project(name, location, ecosystem, cid)
+        self._check_mbr_payment(mbr_payment, mbr_before)
+        return arc4.UInt64(project_id)
+
+    @arc4.abimethod
+    def submit_projects_batch(
+        self,
+        submissions: arc4.DynamicArray[ProjectSubmission],
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Submit up to MAX_SUBMIT_BATCH projects in one call; they get
+        consecutive ids. Each emits a ProjectSubmitted event, so batches of
+        CIDs longer than a base32 CIDv1 may have to be smaller still to stay
+        within MAX_LOG_BYTES.
+        `mbr_payment` must cover the MBR of all new project boxes, and the
+        box references for every new id must be spread over the group.
+        Extra opcode budget is drawn from the group's fee credit, so the
+        outer transaction must cover the resulting inner fees.
+        Returns the new project ids.
+        """
+        assert submissions.length <= MAX_SUBMIT_BATCH, "batch too large"
+        cid_chars = UInt64(0)
+        for i in urange(submissions.length):
+            cid_chars += submissions[i].cid.native.bytes.length
+        ensure_budget(
+            SUBMIT_BUDGET_PER_PROJECT * submissions.length
+            + SUBMIT_BUDGET_PER_CID_CHAR * cid_chars,
+            OpUpFeeSource.GroupCredit,
+        )
+        mbr_before = Global.current_application_address.min_balance
+        ids = arc4.DynamicArray[arc4.UInt64]()
+        # The return value: 4-byte prefix, 2-byte length, 8 bytes per id
+        log_bytes = UInt64(6) + submissions.length * 8
+        for i in urange(submissions.length):
+            submission = submissions[i].copy()
+            log_bytes += SUBMIT_EVENT_BYTES + submission.cid.native.bytes.length
+            assert log_bytes <= MAX_LOG_BYTES, "batch events exceed log limit"
+            project_id = self._create_project(
+                submission.name,
+                submission.location,
+                submission.ecosystem,
+                submission.cid,
+            )
+            ids.append(arc4.UInt64(project_id))
+        self._check_mbr_payment(mbr_payment, mbr_before)
+        return ids
+
+    @arc4.abimethod
+    def commit_evidence_root(
+        self,
+        project_id: UInt64,
+        root: Hash,
+        leaf_count: UInt64,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """
+        Submitter commits the Merkle root of a pending project's measurement
+        records, once. Records are hashed as leaves and paired as described
+        at MERKLE_LEAF_PREFIX; `mbr_payment` must cover the MBR of the root box.
+        """
+        project = self._load_project(project_id)
+        assert Txn.sender == project.submitter.native, "only submitter can commit"
+        assert project.state.native >> STATUS_SHIFT == STATUS_PENDING, "project not pending"
+        assert project_id not in self.evidence_roots, "evidence root already committed"
+        assert leaf_count > UInt64(0), "leaf count must be > 0"
+
+        mbr_before = Global.current_application_address.min_balance
+        self.evidence_roots[project_id] = EvidenceRoot(
+            root=root.copy(), leaf_count=arc4.UInt64(leaf_count)
+        )
+        self._check_mbr_payment(mbr_payment, mbr_before)
+        arc4.emit(
+            EvidenceCommitted(
+                project_id=arc4.UInt64(project_id),
+                root=root.copy(),
+                leaf_count=arc4.UInt64(leaf_count),
+            )
+        )
 
     # ═══════════════════════════════════════════════════
     #  Validator Methods
@@ -236,46 +1435,27 @@ class AarnaRegistry(ARC4Contract):
 
     @arc4.abimethod
     def approve_project(self, project_id: UInt64, credits: UInt64) -> None:
-        """Validator approves a project and assigns credit amount."""
+        """
+        Validator approves a project and assigns credit amount.
+        The project leaves the review queue, and an inner payment with a
+        zero fee refunds the queue entry's MBR to the submitter. The outer
+        transaction pays that fee (one extra minimum fee) and must reference
+        the submitter's account.
+        """
         self._only_validator()
-        assert project_id < self.project_count, "invalid project id"
-        assert credits > UInt64(0), "credits must be > 0"
-
-        if project_id == UInt64(0):
-            assert self.p0_status == UInt64(1), "project not pending"
-            self.p0_status = UInt64(2)
-            self.p0_credits = credits
-        elif project_id == UInt64(1):
-            assert self.p1_status == UInt64(1), "project not pending"
-            self.p1_status = UInt64(2)
-            self.p1_credits = credits
-        elif project_id == UInt64(2):
-            assert self.p2_status == UInt64(1), "project not pending"
-            self.p2_status = UInt64(2)
-            self.p2_credits = credits
-        else:
-            assert self.p3_status == UInt64(1), "project not pending"
-            self.p3_status = UInt64(2)
-            self.p3_credits = credits
+        self._approve(project_id, credits)
 
     @arc4.abimethod
     def reject_project(self, project_id: UInt64) -> None:
-        """Validator rejects a pending project."""
+        """
+        Validator rejects a pending project.
+        The project leaves the review queue, and an inner payment with a
+        zero fee refunds the queue entry's MBR to the submitter. The outer
+        transaction pays that fee (one extra minimum fee) and must reference
+        the submitter's account.
+        """
         self._only_validator()
-        assert project_id < self.project_count, "invalid project id"
-
-        if project_id == UInt64(0):
-            assert self.p0_status == UInt64(1), "project not pending"
-            self.p0_status = UInt64(3)
-        elif project_id == UInt64(1):
-            assert self.p1_status == UInt64(1), "project not pending"
-            self.p1_status = UInt64(3)
-        elif project_id == UInt64(2):
-            assert self.p2_status == UInt64(1), "project not pending"
-            self.p2_status = UInt64(3)
-        else:
-            assert self.p3_status == UInt64(1), "project not pending"
-            self.p3_status = UInt64(3)
+        self._reject(project_id)
 
     @arc4.abimethod
     def issue_credits(self, project_id: UInt64) -> arc4.UInt64:
@@ -285,365 +1465,718 @@ class AarnaRegistry(ARC4Contract):
         """
         self._only_validator()
         assert self.aarna_asset, "no AARNA token created"
-        assert project_id < self.project_count, "invalid project id"
 
-        if project_id == UInt64(0):
-            assert self.p0_status == UInt64(2), "project not verified"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=self.p0_submitter,
-                asset_amount=self.p0_credits,
-            ).submit()
-            self.p0_status = UInt64(4)
-            self.total_credits_issued = self.total_credits_issued + self.p0_credits
-            return arc4.UInt64(self.p0_credits)
-        elif project_id == UInt64(1):
-            assert self.p1_status == UInt64(2), "project not verified"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=self.p1_submitter,
-                asset_amount=self.p1_credits,
-            ).submit()
-            self.p1_status = UInt64(4)
-            self.total_credits_issued = self.total_credits_issued + self.p1_credits
-            return arc4.UInt64(self.p1_credits)
-        elif project_id == UInt64(2):
-            assert self.p2_status == UInt64(2), "project not verified"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=self.p2_submitter,
-                asset_amount=self.p2_credits,
-            ).submit()
-            self.p2_status = UInt64(4)
-            self.total_credits_issued = self.total_credits_issued + self.p2_credits
-            return arc4.UInt64(self.p2_credits)
-        else:
-            assert self.p3_status == UInt64(2), "project not verified"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=self.p3_submitter,
-                asset_amount=self.p3_credits,
-            ).submit()
-            self.p3_status = UInt64(4)
-            self.total_credits_issued = self.total_credits_issued + self.p3_credits
-            return arc4.UInt64(self.p3_credits)
+        submitter, credits = self._mark_issued(project_id)
+        itxn.AssetTransfer(
+            xfer_asset=self.aarna_asset,
+            asset_receiver=submitter,
+            asset_amount=credits,
+        ).submit()
+        self.total_credits_issued += credits
+        return arc4.UInt64(credits)
+
+    # ── Batch review ──
+
+    @arc4.abimethod
+    def approve_projects_batch(
+        self, approvals: arc4.DynamicArray[ProjectApproval]
+    ) -> None:
+        """
+        Validator approves up to MAX_APPROVE_BATCH pending projects in one
+        call. Each project's MBR refund is a zero-fee inner payment to its
+        submitter; those fees and the extra opcode budget are drawn from
+        the group's fee credit. Submitter accounts must be referenced
+        across the group.
+        """
+        self._only_validator()
+        assert approvals.length <= MAX_APPROVE_BATCH, "batch too large"
+        ensure_budget(
+            UInt64(REVIEW_BUDGET_PER_PROJECT) * approvals.length,
+            OpUpFeeSource.GroupCredit,
+        )
+        for i in urange(approvals.length):
+            approval = approvals[i].copy()
+            self._approve(approval.project_id.native, approval.credits.native)
+
+    @arc4.abimethod
+    def reject_projects_batch(self, project_ids: arc4.DynamicArray[arc4.UInt64]) -> None:
+        """
+        Validator rejects up to MAX_REJECT_BATCH pending projects in one
+        call. Each project's MBR refund is a zero-fee inner payment to its
+        submitter; those fees and the extra opcode budget are drawn from
+        the group's fee credit. Submitter accounts must be referenced
+        across the group.
+        """
+        self._only_validator()
+        assert project_ids.length <= MAX_REJECT_BATCH, "batch too large"
+        ensure_budget(
+            UInt64(REVIEW_BUDGET_PER_PROJECT) * project_ids.length,
+            OpUpFeeSource.GroupCredit,
+        )
+        for project_id in project_ids:
+            self._reject(project_id.native)
+
+    @arc4.abimethod
+    def issue_credits_batch(
+        self, project_ids: arc4.DynamicArray[arc4.UInt64]
+    ) -> arc4.UInt64:
+        """
+        Validator issues credits for up to MAX_ISSUE_BATCH verified projects
+        in one call.
+
+        The ASA transfers are submitted as inner groups of up to 16 with a
+        zero fee, so the outer transaction must pay for them through fee
+        pooling. Extra opcode budget is drawn the same way. Submitter
+        accounts and project boxes must be referenced across the group.
+        Returns the number of credits issued by this call.
+        """
+        self._only_validator()
+        assert self.aarna_asset, "no AARNA token created"
+        assert project_ids.length <= MAX_ISSUE_BATCH, "batch too large"
+        ensure_budget(
+            UInt64(ISSUE_BUDGET_PER_PROJECT) * project_ids.length,
+            OpUpFeeSource.GroupCredit,
+        )
+
+        issued = UInt64(0)
+        group_size = UInt64(0)
+        for project_id in project_ids:
+            submitter, credits = self._mark_issued(project_id.native)
+            if group_size == 0:
+                op.ITxnCreate.begin()
+            else:
+                op.ITxnCreate.next()
+            op.ITxnCreate.set_type_enum(TransactionType.AssetTransfer)
+            op.ITxnCreate.set_fee(0)
+            op.ITxnCreate.set_xfer_asset(self.aarna_asset)
+            op.ITxnCreate.set_asset_receiver(submitter)
+            op.ITxnCreate.set_asset_amount(credits)
+            group_size += 1
+            if group_size == MAX_INNER_GROUP_SIZE:
+                op.ITxnCreate.submit()
+                group_size = UInt64(0)
+            issued += credits
+        if group_size:
+            op.ITxnCreate.submit()
+
+        self.total_credits_issued += issued
+        return arc4.UInt64(issued)
 
     # ═══════════════════════════════════════════════════
     #  Marketplace
     # ═══════════════════════════════════════════════════
 
     @arc4.abimethod
-    def list_for_sale(self, amount: UInt64, price_per_token: UInt64) -> arc4.UInt64:
+    def list_for_sale(
+        self,
+        amount: UInt64,
+        price_per_token: UInt64,
+        expires_round: UInt64,
+        after_hint: UInt64,
+        max_fills: UInt64,
+        mbr_payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt64:
         """
-        List AARNA tokens for sale. Uses clawback to escrow tokens
-        from seller into the contract. Returns the listing index.
+        List AARNA tokens for sale. Standing bids priced at or above
+        `price_per_token` are filled first, best price first, at the bid's
+        price; tokens move by clawback straight to each bidder. Bids whose
+        bidder has opted out of the token are closed and refunded on the
+        way. Whatever is left is escrowed into the contract by clawback and
+        listed, unless bids past `max_fills` still cross it, in which case it
+        stays with the seller. Returns the listing id, or NO_LISTING if
+        nothing was listed.
 
         Args:
             amount: number of AARNA tokens to sell
             price_per_token: price per token in microALGO
+            expires_round: last round the listing can be bought in, or 0
+                to keep it open until sold out or cancelled
+            after_hint: the last active listing priced at or below
+                `price_per_token`, or NO_LISTING if there is none; the
+                ask index is walked forward from here
+            max_fills: most crossing bids to fill or close, up to MAX_FILLS;
+                FILL_BUDGET opcodes per fill are drawn from the group's fee
+                credit
+            mbr_payment: covers the MBR of the new listing box, if any;
+                whatever it does not cover is refunded with the proceeds
         """
         assert self.aarna_asset, "no AARNA token"
         assert amount > UInt64(0), "amount must be > 0"
         assert price_per_token > UInt64(0), "price must be > 0"
+        assert not self._is_expired(expires_round), "expiry round passed"
+        assert mbr_payment.receiver == Global.current_application_address, "pay the contract"
+        assert max_fills <= MAX_FILLS, "too many fills"
+        ensure_budget(max_fills * FILL_BUDGET, OpUpFeeSource.GroupCredit)
+
+        # Match crossing bids, best price first
+        remaining = amount
+        proceeds = UInt64(0)
+        fills = UInt64(0)
+        while remaining and self.best_bid_id != NO_BID and fills < max_fills:
+            bid_id = self.best_bid_id
+            bid = self.bids[bid_id].copy()
+            if bid.price.native < price_per_token:
+                break
+            fills += 1
+            if not bid.bidder.native.is_opted_in(self.aarna_asset):
+                self._evict_bid(bid_id)
+                continue
+            quantity = remaining if remaining < bid.quantity.native else bid.quantity.native
+            proceeds += self._fill_bid(bid_id, Txn.sender, quantity)
+            remaining -= quantity
+
+        # A remainder that still crosses a bid would leave the book crossed
+        if remaining and self.best_bid_id != NO_BID:
+            if self.bids[self.best_bid_id].price.native >= price_per_token:
+                remaining = UInt64(0)
+
+        idx = UInt64(NO_LISTING)
+        unused_mbr = mbr_payment.amount
+        if remaining:
+            # Clawback the remainder from seller into contract escrow
+            itxn.AssetTransfer(
+                xfer_asset=self.aarna_asset,
+                asset_sender=Txn.sender,
+                asset_receiver=Global.current_application_address,
+                asset_amount=remaining,
+            ).submit()
 
-        idx = self.listing_count
-        assert idx < UInt64(4), "max listings reached (4)"
+            mbr_before = Global.current_application_address.min_balance
+            prev_id, next_id = self._find_ask_slot(price_per_token, after_hint)
+            idx = self.listing_count
+            self.listing_count = idx + UInt64(1)
+            seller_slot = self._index_append(
+                Bytes(SELLER_INDEX_PREFIX) + Txn.sender.bytes, idx
+            )
+            self.listings[idx] = Listing(
+                seller=arc4.Address(Txn.sender),
+                amount=arc4.UInt64(remaining),
+                price=arc4.UInt64(price_per_token),
+                expires_round=arc4.UInt64(expires_round),
+                prev_ask=arc4.UInt64(prev_id),
+                next_ask=arc4.UInt64(next_id),
+                seller_slot=arc4.UInt64(seller_slot),
+            )
+            self._set_ask_next(prev_id, idx)
+            self._set_ask_prev(next_id, idx)
+            mbr_delta = Global.current_application_address.min_balance - mbr_before
+            assert mbr_payment.amount >= mbr_delta, "insufficient mbr payment"
+            unused_mbr -= mbr_delta
+            arc4.emit(
+                Listed(
+                    listing_id=arc4.UInt64(idx),
+                    seller=arc4.Address(Txn.sender),
+                    amount=arc4.UInt64(remaining),
+                    price=arc4.UInt64(price_per_token),
+                )
+            )
+        if proceeds + unused_mbr:
+            itxn.Payment(receiver=Txn.sender, amount=proceeds + unused_mbr).submit()
+        return arc4.UInt64(idx)
 
-        # Clawback tokens from seller into contract escrow
+    @arc4.abimethod
+    def buy_listing(
+        self,
+        listing_id: UInt64,
+        quantity: UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> None:
+        """
+        Buy `quantity` tokens from a listing. Buyer sends ALGO payment,
+        contract transfers escrowed tokens to buyer and forwards ALGO to seller.
+        The listing stays open with the remainder; once sold out its box is
+        deleted and the MBR returned to the seller.
+        """
+        assert self.aarna_asset, "no AARNA token"
+        assert payment.receiver == Global.current_application_address, "pay the contract"
+        # Check the payment before _fill_listing writes anything
+        listing = self._load_listing(listing_id)
+        assert payment.amount >= quantity * listing.price.native, "insufficient payment"
+        _cost = self._fill_listing(listing_id, listing, quantity)
+        # Transfer tokens to buyer
         itxn.AssetTransfer(
             xfer_asset=self.aarna_asset,
-            asset_sender=Txn.sender,
-            asset_receiver=Global.current_application_address,
-            asset_amount=amount,
+            asset_receiver=Txn.sender,
+            asset_amount=quantity,
         ).submit()
 
-        seller = Txn.sender
-
-        if idx == UInt64(0):
-            self.l0_seller = seller
-            self.l0_amount = amount
-            self.l0_price = price_per_token
-            self.l0_active = UInt64(1)
-        elif idx == UInt64(1):
-            self.l1_seller = seller
-            self.l1_amount = amount
-            self.l1_price = price_per_token
-            self.l1_active = UInt64(1)
-        elif idx == UInt64(2):
-            self.l2_seller = seller
-            self.l2_amount = amount
-            self.l2_price = price_per_token
-            self.l2_active = UInt64(1)
-        else:
-            self.l3_seller = seller
-            self.l3_amount = amount
-            self.l3_price = price_per_token
-            self.l3_active = UInt64(1)
-
-        self.listing_count = idx + UInt64(1)
-        return arc4.UInt64(idx)
-
     @arc4.abimethod
-    def buy_listing(self, listing_id: UInt64, payment: gtxn.PaymentTransaction) -> None:
+    def market_buy(
+        self,
+        max_quantity: UInt64,
+        max_price: UInt64,
+        max_fills: UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt64:
         """
-        Buy tokens from a listing. Buyer sends ALGO payment,
-        contract transfers escrowed tokens to buyer and forwards ALGO to seller.
+        Buy up to `max_quantity` tokens from the cheapest asks priced at or
+        below `max_price`, filling across at most `max_fills` listings
+        (1 to MAX_FILLS) from the best ask down. Each seller is paid in turn,
+        the tokens arrive in one transfer and any unspent payment is refunded.
+        FILL_BUDGET opcodes per fill are drawn from the group's fee credit,
+        so the outer transaction must cover the resulting inner fees.
+        Returns the quantity bought.
         """
         assert self.aarna_asset, "no AARNA token"
-        assert listing_id < self.listing_count, "invalid listing id"
-
-        if listing_id == UInt64(0):
-            assert self.l0_active == UInt64(1), "listing not active"
-            total_cost = self.l0_amount * self.l0_price
-            assert payment.amount >= total_cost, "insufficient payment"
-            assert payment.receiver == Global.current_application_address, "pay the contract"
-            # Transfer tokens to buyer
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=Txn.sender,
-                asset_amount=self.l0_amount,
-            ).submit()
-            # Forward ALGO to seller
-            itxn.Payment(
-                receiver=self.l0_seller,
-                amount=total_cost,
-            ).submit()
-            self.l0_active = UInt64(0)
-        elif listing_id == UInt64(1):
-            assert self.l1_active == UInt64(1), "listing not active"
-            total_cost = self.l1_amount * self.l1_price
-            assert payment.amount >= total_cost, "insufficient payment"
-            assert payment.receiver == Global.current_application_address, "pay the contract"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=Txn.sender,
-                asset_amount=self.l1_amount,
-            ).submit()
-            itxn.Payment(
-                receiver=self.l1_seller,
-                amount=total_cost,
-            ).submit()
-            self.l1_active = UInt64(0)
-        elif listing_id == UInt64(2):
-            assert self.l2_active == UInt64(1), "listing not active"
-            total_cost = self.l2_amount * self.l2_price
-            assert payment.amount >= total_cost, "insufficient payment"
-            assert payment.receiver == Global.current_application_address, "pay the contract"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=Txn.sender,
-                asset_amount=self.l2_amount,
-            ).submit()
-            itxn.Payment(
-                receiver=self.l2_seller,
-                amount=total_cost,
-            ).submit()
-            self.l2_active = UInt64(0)
-        else:
-            assert self.l3_active == UInt64(1), "listing not active"
-            total_cost = self.l3_amount * self.l3_price
-            assert payment.amount >= total_cost, "insufficient payment"
-            assert payment.receiver == Global.current_application_address, "pay the contract"
+        assert payment.receiver == Global.current_application_address, "pay the contract"
+        assert max_fills > UInt64(0), "max fills must be > 0"
+        assert max_fills <= MAX_FILLS, "too many fills"
+        ensure_budget(max_fills * FILL_BUDGET, OpUpFeeSource.GroupCredit)
+
+        bought, spent = self._sweep_asks(max_quantity, max_price, max_fills)
+        assert payment.amount >= spent, "insufficient payment"
+
+        if bought:
             itxn.AssetTransfer(
                 xfer_asset=self.aarna_asset,
                 asset_receiver=Txn.sender,
-                asset_amount=self.l3_amount,
-            ).submit()
-            itxn.Payment(
-                receiver=self.l3_seller,
-                amount=total_cost,
+                asset_amount=bought,
             ).submit()
-            self.l3_active = UInt64(0)
+        if payment.amount > spent:
+            itxn.Payment(receiver=Txn.sender, amount=payment.amount - spent).submit()
+        return arc4.UInt64(bought)
 
     @arc4.abimethod
     def cancel_listing(self, listing_id: UInt64) -> None:
-        """Seller cancels their listing. Escrowed tokens returned."""
-        assert listing_id < self.listing_count, "invalid listing id"
+        """
+        Seller cancels their listing, expired or not. Escrowed tokens and
+        MBR returned.
+        """
+        assert listing_id in self.listings, "listing not active"
+        listing = self.listings[listing_id].copy()
+        assert Txn.sender == listing.seller.native, "only seller can cancel"
+        itxn.AssetTransfer(
+            xfer_asset=self.aarna_asset,
+            asset_receiver=listing.seller.native,
+            asset_amount=listing.amount.native,
+        ).submit()
+        released_mbr = self._delete_listing(listing_id)
+        if released_mbr:
+            itxn.Payment(receiver=Txn.sender, amount=released_mbr).submit()
+        arc4.emit(
+            ListingCancelled(
+                listing_id=arc4.UInt64(listing_id),
+                seller=listing.seller,
+                amount=listing.amount,
+            )
+        )
 
-        if listing_id == UInt64(0):
-            assert self.l0_active == UInt64(1), "listing not active"
-            assert Txn.sender == self.l0_seller, "only seller can cancel"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=self.l0_seller,
-                asset_amount=self.l0_amount,
-            ).submit()
-            self.l0_active = UInt64(0)
-        elif listing_id == UInt64(1):
-            assert self.l1_active == UInt64(1), "listing not active"
-            assert Txn.sender == self.l1_seller, "only seller can cancel"
-            itxn.AssetTransfer(
-                xfer_asset=self.aarna_asset,
-                asset_receiver=self.l1_seller,
-                asset_amount=self.l1_amount,
-            ).submit()
-            self.l1_active = UInt64(0)
-        elif listing_id == UInt64(2):
-            assert self.l2_active == UInt64(1), "listing not active"
-            assert Txn.sender == self.l2_seller, "only seller can cancel"
+    @arc4.abimethod
+    def sweep_expired(self, listing_ids: arc4.DynamicArray[arc4.UInt64]) -> arc4.UInt64:
+        """
+        Close any of `listing_ids` (up to MAX_SWEEP_BATCH) that have expired,
+        returning each escrow to its seller. Anyone may call this; the
+        released MBR is paid to the caller. Ids that are not open and expired
+        are skipped, so a sweep does not fail if another closed a listing
+        first. Extra opcode budget is drawn from the group's fee credit.
+        Returns the MBR paid out.
+        """
+        assert listing_ids.length <= MAX_SWEEP_BATCH, "batch too large"
+        ensure_budget(
+            UInt64(SWEEP_BUDGET_PER_LISTING) * listing_ids.length,
+            OpUpFeeSource.GroupCredit,
+        )
+        reclaimed = UInt64(0)
+        for listing_id in listing_ids:
+            if listing_id.native not in self.listings:
+                continue
+            listing = self.listings[listing_id.native].copy()
+            if self._is_expired(listing.expires_round.native):
+                reclaimed += self._expire_listing(listing_id.native)
+        if reclaimed:
+            itxn.Payment(receiver=Txn.sender, amount=reclaimed).submit()
+        return arc4.UInt64(reclaimed)
+
+    # ── Standing bids ──
+
+    @arc4.abimethod
+    def place_bid(
+        self,
+        quantity: UInt64,
+        max_price: UInt64,
+        after_hint: UInt64,
+        max_fills: UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> arc4.UInt64:
+        """
+        Post a standing buy order for `quantity` tokens at up to `max_price`.
+        Asks already at or below `max_price` are bought straight away; the
+        rest is escrowed (remaining quantity * max_price) and rests in the
+        bid index until a matching list_for_sale fills it. If asks past
+        `max_fills` still cross it, nothing rests and the unfilled part
+        of the payment is refunded.
+
+        Args:
+            quantity: number of AARNA tokens wanted
+            max_price: highest price per token in microALGO
+            after_hint: the last active bid priced at or above `max_price`,
+                or NO_BID if there is none; the bid index is walked
+                forward from here
+            max_fills: most asks to fill first, up to MAX_FILLS; FILL_BUDGET
+                opcodes per fill are drawn from the group's fee credit
+            payment: covers immediate fills, the escrow and the bid box MBR;
+                any excess is refunded
+
+        Returns the bid id, or NO_BID if no bid was left resting.
+        """
+        assert self.aarna_asset, "no AARNA token"
+        assert quantity > UInt64(0), "quantity must be > 0"
+        assert max_price > UInt64(0), "price must be > 0"
+        assert Txn.sender.is_opted_in(self.aarna_asset), "bidder not opted in"
+        assert payment.receiver == Global.current_application_address, "pay the contract"
+        assert max_fills <= MAX_FILLS, "too many fills"
+        ensure_budget(max_fills * FILL_BUDGET, OpUpFeeSource.GroupCredit)
+
+        bought, cost = self._sweep_asks(quantity, max_price, max_fills)
+        if bought:
             itxn.AssetTransfer(
                 xfer_asset=self.aarna_asset,
-                asset_receiver=self.l2_seller,
-                asset_amount=self.l2_amount,
+                asset_receiver=Txn.sender,
+                asset_amount=bought,
             ).submit()
-            self.l2_active = UInt64(0)
-        else:
-            assert self.l3_active == UInt64(1), "listing not active"
-            assert Txn.sender == self.l3_seller, "only seller can cancel"
+
+        bid_id = UInt64(NO_BID)
+        remaining = quantity - bought
+        # A remainder that still crosses an ask would leave the book crossed
+        if remaining and self.best_ask_id != NO_LISTING:
+            if self.listings[self.best_ask_id].price.native <= max_price:
+                remaining = UInt64(0)
+        if remaining:
+            mbr_before = Global.current_application_address.min_balance
+            prev_id, next_id = self._find_bid_slot(max_price, after_hint)
+            bid_id = self.bid_count
+            self.bid_count = bid_id + UInt64(1)
+            self.bids[bid_id] = Bid(
+                bidder=arc4.Address(Txn.sender),
+                quantity=arc4.UInt64(remaining),
+                price=arc4.UInt64(max_price),
+                prev_bid=arc4.UInt64(prev_id),
+                next_bid=arc4.UInt64(next_id),
+            )
+            self._set_bid_next(prev_id, bid_id)
+            self._set_bid_prev(next_id, bid_id)
+            cost += remaining * max_price
+            cost += Global.current_application_address.min_balance - mbr_before
+            arc4.emit(
+                BidPlaced(
+                    bid_id=arc4.UInt64(bid_id),
+                    bidder=arc4.Address(Txn.sender),
+                    quantity=arc4.UInt64(remaining),
+                    price=arc4.UInt64(max_price),
+                )
+            )
+
+        assert payment.amount >= cost, "insufficient payment"
+        if payment.amount > cost:
+            itxn.Payment(receiver=Txn.sender, amount=payment.amount - cost).submit()
+        return arc4.UInt64(bid_id)
+
+    @arc4.abimethod
+    def cancel_bid(self, bid_id: UInt64) -> None:
+        """Bidder cancels their bid. Escrowed ALGO and MBR returned."""
+        bid = self._load_bid(bid_id)
+        assert Txn.sender == bid.bidder.native, "only bidder can cancel"
+        refund = bid.quantity.native * bid.price.native
+        refund += self._delete_bid(bid_id)
+        itxn.Payment(receiver=Txn.sender, amount=refund).submit()
+        arc4.emit(
+            BidCancelled(
+                bid_id=arc4.UInt64(bid_id),
+                bidder=bid.bidder,
+                quantity=bid.quantity,
+            )
+        )
+
+    # ── Claims ──
+
+    @arc4.abimethod
+    def claim(self) -> None:
+        """
+        Withdraw the ALGO and AARNA tokens held for the caller because
+        paying them out failed, with the claim box's MBR. The caller must be
+        opted in to the token if any tokens are held.
+        """
+        assert Txn.sender in self.claims, "nothing to claim"
+        claim = self.claims[Txn.sender].copy()
+        mbr_before = Global.current_application_address.min_balance
+        del self.claims[Txn.sender]
+        algo = claim.algo.native + mbr_before - Global.current_application_address.min_balance
+        if claim.tokens.native:
             itxn.AssetTransfer(
                 xfer_asset=self.aarna_asset,
-                asset_receiver=self.l3_seller,
-                asset_amount=self.l3_amount,
+                asset_receiver=Txn.sender,
+                asset_amount=claim.tokens.native,
             ).submit()
-            self.l3_active = UInt64(0)
+        itxn.Payment(receiver=Txn.sender, amount=algo).submit()
+        arc4.emit(
+            Claimed(
+                account=arc4.Address(Txn.sender),
+                algo=arc4.UInt64(algo),
+                tokens=claim.tokens,
+            )
+        )
 
     # ═══════════════════════════════════════════════════
     #  Read-Only Getters
     # ═══════════════════════════════════════════════════
 
-    @arc4.abimethod(readonly=True)
+    # Getters write nothing, so they skip ABI argument validation, which
+    # keeps the program within the AVM's 8 KB limit; a malformed argument
+    # can only garble the caller's own result.
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
     def get_project_count(self) -> arc4.UInt64:
         return arc4.UInt64(self.project_count)
 
-    @arc4.abimethod(readonly=True)
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
     def get_asset_id(self) -> arc4.UInt64:
         return arc4.UInt64(self.aarna_asset.id)
 
-    @arc4.abimethod(readonly=True)
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
     def get_admin(self) -> Account:
         return self.admin
 
-    @arc4.abimethod(readonly=True)
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
     def get_validator(self) -> Account:
         return self.validator
 
-    @arc4.abimethod(readonly=True)
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
     def get_total_credits_issued(self) -> arc4.UInt64:
         return arc4.UInt64(self.total_credits_issued)
 
-    @arc4.abimethod(readonly=True)
-    def get_project_status(self, project_id: UInt64) -> arc4.UInt64:
-        if project_id == UInt64(0):
-            return arc4.UInt64(self.p0_status)
-        elif project_id == UInt64(1):
-            return arc4.UInt64(self.p1_status)
-        elif project_id == UInt64(2):
-            return arc4.UInt64(self.p2_status)
-        else:
-            return arc4.UInt64(self.p3_status)
-
-    @arc4.abimethod(readonly=True)
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_status_counts(self) -> StatusCounts:
+        """Project count per status code (index 0 unused)."""
+        return self.status_counts
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_ecosystem_totals(self, ecosystem: arc4.String) -> ProjectTotals:
+        """Per-status project counts and credits issued for one ecosystem."""
+        return self.ecosystem_totals.get(
+            self._ecosystem_code(ecosystem.native),
+            default=ProjectTotals(
+                by_status=StatusCounts.from_bytes(op.bzero(5 * 8)),
+                credits_issued=arc4.UInt64(0),
+            ),
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_project(self, project_id: UInt64) -> Project:
+        """Full project record in one call."""
+        return self._decode_project(self._load_project(project_id))
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_projects_page(
+        self, start: UInt64, count: UInt64
+    ) -> arc4.DynamicArray[Project]:
+        """
+        Projects `start` .. `start + count - 1` in one call.
+        The page is cut short if it would not fit in the ABI return value;
+        the next page starts at `start + len(result)`.
+        """
+        page = arc4.DynamicArray[Project]()
+        for project_id in urange(start, self._page_end(start, count, self.project_count)):
+            project = self._decode_project(self.projects[project_id].copy())
+            # Each dynamic element also costs a 2-byte offset in the array head
+            if page.bytes.length + project.bytes.length + UInt64(2) > MAX_PAGE_BYTES:
+                break
+            page.append(project.copy())
+        return page
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_pending(self, start: UInt64, count: UInt64) -> arc4.DynamicArray[arc4.UInt64]:
+        """
+        Ids of up to `count` pending projects, oldest first, skipping the
+        first `start` entries of the review queue. The walk never leaves the
+        queue, so the cost depends only on how many projects are pending.
+        """
+        page = arc4.DynamicArray[arc4.UInt64]()
+        project_id = self.pending_head
+        skipped = UInt64(0)
+        while project_id != NO_PROJECT and page.length < count:
+            if skipped < start:
+                skipped += 1
+            else:
+                if page.bytes.length + UInt64(8) > MAX_PAGE_BYTES:
+                    break
+                page.append(arc4.UInt64(project_id))
+            project_id = self.pending_queue[project_id].next_pending.native
+        return page
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_account_projects(
+        self, account: Account, start: UInt64, count: UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Ids of projects submitted by `account`, in submission order, paged."""
+        return self._index_page(
+            Bytes(SUBMITTER_INDEX_PREFIX) + account.bytes, start, count
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_account_listings(
+        self, account: Account, start: UInt64, count: UInt64
+    ) -> arc4.DynamicArray[arc4.UInt64]:
+        """Ids of `account`'s open listings, paged (order not preserved)."""
+        return self._index_page(
+            Bytes(SELLER_INDEX_PREFIX) + account.bytes, start, count
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def find_project_by_cid(self, cid: arc4.String) -> arc4.UInt64:
+        """
+        Id of the project whose evidence is `cid`, or NO_PROJECT if none.
+        The opcode budget for decoding a base32 CID is drawn from the
+        group's fee credit when the call does not already have it.
+        """
+        ensure_budget(
+            SUBMIT_BUDGET_PER_CID_CHAR * cid.native.bytes.length,
+            OpUpFeeSource.GroupCredit,
+        )
+        return arc4.UInt64(
+            self.cid_index.get(
+                op.sha256(self._pack_cid(cid.native)), default=UInt64(NO_PROJECT)
+            )
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_evidence_root(self, project_id: UInt64) -> EvidenceRoot:
+        """The committed evidence root; `leaf_count` is 0 if there is none."""
+        return self.evidence_roots.get(
+            project_id,
+            default=EvidenceRoot(
+                root=Hash.from_bytes(op.bzero(32)), leaf_count=arc4.UInt64(0)
+            ),
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def verify_inclusion(
+        self,
+        project_id: UInt64,
+        leaf: arc4.DynamicBytes,
+        proof: arc4.DynamicArray[Hash],
+    ) -> arc4.Bool:
+        """
+        Whether measurement record `leaf` is covered by the project's
+        evidence root, given the sibling hashes from the leaf up. Each level
+        costs one sha256; extra opcode budget for deep proofs is drawn from
+        the group's fee credit when the call does not already have it.
+        """
+        assert project_id in self.evidence_roots, "no evidence root"
+        commitment = self.evidence_roots[project_id].copy()
+        ensure_budget(
+            VERIFY_BUDGET + VERIFY_BUDGET_PER_LEVEL * proof.length,
+            OpUpFeeSource.GroupCredit,
+        )
+
+        node = op.sha256(Bytes(MERKLE_LEAF_PREFIX) + leaf.native)
+        # Walk the packed hashes directly, past the array's length prefix
+        siblings = proof.bytes[2:]
+        for offset in urange(0, siblings.length, 32):
+            sibling = op.extract(siblings, offset, 32)
+            if BigUInt.from_bytes(sibling) < BigUInt.from_bytes(node):
+                node = op.sha256(Bytes(MERKLE_NODE_PREFIX) + sibling + node)
+            else:
+                node = op.sha256(Bytes(MERKLE_NODE_PREFIX) + node + sibling)
+        return arc4.Bool(node == commitment.root.bytes)
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
     def get_project_cid(self, project_id: UInt64) -> arc4.String:
-        if project_id == UInt64(0):
-            return self.p0_cid
-        elif project_id == UInt64(1):
-            return self.p1_cid
-        elif project_id == UInt64(2):
-            return self.p2_cid
-        else:
-            return self.p3_cid
-
-    @arc4.abimethod(readonly=True)
-    def get_project_name(self, project_id: UInt64) -> arc4.String:
-        if project_id == UInt64(0):
-            return self.p0_name
-        elif project_id == UInt64(1):
-            return self.p1_name
-        elif project_id == UInt64(2):
-            return self.p2_name
-        else:
-            return self.p3_name
-
-    @arc4.abimethod(readonly=True)
-    def get_project_location(self, project_id: UInt64) -> arc4.String:
-        if project_id == UInt64(0):
-            return self.p0_location
-        elif project_id == UInt64(1):
-            return self.p1_location
-        elif project_id == UInt64(2):
-            return self.p2_location
-        else:
-            return self.p3_location
-
-    @arc4.abimethod(readonly=True)
-    def get_project_credits(self, project_id: UInt64) -> arc4.UInt64:
-        if project_id == UInt64(0):
-            return arc4.UInt64(self.p0_credits)
-        elif project_id == UInt64(1):
-            return arc4.UInt64(self.p1_credits)
-        elif project_id == UInt64(2):
-            return arc4.UInt64(self.p2_credits)
-        else:
-            return arc4.UInt64(self.p3_credits)
-
-    @arc4.abimethod(readonly=True)
-    def get_project_submitter(self, project_id: UInt64) -> Account:
-        if project_id == UInt64(0):
-            return self.p0_submitter
-        elif project_id == UInt64(1):
-            return self.p1_submitter
-        elif project_id == UInt64(2):
-            return self.p2_submitter
-        else:
-            return self.p3_submitter
-
-    @arc4.abimethod(readonly=True)
-    def get_project_ecosystem(self, project_id: UInt64) -> arc4.String:
-        if project_id == UInt64(0):
-            return self.p0_ecosystem
-        elif project_id == UInt64(1):
-            return self.p1_ecosystem
-        elif project_id == UInt64(2):
-            return self.p2_ecosystem
-        else:
-            return self.p3_ecosystem
+        return arc4.String(self._unpack_cid(self._load_project(project_id).cid.native))
 
     # ── Marketplace Getters ──
 
-    @arc4.abimethod(readonly=True)
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_market_stats(self) -> MarketStats:
+        """
+        Running totals, VWAP and last price, plus the current and previous
+        STATS_WINDOW_SECONDS trade windows as of the latest block.
+        """
+        current, previous = self._trade_windows()
+        vwap = UInt64(0)
+        if self.trade_volume:
+            vwap = self.trade_notional // self.trade_volume
+        return MarketStats(
+            volume=arc4.UInt64(self.trade_volume),
+            notional=arc4.UInt64(self.trade_notional),
+            trade_count=arc4.UInt64(self.trade_count),
+            vwap=arc4.UInt64(vwap),
+            last_price=arc4.UInt64(self.last_price),
+            last_trade_time=arc4.UInt64(self.last_trade_time),
+            current=current.copy(),
+            previous=previous.copy(),
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
     def get_listing_count(self) -> arc4.UInt64:
         return arc4.UInt64(self.listing_count)
 
-    @arc4.abimethod(readonly=True)
-    def get_listing_seller(self, listing_id: UInt64) -> Account:
-        if listing_id == UInt64(0):
-            return self.l0_seller
-        elif listing_id == UInt64(1):
-            return self.l1_seller
-        elif listing_id == UInt64(2):
-            return self.l2_seller
-        else:
-            return self.l3_seller
-
-    @arc4.abimethod(readonly=True)
-    def get_listing_amount(self, listing_id: UInt64) -> arc4.UInt64:
-        if listing_id == UInt64(0):
-            return arc4.UInt64(self.l0_amount)
-        elif listing_id == UInt64(1):
-            return arc4.UInt64(self.l1_amount)
-        elif listing_id == UInt64(2):
-            return arc4.UInt64(self.l2_amount)
-        else:
-            return arc4.UInt64(self.l3_amount)
-
-    @arc4.abimethod(readonly=True)
-    def get_listing_price(self, listing_id: UInt64) -> arc4.UInt64:
-        if listing_id == UInt64(0):
-            return arc4.UInt64(self.l0_price)
-        elif listing_id == UInt64(1):
-            return arc4.UInt64(self.l1_price)
-        elif listing_id == UInt64(2):
-            return arc4.UInt64(self.l2_price)
-        else:
-            return arc4.UInt64(self.l3_price)
-
-    @arc4.abimethod(readonly=True)
-    def get_listing_active(self, listing_id: UInt64) -> arc4.UInt64:
-        if listing_id == UInt64(0):
-            return arc4.UInt64(self.l0_active)
-        elif listing_id == UInt64(1):
-            return arc4.UInt64(self.l1_active)
-        elif listing_id == UInt64(2):
-            return arc4.UInt64(self.l2_active)
-        else:
-            return arc4.UInt64(self.l3_active)
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_best_ask(self) -> ListingView:
+        """
+        The cheapest active listing (oldest first among equal prices),
+        passing over expired listings not yet swept.
+        With an empty order book, `listing_id` is NO_LISTING and `amount` 0.
+        """
+        listing_id = self._active_ask(self.best_ask_id)
+        if listing_id != NO_LISTING:
+            return self._listing_view(listing_id)
+        return ListingView(
+            listing_id=arc4.UInt64(NO_LISTING),
+            seller=arc4.Address(Global.zero_address),
+            amount=arc4.UInt64(0),
+            price=arc4.UInt64(0),
+            expires_round=arc4.UInt64(0),
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_claim(self, account: Account) -> Claim:
+        """What the app holds for `account` to `claim`; zero if nothing."""
+        return self.claims.get(
+            account, default=Claim(algo=arc4.UInt64(0), tokens=arc4.UInt64(0))
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_best_bid(self) -> BidView:
+        """
+        The highest standing bid (oldest first among equal prices).
+        With no bids, `bid_id` is NO_BID and `quantity` 0.
+        """
+        if self.best_bid_id == NO_BID:
+            return BidView(
+                bid_id=arc4.UInt64(NO_BID),
+                bidder=arc4.Address(Global.zero_address),
+                quantity=arc4.UInt64(0),
+                price=arc4.UInt64(0),
+            )
+        bid = self.bids[self.best_bid_id].copy()
+        return BidView(
+            bid_id=arc4.UInt64(self.best_bid_id),
+            bidder=bid.bidder,
+            quantity=bid.quantity,
+            price=bid.price,
+        )
+
+    @arc4.abimethod(readonly=True, validate_encoding="unsafe_disabled")
+    def get_active_listings(
+        self, start: UInt64, count: UInt64
+    ) -> arc4.DynamicArray[ListingView]:
+        """
+        Up to `count` active listings in ask order (cheapest first, oldest
+        first among equal prices), skipping the first `start`. The walk
+        follows the ask index past expired listings not yet swept, so the
+        cost depends only on how many listings are open. A page of up to
+        MAX_LISTING_PAGE listings always fits the ABI return value; a longer
+        one may be cut short, and the next page starts at `start + len(result)`.
+        """
+        page = arc4.DynamicArray[ListingView]()
+        listing_id = self._active_ask(self.best_ask_id)
+        skipped = UInt64(0)
+        while listing_id != NO_LISTING and page.length < count:
+            if skipped < start:
+                skipped += 1
+            else:
+                if page.bytes.length + UInt64(LISTING_VIEW_BYTES) > MAX_PAGE_BYTES:
+                    break
+                page.append(self._listing_view(listing_id))
+            listing_id = self._active_ask(self.listings[listing_id].next_ask.native)
+        return page
@@ -0,0 +1,82 @@
+import logging
+import os
+
+import algokit_utils
+
+logger = logging.getLogger(__name__)
+
+# The app account keeps this much ALGO: its own minimum balance, the AARNA
+# asset it creates, and headroom for inner transaction fees.
+APP_FUNDING = algokit_utils.AlgoAmount(algo=1)
+
+
+# Bring the registry up in as few round trips as the AVM allows. The app is
+# found by name (or created), then whatever it still lacks — funding, a
+# validator, the AARNA asset — is sent as one atomic group. Re-running
+# against a fully set up app sends nothing after the lookup.
+def deploy() -> None:
+    from smart_contracts.artifacts.aarna_registry.aarna_registry_client import (
+        AarnaRegistryFactory,
+        AarnaRegistryMethodCallCreateParams,
+        SetValidatorArgs,
+    )
+
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    deployer_ = algorand.account.from_environment("DEPLOYER")
+    # Defaults to the deployer, which suits LocalNet
+    validator = os.getenv("AARNA_VALIDATOR_ADDRESS", deployer_.address)
+
+    factory = algorand.client.get_typed_app_factory(
+        AarnaRegistryFactory, default_sender=deployer_.address
+    )
+
+    # An app cannot be called in the group that creates it (its id is not
+    # known until then), so creation is the one step sent on its own.
+    app_client, result = factory.deploy(
+        create_params=AarnaRegistryMethodCallCreateParams(method="init()void"),
+        on_update=algokit_utils.OnUpdate.AppendApp,
+        on_schema_break=algokit_utils.OnSchemaBreak.AppendApp,
+    )
+    logger.info(
+        f"{result.operation_performed.name} {app_client.app_name} ({app_client.app_id})"
+    )
+
+    group = algorand.new_group()
+    steps: list[str] = []
+
+    balance = algorand.account.get_information(app_client.app_address).amount
+    if balance.micro_algo < APP_FUNDING.micro_algo:
+        group.add_payment(
+            algokit_utils.PaymentParams(
+                amount=algokit_utils.AlgoAmount(
+                    micro_algo=APP_FUNDING.micro_algo - balance.micro_algo
+                ),
+                sender=deployer_.address,
+                receiver=app_client.app_address,
+            )
+        )
+        steps.append("fund")
+
+    if app_client.send.get_validator().abi_return != validator:
+        group.add_app_call_method_call(
+            app_client.params.set_validator(args=SetValidatorArgs(addr=validator))
+        )
+        steps.append("set_validator")
+
+    if not app_client.send.get_asset_id().abi_return:
+        # Covers the inner asset creation's fee as well
+        group.add_app_call_method_call(
+            app_client.params.ensure_token(
+                params=algokit_utils.CommonAppCallParams(
+                    extra_fee=algokit_utils.AlgoAmount(micro_algo=1000)
+                )
+            )
+        )
+        steps.append("ensure_token")
+
+    if not steps:
+        logger.info("Registry already bootstrapped, nothing to send")
+        return
+
+    group.send()
+    logger.info(f"Bootstrapped {app_client.app_name} in one group: {', '.join(steps)}")
@@ -24,7 +24,7 @@ import { SendParams, SendSingleTransactionResult, SendAtomicTransactionComposerR
 import { Address, encodeAddress, modelsv2, OnApplicationComplete, Transaction, TransactionSigner } from 'algosdk'
 import SimulateResponse = modelsv2.SimulateResponse
 
-export const APP_SPEC: Arc56Contract = {"name":"AarnaRegistry","structs":{},"methods":[{"name":"init","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"desc":"Deploy the contract and set the caller as admin.","events":[],"recommendations":{}},{"name":"set_validator","args":[{"type":"address","name":"addr"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin assigns a validator address for project reviews.","events":[],"recommendations":{}},{"name":"transfer_admin","args":[{"type":"address","name":"new_admin"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin transfers ownership to a new admin account.","events":[],"recommendations":{}},{"name":"ensure_token","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Create the AARNA ASA if it doesn't exist.\nReturns the ASA ID.","events":[],"recommendations":{}},{"name":"submit_project","args":[{"type":"string","name":"name"},{"type":"string","name":"location"},{"type":"string","name":"ecosystem"},{"type":"string","name":"cid"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Developer submits a new project for review.\nReturns the project index (0-3).","events":[],"recommendations":{}},{"name":"approve_project","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator approves a project and assigns credit amount.","events":[],"recommendations":{}},{"name":"reject_project","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator rejects a pending project.","events":[],"recommendations":{}},{"name":"issue_credits","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator issues AARNA tokens to submitter.\nStatus: 2 (verified) → 4 (issued). Prevents double-issuance.","events":[],"recommendations":{}},{"name":"list_for_sale","args":[{"type":"uint64","name":"amount","desc":"number of AARNA tokens to sell"},{"type":"uint64","name":"price_per_token","desc":"price per token in microALGO"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"List AARNA tokens for sale. Uses clawback to escrow tokens\nfrom seller into the contract. Returns the listing index.","events":[],"recommendations":{}},{"name":"buy_listing","args":[{"type":"uint64","name":"listing_id"},{"type":"pay","name":"payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Buy tokens from a listing. Buyer sends ALGO payment,\ncontract transfers escrowed tokens to buyer and forwards ALGO to seller.","events":[],"recommendations":{}},{"name":"cancel_listing","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Seller cancels their listing. Escrowed tokens returned.","events":[],"recommendations":{}},{"name":"get_project_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_asset_id","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_admin","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_validator","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_total_credits_issued","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_status","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_cid","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"string"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_name","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"string"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_location","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"string"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_credits","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_submitter","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_project_ecosystem","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"string"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_listing_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_listing_seller","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_listing_amount","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_listing_price","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_listing_active","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}}],"arcs":[22,28],"desc":"\n    On-chain registry + marketplace for blue carbon credits.\n\n    Lifecycle: SUBMIT → REVIEW → VERIFY / REJECT → ISSUE → TRADE\n\n    Roles:\n      - admin: deploys, creates AARNA ASA, assigns validator\n      - validator: approves/rejects, issues credits\n      - developer: submits projects\n      - any holder: lists/buys credits on marketplace\n    ","networks":{},"state":{"schema":{"global":{"ints":24,"bytes":26},"local":{"ints":0,"bytes":0}},"keys":{"global":{"admin":{"keyType":"AVMString","valueType":"address","key":"YWRtaW4="},"validator":{"keyType":"AVMString","valueType":"address","key":"dmFsaWRhdG9y"},"aarna_asset":{"keyType":"AVMString","valueType":"AVMUint64","key":"YWFybmFfYXNzZXQ="},"project_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cHJvamVjdF9jb3VudA=="},"total_credits_issued":{"keyType":"AVMString","valueType":"AVMUint64","key":"dG90YWxfY3JlZGl0c19pc3N1ZWQ="},"p0_submitter":{"keyType":"AVMString","valueType":"address","key":"cDBfc3VibWl0dGVy"},"p0_cid":{"keyType":"AVMString","valueType":"string","key":"cDBfY2lk"},"p0_name":{"keyType":"AVMString","valueType":"string","key":"cDBfbmFtZQ=="},"p0_location":{"keyType":"AVMString","valueType":"string","key":"cDBfbG9jYXRpb24="},"p0_ecosystem":{"keyType":"AVMString","valueType":"string","key":"cDBfZWNvc3lzdGVt"},"p0_status":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDBfc3RhdHVz"},"p0_credits":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDBfY3JlZGl0cw=="},"p1_submitter":{"keyType":"AVMString","valueType":"address","key":"cDFfc3VibWl0dGVy"},"p1_cid":{"keyType":"AVMString","valueType":"string","key":"cDFfY2lk"},"p1_name":{"keyType":"AVMString","valueType":"string","key":"cDFfbmFtZQ=="},"p1_location":{"keyType":"AVMString","valueType":"string","key":"cDFfbG9jYXRpb24="},"p1_ecosystem":{"keyType":"AVMString","valueType":"string","key":"cDFfZWNvc3lzdGVt"},"p1_status":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDFfc3RhdHVz"},"p1_credits":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDFfY3JlZGl0cw=="},"p2_submitter":{"keyType":"AVMString","valueType":"address","key":"cDJfc3VibWl0dGVy"},"p2_cid":{"keyType":"AVMString","valueType":"string","key":"cDJfY2lk"},"p2_name":{"keyType":"AVMString","valueType":"string","key":"cDJfbmFtZQ=="},"p2_location":{"keyType":"AVMString","valueType":"string","key":"cDJfbG9jYXRpb24="},"p2_ecosystem":{"keyType":"AVMString","valueType":"string","key":"cDJfZWNvc3lzdGVt"},"p2_status":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDJfc3RhdHVz"},"p2_credits":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDJfY3JlZGl0cw=="},"p3_submitter":{"keyType":"AVMString","valueType":"address","key":"cDNfc3VibWl0dGVy"},"p3_cid":{"keyType":"AVMString","valueType":"string","key":"cDNfY2lk"},"p3_name":{"keyType":"AVMString","valueType":"string","key":"cDNfbmFtZQ=="},"p3_location":{"keyType":"AVMString","valueType":"string","key":"cDNfbG9jYXRpb24="},"p3_ecosystem":{"keyType":"AVMString","valueType":"string","key":"cDNfZWNvc3lzdGVt"},"p3_status":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDNfc3RhdHVz"},"p3_credits":{"keyType":"AVMString","valueType":"AVMUint64","key":"cDNfY3JlZGl0cw=="},"listing_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"bGlzdGluZ19jb3VudA=="},"l0_seller":{"keyType":"AVMString","valueType":"address","key":"bDBfc2VsbGVy"},"l0_amount":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDBfYW1vdW50"},"l0_price":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDBfcHJpY2U="},"l0_active":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDBfYWN0aXZl"},"l1_seller":{"keyType":"AVMString","valueType":"address","key":"bDFfc2VsbGVy"},"l1_amount":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDFfYW1vdW50"},"l1_price":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDFfcHJpY2U="},"l1_active":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDFfYWN0aXZl"},"l2_seller":{"keyType":"AVMString","valueType":"address","key":"bDJfc2VsbGVy"},"l2_amount":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDJfYW1vdW50"},"l2_price":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDJfcHJpY2U="},"l2_active":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDJfYWN0aXZl"},"l3_seller":{"keyType":"AVMString","valueType":"address","key":"bDNfc2VsbGVy"},"l3_amount":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDNfYW1vdW50"},"l3_price":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDNfcHJpY2U="},"l3_active":{"keyType":"AVMString","valueType":"AVMUint64","key":"bDNfYWN0aXZl"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[1941],"errorMessage":"amount must be > 0"},{"pc":[1033,1131,1632,1658,1729,1797,1859,1936,2129,2186,2277,2369,2454,2543,2598,2654,2704,2745],"errorMessage":"check self.aarna_asset exists"},{"pc":[2757,3495],"errorMessage":"check self.admin exists"},{"pc":[2147,2523,3442],"errorMessage":"check self.l0_active exists"},{"pc":[2155,2548,3312],"errorMessage":"check self.l0_amount exists"},{"pc":[2160,3377],"errorMessage":"check self.l0_price exists"},{"pc":[2209,2533,3251],"errorMessage":"check self.l0_seller exists"},{"pc":[2238,2578,3460],"errorMessage":"check self.l1_active exists"},{"pc":[2246,2603,3330],"errorMessage":"check self.l1_amount exists"},{"pc":[2251,3395],"errorMessage":"check self.l1_price exists"},{"pc":[2300,2588,3268],"errorMessage":"check self.l1_seller exists"},{"pc":[2330,2634,3475],"errorMessage":"check self.l2_active exists"},{"pc":[2338,2659,3345],"errorMessage":"check self.l2_amount exists"},{"pc":[2343,3410],"errorMessage":"check self.l2_price exists"},{"pc":[2392,2644,3282],"errorMessage":"check self.l2_seller exists"},{"pc":[2415,2684,3484],"errorMessage":"check self.l3_active exists"},{"pc":[2423,2709,3354],"errorMessage":"check self.l3_amount exists"},{"pc":[2428,3419],"errorMessage":"check self.l3_price exists"},{"pc":[2477,2694,3290],"errorMessage":"check self.l3_seller exists"},{"pc":[1954,2135,2511,3225],"errorMessage":"check self.listing_count exists"},{"pc":[2869],"errorMessage":"check self.p0_cid exists"},{"pc":[1668,1694,1703,3052],"errorMessage":"check self.p0_credits exists"},{"pc":[3178],"errorMessage":"check self.p0_ecosystem exists"},{"pc":[2991],"errorMessage":"check self.p0_location exists"},{"pc":[2930],"errorMessage":"check self.p0_name exists"},{"pc":[1425,1544,1650,2804],"errorMessage":"check self.p0_status exists"},{"pc":[1663,3117],"errorMessage":"check self.p0_submitter exists"},{"pc":[2886],"errorMessage":"check self.p1_cid exists"},{"pc":[1739,1765,1774,3070],"errorMessage":"check self.p1_credits exists"},{"pc":[3195],"errorMessage":"check self.p1_ecosystem exists"},{"pc":[3008],"errorMessage":"check self.p1_location exists"},{"pc":[2947],"errorMessage":"check self.p1_name exists"},{"pc":[1451,1565,1721,2822],"errorMessage":"check self.p1_status exists"},{"pc":[1734,3134],"errorMessage":"check self.p1_submitter exists"},{"pc":[2900],"errorMessage":"check self.p2_cid exists"},{"pc":[1807,1833,1842,3085],"errorMessage":"check self.p2_credits exists"},{"pc":[3209],"errorMessage":"check self.p2_ecosystem exists"},{"pc":[3022],"errorMessage":"check self.p2_location exists"},{"pc":[2961],"errorMessage":"check self.p2_name exists"},{"pc":[1478,1587,1789,2837],"errorMessage":"check self.p2_status exists"},{"pc":[1802,3148],"errorMessage":"check self.p2_submitter exists"},{"pc":[2908],"errorMessage":"check self.p3_cid exists"},{"pc":[1869,1895,1904,3094],"errorMessage":"check self.p3_credits exists"},{"pc":[3217],"errorMessage":"check self.p3_ecosystem exists"},{"pc":[3030],"errorMessage":"check self.p3_location exists"},{"pc":[2969],"errorMessage":"check self.p3_name exists"},{"pc":[1498,1603,1851,2846],"errorMessage":"check self.p3_status exists"},{"pc":[1864,3156],"errorMessage":"check self.p3_submitter exists"},{"pc":[1199,1412,1532,1638,2734],"errorMessage":"check self.project_count exists"},{"pc":[1689,1760,1828,1890,2778],"errorMessage":"check self.total_credits_issued exists"},{"pc":[2768,3505],"errorMessage":"check self.validator exists"},{"pc":[1417],"errorMessage":"credits must be > 0"},{"pc":[2174,2265,2357,2442],"errorMessage":"insufficient payment"},{"pc":[1145,1158,1171,1184],"errorMessage":"invalid array length header"},{"pc":[2139,2515],"errorMessage":"invalid listing id"},{"pc":[1151,1164,1177,1190],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[994,1012],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[1389,1400,1522,1623,1917,1928,2111,2504,2794,2859,2920,2981,3042,3107,3168,3241,3302,3367,3432],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[1416,1536,1642],"errorMessage":"invalid project id"},{"pc":[1020],"errorMessage":"invalid: zero address"},{"pc":[2150,2241,2333,2418,2526,2581,2637,2687],"errorMessage":"listing not active"},{"pc":[1958],"errorMessage":"max listings reached (4)"},{"pc":[1203],"errorMessage":"max projects reached (4)"},{"pc":[1938,2130],"errorMessage":"no AARNA token"},{"pc":[1633],"errorMessage":"no AARNA token created"},{"pc":[2538,2593,2649,2699],"errorMessage":"only seller can cancel"},{"pc":[2181,2272,2364,2449],"errorMessage":"pay the contract"},{"pc":[1943],"errorMessage":"price must be > 0"},{"pc":[1428,1454,1481,1501,1547,1568,1590,1606],"errorMessage":"project not pending"},{"pc":[1653,1724,1792,1854],"errorMessage":"project not verified"},{"pc":[2125],"errorMessage":"transaction type is pay"},{"pc":[3497],"errorMessage":"unauthorized: admin only"},{"pc":[3507],"errorMessage":"unauthorized: validator only"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgMiA0CiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgImFhcm5hX2Fzc2V0IiAweDAwMDAgInRvdGFsX2NyZWRpdHNfaXNzdWVkIiAicDBfc3RhdHVzIiAicDFfc3RhdHVzIiAicDJfc3RhdHVzIiAicDNfc3RhdHVzIiAicHJvamVjdF9jb3VudCIgInAwX2NyZWRpdHMiICJwMV9jcmVkaXRzIiAicDJfY3JlZGl0cyIgInAzX2NyZWRpdHMiICJsMF9hY3RpdmUiICJsMV9hY3RpdmUiICJsMl9hY3RpdmUiICJsM19hY3RpdmUiICJsaXN0aW5nX2NvdW50IiAiYWRtaW4iICJsMF9zZWxsZXIiICJsMF9hbW91bnQiICJsMV9zZWxsZXIiICJsMV9hbW91bnQiICJsMl9zZWxsZXIiICJsMl9hbW91bnQiICJsM19zZWxsZXIiICJsM19hbW91bnQiICJ2YWxpZGF0b3IiICJwMF9zdWJtaXR0ZXIiICJwMV9zdWJtaXR0ZXIiICJwMl9zdWJtaXR0ZXIiICJwM19zdWJtaXR0ZXIiICJsMF9wcmljZSIgImwxX3ByaWNlIiAibDJfcHJpY2UiICJsM19wcmljZSIgInAwX2NpZCIgInAwX25hbWUiICJwMF9sb2NhdGlvbiIgInAwX2Vjb3N5c3RlbSIgInAxX2NpZCIgInAxX25hbWUiICJwMV9sb2NhdGlvbiIgInAxX2Vjb3N5c3RlbSIgInAyX2NpZCIgInAyX25hbWUiICJwMl9sb2NhdGlvbiIgInAyX2Vjb3N5c3RlbSIgInAzX2NpZCIgInAzX25hbWUiICJwM19sb2NhdGlvbiIgInAzX2Vjb3N5c3RlbSIKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0OS01MAogICAgLy8gIyDilIDilIAgUm9sZS1iYXNlZCBhY2Nlc3MgY29udHJvbCDilIDilIAKICAgIC8vIHNlbGYuYWRtaW46IEFjY291bnQgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlYyAxOCAvLyAiYWRtaW4iCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTEKICAgIC8vIHNlbGYudmFsaWRhdG9yOiBBY2NvdW50ID0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgYnl0ZWMgMjcgLy8gInZhbGlkYXRvciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1My01NAogICAgLy8gIyDilIDilIAgQUFSTkEgdG9rZW4gKEFTQSkg4pSA4pSACiAgICAvLyBzZWxmLmFhcm5hX2Fzc2V0OiBBc3NldCA9IEFzc2V0KDApCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2LTU3CiAgICAvLyAjIOKUgOKUgCBQcm9qZWN0IGJvb2trZWVwaW5nIOKUgOKUgAogICAgLy8gc2VsZi5wcm9qZWN0X2NvdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDggLy8gInByb2plY3RfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1OAogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlY18zIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwLTYxCiAgICAvLyAjIOKUgOKUgCBGbGF0IHByb2plY3Qgc3RvcmFnZSAoNCBzbG90cykg4pSA4pSACiAgICAvLyBzZWxmLnAwX3N1Ym1pdHRlcjogQWNjb3VudCA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjIDI4IC8vICJwMF9zdWJtaXR0ZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHNlbGYucDBfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWMgMzYgLy8gInAwX2NpZCIKICAgIGJ5dGVjXzIgLy8gMHgwMDAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzCiAgICAvLyBzZWxmLnAwX25hbWU6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlYyAzNyAvLyAicDBfbmFtZSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MgogICAgLy8gc2VsZi5wMF9jaWQ6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlY18yIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzCiAgICAvLyBzZWxmLnAwX25hbWU6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0CiAgICAvLyBzZWxmLnAwX2xvY2F0aW9uOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWMgMzggLy8gInAwX2xvY2F0aW9uIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLnAwX2NpZDogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjXzIgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQKICAgIC8vIHNlbGYucDBfbG9jYXRpb246IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1CiAgICAvLyBzZWxmLnAwX2Vjb3N5c3RlbTogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjIDM5IC8vICJwMF9lY29zeXN0ZW0iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHNlbGYucDBfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWNfMiAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NQogICAgLy8gc2VsZi5wMF9lY29zeXN0ZW06IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY2CiAgICAvLyBzZWxmLnAwX3N0YXR1czogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyA0IC8vICJwMF9zdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NwogICAgLy8gc2VsZi5wMF9jcmVkaXRzOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDkgLy8gInAwX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2OQogICAgLy8gc2VsZi5wMV9zdWJtaXR0ZXI6IEFjY291bnQgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlYyAyOSAvLyAicDFfc3VibWl0dGVyIgogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwCiAgICAvLyBzZWxmLnAxX2NpZDogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjIDQwIC8vICJwMV9jaWQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHNlbGYucDBfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWNfMiAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MAogICAgLy8gc2VsZi5wMV9jaWQ6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxCiAgICAvLyBzZWxmLnAxX25hbWU6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlYyA0MSAvLyAicDFfbmFtZSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MgogICAgLy8gc2VsZi5wMF9jaWQ6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlY18yIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxCiAgICAvLyBzZWxmLnAxX25hbWU6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyCiAgICAvLyBzZWxmLnAxX2xvY2F0aW9uOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWMgNDIgLy8gInAxX2xvY2F0aW9uIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLnAwX2NpZDogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjXzIgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzIKICAgIC8vIHNlbGYucDFfbG9jYXRpb246IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczCiAgICAvLyBzZWxmLnAxX2Vjb3N5c3RlbTogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjIDQzIC8vICJwMV9lY29zeXN0ZW0iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHNlbGYucDBfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWNfMiAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MwogICAgLy8gc2VsZi5wMV9lY29zeXN0ZW06IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0CiAgICAvLyBzZWxmLnAxX3N0YXR1czogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyA1IC8vICJwMV9zdGF0dXMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NQogICAgLy8gc2VsZi5wMV9jcmVkaXRzOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDEwIC8vICJwMV9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzcKICAgIC8vIHNlbGYucDJfc3VibWl0dGVyOiBBY2NvdW50ID0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgYnl0ZWMgMzAgLy8gInAyX3N1Ym1pdHRlciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3OAogICAgLy8gc2VsZi5wMl9jaWQ6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlYyA0NCAvLyAicDJfY2lkIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLnAwX2NpZDogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjXzIgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzgKICAgIC8vIHNlbGYucDJfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3OQogICAgLy8gc2VsZi5wMl9uYW1lOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWMgNDUgLy8gInAyX25hbWUiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHNlbGYucDBfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWNfMiAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3OQogICAgLy8gc2VsZi5wMl9uYW1lOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MAogICAgLy8gc2VsZi5wMl9sb2NhdGlvbjogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjIDQ2IC8vICJwMl9sb2NhdGlvbiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MgogICAgLy8gc2VsZi5wMF9jaWQ6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlY18yIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwCiAgICAvLyBzZWxmLnAyX2xvY2F0aW9uOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MQogICAgLy8gc2VsZi5wMl9lY29zeXN0ZW06IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlYyA0NyAvLyAicDJfZWNvc3lzdGVtIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLnAwX2NpZDogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjXzIgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODEKICAgIC8vIHNlbGYucDJfZWNvc3lzdGVtOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MgogICAgLy8gc2VsZi5wMl9zdGF0dXM6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNiAvLyAicDJfc3RhdHVzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODMKICAgIC8vIHNlbGYucDJfY3JlZGl0czogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAxMSAvLyAicDJfY3JlZGl0cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1CiAgICAvLyBzZWxmLnAzX3N1Ym1pdHRlcjogQWNjb3VudCA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjIDMxIC8vICJwM19zdWJtaXR0ZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODYKICAgIC8vIHNlbGYucDNfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWMgNDggLy8gInAzX2NpZCIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MgogICAgLy8gc2VsZi5wMF9jaWQ6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlY18yIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2CiAgICAvLyBzZWxmLnAzX2NpZDogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODcKICAgIC8vIHNlbGYucDNfbmFtZTogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjIDQ5IC8vICJwM19uYW1lIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyCiAgICAvLyBzZWxmLnAwX2NpZDogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGJ5dGVjXzIgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODcKICAgIC8vIHNlbGYucDNfbmFtZTogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODgKICAgIC8vIHNlbGYucDNfbG9jYXRpb246IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlYyA1MCAvLyAicDNfbG9jYXRpb24iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIKICAgIC8vIHNlbGYucDBfY2lkOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWNfMiAvLyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4OAogICAgLy8gc2VsZi5wM19sb2NhdGlvbjogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODkKICAgIC8vIHNlbGYucDNfZWNvc3lzdGVtOiBhcmM0LlN0cmluZyA9IGFyYzQuU3RyaW5nKCIiKQogICAgYnl0ZWMgNTEgLy8gInAzX2Vjb3N5c3RlbSIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MgogICAgLy8gc2VsZi5wMF9jaWQ6IGFyYzQuU3RyaW5nID0gYXJjNC5TdHJpbmcoIiIpCiAgICBieXRlY18yIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5CiAgICAvLyBzZWxmLnAzX2Vjb3N5c3RlbTogYXJjNC5TdHJpbmcgPSBhcmM0LlN0cmluZygiIikKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTAKICAgIC8vIHNlbGYucDNfc3RhdHVzOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDcgLy8gInAzX3N0YXR1cyIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxCiAgICAvLyBzZWxmLnAzX2NyZWRpdHM6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTIgLy8gInAzX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5My05NAogICAgLy8gIyDilIDilIAgTWFya2V0cGxhY2UgbGlzdGluZyBzdG9yYWdlICg0IHNsb3RzKSDilIDilIAKICAgIC8vIHNlbGYubGlzdGluZ19jb3VudDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAxNyAvLyAibGlzdGluZ19jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2CiAgICAvLyBzZWxmLmwwX3NlbGxlcjogQWNjb3VudCA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjIDE5IC8vICJsMF9zZWxsZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTcKICAgIC8vIHNlbGYubDBfYW1vdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDIwIC8vICJsMF9hbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5OAogICAgLy8gc2VsZi5sMF9wcmljZTogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAzMiAvLyAibDBfcHJpY2UiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5OQogICAgLy8gc2VsZi5sMF9hY3RpdmU6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTMgLy8gImwwX2FjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMQogICAgLy8gc2VsZi5sMV9zZWxsZXI6IEFjY291bnQgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlYyAyMSAvLyAibDFfc2VsbGVyIgogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMgogICAgLy8gc2VsZi5sMV9hbW91bnQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMjIgLy8gImwxX2Ftb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMwogICAgLy8gc2VsZi5sMV9wcmljZTogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAzMyAvLyAibDFfcHJpY2UiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDQKICAgIC8vIHNlbGYubDFfYWN0aXZlOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDE0IC8vICJsMV9hY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDYKICAgIC8vIHNlbGYubDJfc2VsbGVyOiBBY2NvdW50ID0gR2xvYmFsLnplcm9fYWRkcmVzcwogICAgYnl0ZWMgMjMgLy8gImwyX3NlbGxlciIKICAgIGdsb2JhbCBaZXJvQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDcKICAgIC8vIHNlbGYubDJfYW1vdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDI0IC8vICJsMl9hbW91bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDgKICAgIC8vIHNlbGYubDJfcHJpY2U6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMzQgLy8gImwyX3ByaWNlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBzZWxmLmwyX2FjdGl2ZTogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAxNSAvLyAibDJfYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTExCiAgICAvLyBzZWxmLmwzX3NlbGxlcjogQWNjb3VudCA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjIDI1IC8vICJsM19zZWxsZXIiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyCiAgICAvLyBzZWxmLmwzX2Ftb3VudDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAyNiAvLyAibDNfYW1vdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEzCiAgICAvLyBzZWxmLmwzX3ByaWNlOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDM1IC8vICJsM19wcmljZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNAogICAgLy8gc2VsZi5sM19hY3RpdmU6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTYgLy8gImwzX2FjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKbWFpbl9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzUKICAgIC8vIGNsYXNzIEFhcm5hUmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJ6IG1haW5fY3JlYXRlX05vT3BAMzMKICAgIHB1c2hieXRlc3MgMHhmMTI2ZDA0YiAweGQzNDhmYmIzIDB4MDhmYjdiN2MgMHhhMjFhODA3NyAweDY2NDVmMmY5IDB4MjE5Nzk5NDMgMHg2MjYyOTA2NSAweDIyNmZhMjM3IDB4MDUwMGZjYTkgMHg2M2Q1NWI2YyAweDMwNWU3NWJkIDB4NWJhMjJhODQgMHgzNDZiM2RiYyAweGYzOGU2OTQxIDB4NWYxY2QyZGMgMHg4YmEzOTI1OSAweDIyZjk4YWI2IDB4MjM1MjMxMTcgMHg0OGM5Yjc1YiAweDdiNjEzZTJhIDB4ZmJkNzA5ZTcgMHg0YTIxMjdiNiAweDFkZWJhNGU5IDB4YWM3N2RjNjQgMHg1MDhkNzZkOSAweDU3N2UxNDlhIDB4NjUyYjUxZDQgLy8gbWV0aG9kICJzZXRfdmFsaWRhdG9yKGFkZHJlc3Mpdm9pZCIsIG1ldGhvZCAidHJhbnNmZXJfYWRtaW4oYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJlbnN1cmVfdG9rZW4oKXVpbnQ2NCIsIG1ldGhvZCAic3VibWl0X3Byb2plY3Qoc3RyaW5nLHN0cmluZyxzdHJpbmcsc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiYXBwcm92ZV9wcm9qZWN0KHVpbnQ2NCx1aW50NjQpdm9pZCIsIG1ldGhvZCAicmVqZWN0X3Byb2plY3QodWludDY0KXZvaWQiLCBtZXRob2QgImlzc3VlX2NyZWRpdHModWludDY0KXVpbnQ2NCIsIG1ldGhvZCAibGlzdF9mb3Jfc2FsZSh1aW50NjQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAiYnV5X2xpc3RpbmcodWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJjYW5jZWxfbGlzdGluZyh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZ2V0X3Byb2plY3RfY291bnQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2Fzc2V0X2lkKCl1aW50NjQiLCBtZXRob2QgImdldF9hZG1pbigpYWRkcmVzcyIsIG1ldGhvZCAiZ2V0X3ZhbGlkYXRvcigpYWRkcmVzcyIsIG1ldGhvZCAiZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkKCl1aW50NjQiLCBtZXRob2QgImdldF9wcm9qZWN0X3N0YXR1cyh1aW50NjQpdWludDY0IiwgbWV0aG9kICJnZXRfcHJvamVjdF9jaWQodWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X3Byb2plY3RfbmFtZSh1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJnZXRfcHJvamVjdF9sb2NhdGlvbih1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJnZXRfcHJvamVjdF9jcmVkaXRzKHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImdldF9wcm9qZWN0X3N1Ym1pdHRlcih1aW50NjQpYWRkcmVzcyIsIG1ldGhvZCAiZ2V0X3Byb2plY3RfZWNvc3lzdGVtKHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF9saXN0aW5nX2NvdW50KCl1aW50NjQiLCBtZXRob2QgImdldF9saXN0aW5nX3NlbGxlcih1aW50NjQpYWRkcmVzcyIsIG1ldGhvZCAiZ2V0X2xpc3RpbmdfYW1vdW50KHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImdldF9saXN0aW5nX3ByaWNlKHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImdldF9saXN0aW5nX2FjdGl2ZSh1aW50NjQpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggc2V0X3ZhbGlkYXRvciB0cmFuc2Zlcl9hZG1pbiBlbnN1cmVfdG9rZW4gc3VibWl0X3Byb2plY3QgYXBwcm92ZV9wcm9qZWN0IHJlamVjdF9wcm9qZWN0IGlzc3VlX2NyZWRpdHMgbGlzdF9mb3Jfc2FsZSBidXlfbGlzdGluZyBjYW5jZWxfbGlzdGluZyBnZXRfcHJvamVjdF9jb3VudCBnZXRfYXNzZXRfaWQgZ2V0X2FkbWluIGdldF92YWxpZGF0b3IgZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkIGdldF9wcm9qZWN0X3N0YXR1cyBnZXRfcHJvamVjdF9jaWQgZ2V0X3Byb2plY3RfbmFtZSBnZXRfcHJvamVjdF9sb2NhdGlvbiBnZXRfcHJvamVjdF9jcmVkaXRzIGdldF9wcm9qZWN0X3N1Ym1pdHRlciBnZXRfcHJvamVjdF9lY29zeXN0ZW0gZ2V0X2xpc3RpbmdfY291bnQgZ2V0X2xpc3Rpbmdfc2VsbGVyIGdldF9saXN0aW5nX2Ftb3VudCBnZXRfbGlzdGluZ19wcmljZSBnZXRfbGlzdGluZ19hY3RpdmUKICAgIGVycgoKbWFpbl9jcmVhdGVfTm9PcEAzMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNQogICAgLy8gY2xhc3MgQWFybmFSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgcHVzaGJ5dGVzIDB4ODNmMTQ3NDggLy8gbWV0aG9kICJpbml0KCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggaW5pdAogICAgZXJyCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuaW5pdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmluaXQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzCiAgICAvLyBzZWxmLmFkbWluID0gVHhuLnNlbmRlcgogICAgYnl0ZWMgMTggLy8gImFkbWluIgogICAgdHhuIFNlbmRlcgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChjcmVhdGU9InJlcXVpcmUiKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LnNldF92YWxpZGF0b3Jbcm91dGluZ10oKSAtPiB2b2lkOgpzZXRfdmFsaWRhdG9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0CiAgICAvLyBzZWxmLl9vbmx5X2FkbWluKCkKICAgIGNhbGxzdWIgX29ubHlfYWRtaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDUKICAgIC8vIHNlbGYudmFsaWRhdG9yID0gYWRkcgogICAgYnl0ZWMgMjcgLy8gInZhbGlkYXRvciIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS50cmFuc2Zlcl9hZG1pbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnRyYW5zZmVyX2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUwCiAgICAvLyBzZWxmLl9vbmx5X2FkbWluKCkKICAgIGNhbGxzdWIgX29ubHlfYWRtaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTEKICAgIC8vIGFzc2VydCBuZXdfYWRtaW4gIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgImludmFsaWQ6IHplcm8gYWRkcmVzcyIKICAgIGR1cAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIGludmFsaWQ6IHplcm8gYWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MgogICAgLy8gc2VsZi5hZG1pbiA9IG5ld19hZG1pbgogICAgYnl0ZWMgMTggLy8gImFkbWluIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmVuc3VyZV90b2tlbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmVuc3VyZV90b2tlbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjAKICAgIC8vIHNlbGYuX29ubHlfYWRtaW4oKQogICAgY2FsbHN1YiBfb25seV9hZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MQogICAgLy8gaWYgbm90IHNlbGYuYWFybmFfYXNzZXQ6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBibnogZW5zdXJlX3Rva2VuX2FmdGVyX2lmX2Vsc2VANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2Mi0xNzMKICAgIC8vIHJlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9MTBfMDAwXzAwMCwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIHVuaXRfbmFtZT0iQUFSTkEiLAogICAgLy8gICAgIGFzc2V0X25hbWU9IkFhcm5hIENhcmJvbiBDcmVkaXQiLAogICAgLy8gICAgIHVybD0iaHR0cHM6Ly9hYXJuYS5lY28iLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjkKICAgIC8vIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTcwLTE3MgogICAgLy8gcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwbiAzCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OAogICAgLy8gdXJsPSJodHRwczovL2Fhcm5hLmVjbyIsCiAgICBwdXNoYnl0ZXMgImh0dHBzOi8vYWFybmEuZWNvIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVSTAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NwogICAgLy8gYXNzZXRfbmFtZT0iQWFybmEgQ2FyYm9uIENyZWRpdCIsCiAgICBwdXNoYnl0ZXMgIkFhcm5hIENhcmJvbiBDcmVkaXQiCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TmFtZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NgogICAgLy8gdW5pdF9uYW1lPSJBQVJOQSIsCiAgICBwdXNoYnl0ZXMgIkFBUk5BIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY1CiAgICAvLyBkZWZhdWx0X2Zyb3plbj1GYWxzZSwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVmYXVsdEZyb3plbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NAogICAgLy8gZGVjaW1hbHM9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0RGVjaW1hbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjMKICAgIC8vIHRvdGFsPTEwXzAwMF8wMDAsCiAgICBwdXNoaW50IDEwMDAwMDAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjIKICAgIC8vIHJlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICBwdXNoaW50IDMgLy8gYWNmZwogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYyLTE3MwogICAgLy8gcmVzdWx0ID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xMF8wMDBfMDAwLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJBQVJOQSIsCiAgICAvLyAgICAgYXNzZXRfbmFtZT0iQWFybmEgQ2FyYm9uIENyZWRpdCIsCiAgICAvLyAgICAgdXJsPSJodHRwczovL2Fhcm5hLmVjbyIsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzQKICAgIC8vIHNlbGYuYWFybmFfYXNzZXQgPSByZXN1bHQuY3JlYXRlZF9hc3NldAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBpdHhuIENyZWF0ZWRBc3NldElECiAgICBhcHBfZ2xvYmFsX3B1dAoKZW5zdXJlX3Rva2VuX2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzUKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmFhcm5hX2Fzc2V0LmlkKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuc3VibWl0X3Byb2plY3Rbcm91dGluZ10oKSAtPiB2b2lkOgpzdWJtaXRfcHJvamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzIgLy8gMgogICAgKwogICAgc3dhcAogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMiAvLyAyCiAgICArCiAgICBzd2FwCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ4PgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18yIC8vIDIKICAgICsKICAgIHN3YXAKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDg+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkzCiAgICAvLyBpZHggPSBzZWxmLnByb2plY3RfY291bnQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJwcm9qZWN0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NAogICAgLy8gYXNzZXJ0IGlkeCA8IFVJbnQ2NCg0KSwgIm1heCBwcm9qZWN0cyByZWFjaGVkICg0KSIKICAgIGR1cAogICAgaW50Y18zIC8vIDQKICAgIDwKICAgIGFzc2VydCAvLyBtYXggcHJvamVjdHMgcmVhY2hlZCAoNCkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTUKICAgIC8vIHNlbmRlciA9IFR4bi5zZW5kZXIKICAgIHR4biBTZW5kZXIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTcKICAgIC8vIGlmIGlkeCA9PSBVSW50NjQoMCk6CiAgICBibnogc3VibWl0X3Byb2plY3RfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTgKICAgIC8vIHNlbGYucDBfc3VibWl0dGVyID0gc2VuZGVyCiAgICBieXRlYyAyOCAvLyAicDBfc3VibWl0dGVyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk5CiAgICAvLyBzZWxmLnAwX25hbWUgPSBuYW1lCiAgICBieXRlYyAzNyAvLyAicDBfbmFtZSIKICAgIGRpZyA2CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMAogICAgLy8gc2VsZi5wMF9sb2NhdGlvbiA9IGxvY2F0aW9uCiAgICBieXRlYyAzOCAvLyAicDBfbG9jYXRpb24iCiAgICBkaWcgNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDEKICAgIC8vIHNlbGYucDBfZWNvc3lzdGVtID0gZWNvc3lzdGVtCiAgICBieXRlYyAzOSAvLyAicDBfZWNvc3lzdGVtIgogICAgZGlnIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAyCiAgICAvLyBzZWxmLnAwX2NpZCA9IGNpZAogICAgYnl0ZWMgMzYgLy8gInAwX2NpZCIKICAgIGRpZyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMwogICAgLy8gc2VsZi5wMF9zdGF0dXMgPSBVSW50NjQoMSkKICAgIGJ5dGVjIDQgLy8gInAwX3N0YXR1cyIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNAogICAgLy8gc2VsZi5wMF9jcmVkaXRzID0gVUludDY0KDApCiAgICBieXRlYyA5IC8vICJwMF9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgpzdWJtaXRfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzMAogICAgLy8gc2VsZi5wcm9qZWN0X2NvdW50ID0gaWR4ICsgVUludDY0KDEpCiAgICBkaWcgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAicHJvamVjdF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjMxCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoaWR4KQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpzdWJtaXRfcHJvamVjdF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDUKICAgIC8vIGVsaWYgaWR4ID09IFVJbnQ2NCgxKToKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IHN1Ym1pdF9wcm9qZWN0X2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA2CiAgICAvLyBzZWxmLnAxX3N1Ym1pdHRlciA9IHNlbmRlcgogICAgYnl0ZWMgMjkgLy8gInAxX3N1Ym1pdHRlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNwogICAgLy8gc2VsZi5wMV9uYW1lID0gbmFtZQogICAgYnl0ZWMgNDEgLy8gInAxX25hbWUiCiAgICBkaWcgNgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDgKICAgIC8vIHNlbGYucDFfbG9jYXRpb24gPSBsb2NhdGlvbgogICAgYnl0ZWMgNDIgLy8gInAxX2xvY2F0aW9uIgogICAgZGlnIDUKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA5CiAgICAvLyBzZWxmLnAxX2Vjb3N5c3RlbSA9IGVjb3N5c3RlbQogICAgYnl0ZWMgNDMgLy8gInAxX2Vjb3N5c3RlbSIKICAgIGRpZyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMAogICAgLy8gc2VsZi5wMV9jaWQgPSBjaWQKICAgIGJ5dGVjIDQwIC8vICJwMV9jaWQiCiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTEKICAgIC8vIHNlbGYucDFfc3RhdHVzID0gVUludDY0KDEpCiAgICBieXRlYyA1IC8vICJwMV9zdGF0dXMiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTIKICAgIC8vIHNlbGYucDFfY3JlZGl0cyA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTAgLy8gInAxX2NyZWRpdHMiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgc3VibWl0X3Byb2plY3RfYWZ0ZXJfaWZfZWxzZUAxMAoKc3VibWl0X3Byb2plY3RfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEzCiAgICAvLyBlbGlmIGlkeCA9PSBVSW50NjQoMik6CiAgICBkaWcgMQogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBieiBzdWJtaXRfcHJvamVjdF9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNAogICAgLy8gc2VsZi5wMl9zdWJtaXR0ZXIgPSBzZW5kZXIKICAgIGJ5dGVjIDMwIC8vICJwMl9zdWJtaXR0ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTUKICAgIC8vIHNlbGYucDJfbmFtZSA9IG5hbWUKICAgIGJ5dGVjIDQ1IC8vICJwMl9uYW1lIgogICAgZGlnIDYKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE2CiAgICAvLyBzZWxmLnAyX2xvY2F0aW9uID0gbG9jYXRpb24KICAgIGJ5dGVjIDQ2IC8vICJwMl9sb2NhdGlvbiIKICAgIGRpZyA1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNwogICAgLy8gc2VsZi5wMl9lY29zeXN0ZW0gPSBlY29zeXN0ZW0KICAgIGJ5dGVjIDQ3IC8vICJwMl9lY29zeXN0ZW0iCiAgICBkaWcgNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTgKICAgIC8vIHNlbGYucDJfY2lkID0gY2lkCiAgICBieXRlYyA0NCAvLyAicDJfY2lkIgogICAgZGlnIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE5CiAgICAvLyBzZWxmLnAyX3N0YXR1cyA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgNiAvLyAicDJfc3RhdHVzIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjIwCiAgICAvLyBzZWxmLnAyX2NyZWRpdHMgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDExIC8vICJwMl9jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIHN1Ym1pdF9wcm9qZWN0X2FmdGVyX2lmX2Vsc2VAMTAKCnN1Ym1pdF9wcm9qZWN0X2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyMgogICAgLy8gc2VsZi5wM19zdWJtaXR0ZXIgPSBzZW5kZXIKICAgIGJ5dGVjIDMxIC8vICJwM19zdWJtaXR0ZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMjMKICAgIC8vIHNlbGYucDNfbmFtZSA9IG5hbWUKICAgIGJ5dGVjIDQ5IC8vICJwM19uYW1lIgogICAgZGlnIDYKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjI0CiAgICAvLyBzZWxmLnAzX2xvY2F0aW9uID0gbG9jYXRpb24KICAgIGJ5dGVjIDUwIC8vICJwM19sb2NhdGlvbiIKICAgIGRpZyA1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyNQogICAgLy8gc2VsZi5wM19lY29zeXN0ZW0gPSBlY29zeXN0ZW0KICAgIGJ5dGVjIDUxIC8vICJwM19lY29zeXN0ZW0iCiAgICBkaWcgNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMjYKICAgIC8vIHNlbGYucDNfY2lkID0gY2lkCiAgICBieXRlYyA0OCAvLyAicDNfY2lkIgogICAgZGlnIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjI3CiAgICAvLyBzZWxmLnAzX3N0YXR1cyA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgNyAvLyAicDNfc3RhdHVzIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjI4CiAgICAvLyBzZWxmLnAzX2NyZWRpdHMgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDEyIC8vICJwM19jcmVkaXRzIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIHN1Ym1pdF9wcm9qZWN0X2FmdGVyX2lmX2Vsc2VAMTAKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5hcHByb3ZlX3Byb2plY3Rbcm91dGluZ10oKSAtPiB2b2lkOgphcHByb3ZlX3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjM3CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNDAKICAgIC8vIHNlbGYuX29ubHlfdmFsaWRhdG9yKCkKICAgIGNhbGxzdWIgX29ubHlfdmFsaWRhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjQxCiAgICAvLyBhc3NlcnQgcHJvamVjdF9pZCA8IHNlbGYucHJvamVjdF9jb3VudCwgImludmFsaWQgcHJvamVjdCBpZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJwcm9qZWN0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnByb2plY3RfY291bnQgZXhpc3RzCiAgICBkaWcgMgogICAgPgogICAgYXNzZXJ0IC8vIGludmFsaWQgcHJvamVjdCBpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MgogICAgLy8gYXNzZXJ0IGNyZWRpdHMgPiBVSW50NjQoMCksICJjcmVkaXRzIG11c3QgYmUgPiAwIgogICAgYXNzZXJ0IC8vIGNyZWRpdHMgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNDQKICAgIC8vIGlmIHByb2plY3RfaWQgPT0gVUludDY0KDApOgogICAgYm56IGFwcHJvdmVfcHJvamVjdF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0NQogICAgLy8gYXNzZXJ0IHNlbGYucDBfc3RhdHVzID09IFVJbnQ2NCgxKSwgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicDBfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAwX3N0YXR1cyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHBlbmRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNDYKICAgIC8vIHNlbGYucDBfc3RhdHVzID0gVUludDY0KDIpCiAgICBieXRlYyA0IC8vICJwMF9zdGF0dXMiCiAgICBpbnRjXzIgLy8gMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNDcKICAgIC8vIHNlbGYucDBfY3JlZGl0cyA9IGNyZWRpdHMKICAgIGJ5dGVjIDkgLy8gInAwX2NyZWRpdHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKCmFwcHJvdmVfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgphcHByb3ZlX3Byb2plY3RfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ4CiAgICAvLyBlbGlmIHByb2plY3RfaWQgPT0gVUludDY0KDEpOgogICAgZGlnIDEKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogYXBwcm92ZV9wcm9qZWN0X2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ5CiAgICAvLyBhc3NlcnQgc2VsZi5wMV9zdGF0dXMgPT0gVUludDY0KDEpLCAicHJvamVjdCBub3QgcGVuZGluZyIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJwMV9zdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDFfc3RhdHVzIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gcHJvamVjdCBub3QgcGVuZGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1MAogICAgLy8gc2VsZi5wMV9zdGF0dXMgPSBVSW50NjQoMikKICAgIGJ5dGVjIDUgLy8gInAxX3N0YXR1cyIKICAgIGludGNfMiAvLyAyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1MQogICAgLy8gc2VsZi5wMV9jcmVkaXRzID0gY3JlZGl0cwogICAgYnl0ZWMgMTAgLy8gInAxX2NyZWRpdHMiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgYXBwcm92ZV9wcm9qZWN0X2FmdGVyX2lmX2Vsc2VAMTAKCmFwcHJvdmVfcHJvamVjdF9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTIKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMik6CiAgICBkaWcgMQogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBieiBhcHByb3ZlX3Byb2plY3RfZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTMKICAgIC8vIGFzc2VydCBzZWxmLnAyX3N0YXR1cyA9PSBVSW50NjQoMSksICJwcm9qZWN0IG5vdCBwZW5kaW5nIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInAyX3N0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMl9zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCBwZW5kaW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjU0CiAgICAvLyBzZWxmLnAyX3N0YXR1cyA9IFVJbnQ2NCgyKQogICAgYnl0ZWMgNiAvLyAicDJfc3RhdHVzIgogICAgaW50Y18yIC8vIDIKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjU1CiAgICAvLyBzZWxmLnAyX2NyZWRpdHMgPSBjcmVkaXRzCiAgICBieXRlYyAxMSAvLyAicDJfY3JlZGl0cyIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiBhcHByb3ZlX3Byb2plY3RfYWZ0ZXJfaWZfZWxzZUAxMAoKYXBwcm92ZV9wcm9qZWN0X2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NwogICAgLy8gYXNzZXJ0IHNlbGYucDNfc3RhdHVzID09IFVJbnQ2NCgxKSwgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAicDNfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAzX3N0YXR1cyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHBlbmRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTgKICAgIC8vIHNlbGYucDNfc3RhdHVzID0gVUludDY0KDIpCiAgICBieXRlYyA3IC8vICJwM19zdGF0dXMiCiAgICBpbnRjXzIgLy8gMgogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNTkKICAgIC8vIHNlbGYucDNfY3JlZGl0cyA9IGNyZWRpdHMKICAgIGJ5dGVjIDEyIC8vICJwM19jcmVkaXRzIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIGFwcHJvdmVfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDEwCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkucmVqZWN0X3Byb2plY3Rbcm91dGluZ10oKSAtPiB2b2lkOgpyZWplY3RfcHJvamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNjEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2NAogICAgLy8gc2VsZi5fb25seV92YWxpZGF0b3IoKQogICAgY2FsbHN1YiBfb25seV92YWxpZGF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNjUKICAgIC8vIGFzc2VydCBwcm9qZWN0X2lkIDwgc2VsZi5wcm9qZWN0X2NvdW50LCAiaW52YWxpZCBwcm9qZWN0IGlkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gaW52YWxpZCBwcm9qZWN0IGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjY3CiAgICAvLyBpZiBwcm9qZWN0X2lkID09IFVJbnQ2NCgwKToKICAgIGJueiByZWplY3RfcHJvamVjdF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2OAogICAgLy8gYXNzZXJ0IHNlbGYucDBfc3RhdHVzID09IFVJbnQ2NCgxKSwgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicDBfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAwX3N0YXR1cyBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHBlbmRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNjkKICAgIC8vIHNlbGYucDBfc3RhdHVzID0gVUludDY0KDMpCiAgICBieXRlYyA0IC8vICJwMF9zdGF0dXMiCiAgICBwdXNoaW50IDMKICAgIGFwcF9nbG9iYWxfcHV0CgpyZWplY3RfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpyZWplY3RfcHJvamVjdF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNzAKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMSk6CiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogcmVqZWN0X3Byb2plY3RfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNzEKICAgIC8vIGFzc2VydCBzZWxmLnAxX3N0YXR1cyA9PSBVSW50NjQoMSksICJwcm9qZWN0IG5vdCBwZW5kaW5nIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInAxX3N0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMV9zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCBwZW5kaW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjcyCiAgICAvLyBzZWxmLnAxX3N0YXR1cyA9IFVJbnQ2NCgzKQogICAgYnl0ZWMgNSAvLyAicDFfc3RhdHVzIgogICAgcHVzaGludCAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiByZWplY3RfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDEwCgpyZWplY3RfcHJvamVjdF9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNzMKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogcmVqZWN0X3Byb2plY3RfZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNzQKICAgIC8vIGFzc2VydCBzZWxmLnAyX3N0YXR1cyA9PSBVSW50NjQoMSksICJwcm9qZWN0IG5vdCBwZW5kaW5nIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gInAyX3N0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMl9zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCBwZW5kaW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjc1CiAgICAvLyBzZWxmLnAyX3N0YXR1cyA9IFVJbnQ2NCgzKQogICAgYnl0ZWMgNiAvLyAicDJfc3RhdHVzIgogICAgcHVzaGludCAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiByZWplY3RfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDEwCgpyZWplY3RfcHJvamVjdF9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyNzcKICAgIC8vIGFzc2VydCBzZWxmLnAzX3N0YXR1cyA9PSBVSW50NjQoMSksICJwcm9qZWN0IG5vdCBwZW5kaW5nIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInAzX3N0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCBwZW5kaW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjc4CiAgICAvLyBzZWxmLnAzX3N0YXR1cyA9IFVJbnQ2NCgzKQogICAgYnl0ZWMgNyAvLyAicDNfc3RhdHVzIgogICAgcHVzaGludCAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiByZWplY3RfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDEwCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuaXNzdWVfY3JlZGl0c1tyb3V0aW5nXSgpIC0+IHZvaWQ6Cmlzc3VlX2NyZWRpdHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjgwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyODYKICAgIC8vIHNlbGYuX29ubHlfdmFsaWRhdG9yKCkKICAgIGNhbGxzdWIgX29ubHlfdmFsaWRhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjg3CiAgICAvLyBhc3NlcnQgc2VsZi5hYXJuYV9hc3NldCwgIm5vIEFBUk5BIHRva2VuIGNyZWF0ZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBhc3NlcnQgLy8gbm8gQUFSTkEgdG9rZW4gY3JlYXRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4OAogICAgLy8gYXNzZXJ0IHByb2plY3RfaWQgPCBzZWxmLnByb2plY3RfY291bnQsICJpbnZhbGlkIHByb2plY3QgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgZGlnIDEKICAgID4KICAgIGFzc2VydCAvLyBpbnZhbGlkIHByb2plY3QgaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyOTAKICAgIC8vIGlmIHByb2plY3RfaWQgPT0gVUludDY0KDApOgogICAgYm56IGlzc3VlX2NyZWRpdHNfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyOTEKICAgIC8vIGFzc2VydCBzZWxmLnAwX3N0YXR1cyA9PSBVSW50NjQoMiksICJwcm9qZWN0IG5vdCB2ZXJpZmllZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwMF9zdGF0dXMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDBfc3RhdHVzIGV4aXN0cwogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBhc3NlcnQgLy8gcHJvamVjdCBub3QgdmVyaWZpZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyOTItMjk2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYucDBfc3VibWl0dGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zZWxmLnAwX2NyZWRpdHMsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjkzCiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjk0CiAgICAvLyBhc3NldF9yZWNlaXZlcj1zZWxmLnAwX3N1Ym1pdHRlciwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOCAvLyAicDBfc3VibWl0dGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAwX3N1Ym1pdHRlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyOTUKICAgIC8vIGFzc2V0X2Ftb3VudD1zZWxmLnAwX2NyZWRpdHMsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAicDBfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMF9jcmVkaXRzIGV4aXN0cwogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyOTItMjk2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYucDBfc3VibWl0dGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zZWxmLnAwX2NyZWRpdHMsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5NwogICAgLy8gc2VsZi5wMF9zdGF0dXMgPSBVSW50NjQoNCkKICAgIGJ5dGVjIDQgLy8gInAwX3N0YXR1cyIKICAgIGludGNfMyAvLyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5OAogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCA9IHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgKyBzZWxmLnAwX2NyZWRpdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJwMF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAwX2NyZWRpdHMgZXhpc3RzCiAgICArCiAgICBieXRlY18zIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mjk5CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wMF9jcmVkaXRzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDkgLy8gInAwX2NyZWRpdHMiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDBfY3JlZGl0cyBleGlzdHMKICAgIGl0b2IKCmlzc3VlX2NyZWRpdHNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5pc3N1ZV9jcmVkaXRzQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgppc3N1ZV9jcmVkaXRzX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMAogICAgLy8gZWxpZiBwcm9qZWN0X2lkID09IFVJbnQ2NCgxKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBpc3N1ZV9jcmVkaXRzX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzAxCiAgICAvLyBhc3NlcnQgc2VsZi5wMV9zdGF0dXMgPT0gVUludDY0KDIpLCAicHJvamVjdCBub3QgdmVyaWZpZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicDFfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAxX3N0YXR1cyBleGlzdHMKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHZlcmlmaWVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzAyLTMwNgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLnAxX3N1Ym1pdHRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5wMV9jcmVkaXRzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMwogICAgLy8geGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwNAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9c2VsZi5wMV9zdWJtaXR0ZXIsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjkgLy8gInAxX3N1Ym1pdHRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMV9zdWJtaXR0ZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzA1CiAgICAvLyBhc3NldF9hbW91bnQ9c2VsZi5wMV9jcmVkaXRzLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJwMV9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAxX2NyZWRpdHMgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzAyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMi0zMDYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c2VsZi5wMV9zdWJtaXR0ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYucDFfY3JlZGl0cywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzA3CiAgICAvLyBzZWxmLnAxX3N0YXR1cyA9IFVJbnQ2NCg0KQogICAgYnl0ZWMgNSAvLyAicDFfc3RhdHVzIgogICAgaW50Y18zIC8vIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzA4CiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkID0gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCArIHNlbGYucDFfY3JlZGl0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX2NyZWRpdHNfaXNzdWVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJwMV9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAxX2NyZWRpdHMgZXhpc3RzCiAgICArCiAgICBieXRlY18zIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzA5CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wMV9jcmVkaXRzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJwMV9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAxX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjgwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGIgaXNzdWVfY3JlZGl0c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Lmlzc3VlX2NyZWRpdHNAMTIKCmlzc3VlX2NyZWRpdHNfZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzEwCiAgICAvLyBlbGlmIHByb2plY3RfaWQgPT0gVUludDY0KDIpOgogICAgZHVwCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGJ6IGlzc3VlX2NyZWRpdHNfZWxzZV9ib2R5QDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzExCiAgICAvLyBhc3NlcnQgc2VsZi5wMl9zdGF0dXMgPT0gVUludDY0KDIpLCAicHJvamVjdCBub3QgdmVyaWZpZWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAicDJfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX3N0YXR1cyBleGlzdHMKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHZlcmlmaWVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzEyLTMxNgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLnAyX3N1Ym1pdHRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5wMl9jcmVkaXRzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxMwogICAgLy8geGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxNAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9c2VsZi5wMl9zdWJtaXR0ZXIsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzAgLy8gInAyX3N1Ym1pdHRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMl9zdWJtaXR0ZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzE1CiAgICAvLyBhc3NldF9hbW91bnQ9c2VsZi5wMl9jcmVkaXRzLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJwMl9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX2NyZWRpdHMgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzEyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxMi0zMTYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c2VsZi5wMl9zdWJtaXR0ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYucDJfY3JlZGl0cywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzE3CiAgICAvLyBzZWxmLnAyX3N0YXR1cyA9IFVJbnQ2NCg0KQogICAgYnl0ZWMgNiAvLyAicDJfc3RhdHVzIgogICAgaW50Y18zIC8vIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzE4CiAgICAvLyBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkID0gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCArIHNlbGYucDJfY3JlZGl0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gInRvdGFsX2NyZWRpdHNfaXNzdWVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkIGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJwMl9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX2NyZWRpdHMgZXhpc3RzCiAgICArCiAgICBieXRlY18zIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzE5CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wMl9jcmVkaXRzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDExIC8vICJwMl9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjgwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGIgaXNzdWVfY3JlZGl0c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Lmlzc3VlX2NyZWRpdHNAMTIKCmlzc3VlX2NyZWRpdHNfZWxzZV9ib2R5QDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyMQogICAgLy8gYXNzZXJ0IHNlbGYucDNfc3RhdHVzID09IFVJbnQ2NCgyKSwgInByb2plY3Qgbm90IHZlcmlmaWVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInAzX3N0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19zdGF0dXMgZXhpc3RzCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCB2ZXJpZmllZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyMi0zMjYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c2VsZi5wM19zdWJtaXR0ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYucDNfY3JlZGl0cywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMjMKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMjQKICAgIC8vIGFzc2V0X3JlY2VpdmVyPXNlbGYucDNfc3VibWl0dGVyLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMxIC8vICJwM19zdWJtaXR0ZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDNfc3VibWl0dGVyIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyNQogICAgLy8gYXNzZXRfYW1vdW50PXNlbGYucDNfY3JlZGl0cywKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAicDNfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19jcmVkaXRzIGV4aXN0cwogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyMgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMjItMzI2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYucDNfc3VibWl0dGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zZWxmLnAzX2NyZWRpdHMsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyNwogICAgLy8gc2VsZi5wM19zdGF0dXMgPSBVSW50NjQoNCkKICAgIGJ5dGVjIDcgLy8gInAzX3N0YXR1cyIKICAgIGludGNfMyAvLyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyOAogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCA9IHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgKyBzZWxmLnAzX2NyZWRpdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAicDNfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19jcmVkaXRzIGV4aXN0cwogICAgKwogICAgYnl0ZWNfMyAvLyAidG90YWxfY3JlZGl0c19pc3N1ZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyOQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYucDNfY3JlZGl0cykKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAicDNfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19jcmVkaXRzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBiIGlzc3VlX2NyZWRpdHNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5pc3N1ZV9jcmVkaXRzQDEyCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkubGlzdF9mb3Jfc2FsZVtyb3V0aW5nXSgpIC0+IHZvaWQ6Cmxpc3RfZm9yX3NhbGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzM1CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNDUKICAgIC8vIGFzc2VydCBzZWxmLmFhcm5hX2Fzc2V0LCAibm8gQUFSTkEgdG9rZW4iCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBubyBBQVJOQSB0b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0NgogICAgLy8gYXNzZXJ0IGFtb3VudCA+IFVJbnQ2NCgwKSwgImFtb3VudCBtdXN0IGJlID4gMCIKICAgIGRpZyAyCiAgICBhc3NlcnQgLy8gYW1vdW50IG11c3QgYmUgPiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzQ3CiAgICAvLyBhc3NlcnQgcHJpY2VfcGVyX3Rva2VuID4gVUludDY0KDApLCAicHJpY2UgbXVzdCBiZSA+IDAiCiAgICBzd2FwCiAgICBhc3NlcnQgLy8gcHJpY2UgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNDkKICAgIC8vIGlkeCA9IHNlbGYubGlzdGluZ19jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE3IC8vICJsaXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgNAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ19jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNTAKICAgIC8vIGFzc2VydCBpZHggPCBVSW50NjQoNCksICJtYXggbGlzdGluZ3MgcmVhY2hlZCAoNCkiCiAgICBkdXAKICAgIGludGNfMyAvLyA0CiAgICA8CiAgICBhc3NlcnQgLy8gbWF4IGxpc3RpbmdzIHJlYWNoZWQgKDQpCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzUyLTM1OAogICAgLy8gIyBDbGF3YmFjayB0b2tlbnMgZnJvbSBzZWxsZXIgaW50byBjb250cmFjdCBlc2Nyb3cKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9YW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1NQogICAgLy8gYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzU2CiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIHVuY292ZXIgNAogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICBzd2FwCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1Mi0zNTMKICAgIC8vICMgQ2xhd2JhY2sgdG9rZW5zIGZyb20gc2VsbGVyIGludG8gY29udHJhY3QgZXNjcm93CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1Mi0zNTgKICAgIC8vICMgQ2xhd2JhY2sgdG9rZW5zIGZyb20gc2VsbGVyIGludG8gY29udHJhY3QgZXNjcm93CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1UeG4uc2VuZGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWFtb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzYwCiAgICAvLyBzZWxsZXIgPSBUeG4uc2VuZGVyCiAgICB0eG4gU2VuZGVyCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzYyCiAgICAvLyBpZiBpZHggPT0gVUludDY0KDApOgogICAgYm56IGxpc3RfZm9yX3NhbGVfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNjMKICAgIC8vIHNlbGYubDBfc2VsbGVyID0gc2VsbGVyCiAgICBieXRlYyAxOSAvLyAibDBfc2VsbGVyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzY0CiAgICAvLyBzZWxmLmwwX2Ftb3VudCA9IGFtb3VudAogICAgYnl0ZWMgMjAgLy8gImwwX2Ftb3VudCIKICAgIGRpZyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2NQogICAgLy8gc2VsZi5sMF9wcmljZSA9IHByaWNlX3Blcl90b2tlbgogICAgYnl0ZWMgMzIgLy8gImwwX3ByaWNlIgogICAgZGlnIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzY2CiAgICAvLyBzZWxmLmwwX2FjdGl2ZSA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgMTMgLy8gImwwX2FjdGl2ZSIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAoKbGlzdF9mb3Jfc2FsZV9hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4MwogICAgLy8gc2VsZi5saXN0aW5nX2NvdW50ID0gaWR4ICsgVUludDY0KDEpCiAgICBkaWcgMQogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTcgLy8gImxpc3RpbmdfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4NAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KGlkeCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozMzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbGlzdF9mb3Jfc2FsZV9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNjcKICAgIC8vIGVsaWYgaWR4ID09IFVJbnQ2NCgxKToKICAgIGRpZyAxCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGxpc3RfZm9yX3NhbGVfZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNjgKICAgIC8vIHNlbGYubDFfc2VsbGVyID0gc2VsbGVyCiAgICBieXRlYyAyMSAvLyAibDFfc2VsbGVyIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzY5CiAgICAvLyBzZWxmLmwxX2Ftb3VudCA9IGFtb3VudAogICAgYnl0ZWMgMjIgLy8gImwxX2Ftb3VudCIKICAgIGRpZyA0CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3MAogICAgLy8gc2VsZi5sMV9wcmljZSA9IHByaWNlX3Blcl90b2tlbgogICAgYnl0ZWMgMzMgLy8gImwxX3ByaWNlIgogICAgZGlnIDMKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzcxCiAgICAvLyBzZWxmLmwxX2FjdGl2ZSA9IFVJbnQ2NCgxKQogICAgYnl0ZWMgMTQgLy8gImwxX2FjdGl2ZSIKICAgIGludGNfMSAvLyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiBsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMTEKCmxpc3RfZm9yX3NhbGVfZWxzZV9ib2R5QDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzcyCiAgICAvLyBlbGlmIGlkeCA9PSBVSW50NjQoMik6CiAgICBkaWcgMQogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBieiBsaXN0X2Zvcl9zYWxlX2Vsc2VfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzczCiAgICAvLyBzZWxmLmwyX3NlbGxlciA9IHNlbGxlcgogICAgYnl0ZWMgMjMgLy8gImwyX3NlbGxlciIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3NAogICAgLy8gc2VsZi5sMl9hbW91bnQgPSBhbW91bnQKICAgIGJ5dGVjIDI0IC8vICJsMl9hbW91bnQiCiAgICBkaWcgNAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzUKICAgIC8vIHNlbGYubDJfcHJpY2UgPSBwcmljZV9wZXJfdG9rZW4KICAgIGJ5dGVjIDM0IC8vICJsMl9wcmljZSIKICAgIGRpZyAzCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3NgogICAgLy8gc2VsZi5sMl9hY3RpdmUgPSBVSW50NjQoMSkKICAgIGJ5dGVjIDE1IC8vICJsMl9hY3RpdmUiCiAgICBpbnRjXzEgLy8gMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgbGlzdF9mb3Jfc2FsZV9hZnRlcl9pZl9lbHNlQDExCgpsaXN0X2Zvcl9zYWxlX2Vsc2VfYm9keUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3OAogICAgLy8gc2VsZi5sM19zZWxsZXIgPSBzZWxsZXIKICAgIGJ5dGVjIDI1IC8vICJsM19zZWxsZXIiCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozNzkKICAgIC8vIHNlbGYubDNfYW1vdW50ID0gYW1vdW50CiAgICBieXRlYyAyNiAvLyAibDNfYW1vdW50IgogICAgZGlnIDQKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MzgwCiAgICAvLyBzZWxmLmwzX3ByaWNlID0gcHJpY2VfcGVyX3Rva2VuCiAgICBieXRlYyAzNSAvLyAibDNfcHJpY2UiCiAgICBkaWcgMwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTozODEKICAgIC8vIHNlbGYubDNfYWN0aXZlID0gVUludDY0KDEpCiAgICBieXRlYyAxNiAvLyAibDNfYWN0aXZlIgogICAgaW50Y18xIC8vIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAxMQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmJ1eV9saXN0aW5nW3JvdXRpbmddKCkgLT4gdm9pZDoKYnV5X2xpc3Rpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mzg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5MgogICAgLy8gYXNzZXJ0IHNlbGYuYWFybmFfYXNzZXQsICJubyBBQVJOQSB0b2tlbiIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGFzc2VydCAvLyBubyBBQVJOQSB0b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5MwogICAgLy8gYXNzZXJ0IGxpc3RpbmdfaWQgPCBzZWxmLmxpc3RpbmdfY291bnQsICJpbnZhbGlkIGxpc3RpbmcgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gImxpc3RpbmdfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ19jb3VudCBleGlzdHMKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gaW52YWxpZCBsaXN0aW5nIGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mzk1CiAgICAvLyBpZiBsaXN0aW5nX2lkID09IFVJbnQ2NCgwKToKICAgIGJueiBidXlfbGlzdGluZ19lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5NgogICAgLy8gYXNzZXJ0IHNlbGYubDBfYWN0aXZlID09IFVJbnQ2NCgxKSwgImxpc3Rpbmcgbm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAibDBfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwwX2FjdGl2ZSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5NwogICAgLy8gdG90YWxfY29zdCA9IHNlbGYubDBfYW1vdW50ICogc2VsZi5sMF9wcmljZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vICJsMF9hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDBfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMyIC8vICJsMF9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMF9wcmljZSBleGlzdHMKICAgIGRpZyAxCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Mzk4CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gdG90YWxfY29zdCwgImluc3VmZmljaWVudCBwYXltZW50IgogICAgZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBpbnN1ZmZpY2llbnQgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM5OQogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgInBheSB0aGUgY29udHJhY3QiCiAgICBzd2FwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gcGF5IHRoZSBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMC00MDUKICAgIC8vICMgVHJhbnNmZXIgdG9rZW5zIHRvIGJ1eWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYubDBfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMgogICAgLy8geGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMwogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMC00MDEKICAgIC8vICMgVHJhbnNmZXIgdG9rZW5zIHRvIGJ1eWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwMC00MDUKICAgIC8vICMgVHJhbnNmZXIgdG9rZW5zIHRvIGJ1eWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYubDBfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MDYtNDEwCiAgICAvLyAjIEZvcndhcmQgQUxHTyB0byBzZWxsZXIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmwwX3NlbGxlciwKICAgIC8vICAgICBhbW91bnQ9dG90YWxfY29zdCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MDgKICAgIC8vIHJlY2VpdmVyPXNlbGYubDBfc2VsbGVyLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vICJsMF9zZWxsZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDBfc2VsbGVyIGV4aXN0cwogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MDYtNDA3CiAgICAvLyAjIEZvcndhcmQgQUxHTyB0byBzZWxsZXIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQwNi00MTAKICAgIC8vICMgRm9yd2FyZCBBTEdPIHRvIHNlbGxlcgogICAgLy8gaXR4bi5QYXltZW50KAogICAgLy8gICAgIHJlY2VpdmVyPXNlbGYubDBfc2VsbGVyLAogICAgLy8gICAgIGFtb3VudD10b3RhbF9jb3N0LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MTEKICAgIC8vIHNlbGYubDBfYWN0aXZlID0gVUludDY0KDApCiAgICBieXRlYyAxMyAvLyAibDBfYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgpidXlfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDE4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpidXlfbGlzdGluZ19lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MTIKICAgIC8vIGVsaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMSk6CiAgICBkaWcgMQogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBidXlfbGlzdGluZ19lbHNlX2JvZHlAOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxMwogICAgLy8gYXNzZXJ0IHNlbGYubDFfYWN0aXZlID09IFVJbnQ2NCgxKSwgImxpc3Rpbmcgbm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNCAvLyAibDFfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwxX2FjdGl2ZSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNAogICAgLy8gdG90YWxfY29zdCA9IHNlbGYubDFfYW1vdW50ICogc2VsZi5sMV9wcmljZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIyIC8vICJsMV9hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDFfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDMzIC8vICJsMV9wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMV9wcmljZSBleGlzdHMKICAgIGRpZyAxCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDE1CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gdG90YWxfY29zdCwgImluc3VmZmljaWVudCBwYXltZW50IgogICAgZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBpbnN1ZmZpY2llbnQgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNgogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgInBheSB0aGUgY29udHJhY3QiCiAgICBzd2FwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gcGF5IHRoZSBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNy00MjEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5sMV9hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDE4CiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDE5CiAgICAvLyBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDE3CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNy00MjEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5sMV9hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyMi00MjUKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmwxX3NlbGxlciwKICAgIC8vICAgICBhbW91bnQ9dG90YWxfY29zdCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MjMKICAgIC8vIHJlY2VpdmVyPXNlbGYubDFfc2VsbGVyLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIxIC8vICJsMV9zZWxsZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDFfc2VsbGVyIGV4aXN0cwogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MjIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQyMi00MjUKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmwxX3NlbGxlciwKICAgIC8vICAgICBhbW91bnQ9dG90YWxfY29zdCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDI2CiAgICAvLyBzZWxmLmwxX2FjdGl2ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTQgLy8gImwxX2FjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiBidXlfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDE4CgpidXlfbGlzdGluZ19lbHNlX2JvZHlAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MjcKICAgIC8vIGVsaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMik6CiAgICBkaWcgMQogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBieiBidXlfbGlzdGluZ19lbHNlX2JvZHlAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MjgKICAgIC8vIGFzc2VydCBzZWxmLmwyX2FjdGl2ZSA9PSBVSW50NjQoMSksICJsaXN0aW5nIG5vdCBhY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gImwyX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMl9hY3RpdmUgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBsaXN0aW5nIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MjkKICAgIC8vIHRvdGFsX2Nvc3QgPSBzZWxmLmwyX2Ftb3VudCAqIHNlbGYubDJfcHJpY2UKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNCAvLyAibDJfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwyX2Ftb3VudCBleGlzdHMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNCAvLyAibDJfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDJfcHJpY2UgZXhpc3RzCiAgICBkaWcgMQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzMAogICAgLy8gYXNzZXJ0IHBheW1lbnQuYW1vdW50ID49IHRvdGFsX2Nvc3QsICJpbnN1ZmZpY2llbnQgcGF5bWVudCIKICAgIGRpZyAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGd0eG5zIEFtb3VudAogICAgZGlnIDEKICAgID49CiAgICBhc3NlcnQgLy8gaW5zdWZmaWNpZW50IHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MzEKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJwYXkgdGhlIGNvbnRyYWN0IgogICAgc3dhcAogICAgZ3R4bnMgUmVjZWl2ZXIKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICA9PQogICAgYXNzZXJ0IC8vIHBheSB0aGUgY29udHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MzItNDM2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYubDJfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzMwogICAgLy8geGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzNAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIHVuY292ZXIgMwogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzMgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MzItNDM2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYubDJfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MzctNDQwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5sMl9zZWxsZXIsCiAgICAvLyAgICAgYW1vdW50PXRvdGFsX2Nvc3QsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDM4CiAgICAvLyByZWNlaXZlcj1zZWxmLmwyX3NlbGxlciwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMyAvLyAibDJfc2VsbGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwyX3NlbGxlciBleGlzdHMKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDM3CiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0MzctNDQwCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9c2VsZi5sMl9zZWxsZXIsCiAgICAvLyAgICAgYW1vdW50PXRvdGFsX2Nvc3QsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0MQogICAgLy8gc2VsZi5sMl9hY3RpdmUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDE1IC8vICJsMl9hY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgYnV5X2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUAxOAoKYnV5X2xpc3RpbmdfZWxzZV9ib2R5QDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0MwogICAgLy8gYXNzZXJ0IHNlbGYubDNfYWN0aXZlID09IFVJbnQ2NCgxKSwgImxpc3Rpbmcgbm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAibDNfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwzX2FjdGl2ZSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0NAogICAgLy8gdG90YWxfY29zdCA9IHNlbGYubDNfYW1vdW50ICogc2VsZi5sM19wcmljZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI2IC8vICJsM19hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDNfYW1vdW50IGV4aXN0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDM1IC8vICJsM19wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sM19wcmljZSBleGlzdHMKICAgIGRpZyAxCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDQ1CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gdG90YWxfY29zdCwgImluc3VmZmljaWVudCBwYXltZW50IgogICAgZGlnIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgMQogICAgPj0KICAgIGFzc2VydCAvLyBpbnN1ZmZpY2llbnQgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0NgogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgInBheSB0aGUgY29udHJhY3QiCiAgICBzd2FwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gcGF5IHRoZSBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0Ny00NTEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5sM19hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDQ4CiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDQ5CiAgICAvLyBhc3NldF9yZWNlaXZlcj1UeG4uc2VuZGVyLAogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciAzCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDQ3CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0Ny00NTEKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5sM19hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1Mi00NTUKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmwzX3NlbGxlciwKICAgIC8vICAgICBhbW91bnQ9dG90YWxfY29zdCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NTMKICAgIC8vIHJlY2VpdmVyPXNlbGYubDNfc2VsbGVyLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI1IC8vICJsM19zZWxsZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDNfc2VsbGVyIGV4aXN0cwogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NTIKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1Mi00NTUKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1zZWxmLmwzX3NlbGxlciwKICAgIC8vICAgICBhbW91bnQ9dG90YWxfY29zdCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDU2CiAgICAvLyBzZWxmLmwzX2FjdGl2ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTYgLy8gImwzX2FjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiBidXlfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDE4CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuY2FuY2VsX2xpc3Rpbmdbcm91dGluZ10oKSAtPiB2b2lkOgpjYW5jZWxfbGlzdGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2MQogICAgLy8gYXNzZXJ0IGxpc3RpbmdfaWQgPCBzZWxmLmxpc3RpbmdfY291bnQsICJpbnZhbGlkIGxpc3RpbmcgaWQiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gImxpc3RpbmdfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ19jb3VudCBleGlzdHMKICAgIGRpZyAxCiAgICA+CiAgICBhc3NlcnQgLy8gaW52YWxpZCBsaXN0aW5nIGlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDYzCiAgICAvLyBpZiBsaXN0aW5nX2lkID09IFVJbnQ2NCgwKToKICAgIGJueiBjYW5jZWxfbGlzdGluZ19lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2NAogICAgLy8gYXNzZXJ0IHNlbGYubDBfYWN0aXZlID09IFVJbnQ2NCgxKSwgImxpc3Rpbmcgbm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMyAvLyAibDBfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwwX2FjdGl2ZSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2NQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5sMF9zZWxsZXIsICJvbmx5IHNlbGxlciBjYW4gY2FuY2VsIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vICJsMF9zZWxsZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDBfc2VsbGVyIGV4aXN0cwogICAgc3dhcAogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gb25seSBzZWxsZXIgY2FuIGNhbmNlbAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2Ni00NzAKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c2VsZi5sMF9zZWxsZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYubDBfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2NwogICAgLy8geGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2OQogICAgLy8gYXNzZXRfYW1vdW50PXNlbGYubDBfYW1vdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vICJsMF9hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDBfYW1vdW50IGV4aXN0cwogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ2NgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NjYtNDcwCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYubDBfc2VsbGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zZWxmLmwwX2Ftb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDcxCiAgICAvLyBzZWxmLmwwX2FjdGl2ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTMgLy8gImwwX2FjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAoKY2FuY2VsX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUAxNDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKY2FuY2VsX2xpc3RpbmdfZWxzZV9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDcyCiAgICAvLyBlbGlmIGxpc3RpbmdfaWQgPT0gVUludDY0KDEpOgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGNhbmNlbF9saXN0aW5nX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDczCiAgICAvLyBhc3NlcnQgc2VsZi5sMV9hY3RpdmUgPT0gVUludDY0KDEpLCAibGlzdGluZyBub3QgYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE0IC8vICJsMV9hY3RpdmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDFfYWN0aXZlIGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gbGlzdGluZyBub3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDc0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmwxX3NlbGxlciwgIm9ubHkgc2VsbGVyIGNhbiBjYW5jZWwiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjEgLy8gImwxX3NlbGxlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMV9zZWxsZXIgZXhpc3RzCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBvbmx5IHNlbGxlciBjYW4gY2FuY2VsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDc1LTQ3OQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLmwxX3NlbGxlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5sMV9hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDc2CiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDc4CiAgICAvLyBhc3NldF9hbW91bnQ9c2VsZi5sMV9hbW91bnQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gImwxX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMV9hbW91bnQgZXhpc3RzCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDc1CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBpbnRjXzMgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3NS00NzkKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c2VsZi5sMV9zZWxsZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYubDFfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODAKICAgIC8vIHNlbGYubDFfYWN0aXZlID0gVUludDY0KDApCiAgICBieXRlYyAxNCAvLyAibDFfYWN0aXZlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBiIGNhbmNlbF9saXN0aW5nX2FmdGVyX2lmX2Vsc2VAMTQKCmNhbmNlbF9saXN0aW5nX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4MQogICAgLy8gZWxpZiBsaXN0aW5nX2lkID09IFVJbnQ2NCgyKToKICAgIGR1cAogICAgaW50Y18yIC8vIDIKICAgID09CiAgICBieiBjYW5jZWxfbGlzdGluZ19lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODIKICAgIC8vIGFzc2VydCBzZWxmLmwyX2FjdGl2ZSA9PSBVSW50NjQoMSksICJsaXN0aW5nIG5vdCBhY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gImwyX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMl9hY3RpdmUgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBsaXN0aW5nIG5vdCBhY3RpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODMKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYubDJfc2VsbGVyLCAib25seSBzZWxsZXIgY2FuIGNhbmNlbCIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMyAvLyAibDJfc2VsbGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwyX3NlbGxlciBleGlzdHMKICAgIHN3YXAKICAgIGRpZyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIG9ubHkgc2VsbGVyIGNhbiBjYW5jZWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODQtNDg4CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYubDJfc2VsbGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zZWxmLmwyX2Ftb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODUKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODcKICAgIC8vIGFzc2V0X2Ftb3VudD1zZWxmLmwyX2Ftb3VudCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNCAvLyAibDJfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwyX2Ftb3VudCBleGlzdHMKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIGludGNfMyAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDg0LTQ4OAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zZWxmLmwyX3NlbGxlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9c2VsZi5sMl9hbW91bnQsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4OQogICAgLy8gc2VsZi5sMl9hY3RpdmUgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDE1IC8vICJsMl9hY3RpdmUiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIGIgY2FuY2VsX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUAxNAoKY2FuY2VsX2xpc3RpbmdfZWxzZV9ib2R5QDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5MQogICAgLy8gYXNzZXJ0IHNlbGYubDNfYWN0aXZlID09IFVJbnQ2NCgxKSwgImxpc3Rpbmcgbm90IGFjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAibDNfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwzX2FjdGl2ZSBleGlzdHMKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5MgogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5sM19zZWxsZXIsICJvbmx5IHNlbGxlciBjYW4gY2FuY2VsIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI1IC8vICJsM19zZWxsZXIiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDNfc2VsbGVyIGV4aXN0cwogICAgc3dhcAogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gb25seSBzZWxsZXIgY2FuIGNhbmNlbAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5My00OTcKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c2VsZi5sM19zZWxsZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXNlbGYubDNfYW1vdW50LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NAogICAgLy8geGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5NgogICAgLy8gYXNzZXRfYW1vdW50PXNlbGYubDNfYW1vdW50LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI2IC8vICJsM19hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDNfYW1vdW50IGV4aXN0cwogICAgaXR4bl9maWVsZCBBc3NldEFtb3VudAogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ5MwogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgaW50Y18zIC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0OTMtNDk3CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPXNlbGYubDNfc2VsbGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1zZWxmLmwzX2Ftb3VudCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDk4CiAgICAvLyBzZWxmLmwzX2FjdGl2ZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTYgLy8gImwzX2FjdGl2ZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgYiBjYW5jZWxfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDE0CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RfY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvamVjdF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MDYKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLnByb2plY3RfY291bnQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2Fzc2V0X2lkW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2Fzc2V0X2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYuYWFybmFfYXNzZXQuaWQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTA4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfYWRtaW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTE0CiAgICAvLyByZXR1cm4gc2VsZi5hZG1pbgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF92YWxpZGF0b3Jbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdmFsaWRhdG9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxOAogICAgLy8gcmV0dXJuIHNlbGYudmFsaWRhdG9yCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjcgLy8gInZhbGlkYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52YWxpZGF0b3IgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTE2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfdG90YWxfY3JlZGl0c19pc3N1ZWRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdG90YWxfY3JlZGl0c19pc3N1ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTIyCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X3N0YXR1c1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0X3N0YXR1czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyNgogICAgLy8gaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMCk6CiAgICBibnogZ2V0X3Byb2plY3Rfc3RhdHVzX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI3CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wMF9zdGF0dXMpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAicDBfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAwX3N0YXR1cyBleGlzdHMKICAgIGl0b2IKCmdldF9wcm9qZWN0X3N0YXR1c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X3N0YXR1c0A4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfcHJvamVjdF9zdGF0dXNfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI4CiAgICAvLyBlbGlmIHByb2plY3RfaWQgPT0gVUludDY0KDEpOgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9wcm9qZWN0X3N0YXR1c19lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUyOQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYucDFfc3RhdHVzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInAxX3N0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMV9zdGF0dXMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3Rfc3RhdHVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3Rfc3RhdHVzQDgKCmdldF9wcm9qZWN0X3N0YXR1c19lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MzAKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X3Byb2plY3Rfc3RhdHVzX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTMxCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wMl9zdGF0dXMpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAicDJfc3RhdHVzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX3N0YXR1cyBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfcHJvamVjdF9zdGF0dXNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9zdGF0dXNAOAoKZ2V0X3Byb2plY3Rfc3RhdHVzX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzMwogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYucDNfc3RhdHVzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInAzX3N0YXR1cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19zdGF0dXMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3Rfc3RhdHVzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3Rfc3RhdHVzQDgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9jaWRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvamVjdF9jaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTM1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MzcKICAgIC8vIGlmIHByb2plY3RfaWQgPT0gVUludDY0KDApOgogICAgYm56IGdldF9wcm9qZWN0X2NpZF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzOAogICAgLy8gcmV0dXJuIHNlbGYucDBfY2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzYgLy8gInAwX2NpZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMF9jaWQgZXhpc3RzCgpnZXRfcHJvamVjdF9jaWRfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9jaWRAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MzUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X3Byb2plY3RfY2lkX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzOQogICAgLy8gZWxpZiBwcm9qZWN0X2lkID09IFVJbnQ2NCgxKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBnZXRfcHJvamVjdF9jaWRfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDAKICAgIC8vIHJldHVybiBzZWxmLnAxX2NpZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQwIC8vICJwMV9jaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDFfY2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9wcm9qZWN0X2NpZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2NpZEA4CgpnZXRfcHJvamVjdF9jaWRfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQxCiAgICAvLyBlbGlmIHByb2plY3RfaWQgPT0gVUludDY0KDIpOgogICAgZHVwCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGJ6IGdldF9wcm9qZWN0X2NpZF9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0MgogICAgLy8gcmV0dXJuIHNlbGYucDJfY2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDQgLy8gInAyX2NpZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMl9jaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTM1CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3RfY2lkX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RfY2lkQDgKCmdldF9wcm9qZWN0X2NpZF9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDQKICAgIC8vIHJldHVybiBzZWxmLnAzX2NpZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQ4IC8vICJwM19jaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDNfY2lkIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9wcm9qZWN0X2NpZF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2NpZEA4CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RfbmFtZVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0X25hbWU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQ2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDgKICAgIC8vIGlmIHByb2plY3RfaWQgPT0gVUludDY0KDApOgogICAgYm56IGdldF9wcm9qZWN0X25hbWVfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDkKICAgIC8vIHJldHVybiBzZWxmLnAwX25hbWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNyAvLyAicDBfbmFtZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMF9uYW1lIGV4aXN0cwoKZ2V0X3Byb2plY3RfbmFtZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X25hbWVAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X3Byb2plY3RfbmFtZV9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTAKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMSk6CiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogZ2V0X3Byb2plY3RfbmFtZV9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MQogICAgLy8gcmV0dXJuIHNlbGYucDFfbmFtZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQxIC8vICJwMV9uYW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAxX25hbWUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQ2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3RfbmFtZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X25hbWVAOAoKZ2V0X3Byb2plY3RfbmFtZV9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTIKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X3Byb2plY3RfbmFtZV9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1MwogICAgLy8gcmV0dXJuIHNlbGYucDJfbmFtZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQ1IC8vICJwMl9uYW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX25hbWUgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQ2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3RfbmFtZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X25hbWVAOAoKZ2V0X3Byb2plY3RfbmFtZV9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTUKICAgIC8vIHJldHVybiBzZWxmLnAzX25hbWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0OSAvLyAicDNfbmFtZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19uYW1lIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9wcm9qZWN0X25hbWVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9uYW1lQDgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9sb2NhdGlvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0X2xvY2F0aW9uOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTU5CiAgICAvLyBpZiBwcm9qZWN0X2lkID09IFVJbnQ2NCgwKToKICAgIGJueiBnZXRfcHJvamVjdF9sb2NhdGlvbl9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2MAogICAgLy8gcmV0dXJuIHNlbGYucDBfbG9jYXRpb24KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzOCAvLyAicDBfbG9jYXRpb24iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDBfbG9jYXRpb24gZXhpc3RzCgpnZXRfcHJvamVjdF9sb2NhdGlvbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2xvY2F0aW9uQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9wcm9qZWN0X2xvY2F0aW9uX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2MQogICAgLy8gZWxpZiBwcm9qZWN0X2lkID09IFVJbnQ2NCgxKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBnZXRfcHJvamVjdF9sb2NhdGlvbl9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2MgogICAgLy8gcmV0dXJuIHNlbGYucDFfbG9jYXRpb24KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0MiAvLyAicDFfbG9jYXRpb24iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDFfbG9jYXRpb24gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTU3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3RfbG9jYXRpb25fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9sb2NhdGlvbkA4CgpnZXRfcHJvamVjdF9sb2NhdGlvbl9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjMKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X3Byb2plY3RfbG9jYXRpb25fZWxzZV9ib2R5QDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjQKICAgIC8vIHJldHVybiBzZWxmLnAyX2xvY2F0aW9uCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDYgLy8gInAyX2xvY2F0aW9uIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX2xvY2F0aW9uIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9wcm9qZWN0X2xvY2F0aW9uX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RfbG9jYXRpb25AOAoKZ2V0X3Byb2plY3RfbG9jYXRpb25fZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTY2CiAgICAvLyByZXR1cm4gc2VsZi5wM19sb2NhdGlvbgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUwIC8vICJwM19sb2NhdGlvbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19sb2NhdGlvbiBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfcHJvamVjdF9sb2NhdGlvbl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2xvY2F0aW9uQDgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9jcmVkaXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Byb2plY3RfY3JlZGl0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MAogICAgLy8gaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMCk6CiAgICBibnogZ2V0X3Byb2plY3RfY3JlZGl0c19lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYucDBfY3JlZGl0cykKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJwMF9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAwX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCgpnZXRfcHJvamVjdF9jcmVkaXRzX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RfY3JlZGl0c0A4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfcHJvamVjdF9jcmVkaXRzX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MgogICAgLy8gZWxpZiBwcm9qZWN0X2lkID09IFVJbnQ2NCgxKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBnZXRfcHJvamVjdF9jcmVkaXRzX2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTczCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wMV9jcmVkaXRzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEwIC8vICJwMV9jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAxX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTY4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3RfY3JlZGl0c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2NyZWRpdHNAOAoKZ2V0X3Byb2plY3RfY3JlZGl0c19lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NzQKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X3Byb2plY3RfY3JlZGl0c19lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3NQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYucDJfY3JlZGl0cykKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAicDJfY3JlZGl0cyIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMl9jcmVkaXRzIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9wcm9qZWN0X2NyZWRpdHNfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9jcmVkaXRzQDgKCmdldF9wcm9qZWN0X2NyZWRpdHNfZWxzZV9ib2R5QDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTc3CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wM19jcmVkaXRzKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJwM19jcmVkaXRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAzX2NyZWRpdHMgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTY4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3RfY3JlZGl0c19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2NyZWRpdHNAOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X3N1Ym1pdHRlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0X3N1Ym1pdHRlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4MQogICAgLy8gaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMCk6CiAgICBibnogZ2V0X3Byb2plY3Rfc3VibWl0dGVyX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTgyCiAgICAvLyByZXR1cm4gc2VsZi5wMF9zdWJtaXR0ZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyOCAvLyAicDBfc3VibWl0dGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAwX3N1Ym1pdHRlciBleGlzdHMKCmdldF9wcm9qZWN0X3N1Ym1pdHRlcl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X3N1Ym1pdHRlckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfcHJvamVjdF9zdWJtaXR0ZXJfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTgzCiAgICAvLyBlbGlmIHByb2plY3RfaWQgPT0gVUludDY0KDEpOgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9wcm9qZWN0X3N1Ym1pdHRlcl9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4NAogICAgLy8gcmV0dXJuIHNlbGYucDFfc3VibWl0dGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjkgLy8gInAxX3N1Ym1pdHRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMV9zdWJtaXR0ZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTc5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3Rfc3VibWl0dGVyX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3Rfc3VibWl0dGVyQDgKCmdldF9wcm9qZWN0X3N1Ym1pdHRlcl9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1ODUKICAgIC8vIGVsaWYgcHJvamVjdF9pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X3Byb2plY3Rfc3VibWl0dGVyX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTg2CiAgICAvLyByZXR1cm4gc2VsZi5wMl9zdWJtaXR0ZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMCAvLyAicDJfc3VibWl0dGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnAyX3N1Ym1pdHRlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfcHJvamVjdF9zdWJtaXR0ZXJfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9zdWJtaXR0ZXJAOAoKZ2V0X3Byb2plY3Rfc3VibWl0dGVyX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4OAogICAgLy8gcmV0dXJuIHNlbGYucDNfc3VibWl0dGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzEgLy8gInAzX3N1Ym1pdHRlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wM19zdWJtaXR0ZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTc5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3Rfc3VibWl0dGVyX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3Rfc3VibWl0dGVyQDgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9lY29zeXN0ZW1bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvamVjdF9lY29zeXN0ZW06CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1OTIKICAgIC8vIGlmIHByb2plY3RfaWQgPT0gVUludDY0KDApOgogICAgYm56IGdldF9wcm9qZWN0X2Vjb3N5c3RlbV9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5MwogICAgLy8gcmV0dXJuIHNlbGYucDBfZWNvc3lzdGVtCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzkgLy8gInAwX2Vjb3N5c3RlbSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMF9lY29zeXN0ZW0gZXhpc3RzCgpnZXRfcHJvamVjdF9lY29zeXN0ZW1fYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfcHJvamVjdF9lY29zeXN0ZW1AODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1OTAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X3Byb2plY3RfZWNvc3lzdGVtX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5NAogICAgLy8gZWxpZiBwcm9qZWN0X2lkID09IFVJbnQ2NCgxKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBnZXRfcHJvamVjdF9lY29zeXN0ZW1fZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1OTUKICAgIC8vIHJldHVybiBzZWxmLnAxX2Vjb3N5c3RlbQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQzIC8vICJwMV9lY29zeXN0ZW0iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDFfZWNvc3lzdGVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9wcm9qZWN0X2Vjb3N5c3RlbV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2Vjb3N5c3RlbUA4CgpnZXRfcHJvamVjdF9lY29zeXN0ZW1fZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTk2CiAgICAvLyBlbGlmIHByb2plY3RfaWQgPT0gVUludDY0KDIpOgogICAgZHVwCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGJ6IGdldF9wcm9qZWN0X2Vjb3N5c3RlbV9lbHNlX2JvZHlANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5NwogICAgLy8gcmV0dXJuIHNlbGYucDJfZWNvc3lzdGVtCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNDcgLy8gInAyX2Vjb3N5c3RlbSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wMl9lY29zeXN0ZW0gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTkwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X3Byb2plY3RfZWNvc3lzdGVtX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RfZWNvc3lzdGVtQDgKCmdldF9wcm9qZWN0X2Vjb3N5c3RlbV9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1OTkKICAgIC8vIHJldHVybiBzZWxmLnAzX2Vjb3N5c3RlbQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUxIC8vICJwM19lY29zeXN0ZW0iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucDNfZWNvc3lzdGVtIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5MAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9wcm9qZWN0X2Vjb3N5c3RlbV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2Vjb3N5c3RlbUA4CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfbGlzdGluZ19jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MDUKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmxpc3RpbmdfY291bnQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gImxpc3RpbmdfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ19jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nX3NlbGxlcltyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9saXN0aW5nX3NlbGxlcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwOQogICAgLy8gaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMCk6CiAgICBibnogZ2V0X2xpc3Rpbmdfc2VsbGVyX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjEwCiAgICAvLyByZXR1cm4gc2VsZi5sMF9zZWxsZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOSAvLyAibDBfc2VsbGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwwX3NlbGxlciBleGlzdHMKCmdldF9saXN0aW5nX3NlbGxlcl9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nX3NlbGxlckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwNwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpnZXRfbGlzdGluZ19zZWxsZXJfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjExCiAgICAvLyBlbGlmIGxpc3RpbmdfaWQgPT0gVUludDY0KDEpOgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGJ6IGdldF9saXN0aW5nX3NlbGxlcl9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYxMgogICAgLy8gcmV0dXJuIHNlbGYubDFfc2VsbGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjEgLy8gImwxX3NlbGxlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMV9zZWxsZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2xpc3Rpbmdfc2VsbGVyX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3Rpbmdfc2VsbGVyQDgKCmdldF9saXN0aW5nX3NlbGxlcl9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MTMKICAgIC8vIGVsaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X2xpc3Rpbmdfc2VsbGVyX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjE0CiAgICAvLyByZXR1cm4gc2VsZi5sMl9zZWxsZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMyAvLyAibDJfc2VsbGVyIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwyX3NlbGxlciBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MDcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfbGlzdGluZ19zZWxsZXJfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19zZWxsZXJAOAoKZ2V0X2xpc3Rpbmdfc2VsbGVyX2Vsc2VfYm9keUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYxNgogICAgLy8gcmV0dXJuIHNlbGYubDNfc2VsbGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjUgLy8gImwzX3NlbGxlciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sM19zZWxsZXIgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjA3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2xpc3Rpbmdfc2VsbGVyX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3Rpbmdfc2VsbGVyQDgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19hbW91bnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfbGlzdGluZ19hbW91bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjAKICAgIC8vIGlmIGxpc3RpbmdfaWQgPT0gVUludDY0KDApOgogICAgYm56IGdldF9saXN0aW5nX2Ftb3VudF9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYubDBfYW1vdW50KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIwIC8vICJsMF9hbW91bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDBfYW1vdW50IGV4aXN0cwogICAgaXRvYgoKZ2V0X2xpc3RpbmdfYW1vdW50X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfYW1vdW50QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9saXN0aW5nX2Ftb3VudF9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjIKICAgIC8vIGVsaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMSk6CiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogZ2V0X2xpc3RpbmdfYW1vdW50X2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjIzCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5sMV9hbW91bnQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjIgLy8gImwxX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMV9hbW91bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2xpc3RpbmdfYW1vdW50X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfYW1vdW50QDgKCmdldF9saXN0aW5nX2Ftb3VudF9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjQKICAgIC8vIGVsaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X2xpc3RpbmdfYW1vdW50X2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjI1CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5sMl9hbW91bnQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjQgLy8gImwyX2Ftb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMl9hbW91bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjE4CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2xpc3RpbmdfYW1vdW50X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfYW1vdW50QDgKCmdldF9saXN0aW5nX2Ftb3VudF9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjcKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmwzX2Ftb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNiAvLyAibDNfYW1vdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwzX2Ftb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MTgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfbGlzdGluZ19hbW91bnRfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19hbW91bnRAOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nX3ByaWNlW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2xpc3RpbmdfcHJpY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjI5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MzEKICAgIC8vIGlmIGxpc3RpbmdfaWQgPT0gVUludDY0KDApOgogICAgYm56IGdldF9saXN0aW5nX3ByaWNlX2Vsc2VfYm9keUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjMyCiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5sMF9wcmljZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzMiAvLyAibDBfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDBfcHJpY2UgZXhpc3RzCiAgICBpdG9iCgpnZXRfbGlzdGluZ19wcmljZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nX3ByaWNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjI5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9saXN0aW5nX3ByaWNlX2Vsc2VfYm9keUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMwogICAgLy8gZWxpZiBsaXN0aW5nX2lkID09IFVJbnQ2NCgxKToKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBieiBnZXRfbGlzdGluZ19wcmljZV9lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzNAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYubDFfcHJpY2UpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMzMgLy8gImwxX3ByaWNlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwxX3ByaWNlIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBiIGdldF9saXN0aW5nX3ByaWNlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfcHJpY2VAOAoKZ2V0X2xpc3RpbmdfcHJpY2VfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjM1CiAgICAvLyBlbGlmIGxpc3RpbmdfaWQgPT0gVUludDY0KDIpOgogICAgZHVwCiAgICBpbnRjXzIgLy8gMgogICAgPT0KICAgIGJ6IGdldF9saXN0aW5nX3ByaWNlX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjM2CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5sMl9wcmljZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAzNCAvLyAibDJfcHJpY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDJfcHJpY2UgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjI5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2xpc3RpbmdfcHJpY2VfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19wcmljZUA4CgpnZXRfbGlzdGluZ19wcmljZV9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MzgKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmwzX3ByaWNlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDM1IC8vICJsM19wcmljZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sM19wcmljZSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfbGlzdGluZ19wcmljZV9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nX3ByaWNlQDgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19hY3RpdmVbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfbGlzdGluZ19hY3RpdmU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBwdXNoaW50IDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDIKICAgIC8vIGlmIGxpc3RpbmdfaWQgPT0gVUludDY0KDApOgogICAgYm56IGdldF9saXN0aW5nX2FjdGl2ZV9lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0MwogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYubDBfYWN0aXZlKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEzIC8vICJsMF9hY3RpdmUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubDBfYWN0aXZlIGV4aXN0cwogICAgaXRvYgoKZ2V0X2xpc3RpbmdfYWN0aXZlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfYWN0aXZlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9saXN0aW5nX2FjdGl2ZV9lbHNlX2JvZHlAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDQKICAgIC8vIGVsaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMSk6CiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogZ2V0X2xpc3RpbmdfYWN0aXZlX2Vsc2VfYm9keUA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ1CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5sMV9hY3RpdmUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTQgLy8gImwxX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMV9hY3RpdmUgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2xpc3RpbmdfYWN0aXZlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfYWN0aXZlQDgKCmdldF9saXN0aW5nX2FjdGl2ZV9lbHNlX2JvZHlANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDYKICAgIC8vIGVsaWYgbGlzdGluZ19pZCA9PSBVSW50NjQoMik6CiAgICBkdXAKICAgIGludGNfMiAvLyAyCiAgICA9PQogICAgYnogZ2V0X2xpc3RpbmdfYWN0aXZlX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ3CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5sMl9hY3RpdmUpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTUgLy8gImwyX2FjdGl2ZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5sMl9hY3RpdmUgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQwCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGIgZ2V0X2xpc3RpbmdfYWN0aXZlX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2xpc3RpbmdfYWN0aXZlQDgKCmdldF9saXN0aW5nX2FjdGl2ZV9lbHNlX2JvZHlANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDkKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmwzX2FjdGl2ZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNiAvLyAibDNfYWN0aXZlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmwzX2FjdGl2ZSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgYiBnZXRfbGlzdGluZ19hY3RpdmVfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbGlzdGluZ19hY3RpdmVAOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9vbmx5X2FkbWluKCkgLT4gdm9pZDoKX29ubHlfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxCiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluLCAidW5hdXRob3JpemVkOiBhZG1pbiBvbmx5IgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gdW5hdXRob3JpemVkOiBhZG1pbiBvbmx5CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fb25seV92YWxpZGF0b3IoKSAtPiB2b2lkOgpfb25seV92YWxpZGF0b3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLnZhbGlkYXRvciwgInVuYXV0aG9yaXplZDogdmFsaWRhdG9yIG9ubHkiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjcgLy8gInZhbGlkYXRvciIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi52YWxpZGF0b3IgZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIHVuYXV0aG9yaXplZDogdmFsaWRhdG9yIG9ubHkKICAgIHJldHN1Ygo=","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="},"byteCode":{"approval":"CyAEAAECBCY0BBUffHULYWFybmFfYXNzZXQCAAAUdG90YWxfY3JlZGl0c19pc3N1ZWQJcDBfc3RhdHVzCXAxX3N0YXR1cwlwMl9zdGF0dXMJcDNfc3RhdHVzDXByb2plY3RfY291bnQKcDBfY3JlZGl0cwpwMV9jcmVkaXRzCnAyX2NyZWRpdHMKcDNfY3JlZGl0cwlsMF9hY3RpdmUJbDFfYWN0aXZlCWwyX2FjdGl2ZQlsM19hY3RpdmUNbGlzdGluZ19jb3VudAVhZG1pbglsMF9zZWxsZXIJbDBfYW1vdW50CWwxX3NlbGxlcglsMV9hbW91bnQJbDJfc2VsbGVyCWwyX2Ftb3VudAlsM19zZWxsZXIJbDNfYW1vdW50CXZhbGlkYXRvcgxwMF9zdWJtaXR0ZXIMcDFfc3VibWl0dGVyDHAyX3N1Ym1pdHRlcgxwM19zdWJtaXR0ZXIIbDBfcHJpY2UIbDFfcHJpY2UIbDJfcHJpY2UIbDNfcHJpY2UGcDBfY2lkB3AwX25hbWULcDBfbG9jYXRpb24McDBfZWNvc3lzdGVtBnAxX2NpZAdwMV9uYW1lC3AxX2xvY2F0aW9uDHAxX2Vjb3N5c3RlbQZwMl9jaWQHcDJfbmFtZQtwMl9sb2NhdGlvbgxwMl9lY29zeXN0ZW0GcDNfY2lkB3AzX25hbWULcDNfbG9jYXRpb24McDNfZWNvc3lzdGVtMRhAANAnEjIDZycbMgNnKSJnJwgiZysiZyccMgNnJyQqZyclKmcnJipnJycqZycEImcnCSJnJx0yA2cnKCpnJykqZycqKmcnKypnJwUiZycKImcnHjIDZycsKmcnLSpnJy4qZycvKmcnBiJnJwsiZycfMgNnJzAqZycxKmcnMipnJzMqZycHImcnDCJnJxEiZycTMgNnJxQiZycgImcnDSJnJxUyA2cnFiJnJyEiZycOImcnFzIDZycYImcnIiJnJw8iZycZMgNnJxoiZycjImcnECJnMRkURDEYQQDFghsE8SbQSwTTSPuzBAj7e3wEohqAdwRmRfL5BCGXmUMEYmKQZQQib6I3BAUA/KkEY9VbbAQwXnW9BFuiKoQENGs9vATzjmlBBF8c0twEi6OSWQQi+Yq2BCNSMRcESMm3WwR7YT4qBPvXCecESiEntgQd66TpBKx33GQEUI122QRXfhSaBGUrUdQ2GgCOGwAWACgAPwCvAaECJgKLA7EEcwX8BuYG8gb9BwgHEwceB18HnAfZCBYIVwiUCNEI3QkaCVsJnACABIPxR0g2GgCOAQABACcSMQBnI0M2GgFJFYEgEkSICbsnG0xnI0M2GgFJFYEgEkSICalJMgMTRCcSTGcjQ4gJmyIpZURAAFuxMgpHA7IssiuyKrIpgBFodHRwczovL2Fhcm5hLmVjb7IngBNBYXJuYSBDYXJib24gQ3JlZGl0siaABUFBUk5BsiUisiQisiOBgK3iBLIigQOyECKyAbMptDxnIillRBYoTFCwI0M2GgFHAiJZJAhMFRJENhoCRwIiWSQITBUSRDYaA0cCIlkkCEwVEkQ2GgRHAiJZJAhMFRJEIicIZUxJTwJESSUMRDEATEAAMSccSwFnJyVLBmcnJksFZycnSwRnJyRLA2cnBCNnJwkiZ0sBSSMIJwhMZxYoTFCwI0NLASMSQQAkJx1LAWcnKUsGZycqSwVnJytLBGcnKEsDZycFI2cnCiJnQv/FSwEkEkEAJCceSwFnJy1LBmcnLksFZycvSwRnJyxLA2cnBiNnJwsiZ0L/micfSwFnJzFLBmcnMksFZyczSwRnJzBLA2cnByNnJwwiZ0L/djYaAUkVgQgSRBdJNhoCSRWBCBJEF0lOAogIKyInCGVESwINRERAABMiJwRlRCMSRCcEJGcnCUsBZyNDSwEjEkEAFCInBWVEIxJEJwUkZycKSwFnQv/jSwEkEkEAFCInBmVEIxJEJwYkZycLSwFnQv/IIicHZUQjEkQnByRnJwxLAWdC/7Q2GgFJFYEIEkQXSYgHsyInCGVESwENREAADyInBGVEIxJEJwSBA2cjQ0kjEkEAECInBWVEIxJEJwWBA2dC/+hJJBJBABAiJwZlRCMSRCcGgQNnQv/SIicHZUQjEkQnB4EDZ0L/wjYaAUkVgQgSRBdJiAdOIillREQiJwhlREsBDURAAEEiJwRlRCQSRLEiKWVEIiccZUQiJwllRLISshSyESWyECKyAbMnBCVnIitlRCInCWVECCtMZyInCWVEFihMULAjQ0kjEkEAPiInBWVEJBJEsSIpZUQiJx1lRCInCmVEshKyFLIRJbIQIrIBsycFJWciK2VEIicKZUQIK0xnIicKZUQWQv+2SSQSQQA+IicGZUQkEkSxIillRCInHmVEIicLZUSyErIUshElshAisgGzJwYlZyIrZUQiJwtlRAgrTGciJwtlRBZC/3IiJwdlRCQSRLEiKWVEIicfZUQiJwxlRLISshSyESWyECKyAbMnByVnIitlRCInDGVECCtMZyInDGVEFkL/NDYaAUkVgQgSRBdJNhoCSRWBCBJEF0lOAiIpZURJREsCRExEIicRZUxJTgJOBERJJQxEsTEAMgpPBLISshSyE0yyESWyECKyAbMxAExAACMnE0sBZycUSwRnJyBLA2cnDSNnSwFJIwgnEUxnFihMULAjQ0sBIxJBABYnFUsBZycWSwRnJyFLA2cnDiNnQv/TSwEkEkEAFicXSwFnJxhLBGcnIksDZycPI2dC/7YnGUsBZycaSwRnJyNLA2cnECNnQv+gNhoBSRWBCBJEF0kxFiMJSU4COBAjEkQiKWVERCInEWVESwENREAAVCInDWVEIxJEIicUZUQiJyBlREsBC0sCSU4COAhLAQ9ETDgHMgoSRLEiKWVEMQBPA7ISshSyESWyECKyAbOxIicTZUSyB7III7IQIrIBsycNImcjQ0sBIxJBAFUiJw5lRCMSRCInFmVEIichZURLAQtLAklOAjgISwEPREw4BzIKEkSxIillRDEATwOyErIUshElshAisgGzsSInFWVEsgeyCCOyECKyAbMnDiJnQv+iSwEkEkEAVSInD2VEIxJEIicYZUQiJyJlREsBC0sCSU4COAhLAQ9ETDgHMgoSRLEiKWVEMQBPA7ISshSyESWyECKyAbOxIicXZUSyB7III7IQIrIBsycPImdC/0YiJxBlRCMSRCInGmVEIicjZURLAQtLAklOAjgISwEPREw4BzIKEkSxIillRDEATwOyErIUshElshAisgGzsSInGWVEsgeyCCOyECKyAbMnECJnQv7xNhoBSRWBCBJEF0kiJxFlREsBDURAADEiJw1lRCMSRDEAIicTZURMSwESRLEiKWVEIicUZUSyErIRshQlshAisgGzJw0iZyNDSSMSQQAyIicOZUQjEkQxACInFWVETEsBEkSxIillRCInFmVEshKyEbIUJbIQIrIBsycOImdC/8ZJJBJBADIiJw9lRCMSRDEAIicXZURMSwESRLEiKWVEIicYZUSyErIRshQlshAisgGzJw8iZ0L/jiInEGVEIxJEMQAiJxllRExLARJEsSIpZUQiJxplRLISshGyFCWyECKyAbMnECJnQv9cIicIZUQWKExQsCNDIillRBYoTFCwI0MiJxJlRChMULAjQyInG2VEKExQsCNDIitlRBYoTFCwI0M2GgFJFYEIEkQXSUAADCInBGVEFihMULAjQ0kjEkEACSInBWVEFkL/60kkEkEACSInBmVEFkL/3CInB2VEFkL/0zYaAUkVgQgSRBdJQAALIickZUQoTFCwI0NJIxJBAAgiJyhlREL/7EkkEkEACCInLGVEQv/eIicwZURC/9Y2GgFJFYEIEkQXSUAACyInJWVEKExQsCNDSSMSQQAIIicpZURC/+xJJBJBAAgiJy1lREL/3iInMWVEQv/WNhoBSRWBCBJEF0lAAAsiJyZlRChMULAjQ0kjEkEACCInKmVEQv/sSSQSQQAIIicuZURC/94iJzJlREL/1jYaAUkVgQgSRBdJQAAMIicJZUQWKExQsCNDSSMSQQAJIicKZUQWQv/rSSQSQQAJIicLZUQWQv/cIicMZUQWQv/TNhoBSRWBCBJEF0lAAAsiJxxlRChMULAjQ0kjEkEACCInHWVEQv/sSSQSQQAIIiceZURC/94iJx9lREL/1jYaAUkVgQgSRBdJQAALIicnZUQoTFCwI0NJIxJBAAgiJytlREL/7EkkEkEACCInL2VEQv/eIiczZURC/9YiJxFlRBYoTFCwI0M2GgFJFYEIEkQXSUAACyInE2VEKExQsCNDSSMSQQAIIicVZURC/+xJJBJBAAgiJxdlREL/3iInGWVEQv/WNhoBSRWBCBJEF0lAAAwiJxRlRBYoTFCwI0NJIxJBAAkiJxZlRBZC/+tJJBJBAAkiJxhlRBZC/9wiJxplRBZC/9M2GgFJFYEIEkQXSUAADCInIGVEFihMULAjQ0kjEkEACSInIWVEFkL/60kkEkEACSInImVEFkL/3CInI2VEFkL/0zYaAUkVgQgSRBdJQAAMIicNZUQWKExQsCNDSSMSQQAJIicOZUQWQv/rSSQSQQAJIicPZUQWQv/cIicQZUQWQv/TMQAiJxJlRBJEiTEAIicbZUQSRIk=","clear":"C4EBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":5,"minor":7,"patch":1}},"events":[],"templateVariables":{}} as unknown as Arc56Contract
+export const APP_SPEC: Arc56Contract = {"name":"AarnaRegistry","structs":{"Bid":[{"name":"bidder","type":"address"},{"name":"quantity","type":"uint64"},{"name":"price","type":"uint64"},{"name":"prev_bid","type":"uint64"},{"name":"next_bid","type":"uint64"}],"BidView":[{"name":"bid_id","type":"uint64"},{"name":"bidder","type":"address"},{"name":"quantity","type":"uint64"},{"name":"price","type":"uint64"}],"Claim":[{"name":"algo","type":"uint64"},{"name":"tokens","type":"uint64"}],"EvidenceRoot":[{"name":"root","type":"byte[32]"},{"name":"leaf_count","type":"uint64"}],"Listing":[{"name":"seller","type":"address"},{"name":"amount","type":"uint64"},{"name":"price","type":"uint64"},{"name":"expires_round","type":"uint64"},{"name":"prev_ask","type":"uint64"},{"name":"next_ask","type":"uint64"},{"name":"seller_slot","type":"uint64"}],"ListingView":[{"name":"listing_id","type":"uint64"},{"name":"seller","type":"address"},{"name":"amount","type":"uint64"},{"name":"price","type":"uint64"},{"name":"expires_round","type":"uint64"}],"MarketStats":[{"name":"volume","type":"uint64"},{"name":"notional","type":"uint64"},{"name":"trade_count","type":"uint64"},{"name":"vwap","type":"uint64"},{"name":"last_price","type":"uint64"},{"name":"last_trade_time","type":"uint64"},{"name":"current","type":"TradeWindow"},{"name":"previous","type":"TradeWindow"}],"PendingLink":[{"name":"prev_pending","type":"uint64"},{"name":"next_pending","type":"uint64"}],"Project":[{"name":"submitter","type":"address"},{"name":"cid","type":"string"},{"name":"name","type":"string"},{"name":"location","type":"string"},{"name":"ecosystem","type":"string"},{"name":"status","type":"uint64"},{"name":"credits","type":"uint64"}],"ProjectRecord":[{"name":"submitter","type":"address"},{"name":"state","type":"uint64"},{"name":"ecosystem","type":"uint8"},{"name":"cid","type":"byte[]"},{"name":"name","type":"string"},{"name":"location","type":"string"}],"ProjectTotals":[{"name":"by_status","type":"uint64[5]"},{"name":"credits_issued","type":"uint64"}],"TradeWindow":[{"name":"start","type":"uint64"},{"name":"volume","type":"uint64"},{"name":"notional","type":"uint64"},{"name":"high","type":"uint64"},{"name":"low","type":"uint64"}]},"methods":[{"name":"init","args":[],"returns":{"type":"void"},"actions":{"create":["NoOp"],"call":[]},"readonly":false,"desc":"Deploy the contract and set the caller as admin.","events":[],"recommendations":{}},{"name":"set_validator","args":[{"type":"address","name":"addr"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin assigns a validator address for project reviews.","events":[],"recommendations":{}},{"name":"transfer_admin","args":[{"type":"address","name":"new_admin"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Admin transfers ownership to a new admin account.","events":[],"recommendations":{}},{"name":"ensure_token","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Create the AARNA ASA if it doesn't exist.\nReturns the ASA ID.","events":[],"recommendations":{}},{"name":"submit_project","args":[{"type":"string","name":"name"},{"type":"string","name":"location"},{"type":"string","name":"ecosystem"},{"type":"string","name":"cid"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Developer submits a new project for review.\n`mbr_payment` must cover the MBR of the new project box. Extra opcode budget for packing the CID is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the project id.","events":[{"name":"ProjectSubmitted","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"},{"type":"string","name":"cid"}]}],"recommendations":{}},{"name":"submit_projects_batch","args":[{"type":"(string,string,string,string)[]","name":"submissions"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Submit up to MAX_SUBMIT_BATCH projects in one call; they get\nconsecutive ids. Each emits a ProjectSubmitted event, so batches of CIDs longer than a base32 CIDv1 may have to be smaller still to stay within MAX_LOG_BYTES. `mbr_payment` must cover the MBR of all new project boxes, and the box references for every new id must be spread over the group. Extra opcode budget is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the new project ids.","events":[{"name":"ProjectSubmitted","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"},{"type":"string","name":"cid"}]}],"recommendations":{}},{"name":"commit_evidence_root","args":[{"type":"uint64","name":"project_id"},{"type":"byte[32]","name":"root"},{"type":"uint64","name":"leaf_count"},{"type":"pay","name":"mbr_payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Submitter commits the Merkle root of a pending project's measurement\nrecords, once. Records are hashed as leaves and paired as described at MERKLE_LEAF_PREFIX; `mbr_payment` must cover the MBR of the root box.","events":[{"name":"EvidenceCommitted","args":[{"type":"uint64","name":"project_id"},{"type":"byte[32]","name":"root"},{"type":"uint64","name":"leaf_count"}]}],"recommendations":{}},{"name":"approve_project","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator approves a project and assigns credit amount.\nThe project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.","events":[{"name":"ProjectApproved","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}]}],"recommendations":{}},{"name":"reject_project","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator rejects a pending project.\nThe project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.","events":[{"name":"ProjectRejected","args":[{"type":"uint64","name":"project_id"}]}],"recommendations":{}},{"name":"issue_credits","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator issues AARNA tokens to submitter.\nStatus: 2 (verified) → 4 (issued). Prevents double-issuance.","events":[{"name":"CreditsIssued","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"},{"type":"uint64","name":"credits"}]}],"recommendations":{}},{"name":"approve_projects_batch","args":[{"type":"(uint64,uint64)[]","name":"approvals"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator approves up to MAX_APPROVE_BATCH pending projects in one\ncall. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.","events":[{"name":"ProjectApproved","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}]}],"recommendations":{}},{"name":"reject_projects_batch","args":[{"type":"uint64[]","name":"project_ids"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator rejects up to MAX_REJECT_BATCH pending projects in one\ncall. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.","events":[{"name":"ProjectRejected","args":[{"type":"uint64","name":"project_id"}]}],"recommendations":{}},{"name":"issue_credits_batch","args":[{"type":"uint64[]","name":"project_ids"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Validator issues credits for up to MAX_ISSUE_BATCH verified projects\nin one call.\nThe ASA transfers are submitted as inner groups of up to 16 with a zero fee, so the outer transaction must pay for them through fee pooling. Extra opcode budget is drawn the same way. Submitter accounts and project boxes must be referenced across the group. Returns the number of credits issued by this call.","events":[{"name":"CreditsIssued","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"},{"type":"uint64","name":"credits"}]}],"recommendations":{}},{"name":"list_for_sale","args":[{"type":"uint64","name":"amount","desc":"number of AARNA tokens to sell"},{"type":"uint64","name":"price_per_token","desc":"price per token in microALGO"},{"type":"uint64","name":"expires_round","desc":"last round the listing can be bought in, or 0 to keep it open until sold out or cancelled"},{"type":"uint64","name":"after_hint","desc":"the last active listing priced at or below `price_per_token`, or NO_LISTING if there is none; the ask index is walked forward from here"},{"type":"uint64","name":"max_fills","desc":"most crossing bids to fill or close, up to MAX_FILLS; FILL_BUDGET opcodes per fill are drawn from the group's fee credit"},{"type":"pay","name":"mbr_payment","desc":"covers the MBR of the new listing box, if any; whatever it does not cover is refunded with the proceeds"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"List AARNA tokens for sale. Standing bids priced at or above\n`price_per_token` are filled first, best price first, at the bid's price; tokens move by clawback straight to each bidder. Bids whose bidder has opted out of the token are closed and refunded on the way. Whatever is left is escrowed into the contract by clawback and listed, unless bids past `max_fills` still cross it, in which case it stays with the seller. Returns the listing id, or NO_LISTING if nothing was listed.","events":[{"name":"BidCancelled","args":[{"type":"uint64","name":"bid_id"},{"type":"address","name":"bidder"},{"type":"uint64","name":"quantity"}]},{"name":"BidFilled","args":[{"type":"uint64","name":"bid_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"},{"type":"uint64","name":"remaining"}]},{"name":"Listed","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"price"}]}],"recommendations":{}},{"name":"buy_listing","args":[{"type":"uint64","name":"listing_id"},{"type":"uint64","name":"quantity"},{"type":"pay","name":"payment"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Buy `quantity` tokens from a listing. Buyer sends ALGO payment,\ncontract transfers escrowed tokens to buyer and forwards ALGO to seller. The listing stays open with the remainder; once sold out its box is deleted and the MBR returned to the seller.","events":[{"name":"ListingFilled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"},{"type":"uint64","name":"remaining"}]}],"recommendations":{}},{"name":"market_buy","args":[{"type":"uint64","name":"max_quantity"},{"type":"uint64","name":"max_price"},{"type":"uint64","name":"max_fills"},{"type":"pay","name":"payment"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Buy up to `max_quantity` tokens from the cheapest asks priced at or\nbelow `max_price`, filling across at most `max_fills` listings (1 to MAX_FILLS) from the best ask down. Each seller is paid in turn, the tokens arrive in one transfer and any unspent payment is refunded. FILL_BUDGET opcodes per fill are drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the quantity bought.","events":[{"name":"ListingExpired","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]},{"name":"ListingFilled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"},{"type":"uint64","name":"remaining"}]}],"recommendations":{}},{"name":"cancel_listing","args":[{"type":"uint64","name":"listing_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Seller cancels their listing, expired or not. Escrowed tokens and\nMBR returned.","events":[{"name":"ListingCancelled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]}],"recommendations":{}},{"name":"sweep_expired","args":[{"type":"uint64[]","name":"listing_ids"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Close any of `listing_ids` (up to MAX_SWEEP_BATCH) that have expired,\nreturning each escrow to its seller. Anyone may call this; the released MBR is paid to the caller. Ids that are not open and expired are skipped, so a sweep does not fail if another closed a listing first. Extra opcode budget is drawn from the group's fee credit. Returns the MBR paid out.","events":[{"name":"ListingExpired","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]}],"recommendations":{}},{"name":"place_bid","args":[{"type":"uint64","name":"quantity","desc":"number of AARNA tokens wanted"},{"type":"uint64","name":"max_price","desc":"highest price per token in microALGO"},{"type":"uint64","name":"after_hint","desc":"the last active bid priced at or above `max_price`, or NO_BID if there is none; the bid index is walked forward from here"},{"type":"uint64","name":"max_fills","desc":"most asks to fill first, up to MAX_FILLS; FILL_BUDGET opcodes per fill are drawn from the group's fee credit"},{"type":"pay","name":"payment","desc":"covers immediate fills, the escrow and the bid box MBR; any excess is refunded"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Post a standing buy order for `quantity` tokens at up to `max_price`.\nAsks already at or below `max_price` are bought straight away; the rest is escrowed (remaining quantity * max_price) and rests in the bid index until a matching list_for_sale fills it. If asks past `max_fills` still cross it, nothing rests and the unfilled part of the payment is refunded.","events":[{"name":"ListingExpired","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]},{"name":"ListingFilled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"},{"type":"uint64","name":"remaining"}]},{"name":"BidPlaced","args":[{"type":"uint64","name":"bid_id"},{"type":"address","name":"bidder"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"}]}],"recommendations":{}},{"name":"cancel_bid","args":[{"type":"uint64","name":"bid_id"}],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Bidder cancels their bid. Escrowed ALGO and MBR returned.","events":[{"name":"BidCancelled","args":[{"type":"uint64","name":"bid_id"},{"type":"address","name":"bidder"},{"type":"uint64","name":"quantity"}]}],"recommendations":{}},{"name":"claim","args":[],"returns":{"type":"void"},"actions":{"create":[],"call":["NoOp"]},"readonly":false,"desc":"Withdraw the ALGO and AARNA tokens held for the caller because\npaying them out failed, with the claim box's MBR. The caller must be opted in to the token if any tokens are held.","events":[{"name":"Claimed","args":[{"type":"address","name":"account"},{"type":"uint64","name":"algo"},{"type":"uint64","name":"tokens"}]}],"recommendations":{}},{"name":"get_project_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_asset_id","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_admin","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_validator","args":[],"returns":{"type":"address"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_total_credits_issued","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_status_counts","args":[],"returns":{"type":"uint64[5]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Project count per status code (index 0 unused).","events":[],"recommendations":{}},{"name":"get_ecosystem_totals","args":[{"type":"string","name":"ecosystem"}],"returns":{"type":"(uint64[5],uint64)","struct":"ProjectTotals"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Per-status project counts and credits issued for one ecosystem.","events":[],"recommendations":{}},{"name":"get_project","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"(address,string,string,string,string,uint64,uint64)","struct":"Project"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Full project record in one call.","events":[],"recommendations":{}},{"name":"get_projects_page","args":[{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"(address,string,string,string,string,uint64,uint64)[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Projects `start` .. `start + count - 1` in one call.\nThe page is cut short if it would not fit in the ABI return value; the next page starts at `start + len(result)`.","events":[],"recommendations":{}},{"name":"get_pending","args":[{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Ids of up to `count` pending projects, oldest first, skipping the\nfirst `start` entries of the review queue. The walk never leaves the queue, so the cost depends only on how many projects are pending.","events":[],"recommendations":{}},{"name":"get_account_projects","args":[{"type":"address","name":"account"},{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Ids of projects submitted by `account`, in submission order, paged.","events":[],"recommendations":{}},{"name":"get_account_listings","args":[{"type":"address","name":"account"},{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"uint64[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Ids of `account`'s open listings, paged (order not preserved).","events":[],"recommendations":{}},{"name":"find_project_by_cid","args":[{"type":"string","name":"cid"}],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Id of the project whose evidence is `cid`, or NO_PROJECT if none.\nThe opcode budget for decoding a base32 CID is drawn from the group's fee credit when the call does not already have it.","events":[],"recommendations":{}},{"name":"get_evidence_root","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"(byte[32],uint64)","struct":"EvidenceRoot"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"The committed evidence root; `leaf_count` is 0 if there is none.","events":[],"recommendations":{}},{"name":"verify_inclusion","args":[{"type":"uint64","name":"project_id"},{"type":"byte[]","name":"leaf"},{"type":"byte[32][]","name":"proof"}],"returns":{"type":"bool"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Whether measurement record `leaf` is covered by the project's\nevidence root, given the sibling hashes from the leaf up. Each level costs one sha256; extra opcode budget for deep proofs is drawn from the group's fee credit when the call does not already have it.","events":[],"recommendations":{}},{"name":"get_project_cid","args":[{"type":"uint64","name":"project_id"}],"returns":{"type":"string"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_market_stats","args":[],"returns":{"type":"(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))","struct":"MarketStats"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Running totals, VWAP and last price, plus the current and previous\nSTATS_WINDOW_SECONDS trade windows as of the latest block.","events":[],"recommendations":{}},{"name":"get_listing_count","args":[],"returns":{"type":"uint64"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"events":[],"recommendations":{}},{"name":"get_best_ask","args":[],"returns":{"type":"(uint64,address,uint64,uint64,uint64)","struct":"ListingView"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"The cheapest active listing (oldest first among equal prices),\npassing over expired listings not yet swept. With an empty order book, `listing_id` is NO_LISTING and `amount` 0.","events":[],"recommendations":{}},{"name":"get_claim","args":[{"type":"address","name":"account"}],"returns":{"type":"(uint64,uint64)","struct":"Claim"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"What the app holds for `account` to `claim`; zero if nothing.","events":[],"recommendations":{}},{"name":"get_best_bid","args":[],"returns":{"type":"(uint64,address,uint64,uint64)","struct":"BidView"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"The highest standing bid (oldest first among equal prices).\nWith no bids, `bid_id` is NO_BID and `quantity` 0.","events":[],"recommendations":{}},{"name":"get_active_listings","args":[{"type":"uint64","name":"start"},{"type":"uint64","name":"count"}],"returns":{"type":"(uint64,address,uint64,uint64,uint64)[]"},"actions":{"create":[],"call":["NoOp"]},"readonly":true,"desc":"Up to `count` active listings in ask order (cheapest first, oldest\nfirst among equal prices), skipping the first `start`. The walk follows the ask index past expired listings not yet swept, so the cost depends only on how many listings are open. A page of up to MAX_LISTING_PAGE listings always fits the ABI return value; a longer one may be cut short, and the next page starts at `start + len(result)`.","events":[],"recommendations":{}}],"arcs":[22,28],"desc":"\n    On-chain registry + marketplace for blue carbon credits.\n\n    Lifecycle: SUBMIT → REVIEW → VERIFY / REJECT → ISSUE → TRADE\n\n    Roles:\n      - admin: deploys, creates AARNA ASA, assigns validator\n      - validator: approves/rejects, issues credits\n      - developer: submits projects\n      - any holder: lists/buys credits on marketplace\n    ","networks":{},"state":{"schema":{"global":{"ints":14,"bytes":5},"local":{"ints":0,"bytes":0}},"keys":{"global":{"admin":{"keyType":"AVMString","valueType":"address","key":"YWRtaW4="},"validator":{"keyType":"AVMString","valueType":"address","key":"dmFsaWRhdG9y"},"aarna_asset":{"keyType":"AVMString","valueType":"AVMUint64","key":"YWFybmFfYXNzZXQ="},"project_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"cHJvamVjdF9jb3VudA=="},"total_credits_issued":{"keyType":"AVMString","valueType":"AVMUint64","key":"dG90YWxfY3JlZGl0c19pc3N1ZWQ="},"status_counts":{"keyType":"AVMString","valueType":"uint64[5]","key":"c3RhdHVzX2NvdW50cw=="},"pending_head":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGVuZGluZ19oZWFk"},"pending_tail":{"keyType":"AVMString","valueType":"AVMUint64","key":"cGVuZGluZ190YWls"},"listing_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"bGlzdGluZ19jb3VudA=="},"best_ask_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"YmVzdF9hc2tfaWQ="},"bid_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"YmlkX2NvdW50"},"best_bid_id":{"keyType":"AVMString","valueType":"AVMUint64","key":"YmVzdF9iaWRfaWQ="},"trade_volume":{"keyType":"AVMString","valueType":"AVMUint64","key":"dHJhZGVfdm9sdW1l"},"trade_notional":{"keyType":"AVMString","valueType":"AVMUint64","key":"dHJhZGVfbm90aW9uYWw="},"trade_count":{"keyType":"AVMString","valueType":"AVMUint64","key":"dHJhZGVfY291bnQ="},"last_price":{"keyType":"AVMString","valueType":"AVMUint64","key":"bGFzdF9wcmljZQ=="},"last_trade_time":{"keyType":"AVMString","valueType":"AVMUint64","key":"bGFzdF90cmFkZV90aW1l"},"current_window":{"keyType":"AVMString","valueType":"TradeWindow","key":"Y3VycmVudF93aW5kb3c="},"previous_window":{"keyType":"AVMString","valueType":"TradeWindow","key":"cHJldmlvdXNfd2luZG93"}},"local":{},"box":{}},"maps":{"global":{},"local":{},"box":{"projects":{"keyType":"uint64","valueType":"ProjectRecord","prefix":"cA=="},"ecosystem_totals":{"keyType":"uint64","valueType":"ProjectTotals","prefix":"ZQ=="},"cid_index":{"keyType":"AVMBytes","valueType":"uint64","prefix":"Yw=="},"evidence_roots":{"keyType":"uint64","valueType":"EvidenceRoot","prefix":"bQ=="},"pending_queue":{"keyType":"uint64","valueType":"PendingLink","prefix":"cQ=="},"listings":{"keyType":"uint64","valueType":"Listing","prefix":"bA=="},"bids":{"keyType":"uint64","valueType":"Bid","prefix":"Yg=="},"claims":{"keyType":"address","valueType":"Claim","prefix":"aw=="}}}},"bareActions":{"create":[],"call":[]},"sourceInfo":{"approval":{"sourceInfo":[{"pc":[1222,1477,1712,2656,2810,3593,3741,3921,3938,6486,6494,6659,6806,6883,7370,7505,7999,8007,8017,8025],"errorMessage":"account funded"},{"pc":[2221],"errorMessage":"amount must be > 0"},{"pc":[2895,3820],"errorMessage":"bad price hint"},{"pc":[1536],"errorMessage":"batch events exceed log limit"},{"pc":[1405,1874,1946,2014,3298],"errorMessage":"batch too large"},{"pc":[7904],"errorMessage":"bid not active"},{"pc":[3481],"errorMessage":"bidder not opted in"},{"pc":[1033,1131,1799,1808,2008,2066,2217,2328,2433,2626,2933,2991,3052,3110,3204,3465,3514,3958,4029,6816,6828],"errorMessage":"check self.aarna_asset exists"},{"pc":[4041,5209],"errorMessage":"check self.admin exists"},{"pc":[2669,3550,3561,4868,5106,7541,7570],"errorMessage":"check self.best_ask_id exists"},{"pc":[2265,2289,2577,2588,3606,4980,5055],"errorMessage":"check self.best_bid_id exists"},{"pc":[3660],"errorMessage":"check self.bid_count exists"},{"pc":[2308,2339,2595,3631,5063,7978],"errorMessage":"check self.bids entry exists"},{"pc":[3916,8073],"errorMessage":"check self.claims entry exists"},{"pc":[7830],"errorMessage":"check self.current_window exists"},{"pc":[6585],"errorMessage":"check self.ecosystem_totals entry exists"},{"pc":[4818],"errorMessage":"check self.last_price exists"},{"pc":[4824],"errorMessage":"check self.last_trade_time exists"},{"pc":[2722,4856],"errorMessage":"check self.listing_count exists"},{"pc":[2693,3344,3567,5147,6712,6725,6749,6798,7345,7582],"errorMessage":"check self.listings entry exists"},{"pc":[4343],"errorMessage":"check self.pending_head exists"},{"pc":[4382,6442],"errorMessage":"check self.pending_queue entry exists"},{"pc":[5448],"errorMessage":"check self.pending_tail exists"},{"pc":[7838],"errorMessage":"check self.previous_window exists"},{"pc":[4018,4144,5230,5304],"errorMessage":"check self.project_count exists"},{"pc":[4168,5243],"errorMessage":"check self.projects entry exists"},{"pc":[4075,6531],"errorMessage":"check self.status_counts exists"},{"pc":[1831,2121,4063],"errorMessage":"check self.total_credits_issued exists"},{"pc":[4809,7721],"errorMessage":"check self.trade_count exists"},{"pc":[4784,4803,7709],"errorMessage":"check self.trade_notional exists"},{"pc":[4776,4789,4797,7697],"errorMessage":"check self.trade_volume exists"},{"pc":[4052,5219],"errorMessage":"check self.validator exists"},{"pc":[5293],"errorMessage":"cid too long"},{"pc":[5524],"errorMessage":"credits must be > 0"},{"pc":[5530],"errorMessage":"credits too large"},{"pc":[5318],"errorMessage":"duplicate evidence cid"},{"pc":[1704],"errorMessage":"evidence root already committed"},{"pc":[2231],"errorMessage":"expiry round passed"},{"pc":[1902,6546,6563,6604,6624],"errorMessage":"index access is out of bounds"},{"pc":[6428,6513,7069,7094,7497,7938,7964],"errorMessage":"index out of bounds"},{"pc":[2822,6668],"errorMessage":"insufficient mbr payment"},{"pc":[2976,3102,3777],"errorMessage":"insufficient payment"},{"pc":[1280],"errorMessage":"invalid array encoding"},{"pc":[1144,1157,1170,1183,1250,1310,1330,1351,1372,1852,1925,1988,3280,4356,4614,5122],"errorMessage":"invalid array length header"},{"pc":[6194,6223,6243],"errorMessage":"invalid cid"},{"pc":[1938,2001,3293],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint64>"},{"pc":[1151,1164,1177,1190],"errorMessage":"invalid number of bytes for arc4.dynamic_array<arc4.uint8>"},{"pc":[1866],"errorMessage":"invalid number of bytes for arc4.dynamic_array<smart_contracts.aarna_registry.contract.ProjectApproval>"},{"pc":[1389],"errorMessage":"invalid number of bytes for arc4.dynamic_array<smart_contracts.aarna_registry.contract.ProjectSubmission>"},{"pc":[994,1012,1648],"errorMessage":"invalid number of bytes for arc4.static_array<arc4.uint8, 32>"},{"pc":[1637,1656,1748,1757,1774,1791,2149,2161,2176,2185,2196,2909,2918,3019,3028,3037,3171,3411,3424,3436,3447,3834],"errorMessage":"invalid number of bytes for arc4.uint64"},{"pc":[5234],"errorMessage":"invalid project id"},{"pc":[1302],"errorMessage":"invalid tail pointer at index 0 of ((len+utf8[]),(len+utf8[]),(len+utf8[]),(len+utf8[]))"},{"pc":[1322],"errorMessage":"invalid tail pointer at index 1 of ((len+utf8[]),(len+utf8[]),(len+utf8[]),(len+utf8[]))"},{"pc":[1343],"errorMessage":"invalid tail pointer at index 2 of ((len+utf8[]),(len+utf8[]),(len+utf8[]),(len+utf8[]))"},{"pc":[1364],"errorMessage":"invalid tail pointer at index 3 of ((len+utf8[]),(len+utf8[]),(len+utf8[]),(len+utf8[]))"},{"pc":[1288],"errorMessage":"invalid tail pointer for (len+((len+utf8[]),(len+utf8[]),(len+utf8[]),(len+utf8[]))[])"},{"pc":[1298,1317,1338,1359],"errorMessage":"invalid tuple encoding"},{"pc":[1020],"errorMessage":"invalid: zero address"},{"pc":[1707],"errorMessage":"leaf count must be > 0"},{"pc":[2963],"errorMessage":"listing expired"},{"pc":[2885,2952,3182],"errorMessage":"listing not active"},{"pc":[5267],"errorMessage":"location too long"},{"pc":[3063],"errorMessage":"max fills must be > 0"},{"pc":[5257],"errorMessage":"name too long"},{"pc":[2218,2934,3053,3467],"errorMessage":"no AARNA token"},{"pc":[1800,2009],"errorMessage":"no AARNA token created"},{"pc":[4607],"errorMessage":"no evidence root"},{"pc":[3909],"errorMessage":"nothing to claim"},{"pc":[3852],"errorMessage":"only bidder can cancel"},{"pc":[3199],"errorMessage":"only seller can cancel"},{"pc":[1682],"errorMessage":"only submitter can commit"},{"pc":[5349,7291],"errorMessage":"overflow"},{"pc":[2237,2941,3060,3487,6654],"errorMessage":"pay the contract"},{"pc":[2224,3473],"errorMessage":"price must be > 0"},{"pc":[1691,5545,5628],"errorMessage":"project not pending"},{"pc":[5706],"errorMessage":"project not verified"},{"pc":[6927],"errorMessage":"quantity exceeds listing"},{"pc":[3470,6916],"errorMessage":"quantity must be > 0"},{"pc":[2242,3069,3492],"errorMessage":"too many fills"},{"pc":[1200,1401,1668,2213,2929,3048,3461],"errorMessage":"transaction type is pay"},{"pc":[5211],"errorMessage":"unauthorized: admin only"},{"pc":[5221],"errorMessage":"unauthorized: validator only"},{"pc":[5278],"errorMessage":"unknown ecosystem"}],"pcOffsetMethod":"none"},"clear":{"sourceInfo":[],"pcOffsetMethod":"none"}},"source":{"approval":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAwIDEgOCAyIDE4NDQ2NzQ0MDczNzA5NTUxNjE1IDEyOCAzMDAgNzAwIDEwMDAgNzIwNTc1OTQwMzc5Mjc5MzUgMzYwMCAyMjEwMAogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1ICJhYXJuYV9hc3NldCIgMHg2YyAweCAweDYyICJiZXN0X2Fza19pZCIgImJlc3RfYmlkX2lkIiAicHJvamVjdF9jb3VudCIgInRvdGFsX2NyZWRpdHNfaXNzdWVkIiAidHJhZGVfdm9sdW1lIiAweDcwICJhZG1pbiIgInRyYWRlX25vdGlvbmFsIiAweDZiIDB4NzEgInZhbGlkYXRvciIgInN0YXR1c19jb3VudHMiICJwZW5kaW5nX2hlYWQiICJwZW5kaW5nX3RhaWwiICJsaXN0aW5nX2NvdW50IiAidHJhZGVfY291bnQiIDB4MDAwMCAweDAxICJiaWRfY291bnQiICJsYXN0X3ByaWNlIiAibGFzdF90cmFkZV90aW1lIiAiY3VycmVudF93aW5kb3ciICJwcmV2aW91c193aW5kb3ciIDB4NmQgMHg3MzZjIDB4MDY4MTAxIDB4ZTU4NzQ2MDkgMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAgMHg3MzcwIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAgIk1hbmdyb3ZlIiAiU2VhZ3Jhc3MiICJXZXRsYW5kIiAiU2FsdCBNYXJzaCIgMHg2MTYyNjM2NDY1NjY2NzY4Njk2YTZiNmM2ZDZlNmY3MDcxNzI3Mzc0NzU3Njc3Nzg3OTdhMzIzMzM0MzUzNjM3CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDMxLTQzMgogICAgLy8gIyDilIDilIAgUm9sZS1iYXNlZCBhY2Nlc3MgY29udHJvbCDilIDilIAKICAgIC8vIHNlbGYuYWRtaW46IEFjY291bnQgPSBHbG9iYWwuemVyb19hZGRyZXNzCiAgICBieXRlYyAxMSAvLyAiYWRtaW4iCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDMzCiAgICAvLyBzZWxmLnZhbGlkYXRvcjogQWNjb3VudCA9IEdsb2JhbC56ZXJvX2FkZHJlc3MKICAgIGJ5dGVjIDE1IC8vICJ2YWxpZGF0b3IiCiAgICBnbG9iYWwgWmVyb0FkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDM1LTQzNgogICAgLy8gIyDilIDilIAgQUFSTkEgdG9rZW4gKEFTQSkg4pSA4pSACiAgICAvLyBzZWxmLmFhcm5hX2Fzc2V0OiBBc3NldCA9IEFzc2V0KDApCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQzOC00MzkKICAgIC8vICMg4pSA4pSAIFByb2plY3QgYm9va2tlZXBpbmcg4pSA4pSACiAgICAvLyBzZWxmLnByb2plY3RfY291bnQ6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNyAvLyAicHJvamVjdF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0MAogICAgLy8gc2VsZi50b3RhbF9jcmVkaXRzX2lzc3VlZDogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyA4IC8vICJ0b3RhbF9jcmVkaXRzX2lzc3VlZCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ0Mi00NDMKICAgIC8vICMgUHJvamVjdCBjb3VudCBwZXIgc3RhdHVzIGNvZGUgKGluZGV4IDAgdW51c2VkKQogICAgLy8gc2VsZi5zdGF0dXNfY291bnRzID0gU3RhdHVzQ291bnRzLmZyb21fYnl0ZXMob3AuYnplcm8oNSAqIDgpKQogICAgcHVzaGludCA0MAogICAgYnplcm8KICAgIGJ5dGVjIDE2IC8vICJzdGF0dXNfY291bnRzIgogICAgZGlnIDEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDU2CiAgICAvLyBzZWxmLnBlbmRpbmdfaGVhZDogVUludDY0ID0gVUludDY0KE5PX1BST0pFQ1QpCiAgICBieXRlYyAxNyAvLyAicGVuZGluZ19oZWFkIgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ1NwogICAgLy8gc2VsZi5wZW5kaW5nX3RhaWw6IFVJbnQ2NCA9IFVJbnQ2NChOT19QUk9KRUNUKQogICAgYnl0ZWMgMTggLy8gInBlbmRpbmdfdGFpbCIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NTktNDYyCiAgICAvLyAjIOKUgOKUgCBNYXJrZXRwbGFjZSBsaXN0aW5nIHN0b3JhZ2U6IG9uZSBib3ggcGVyIGxpc3Rpbmcg4pSA4pSACiAgICAvLyAjIGxpc3RpbmdfY291bnQgaXMgdGhlIG5leHQgbGlzdGluZyBpZDsgaWRzIGFyZSBuZXZlciByZXVzZWQsIHNvIGEKICAgIC8vICMgY2xvc2VkIGxpc3RpbmcgcmVsZWFzZXMgYWxsIG9mIGl0cyBib3ggTUJSLgogICAgLy8gc2VsZi5saXN0aW5nX2NvdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDE5IC8vICJsaXN0aW5nX2NvdW50IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDY0LTQ2NQogICAgLy8gIyBIZWFkIG9mIHRoZSBwcmljZS1vcmRlcmVkIGFzayBpbmRleCAoY2hlYXBlc3QsIG9sZGVzdCBsaXN0aW5nKQogICAgLy8gc2VsZi5iZXN0X2Fza19pZDogVUludDY0ID0gVUludDY0KE5PX0xJU1RJTkcpCiAgICBieXRlYyA1IC8vICJiZXN0X2Fza19pZCIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NjctNDY4CiAgICAvLyAjIOKUgOKUgCBTdGFuZGluZyBiaWRzOiBvbmUgYm94IHBlciBvcGVuIGJpZCDilIDilIAKICAgIC8vIHNlbGYuYmlkX2NvdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDIzIC8vICJiaWRfY291bnQiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NzAtNDcxCiAgICAvLyAjIEhlYWQgb2YgdGhlIHByaWNlLW9yZGVyZWQgYmlkIGluZGV4IChoaWdoZXN0LCBvbGRlc3QgYmlkKQogICAgLy8gc2VsZi5iZXN0X2JpZF9pZDogVUludDY0ID0gVUludDY0KE5PX0JJRCkKICAgIGJ5dGVjIDYgLy8gImJlc3RfYmlkX2lkIgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ3Ni00NzcKICAgIC8vICMg4pSA4pSAIE1hcmtldCBzdGF0aXN0aWNzLCB1cGRhdGVkIGJ5IGV2ZXJ5IGZpbGwg4pSA4pSACiAgICAvLyBzZWxmLnRyYWRlX3ZvbHVtZTogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyA5IC8vICJ0cmFkZV92b2x1bWUiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0NzgKICAgIC8vIHNlbGYudHJhZGVfbm90aW9uYWw6IFVJbnQ2NCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgMTIgLy8gInRyYWRlX25vdGlvbmFsIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDc5CiAgICAvLyBzZWxmLnRyYWRlX2NvdW50OiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDIwIC8vICJ0cmFkZV9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4MAogICAgLy8gc2VsZi5sYXN0X3ByaWNlOiBVSW50NjQgPSBVSW50NjQoMCkKICAgIGJ5dGVjIDI0IC8vICJsYXN0X3ByaWNlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDgxCiAgICAvLyBzZWxmLmxhc3RfdHJhZGVfdGltZTogVUludDY0ID0gVUludDY0KDApCiAgICBieXRlYyAyNSAvLyAibGFzdF90cmFkZV90aW1lIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDgyCiAgICAvLyBzZWxmLmN1cnJlbnRfd2luZG93ID0gVHJhZGVXaW5kb3cuZnJvbV9ieXRlcyhvcC5iemVybyg1ICogOCkpCiAgICBieXRlYyAyNiAvLyAiY3VycmVudF93aW5kb3ciCiAgICBkaWcgMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0ODMKICAgIC8vIHNlbGYucHJldmlvdXNfd2luZG93ID0gVHJhZGVXaW5kb3cuZnJvbV9ieXRlcyhvcC5iemVybyg1ICogOCkpCiAgICBieXRlYyAyNyAvLyAicHJldmlvdXNfd2luZG93IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQxNwogICAgLy8gY2xhc3MgQWFybmFSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYnogbWFpbl9jcmVhdGVfTm9PcEA0OAogICAgcHVzaGJ5dGVzcyAweGYxMjZkMDRiIDB4ZDM0OGZiYjMgMHgwOGZiN2I3YyAweDgyMGQ2OGExIDB4ZTFkNjUzZjggMHg1NDU2OTcwZCAweDY2NDVmMmY5IDB4MjE5Nzk5NDMgMHg2MjYyOTA2NSAweDk2ZTVlMjlmIDB4YzJjMDc4NTAgMHgwOTI2NTQyNCAweGQ4OGE4ZjdiIDB4Zjg5OTZiZmMgMHg4ZDQ2N2ZkMyAweDYzZDU1YjZjIDB4NGE5ZTFkMDEgMHg1ODg4ODYwOSAweDNiY2IwZGJjIDB4ZjE1Nzc3MjYgMHgzMDVlNzViZCAweDViYTIyYTg0IDB4MzQ2YjNkYmMgMHhmMzhlNjk0MSAweDVmMWNkMmRjIDB4MTdmYjlhODUgMHhiZTk1ODc4NSAweDBhMWM2NTZlIDB4ZGE0NmJjNTYgMHhkZWJiYTdjNiAweGQ0NTdiZDIwIDB4NTVmMjJkNDEgMHg3NzZjNzRlMyAweDE4OGNmMGRjIDB4OWVjNTdmZmMgMHgyMmY5OGFiNiAweDUyNTY1M2VkIDB4MWRlYmE0ZTkgMHgzYjM3ZDRjMyAweGRhNWY3YjVhIDB4Zjk3ZmU3NmIgMHhkNThiMWE4OCAvLyBtZXRob2QgInNldF92YWxpZGF0b3IoYWRkcmVzcyl2b2lkIiwgbWV0aG9kICJ0cmFuc2Zlcl9hZG1pbihhZGRyZXNzKXZvaWQiLCBtZXRob2QgImVuc3VyZV90b2tlbigpdWludDY0IiwgbWV0aG9kICJzdWJtaXRfcHJvamVjdChzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcscGF5KXVpbnQ2NCIsIG1ldGhvZCAic3VibWl0X3Byb2plY3RzX2JhdGNoKChzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcpW10scGF5KXVpbnQ2NFtdIiwgbWV0aG9kICJjb21taXRfZXZpZGVuY2Vfcm9vdCh1aW50NjQsYnl0ZVszMl0sdWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJhcHByb3ZlX3Byb2plY3QodWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJyZWplY3RfcHJvamVjdCh1aW50NjQpdm9pZCIsIG1ldGhvZCAiaXNzdWVfY3JlZGl0cyh1aW50NjQpdWludDY0IiwgbWV0aG9kICJhcHByb3ZlX3Byb2plY3RzX2JhdGNoKCh1aW50NjQsdWludDY0KVtdKXZvaWQiLCBtZXRob2QgInJlamVjdF9wcm9qZWN0c19iYXRjaCh1aW50NjRbXSl2b2lkIiwgbWV0aG9kICJpc3N1ZV9jcmVkaXRzX2JhdGNoKHVpbnQ2NFtdKXVpbnQ2NCIsIG1ldGhvZCAibGlzdF9mb3Jfc2FsZSh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHBheSl1aW50NjQiLCBtZXRob2QgImJ1eV9saXN0aW5nKHVpbnQ2NCx1aW50NjQscGF5KXZvaWQiLCBtZXRob2QgIm1hcmtldF9idXkodWludDY0LHVpbnQ2NCx1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAiY2FuY2VsX2xpc3RpbmcodWludDY0KXZvaWQiLCBtZXRob2QgInN3ZWVwX2V4cGlyZWQodWludDY0W10pdWludDY0IiwgbWV0aG9kICJwbGFjZV9iaWQodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHBheSl1aW50NjQiLCBtZXRob2QgImNhbmNlbF9iaWQodWludDY0KXZvaWQiLCBtZXRob2QgImNsYWltKCl2b2lkIiwgbWV0aG9kICJnZXRfcHJvamVjdF9jb3VudCgpdWludDY0IiwgbWV0aG9kICJnZXRfYXNzZXRfaWQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2FkbWluKClhZGRyZXNzIiwgbWV0aG9kICJnZXRfdmFsaWRhdG9yKClhZGRyZXNzIiwgbWV0aG9kICJnZXRfdG90YWxfY3JlZGl0c19pc3N1ZWQoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X3N0YXR1c19jb3VudHMoKXVpbnQ2NFs1XSIsIG1ldGhvZCAiZ2V0X2Vjb3N5c3RlbV90b3RhbHMoc3RyaW5nKSh1aW50NjRbNV0sdWludDY0KSIsIG1ldGhvZCAiZ2V0X3Byb2plY3QodWludDY0KShhZGRyZXNzLHN0cmluZyxzdHJpbmcsc3RyaW5nLHN0cmluZyx1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X3Byb2plY3RzX3BhZ2UodWludDY0LHVpbnQ2NCkoYWRkcmVzcyxzdHJpbmcsc3RyaW5nLHN0cmluZyxzdHJpbmcsdWludDY0LHVpbnQ2NClbXSIsIG1ldGhvZCAiZ2V0X3BlbmRpbmcodWludDY0LHVpbnQ2NCl1aW50NjRbXSIsIG1ldGhvZCAiZ2V0X2FjY291bnRfcHJvamVjdHMoYWRkcmVzcyx1aW50NjQsdWludDY0KXVpbnQ2NFtdIiwgbWV0aG9kICJnZXRfYWNjb3VudF9saXN0aW5ncyhhZGRyZXNzLHVpbnQ2NCx1aW50NjQpdWludDY0W10iLCBtZXRob2QgImZpbmRfcHJvamVjdF9ieV9jaWQoc3RyaW5nKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2V2aWRlbmNlX3Jvb3QodWludDY0KShieXRlWzMyXSx1aW50NjQpIiwgbWV0aG9kICJ2ZXJpZnlfaW5jbHVzaW9uKHVpbnQ2NCxieXRlW10sYnl0ZVszMl1bXSlib29sIiwgbWV0aG9kICJnZXRfcHJvamVjdF9jaWQodWludDY0KXN0cmluZyIsIG1ldGhvZCAiZ2V0X21hcmtldF9zdGF0cygpKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LCh1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0KSwodWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCkpIiwgbWV0aG9kICJnZXRfbGlzdGluZ19jb3VudCgpdWludDY0IiwgbWV0aG9kICJnZXRfYmVzdF9hc2soKSh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9jbGFpbShhZGRyZXNzKSh1aW50NjQsdWludDY0KSIsIG1ldGhvZCAiZ2V0X2Jlc3RfYmlkKCkodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCkiLCBtZXRob2QgImdldF9hY3RpdmVfbGlzdGluZ3ModWludDY0LHVpbnQ2NCkodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpW10iCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBzZXRfdmFsaWRhdG9yIHRyYW5zZmVyX2FkbWluIGVuc3VyZV90b2tlbiBzdWJtaXRfcHJvamVjdCBzdWJtaXRfcHJvamVjdHNfYmF0Y2ggY29tbWl0X2V2aWRlbmNlX3Jvb3QgYXBwcm92ZV9wcm9qZWN0IHJlamVjdF9wcm9qZWN0IGlzc3VlX2NyZWRpdHMgYXBwcm92ZV9wcm9qZWN0c19iYXRjaCByZWplY3RfcHJvamVjdHNfYmF0Y2ggaXNzdWVfY3JlZGl0c19iYXRjaCBsaXN0X2Zvcl9zYWxlIGJ1eV9saXN0aW5nIG1hcmtldF9idXkgY2FuY2VsX2xpc3Rpbmcgc3dlZXBfZXhwaXJlZCBwbGFjZV9iaWQgY2FuY2VsX2JpZCBjbGFpbSBnZXRfcHJvamVjdF9jb3VudCBnZXRfYXNzZXRfaWQgZ2V0X2FkbWluIGdldF92YWxpZGF0b3IgZ2V0X3RvdGFsX2NyZWRpdHNfaXNzdWVkIGdldF9zdGF0dXNfY291bnRzIGdldF9lY29zeXN0ZW1fdG90YWxzIGdldF9wcm9qZWN0IGdldF9wcm9qZWN0c19wYWdlIGdldF9wZW5kaW5nIGdldF9hY2NvdW50X3Byb2plY3RzIGdldF9hY2NvdW50X2xpc3RpbmdzIGZpbmRfcHJvamVjdF9ieV9jaWQgZ2V0X2V2aWRlbmNlX3Jvb3QgdmVyaWZ5X2luY2x1c2lvbiBnZXRfcHJvamVjdF9jaWQgZ2V0X21hcmtldF9zdGF0cyBnZXRfbGlzdGluZ19jb3VudCBnZXRfYmVzdF9hc2sgZ2V0X2NsYWltIGdldF9iZXN0X2JpZCBnZXRfYWN0aXZlX2xpc3RpbmdzCiAgICBlcnIKCm1haW5fY3JlYXRlX05vT3BANDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NDE3CiAgICAvLyBjbGFzcyBBYXJuYVJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICBwdXNoYnl0ZXMgMHg4M2YxNDc0OCAvLyBtZXRob2QgImluaXQoKXZvaWQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBpbml0CiAgICBlcnIKCgovLyBfcHV5YV9saWIudXRpbC5lbnN1cmVfYnVkZ2V0KHJlcXVpcmVkX2J1ZGdldDogdWludDY0LCBmZWVfc291cmNlOiB1aW50NjQpIC0+IHZvaWQ6CmVuc3VyZV9idWRnZXQ6CiAgICBwcm90byAyIDAKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCAxMAogICAgKwoKZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMToKICAgIGR1cAogICAgZ2xvYmFsIE9wY29kZUJ1ZGdldAogICAgPgogICAgYnogZW5zdXJlX2J1ZGdldF9hZnRlcl93aGlsZUA2CiAgICBpdHhuX2JlZ2luCiAgICBwdXNoaW50IDYgLy8gYXBwbAogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgcHVzaGludCA1IC8vIERlbGV0ZUFwcGxpY2F0aW9uCiAgICBpdHhuX2ZpZWxkIE9uQ29tcGxldGlvbgogICAgYnl0ZWMgMzAgLy8gMHgwNjgxMDEKICAgIGl0eG5fZmllbGQgQXBwcm92YWxQcm9ncmFtCiAgICBieXRlYyAzMCAvLyAweDA2ODEwMQogICAgaXR4bl9maWVsZCBDbGVhclN0YXRlUHJvZ3JhbQogICAgZnJhbWVfZGlnIC0xCiAgICBzd2l0Y2ggZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8wQDMgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8xQDQKCmVuc3VyZV9idWRnZXRfc3dpdGNoX2Nhc2VfbmV4dEA1OgogICAgaXR4bl9zdWJtaXQKICAgIGIgZW5zdXJlX2J1ZGdldF93aGlsZV90b3BAMQoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8xQDQ6CiAgICBnbG9iYWwgTWluVHhuRmVlCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgYiBlbnN1cmVfYnVkZ2V0X3N3aXRjaF9jYXNlX25leHRANQoKZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV8wQDM6CiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGIgZW5zdXJlX2J1ZGdldF9zd2l0Y2hfY2FzZV9uZXh0QDUKCmVuc3VyZV9idWRnZXRfYWZ0ZXJfd2hpbGVANjoKICAgIHJldHN1YgoKCi8vIF9wdXlhX2xpYi5hcmM0LmR5bmFtaWNfYXJyYXlfcmVhZF9keW5hbWljX2VsZW1lbnQoYXJyYXk6IGJ5dGVzLCBpbmRleDogdWludDY0KSAtPiBieXRlczoKZHluYW1pY19hcnJheV9yZWFkX2R5bmFtaWNfZWxlbWVudDoKICAgIHByb3RvIDIgMQogICAgZnJhbWVfZGlnIC0yCiAgICBleHRyYWN0IDIgMAogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18zIC8vIDIKICAgICoKICAgIGRpZyAyCiAgICBzd2FwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDIKICAgIGxlbgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZHVwCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDUKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDE2CiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgLQogICAgc2VsZWN0CiAgICBzdWJzdHJpbmczCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5pbml0W3JvdXRpbmddKCkgLT4gdm9pZDoKaW5pdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo0OTIKICAgIC8vIHNlbGYuYWRtaW4gPSBUeG4uc2VuZGVyCiAgICBieXRlYyAxMSAvLyAiYWRtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjQ4OQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKGNyZWF0ZT0icmVxdWlyZSIpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuc2V0X3ZhbGlkYXRvcltyb3V0aW5nXSgpIC0+IHZvaWQ6CnNldF92YWxpZGF0b3I6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5NAogICAgLy8gc2VsZi5fb25seV9hZG1pbigpCiAgICBjYWxsc3ViIF9vbmx5X2FkbWluCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5NQogICAgLy8gc2VsZi52YWxpZGF0b3IgPSBhZGRyCiAgICBieXRlYyAxNSAvLyAidmFsaWRhdG9yIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjkxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS50cmFuc2Zlcl9hZG1pbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnRyYW5zZmVyX2FkbWluOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyOTcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIHB1c2hpbnQgMzIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuc3RhdGljX2FycmF5PGFyYzQudWludDgsIDMyPgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDAKICAgIC8vIHNlbGYuX29ubHlfYWRtaW4oKQogICAgY2FsbHN1YiBfb25seV9hZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDEKICAgIC8vIGFzc2VydCBuZXdfYWRtaW4gIT0gR2xvYmFsLnplcm9fYWRkcmVzcywgImludmFsaWQ6IHplcm8gYWRkcmVzcyIKICAgIGR1cAogICAgZ2xvYmFsIFplcm9BZGRyZXNzCiAgICAhPQogICAgYXNzZXJ0IC8vIGludmFsaWQ6IHplcm8gYWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMDIKICAgIC8vIHNlbGYuYWRtaW4gPSBuZXdfYWRtaW4KICAgIGJ5dGVjIDExIC8vICJhZG1pbiIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI5NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZW5zdXJlX3Rva2VuW3JvdXRpbmddKCkgLT4gdm9pZDoKZW5zdXJlX3Rva2VuOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTAKICAgIC8vIHNlbGYuX29ubHlfYWRtaW4oKQogICAgY2FsbHN1YiBfb25seV9hZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTEKICAgIC8vIGlmIG5vdCBzZWxmLmFhcm5hX2Fzc2V0OgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgYm56IGVuc3VyZV90b2tlbl9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzEyLTEzMjMKICAgIC8vIHJlc3VsdCA9IGl0eG4uQXNzZXRDb25maWcoCiAgICAvLyAgICAgdG90YWw9MTBfMDAwXzAwMCwKICAgIC8vICAgICBkZWNpbWFscz0wLAogICAgLy8gICAgIGRlZmF1bHRfZnJvemVuPUZhbHNlLAogICAgLy8gICAgIHVuaXRfbmFtZT0iQUFSTkEiLAogICAgLy8gICAgIGFzc2V0X25hbWU9IkFhcm5hIENhcmJvbiBDcmVkaXQiLAogICAgLy8gICAgIHVybD0iaHR0cHM6Ly9hYXJuYS5lY28iLAogICAgLy8gICAgIG1hbmFnZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICByZXNlcnZlPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyAgICAgY2xhd2JhY2s9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzE5CiAgICAvLyBtYW5hZ2VyPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMjAtMTMyMgogICAgLy8gcmVzZXJ2ZT1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gZnJlZXplPUdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsCiAgICAvLyBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZHVwbiAzCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0Q2xhd2JhY2sKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRGcmVlemUKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRSZXNlcnZlCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0TWFuYWdlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTgKICAgIC8vIHVybD0iaHR0cHM6Ly9hYXJuYS5lY28iLAogICAgcHVzaGJ5dGVzICJodHRwczovL2Fhcm5hLmVjbyIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXRVUkwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzE3CiAgICAvLyBhc3NldF9uYW1lPSJBYXJuYSBDYXJib24gQ3JlZGl0IiwKICAgIHB1c2hieXRlcyAiQWFybmEgQ2FyYm9uIENyZWRpdCIKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxNgogICAgLy8gdW5pdF9uYW1lPSJBQVJOQSIsCiAgICBwdXNoYnl0ZXMgIkFBUk5BIgogICAgaXR4bl9maWVsZCBDb25maWdBc3NldFVuaXROYW1lCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMxNQogICAgLy8gZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBDb25maWdBc3NldERlZmF1bHRGcm96ZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzE0CiAgICAvLyBkZWNpbWFscz0wLAogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgQ29uZmlnQXNzZXREZWNpbWFscwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTMKICAgIC8vIHRvdGFsPTEwXzAwMF8wMDAsCiAgICBwdXNoaW50IDEwMDAwMDAwCiAgICBpdHhuX2ZpZWxkIENvbmZpZ0Fzc2V0VG90YWwKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzEyCiAgICAvLyByZXN1bHQgPSBpdHhuLkFzc2V0Q29uZmlnKAogICAgcHVzaGludCAzIC8vIGFjZmcKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMTItMTMyMwogICAgLy8gcmVzdWx0ID0gaXR4bi5Bc3NldENvbmZpZygKICAgIC8vICAgICB0b3RhbD0xMF8wMDBfMDAwLAogICAgLy8gICAgIGRlY2ltYWxzPTAsCiAgICAvLyAgICAgZGVmYXVsdF9mcm96ZW49RmFsc2UsCiAgICAvLyAgICAgdW5pdF9uYW1lPSJBQVJOQSIsCiAgICAvLyAgICAgYXNzZXRfbmFtZT0iQWFybmEgQ2FyYm9uIENyZWRpdCIsCiAgICAvLyAgICAgdXJsPSJodHRwczovL2Fhcm5hLmVjbyIsCiAgICAvLyAgICAgbWFuYWdlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gICAgIHJlc2VydmU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBmcmVlemU9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBjbGF3YmFjaz1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzI0CiAgICAvLyBzZWxmLmFhcm5hX2Fzc2V0ID0gcmVzdWx0LmNyZWF0ZWRfYXNzZXQKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgaXR4biBDcmVhdGVkQXNzZXRJRAogICAgYXBwX2dsb2JhbF9wdXQKCmVuc3VyZV90b2tlbl9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMyNQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYuYWFybmFfYXNzZXQuaWQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTMwNAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuc3VibWl0X3Byb2plY3Rbcm91dGluZ10oKSAtPiB2b2lkOgpzdWJtaXRfcHJvamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzMxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBkaWcgMQogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50OD4KICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNDgKICAgIC8vIFNVQk1JVF9CVURHRVRfUEVSX1BST0pFQ1QgKyBTVUJNSVRfQlVER0VUX1BFUl9DSURfQ0hBUiAqIGNpZC5uYXRpdmUuYnl0ZXMubGVuZ3RoLAogICAgZGlnIDEKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIHB1c2hpbnQgNjAKICAgICoKICAgIHB1c2hpbnQgNTUwCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM0OQogICAgLy8gT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM0Ny0xMzUwCiAgICAvLyBlbnN1cmVfYnVkZ2V0KAogICAgLy8gICAgIFNVQk1JVF9CVURHRVRfUEVSX1BST0pFQ1QgKyBTVUJNSVRfQlVER0VUX1BFUl9DSURfQ0hBUiAqIGNpZC5uYXRpdmUuYnl0ZXMubGVuZ3RoLAogICAgLy8gICAgIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzUxCiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1MgogICAgLy8gcHJvamVjdF9pZCA9IHNlbGYuX2NyZWF0ZV9wcm9qZWN0KG5hbWUsIGxvY2F0aW9uLCBlY29zeXN0ZW0sIGNpZCkKICAgIGNvdmVyIDUKICAgIGNvdmVyIDUKICAgIGNhbGxzdWIgX2NyZWF0ZV9wcm9qZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM1MwogICAgLy8gc2VsZi5fY2hlY2tfbWJyX3BheW1lbnQobWJyX3BheW1lbnQsIG1icl9iZWZvcmUpCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIF9jaGVja19tYnJfcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTQKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChwcm9qZWN0X2lkKQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzMzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LnN1Ym1pdF9wcm9qZWN0c19iYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnN1Ym1pdF9wcm9qZWN0c19iYXRjaDoKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgc3dhcAogICAgZHVwCiAgICBsZW4KICAgIGNvdmVyIDIKICAgIGV4dHJhY3QgMiAwCiAgICBpbnRjXzAgLy8gMAoKc3VibWl0X3Byb2plY3RzX2JhdGNoX2Zvcl9oZWFkZXJAMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzU2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGR1cAogICAgZGlnIDUKICAgIDwKICAgIGJ6IHN1Ym1pdF9wcm9qZWN0c19iYXRjaF9hZnRlcl9mb3JANAogICAgZHVwCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgZGlnIDIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBlbmNvZGluZwogICAgZHVwCiAgICB1bmNvdmVyIDUKICAgIGR1cAogICAgY292ZXIgNAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIHRhaWwgcG9pbnRlciBmb3IgKGxlbisoKGxlbit1dGY4W10pLChsZW4rdXRmOFtdKSwobGVuK3V0ZjhbXSksKGxlbit1dGY4W10pKVtdKQogICAgZGlnIDEKICAgIGxlbgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICBsZW4KICAgIGRpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgdHVwbGUgZW5jb2RpbmcKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCB0YWlsIHBvaW50ZXIgYXQgaW5kZXggMCBvZiAoKGxlbit1dGY4W10pLChsZW4rdXRmOFtdKSwobGVuK3V0ZjhbXSksKGxlbit1dGY4W10pKQogICAgZGlnIDIKICAgIHN3YXAKICAgIGRpZyAyCiAgICBzdWJzdHJpbmczCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCAxMAogICAgKwogICAgZGlnIDIKICAgIGludGNfMyAvLyAyCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCB0dXBsZSBlbmNvZGluZwogICAgZHVwCiAgICBkaWcgMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIHRhaWwgcG9pbnRlciBhdCBpbmRleCAxIG9mICgobGVuK3V0ZjhbXSksKGxlbit1dGY4W10pLChsZW4rdXRmOFtdKSwobGVuK3V0ZjhbXSkpCiAgICBkaWcgMwogICAgc3dhcAogICAgZGlnIDMKICAgIHN1YnN0cmluZzMKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgKwogICAgZGlnIDIKICAgIHB1c2hpbnQgNAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgdHVwbGUgZW5jb2RpbmcKICAgIGR1cAogICAgZGlnIDIKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCB0YWlsIHBvaW50ZXIgYXQgaW5kZXggMiBvZiAoKGxlbit1dGY4W10pLChsZW4rdXRmOFtdKSwobGVuK3V0ZjhbXSksKGxlbit1dGY4W10pKQogICAgZGlnIDMKICAgIHN3YXAKICAgIGRpZyAzCiAgICBzdWJzdHJpbmczCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgICsKICAgIGRpZyAyCiAgICBwdXNoaW50IDYKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIHR1cGxlIGVuY29kaW5nCiAgICBkdXAKICAgIGRpZyAyCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgdGFpbCBwb2ludGVyIGF0IGluZGV4IDMgb2YgKChsZW4rdXRmOFtdKSwobGVuK3V0ZjhbXSksKGxlbit1dGY4W10pLChsZW4rdXRmOFtdKSkKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgdW5jb3ZlciAzCiAgICBzdWJzdHJpbmczCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgaW50Y18zIC8vIDIKICAgICsKICAgICsKICAgICsKICAgIGNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIHN1Ym1pdF9wcm9qZWN0c19iYXRjaF9mb3JfaGVhZGVyQDEKCnN1Ym1pdF9wcm9qZWN0c19iYXRjaF9hZnRlcl9mb3JANDoKICAgIHBvcG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNTYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18zIC8vIDIKICAgICsKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuUHJvamVjdFN1Ym1pc3Npb24+CiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgYnVyeSA0CiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzMKICAgIC8vIGFzc2VydCBzdWJtaXNzaW9ucy5sZW5ndGggPD0gTUFYX1NVQk1JVF9CQVRDSCwgImJhdGNoIHRvbyBsYXJnZSIKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gYmF0Y2ggdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3NAogICAgLy8gY2lkX2NoYXJzID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzUKICAgIC8vIGZvciBpIGluIHVyYW5nZShzdWJtaXNzaW9ucy5sZW5ndGgpOgogICAgZHVwCiAgICBidXJ5IDUKCnN1Ym1pdF9wcm9qZWN0c19iYXRjaF9mb3JfaGVhZGVyQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3NQogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHN1Ym1pc3Npb25zLmxlbmd0aCk6CiAgICBkaWcgNAogICAgZGlnIDIKICAgIDwKICAgIGJ6IHN1Ym1pdF9wcm9qZWN0c19iYXRjaF9hZnRlcl9mb3JAOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzYKICAgIC8vIGNpZF9jaGFycyArPSBzdWJtaXNzaW9uc1tpXS5jaWQubmF0aXZlLmJ5dGVzLmxlbmd0aAogICAgZGlnIDIKICAgIGRpZyA1CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9yZWFkX2R5bmFtaWNfZWxlbWVudAogICAgZHVwCiAgICBwdXNoaW50IDYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBzdWJzdHJpbmczCiAgICBleHRyYWN0IDIgMAogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzc1CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc3VibWlzc2lvbnMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBidXJ5IDUKICAgIGIgc3VibWl0X3Byb2plY3RzX2JhdGNoX2Zvcl9oZWFkZXJANgoKc3VibWl0X3Byb2plY3RzX2JhdGNoX2FmdGVyX2ZvckA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzgKICAgIC8vIFNVQk1JVF9CVURHRVRfUEVSX1BST0pFQ1QgKiBzdWJtaXNzaW9ucy5sZW5ndGgKICAgIHB1c2hpbnQgNTUwCiAgICBkaWcgMgogICAgZHVwCiAgICBjb3ZlciAyCiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM3OQogICAgLy8gKyBTVUJNSVRfQlVER0VUX1BFUl9DSURfQ0hBUiAqIGNpZF9jaGFycywKICAgIHB1c2hpbnQgNjAKICAgIHVuY292ZXIgMwogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzNzgtMTM3OQogICAgLy8gU1VCTUlUX0JVREdFVF9QRVJfUFJPSkVDVCAqIHN1Ym1pc3Npb25zLmxlbmd0aAogICAgLy8gKyBTVUJNSVRfQlVER0VUX1BFUl9DSURfQ0hBUiAqIGNpZF9jaGFycywKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzgwCiAgICAvLyBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzc3LTEzODEKICAgIC8vIGVuc3VyZV9idWRnZXQoCiAgICAvLyAgICAgU1VCTUlUX0JVREdFVF9QRVJfUFJPSkVDVCAqIHN1Ym1pc3Npb25zLmxlbmd0aAogICAgLy8gICAgICsgU1VCTUlUX0JVREdFVF9QRVJfQ0lEX0NIQVIgKiBjaWRfY2hhcnMsCiAgICAvLyAgICAgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIC8vICkKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODIKICAgIC8vIG1icl9iZWZvcmUgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBjb3ZlciA0CiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzgzCiAgICAvLyBpZHMgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgYnl0ZWMgMjEgLy8gMHgwMDAwCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4NC0xMzg1CiAgICAvLyAjIFRoZSByZXR1cm4gdmFsdWU6IDQtYnl0ZSBwcmVmaXgsIDItYnl0ZSBsZW5ndGgsIDggYnl0ZXMgcGVyIGlkCiAgICAvLyBsb2dfYnl0ZXMgPSBVSW50NjQoNikgKyBzdWJtaXNzaW9ucy5sZW5ndGggKiA4CiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgcHVzaGludCA2CiAgICArCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4NgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHN1Ym1pc3Npb25zLmxlbmd0aCk6CiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA3CgpzdWJtaXRfcHJvamVjdHNfYmF0Y2hfZm9yX2hlYWRlckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzg2CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2Uoc3VibWlzc2lvbnMubGVuZ3RoKToKICAgIGRpZyA2CiAgICBkaWcgMQogICAgPAogICAgYnogc3VibWl0X3Byb2plY3RzX2JhdGNoX2FmdGVyX2ZvckAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODctMTM4OAogICAgLy8gc3VibWlzc2lvbiA9IHN1Ym1pc3Npb25zW2ldLmNvcHkoKQogICAgLy8gbG9nX2J5dGVzICs9IFNVQk1JVF9FVkVOVF9CWVRFUyArIHN1Ym1pc3Npb24uY2lkLm5hdGl2ZS5ieXRlcy5sZW5ndGgKICAgIGRpZyAyCiAgICBkdXAKICAgIGRpZyA4CiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9yZWFkX2R5bmFtaWNfZWxlbWVudAogICAgZHVwCiAgICBwdXNoaW50IDYKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgbGVuCiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4OAogICAgLy8gbG9nX2J5dGVzICs9IFNVQk1JVF9FVkVOVF9CWVRFUyArIHN1Ym1pc3Npb24uY2lkLm5hdGl2ZS5ieXRlcy5sZW5ndGgKICAgIGR1cAogICAgZXh0cmFjdCAyIDAKICAgIGxlbgogICAgcHVzaGludCA0OAogICAgKwogICAgdW5jb3ZlciA1CiAgICArCiAgICBkdXAKICAgIGNvdmVyIDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzg5CiAgICAvLyBhc3NlcnQgbG9nX2J5dGVzIDw9IE1BWF9MT0dfQllURVMsICJiYXRjaCBldmVudHMgZXhjZWVkIGxvZyBsaW1pdCIKICAgIHB1c2hpbnQgMTAyNAogICAgPD0KICAgIGFzc2VydCAvLyBiYXRjaCBldmVudHMgZXhjZWVkIGxvZyBsaW1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTEKICAgIC8vIHN1Ym1pc3Npb24ubmFtZSwKICAgIGRpZyAxCiAgICBkaWcgMwogICAgY2FsbHN1YiBkeW5hbWljX2FycmF5X3JlYWRfZHluYW1pY19lbGVtZW50CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIGludGNfMyAvLyAyCiAgICBleHRyYWN0X3VpbnQxNgogICAgc3Vic3RyaW5nMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTIKICAgIC8vIHN1Ym1pc3Npb24ubG9jYXRpb24sCiAgICBkaWcgMgogICAgZGlnIDQKICAgIGNhbGxzdWIgZHluYW1pY19hcnJheV9yZWFkX2R5bmFtaWNfZWxlbWVudAogICAgZHVwCiAgICBpbnRjXzMgLy8gMgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyAxCiAgICBwdXNoaW50IDQKICAgIGV4dHJhY3RfdWludDE2CiAgICBzdWJzdHJpbmczCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTM5MwogICAgLy8gc3VibWlzc2lvbi5lY29zeXN0ZW0sCiAgICB1bmNvdmVyIDMKICAgIGRpZyA0CiAgICBjYWxsc3ViIGR5bmFtaWNfYXJyYXlfcmVhZF9keW5hbWljX2VsZW1lbnQKICAgIGR1cAogICAgcHVzaGludCA0CiAgICBleHRyYWN0X3VpbnQxNgogICAgZGlnIDEKICAgIHB1c2hpbnQgNgogICAgZXh0cmFjdF91aW50MTYKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzkwLTEzOTUKICAgIC8vIHByb2plY3RfaWQgPSBzZWxmLl9jcmVhdGVfcHJvamVjdCgKICAgIC8vICAgICBzdWJtaXNzaW9uLm5hbWUsCiAgICAvLyAgICAgc3VibWlzc2lvbi5sb2NhdGlvbiwKICAgIC8vICAgICBzdWJtaXNzaW9uLmVjb3N5c3RlbSwKICAgIC8vICAgICBzdWJtaXNzaW9uLmNpZCwKICAgIC8vICkKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBfY3JlYXRlX3Byb2plY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzk2CiAgICAvLyBpZHMuYXBwZW5kKGFyYzQuVUludDY0KHByb2plY3RfaWQpKQogICAgaXRvYgogICAgdW5jb3ZlciA1CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTYKICAgIC8vIGlkcy5hcHBlbmQoYXJjNC5VSW50NjQocHJvamVjdF9pZCkpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDAKICAgIHJlcGxhY2UyIDAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzODYKICAgIC8vIGZvciBpIGluIHVyYW5nZShzdWJtaXNzaW9ucy5sZW5ndGgpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ1cnkgNwogICAgYiBzdWJtaXRfcHJvamVjdHNfYmF0Y2hfZm9yX2hlYWRlckAxMAoKc3VibWl0X3Byb2plY3RzX2JhdGNoX2FmdGVyX2ZvckAxMzoKICAgIHBvcG4gMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOTcKICAgIC8vIHNlbGYuX2NoZWNrX21icl9wYXltZW50KG1icl9wYXltZW50LCBtYnJfYmVmb3JlKQogICAgZGlnIDIKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfY2hlY2tfbWJyX3BheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMzU2CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5jb21taXRfZXZpZGVuY2Vfcm9vdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmNvbW1pdF9ldmlkZW5jZV9yb290OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MDAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgZHVwCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5zdGF0aWNfYXJyYXk8YXJjNC51aW50OCwgMzI+CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBkdXAKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTMKICAgIC8vIHByb2plY3QgPSBzZWxmLl9sb2FkX3Byb2plY3QocHJvamVjdF9pZCkKICAgIGRpZyA0CiAgICBjYWxsc3ViIF9sb2FkX3Byb2plY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDE0CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBwcm9qZWN0LnN1Ym1pdHRlci5uYXRpdmUsICJvbmx5IHN1Ym1pdHRlciBjYW4gY29tbWl0IgogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGV4dHJhY3QgMCAzMgogICAgPT0KICAgIGFzc2VydCAvLyBvbmx5IHN1Ym1pdHRlciBjYW4gY29tbWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxNQogICAgLy8gYXNzZXJ0IHByb2plY3Quc3RhdGUubmF0aXZlID4+IFNUQVRVU19TSElGVCA9PSBTVEFUVVNfUEVORElORywgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgcHVzaGludCA1NgogICAgc2hyCiAgICBpbnRjXzEgLy8gMQogICAgPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCBwZW5kaW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQxNgogICAgLy8gYXNzZXJ0IHByb2plY3RfaWQgbm90IGluIHNlbGYuZXZpZGVuY2Vfcm9vdHMsICJldmlkZW5jZSByb290IGFscmVhZHkgY29tbWl0dGVkIgogICAgdW5jb3ZlciA0CiAgICBpdG9iCiAgICBieXRlYyAyOCAvLyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAhCiAgICBhc3NlcnQgLy8gZXZpZGVuY2Ugcm9vdCBhbHJlYWR5IGNvbW1pdHRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MTcKICAgIC8vIGFzc2VydCBsZWFmX2NvdW50ID4gVUludDY0KDApLCAibGVhZiBjb3VudCBtdXN0IGJlID4gMCIKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGxlYWYgY291bnQgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDE5CiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyMC0xNDIyCiAgICAvLyBzZWxmLmV2aWRlbmNlX3Jvb3RzW3Byb2plY3RfaWRdID0gRXZpZGVuY2VSb290KAogICAgLy8gICAgIHJvb3Q9cm9vdC5jb3B5KCksIGxlYWZfY291bnQ9YXJjNC5VSW50NjQobGVhZl9jb3VudCkKICAgIC8vICkKICAgIGRpZyA0CiAgICBkaWcgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDIzCiAgICAvLyBzZWxmLl9jaGVja19tYnJfcGF5bWVudChtYnJfcGF5bWVudCwgbWJyX2JlZm9yZSkKICAgIGNhbGxzdWIgX2NoZWNrX21icl9wYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyNS0xNDI5CiAgICAvLyBFdmlkZW5jZUNvbW1pdHRlZCgKICAgIC8vICAgICBwcm9qZWN0X2lkPWFyYzQuVUludDY0KHByb2plY3RfaWQpLAogICAgLy8gICAgIHJvb3Q9cm9vdC5jb3B5KCksCiAgICAvLyAgICAgbGVhZl9jb3VudD1hcmM0LlVJbnQ2NChsZWFmX2NvdW50KSwKICAgIC8vICkKICAgIGNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQyNC0xNDMwCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgRXZpZGVuY2VDb21taXR0ZWQoCiAgICAvLyAgICAgICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQocHJvamVjdF9pZCksCiAgICAvLyAgICAgICAgIHJvb3Q9cm9vdC5jb3B5KCksCiAgICAvLyAgICAgICAgIGxlYWZfY291bnQ9YXJjNC5VSW50NjQobGVhZl9jb3VudCksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZTNjNGE5ZDEgLy8gbWV0aG9kICJFdmlkZW5jZUNvbW1pdHRlZCh1aW50NjQsYnl0ZVszMl0sdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQwMAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuYXBwcm92ZV9wcm9qZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV9wcm9qZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDUKICAgIC8vIHNlbGYuX29ubHlfdmFsaWRhdG9yKCkKICAgIGNhbGxzdWIgX29ubHlfdmFsaWRhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0NgogICAgLy8gc2VsZi5fYXBwcm92ZShwcm9qZWN0X2lkLCBjcmVkaXRzKQogICAgY2FsbHN1YiBfYXBwcm92ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MzYKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LnJlamVjdF9wcm9qZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKcmVqZWN0X3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1NwogICAgLy8gc2VsZi5fb25seV92YWxpZGF0b3IoKQogICAgY2FsbHN1YiBfb25seV92YWxpZGF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDU4CiAgICAvLyBzZWxmLl9yZWplY3QocHJvamVjdF9pZCkKICAgIGNhbGxzdWIgX3JlamVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NDgKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Lmlzc3VlX2NyZWRpdHNbcm91dGluZ10oKSAtPiB2b2lkOgppc3N1ZV9jcmVkaXRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NjYKICAgIC8vIHNlbGYuX29ubHlfdmFsaWRhdG9yKCkKICAgIGNhbGxzdWIgX29ubHlfdmFsaWRhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ2NwogICAgLy8gYXNzZXJ0IHNlbGYuYWFybmFfYXNzZXQsICJubyBBQVJOQSB0b2tlbiBjcmVhdGVkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgYXNzZXJ0IC8vIG5vIEFBUk5BIHRva2VuIGNyZWF0ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDY5CiAgICAvLyBzdWJtaXR0ZXIsIGNyZWRpdHMgPSBzZWxmLl9tYXJrX2lzc3VlZChwcm9qZWN0X2lkKQogICAgY2FsbHN1YiBfbWFya19pc3N1ZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDcwLTE0NzQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9c3VibWl0dGVyLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1jcmVkaXRzLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NzEKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDcwCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NzAtMTQ3NAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1zdWJtaXR0ZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWNyZWRpdHMsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NzUKICAgIC8vIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgKz0gY3JlZGl0cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDggLy8gInRvdGFsX2NyZWRpdHNfaXNzdWVkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRvdGFsX2NyZWRpdHNfaXNzdWVkIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIGJ5dGVjIDggLy8gInRvdGFsX2NyZWRpdHNfaXNzdWVkIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDc2CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoY3JlZGl0cykKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDYwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5hcHByb3ZlX3Byb2plY3RzX2JhdGNoW3JvdXRpbmddKCkgLT4gdm9pZDoKYXBwcm92ZV9wcm9qZWN0c19iYXRjaDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDgwCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBwdXNoaW50IDE2CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuUHJvamVjdEFwcHJvdmFsPgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTEKICAgIC8vIHNlbGYuX29ubHlfdmFsaWRhdG9yKCkKICAgIGNhbGxzdWIgX29ubHlfdmFsaWRhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5MgogICAgLy8gYXNzZXJ0IGFwcHJvdmFscy5sZW5ndGggPD0gTUFYX0FQUFJPVkVfQkFUQ0gsICJiYXRjaCB0b28gbGFyZ2UiCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gYmF0Y2ggdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5NAogICAgLy8gVUludDY0KFJFVklFV19CVURHRVRfUEVSX1BST0pFQ1QpICogYXBwcm92YWxzLmxlbmd0aCwKICAgIGludGMgNiAvLyAzMDAKICAgICoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDk1CiAgICAvLyBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDkzLTE0OTYKICAgIC8vIGVuc3VyZV9idWRnZXQoCiAgICAvLyAgICAgVUludDY0KFJFVklFV19CVURHRVRfUEVSX1BST0pFQ1QpICogYXBwcm92YWxzLmxlbmd0aCwKICAgIC8vICAgICBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5NwogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGFwcHJvdmFscy5sZW5ndGgpOgogICAgaW50Y18wIC8vIDAKCmFwcHJvdmVfcHJvamVjdHNfYmF0Y2hfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTcKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcHByb3ZhbHMubGVuZ3RoKToKICAgIGR1cAogICAgZGlnIDIKICAgIDwKICAgIGJ6IGFwcHJvdmVfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfZm9yQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDk4LTE0OTkKICAgIC8vIGFwcHJvdmFsID0gYXBwcm92YWxzW2ldLmNvcHkoKQogICAgLy8gc2VsZi5fYXBwcm92ZShhcHByb3ZhbC5wcm9qZWN0X2lkLm5hdGl2ZSwgYXBwcm92YWwuY3JlZGl0cy5uYXRpdmUpCiAgICBkaWcgMgogICAgZXh0cmFjdCAyIDAKICAgIGRpZyAxCiAgICBwdXNoaW50IDE2CiAgICAqCiAgICBwdXNoaW50IDE2CiAgICBleHRyYWN0MyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNDk5CiAgICAvLyBzZWxmLl9hcHByb3ZlKGFwcHJvdmFsLnByb2plY3RfaWQubmF0aXZlLCBhcHByb3ZhbC5jcmVkaXRzLm5hdGl2ZSkKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTgtMTQ5OQogICAgLy8gYXBwcm92YWwgPSBhcHByb3ZhbHNbaV0uY29weSgpCiAgICAvLyBzZWxmLl9hcHByb3ZlKGFwcHJvdmFsLnByb2plY3RfaWQubmF0aXZlLCBhcHByb3ZhbC5jcmVkaXRzLm5hdGl2ZSkKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5OQogICAgLy8gc2VsZi5fYXBwcm92ZShhcHByb3ZhbC5wcm9qZWN0X2lkLm5hdGl2ZSwgYXBwcm92YWwuY3JlZGl0cy5uYXRpdmUpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTgtMTQ5OQogICAgLy8gYXBwcm92YWwgPSBhcHByb3ZhbHNbaV0uY29weSgpCiAgICAvLyBzZWxmLl9hcHByb3ZlKGFwcHJvdmFsLnByb2plY3RfaWQubmF0aXZlLCBhcHByb3ZhbC5jcmVkaXRzLm5hdGl2ZSkKICAgIGludGNfMiAvLyA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ5OQogICAgLy8gc2VsZi5fYXBwcm92ZShhcHByb3ZhbC5wcm9qZWN0X2lkLm5hdGl2ZSwgYXBwcm92YWwuY3JlZGl0cy5uYXRpdmUpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgY2FsbHN1YiBfYXBwcm92ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0OTcKICAgIC8vIGZvciBpIGluIHVyYW5nZShhcHByb3ZhbHMubGVuZ3RoKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBiIGFwcHJvdmVfcHJvamVjdHNfYmF0Y2hfZm9yX2hlYWRlckAyCgphcHByb3ZlX3Byb2plY3RzX2JhdGNoX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0ODAKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LnJlamVjdF9wcm9qZWN0c19iYXRjaFtyb3V0aW5nXSgpIC0+IHZvaWQ6CnJlamVjdF9wcm9qZWN0c19iYXRjaDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTAxCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cG4gMgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDE2IC8vIG9uIGVycm9yOiBpbnZhbGlkIGFycmF5IGxlbmd0aCBoZWFkZXIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18zIC8vIDIKICAgICsKICAgIHVuY292ZXIgMgogICAgbGVuCiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LmR5bmFtaWNfYXJyYXk8YXJjNC51aW50NjQ+CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxMAogICAgLy8gc2VsZi5fb25seV92YWxpZGF0b3IoKQogICAgY2FsbHN1YiBfb25seV92YWxpZGF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTExCiAgICAvLyBhc3NlcnQgcHJvamVjdF9pZHMubGVuZ3RoIDw9IE1BWF9SRUpFQ1RfQkFUQ0gsICJiYXRjaCB0b28gbGFyZ2UiCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIDw9CiAgICBhc3NlcnQgLy8gYmF0Y2ggdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxMwogICAgLy8gVUludDY0KFJFVklFV19CVURHRVRfUEVSX1BST0pFQ1QpICogcHJvamVjdF9pZHMubGVuZ3RoLAogICAgaW50YyA2IC8vIDMwMAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MTQKICAgIC8vIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MTItMTUxNQogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBVSW50NjQoUkVWSUVXX0JVREdFVF9QRVJfUFJPSkVDVCkgKiBwcm9qZWN0X2lkcy5sZW5ndGgsCiAgICAvLyAgICAgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdCwKICAgIC8vICkKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgaW50Y18wIC8vIDAKCnJlamVjdF9wcm9qZWN0c19iYXRjaF9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxNgogICAgLy8gZm9yIHByb2plY3RfaWQgaW4gcHJvamVjdF9pZHM6CiAgICBkdXAKICAgIGRpZyAyCiAgICA8CiAgICBieiByZWplY3RfcHJvamVjdHNfYmF0Y2hfYWZ0ZXJfZm9yQDUKICAgIGRpZyAyCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxNwogICAgLy8gc2VsZi5fcmVqZWN0KHByb2plY3RfaWQubmF0aXZlKQogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX3JlamVjdAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGIgcmVqZWN0X3Byb2plY3RzX2JhdGNoX2Zvcl9oZWFkZXJAMgoKcmVqZWN0X3Byb2plY3RzX2JhdGNoX2FmdGVyX2ZvckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MDEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Lmlzc3VlX2NyZWRpdHNfYmF0Y2hbcm91dGluZ10oKSAtPiB2b2lkOgppc3N1ZV9jcmVkaXRzX2JhdGNoOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgdW5jb3ZlciAyCiAgICBsZW4KICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQuZHluYW1pY19hcnJheTxhcmM0LnVpbnQ2ND4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTMzCiAgICAvLyBzZWxmLl9vbmx5X3ZhbGlkYXRvcigpCiAgICBjYWxsc3ViIF9vbmx5X3ZhbGlkYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MzQKICAgIC8vIGFzc2VydCBzZWxmLmFhcm5hX2Fzc2V0LCAibm8gQUFSTkEgdG9rZW4gY3JlYXRlZCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGFzc2VydCAvLyBubyBBQVJOQSB0b2tlbiBjcmVhdGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUzNQogICAgLy8gYXNzZXJ0IHByb2plY3RfaWRzLmxlbmd0aCA8PSBNQVhfSVNTVUVfQkFUQ0gsICJiYXRjaCB0b28gbGFyZ2UiCiAgICBkdXAKICAgIHB1c2hpbnQgMTkKICAgIDw9CiAgICBhc3NlcnQgLy8gYmF0Y2ggdG9vIGxhcmdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUzNwogICAgLy8gVUludDY0KElTU1VFX0JVREdFVF9QRVJfUFJPSkVDVCkgKiBwcm9qZWN0X2lkcy5sZW5ndGgsCiAgICBwdXNoaW50IDIwMAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MzgKICAgIC8vIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1MzYtMTUzOQogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBVSW50NjQoSVNTVUVfQlVER0VUX1BFUl9QUk9KRUNUKSAqIHByb2plY3RfaWRzLmxlbmd0aCwKICAgIC8vICAgICBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU0MQogICAgLy8gaXNzdWVkID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NDIKICAgIC8vIGdyb3VwX3NpemUgPSBVSW50NjQoMCkKICAgIGR1cAogICAgY292ZXIgMwogICAgaW50Y18wIC8vIDAKCmlzc3VlX2NyZWRpdHNfYmF0Y2hfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NDMKICAgIC8vIGZvciBwcm9qZWN0X2lkIGluIHByb2plY3RfaWRzOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogaXNzdWVfY3JlZGl0c19iYXRjaF9hZnRlcl9mb3JAMTAKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU0NAogICAgLy8gc3VibWl0dGVyLCBjcmVkaXRzID0gc2VsZi5fbWFya19pc3N1ZWQocHJvamVjdF9pZC5uYXRpdmUpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgY2FsbHN1YiBfbWFya19pc3N1ZWQKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTQ1CiAgICAvLyBpZiBncm91cF9zaXplID09IDA6CiAgICBkaWcgNgogICAgYm56IGlzc3VlX2NyZWRpdHNfYmF0Y2hfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTQ2CiAgICAvLyBvcC5JVHhuQ3JlYXRlLmJlZ2luKCkKICAgIGl0eG5fYmVnaW4KCmlzc3VlX2NyZWRpdHNfYmF0Y2hfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NDkKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X3R5cGVfZW51bShUcmFuc2FjdGlvblR5cGUuQXNzZXRUcmFuc2ZlcikKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NTAKICAgIC8vIG9wLklUeG5DcmVhdGUuc2V0X2ZlZSgwKQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1MQogICAgLy8gb3AuSVR4bkNyZWF0ZS5zZXRfeGZlcl9hc3NldChzZWxmLmFhcm5hX2Fzc2V0KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTUyCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9yZWNlaXZlcihzdWJtaXR0ZXIpCiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTUzCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnNldF9hc3NldF9hbW91bnQoY3JlZGl0cykKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1NAogICAgLy8gZ3JvdXBfc2l6ZSArPSAxCiAgICBkaWcgNQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGR1cAogICAgYnVyeSA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1NQogICAgLy8gaWYgZ3JvdXBfc2l6ZSA9PSBNQVhfSU5ORVJfR1JPVVBfU0laRToKICAgIHB1c2hpbnQgMTYKICAgID09CiAgICBieiBpc3N1ZV9jcmVkaXRzX2JhdGNoX2FmdGVyX2lmX2Vsc2VAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NTYKICAgIC8vIG9wLklUeG5DcmVhdGUuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1NwogICAgLy8gZ3JvdXBfc2l6ZSA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgNgoKaXNzdWVfY3JlZGl0c19iYXRjaF9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1OAogICAgLy8gaXNzdWVkICs9IGNyZWRpdHMKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgKwogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGIgaXNzdWVfY3JlZGl0c19iYXRjaF9mb3JfaGVhZGVyQDIKCmlzc3VlX2NyZWRpdHNfYmF0Y2hfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU0OAogICAgLy8gb3AuSVR4bkNyZWF0ZS5uZXh0KCkKICAgIGl0eG5fbmV4dAogICAgYiBpc3N1ZV9jcmVkaXRzX2JhdGNoX2FmdGVyX2lmX2Vsc2VANgoKaXNzdWVfY3JlZGl0c19iYXRjaF9hZnRlcl9mb3JAMTA6CiAgICBwb3AKICAgIGJ1cnkgMQogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTU1OQogICAgLy8gaWYgZ3JvdXBfc2l6ZToKICAgIGRpZyAxCiAgICBieiBpc3N1ZV9jcmVkaXRzX2JhdGNoX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTYwCiAgICAvLyBvcC5JVHhuQ3JlYXRlLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAoKaXNzdWVfY3JlZGl0c19iYXRjaF9hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NjIKICAgIC8vIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgKz0gaXNzdWVkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAidG90YWxfY3JlZGl0c19pc3N1ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgZXhpc3RzCiAgICBkaWcgMQogICAgKwogICAgYnl0ZWMgOCAvLyAidG90YWxfY3JlZGl0c19pc3N1ZWQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE1NjMKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChpc3N1ZWQpCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTUxOQogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkubGlzdF9mb3Jfc2FsZVtyb3V0aW5nXSgpIC0+IHZvaWQ6Cmxpc3RfZm9yX3NhbGU6CiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiA0CiAgICBieXRlY18zIC8vICIiCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTY5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICBjb3ZlciAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGNvdmVyIDMKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgNAogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGNvdmVyIDUKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjAzCiAgICAvLyBhc3NlcnQgc2VsZi5hYXJuYV9hc3NldCwgIm5vIEFBUk5BIHRva2VuIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgYXNzZXJ0IC8vIG5vIEFBUk5BIHRva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwNAogICAgLy8gYXNzZXJ0IGFtb3VudCA+IFVJbnQ2NCgwKSwgImFtb3VudCBtdXN0IGJlID4gMCIKICAgIGRpZyA0CiAgICBhc3NlcnQgLy8gYW1vdW50IG11c3QgYmUgPiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwNQogICAgLy8gYXNzZXJ0IHByaWNlX3Blcl90b2tlbiA+IFVJbnQ2NCgwKSwgInByaWNlIG11c3QgYmUgPiAwIgogICAgdW5jb3ZlciAzCiAgICBhc3NlcnQgLy8gcHJpY2UgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjA2CiAgICAvLyBhc3NlcnQgbm90IHNlbGYuX2lzX2V4cGlyZWQoZXhwaXJlc19yb3VuZCksICJleHBpcnkgcm91bmQgcGFzc2VkIgogICAgdW5jb3ZlciAyCiAgICBjYWxsc3ViIF9pc19leHBpcmVkCiAgICAhCiAgICBhc3NlcnQgLy8gZXhwaXJ5IHJvdW5kIHBhc3NlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MDcKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5yZWNlaXZlciA9PSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLCAicGF5IHRoZSBjb250cmFjdCIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBwYXkgdGhlIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYwOAogICAgLy8gYXNzZXJ0IG1heF9maWxscyA8PSBNQVhfRklMTFMsICJ0b28gbWFueSBmaWxscyIKICAgIGR1cAogICAgcHVzaGludCAxNAogICAgPD0KICAgIGFzc2VydCAvLyB0b28gbWFueSBmaWxscwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MDkKICAgIC8vIGVuc3VyZV9idWRnZXQobWF4X2ZpbGxzICogRklMTF9CVURHRVQsIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBpbnRjIDcgLy8gNzAwCiAgICAqCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYxMwogICAgLy8gcHJvY2VlZHMgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYxNAogICAgLy8gZmlsbHMgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICBjb3ZlciAyCgpsaXN0X2Zvcl9zYWxlX3doaWxlX3RvcEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MTUKICAgIC8vIHdoaWxlIHJlbWFpbmluZyBhbmQgc2VsZi5iZXN0X2JpZF9pZCAhPSBOT19CSUQgYW5kIGZpbGxzIDwgbWF4X2ZpbGxzOgogICAgZGlnIDIKICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfd2hpbGVAMTMKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJiZXN0X2JpZF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X2JpZF9pZCBleGlzdHMKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgIT0KICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfd2hpbGVAMTMKICAgIGR1cAogICAgZGlnIDUKICAgIDwKICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfd2hpbGVAMTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjE2CiAgICAvLyBiaWRfaWQgPSBzZWxmLmJlc3RfYmlkX2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAiYmVzdF9iaWRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDE1CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X2JpZF9pZCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjE3CiAgICAvLyBiaWQgPSBzZWxmLmJpZHNbYmlkX2lkXS5jb3B5KCkKICAgIGl0b2IKICAgIGR1cAogICAgYnVyeSAxNwogICAgYnl0ZWMgNCAvLyAweDYyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYnVyeSAxNQogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDE5CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iaWRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MTgKICAgIC8vIGlmIGJpZC5wcmljZS5uYXRpdmUgPCBwcmljZV9wZXJfdG9rZW46CiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDgKICAgIDwKICAgIGJueiBsaXN0X2Zvcl9zYWxlX2FmdGVyX3doaWxlQDEzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYyMAogICAgLy8gZmlsbHMgKz0gMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjIxCiAgICAvLyBpZiBub3QgYmlkLmJpZGRlci5uYXRpdmUuaXNfb3B0ZWRfaW4oc2VsZi5hYXJuYV9hc3NldCk6CiAgICBkaWcgMTYKICAgIGV4dHJhY3QgMCAzMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIGJueiBsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDkKICAgIC8vIGJpZCA9IHNlbGYuYmlkc1tiaWRfaWRdLmNvcHkoKQogICAgZGlnIDEzCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iaWRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTAKICAgIC8vIHJlZnVuZCA9IGJpZC5xdWFudGl0eS5uYXRpdmUgKiBiaWQucHJpY2UubmF0aXZlICsgc2VsZi5fZGVsZXRlX2JpZChiaWRfaWQpCiAgICBkdXAKICAgIGV4dHJhY3QgMzIgOAogICAgZGlnIDEKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMgogICAgcHVzaGludCA0MAogICAgZXh0cmFjdF91aW50NjQKICAgICoKICAgIGRpZyAxNQogICAgY2FsbHN1YiBfZGVsZXRlX2JpZAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTEKICAgIC8vIHNlbGYuX3BheV9vdXQoYmlkLmJpZGRlci5uYXRpdmUsIHJlZnVuZCkKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdCAwIDMyCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfcGF5X291dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTMKICAgIC8vIEJpZENhbmNlbGxlZChiaWRfaWQ9YXJjNC5VSW50NjQoYmlkX2lkKSwgYmlkZGVyPWJpZC5iaWRkZXIsIHF1YW50aXR5PWJpZC5xdWFudGl0eSkKICAgIGRpZyAxNwogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjUyLTEyNTQKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBCaWRDYW5jZWxsZWQoYmlkX2lkPWFyYzQuVUludDY0KGJpZF9pZCksIGJpZGRlcj1iaWQuYmlkZGVyLCBxdWFudGl0eT1iaWQucXVhbnRpdHkpCiAgICAvLyApCiAgICBieXRlYyAzMSAvLyBtZXRob2QgIkJpZENhbmNlbGxlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjIzCiAgICAvLyBjb250aW51ZQogICAgYiBsaXN0X2Zvcl9zYWxlX3doaWxlX3RvcEAyCgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjI0CiAgICAvLyBxdWFudGl0eSA9IHJlbWFpbmluZyBpZiByZW1haW5pbmcgPCBiaWQucXVhbnRpdHkubmF0aXZlIGVsc2UgYmlkLnF1YW50aXR5Lm5hdGl2ZQogICAgZGlnIDE2CiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBkaWcgNAogICAgPgogICAgYnogbGlzdF9mb3Jfc2FsZV90ZXJuYXJ5X2ZhbHNlQDExCiAgICBwb3AKICAgIGRpZyAyCiAgICBzd2FwCgpsaXN0X2Zvcl9zYWxlX3Rlcm5hcnlfbWVyZ2VAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYyNQogICAgLy8gcHJvY2VlZHMgKz0gc2VsZi5fZmlsbF9iaWQoYmlkX2lkLCBUeG4uc2VuZGVyLCBxdWFudGl0eSkKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTYwCiAgICAvLyBiaWQgPSBzZWxmLl9sb2FkX2JpZChiaWRfaWQpCiAgICBkaWcgMTQKICAgIGNhbGxzdWIgX2xvYWRfYmlkCiAgICBkdXAKICAgIGJ1cnkgMjAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTYxCiAgICAvLyBzZWxmLl9yZWNvcmRfdHJhZGUocXVhbnRpdHksIGJpZC5wcmljZS5uYXRpdmUpCiAgICBkdXAKICAgIGV4dHJhY3QgNDAgOAogICAgZGlnIDEKICAgIHB1c2hpbnQgNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgNQogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX3JlY29yZF90cmFkZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNjItMTE2NwogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9zZW5kZXI9c2VsbGVyLAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWJpZC5iaWRkZXIubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1xdWFudGl0eSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTYzCiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2NQogICAgLy8gYXNzZXRfcmVjZWl2ZXI9YmlkLmJpZGRlci5uYXRpdmUsCiAgICBkaWcgMwogICAgZXh0cmFjdCAwIDMyCiAgICBkdXAKICAgIGJ1cnkgMjUKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGRpZyA0CiAgICBpdHhuX2ZpZWxkIEFzc2V0U2VuZGVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNjIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2Mi0xMTY3CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3NlbmRlcj1zZWxsZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9YmlkLmJpZGRlci5uYXRpdmUsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PXF1YW50aXR5LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTY5CiAgICAvLyByZW1haW5pbmcgPSBiaWQucXVhbnRpdHkubmF0aXZlIC0gcXVhbnRpdHkKICAgIHVuY292ZXIgMgogICAgcHVzaGludCAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAxCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3NAogICAgLy8gcXVhbnRpdHk9YXJjNC5VSW50NjQocXVhbnRpdHkpLAogICAgc3dhcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzYKICAgIC8vIHJlbWFpbmluZz1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgZGlnIDEKICAgIGl0b2IKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNzEtMTE3NwogICAgLy8gQmlkRmlsbGVkKAogICAgLy8gICAgIGJpZF9pZD1hcmM0LlVJbnQ2NChiaWRfaWQpLAogICAgLy8gICAgIHNlbGxlcj1hcmM0LkFkZHJlc3Moc2VsbGVyKSwKICAgIC8vICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NChxdWFudGl0eSksCiAgICAvLyAgICAgcHJpY2U9YmlkLnByaWNlLAogICAgLy8gICAgIHJlbWFpbmluZz1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgLy8gKQogICAgZGlnIDIyCiAgICB1bmNvdmVyIDUKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE3MC0xMTc4CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQmlkRmlsbGVkKAogICAgLy8gICAgICAgICBiaWRfaWQ9YXJjNC5VSW50NjQoYmlkX2lkKSwKICAgIC8vICAgICAgICAgc2VsbGVyPWFyYzQuQWRkcmVzcyhzZWxsZXIpLAogICAgLy8gICAgICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NChxdWFudGl0eSksCiAgICAvLyAgICAgICAgIHByaWNlPWJpZC5wcmljZSwKICAgIC8vICAgICAgICAgcmVtYWluaW5nPWFyYzQuVUludDY0KHJlbWFpbmluZyksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4NGE2YjM5NjggLy8gbWV0aG9kICJCaWRGaWxsZWQodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTc5CiAgICAvLyBpZiByZW1haW5pbmc6CiAgICBieiBsaXN0X2Zvcl9zYWxlX2Vsc2VfYm9keUAzNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExODAKICAgIC8vIGJpZC5xdWFudGl0eSA9IGFyYzQuVUludDY0KHJlbWFpbmluZykKICAgIGRpZyAxOAogICAgc3dhcAogICAgcmVwbGFjZTIgMzIKICAgIGR1cAogICAgYnVyeSAxOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExODEKICAgIC8vIHNlbGYuYmlkc1tiaWRfaWRdID0gYmlkLmNvcHkoKQogICAgZGlnIDE1CiAgICBzd2FwCiAgICBib3hfcHV0CgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMzk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE4NwogICAgLy8gcmV0dXJuIHF1YW50aXR5ICogYmlkLnByaWNlLm5hdGl2ZQogICAgZGlnIDE3CiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MjUKICAgIC8vIHByb2NlZWRzICs9IHNlbGYuX2ZpbGxfYmlkKGJpZF9pZCwgVHhuLnNlbmRlciwgcXVhbnRpdHkpCiAgICB1bmNvdmVyIDMKICAgICsKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjI2CiAgICAvLyByZW1haW5pbmcgLT0gcXVhbnRpdHkKICAgIGRpZyAzCiAgICBzd2FwCiAgICAtCiAgICBidXJ5IDMKICAgIGIgbGlzdF9mb3Jfc2FsZV93aGlsZV90b3BAMgoKbGlzdF9mb3Jfc2FsZV9lbHNlX2JvZHlAMzY6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTgzLTExODQKICAgIC8vICMgRmlsbGVkOiB0aGUgcmVsZWFzZWQgYmlkIE1CUiBnb2VzIGJhY2sgdG8gdGhlIGJpZGRlcgogICAgLy8gcmVsZWFzZWRfbWJyID0gc2VsZi5fZGVsZXRlX2JpZChiaWRfaWQpCiAgICBkaWcgMTMKICAgIGNhbGxzdWIgX2RlbGV0ZV9iaWQKICAgIGR1cAogICAgYnVyeSAxMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExODUKICAgIC8vIGlmIHJlbGVhc2VkX21icjoKICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAzOQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExODYKICAgIC8vIHNlbGYuX3BheV9vdXQoYmlkLmJpZGRlci5uYXRpdmUsIHJlbGVhc2VkX21icikKICAgIGRpZyAxOAogICAgZGlnIDEyCiAgICBjYWxsc3ViIF9wYXlfb3V0CiAgICBiIGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAzOQoKbGlzdF9mb3Jfc2FsZV90ZXJuYXJ5X2ZhbHNlQDExOgogICAgc3dhcAogICAgYiBsaXN0X2Zvcl9zYWxlX3Rlcm5hcnlfbWVyZ2VAMTIKCmxpc3RfZm9yX3NhbGVfYWZ0ZXJfd2hpbGVAMTM6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjI4LTE2MjkKICAgIC8vICMgQSByZW1haW5kZXIgdGhhdCBzdGlsbCBjcm9zc2VzIGEgYmlkIHdvdWxkIGxlYXZlIHRoZSBib29rIGNyb3NzZWQKICAgIC8vIGlmIHJlbWFpbmluZyBhbmQgc2VsZi5iZXN0X2JpZF9pZCAhPSBOT19CSUQ6CiAgICBkaWcgMQogICAgYnogbGlzdF9mb3Jfc2FsZV9hZnRlcl9pZl9lbHNlQDE4CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAiYmVzdF9iaWRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9iaWRfaWQgZXhpc3RzCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgICE9CiAgICBieiBsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMTgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjMwCiAgICAvLyBpZiBzZWxmLmJpZHNbc2VsZi5iZXN0X2JpZF9pZF0ucHJpY2UubmF0aXZlID49IHByaWNlX3Blcl90b2tlbjoKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA2IC8vICJiZXN0X2JpZF9pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X2JpZF9pZCBleGlzdHMKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHg2MgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iaWRzIGVudHJ5IGV4aXN0cwogICAgcHVzaGludCA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyA3CiAgICA+PQogICAgYnogbGlzdF9mb3Jfc2FsZV9hZnRlcl9pZl9lbHNlQDE4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzMQogICAgLy8gcmVtYWluaW5nID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSAyCgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzMwogICAgLy8gaWR4ID0gVUludDY0KE5PX0xJU1RJTkcpCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjM0CiAgICAvLyB1bnVzZWRfbWJyID0gbWJyX3BheW1lbnQuYW1vdW50CiAgICBkaWcgMwogICAgZ3R4bnMgQW1vdW50CiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzNQogICAgLy8gaWYgcmVtYWluaW5nOgogICAgZGlnIDMKICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAyMQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzNi0xNjQyCiAgICAvLyAjIENsYXdiYWNrIHRoZSByZW1haW5kZXIgZnJvbSBzZWxsZXIgaW50byBjb250cmFjdCBlc2Nyb3cKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cmVtYWluaW5nLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MzgKICAgIC8vIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjM5CiAgICAvLyBhc3NldF9zZW5kZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjQwCiAgICAvLyBhc3NldF9yZWNlaXZlcj1HbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLAogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGRpZyA1CiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgQXNzZXRTZW5kZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzNi0xNjM3CiAgICAvLyAjIENsYXdiYWNrIHRoZSByZW1haW5kZXIgZnJvbSBzZWxsZXIgaW50byBjb250cmFjdCBlc2Nyb3cKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIHB1c2hpbnQgNCAvLyBheGZlcgogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTYzNi0xNjQyCiAgICAvLyAjIENsYXdiYWNrIHRoZSByZW1haW5kZXIgZnJvbSBzZWxsZXIgaW50byBjb250cmFjdCBlc2Nyb3cKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfc2VuZGVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9R2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cmVtYWluaW5nLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjQ0CiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgc3dhcAogICAgY292ZXIgMwogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTMwCiAgICAvLyBpZiBwcmV2X2lkID09IE5PX0xJU1RJTkc6CiAgICBkaWcgNgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICA9PQogICAgYnogbGlzdF9mb3Jfc2FsZV9lbHNlX2JvZHlAMjcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MzEKICAgIC8vIG5leHRfaWQgPSBzZWxmLmJlc3RfYXNrX2lkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiYmVzdF9hc2tfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9hc2tfaWQgZXhpc3RzCgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMjg6CiAgICBkaWcgNwogICAgYnVyeSAxNAoKbGlzdF9mb3Jfc2FsZV93aGlsZV90b3BAMjk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTM4CiAgICAvLyB3aGlsZSBuZXh0X2lkICE9IE5PX0xJU1RJTkc6CiAgICBkdXAKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgIT0KICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfd2hpbGVAMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MzkKICAgIC8vIGZvbGxvd2luZyA9IHNlbGYubGlzdGluZ3NbbmV4dF9pZF0uY29weSgpCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGJ1cnkgMTkKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk0MAogICAgLy8gaWYgZm9sbG93aW5nLnByaWNlLm5hdGl2ZSA+IHByaWNlOgogICAgcHVzaGludCA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAxMAogICAgPgogICAgYm56IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfd2hpbGVAMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NDMKICAgIC8vIG5leHRfaWQgPSBmb2xsb3dpbmcubmV4dF9hc2submF0aXZlCiAgICBkaWcgMTYKICAgIHB1c2hpbnQgNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBzd2FwCiAgICBidXJ5IDE0CiAgICBiIGxpc3RfZm9yX3NhbGVfd2hpbGVfdG9wQDI5CgpsaXN0X2Zvcl9zYWxlX2FmdGVyX3doaWxlQDMyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDYKICAgIC8vIGlkeCA9IHNlbGYubGlzdGluZ19jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE5IC8vICJsaXN0aW5nX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5nX2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDcKICAgIC8vIHNlbGYubGlzdGluZ19jb3VudCA9IGlkeCArIFVJbnQ2NCgxKQogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMTkgLy8gImxpc3RpbmdfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDkKICAgIC8vIEJ5dGVzKFNFTExFUl9JTkRFWF9QUkVGSVgpICsgVHhuLnNlbmRlci5ieXRlcywgaWR4CiAgICBieXRlYyAyOSAvLyAweDczNmMKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NDgtMTY1MAogICAgLy8gc2VsbGVyX3Nsb3QgPSBzZWxmLl9pbmRleF9hcHBlbmQoCiAgICAvLyAgICAgQnl0ZXMoU0VMTEVSX0lOREVYX1BSRUZJWCkgKyBUeG4uc2VuZGVyLmJ5dGVzLCBpZHgKICAgIC8vICkKICAgIGRpZyAxCiAgICBjYWxsc3ViIF9pbmRleF9hcHBlbmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjUyCiAgICAvLyBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NTMKICAgIC8vIGFtb3VudD1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgZGlnIDgKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjU2CiAgICAvLyBwcmV2X2Fzaz1hcmM0LlVJbnQ2NChwcmV2X2lkKSwKICAgIGRpZyAxOAogICAgZHVwCiAgICBjb3ZlciA1CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY1NwogICAgLy8gbmV4dF9hc2s9YXJjNC5VSW50NjQobmV4dF9pZCksCiAgICB1bmNvdmVyIDcKICAgIGR1cAogICAgY292ZXIgNwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NTgKICAgIC8vIHNlbGxlcl9zbG90PWFyYzQuVUludDY0KHNlbGxlcl9zbG90KSwKICAgIHVuY292ZXIgNAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NTEtMTY1OQogICAgLy8gc2VsZi5saXN0aW5nc1tpZHhdID0gTGlzdGluZygKICAgIC8vICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFtb3VudD1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KHByaWNlX3Blcl90b2tlbiksCiAgICAvLyAgICAgZXhwaXJlc19yb3VuZD1hcmM0LlVJbnQ2NChleHBpcmVzX3JvdW5kKSwKICAgIC8vICAgICBwcmV2X2Fzaz1hcmM0LlVJbnQ2NChwcmV2X2lkKSwKICAgIC8vICAgICBuZXh0X2Fzaz1hcmM0LlVJbnQ2NChuZXh0X2lkKSwKICAgIC8vICAgICBzZWxsZXJfc2xvdD1hcmM0LlVJbnQ2NChzZWxsZXJfc2xvdCksCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIGRpZyA0CiAgICBjb25jYXQKICAgIGRpZyAxOAogICAgZHVwCiAgICBjb3ZlciA5CiAgICBjb25jYXQKICAgIGRpZyAxNwogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NTEKICAgIC8vIHNlbGYubGlzdGluZ3NbaWR4XSA9IExpc3RpbmcoCiAgICBkaWcgMgogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDZjCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY1MS0xNjU5CiAgICAvLyBzZWxmLmxpc3RpbmdzW2lkeF0gPSBMaXN0aW5nKAogICAgLy8gICAgIHNlbGxlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KHJlbWFpbmluZyksCiAgICAvLyAgICAgcHJpY2U9YXJjNC5VSW50NjQocHJpY2VfcGVyX3Rva2VuKSwKICAgIC8vICAgICBleHBpcmVzX3JvdW5kPWFyYzQuVUludDY0KGV4cGlyZXNfcm91bmQpLAogICAgLy8gICAgIHByZXZfYXNrPWFyYzQuVUludDY0KHByZXZfaWQpLAogICAgLy8gICAgIG5leHRfYXNrPWFyYzQuVUludDY0KG5leHRfaWQpLAogICAgLy8gICAgIHNlbGxlcl9zbG90PWFyYzQuVUludDY0KHNlbGxlcl9zbG90KSwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjAKICAgIC8vIHNlbGYuX3NldF9hc2tfbmV4dChwcmV2X2lkLCBpZHgpCiAgICB1bmNvdmVyIDMKICAgIGRpZyAzCiAgICBjYWxsc3ViIF9zZXRfYXNrX25leHQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjYxCiAgICAvLyBzZWxmLl9zZXRfYXNrX3ByZXYobmV4dF9pZCwgaWR4KQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgX3NldF9hc2tfcHJldgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjIKICAgIC8vIG1icl9kZWx0YSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgLSBtYnJfYmVmb3JlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIHVuY292ZXIgNwogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjMKICAgIC8vIGFzc2VydCBtYnJfcGF5bWVudC5hbW91bnQgPj0gbWJyX2RlbHRhLCAiaW5zdWZmaWNpZW50IG1iciBwYXltZW50IgogICAgdW5jb3ZlciA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyAxCiAgICA+PQogICAgYXNzZXJ0IC8vIGluc3VmZmljaWVudCBtYnIgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjQKICAgIC8vIHVudXNlZF9tYnIgLT0gbWJyX2RlbHRhCiAgICAtCiAgICBjb3ZlciA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY2OAogICAgLy8gc2VsbGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjY2LTE2NzEKICAgIC8vIExpc3RlZCgKICAgIC8vICAgICBsaXN0aW5nX2lkPWFyYzQuVUludDY0KGlkeCksCiAgICAvLyAgICAgc2VsbGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhbW91bnQ9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NChwcmljZV9wZXJfdG9rZW4pLAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NjUtMTY3MgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIExpc3RlZCgKICAgIC8vICAgICAgICAgbGlzdGluZ19pZD1hcmM0LlVJbnQ2NChpZHgpLAogICAgLy8gICAgICAgICBzZWxsZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgICAgICBhbW91bnQ9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICAgICAgICAgcHJpY2U9YXJjNC5VSW50NjQocHJpY2VfcGVyX3Rva2VuKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwOThjY2RhZiAvLyBtZXRob2QgIkxpc3RlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMjE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY3MwogICAgLy8gaWYgcHJvY2VlZHMgKyB1bnVzZWRfbWJyOgogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICArCiAgICBkdXAKICAgIGJ1cnkgMTAKICAgIGJ6IGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAyNAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NzQKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cHJvY2VlZHMgKyB1bnVzZWRfbWJyKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgZGlnIDkKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CgpsaXN0X2Zvcl9zYWxlX2FmdGVyX2lmX2Vsc2VAMjQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY3NQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KGlkeCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNTY5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmxpc3RfZm9yX3NhbGVfZWxzZV9ib2R5QDI3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkzMy05MzQKICAgIC8vICMgQW4gZXhwaXJlZCBoaW50IGlzIHN0aWxsIGluIHRoZSBpbmRleCwgc28gaXQgc3RpbGwgc2VydmVzCiAgICAvLyBhc3NlcnQgcHJldl9pZCBpbiBzZWxmLmxpc3RpbmdzLCAibGlzdGluZyBub3QgYWN0aXZlIgogICAgZGlnIDYKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkzNQogICAgLy8gaGludCA9IHNlbGYubGlzdGluZ3NbcHJldl9pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MzYKICAgIC8vIGFzc2VydCBoaW50LnByaWNlLm5hdGl2ZSA8PSBwcmljZSwgImJhZCBwcmljZSBoaW50IgogICAgZHVwCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDEwCiAgICA8PQogICAgYXNzZXJ0IC8vIGJhZCBwcmljZSBoaW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTM3CiAgICAvLyBuZXh0X2lkID0gaGludC5uZXh0X2Fzay5uYXRpdmUKICAgIHB1c2hpbnQgNjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBiIGxpc3RfZm9yX3NhbGVfYWZ0ZXJfaWZfZWxzZUAyOAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmJ1eV9saXN0aW5nW3JvdXRpbmddKCkgLT4gdm9pZDoKYnV5X2xpc3Rpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY3NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18yIC8vIDgKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBudW1iZXIgb2YgYnl0ZXMgZm9yIGFyYzQudWludDY0CiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjkwCiAgICAvLyBhc3NlcnQgc2VsZi5hYXJuYV9hc3NldCwgIm5vIEFBUk5BIHRva2VuIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgYXNzZXJ0IC8vIG5vIEFBUk5BIHRva2VuCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY5MQogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgInBheSB0aGUgY29udHJhY3QiCiAgICBkdXAKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBwYXkgdGhlIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODI1CiAgICAvLyBhc3NlcnQgbGlzdGluZ19pZCBpbiBzZWxmLmxpc3RpbmdzLCAibGlzdGluZyBub3QgYWN0aXZlIgogICAgZGlnIDIKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgyNgogICAgLy8gbGlzdGluZyA9IHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0uY29weSgpCiAgICBib3hfZ2V0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MjcKICAgIC8vIGFzc2VydCBub3Qgc2VsZi5faXNfZXhwaXJlZChsaXN0aW5nLmV4cGlyZXNfcm91bmQubmF0aXZlKSwgImxpc3RpbmcgZXhwaXJlZCIKICAgIGR1cAogICAgcHVzaGludCA0OAogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2lzX2V4cGlyZWQKICAgICEKICAgIGFzc2VydCAvLyBsaXN0aW5nIGV4cGlyZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjk0CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gcXVhbnRpdHkgKiBsaXN0aW5nLnByaWNlLm5hdGl2ZSwgImluc3VmZmljaWVudCBwYXltZW50IgogICAgc3dhcAogICAgZ3R4bnMgQW1vdW50CiAgICBkaWcgMQogICAgcHVzaGludCA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIGRpZyAzCiAgICAqCiAgICA+PQogICAgYXNzZXJ0IC8vIGluc3VmZmljaWVudCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY5NQogICAgLy8gX2Nvc3QgPSBzZWxmLl9maWxsX2xpc3RpbmcobGlzdGluZ19pZCwgbGlzdGluZywgcXVhbnRpdHkpCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIGRpZyAyCiAgICBjYWxsc3ViIF9maWxsX2xpc3RpbmcKICAgIHBvcG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OTYtMTcwMQogICAgLy8gIyBUcmFuc2ZlciB0b2tlbnMgdG8gYnV5ZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cXVhbnRpdHksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTY5OAogICAgLy8geGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OTkKICAgIC8vIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDIKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgQXNzZXRSZWNlaXZlcgogICAgaXR4bl9maWVsZCBYZmVyQXNzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNjk2LTE2OTcKICAgIC8vICMgVHJhbnNmZXIgdG9rZW5zIHRvIGJ1eWVyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2OTYtMTcwMQogICAgLy8gIyBUcmFuc2ZlciB0b2tlbnMgdG8gYnV5ZXIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9cXVhbnRpdHksCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2NzcKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Lm1hcmtldF9idXlbcm91dGluZ10oKSAtPiB2b2lkOgptYXJrZXRfYnV5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MDMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGd0eG5zIFR5cGVFbnVtCiAgICBpbnRjXzEgLy8gcGF5CiAgICA9PQogICAgYXNzZXJ0IC8vIHRyYW5zYWN0aW9uIHR5cGUgaXMgcGF5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTcyMAogICAgLy8gYXNzZXJ0IHNlbGYuYWFybmFfYXNzZXQsICJubyBBQVJOQSB0b2tlbiIKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJhYXJuYV9hc3NldCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hYXJuYV9hc3NldCBleGlzdHMKICAgIGFzc2VydCAvLyBubyBBQVJOQSB0b2tlbgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjEKICAgIC8vIGFzc2VydCBwYXltZW50LnJlY2VpdmVyID09IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MsICJwYXkgdGhlIGNvbnRyYWN0IgogICAgZHVwCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gcGF5IHRoZSBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjIKICAgIC8vIGFzc2VydCBtYXhfZmlsbHMgPiBVSW50NjQoMCksICJtYXggZmlsbHMgbXVzdCBiZSA+IDAiCiAgICBkaWcgMQogICAgYXNzZXJ0IC8vIG1heCBmaWxscyBtdXN0IGJlID4gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjMKICAgIC8vIGFzc2VydCBtYXhfZmlsbHMgPD0gTUFYX0ZJTExTLCAidG9vIG1hbnkgZmlsbHMiCiAgICBkaWcgMQogICAgcHVzaGludCAxNAogICAgPD0KICAgIGFzc2VydCAvLyB0b28gbWFueSBmaWxscwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjQKICAgIC8vIGVuc3VyZV9idWRnZXQobWF4X2ZpbGxzICogRklMTF9CVURHRVQsIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQpCiAgICBkaWcgMQogICAgaW50YyA3IC8vIDcwMAogICAgKgogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjYKICAgIC8vIGJvdWdodCwgc3BlbnQgPSBzZWxmLl9zd2VlcF9hc2tzKG1heF9xdWFudGl0eSwgbWF4X3ByaWNlLCBtYXhfZmlsbHMpCiAgICBjb3ZlciAzCiAgICBjYWxsc3ViIF9zd2VlcF9hc2tzCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIGR1cAogICAgY292ZXIgMgogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjcKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA+PSBzcGVudCwgImluc3VmZmljaWVudCBwYXltZW50IgogICAgdW5jb3ZlciAyCiAgICBndHhucyBBbW91bnQKICAgIGR1cAogICAgY292ZXIgNAogICAgPD0KICAgIGFzc2VydCAvLyBpbnN1ZmZpY2llbnQgcGF5bWVudAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MjkKICAgIC8vIGlmIGJvdWdodDoKICAgIGJ6IG1hcmtldF9idXlfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTczMC0xNzM0CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWJvdWdodCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzMxCiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTczMgogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTczMAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzMwLTE3MzQKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9Ym91Z2h0LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCm1hcmtldF9idXlfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MzUKICAgIC8vIGlmIHBheW1lbnQuYW1vdW50ID4gc3BlbnQ6CiAgICBkaWcgMQogICAgZGlnIDMKICAgID4KICAgIGJ6IG1hcmtldF9idXlfYWZ0ZXJfaWZfZWxzZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTczNgogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1wYXltZW50LmFtb3VudCAtIHNwZW50KS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgZGlnIDIKICAgIGRpZyA0CiAgICAtCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKbWFya2V0X2J1eV9hZnRlcl9pZl9lbHNlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTczNwogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KGJvdWdodCkKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzAzCiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5jYW5jZWxfbGlzdGluZ1tyb3V0aW5nXSgpIC0+IHZvaWQ6CmNhbmNlbF9saXN0aW5nOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwbiAyCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NDUKICAgIC8vIGFzc2VydCBsaXN0aW5nX2lkIGluIHNlbGYubGlzdGluZ3MsICJsaXN0aW5nIG5vdCBhY3RpdmUiCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIGxpc3Rpbmcgbm90IGFjdGl2ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NDYKICAgIC8vIGxpc3RpbmcgPSBzZWxmLmxpc3RpbmdzW2xpc3RpbmdfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc0NwogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gbGlzdGluZy5zZWxsZXIubmF0aXZlLCAib25seSBzZWxsZXIgY2FuIGNhbmNlbCIKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgMzIKICAgIGR1cAogICAgY292ZXIgNAogICAgc3dhcAogICAgZGlnIDEKICAgID09CiAgICBhc3NlcnQgLy8gb25seSBzZWxsZXIgY2FuIGNhbmNlbAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NDgtMTc1MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1saXN0aW5nLnNlbGxlci5uYXRpdmUsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWxpc3RpbmcuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzQ5CiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc1MQogICAgLy8gYXNzZXRfYW1vdW50PWxpc3RpbmcuYW1vdW50Lm5hdGl2ZSwKICAgIGRpZyAyCiAgICBleHRyYWN0IDMyIDgKICAgIGNvdmVyIDQKICAgIHVuY292ZXIgMgogICAgcHVzaGludCAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGl0eG5fZmllbGQgQXNzZXRBbW91bnQKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzQ4CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICBwdXNoaW50IDQgLy8gYXhmZXIKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NDgtMTc1MgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgLy8gICAgIHhmZXJfYXNzZXQ9c2VsZi5hYXJuYV9hc3NldCwKICAgIC8vICAgICBhc3NldF9yZWNlaXZlcj1saXN0aW5nLnNlbGxlci5uYXRpdmUsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWxpc3RpbmcuYW1vdW50Lm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc1MwogICAgLy8gcmVsZWFzZWRfbWJyID0gc2VsZi5fZGVsZXRlX2xpc3RpbmcobGlzdGluZ19pZCkKICAgIGNhbGxzdWIgX2RlbGV0ZV9saXN0aW5nCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzU0CiAgICAvLyBpZiByZWxlYXNlZF9tYnI6CiAgICBieiBjYW5jZWxfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzU1CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXJlbGVhc2VkX21icikuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIHR4biBTZW5kZXIKICAgIGRpZyA0CiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKY2FuY2VsX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NTctMTc2MQogICAgLy8gTGlzdGluZ0NhbmNlbGxlZCgKICAgIC8vICAgICBsaXN0aW5nX2lkPWFyYzQuVUludDY0KGxpc3RpbmdfaWQpLAogICAgLy8gICAgIHNlbGxlcj1saXN0aW5nLnNlbGxlciwKICAgIC8vICAgICBhbW91bnQ9bGlzdGluZy5hbW91bnQsCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NTYtMTc2MgogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIExpc3RpbmdDYW5jZWxsZWQoCiAgICAvLyAgICAgICAgIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQobGlzdGluZ19pZCksCiAgICAvLyAgICAgICAgIHNlbGxlcj1saXN0aW5nLnNlbGxlciwKICAgIC8vICAgICAgICAgYW1vdW50PWxpc3RpbmcuYW1vdW50LAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDY1ZjBjNWIxIC8vIG1ldGhvZCAiTGlzdGluZ0NhbmNlbGxlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzM5CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5zd2VlcF9leHBpcmVkW3JvdXRpbmddKCkgLT4gdm9pZDoKc3dlZXBfZXhwaXJlZDoKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc2NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBkdXBuIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGludGNfMyAvLyAyCiAgICArCiAgICB1bmNvdmVyIDIKICAgIGxlbgogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC5keW5hbWljX2FycmF5PGFyYzQudWludDY0PgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NzQKICAgIC8vIGFzc2VydCBsaXN0aW5nX2lkcy5sZW5ndGggPD0gTUFYX1NXRUVQX0JBVENILCAiYmF0Y2ggdG9vIGxhcmdlIgogICAgZHVwCiAgICBwdXNoaW50IDE5CiAgICA8PQogICAgYXNzZXJ0IC8vIGJhdGNoIHRvbyBsYXJnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NzYKICAgIC8vIFVJbnQ2NChTV0VFUF9CVURHRVRfUEVSX0xJU1RJTkcpICogbGlzdGluZ19pZHMubGVuZ3RoLAogICAgaW50YyA2IC8vIDMwMAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NzcKICAgIC8vIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3NzUtMTc3OAogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBVSW50NjQoU1dFRVBfQlVER0VUX1BFUl9MSVNUSU5HKSAqIGxpc3RpbmdfaWRzLmxlbmd0aCwKICAgIC8vICAgICBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgLy8gKQogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc3OQogICAgLy8gcmVjbGFpbWVkID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZHVwCgpzd2VlcF9leHBpcmVkX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzgwCiAgICAvLyBmb3IgbGlzdGluZ19pZCBpbiBsaXN0aW5nX2lkczoKICAgIGR1cAogICAgZGlnIDMKICAgIDwKICAgIGJ6IHN3ZWVwX2V4cGlyZWRfYWZ0ZXJfZm9yQDkKICAgIGRpZyAzCiAgICBleHRyYWN0IDIgMAogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc4MQogICAgLy8gaWYgbGlzdGluZ19pZC5uYXRpdmUgbm90IGluIHNlbGYubGlzdGluZ3M6CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBidXJ5IDYKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJ1cnkgNwogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBzd2VlcF9leHBpcmVkX2Zvcl9mb290ZXJAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3ODMKICAgIC8vIGxpc3RpbmcgPSBzZWxmLmxpc3RpbmdzW2xpc3RpbmdfaWQubmF0aXZlXS5jb3B5KCkKICAgIGRpZyA1CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5ncyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzg0CiAgICAvLyBpZiBzZWxmLl9pc19leHBpcmVkKGxpc3RpbmcuZXhwaXJlc19yb3VuZC5uYXRpdmUpOgogICAgcHVzaGludCA0OAogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2lzX2V4cGlyZWQKICAgIGJ6IHN3ZWVwX2V4cGlyZWRfZm9yX2Zvb3RlckA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc4NQogICAgLy8gcmVjbGFpbWVkICs9IHNlbGYuX2V4cGlyZV9saXN0aW5nKGxpc3RpbmdfaWQubmF0aXZlKQogICAgZGlnIDQKICAgIGNhbGxzdWIgX2V4cGlyZV9saXN0aW5nCiAgICB1bmNvdmVyIDIKICAgICsKICAgIHN3YXAKCnN3ZWVwX2V4cGlyZWRfZm9yX2Zvb3RlckA4OgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGIgc3dlZXBfZXhwaXJlZF9mb3JfaGVhZGVyQDIKCnN3ZWVwX2V4cGlyZWRfYWZ0ZXJfZm9yQDk6CiAgICBwb3AKICAgIGJ1cnkgMQogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc4NgogICAgLy8gaWYgcmVjbGFpbWVkOgogICAgZHVwCiAgICBieiBzd2VlcF9leHBpcmVkX2FmdGVyX2lmX2Vsc2VAMTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxNzg3CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXJlY2xhaW1lZCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAoKc3dlZXBfZXhwaXJlZF9hZnRlcl9pZl9lbHNlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3ODgKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChyZWNsYWltZWQpCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc2NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkucGxhY2VfYmlkW3JvdXRpbmddKCkgLT4gdm9pZDoKcGxhY2VfYmlkOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3OTIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZAogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgZHVwCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGJ0b2kKICAgIGR1cAogICAgY292ZXIgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgY292ZXIgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgZHVwCiAgICBsZW4KICAgIGludGNfMiAvLyA4CiAgICA9PQogICAgYXNzZXJ0IC8vIGludmFsaWQgbnVtYmVyIG9mIGJ5dGVzIGZvciBhcmM0LnVpbnQ2NAogICAgYnRvaQogICAgdHhuIEdyb3VwSW5kZXgKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkdXAKICAgIGNvdmVyIDQKICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODIyCiAgICAvLyBhc3NlcnQgc2VsZi5hYXJuYV9hc3NldCwgIm5vIEFBUk5BIHRva2VuIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgZHVwCiAgICBhc3NlcnQgLy8gbm8gQUFSTkEgdG9rZW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODIzCiAgICAvLyBhc3NlcnQgcXVhbnRpdHkgPiBVSW50NjQoMCksICJxdWFudGl0eSBtdXN0IGJlID4gMCIKICAgIGRpZyA0CiAgICBhc3NlcnQgLy8gcXVhbnRpdHkgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODI0CiAgICAvLyBhc3NlcnQgbWF4X3ByaWNlID4gVUludDY0KDApLCAicHJpY2UgbXVzdCBiZSA+IDAiCiAgICBkaWcgMwogICAgYXNzZXJ0IC8vIHByaWNlIG11c3QgYmUgPiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgyNQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIuaXNfb3B0ZWRfaW4oc2VsZi5hYXJuYV9hc3NldCksICJiaWRkZXIgbm90IG9wdGVkIGluIgogICAgdHhuIFNlbmRlcgogICAgc3dhcAogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIGFzc2VydCAvLyBiaWRkZXIgbm90IG9wdGVkIGluCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgyNgogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgInBheSB0aGUgY29udHJhY3QiCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gcGF5IHRoZSBjb250cmFjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MjcKICAgIC8vIGFzc2VydCBtYXhfZmlsbHMgPD0gTUFYX0ZJTExTLCAidG9vIG1hbnkgZmlsbHMiCiAgICBkdXAKICAgIHB1c2hpbnQgMTQKICAgIDw9CiAgICBhc3NlcnQgLy8gdG9vIG1hbnkgZmlsbHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODI4CiAgICAvLyBlbnN1cmVfYnVkZ2V0KG1heF9maWxscyAqIEZJTExfQlVER0VULCBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0KQogICAgZHVwCiAgICBpbnRjIDcgLy8gNzAwCiAgICAqCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBlbnN1cmVfYnVkZ2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgzMAogICAgLy8gYm91Z2h0LCBjb3N0ID0gc2VsZi5fc3dlZXBfYXNrcyhxdWFudGl0eSwgbWF4X3ByaWNlLCBtYXhfZmlsbHMpCiAgICBjYWxsc3ViIF9zd2VlcF9hc2tzCiAgICBjb3ZlciAzCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODMxCiAgICAvLyBpZiBib3VnaHQ6CiAgICBieiBwbGFjZV9iaWRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgzMi0xODM2CiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPVR4bi5zZW5kZXIsCiAgICAvLyAgICAgYXNzZXRfYW1vdW50PWJvdWdodCwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODMzCiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgzNAogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGRpZyAyCiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgzMgogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODMyLTE4MzYKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9Ym91Z2h0LAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCnBsYWNlX2JpZF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTgzOAogICAgLy8gYmlkX2lkID0gVUludDY0KE5PX0JJRCkKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MzkKICAgIC8vIHJlbWFpbmluZyA9IHF1YW50aXR5IC0gYm91Z2h0CiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgLQogICAgZHVwCiAgICBidXJ5IDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODQwLTE4NDEKICAgIC8vICMgQSByZW1haW5kZXIgdGhhdCBzdGlsbCBjcm9zc2VzIGFuIGFzayB3b3VsZCBsZWF2ZSB0aGUgYm9vayBjcm9zc2VkCiAgICAvLyBpZiByZW1haW5pbmcgYW5kIHNlbGYuYmVzdF9hc2tfaWQgIT0gTk9fTElTVElORzoKICAgIGJ6IHBsYWNlX2JpZF9hZnRlcl9pZl9lbHNlQDkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJiZXN0X2Fza19pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X2Fza19pZCBleGlzdHMKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgIT0KICAgIGJ6IHBsYWNlX2JpZF9hZnRlcl9pZl9lbHNlQDkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODQyCiAgICAvLyBpZiBzZWxmLmxpc3RpbmdzW3NlbGYuYmVzdF9hc2tfaWRdLnByaWNlLm5hdGl2ZSA8PSBtYXhfcHJpY2U6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiYmVzdF9hc2tfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9hc2tfaWQgZXhpc3RzCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4NmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZGlnIDUKICAgIDw9CiAgICBieiBwbGFjZV9iaWRfYWZ0ZXJfaWZfZWxzZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg0MwogICAgLy8gcmVtYWluaW5nID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgYnVyeSA4CgpwbGFjZV9iaWRfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NDQKICAgIC8vIGlmIHJlbWFpbmluZzoKICAgIGRpZyA3CiAgICBieiBwbGFjZV9iaWRfYWZ0ZXJfaWZfZWxzZUAxMQogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg0NQogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExOTcKICAgIC8vIGlmIHByZXZfaWQgPT0gTk9fQklEOgogICAgZGlnIDMKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgPT0KICAgIGJ6IHBsYWNlX2JpZF9lbHNlX2JvZHlAMTcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTk4CiAgICAvLyBuZXh0X2lkID0gc2VsZi5iZXN0X2JpZF9pZAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImJlc3RfYmlkX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJlc3RfYmlkX2lkIGV4aXN0cwoKcGxhY2VfYmlkX2FmdGVyX2lmX2Vsc2VAMTg6CiAgICBkaWcgNAogICAgYnVyeSAxMAoKcGxhY2VfYmlkX3doaWxlX3RvcEAxOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjAzCiAgICAvLyB3aGlsZSBuZXh0X2lkICE9IE5PX0JJRDoKICAgIGR1cAogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICAhPQogICAgYnogcGxhY2VfYmlkX2FmdGVyX3doaWxlQDIyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwNAogICAgLy8gZm9sbG93aW5nID0gc2VsZi5iaWRzW25leHRfaWRdLmNvcHkoKQogICAgZHVwCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NjIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBidXJ5IDEzCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iaWRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDUKICAgIC8vIGlmIGZvbGxvd2luZy5wcmljZS5uYXRpdmUgPCBwcmljZToKICAgIHB1c2hpbnQgNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgNgogICAgPAogICAgYm56IHBsYWNlX2JpZF9hZnRlcl93aGlsZUAyMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDgKICAgIC8vIG5leHRfaWQgPSBmb2xsb3dpbmcubmV4dF9iaWQubmF0aXZlCiAgICBkaWcgMTAKICAgIHB1c2hpbnQgNTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBzd2FwCiAgICBidXJ5IDEwCiAgICBiIHBsYWNlX2JpZF93aGlsZV90b3BAMTkKCnBsYWNlX2JpZF9hZnRlcl93aGlsZUAyMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODQ3CiAgICAvLyBiaWRfaWQgPSBzZWxmLmJpZF9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDIzIC8vICJiaWRfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJpZF9jb3VudCBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODQ4CiAgICAvLyBzZWxmLmJpZF9jb3VudCA9IGJpZF9pZCArIFVJbnQ2NCgxKQogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgMjMgLy8gImJpZF9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1MAogICAgLy8gYmlkZGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODUxCiAgICAvLyBxdWFudGl0eT1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgZGlnIDExCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODUzCiAgICAvLyBwcmV2X2JpZD1hcmM0LlVJbnQ2NChwcmV2X2lkKSwKICAgIGRpZyAxNAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1NAogICAgLy8gbmV4dF9iaWQ9YXJjNC5VSW50NjQobmV4dF9pZCksCiAgICB1bmNvdmVyIDcKICAgIGR1cAogICAgY292ZXIgNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NDktMTg1NQogICAgLy8gc2VsZi5iaWRzW2JpZF9pZF0gPSBCaWQoCiAgICAvLyAgICAgYmlkZGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KG1heF9wcmljZSksCiAgICAvLyAgICAgcHJldl9iaWQ9YXJjNC5VSW50NjQocHJldl9pZCksCiAgICAvLyAgICAgbmV4dF9iaWQ9YXJjNC5VSW50NjQobmV4dF9pZCksCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIGRpZyAzCiAgICBjb25jYXQKICAgIGRpZyAxNAogICAgZHVwCiAgICBjb3ZlciA5CiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODQ5CiAgICAvLyBzZWxmLmJpZHNbYmlkX2lkXSA9IEJpZCgKICAgIGRpZyA0CiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NjIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODQ5LTE4NTUKICAgIC8vIHNlbGYuYmlkc1tiaWRfaWRdID0gQmlkKAogICAgLy8gICAgIGJpZGRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgcXVhbnRpdHk9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NChtYXhfcHJpY2UpLAogICAgLy8gICAgIHByZXZfYmlkPWFyYzQuVUludDY0KHByZXZfaWQpLAogICAgLy8gICAgIG5leHRfYmlkPWFyYzQuVUludDY0KG5leHRfaWQpLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1NgogICAgLy8gc2VsZi5fc2V0X2JpZF9uZXh0KHByZXZfaWQsIGJpZF9pZCkKICAgIHVuY292ZXIgMgogICAgZGlnIDQKICAgIGNhbGxzdWIgX3NldF9iaWRfbmV4dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NTcKICAgIC8vIHNlbGYuX3NldF9iaWRfcHJldihuZXh0X2lkLCBiaWRfaWQpCiAgICB1bmNvdmVyIDIKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBfc2V0X2JpZF9wcmV2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1OAogICAgLy8gY29zdCArPSByZW1haW5pbmcgKiBtYXhfcHJpY2UKICAgIHVuY292ZXIgMgogICAgZGlnIDkKICAgICoKICAgIGRpZyA3CiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg1OQogICAgLy8gY29zdCArPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlIC0gbWJyX2JlZm9yZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICB1bmNvdmVyIDcKICAgIC0KICAgICsKICAgIGJ1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NjMKICAgIC8vIGJpZGRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg2MS0xODY2CiAgICAvLyBCaWRQbGFjZWQoCiAgICAvLyAgICAgYmlkX2lkPWFyYzQuVUludDY0KGJpZF9pZCksCiAgICAvLyAgICAgYmlkZGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NChyZW1haW5pbmcpLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KG1heF9wcmljZSksCiAgICAvLyApCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg2MC0xODY3CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQmlkUGxhY2VkKAogICAgLy8gICAgICAgICBiaWRfaWQ9YXJjNC5VSW50NjQoYmlkX2lkKSwKICAgIC8vICAgICAgICAgYmlkZGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgcXVhbnRpdHk9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICAgICAgICAgcHJpY2U9YXJjNC5VSW50NjQobWF4X3ByaWNlKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgzMjA4MzE0YSAvLyBtZXRob2QgIkJpZFBsYWNlZCh1aW50NjQsYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCgpwbGFjZV9iaWRfYWZ0ZXJfaWZfZWxzZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODY5CiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gY29zdCwgImluc3VmZmljaWVudCBwYXltZW50IgogICAgc3dhcAogICAgZ3R4bnMgQW1vdW50CiAgICBkdXAKICAgIGJ1cnkgNwogICAgZHVwCiAgICBkaWcgMwogICAgZHVwCiAgICBjb3ZlciAzCiAgICA+PQogICAgYXNzZXJ0IC8vIGluc3VmZmljaWVudCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg3MAogICAgLy8gaWYgcGF5bWVudC5hbW91bnQgPiBjb3N0OgogICAgPAogICAgYnogcGxhY2VfYmlkX2FmdGVyX2lmX2Vsc2VAMTQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODcxCiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9VHhuLnNlbmRlciwgYW1vdW50PXBheW1lbnQuYW1vdW50IC0gY29zdCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIHR4biBTZW5kZXIKICAgIGRpZyA2CiAgICBkaWcgMwogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCnBsYWNlX2JpZF9hZnRlcl9pZl9lbHNlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NzIKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChiaWRfaWQpCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTc5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgpwbGFjZV9iaWRfZWxzZV9ib2R5QDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDAKICAgIC8vIGhpbnQgPSBzZWxmLl9sb2FkX2JpZChwcmV2X2lkKQogICAgZGlnIDMKICAgIGNhbGxzdWIgX2xvYWRfYmlkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIwMQogICAgLy8gYXNzZXJ0IGhpbnQucHJpY2UubmF0aXZlID49IHByaWNlLCAiYmFkIHByaWNlIGhpbnQiCiAgICBkdXAKICAgIHB1c2hpbnQgNDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgNgogICAgPj0KICAgIGFzc2VydCAvLyBiYWQgcHJpY2UgaGludAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMDIKICAgIC8vIG5leHRfaWQgPSBoaW50Lm5leHRfYmlkLm5hdGl2ZQogICAgcHVzaGludCA1NgogICAgZXh0cmFjdF91aW50NjQKICAgIGIgcGxhY2VfYmlkX2FmdGVyX2lmX2Vsc2VAMTgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5jYW5jZWxfYmlkW3JvdXRpbmddKCkgLT4gdm9pZDoKY2FuY2VsX2JpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODc0CiAgICAvLyBAYXJjNC5hYmltZXRob2QKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGR1cAogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgPT0KICAgIGFzc2VydCAvLyBpbnZhbGlkIG51bWJlciBvZiBieXRlcyBmb3IgYXJjNC51aW50NjQKICAgIGR1cAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4NzcKICAgIC8vIGJpZCA9IHNlbGYuX2xvYWRfYmlkKGJpZF9pZCkKICAgIGR1cAogICAgY2FsbHN1YiBfbG9hZF9iaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODc4CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBiaWQuYmlkZGVyLm5hdGl2ZSwgIm9ubHkgYmlkZGVyIGNhbiBjYW5jZWwiCiAgICB0eG4gU2VuZGVyCiAgICBkaWcgMQogICAgZXh0cmFjdCAwIDMyCiAgICBzd2FwCiAgICBkaWcgMQogICAgPT0KICAgIGFzc2VydCAvLyBvbmx5IGJpZGRlciBjYW4gY2FuY2VsCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg3OQogICAgLy8gcmVmdW5kID0gYmlkLnF1YW50aXR5Lm5hdGl2ZSAqIGJpZC5wcmljZS5uYXRpdmUKICAgIGRpZyAxCiAgICBleHRyYWN0IDMyIDgKICAgIGRpZyAyCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgdW5jb3ZlciAzCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4ODAKICAgIC8vIHJlZnVuZCArPSBzZWxmLl9kZWxldGVfYmlkKGJpZF9pZCkKICAgIHVuY292ZXIgMwogICAgY2FsbHN1YiBfZGVsZXRlX2JpZAogICAgKwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4ODEKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1UeG4uc2VuZGVyLCBhbW91bnQ9cmVmdW5kKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODgzLTE4ODcKICAgIC8vIEJpZENhbmNlbGxlZCgKICAgIC8vICAgICBiaWRfaWQ9YXJjNC5VSW50NjQoYmlkX2lkKSwKICAgIC8vICAgICBiaWRkZXI9YmlkLmJpZGRlciwKICAgIC8vICAgICBxdWFudGl0eT1iaWQucXVhbnRpdHksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4ODItMTg4OAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIEJpZENhbmNlbGxlZCgKICAgIC8vICAgICAgICAgYmlkX2lkPWFyYzQuVUludDY0KGJpZF9pZCksCiAgICAvLyAgICAgICAgIGJpZGRlcj1iaWQuYmlkZGVyLAogICAgLy8gICAgICAgICBxdWFudGl0eT1iaWQucXVhbnRpdHksCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgYnl0ZWMgMzEgLy8gbWV0aG9kICJCaWRDYW5jZWxsZWQodWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg3NAogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuY2xhaW1bcm91dGluZ10oKSAtPiB2b2lkOgpjbGFpbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxODk5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciBpbiBzZWxmLmNsYWltcywgIm5vdGhpbmcgdG8gY2xhaW0iCiAgICBieXRlYyAxMyAvLyAweDZiCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIG5vdGhpbmcgdG8gY2xhaW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTAwCiAgICAvLyBjbGFpbSA9IHNlbGYuY2xhaW1zW1R4bi5zZW5kZXJdLmNvcHkoKQogICAgYnl0ZWMgMTMgLy8gMHg2YgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jbGFpbXMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkwMQogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MDIKICAgIC8vIGRlbCBzZWxmLmNsYWltc1tUeG4uc2VuZGVyXQogICAgYnl0ZWMgMTMgLy8gMHg2YgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTAzCiAgICAvLyBhbGdvID0gY2xhaW0uYWxnby5uYXRpdmUgKyBtYnJfYmVmb3JlIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgKwogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAtCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkwNAogICAgLy8gaWYgY2xhaW0udG9rZW5zLm5hdGl2ZToKICAgIGR1cAogICAgZXh0cmFjdCA4IDgKICAgIHN3YXAKICAgIGludGNfMiAvLyA4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBieiBjbGFpbV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTA1LTE5MDkKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9Y2xhaW0udG9rZW5zLm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTA2CiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkwNwogICAgLy8gYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIHR4biBTZW5kZXIKICAgIGRpZyA0CiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBpdHhuX2ZpZWxkIEFzc2V0UmVjZWl2ZXIKICAgIGl0eG5fZmllbGQgWGZlckFzc2V0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkwNQogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTA1LTE5MDkKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9VHhuLnNlbmRlciwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9Y2xhaW0udG9rZW5zLm5hdGl2ZSwKICAgIC8vICkuc3VibWl0KCkKICAgIGl0eG5fc3VibWl0CgpjbGFpbV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkxMAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1hbGdvKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkxMwogICAgLy8gYWNjb3VudD1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkxNAogICAgLy8gYWxnbz1hcmM0LlVJbnQ2NChhbGdvKSwKICAgIHN3YXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTEyLTE5MTYKICAgIC8vIENsYWltZWQoCiAgICAvLyAgICAgYWNjb3VudD1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgYWxnbz1hcmM0LlVJbnQ2NChhbGdvKSwKICAgIC8vICAgICB0b2tlbnM9Y2xhaW0udG9rZW5zLAogICAgLy8gKQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTExLTE5MTcKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBDbGFpbWVkKAogICAgLy8gICAgICAgICBhY2NvdW50PWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYWxnbz1hcmM0LlVJbnQ2NChhbGdvKSwKICAgIC8vICAgICAgICAgdG9rZW5zPWNsYWltLnRva2VucywKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhiYmNjNjYwOSAvLyBtZXRob2QgIkNsYWltZWQoYWRkcmVzcyx1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTg5MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RfY291bnRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvamVjdF9jb3VudDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTI5CiAgICAvLyByZXR1cm4gYXJjNC5VSW50NjQoc2VsZi5wcm9qZWN0X2NvdW50KQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTI3CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2Fzc2V0X2lkW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2Fzc2V0X2lkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MzMKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NChzZWxmLmFhcm5hX2Fzc2V0LmlkKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfYWRtaW5bcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWRtaW46CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkzNwogICAgLy8gcmV0dXJuIHNlbGYuYWRtaW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMSAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTkzNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF92YWxpZGF0b3Jbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdmFsaWRhdG9yOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NDEKICAgIC8vIHJldHVybiBzZWxmLnZhbGlkYXRvcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE1IC8vICJ2YWxpZGF0b3IiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudmFsaWRhdG9yIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MzkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfdG90YWxfY3JlZGl0c19pc3N1ZWRbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfdG90YWxfY3JlZGl0c19pc3N1ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk0NQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOCAvLyAidG90YWxfY3JlZGl0c19pc3N1ZWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudG90YWxfY3JlZGl0c19pc3N1ZWQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk0MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9zdGF0dXNfY291bnRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3N0YXR1c19jb3VudHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk1MAogICAgLy8gcmV0dXJuIHNlbGYuc3RhdHVzX2NvdW50cwogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vICJzdGF0dXNfY291bnRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1c19jb3VudHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk0NwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9lY29zeXN0ZW1fdG90YWxzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2Vjb3N5c3RlbV90b3RhbHM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NTYKICAgIC8vIHNlbGYuX2Vjb3N5c3RlbV9jb2RlKGVjb3N5c3RlbS5uYXRpdmUpLAogICAgZXh0cmFjdCAyIDAKICAgIGNhbGxzdWIgX2Vjb3N5c3RlbV9jb2RlCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk1NQogICAgLy8gcmV0dXJuIHNlbGYuZWNvc3lzdGVtX3RvdGFscy5nZXQoCiAgICBwdXNoYnl0ZXMgMHg2NQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NTUtMTk2MQogICAgLy8gcmV0dXJuIHNlbGYuZWNvc3lzdGVtX3RvdGFscy5nZXQoCiAgICAvLyAgICAgc2VsZi5fZWNvc3lzdGVtX2NvZGUoZWNvc3lzdGVtLm5hdGl2ZSksCiAgICAvLyAgICAgZGVmYXVsdD1Qcm9qZWN0VG90YWxzKAogICAgLy8gICAgICAgICBieV9zdGF0dXM9U3RhdHVzQ291bnRzLmZyb21fYnl0ZXMob3AuYnplcm8oNSAqIDgpKSwKICAgIC8vICAgICAgICAgY3JlZGl0c19pc3N1ZWQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NTctMTk2MAogICAgLy8gZGVmYXVsdD1Qcm9qZWN0VG90YWxzKAogICAgLy8gICAgIGJ5X3N0YXR1cz1TdGF0dXNDb3VudHMuZnJvbV9ieXRlcyhvcC5iemVybyg1ICogOCkpLAogICAgLy8gICAgIGNyZWRpdHNfaXNzdWVkPWFyYzQuVUludDY0KDApLAogICAgLy8gKSwKICAgIGJ5dGVjIDMyIC8vIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk1NS0xOTYxCiAgICAvLyByZXR1cm4gc2VsZi5lY29zeXN0ZW1fdG90YWxzLmdldCgKICAgIC8vICAgICBzZWxmLl9lY29zeXN0ZW1fY29kZShlY29zeXN0ZW0ubmF0aXZlKSwKICAgIC8vICAgICBkZWZhdWx0PVByb2plY3RUb3RhbHMoCiAgICAvLyAgICAgICAgIGJ5X3N0YXR1cz1TdGF0dXNDb3VudHMuZnJvbV9ieXRlcyhvcC5iemVybyg1ICogOCkpLAogICAgLy8gICAgICAgICBjcmVkaXRzX2lzc3VlZD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICApLAogICAgLy8gKQogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk1MgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk2MwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NjYKICAgIC8vIHJldHVybiBzZWxmLl9kZWNvZGVfcHJvamVjdChzZWxmLl9sb2FkX3Byb2plY3QocHJvamVjdF9pZCkpCiAgICBjYWxsc3ViIF9sb2FkX3Byb2plY3QKICAgIGNhbGxzdWIgX2RlY29kZV9wcm9qZWN0CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTYzCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X3Byb2plY3RzX3BhZ2Vbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfcHJvamVjdHNfcGFnZToKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5NzcKICAgIC8vIHBhZ2UgPSBhcmM0LkR5bmFtaWNBcnJheVtQcm9qZWN0XSgpCiAgICBieXRlYyAyMSAvLyAweDAwMDAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTc4CiAgICAvLyBmb3IgcHJvamVjdF9pZCBpbiB1cmFuZ2Uoc3RhcnQsIHNlbGYuX3BhZ2VfZW5kKHN0YXJ0LCBjb3VudCwgc2VsZi5wcm9qZWN0X2NvdW50KSk6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNyAvLyAicHJvamVjdF9jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgZGlnIDIKICAgIGNvdmVyIDIKICAgIGNhbGxzdWIgX3BhZ2VfZW5kCiAgICBjb3ZlciAyCgpnZXRfcHJvamVjdHNfcGFnZV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk3OAogICAgLy8gZm9yIHByb2plY3RfaWQgaW4gdXJhbmdlKHN0YXJ0LCBzZWxmLl9wYWdlX2VuZChzdGFydCwgY291bnQsIHNlbGYucHJvamVjdF9jb3VudCkpOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTc5CiAgICAvLyBwcm9qZWN0ID0gc2VsZi5fZGVjb2RlX3Byb2plY3Qoc2VsZi5wcm9qZWN0c1twcm9qZWN0X2lkXS5jb3B5KCkpCiAgICBkdXAKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdHMgZW50cnkgZXhpc3RzCiAgICBjYWxsc3ViIF9kZWNvZGVfcHJvamVjdAogICAgcG9wCiAgICBkdXAKICAgIGJ1cnkgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5ODAtMTk4MQogICAgLy8gIyBFYWNoIGR5bmFtaWMgZWxlbWVudCBhbHNvIGNvc3RzIGEgMi1ieXRlIG9mZnNldCBpbiB0aGUgYXJyYXkgaGVhZAogICAgLy8gaWYgcGFnZS5ieXRlcy5sZW5ndGggKyBwcm9qZWN0LmJ5dGVzLmxlbmd0aCArIFVJbnQ2NCgyKSA+IE1BWF9QQUdFX0JZVEVTOgogICAgZGlnIDIKICAgIGxlbgogICAgc3dhcAogICAgbGVuCiAgICArCiAgICBpbnRjXzMgLy8gMgogICAgKwogICAgaW50YyA4IC8vIDEwMDAKICAgID4KICAgIGJueiBnZXRfcHJvamVjdHNfcGFnZV9hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5ODMKICAgIC8vIHBhZ2UuYXBwZW5kKHByb2plY3QuY29weSgpKQogICAgcHVzaGJ5dGVzIDB4MDAwMgogICAgZGlnIDUKICAgIGNvbmNhdAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk4MwogICAgLy8gcGFnZS5hcHBlbmQocHJvamVjdC5jb3B5KCkpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDAKICAgIGNvdmVyIDMKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBzd2FwCiAgICBpbnRjXzMgLy8gMgogICAgKgogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgNwoKZ2V0X3Byb2plY3RzX3BhZ2VfZm9yX2hlYWRlckA5OgogICAgZGlnIDYKICAgIGRpZyAzCiAgICA8CiAgICBieiBnZXRfcHJvamVjdHNfcGFnZV9hZnRlcl9mb3JAMTEKICAgIGR1cAogICAgZGlnIDcKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgdW5jb3ZlciA1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDQKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBidXJ5IDcKICAgIGIgZ2V0X3Byb2plY3RzX3BhZ2VfZm9yX2hlYWRlckA5CgpnZXRfcHJvamVjdHNfcGFnZV9hZnRlcl9mb3JAMTE6CiAgICBkdXAKICAgIGxlbgogICAgY292ZXIgMwogICAgaW50Y18wIC8vIDAKICAgIGJ1cnkgOAoKZ2V0X3Byb2plY3RzX3BhZ2VfZm9yX2hlYWRlckAxMjoKICAgIGRpZyA3CiAgICBpbnRjXzMgLy8gMgogICAgPAogICAgYnogZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfZm9yQDE0CiAgICBkaWcgNQogICAgZGlnIDgKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIGRpZyA1CiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgdW5jb3ZlciA2CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDUKICAgIGludGNfMyAvLyAyCiAgICArCiAgICBidXJ5IDgKICAgIGIgZ2V0X3Byb2plY3RzX3BhZ2VfZm9yX2hlYWRlckAxMgoKZ2V0X3Byb2plY3RzX3BhZ2VfYWZ0ZXJfZm9yQDE0OgogICAgdW5jb3ZlciAyCiAgICB1bmNvdmVyIDMKICAgIHN1YnN0cmluZzMKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3QgMiAwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTc4CiAgICAvLyBmb3IgcHJvamVjdF9pZCBpbiB1cmFuZ2Uoc3RhcnQsIHNlbGYuX3BhZ2VfZW5kKHN0YXJ0LCBjb3VudCwgc2VsZi5wcm9qZWN0X2NvdW50KSk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYiBnZXRfcHJvamVjdHNfcGFnZV9mb3JfaGVhZGVyQDIKCmdldF9wcm9qZWN0c19wYWdlX2FmdGVyX2ZvckA3OgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk2OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wZW5kaW5nW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X3BlbmRpbmc6CiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk4NgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5OTMKICAgIC8vIHBhZ2UgPSBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF0oKQogICAgYnl0ZWMgMjEgLy8gMHgwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk5NAogICAgLy8gcHJvamVjdF9pZCA9IHNlbGYucGVuZGluZ19oZWFkCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTcgLy8gInBlbmRpbmdfaGVhZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX2hlYWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk5NQogICAgLy8gc2tpcHBlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKCmdldF9wZW5kaW5nX3doaWxlX3RvcEAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5OTYKICAgIC8vIHdoaWxlIHByb2plY3RfaWQgIT0gTk9fUFJPSkVDVCBhbmQgcGFnZS5sZW5ndGggPCBjb3VudDoKICAgIGRpZyAxCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgICE9CiAgICBieiBnZXRfcGVuZGluZ19hZnRlcl93aGlsZUAxMAogICAgZGlnIDIKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNiAvLyBvbiBlcnJvcjogaW52YWxpZCBhcnJheSBsZW5ndGggaGVhZGVyCiAgICBkdXAKICAgIGJ1cnkgNwogICAgZGlnIDQKICAgIDwKICAgIGJ6IGdldF9wZW5kaW5nX2FmdGVyX3doaWxlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTk5NwogICAgLy8gaWYgc2tpcHBlZCA8IHN0YXJ0OgogICAgZHVwCiAgICBkaWcgNQogICAgPAogICAgYnogZ2V0X3BlbmRpbmdfZWxzZV9ib2R5QDYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTk4CiAgICAvLyBza2lwcGVkICs9IDEKICAgIGludGNfMSAvLyAxCiAgICArCgpnZXRfcGVuZGluZ19hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAwMwogICAgLy8gcHJvamVjdF9pZCA9IHNlbGYucGVuZGluZ19xdWV1ZVtwcm9qZWN0X2lkXS5uZXh0X3BlbmRpbmcubmF0aXZlCiAgICBzd2FwCiAgICBpdG9iCiAgICBieXRlYyAxNCAvLyAweDcxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBlbmRpbmdfcXVldWUgZW50cnkgZXhpc3RzCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIHN3YXAKICAgIGIgZ2V0X3BlbmRpbmdfd2hpbGVfdG9wQDIKCmdldF9wZW5kaW5nX2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDAKICAgIC8vIGlmIHBhZ2UuYnl0ZXMubGVuZ3RoICsgVUludDY0KDgpID4gTUFYX1BBR0VfQllURVM6CiAgICBkaWcgMgogICAgbGVuCiAgICBpbnRjXzIgLy8gOAogICAgKwogICAgaW50YyA4IC8vIDEwMDAKICAgID4KICAgIGJueiBnZXRfcGVuZGluZ19hZnRlcl93aGlsZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMDIKICAgIC8vIHBhZ2UuYXBwZW5kKGFyYzQuVUludDY0KHByb2plY3RfaWQpKQogICAgZGlnIDEKICAgIGl0b2IKICAgIGRpZyA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAwMgogICAgLy8gcGFnZS5hcHBlbmQoYXJjNC5VSW50NjQocHJvamVjdF9pZCkpCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDAKICAgIHVuY292ZXIgNAogICAgc3dhcAogICAgcmVwbGFjZTIgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBjb3ZlciAyCiAgICBiIGdldF9wZW5kaW5nX2FmdGVyX2lmX2Vsc2VAOQoKZ2V0X3BlbmRpbmdfYWZ0ZXJfd2hpbGVAMTA6CiAgICBwb3BuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxOTg2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2FjY291bnRfcHJvamVjdHNbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWNjb3VudF9wcm9qZWN0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDA2CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAxMgogICAgLy8gQnl0ZXMoU1VCTUlUVEVSX0lOREVYX1BSRUZJWCkgKyBhY2NvdW50LmJ5dGVzLCBzdGFydCwgY291bnQKICAgIGJ5dGVjIDMzIC8vIDB4NzM3MAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDExLTIwMTMKICAgIC8vIHJldHVybiBzZWxmLl9pbmRleF9wYWdlKAogICAgLy8gICAgIEJ5dGVzKFNVQk1JVFRFUl9JTkRFWF9QUkVGSVgpICsgYWNjb3VudC5ieXRlcywgc3RhcnQsIGNvdW50CiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjYWxsc3ViIF9pbmRleF9wYWdlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAwNgogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9hY2NvdW50X2xpc3RpbmdzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2FjY291bnRfbGlzdGluZ3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAxNQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMjEKICAgIC8vIEJ5dGVzKFNFTExFUl9JTkRFWF9QUkVGSVgpICsgYWNjb3VudC5ieXRlcywgc3RhcnQsIGNvdW50CiAgICBieXRlYyAyOSAvLyAweDczNmMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAyMC0yMDIyCiAgICAvLyByZXR1cm4gc2VsZi5faW5kZXhfcGFnZSgKICAgIC8vICAgICBCeXRlcyhTRUxMRVJfSU5ERVhfUFJFRklYKSArIGFjY291bnQuYnl0ZXMsIHN0YXJ0LCBjb3VudAogICAgLy8gKQogICAgY292ZXIgMgogICAgY2FsbHN1YiBfaW5kZXhfcGFnZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMTUKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5maW5kX3Byb2plY3RfYnlfY2lkW3JvdXRpbmddKCkgLT4gdm9pZDoKZmluZF9wcm9qZWN0X2J5X2NpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDI0CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAzMgogICAgLy8gU1VCTUlUX0JVREdFVF9QRVJfQ0lEX0NIQVIgKiBjaWQubmF0aXZlLmJ5dGVzLmxlbmd0aCwKICAgIGV4dHJhY3QgMiAwCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCA2MAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMzMKICAgIC8vIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMzEtMjAzNAogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBTVUJNSVRfQlVER0VUX1BFUl9DSURfQ0hBUiAqIGNpZC5uYXRpdmUuYnl0ZXMubGVuZ3RoLAogICAgLy8gICAgIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDM3CiAgICAvLyBvcC5zaGEyNTYoc2VsZi5fcGFja19jaWQoY2lkLm5hdGl2ZSkpLCBkZWZhdWx0PVVJbnQ2NChOT19QUk9KRUNUKQogICAgY2FsbHN1YiBfcGFja19jaWQKICAgIHNoYTI1NgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMzYKICAgIC8vIHNlbGYuY2lkX2luZGV4LmdldCgKICAgIHB1c2hieXRlcyAweDYzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjAzNi0yMDM4CiAgICAvLyBzZWxmLmNpZF9pbmRleC5nZXQoCiAgICAvLyAgICAgb3Auc2hhMjU2KHNlbGYuX3BhY2tfY2lkKGNpZC5uYXRpdmUpKSwgZGVmYXVsdD1VSW50NjQoTk9fUFJPSkVDVCkKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMzcKICAgIC8vIG9wLnNoYTI1NihzZWxmLl9wYWNrX2NpZChjaWQubmF0aXZlKSksIGRlZmF1bHQ9VUludDY0KE5PX1BST0pFQ1QpCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDM2LTIwMzgKICAgIC8vIHNlbGYuY2lkX2luZGV4LmdldCgKICAgIC8vICAgICBvcC5zaGEyNTYoc2VsZi5fcGFja19jaWQoY2lkLm5hdGl2ZSkpLCBkZWZhdWx0PVVJbnQ2NChOT19QUk9KRUNUKQogICAgLy8gKQogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDM1LTIwMzkKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NCgKICAgIC8vICAgICBzZWxmLmNpZF9pbmRleC5nZXQoCiAgICAvLyAgICAgICAgIG9wLnNoYTI1NihzZWxmLl9wYWNrX2NpZChjaWQubmF0aXZlKSksIGRlZmF1bHQ9VUludDY0KE5PX1BST0pFQ1QpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwMjQKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfZXZpZGVuY2Vfcm9vdFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9ldmlkZW5jZV9yb290OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNDEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDQ1CiAgICAvLyBwcm9qZWN0X2lkLAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNDQKICAgIC8vIHJldHVybiBzZWxmLmV2aWRlbmNlX3Jvb3RzLmdldCgKICAgIGJ5dGVjIDI4IC8vIDB4NmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDQ0LTIwNDkKICAgIC8vIHJldHVybiBzZWxmLmV2aWRlbmNlX3Jvb3RzLmdldCgKICAgIC8vICAgICBwcm9qZWN0X2lkLAogICAgLy8gICAgIGRlZmF1bHQ9RXZpZGVuY2VSb290KAogICAgLy8gICAgICAgICByb290PUhhc2guZnJvbV9ieXRlcyhvcC5iemVybygzMikpLCBsZWFmX2NvdW50PWFyYzQuVUludDY0KDApCiAgICAvLyAgICAgKSwKICAgIC8vICkKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNDYtMjA0OAogICAgLy8gZGVmYXVsdD1FdmlkZW5jZVJvb3QoCiAgICAvLyAgICAgcm9vdD1IYXNoLmZyb21fYnl0ZXMob3AuYnplcm8oMzIpKSwgbGVhZl9jb3VudD1hcmM0LlVJbnQ2NCgwKQogICAgLy8gKSwKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA0NC0yMDQ5CiAgICAvLyByZXR1cm4gc2VsZi5ldmlkZW5jZV9yb290cy5nZXQoCiAgICAvLyAgICAgcHJvamVjdF9pZCwKICAgIC8vICAgICBkZWZhdWx0PUV2aWRlbmNlUm9vdCgKICAgIC8vICAgICAgICAgcm9vdD1IYXNoLmZyb21fYnl0ZXMob3AuYnplcm8oMzIpKSwgbGVhZl9jb3VudD1hcmM0LlVJbnQ2NCgwKQogICAgLy8gICAgICksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDQxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkudmVyaWZ5X2luY2x1c2lvbltyb3V0aW5nXSgpIC0+IHZvaWQ6CnZlcmlmeV9pbmNsdXNpb246CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNjQKICAgIC8vIGFzc2VydCBwcm9qZWN0X2lkIGluIHNlbGYuZXZpZGVuY2Vfcm9vdHMsICJubyBldmlkZW5jZSByb290IgogICAgdW5jb3ZlciAyCiAgICBpdG9iCiAgICBieXRlYyAyOCAvLyAweDZkCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gbm8gZXZpZGVuY2Ugcm9vdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNjUKICAgIC8vIGNvbW1pdG1lbnQgPSBzZWxmLmV2aWRlbmNlX3Jvb3RzW3Byb2plY3RfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA2NwogICAgLy8gVkVSSUZZX0JVREdFVCArIFZFUklGWV9CVURHRVRfUEVSX0xFVkVMICogcHJvb2YubGVuZ3RoLAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgcHVzaGludCA2MAogICAgKgogICAgcHVzaGludCAxNTAKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDY4CiAgICAvLyBPcFVwRmVlU291cmNlLkdyb3VwQ3JlZGl0LAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDY2LTIwNjkKICAgIC8vIGVuc3VyZV9idWRnZXQoCiAgICAvLyAgICAgVkVSSUZZX0JVREdFVCArIFZFUklGWV9CVURHRVRfUEVSX0xFVkVMICogcHJvb2YubGVuZ3RoLAogICAgLy8gICAgIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQsCiAgICAvLyApCiAgICBjYWxsc3ViIGVuc3VyZV9idWRnZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDcxCiAgICAvLyBub2RlID0gb3Auc2hhMjU2KEJ5dGVzKE1FUktMRV9MRUFGX1BSRUZJWCkgKyBsZWFmLm5hdGl2ZSkKICAgIHN3YXAKICAgIGV4dHJhY3QgMiAwCiAgICBwdXNoYnl0ZXMgMHgwMAogICAgc3dhcAogICAgY29uY2F0CiAgICBzaGEyNTYKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDcyLTIwNzMKICAgIC8vICMgV2FsayB0aGUgcGFja2VkIGhhc2hlcyBkaXJlY3RseSwgcGFzdCB0aGUgYXJyYXkncyBsZW5ndGggcHJlZml4CiAgICAvLyBzaWJsaW5ncyA9IHByb29mLmJ5dGVzWzI6XQogICAgZHVwCiAgICBsZW4KICAgIGludGNfMyAvLyAyCiAgICBkaWcgMQogICAgPj0KICAgIGludGNfMyAvLyAyCiAgICBkaWcgMgogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN3YXAKICAgIHN1YnN0cmluZzMKICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNzQKICAgIC8vIGZvciBvZmZzZXQgaW4gdXJhbmdlKDAsIHNpYmxpbmdzLmxlbmd0aCwgMzIpOgogICAgbGVuCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAoKdmVyaWZ5X2luY2x1c2lvbl9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3NAogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMCwgc2libGluZ3MubGVuZ3RoLCAzMik6CiAgICBkdXAKICAgIGRpZyAzCiAgICA8CiAgICBieiB2ZXJpZnlfaW5jbHVzaW9uX2FmdGVyX2ZvckA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3NQogICAgLy8gc2libGluZyA9IG9wLmV4dHJhY3Qoc2libGluZ3MsIG9mZnNldCwgMzIpCiAgICBkaWcgMwogICAgZGlnIDEKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3QzCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDc2CiAgICAvLyBpZiBCaWdVSW50LmZyb21fYnl0ZXMoc2libGluZykgPCBCaWdVSW50LmZyb21fYnl0ZXMobm9kZSk6CiAgICBkaWcgMwogICAgYjwKICAgIGJ6IHZlcmlmeV9pbmNsdXNpb25fZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDc3CiAgICAvLyBub2RlID0gb3Auc2hhMjU2KEJ5dGVzKE1FUktMRV9OT0RFX1BSRUZJWCkgKyBzaWJsaW5nICsgbm9kZSkKICAgIGJ5dGVjIDIyIC8vIDB4MDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHNoYTI1NgogICAgc3dhcAoKdmVyaWZ5X2luY2x1c2lvbl9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3NAogICAgLy8gZm9yIG9mZnNldCBpbiB1cmFuZ2UoMCwgc2libGluZ3MubGVuZ3RoLCAzMik6CiAgICBwdXNoaW50IDMyCiAgICArCiAgICBiIHZlcmlmeV9pbmNsdXNpb25fZm9yX2hlYWRlckAyCgp2ZXJpZnlfaW5jbHVzaW9uX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwNzkKICAgIC8vIG5vZGUgPSBvcC5zaGEyNTYoQnl0ZXMoTUVSS0xFX05PREVfUFJFRklYKSArIG5vZGUgKyBzaWJsaW5nKQogICAgYnl0ZWMgMjIgLy8gMHgwMQogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc2hhMjU2CiAgICBzd2FwCiAgICBiIHZlcmlmeV9pbmNsdXNpb25fYWZ0ZXJfaWZfZWxzZUA2Cgp2ZXJpZnlfaW5jbHVzaW9uX2FmdGVyX2ZvckA4OgogICAgcG9wCiAgICBidXJ5IDEKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwODAKICAgIC8vIHJldHVybiBhcmM0LkJvb2wobm9kZSA9PSBjb21taXRtZW50LnJvb3QuYnl0ZXMpCiAgICBzd2FwCiAgICBleHRyYWN0IDAgMzIKICAgID09CiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA1MQogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9wcm9qZWN0X2NpZFtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9wcm9qZWN0X2NpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDgyCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA4NAogICAgLy8gcmV0dXJuIGFyYzQuU3RyaW5nKHNlbGYuX3VucGFja19jaWQoc2VsZi5fbG9hZF9wcm9qZWN0KHByb2plY3RfaWQpLmNpZC5uYXRpdmUpKQogICAgY2FsbHN1YiBfbG9hZF9wcm9qZWN0CiAgICBkdXAKICAgIHB1c2hpbnQgNDEKICAgIGV4dHJhY3RfdWludDE2CiAgICBkaWcgMQogICAgcHVzaGludCA0MwogICAgZXh0cmFjdF91aW50MTYKICAgIHN1YnN0cmluZzMKICAgIGV4dHJhY3QgMiAwCiAgICBjYWxsc3ViIF91bnBhY2tfY2lkCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwODIKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfbWFya2V0X3N0YXRzW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X21hcmtldF9zdGF0czoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDk0CiAgICAvLyBjdXJyZW50LCBwcmV2aW91cyA9IHNlbGYuX3RyYWRlX3dpbmRvd3MoKQogICAgY2FsbHN1YiBfdHJhZGVfd2luZG93cwogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIwOTUKICAgIC8vIHZ3YXAgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA5NgogICAgLy8gaWYgc2VsZi50cmFkZV92b2x1bWU6CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAidHJhZGVfdm9sdW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYWRlX3ZvbHVtZSBleGlzdHMKICAgIGJ6IGdldF9tYXJrZXRfc3RhdHNfYWZ0ZXJfaWZfZWxzZUAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA5NwogICAgLy8gdndhcCA9IHNlbGYudHJhZGVfbm90aW9uYWwgLy8gc2VsZi50cmFkZV92b2x1bWUKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxMiAvLyAidHJhZGVfbm90aW9uYWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJhZGVfbm90aW9uYWwgZXhpc3RzCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAidHJhZGVfdm9sdW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYWRlX3ZvbHVtZSBleGlzdHMKICAgIC8KICAgIGJ1cnkgMwoKZ2V0X21hcmtldF9zdGF0c19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA5OQogICAgLy8gdm9sdW1lPWFyYzQuVUludDY0KHNlbGYudHJhZGVfdm9sdW1lKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJ0cmFkZV92b2x1bWUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJhZGVfdm9sdW1lIGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMDAKICAgIC8vIG5vdGlvbmFsPWFyYzQuVUludDY0KHNlbGYudHJhZGVfbm90aW9uYWwpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDEyIC8vICJ0cmFkZV9ub3Rpb25hbCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi50cmFkZV9ub3Rpb25hbCBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTAxCiAgICAvLyB0cmFkZV9jb3VudD1hcmM0LlVJbnQ2NChzZWxmLnRyYWRlX2NvdW50KSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyMCAvLyAidHJhZGVfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudHJhZGVfY291bnQgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEwMgogICAgLy8gdndhcD1hcmM0LlVJbnQ2NCh2d2FwKSwKICAgIGRpZyA1CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEwMwogICAgLy8gbGFzdF9wcmljZT1hcmM0LlVJbnQ2NChzZWxmLmxhc3RfcHJpY2UpLAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI0IC8vICJsYXN0X3ByaWNlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxhc3RfcHJpY2UgZXhpc3RzCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEwNAogICAgLy8gbGFzdF90cmFkZV90aW1lPWFyYzQuVUludDY0KHNlbGYubGFzdF90cmFkZV90aW1lKSwKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNSAvLyAibGFzdF90cmFkZV90aW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxhc3RfdHJhZGVfdGltZSBleGlzdHMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMDk4LTIxMDcKICAgIC8vIHJldHVybiBNYXJrZXRTdGF0cygKICAgIC8vICAgICB2b2x1bWU9YXJjNC5VSW50NjQoc2VsZi50cmFkZV92b2x1bWUpLAogICAgLy8gICAgIG5vdGlvbmFsPWFyYzQuVUludDY0KHNlbGYudHJhZGVfbm90aW9uYWwpLAogICAgLy8gICAgIHRyYWRlX2NvdW50PWFyYzQuVUludDY0KHNlbGYudHJhZGVfY291bnQpLAogICAgLy8gICAgIHZ3YXA9YXJjNC5VSW50NjQodndhcCksCiAgICAvLyAgICAgbGFzdF9wcmljZT1hcmM0LlVJbnQ2NChzZWxmLmxhc3RfcHJpY2UpLAogICAgLy8gICAgIGxhc3RfdHJhZGVfdGltZT1hcmM0LlVJbnQ2NChzZWxmLmxhc3RfdHJhZGVfdGltZSksCiAgICAvLyAgICAgY3VycmVudD1jdXJyZW50LmNvcHkoKSwKICAgIC8vICAgICBwcmV2aW91cz1wcmV2aW91cy5jb3B5KCksCiAgICAvLyApCiAgICB1bmNvdmVyIDUKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICB1bmNvdmVyIDQKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjA4OAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9saXN0aW5nX2NvdW50W3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2xpc3RpbmdfY291bnQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjExMQogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KHNlbGYubGlzdGluZ19jb3VudCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxOSAvLyAibGlzdGluZ19jb3VudCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saXN0aW5nX2NvdW50IGV4aXN0cwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMDkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfYmVzdF9hc2tbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYmVzdF9hc2s6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEyMAogICAgLy8gbGlzdGluZ19pZCA9IHNlbGYuX2FjdGl2ZV9hc2soc2VsZi5iZXN0X2Fza19pZCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJiZXN0X2Fza19pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X2Fza19pZCBleGlzdHMKICAgIGNhbGxzdWIgX2FjdGl2ZV9hc2sKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMjEKICAgIC8vIGlmIGxpc3RpbmdfaWQgIT0gTk9fTElTVElORzoKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgIT0KICAgIGJ6IGdldF9iZXN0X2Fza19hZnRlcl9pZl9lbHNlQDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTIyCiAgICAvLyByZXR1cm4gc2VsZi5fbGlzdGluZ192aWV3KGxpc3RpbmdfaWQpCiAgICBjYWxsc3ViIF9saXN0aW5nX3ZpZXcKCmdldF9iZXN0X2Fza19hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9iZXN0X2Fza0A0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMTMKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCmdldF9iZXN0X2Fza19hZnRlcl9pZl9lbHNlQDM6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTIzLTIxMjkKICAgIC8vIHJldHVybiBMaXN0aW5nVmlldygKICAgIC8vICAgICBsaXN0aW5nX2lkPWFyYzQuVUludDY0KE5PX0xJU1RJTkcpLAogICAgLy8gICAgIHNlbGxlcj1hcmM0LkFkZHJlc3MoR2xvYmFsLnplcm9fYWRkcmVzcyksCiAgICAvLyAgICAgYW1vdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIGV4cGlyZXNfcm91bmQ9YXJjNC5VSW50NjQoMCksCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgYmFzZTMyKDc3Nzc3Nzc3Nzc3NzZBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUEpCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjExMwogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYiBnZXRfYmVzdF9hc2tfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfYmVzdF9hc2tANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9jbGFpbVtyb3V0aW5nXSgpIC0+IHZvaWQ6CmdldF9jbGFpbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTM0CiAgICAvLyByZXR1cm4gc2VsZi5jbGFpbXMuZ2V0KAogICAgYnl0ZWMgMTMgLy8gMHg2YgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMzEKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTM0LTIxMzYKICAgIC8vIHJldHVybiBzZWxmLmNsYWltcy5nZXQoCiAgICAvLyAgICAgYWNjb3VudCwgZGVmYXVsdD1DbGFpbShhbGdvPWFyYzQuVUludDY0KDApLCB0b2tlbnM9YXJjNC5VSW50NjQoMCkpCiAgICAvLyApCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTM1CiAgICAvLyBhY2NvdW50LCBkZWZhdWx0PUNsYWltKGFsZ289YXJjNC5VSW50NjQoMCksIHRva2Vucz1hcmM0LlVJbnQ2NCgwKSkKICAgIGJ5dGVjIDM0IC8vIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTM0LTIxMzYKICAgIC8vIHJldHVybiBzZWxmLmNsYWltcy5nZXQoCiAgICAvLyAgICAgYWNjb3VudCwgZGVmYXVsdD1DbGFpbShhbGdvPWFyYzQuVUludDY0KDApLCB0b2tlbnM9YXJjNC5VSW50NjQoMCkpCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTMxCiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2Jlc3RfYmlkW3JvdXRpbmddKCkgLT4gdm9pZDoKZ2V0X2Jlc3RfYmlkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNDQKICAgIC8vIGlmIHNlbGYuYmVzdF9iaWRfaWQgPT0gTk9fQklEOgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDYgLy8gImJlc3RfYmlkX2lkIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJlc3RfYmlkX2lkIGV4aXN0cwogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICA9PQogICAgYnogZ2V0X2Jlc3RfYmlkX2FmdGVyX2lmX2Vsc2VAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNDUtMjE1MAogICAgLy8gcmV0dXJuIEJpZFZpZXcoCiAgICAvLyAgICAgYmlkX2lkPWFyYzQuVUludDY0KE5PX0JJRCksCiAgICAvLyAgICAgYmlkZGVyPWFyYzQuQWRkcmVzcyhHbG9iYWwuemVyb19hZGRyZXNzKSwKICAgIC8vICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICkKICAgIHB1c2hieXRlcyBiYXNlMzIoNzc3Nzc3Nzc3Nzc3NkFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBQUFBKQoKZ2V0X2Jlc3RfYmlkX2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuZ2V0X2Jlc3RfYmlkQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEzOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKZ2V0X2Jlc3RfYmlkX2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTUxCiAgICAvLyBiaWQgPSBzZWxmLmJpZHNbc2VsZi5iZXN0X2JpZF9pZF0uY29weSgpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNiAvLyAiYmVzdF9iaWRfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9iaWRfaWQgZXhpc3RzCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NjIKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmJpZHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE1NAogICAgLy8gYmlkZGVyPWJpZC5iaWRkZXIsCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNTUKICAgIC8vIHF1YW50aXR5PWJpZC5xdWFudGl0eSwKICAgIGRpZyAxCiAgICBleHRyYWN0IDMyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTU2CiAgICAvLyBwcmljZT1iaWQucHJpY2UsCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3QgNDAgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNTItMjE1NwogICAgLy8gcmV0dXJuIEJpZFZpZXcoCiAgICAvLyAgICAgYmlkX2lkPWFyYzQuVUludDY0KHNlbGYuYmVzdF9iaWRfaWQpLAogICAgLy8gICAgIGJpZGRlcj1iaWQuYmlkZGVyLAogICAgLy8gICAgIHF1YW50aXR5PWJpZC5xdWFudGl0eSwKICAgIC8vICAgICBwcmljZT1iaWQucHJpY2UsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjEzOAogICAgLy8gQGFyYzQuYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUsIHZhbGlkYXRlX2VuY29kaW5nPSJ1bnNhZmVfZGlzYWJsZWQiKQogICAgYiBnZXRfYmVzdF9iaWRfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5nZXRfYmVzdF9iaWRANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5LmdldF9hY3RpdmVfbGlzdGluZ3Nbcm91dGluZ10oKSAtPiB2b2lkOgpnZXRfYWN0aXZlX2xpc3RpbmdzOgogICAgYnl0ZWNfMyAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNTkKICAgIC8vIEBhcmM0LmFiaW1ldGhvZChyZWFkb25seT1UcnVlLCB2YWxpZGF0ZV9lbmNvZGluZz0idW5zYWZlX2Rpc2FibGVkIikKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTcxCiAgICAvLyBwYWdlID0gYXJjNC5EeW5hbWljQXJyYXlbTGlzdGluZ1ZpZXddKCkKICAgIGJ5dGVjIDIxIC8vIDB4MDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNzIKICAgIC8vIGxpc3RpbmdfaWQgPSBzZWxmLl9hY3RpdmVfYXNrKHNlbGYuYmVzdF9hc2tfaWQpCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAiYmVzdF9hc2tfaWQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9hc2tfaWQgZXhpc3RzCiAgICBjYWxsc3ViIF9hY3RpdmVfYXNrCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE3MwogICAgLy8gc2tpcHBlZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKCmdldF9hY3RpdmVfbGlzdGluZ3Nfd2hpbGVfdG9wQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE3NAogICAgLy8gd2hpbGUgbGlzdGluZ19pZCAhPSBOT19MSVNUSU5HIGFuZCBwYWdlLmxlbmd0aCA8IGNvdW50OgogICAgZGlnIDEKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgIT0KICAgIGJ6IGdldF9hY3RpdmVfbGlzdGluZ3NfYWZ0ZXJfd2hpbGVAMTAKICAgIGRpZyAyCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50MTYgLy8gb24gZXJyb3I6IGludmFsaWQgYXJyYXkgbGVuZ3RoIGhlYWRlcgogICAgZHVwCiAgICBidXJ5IDcKICAgIGRpZyA0CiAgICA8CiAgICBieiBnZXRfYWN0aXZlX2xpc3RpbmdzX2FmdGVyX3doaWxlQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MjE3NQogICAgLy8gaWYgc2tpcHBlZCA8IHN0YXJ0OgogICAgZHVwCiAgICBkaWcgNQogICAgPAogICAgYnogZ2V0X2FjdGl2ZV9saXN0aW5nc19lbHNlX2JvZHlANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxNzYKICAgIC8vIHNraXBwZWQgKz0gMQogICAgaW50Y18xIC8vIDEKICAgICsKCmdldF9hY3RpdmVfbGlzdGluZ3NfYWZ0ZXJfaWZfZWxzZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxODEKICAgIC8vIGxpc3RpbmdfaWQgPSBzZWxmLl9hY3RpdmVfYXNrKHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0ubmV4dF9hc2submF0aXZlKQogICAgc3dhcAogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDZjCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdzIGVudHJ5IGV4aXN0cwogICAgcHVzaGludCA2NAogICAgZXh0cmFjdF91aW50NjQKICAgIGNhbGxzdWIgX2FjdGl2ZV9hc2sKICAgIHN3YXAKICAgIGIgZ2V0X2FjdGl2ZV9saXN0aW5nc193aGlsZV90b3BAMgoKZ2V0X2FjdGl2ZV9saXN0aW5nc19lbHNlX2JvZHlANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTc4CiAgICAvLyBpZiBwYWdlLmJ5dGVzLmxlbmd0aCArIFVJbnQ2NChMSVNUSU5HX1ZJRVdfQllURVMpID4gTUFYX1BBR0VfQllURVM6CiAgICBkaWcgMgogICAgbGVuCiAgICBwdXNoaW50IDY0CiAgICArCiAgICBpbnRjIDggLy8gMTAwMAogICAgPgogICAgYm56IGdldF9hY3RpdmVfbGlzdGluZ3NfYWZ0ZXJfd2hpbGVAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTgwCiAgICAvLyBwYWdlLmFwcGVuZChzZWxmLl9saXN0aW5nX3ZpZXcobGlzdGluZ19pZCkpCiAgICBkaWcgMQogICAgY2FsbHN1YiBfbGlzdGluZ192aWV3CiAgICBkaWcgNgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxODAKICAgIC8vIHBhZ2UuYXBwZW5kKHNlbGYuX2xpc3RpbmdfdmlldyhsaXN0aW5nX2lkKSkKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMAogICAgdW5jb3ZlciA0CiAgICBzd2FwCiAgICByZXBsYWNlMiAwCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGNvdmVyIDIKICAgIGIgZ2V0X2FjdGl2ZV9saXN0aW5nc19hZnRlcl9pZl9lbHNlQDkKCmdldF9hY3RpdmVfbGlzdGluZ3NfYWZ0ZXJfd2hpbGVAMTA6CiAgICBwb3BuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToyMTU5CiAgICAvLyBAYXJjNC5hYmltZXRob2QocmVhZG9ubHk9VHJ1ZSwgdmFsaWRhdGVfZW5jb2Rpbmc9InVuc2FmZV9kaXNhYmxlZCIpCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX29ubHlfYWRtaW4oKSAtPiB2b2lkOgpfb25seV9hZG1pbjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MDAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4sICJ1bmF1dGhvcml6ZWQ6IGFkbWluIG9ubHkiCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTEgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyB1bmF1dGhvcml6ZWQ6IGFkbWluIG9ubHkKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9vbmx5X3ZhbGlkYXRvcigpIC0+IHZvaWQ6Cl9vbmx5X3ZhbGlkYXRvcjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MDQKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYudmFsaWRhdG9yLCAidW5hdXRob3JpemVkOiB2YWxpZGF0b3Igb25seSIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAxNSAvLyAidmFsaWRhdG9yIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnZhbGlkYXRvciBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gdW5hdXRob3JpemVkOiB2YWxpZGF0b3Igb25seQogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2xvYWRfcHJvamVjdChwcm9qZWN0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpfbG9hZF9wcm9qZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMC01MTEKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2xvYWRfcHJvamVjdChzZWxmLCBwcm9qZWN0X2lkOiBVSW50NjQpIC0+IFByb2plY3RSZWNvcmQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MTIKICAgIC8vIGFzc2VydCBwcm9qZWN0X2lkIDwgc2VsZi5wcm9qZWN0X2NvdW50LCAiaW52YWxpZCBwcm9qZWN0IGlkIgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdF9jb3VudCBleGlzdHMKICAgIGZyYW1lX2RpZyAtMQogICAgPgogICAgYXNzZXJ0IC8vIGludmFsaWQgcHJvamVjdCBpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUxMwogICAgLy8gcmV0dXJuIHNlbGYucHJvamVjdHNbcHJvamVjdF9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vIDB4NzAKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJvamVjdHMgZW50cnkgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fY3JlYXRlX3Byb2plY3QobmFtZTogYnl0ZXMsIGxvY2F0aW9uOiBieXRlcywgZWNvc3lzdGVtOiBieXRlcywgY2lkOiBieXRlcykgLT4gdWludDY0OgpfY3JlYXRlX3Byb2plY3Q6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTE1LTUyMgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfY3JlYXRlX3Byb2plY3QoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBuYW1lOiBhcmM0LlN0cmluZywKICAgIC8vICAgICBsb2NhdGlvbjogYXJjNC5TdHJpbmcsCiAgICAvLyAgICAgZWNvc3lzdGVtOiBhcmM0LlN0cmluZywKICAgIC8vICAgICBjaWQ6IGFyYzQuU3RyaW5nLAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byA0IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjMKICAgIC8vIGFzc2VydCBuYW1lLm5hdGl2ZS5ieXRlcy5sZW5ndGggPD0gTUFYX05BTUVfTEVOR1RILCAibmFtZSB0b28gbG9uZyIKICAgIGZyYW1lX2RpZyAtNAogICAgZXh0cmFjdCAyIDAKICAgIGxlbgogICAgcHVzaGludCA2NAogICAgPD0KICAgIGFzc2VydCAvLyBuYW1lIHRvbyBsb25nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI0CiAgICAvLyBhc3NlcnQgbG9jYXRpb24ubmF0aXZlLmJ5dGVzLmxlbmd0aCA8PSBNQVhfTE9DQVRJT05fTEVOR1RILCAibG9jYXRpb24gdG9vIGxvbmciCiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIHB1c2hpbnQgNjQKICAgIDw9CiAgICBhc3NlcnQgLy8gbG9jYXRpb24gdG9vIGxvbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjUKICAgIC8vIGVjb3N5c3RlbV9jb2RlID0gc2VsZi5fZWNvc3lzdGVtX2NvZGUoZWNvc3lzdGVtLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMgogICAgZXh0cmFjdCAyIDAKICAgIGNhbGxzdWIgX2Vjb3N5c3RlbV9jb2RlCiAgICBkdXBuIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MjYKICAgIC8vIGFzc2VydCBlY29zeXN0ZW1fY29kZSwgInVua25vd24gZWNvc3lzdGVtIgogICAgYXNzZXJ0IC8vIHVua25vd24gZWNvc3lzdGVtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI3CiAgICAvLyBwYWNrZWRfY2lkID0gc2VsZi5fcGFja19jaWQoY2lkLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGNhbGxzdWIgX3BhY2tfY2lkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTI4CiAgICAvLyBhc3NlcnQgcGFja2VkX2NpZC5sZW5ndGggPD0gTUFYX0NJRF9MRU5HVEgsICJjaWQgdG9vIGxvbmciCiAgICBkdXAKICAgIGxlbgogICAgZHVwCiAgICBwdXNoaW50IDk2CiAgICA8PQogICAgYXNzZXJ0IC8vIGNpZCB0b28gbG9uZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzMAogICAgLy8gcHJvamVjdF9pZCA9IHNlbGYucHJvamVjdF9jb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDcgLy8gInByb2plY3RfY291bnQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAzCiAgICBjb3ZlciA1CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wcm9qZWN0X2NvdW50IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzMQogICAgLy8gY2lkX2hhc2ggPSBvcC5zaGEyNTYocGFja2VkX2NpZCkKICAgIGRpZyAyCiAgICBzaGEyNTYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MzIKICAgIC8vIGFzc2VydCBjaWRfaGFzaCBub3QgaW4gc2VsZi5jaWRfaW5kZXgsICJkdXBsaWNhdGUgZXZpZGVuY2UgY2lkIgogICAgcHVzaGJ5dGVzIDB4NjMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBkdXBsaWNhdGUgZXZpZGVuY2UgY2lkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTMzCiAgICAvLyBzZWxmLmNpZF9pbmRleFtjaWRfaGFzaF0gPSBwcm9qZWN0X2lkCiAgICBkaWcgMgogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciA3CiAgICBzd2FwCiAgICBkaWcgMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzNQogICAgLy8gc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjAKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NCgoc3RhdHVzIDw8IFNUQVRVU19TSElGVCkgfCBjcmVkaXRzKQogICAgcHVzaGludCA3MjA1NzU5NDAzNzkyNzkzNgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzNwogICAgLy8gZWNvc3lzdGVtPWFyYzQuVUludDgoZWNvc3lzdGVtX2NvZGUpLAogICAgdW5jb3ZlciA2CiAgICBpdG9iCiAgICBkdXAKICAgIGJpdGxlbgogICAgaW50Y18yIC8vIDgKICAgIDw9CiAgICBhc3NlcnQgLy8gb3ZlcmZsb3cKICAgIGV4dHJhY3QgNyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTM4CiAgICAvLyBjaWQ9YXJjNC5EeW5hbWljQnl0ZXMocGFja2VkX2NpZCksCiAgICB1bmNvdmVyIDQKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICB1bmNvdmVyIDYKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUzNC01NDEKICAgIC8vIHNlbGYucHJvamVjdHNbcHJvamVjdF9pZF0gPSBQcm9qZWN0UmVjb3JkKAogICAgLy8gICAgIHN1Ym1pdHRlcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgc3RhdGU9c2VsZi5fcGFja19zdGF0ZShVSW50NjQoU1RBVFVTX1BFTkRJTkcpLCBVSW50NjQoMCkpLAogICAgLy8gICAgIGVjb3N5c3RlbT1hcmM0LlVJbnQ4KGVjb3N5c3RlbV9jb2RlKSwKICAgIC8vICAgICBjaWQ9YXJjNC5EeW5hbWljQnl0ZXMocGFja2VkX2NpZCksCiAgICAvLyAgICAgbmFtZT1uYW1lLAogICAgLy8gICAgIGxvY2F0aW9uPWxvY2F0aW9uLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMmYKICAgIGNvbmNhdAogICAgZGlnIDEKICAgIGxlbgogICAgcHVzaGludCA0NwogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtNAogICAgbGVuCiAgICB1bmNvdmVyIDIKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTM0CiAgICAvLyBzZWxmLnByb2plY3RzW3Byb2plY3RfaWRdID0gUHJvamVjdFJlY29yZCgKICAgIGJ5dGVjIDEwIC8vIDB4NzAKICAgIGRpZyAyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1MzQtNTQxCiAgICAvLyBzZWxmLnByb2plY3RzW3Byb2plY3RfaWRdID0gUHJvamVjdFJlY29yZCgKICAgIC8vICAgICBzdWJtaXR0ZXI9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIHN0YXRlPXNlbGYuX3BhY2tfc3RhdGUoVUludDY0KFNUQVRVU19QRU5ESU5HKSwgVUludDY0KDApKSwKICAgIC8vICAgICBlY29zeXN0ZW09YXJjNC5VSW50OChlY29zeXN0ZW1fY29kZSksCiAgICAvLyAgICAgY2lkPWFyYzQuRHluYW1pY0J5dGVzKHBhY2tlZF9jaWQpLAogICAgLy8gICAgIG5hbWU9bmFtZSwKICAgIC8vICAgICBsb2NhdGlvbj1sb2NhdGlvbiwKICAgIC8vICkKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBzd2FwCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTQyCiAgICAvLyBzZWxmLnByb2plY3RfY291bnQgPSBwcm9qZWN0X2lkICsgVUludDY0KDEpCiAgICBkaWcgMQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDcgLy8gInByb2plY3RfY291bnQiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0MwogICAgLy8gX3Nsb3QgPSBzZWxmLl9pbmRleF9hcHBlbmQoQnl0ZXMoU1VCTUlUVEVSX0lOREVYX1BSRUZJWCkgKyBUeG4uc2VuZGVyLmJ5dGVzLCBwcm9qZWN0X2lkKQogICAgYnl0ZWMgMzMgLy8gMHg3MzcwCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfaW5kZXhfYXBwZW5kCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MzYKICAgIC8vIHRhaWwgPSBzZWxmLnBlbmRpbmdfdGFpbAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE4IC8vICJwZW5kaW5nX3RhaWwiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjb3ZlciAzCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX3RhaWwgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzM4CiAgICAvLyBwcmV2X3BlbmRpbmc9YXJjNC5VSW50NjQodGFpbCksCiAgICBkdXAKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MzkKICAgIC8vIG5leHRfcGVuZGluZz1hcmM0LlVJbnQ2NChOT19QUk9KRUNUKSwKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjczNy03NDAKICAgIC8vIHNlbGYucGVuZGluZ19xdWV1ZVtwcm9qZWN0X2lkXSA9IFBlbmRpbmdMaW5rKAogICAgLy8gICAgIHByZXZfcGVuZGluZz1hcmM0LlVJbnQ2NCh0YWlsKSwKICAgIC8vICAgICBuZXh0X3BlbmRpbmc9YXJjNC5VSW50NjQoTk9fUFJPSkVDVCksCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MzcKICAgIC8vIHNlbGYucGVuZGluZ19xdWV1ZVtwcm9qZWN0X2lkXSA9IFBlbmRpbmdMaW5rKAogICAgYnl0ZWMgMTQgLy8gMHg3MQogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MzctNzQwCiAgICAvLyBzZWxmLnBlbmRpbmdfcXVldWVbcHJvamVjdF9pZF0gPSBQZW5kaW5nTGluaygKICAgIC8vICAgICBwcmV2X3BlbmRpbmc9YXJjNC5VSW50NjQodGFpbCksCiAgICAvLyAgICAgbmV4dF9wZW5kaW5nPWFyYzQuVUludDY0KE5PX1BST0pFQ1QpLAogICAgLy8gKQogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0MQogICAgLy8gaWYgdGFpbCA9PSBOT19QUk9KRUNUOgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICA9PQogICAgYnogX2NyZWF0ZV9wcm9qZWN0X2Vsc2VfYm9keUAzCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NDIKICAgIC8vIHNlbGYucGVuZGluZ19oZWFkID0gcHJvamVjdF9pZAogICAgYnl0ZWMgMTcgLy8gInBlbmRpbmdfaGVhZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAoKX2NyZWF0ZV9wcm9qZWN0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NDUKICAgIC8vIHNlbGYucGVuZGluZ190YWlsID0gcHJvamVjdF9pZAogICAgYnl0ZWMgMTggLy8gInBlbmRpbmdfdGFpbCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0NQogICAgLy8gc2VsZi5fdGFsbHkoZWNvc3lzdGVtX2NvZGUsIFVJbnQ2NCgwKSwgVUludDY0KFNUQVRVU19QRU5ESU5HKSwgVUludDY0KDApKQogICAgdW5jb3ZlciAyCiAgICBpbnRjXzAgLy8gMAogICAgaW50Y18xIC8vIDEKICAgIGludGNfMCAvLyAwCiAgICBjYWxsc3ViIF90YWxseQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU0OQogICAgLy8gc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDctNTUxCiAgICAvLyBQcm9qZWN0U3VibWl0dGVkKAogICAgLy8gICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQocHJvamVjdF9pZCksCiAgICAvLyAgICAgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBjaWQ9Y2lkLAogICAgLy8gKQogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDAwMmEKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NDYtNTUyCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgUHJvamVjdFN1Ym1pdHRlZCgKICAgIC8vICAgICAgICAgcHJvamVjdF9pZD1hcmM0LlVJbnQ2NChwcm9qZWN0X2lkKSwKICAgIC8vICAgICAgICAgc3VibWl0dGVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgY2lkPWNpZCwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgyNDI3NjBmNCAvLyBtZXRob2QgIlByb2plY3RTdWJtaXR0ZWQodWludDY0LGFkZHJlc3Msc3RyaW5nKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTUzCiAgICAvLyByZXR1cm4gcHJvamVjdF9pZAogICAgcmV0c3ViCgpfY3JlYXRlX3Byb2plY3RfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzQ0CiAgICAvLyBzZWxmLl9zZXRfcGVuZGluZ19uZXh0KHRhaWwsIHByb2plY3RfaWQpCiAgICBkaWcgMQogICAgY2FsbHN1YiBfc2V0X3BlbmRpbmdfbmV4dAogICAgYiBfY3JlYXRlX3Byb2plY3RfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2FwcHJvdmUocHJvamVjdF9pZDogdWludDY0LCBjcmVkaXRzOiB1aW50NjQpIC0+IHZvaWQ6Cl9hcHByb3ZlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU1NS01NTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2FwcHJvdmUoc2VsZiwgcHJvamVjdF9pZDogVUludDY0LCBjcmVkaXRzOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTcKICAgIC8vIGFzc2VydCBjcmVkaXRzID4gVUludDY0KDApLCAiY3JlZGl0cyBtdXN0IGJlID4gMCIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXJ0IC8vIGNyZWRpdHMgbXVzdCBiZSA+IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTgKICAgIC8vIGFzc2VydCBjcmVkaXRzIDw9IENSRURJVFNfTUFTSywgImNyZWRpdHMgdG9vIGxhcmdlIgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjIDkgLy8gNzIwNTc1OTQwMzc5Mjc5MzUKICAgIDw9CiAgICBhc3NlcnQgLy8gY3JlZGl0cyB0b28gbGFyZ2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NTkKICAgIC8vIHByb2plY3QgPSBzZWxmLl9sb2FkX3Byb2plY3QocHJvamVjdF9pZCkKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfbG9hZF9wcm9qZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTYwCiAgICAvLyBhc3NlcnQgcHJvamVjdC5zdGF0ZS5uYXRpdmUgPj4gU1RBVFVTX1NISUZUID09IFNUQVRVU19QRU5ESU5HLCAicHJvamVjdCBub3QgcGVuZGluZyIKICAgIGR1cAogICAgcHVzaGludCAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIHB1c2hpbnQgNTYKICAgIHNocgogICAgaW50Y18xIC8vIDEKICAgID09CiAgICBhc3NlcnQgLy8gcHJvamVjdCBub3QgcGVuZGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMAogICAgLy8gcmV0dXJuIGFyYzQuVUludDY0KChzdGF0dXMgPDwgU1RBVFVTX1NISUZUKSB8IGNyZWRpdHMpCiAgICBwdXNoaW50IDE0NDExNTE4ODA3NTg1NTg3MgogICAgZnJhbWVfZGlnIC0xCiAgICB8CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTYxCiAgICAvLyBwcm9qZWN0LnN0YXRlID0gc2VsZi5fcGFja19zdGF0ZShVSW50NjQoU1RBVFVTX1ZFUklGSUVEKSwgY3JlZGl0cykKICAgIHJlcGxhY2UyIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTYyCiAgICAvLyBzZWxmLnByb2plY3RzW3Byb2plY3RfaWRdID0gcHJvamVjdC5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWMgMTAgLy8gMHg3MAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGRpZyAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTYzCiAgICAvLyBzZWxmLl9kZXF1ZXVlX3BlbmRpbmcocHJvamVjdF9pZCwgcHJvamVjdC5zdWJtaXR0ZXIubmF0aXZlKQogICAgZGlnIDEKICAgIGV4dHJhY3QgMCAzMgogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICBjYWxsc3ViIF9kZXF1ZXVlX3BlbmRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjUKICAgIC8vIHByb2plY3QuZWNvc3lzdGVtLm5hdGl2ZSwKICAgIHN3YXAKICAgIHB1c2hpbnQgNDAKICAgIGdldGJ5dGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjYKICAgIC8vIFVJbnQ2NChTVEFUVVNfUEVORElORyksCiAgICBpbnRjXzEgLy8gMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2NwogICAgLy8gVUludDY0KFNUQVRVU19WRVJJRklFRCksCiAgICBpbnRjXzMgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU2OAogICAgLy8gVUludDY0KDApLAogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NjQtNTY5CiAgICAvLyBzZWxmLl90YWxseSgKICAgIC8vICAgICBwcm9qZWN0LmVjb3N5c3RlbS5uYXRpdmUsCiAgICAvLyAgICAgVUludDY0KFNUQVRVU19QRU5ESU5HKSwKICAgIC8vICAgICBVSW50NjQoU1RBVFVTX1ZFUklGSUVEKSwKICAgIC8vICAgICBVSW50NjQoMCksCiAgICAvLyApCiAgICBjYWxsc3ViIF90YWxseQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MgogICAgLy8gcHJvamVjdF9pZD1hcmM0LlVJbnQ2NChwcm9qZWN0X2lkKSwgY3JlZGl0cz1hcmM0LlVJbnQ2NChjcmVkaXRzKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTcxLTU3MwogICAgLy8gUHJvamVjdEFwcHJvdmVkKAogICAgLy8gICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQocHJvamVjdF9pZCksIGNyZWRpdHM9YXJjNC5VSW50NjQoY3JlZGl0cykKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3MC01NzQKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBQcm9qZWN0QXBwcm92ZWQoCiAgICAvLyAgICAgICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQocHJvamVjdF9pZCksIGNyZWRpdHM9YXJjNC5VSW50NjQoY3JlZGl0cykKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgwZjY2M2U3OSAvLyBtZXRob2QgIlByb2plY3RBcHByb3ZlZCh1aW50NjQsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fcmVqZWN0KHByb2plY3RfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKX3JlamVjdDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1NzYtNTc3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9yZWplY3Qoc2VsZiwgcHJvamVjdF9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTc4CiAgICAvLyBwcm9qZWN0ID0gc2VsZi5fbG9hZF9wcm9qZWN0KHByb2plY3RfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2xvYWRfcHJvamVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU3OQogICAgLy8gYXNzZXJ0IHByb2plY3Quc3RhdGUubmF0aXZlID4+IFNUQVRVU19TSElGVCA9PSBTVEFUVVNfUEVORElORywgInByb2plY3Qgbm90IHBlbmRpbmciCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBwdXNoaW50IDU2CiAgICBzaHIKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYXNzZXJ0IC8vIHByb2plY3Qgbm90IHBlbmRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjAKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NCgoc3RhdHVzIDw8IFNUQVRVU19TSElGVCkgfCBjcmVkaXRzKQogICAgcHVzaGludCAyMTYxNzI3ODIxMTM3ODM4MDgKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1ODAKICAgIC8vIHByb2plY3Quc3RhdGUgPSBzZWxmLl9wYWNrX3N0YXRlKFVJbnQ2NChTVEFUVVNfUkVKRUNURUQpLCBVSW50NjQoMCkpCiAgICByZXBsYWNlMiAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4MQogICAgLy8gc2VsZi5wcm9qZWN0c1twcm9qZWN0X2lkXSA9IHByb2plY3QuY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDEwIC8vIDB4NzAKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2RlbAogICAgcG9wCiAgICBkaWcgMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4MgogICAgLy8gc2VsZi5fZGVxdWV1ZV9wZW5kaW5nKHByb2plY3RfaWQsIHByb2plY3Quc3VibWl0dGVyLm5hdGl2ZSkKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgMzIKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiBfZGVxdWV1ZV9wZW5kaW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTg0CiAgICAvLyBwcm9qZWN0LmVjb3N5c3RlbS5uYXRpdmUsCiAgICBzd2FwCiAgICBwdXNoaW50IDQwCiAgICBnZXRieXRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTg1CiAgICAvLyBVSW50NjQoU1RBVFVTX1BFTkRJTkcpLAogICAgaW50Y18xIC8vIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo1ODYKICAgIC8vIFVJbnQ2NChTVEFUVVNfUkVKRUNURUQpLAogICAgcHVzaGludCAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTg3CiAgICAvLyBVSW50NjQoMCksCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU4My01ODgKICAgIC8vIHNlbGYuX3RhbGx5KAogICAgLy8gICAgIHByb2plY3QuZWNvc3lzdGVtLm5hdGl2ZSwKICAgIC8vICAgICBVSW50NjQoU1RBVFVTX1BFTkRJTkcpLAogICAgLy8gICAgIFVJbnQ2NChTVEFUVVNfUkVKRUNURUQpLAogICAgLy8gICAgIFVJbnQ2NCgwKSwKICAgIC8vICkKICAgIGNhbGxzdWIgX3RhbGx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTg5CiAgICAvLyBhcmM0LmVtaXQoUHJvamVjdFJlamVjdGVkKHByb2plY3RfaWQ9YXJjNC5VSW50NjQocHJvamVjdF9pZCkpKQogICAgcHVzaGJ5dGVzIDB4MDQyYjUyM2EgLy8gbWV0aG9kICJQcm9qZWN0UmVqZWN0ZWQodWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fbWFya19pc3N1ZWQocHJvamVjdF9pZDogdWludDY0KSAtPiBieXRlcywgdWludDY0OgpfbWFya19pc3N1ZWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTkxLTU5MgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfbWFya19pc3N1ZWQoc2VsZiwgcHJvamVjdF9pZDogVUludDY0KSAtPiB0dXBsZVtBY2NvdW50LCBVSW50NjRdOgogICAgcHJvdG8gMSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NTk3CiAgICAvLyBwcm9qZWN0ID0gc2VsZi5fbG9hZF9wcm9qZWN0KHByb2plY3RfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2xvYWRfcHJvamVjdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5OAogICAgLy8gYXNzZXJ0IHByb2plY3Quc3RhdGUubmF0aXZlID4+IFNUQVRVU19TSElGVCA9PSBTVEFUVVNfVkVSSUZJRUQsICJwcm9qZWN0IG5vdCB2ZXJpZmllZCIKICAgIGR1cAogICAgcHVzaGludCAzMgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgcHVzaGludCA1NgogICAgc2hyCiAgICBpbnRjXzMgLy8gMgogICAgPT0KICAgIGFzc2VydCAvLyBwcm9qZWN0IG5vdCB2ZXJpZmllZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjU5OQogICAgLy8gY3JlZGl0cyA9IHByb2plY3Quc3RhdGUubmF0aXZlICYgQ1JFRElUU19NQVNLCiAgICBpbnRjIDkgLy8gNzIwNTc1OTQwMzc5Mjc5MzUKICAgICYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjAKICAgIC8vIHJldHVybiBhcmM0LlVJbnQ2NCgoc3RhdHVzIDw8IFNUQVRVU19TSElGVCkgfCBjcmVkaXRzKQogICAgcHVzaGludCAyODgyMzAzNzYxNTE3MTE3NDQKICAgIGRpZyAxCiAgICB8CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjAwCiAgICAvLyBwcm9qZWN0LnN0YXRlID0gc2VsZi5fcGFja19zdGF0ZShVSW50NjQoU1RBVFVTX0lTU1VFRCksIGNyZWRpdHMpCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIHJlcGxhY2UyIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjAxCiAgICAvLyBzZWxmLnByb2plY3RzW3Byb2plY3RfaWRdID0gcHJvamVjdC5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYnl0ZWMgMTAgLy8gMHg3MAogICAgZGlnIDEKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIGRpZyAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjAzCiAgICAvLyBwcm9qZWN0LmVjb3N5c3RlbS5uYXRpdmUsCiAgICBkaWcgMQogICAgcHVzaGludCA0MAogICAgZ2V0Ynl0ZQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwNAogICAgLy8gVUludDY0KFNUQVRVU19WRVJJRklFRCksCiAgICBpbnRjXzMgLy8gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwNQogICAgLy8gVUludDY0KFNUQVRVU19JU1NVRUQpLAogICAgcHVzaGludCA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjAyLTYwNwogICAgLy8gc2VsZi5fdGFsbHkoCiAgICAvLyAgICAgcHJvamVjdC5lY29zeXN0ZW0ubmF0aXZlLAogICAgLy8gICAgIFVJbnQ2NChTVEFUVVNfVkVSSUZJRUQpLAogICAgLy8gICAgIFVJbnQ2NChTVEFUVVNfSVNTVUVEKSwKICAgIC8vICAgICBjcmVkaXRzLAogICAgLy8gKQogICAgZGlnIDUKICAgIGNhbGxzdWIgX3RhbGx5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjExCiAgICAvLyBzdWJtaXR0ZXI9cHJvamVjdC5zdWJtaXR0ZXIsCiAgICBzd2FwCiAgICBleHRyYWN0IDAgMzIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MTIKICAgIC8vIGNyZWRpdHM9YXJjNC5VSW50NjQoY3JlZGl0cyksCiAgICBkaWcgMgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYwOS02MTMKICAgIC8vIENyZWRpdHNJc3N1ZWQoCiAgICAvLyAgICAgcHJvamVjdF9pZD1hcmM0LlVJbnQ2NChwcm9qZWN0X2lkKSwKICAgIC8vICAgICBzdWJtaXR0ZXI9cHJvamVjdC5zdWJtaXR0ZXIsCiAgICAvLyAgICAgY3JlZGl0cz1hcmM0LlVJbnQ2NChjcmVkaXRzKSwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgZGlnIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjA4LTYxNAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENyZWRpdHNJc3N1ZWQoCiAgICAvLyAgICAgICAgIHByb2plY3RfaWQ9YXJjNC5VSW50NjQocHJvamVjdF9pZCksCiAgICAvLyAgICAgICAgIHN1Ym1pdHRlcj1wcm9qZWN0LnN1Ym1pdHRlciwKICAgIC8vICAgICAgICAgY3JlZGl0cz1hcmM0LlVJbnQ2NChjcmVkaXRzKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHhkYTM3MWNlMCAvLyBtZXRob2QgIkNyZWRpdHNJc3N1ZWQodWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjE1CiAgICAvLyByZXR1cm4gcHJvamVjdC5zdWJtaXR0ZXIubmF0aXZlLCBjcmVkaXRzCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fZGVjb2RlX3Byb2plY3QocHJvamVjdDogYnl0ZXMpIC0+IGJ5dGVzLCBieXRlczoKX2RlY29kZV9wcm9qZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyMi02MjMKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2RlY29kZV9wcm9qZWN0KHNlbGYsIHByb2plY3Q6IFByb2plY3RSZWNvcmQpIC0+IFByb2plY3Q6CiAgICBwcm90byAxIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjYKICAgIC8vIHN1Ym1pdHRlcj1wcm9qZWN0LnN1Ym1pdHRlciwKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAwIDMyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjI3CiAgICAvLyBjaWQ9YXJjNC5TdHJpbmcoc2VsZi5fdW5wYWNrX2NpZChwcm9qZWN0LmNpZC5uYXRpdmUpKSwKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA0MQogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA0MwogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgZXh0cmFjdCAyIDAKICAgIGNhbGxzdWIgX3VucGFja19jaWQKICAgIGR1cAogICAgbGVuCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjI4CiAgICAvLyBuYW1lPXByb2plY3QubmFtZSwKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA0NQogICAgZXh0cmFjdF91aW50MTYKICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICBkaWcgMgogICAgc3Vic3RyaW5nMwogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYyOQogICAgLy8gbG9jYXRpb249cHJvamVjdC5sb2NhdGlvbiwKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MzAKICAgIC8vIGVjb3N5c3RlbT1hcmM0LlN0cmluZyhzZWxmLl9lY29zeXN0ZW1fbmFtZShwcm9qZWN0LmVjb3N5c3RlbS5uYXRpdmUpKSwKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA0MAogICAgZ2V0Ynl0ZQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjUwCiAgICAvLyBpZiBjb2RlID09IEVDT1NZU1RFTV9NQU5HUk9WRToKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogX2RlY29kZV9wcm9qZWN0X2FmdGVyX2lmX2Vsc2VAMwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjUxCiAgICAvLyByZXR1cm4gU3RyaW5nKCJNYW5ncm92ZSIpCiAgICBieXRlYyAzNSAvLyAiTWFuZ3JvdmUiCgpfZGVjb2RlX3Byb2plY3RfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fZWNvc3lzdGVtX25hbWVAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjMwCiAgICAvLyBlY29zeXN0ZW09YXJjNC5TdHJpbmcoc2VsZi5fZWNvc3lzdGVtX25hbWUocHJvamVjdC5lY29zeXN0ZW0ubmF0aXZlKSksCiAgICBkdXAKICAgIGxlbgogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMQogICAgLy8gc3RhdHVzPWFyYzQuVUludDY0KHByb2plY3Quc3RhdGUubmF0aXZlID4+IFNUQVRVU19TSElGVCksCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIHB1c2hpbnQgNTYKICAgIHNocgogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMgogICAgLy8gY3JlZGl0cz1hcmM0LlVJbnQ2NChwcm9qZWN0LnN0YXRlLm5hdGl2ZSAmIENSRURJVFNfTUFTSyksCiAgICBzd2FwCiAgICBpbnRjIDkgLy8gNzIwNTc1OTQwMzc5Mjc5MzUKICAgICYKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MjUtNjMzCiAgICAvLyByZXR1cm4gUHJvamVjdCgKICAgIC8vICAgICBzdWJtaXR0ZXI9cHJvamVjdC5zdWJtaXR0ZXIsCiAgICAvLyAgICAgY2lkPWFyYzQuU3RyaW5nKHNlbGYuX3VucGFja19jaWQocHJvamVjdC5jaWQubmF0aXZlKSksCiAgICAvLyAgICAgbmFtZT1wcm9qZWN0Lm5hbWUsCiAgICAvLyAgICAgbG9jYXRpb249cHJvamVjdC5sb2NhdGlvbiwKICAgIC8vICAgICBlY29zeXN0ZW09YXJjNC5TdHJpbmcoc2VsZi5fZWNvc3lzdGVtX25hbWUocHJvamVjdC5lY29zeXN0ZW0ubmF0aXZlKSksCiAgICAvLyAgICAgc3RhdHVzPWFyYzQuVUludDY0KHByb2plY3Quc3RhdGUubmF0aXZlID4+IFNUQVRVU19TSElGVCksCiAgICAvLyAgICAgY3JlZGl0cz1hcmM0LlVJbnQ2NChwcm9qZWN0LnN0YXRlLm5hdGl2ZSAmIENSRURJVFNfTUFTSyksCiAgICAvLyApCiAgICB1bmNvdmVyIDYKICAgIHB1c2hieXRlcyAweDAwMzgKICAgIGNvbmNhdAogICAgdW5jb3ZlciA2CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGxlbgogICAgcHVzaGludCA1NgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgZHVwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgNwogICAgZHVwCiAgICBjb3ZlciAzCiAgICBsZW4KICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciA1CiAgICBjb25jYXQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIHJldHN1YgoKX2RlY29kZV9wcm9qZWN0X2FmdGVyX2lmX2Vsc2VAMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NTIKICAgIC8vIGlmIGNvZGUgPT0gRUNPU1lTVEVNX1NFQUdSQVNTOgogICAgZHVwCiAgICBpbnRjXzMgLy8gMgogICAgPT0KICAgIGJ6IF9kZWNvZGVfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDUKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY1MwogICAgLy8gcmV0dXJuIFN0cmluZygiU2VhZ3Jhc3MiKQogICAgYnl0ZWMgMzYgLy8gIlNlYWdyYXNzIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMAogICAgLy8gZWNvc3lzdGVtPWFyYzQuU3RyaW5nKHNlbGYuX2Vjb3N5c3RlbV9uYW1lKHByb2plY3QuZWNvc3lzdGVtLm5hdGl2ZSkpLAogICAgYiBfZGVjb2RlX3Byb2plY3RfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fZWNvc3lzdGVtX25hbWVAMTAKCl9kZWNvZGVfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjU0CiAgICAvLyBpZiBjb2RlID09IEVDT1NZU1RFTV9XRVRMQU5EOgogICAgZHVwCiAgICBwdXNoaW50IDMKICAgID09CiAgICBieiBfZGVjb2RlX3Byb2plY3RfYWZ0ZXJfaWZfZWxzZUA3CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NTUKICAgIC8vIHJldHVybiBTdHJpbmcoIldldGxhbmQiKQogICAgYnl0ZWMgMzcgLy8gIldldGxhbmQiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjMwCiAgICAvLyBlY29zeXN0ZW09YXJjNC5TdHJpbmcoc2VsZi5fZWNvc3lzdGVtX25hbWUocHJvamVjdC5lY29zeXN0ZW0ubmF0aXZlKSksCiAgICBiIF9kZWNvZGVfcHJvamVjdF9hZnRlcl9pbmxpbmVkX3NtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9lY29zeXN0ZW1fbmFtZUAxMAoKX2RlY29kZV9wcm9qZWN0X2FmdGVyX2lmX2Vsc2VANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NTYKICAgIC8vIGlmIGNvZGUgPT0gRUNPU1lTVEVNX1NBTFRfTUFSU0g6CiAgICBwdXNoaW50IDQKICAgID09CiAgICBieiBfZGVjb2RlX3Byb2plY3RfYWZ0ZXJfaWZfZWxzZUA5CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjU3CiAgICAvLyByZXR1cm4gU3RyaW5nKCJTYWx0IE1hcnNoIikKICAgIGJ5dGVjIDM4IC8vICJTYWx0IE1hcnNoIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzMAogICAgLy8gZWNvc3lzdGVtPWFyYzQuU3RyaW5nKHNlbGYuX2Vjb3N5c3RlbV9uYW1lKHByb2plY3QuZWNvc3lzdGVtLm5hdGl2ZSkpLAogICAgYiBfZGVjb2RlX3Byb2plY3RfYWZ0ZXJfaW5saW5lZF9zbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fZWNvc3lzdGVtX25hbWVAMTAKCl9kZWNvZGVfcHJvamVjdF9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjU4CiAgICAvLyByZXR1cm4gU3RyaW5nKCkKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MzAKICAgIC8vIGVjb3N5c3RlbT1hcmM0LlN0cmluZyhzZWxmLl9lY29zeXN0ZW1fbmFtZShwcm9qZWN0LmVjb3N5c3RlbS5uYXRpdmUpKSwKICAgIGIgX2RlY29kZV9wcm9qZWN0X2FmdGVyX2lubGluZWRfc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2Vjb3N5c3RlbV9uYW1lQDEwCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2Vjb3N5c3RlbV9jb2RlKGVjb3N5c3RlbTogYnl0ZXMpIC0+IHVpbnQ2NDoKX2Vjb3N5c3RlbV9jb2RlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzNS02MzYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2Vjb3N5c3RlbV9jb2RlKHNlbGYsIGVjb3N5c3RlbTogU3RyaW5nKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2MzgKICAgIC8vIGlmIGVjb3N5c3RlbSA9PSAiTWFuZ3JvdmUiOgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlYyAzNSAvLyAiTWFuZ3JvdmUiCiAgICA9PQogICAgYnogX2Vjb3N5c3RlbV9jb2RlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjYzOQogICAgLy8gcmV0dXJuIFVJbnQ2NChFQ09TWVNURU1fTUFOR1JPVkUpCiAgICBpbnRjXzEgLy8gMQogICAgcmV0c3ViCgpfZWNvc3lzdGVtX2NvZGVfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY0MAogICAgLy8gaWYgZWNvc3lzdGVtID09ICJTZWFncmFzcyI6CiAgICBmcmFtZV9kaWcgLTEKICAgIGJ5dGVjIDM2IC8vICJTZWFncmFzcyIKICAgID09CiAgICBieiBfZWNvc3lzdGVtX2NvZGVfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQxCiAgICAvLyByZXR1cm4gVUludDY0KEVDT1NZU1RFTV9TRUFHUkFTUykKICAgIGludGNfMyAvLyAyCiAgICByZXRzdWIKCl9lY29zeXN0ZW1fY29kZV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQyCiAgICAvLyBpZiBlY29zeXN0ZW0gPT0gIldldGxhbmQiOgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlYyAzNyAvLyAiV2V0bGFuZCIKICAgID09CiAgICBieiBfZWNvc3lzdGVtX2NvZGVfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQzCiAgICAvLyByZXR1cm4gVUludDY0KEVDT1NZU1RFTV9XRVRMQU5EKQogICAgcHVzaGludCAzCiAgICByZXRzdWIKCl9lY29zeXN0ZW1fY29kZV9hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ0CiAgICAvLyBpZiBlY29zeXN0ZW0gPT0gIlNhbHQgTWFyc2giOgogICAgZnJhbWVfZGlnIC0xCiAgICBieXRlYyAzOCAvLyAiU2FsdCBNYXJzaCIKICAgID09CiAgICBieiBfZWNvc3lzdGVtX2NvZGVfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ1CiAgICAvLyByZXR1cm4gVUludDY0KEVDT1NZU1RFTV9TQUxUX01BUlNIKQogICAgcHVzaGludCA0CiAgICByZXRzdWIKCl9lY29zeXN0ZW1fY29kZV9hZnRlcl9pZl9lbHNlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjQ2CiAgICAvLyByZXR1cm4gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3BhY2tfY2lkKGNpZDogYnl0ZXMpIC0+IGJ5dGVzOgpfcGFja19jaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjYwLTY2MQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfcGFja19jaWQoc2VsZiwgY2lkOiBTdHJpbmcpIC0+IEJ5dGVzOgogICAgcHJvdG8gMSAxCiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjY3CiAgICAvLyBpZiB0ZXh0WzoxXSAhPSBDSURfQkFTRTMyX1BSRUZJWDoKICAgIGZyYW1lX2RpZyAtMQogICAgbGVuCiAgICBkdXAKICAgIGludGNfMSAvLyAxCiAgICBkaWcgMQogICAgPj0KICAgIGludGNfMSAvLyAxCiAgICBjb3ZlciAyCiAgICBzZWxlY3QKICAgIGR1cAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzdWJzdHJpbmczCiAgICBieXRlYyA0IC8vIDB4NjIKICAgICE9CiAgICBieiBfcGFja19jaWRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjY4CiAgICAvLyByZXR1cm4gdGV4dAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX3BhY2tfY2lkX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NjkKICAgIC8vIHBhY2tlZCA9IHNlbGYuX2Jhc2UzMl9kZWNvZGUodGV4dFsxOl0pCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc3Vic3RyaW5nMwogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Njk1CiAgICAvLyBkZWNvZGVkID0gQnl0ZXMoKQogICAgYnl0ZWNfMyAvLyAweAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5NgogICAgLy8gYnVmZmVyID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Njk3CiAgICAvLyBiaXRzID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5OAogICAgLy8gZm9yIGkgaW4gdXJhbmdlKHRleHQubGVuZ3RoKToKICAgIGxlbgogICAgc3dhcAogICAgaW50Y18wIC8vIDAKCl9wYWNrX2NpZF9mb3JfaGVhZGVyQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Njk4CiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UodGV4dC5sZW5ndGgpOgogICAgZHVwCiAgICBkaWcgMwogICAgPAogICAgYnogX3BhY2tfY2lkX2FmdGVyX2ZvckAxNwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY5OQogICAgLy8gY2hhciA9IG9wLmdldGJ5dGUodGV4dCwgaSkKICAgIGRpZyA0CiAgICBkaWcgMQogICAgZ2V0Ynl0ZQogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzAwCiAgICAvLyBpZiBjaGFyID49IDk3IGFuZCBjaGFyIDw9IDEyMjogICMgYS16CiAgICBwdXNoaW50IDk3CiAgICA+PQogICAgYnogX3BhY2tfY2lkX2Vsc2VfYm9keUA4CiAgICBkdXAKICAgIHB1c2hpbnQgMTIyCiAgICA8PQogICAgYnogX3BhY2tfY2lkX2Vsc2VfYm9keUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzAxCiAgICAvLyB2YWx1ZSA9IGNoYXIgLSA5NwogICAgcHVzaGludCA5NwogICAgLQoKX3BhY2tfY2lkX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzA1CiAgICAvLyBidWZmZXIgPSAoYnVmZmVyIDw8IDUpIHwgdmFsdWUKICAgIGZyYW1lX2RpZyAwCiAgICBwdXNoaW50IDUKICAgIHNobAogICAgfAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzA2CiAgICAvLyBiaXRzICs9IDUKICAgIHN3YXAKICAgIHB1c2hpbnQgNQogICAgKwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzA3CiAgICAvLyBpZiBiaXRzID49IDg6CiAgICBpbnRjXzIgLy8gOAogICAgPj0KICAgIGJ6IF9wYWNrX2NpZF9hZnRlcl9pZl9lbHNlQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzA4CiAgICAvLyBiaXRzIC09IDgKICAgIHN3YXAKICAgIGludGNfMiAvLyA4CiAgICAtCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MDkKICAgIC8vIGRlY29kZWQgKz0gb3AuZXh0cmFjdChvcC5pdG9iKGJ1ZmZlciA+PiBiaXRzKSwgNywgMSkKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGRpZyAxCiAgICBzaHIKICAgIGl0b2IKICAgIGV4dHJhY3QgNyAxCiAgICB1bmNvdmVyIDYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgY292ZXIgNQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxMAogICAgLy8gYnVmZmVyICY9IChVSW50NjQoMSkgPDwgYml0cykgLSAxCiAgICBpbnRjXzEgLy8gMQogICAgc3dhcAogICAgc2hsCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgJgogICAgZnJhbWVfYnVyeSAwCgpfcGFja19jaWRfYWZ0ZXJfaWZfZWxzZUAxNToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2OTgKICAgIC8vIGZvciBpIGluIHVyYW5nZSh0ZXh0Lmxlbmd0aCk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYiBfcGFja19jaWRfZm9yX2hlYWRlckA0CgpfcGFja19jaWRfZWxzZV9ib2R5QDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzAzCiAgICAvLyBhc3NlcnQgY2hhciA+PSA1MCBhbmQgY2hhciA8PSA1NSwgImludmFsaWQgY2lkIiAgIyAyLTcKICAgIGR1cAogICAgcHVzaGludCA1MAogICAgPj0KICAgIGJ6IF9wYWNrX2NpZF9ib29sX2ZhbHNlQDExCiAgICBkdXAKICAgIHB1c2hpbnQgNTUKICAgIDw9CiAgICBieiBfcGFja19jaWRfYm9vbF9mYWxzZUAxMQogICAgaW50Y18xIC8vIDEKCl9wYWNrX2NpZF9ib29sX21lcmdlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcwMwogICAgLy8gYXNzZXJ0IGNoYXIgPj0gNTAgYW5kIGNoYXIgPD0gNTUsICJpbnZhbGlkIGNpZCIgICMgMi03CiAgICBhc3NlcnQgLy8gaW52YWxpZCBjaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MDQKICAgIC8vIHZhbHVlID0gY2hhciAtIDI0CiAgICBwdXNoaW50IDI0CiAgICAtCiAgICBiIF9wYWNrX2NpZF9hZnRlcl9pZl9lbHNlQDEzCgpfcGFja19jaWRfYm9vbF9mYWxzZUAxMToKICAgIGludGNfMCAvLyAwCiAgICBiIF9wYWNrX2NpZF9ib29sX21lcmdlQDEyCgpfcGFja19jaWRfYWZ0ZXJfZm9yQDE3OgogICAgcG9wCiAgICBidXJ5IDEKICAgIHVuY292ZXIgMgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzExLTcxMgogICAgLy8gIyBMZWZ0b3ZlciBiaXRzIGFyZSBwYWRkaW5nIGFuZCBtdXN0IGJlIHplcm8KICAgIC8vIGFzc2VydCBiaXRzIDwgNSBhbmQgYnVmZmVyID09IDAsICJpbnZhbGlkIGNpZCIKICAgIHB1c2hpbnQgNQogICAgPAogICAgYnogX3BhY2tfY2lkX2Jvb2xfZmFsc2VAMjAKICAgIGZyYW1lX2RpZyAwCiAgICBibnogX3BhY2tfY2lkX2Jvb2xfZmFsc2VAMjAKICAgIGludGNfMSAvLyAxCgpfcGFja19jaWRfYm9vbF9tZXJnZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MTEtNzEyCiAgICAvLyAjIExlZnRvdmVyIGJpdHMgYXJlIHBhZGRpbmcgYW5kIG11c3QgYmUgemVybwogICAgLy8gYXNzZXJ0IGJpdHMgPCA1IGFuZCBidWZmZXIgPT0gMCwgImludmFsaWQgY2lkIgogICAgYXNzZXJ0IC8vIGludmFsaWQgY2lkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjcwCiAgICAvLyBhc3NlcnQgcGFja2VkWzoxXSA9PSBDSURfVjFfUFJFRklYLCAiaW52YWxpZCBjaWQiCiAgICBkdXAKICAgIGxlbgogICAgaW50Y18xIC8vIDEKICAgIGRpZyAxCiAgICA+PQogICAgaW50Y18xIC8vIDEKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZGlnIDEKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGJ5dGVjIDIyIC8vIDB4MDEKICAgID09CiAgICBhc3NlcnQgLy8gaW52YWxpZCBjaWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NzEKICAgIC8vIHJldHVybiBwYWNrZWQKICAgIHN3YXAKICAgIHJldHN1YgoKX3BhY2tfY2lkX2Jvb2xfZmFsc2VAMjA6CiAgICBpbnRjXzAgLy8gMAogICAgYiBfcGFja19jaWRfYm9vbF9tZXJnZUAyMQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll91bnBhY2tfY2lkKHBhY2tlZDogYnl0ZXMpIC0+IGJ5dGVzOgpfdW5wYWNrX2NpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2NzMtNjc0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF91bnBhY2tfY2lkKHNlbGYsIHBhY2tlZDogQnl0ZXMpIC0+IFN0cmluZzoKICAgIHByb3RvIDEgMQogICAgYnl0ZWNfMyAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjgwCiAgICAvLyBpZiBwYWNrZWRbOjFdID09IENJRF9WMV9QUkVGSVg6CiAgICBmcmFtZV9kaWcgLTEKICAgIGxlbgogICAgZHVwCiAgICBpbnRjXzEgLy8gMQogICAgZGlnIDEKICAgID49CiAgICBpbnRjXzEgLy8gMQogICAgY292ZXIgMgogICAgc2VsZWN0CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDIKICAgIHN1YnN0cmluZzMKICAgIGJ5dGVjIDIyIC8vIDB4MDEKICAgID09CiAgICBieiBfdW5wYWNrX2NpZF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2ODIKICAgIC8vIFVOUEFDS19CVURHRVRfUEVSX0NJRF9CWVRFICogcGFja2VkLmxlbmd0aCwgT3BVcEZlZVNvdXJjZS5Hcm91cENyZWRpdAogICAgcHVzaGludCA2MAogICAgZGlnIDEKICAgICoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NjgxLTY4MwogICAgLy8gZW5zdXJlX2J1ZGdldCgKICAgIC8vICAgICBVTlBBQ0tfQlVER0VUX1BFUl9DSURfQllURSAqIHBhY2tlZC5sZW5ndGgsIE9wVXBGZWVTb3VyY2UuR3JvdXBDcmVkaXQKICAgIC8vICkKICAgIGNhbGxzdWIgZW5zdXJlX2J1ZGdldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxOQogICAgLy8gdGV4dCA9IEJ5dGVzKCkKICAgIGJ5dGVjXzMgLy8gMHgKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MjAKICAgIC8vIGJ1ZmZlciA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyMQogICAgLy8gYml0cyA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyMgogICAgLy8gZm9yIGkgaW4gdXJhbmdlKGRhdGEubGVuZ3RoKToKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCgpfdW5wYWNrX2NpZF9mb3JfaGVhZGVyQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzIyCiAgICAvLyBmb3IgaSBpbiB1cmFuZ2UoZGF0YS5sZW5ndGgpOgogICAgZHVwMgogICAgPAogICAgYnogX3VucGFja19jaWRfYWZ0ZXJfZm9yQDEwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzIzCiAgICAvLyBidWZmZXIgPSAoYnVmZmVyIDw8IDgpIHwgb3AuZ2V0Ynl0ZShkYXRhLCBpKQogICAgZnJhbWVfZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICBzaGwKICAgIGZyYW1lX2RpZyAtMQogICAgZGlnIDMKICAgIGdldGJ5dGUKICAgIHwKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyNAogICAgLy8gYml0cyArPSA4CiAgICBmcmFtZV9kaWcgMAogICAgaW50Y18yIC8vIDgKICAgICsKICAgIGZyYW1lX2J1cnkgMAoKX3VucGFja19jaWRfd2hpbGVfdG9wQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzI1CiAgICAvLyB3aGlsZSBiaXRzID49IDU6CiAgICBmcmFtZV9kaWcgMAogICAgcHVzaGludCA1CiAgICA+PQogICAgYnogX3VucGFja19jaWRfYWZ0ZXJfd2hpbGVAOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyNgogICAgLy8gYml0cyAtPSA1CiAgICBmcmFtZV9kaWcgMAogICAgcHVzaGludCA1CiAgICAtCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyNwogICAgLy8gdGV4dCArPSBvcC5leHRyYWN0KGFscGhhYmV0LCAoYnVmZmVyID4+IGJpdHMpICYgMzEsIDEpCiAgICBmcmFtZV9kaWcgMQogICAgc3dhcAogICAgc2hyCiAgICBwdXNoaW50IDMxCiAgICAmCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzE4CiAgICAvLyBhbHBoYWJldCA9IEJ5dGVzKEJBU0UzMl9BTFBIQUJFVCkKICAgIGJ5dGVjIDM5IC8vIDB4NjE2MjYzNjQ2NTY2Njc2ODY5NmE2YjZjNmQ2ZTZmNzA3MTcyNzM3NDc1NzY3Nzc4Nzk3YTMyMzMzNDM1MzYzNwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyNwogICAgLy8gdGV4dCArPSBvcC5leHRyYWN0KGFscGhhYmV0LCAoYnVmZmVyID4+IGJpdHMpICYgMzEsIDEpCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgZXh0cmFjdDMKICAgIHVuY292ZXIgMwogICAgc3dhcAogICAgY29uY2F0CiAgICBjb3ZlciAyCiAgICBiIF91bnBhY2tfY2lkX3doaWxlX3RvcEA2CgpfdW5wYWNrX2NpZF9hZnRlcl93aGlsZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyOAogICAgLy8gYnVmZmVyICY9IChVSW50NjQoMSkgPDwgYml0cykgLSAxCiAgICBpbnRjXzEgLy8gMQogICAgZnJhbWVfZGlnIDAKICAgIHNobAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGZyYW1lX2RpZyAxCiAgICAmCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MjIKICAgIC8vIGZvciBpIGluIHVyYW5nZShkYXRhLmxlbmd0aCk6CiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgc3dhcAogICAgYiBfdW5wYWNrX2NpZF9mb3JfaGVhZGVyQDQKCl91bnBhY2tfY2lkX2FmdGVyX2ZvckAxMDoKICAgIHBvcG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcyOQogICAgLy8gaWYgYml0czoKICAgIGZyYW1lX2RpZyAwCiAgICBieiBfdW5wYWNrX2NpZF9hZnRlcl9pZl9lbHNlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzMwCiAgICAvLyB0ZXh0ICs9IG9wLmV4dHJhY3QoYWxwaGFiZXQsIChidWZmZXIgPDwgKFVJbnQ2NCg1KSAtIGJpdHMpKSAmIDMxLCAxKQogICAgcHVzaGludCA1CiAgICBmcmFtZV9kaWcgMAogICAgLQogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIHNobAogICAgcHVzaGludCAzMQogICAgJgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjcxOAogICAgLy8gYWxwaGFiZXQgPSBCeXRlcyhCQVNFMzJfQUxQSEFCRVQpCiAgICBieXRlYyAzOSAvLyAweDYxNjI2MzY0NjU2NjY3Njg2OTZhNmI2YzZkNmU2ZjcwNzE3MjczNzQ3NTc2Nzc3ODc5N2EzMjMzMzQzNTM2MzcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3MzAKICAgIC8vIHRleHQgKz0gb3AuZXh0cmFjdChhbHBoYWJldCwgKGJ1ZmZlciA8PCAoVUludDY0KDUpIC0gYml0cykpICYgMzEsIDEpCiAgICBzd2FwCiAgICBpbnRjXzEgLy8gMQogICAgZXh0cmFjdDMKICAgIGNvbmNhdAoKX3VucGFja19jaWRfYWZ0ZXJfaWZfZWxzZUAxMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2ODUKICAgIC8vIEJ5dGVzKENJRF9CQVNFMzJfUFJFRklYKSArIHNlbGYuX2Jhc2UzMl9lbmNvZGUocGFja2VkKQogICAgYnl0ZWMgNCAvLyAweDYyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo2ODQtNjg2CiAgICAvLyByZXR1cm4gU3RyaW5nLmZyb21fYnl0ZXMoCiAgICAvLyAgICAgQnl0ZXMoQ0lEX0JBU0UzMl9QUkVGSVgpICsgc2VsZi5fYmFzZTMyX2VuY29kZShwYWNrZWQpCiAgICAvLyApCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKX3VucGFja19jaWRfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjY4NwogICAgLy8gcmV0dXJuIFN0cmluZy5mcm9tX2J5dGVzKHBhY2tlZCkKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fc2V0X3BlbmRpbmdfbmV4dChwcm9qZWN0X2lkOiB1aW50NjQsIG5leHRfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKX3NldF9wZW5kaW5nX25leHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzQ3LTc0OAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfc2V0X3BlbmRpbmdfbmV4dChzZWxmLCBwcm9qZWN0X2lkOiBVSW50NjQsIG5leHRfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc0OQogICAgLy8gbGluayA9IHNlbGYucGVuZGluZ19xdWV1ZVtwcm9qZWN0X2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWMgMTQgLy8gMHg3MQogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzUwCiAgICAvLyBsaW5rLm5leHRfcGVuZGluZyA9IGFyYzQuVUludDY0KG5leHRfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTAtNzUxCiAgICAvLyBsaW5rLm5leHRfcGVuZGluZyA9IGFyYzQuVUludDY0KG5leHRfaWQpCiAgICAvLyBzZWxmLnBlbmRpbmdfcXVldWVbcHJvamVjdF9pZF0gPSBsaW5rLmNvcHkoKQogICAgaW50Y18yIC8vIDgKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fZGVxdWV1ZV9wZW5kaW5nKHByb2plY3RfaWQ6IHVpbnQ2NCwgc3VibWl0dGVyOiBieXRlcykgLT4gdm9pZDoKX2RlcXVldWVfcGVuZGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTMtNzU0CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9kZXF1ZXVlX3BlbmRpbmcoc2VsZiwgcHJvamVjdF9pZDogVUludDY0LCBzdWJtaXR0ZXI6IEFjY291bnQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NTkKICAgIC8vIGxpbmsgPSBzZWxmLnBlbmRpbmdfcXVldWVbcHJvamVjdF9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDE0IC8vIDB4NzEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wZW5kaW5nX3F1ZXVlIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc2MAogICAgLy8gcHJldl9pZCA9IGxpbmsucHJldl9wZW5kaW5nLm5hdGl2ZQogICAgZHVwCiAgICBleHRyYWN0IDAgOAogICAgc3dhcAogICAgZHVwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzYxCiAgICAvLyBuZXh0X2lkID0gbGluay5uZXh0X3BlbmRpbmcubmF0aXZlCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdF91aW50NjQKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NjIKICAgIC8vIGlmIHByZXZfaWQgPT0gTk9fUFJPSkVDVDoKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgPT0KICAgIGJ6IF9kZXF1ZXVlX3BlbmRpbmdfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NjMKICAgIC8vIHNlbGYucGVuZGluZ19oZWFkID0gbmV4dF9pZAogICAgYnl0ZWMgMTcgLy8gInBlbmRpbmdfaGVhZCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAoKX2RlcXVldWVfcGVuZGluZ19hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzY2CiAgICAvLyBpZiBuZXh0X2lkID09IE5PX1BST0pFQ1Q6CiAgICBkdXAKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgPT0KICAgIGJ6IF9kZXF1ZXVlX3BlbmRpbmdfZWxzZV9ib2R5QDUKICAgIHBvcAogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzY3CiAgICAvLyBzZWxmLnBlbmRpbmdfdGFpbCA9IHByZXZfaWQKICAgIGJ5dGVjIDE4IC8vICJwZW5kaW5nX3RhaWwiCiAgICBzd2FwCiAgICBhcHBfZ2xvYmFsX3B1dAoKX2RlcXVldWVfcGVuZGluZ19hZnRlcl9pZl9lbHNlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzczCiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzc0CiAgICAvLyBkZWwgc2VsZi5wZW5kaW5nX3F1ZXVlW3Byb2plY3RfaWRdCiAgICBzd2FwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NzYKICAgIC8vIHN1Ym1pdHRlciwgbWJyX2JlZm9yZSAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3NS03NzcKICAgIC8vIHNlbGYuX3BheV9vdXQoCiAgICAvLyAgICAgc3VibWl0dGVyLCBtYnJfYmVmb3JlIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgLy8gKQogICAgZnJhbWVfZGlnIC0xCiAgICBzd2FwCiAgICBjYWxsc3ViIF9wYXlfb3V0CiAgICByZXRzdWIKCl9kZXF1ZXVlX3BlbmRpbmdfZWxzZV9ib2R5QDU6CiAgICBidXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo3NjkKICAgIC8vIGZvbGxvd2luZyA9IHNlbGYucGVuZGluZ19xdWV1ZVtuZXh0X2lkXS5jb3B5KCkKICAgIGl0b2IKICAgIGJ5dGVjIDE0IC8vIDB4NzEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc3MC03NzEKICAgIC8vIGZvbGxvd2luZy5wcmV2X3BlbmRpbmcgPSBhcmM0LlVJbnQ2NChwcmV2X2lkKQogICAgLy8gc2VsZi5wZW5kaW5nX3F1ZXVlW25leHRfaWRdID0gZm9sbG93aW5nLmNvcHkoKQogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKICAgIGIgX2RlcXVldWVfcGVuZGluZ19hZnRlcl9pZl9lbHNlQDYKCl9kZXF1ZXVlX3BlbmRpbmdfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzY1CiAgICAvLyBzZWxmLl9zZXRfcGVuZGluZ19uZXh0KHByZXZfaWQsIG5leHRfaWQpCiAgICBkdXAyCiAgICBjYWxsc3ViIF9zZXRfcGVuZGluZ19uZXh0CiAgICBiIF9kZXF1ZXVlX3BlbmRpbmdfYWZ0ZXJfaWZfZWxzZUAzCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX3RhbGx5KGVjb3N5c3RlbTogdWludDY0LCBmcm9tX3N0YXR1czogdWludDY0LCB0b19zdGF0dXM6IHVpbnQ2NCwgY3JlZGl0czogdWludDY0KSAtPiB2b2lkOgpfdGFsbHk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzc5LTc4NgogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfdGFsbHkoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBlY29zeXN0ZW06IFVJbnQ2NCwKICAgIC8vICAgICBmcm9tX3N0YXR1czogVUludDY0LAogICAgLy8gICAgIHRvX3N0YXR1czogVUludDY0LAogICAgLy8gICAgIGNyZWRpdHM6IFVJbnQ2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5MgogICAgLy8gY291bnRzID0gc2VsZi5zdGF0dXNfY291bnRzLmNvcHkoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDE2IC8vICJzdGF0dXNfY291bnRzIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnN0YXR1c19jb3VudHMgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6NzkzCiAgICAvLyBpZiBmcm9tX3N0YXR1czoKICAgIGZyYW1lX2RpZyAtMwogICAgYnogX3RhbGx5X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5NAogICAgLy8gY291bnRzW2Zyb21fc3RhdHVzXSA9IGFyYzQuVUludDY0KGNvdW50c1tmcm9tX3N0YXR1c10ubmF0aXZlIC0gMSkKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgaXRvYgogICAgcmVwbGFjZTMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCgpfdGFsbHlfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojc5NQogICAgLy8gY291bnRzW3RvX3N0YXR1c10gPSBhcmM0LlVJbnQ2NChjb3VudHNbdG9fc3RhdHVzXS5uYXRpdmUgKyAxKQogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgY292ZXIgMgogICAgZGlnIDEKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzk2CiAgICAvLyBzZWxmLnN0YXR1c19jb3VudHMgPSBjb3VudHMuY29weSgpCiAgICBieXRlYyAxNiAvLyAic3RhdHVzX2NvdW50cyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzk4CiAgICAvLyBpZiBlY29zeXN0ZW0gaW4gc2VsZi5lY29zeXN0ZW1fdG90YWxzOgogICAgZnJhbWVfZGlnIC00CiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHg2NQogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYnogX3RhbGx5X2Vsc2VfYm9keUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6Nzk5CiAgICAvLyB0b3RhbHMgPSBzZWxmLmVjb3N5c3RlbV90b3RhbHNbZWNvc3lzdGVtXS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuZWNvc3lzdGVtX3RvdGFscyBlbnRyeSBleGlzdHMKCl90YWxseV9hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODA1CiAgICAvLyBpZiBmcm9tX3N0YXR1czoKICAgIGZyYW1lX2RpZyAtMwogICAgYnogX3RhbGx5X2FmdGVyX2lmX2Vsc2VANwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwNwogICAgLy8gdG90YWxzLmJ5X3N0YXR1c1tmcm9tX3N0YXR1c10ubmF0aXZlIC0gMQogICAgZHVwCiAgICBleHRyYWN0IDAgNDAKICAgIGZyYW1lX2RpZyAtMwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwNi04MDgKICAgIC8vIHRvdGFscy5ieV9zdGF0dXNbZnJvbV9zdGF0dXNdID0gYXJjNC5VSW50NjQoCiAgICAvLyAgICAgdG90YWxzLmJ5X3N0YXR1c1tmcm9tX3N0YXR1c10ubmF0aXZlIC0gMQogICAgLy8gKQogICAgaXRvYgogICAgcmVwbGFjZTMgLy8gb24gZXJyb3I6IGluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICByZXBsYWNlMiAwCgpfdGFsbHlfYWZ0ZXJfaWZfZWxzZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgwOQogICAgLy8gdG90YWxzLmJ5X3N0YXR1c1t0b19zdGF0dXNdID0gYXJjNC5VSW50NjQodG90YWxzLmJ5X3N0YXR1c1t0b19zdGF0dXNdLm5hdGl2ZSArIDEpCiAgICBkdXAKICAgIGV4dHJhY3QgMCA0MAogICAgZHVwCiAgICB1bmNvdmVyIDQKICAgIGR1cAogICAgY292ZXIgMwogICAgZXh0cmFjdF91aW50NjQKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpdG9iCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICByZXBsYWNlMyAvLyBvbiBlcnJvcjogaW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHJlcGxhY2UyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MTAKICAgIC8vIHRvdGFscy5jcmVkaXRzX2lzc3VlZCA9IGFyYzQuVUludDY0KHRvdGFscy5jcmVkaXRzX2lzc3VlZC5uYXRpdmUgKyBjcmVkaXRzKQogICAgZHVwCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiA0MAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxMQogICAgLy8gc2VsZi5lY29zeXN0ZW1fdG90YWxzW2Vjb3N5c3RlbV0gPSB0b3RhbHMuY29weSgpCiAgICBib3hfcHV0CiAgICByZXRzdWIKCl90YWxseV9lbHNlX2JvZHlANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MDEtODA0CiAgICAvLyB0b3RhbHMgPSBQcm9qZWN0VG90YWxzKAogICAgLy8gICAgIGJ5X3N0YXR1cz1TdGF0dXNDb3VudHMuZnJvbV9ieXRlcyhvcC5iemVybyg1ICogOCkpLAogICAgLy8gICAgIGNyZWRpdHNfaXNzdWVkPWFyYzQuVUludDY0KDApLAogICAgLy8gKQogICAgYnl0ZWMgMzIgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIGIgX3RhbGx5X2FmdGVyX2lmX2Vsc2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9jaGVja19tYnJfcGF5bWVudChwYXltZW50OiB1aW50NjQsIG1icl9iZWZvcmU6IHVpbnQ2NCkgLT4gdm9pZDoKX2NoZWNrX21icl9wYXltZW50OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxMy04MTYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2NoZWNrX21icl9wYXltZW50KAogICAgLy8gICAgIHNlbGYsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uLCBtYnJfYmVmb3JlOiBVSW50NjQKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgxOAogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgInBheSB0aGUgY29udHJhY3QiCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIFJlY2VpdmVyCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgPT0KICAgIGFzc2VydCAvLyBwYXkgdGhlIGNvbnRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODE5CiAgICAvLyBtYnJfZGVsdGEgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlIC0gbWJyX2JlZm9yZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MjAKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA+PSBtYnJfZGVsdGEsICJpbnN1ZmZpY2llbnQgbWJyIHBheW1lbnQiCiAgICBmcmFtZV9kaWcgLTIKICAgIGd0eG5zIEFtb3VudAogICAgPD0KICAgIGFzc2VydCAvLyBpbnN1ZmZpY2llbnQgbWJyIHBheW1lbnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9pc19leHBpcmVkKGV4cGlyZXNfcm91bmQ6IHVpbnQ2NCkgLT4gdWludDY0OgpfaXNfZXhwaXJlZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4MzAtODMxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9pc19leHBpcmVkKHNlbGYsIGV4cGlyZXNfcm91bmQ6IFVJbnQ2NCkgLT4gYm9vbDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjgzMgogICAgLy8gcmV0dXJuIGV4cGlyZXNfcm91bmQgIT0gMCBhbmQgR2xvYmFsLnJvdW5kID4gZXhwaXJlc19yb3VuZAogICAgZnJhbWVfZGlnIC0xCiAgICBieiBfaXNfZXhwaXJlZF9ib29sX2ZhbHNlQDMKICAgIGdsb2JhbCBSb3VuZAogICAgZnJhbWVfZGlnIC0xCiAgICA+CiAgICBieiBfaXNfZXhwaXJlZF9ib29sX2ZhbHNlQDMKICAgIGludGNfMSAvLyAxCiAgICByZXRzdWIKCl9pc19leHBpcmVkX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODMyCiAgICAvLyByZXR1cm4gZXhwaXJlc19yb3VuZCAhPSAwIGFuZCBHbG9iYWwucm91bmQgPiBleHBpcmVzX3JvdW5kCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fYWN0aXZlX2FzayhsaXN0aW5nX2lkOiB1aW50NjQpIC0+IHVpbnQ2NDoKX2FjdGl2ZV9hc2s6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODM0LTgzNQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfYWN0aXZlX2FzayhzZWxmLCBsaXN0aW5nX2lkOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgaW50Y18wIC8vIDAKCl9hY3RpdmVfYXNrX3doaWxlX3RvcEAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0MAogICAgLy8gd2hpbGUgbGlzdGluZ19pZCAhPSBOT19MSVNUSU5HIGFuZCBzZWxmLl9pc19leHBpcmVkKAogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgICE9CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODQwLTg0MgogICAgLy8gd2hpbGUgbGlzdGluZ19pZCAhPSBOT19MSVNUSU5HIGFuZCBzZWxmLl9pc19leHBpcmVkKAogICAgLy8gICAgIHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0uZXhwaXJlc19yb3VuZC5uYXRpdmUKICAgIC8vICk6CiAgICBieiBfYWN0aXZlX2Fza19hZnRlcl93aGlsZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODQxCiAgICAvLyBzZWxmLmxpc3RpbmdzW2xpc3RpbmdfaWRdLmV4cGlyZXNfcm91bmQubmF0aXZlCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICBwdXNoaW50IDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0MC04NDIKICAgIC8vIHdoaWxlIGxpc3RpbmdfaWQgIT0gTk9fTElTVElORyBhbmQgc2VsZi5faXNfZXhwaXJlZCgKICAgIC8vICAgICBzZWxmLmxpc3RpbmdzW2xpc3RpbmdfaWRdLmV4cGlyZXNfcm91bmQubmF0aXZlCiAgICAvLyApOgogICAgY2FsbHN1YiBfaXNfZXhwaXJlZAogICAgYnogX2FjdGl2ZV9hc2tfYWZ0ZXJfd2hpbGVANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0MwogICAgLy8gbGlzdGluZ19pZCA9IHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0ubmV4dF9hc2submF0aXZlCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICBwdXNoaW50IDY0CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfYnVyeSAtMQogICAgYiBfYWN0aXZlX2Fza193aGlsZV90b3BAMQoKX2FjdGl2ZV9hc2tfYWZ0ZXJfd2hpbGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NDQKICAgIC8vIHJldHVybiBsaXN0aW5nX2lkCiAgICBmcmFtZV9kaWcgLTEKICAgIHN3YXAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9saXN0aW5nX3ZpZXcobGlzdGluZ19pZDogdWludDY0KSAtPiBieXRlczoKX2xpc3RpbmdfdmlldzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NDYtODQ3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9saXN0aW5nX3ZpZXcoc2VsZiwgbGlzdGluZ19pZDogVUludDY0KSAtPiBMaXN0aW5nVmlldzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg0OAogICAgLy8gbGlzdGluZyA9IHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODUxCiAgICAvLyBzZWxsZXI9bGlzdGluZy5zZWxsZXIsCiAgICBkdXAKICAgIGV4dHJhY3QgMCAzMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1MgogICAgLy8gYW1vdW50PWxpc3RpbmcuYW1vdW50LAogICAgZGlnIDEKICAgIGV4dHJhY3QgMzIgOAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg1MwogICAgLy8gcHJpY2U9bGlzdGluZy5wcmljZSwKICAgIGRpZyAyCiAgICBleHRyYWN0IDQwIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NTQKICAgIC8vIGV4cGlyZXNfcm91bmQ9bGlzdGluZy5leHBpcmVzX3JvdW5kLAogICAgdW5jb3ZlciAzCiAgICBleHRyYWN0IDQ4IDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NDktODU1CiAgICAvLyByZXR1cm4gTGlzdGluZ1ZpZXcoCiAgICAvLyAgICAgbGlzdGluZ19pZD1hcmM0LlVJbnQ2NChsaXN0aW5nX2lkKSwKICAgIC8vICAgICBzZWxsZXI9bGlzdGluZy5zZWxsZXIsCiAgICAvLyAgICAgYW1vdW50PWxpc3RpbmcuYW1vdW50LAogICAgLy8gICAgIHByaWNlPWxpc3RpbmcucHJpY2UsCiAgICAvLyAgICAgZXhwaXJlc19yb3VuZD1saXN0aW5nLmV4cGlyZXNfcm91bmQsCiAgICAvLyApCiAgICB1bmNvdmVyIDQKICAgIHVuY292ZXIgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2V4cGlyZV9saXN0aW5nKGxpc3RpbmdfaWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpfZXhwaXJlX2xpc3Rpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODU3LTg1OAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfZXhwaXJlX2xpc3Rpbmcoc2VsZiwgbGlzdGluZ19pZDogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NjUKICAgIC8vIGxpc3RpbmcgPSBzZWxmLmxpc3RpbmdzW2xpc3RpbmdfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBkdXAKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGlzdGluZ3MgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODY2CiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgc3dhcAogICAgY292ZXIgMwogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODY3CiAgICAvLyBpZiBsaXN0aW5nLnNlbGxlci5uYXRpdmUuaXNfb3B0ZWRfaW4oc2VsZi5hYXJuYV9hc3NldCk6CiAgICBleHRyYWN0IDAgMzIKICAgIGR1cAogICAgY292ZXIgMgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gImFhcm5hX2Fzc2V0IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFhcm5hX2Fzc2V0IGV4aXN0cwogICAgYXNzZXRfaG9sZGluZ19nZXQgQXNzZXRCYWxhbmNlCiAgICBidXJ5IDEKICAgIGJ6IF9leHBpcmVfbGlzdGluZ19lbHNlX2JvZHlAMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2OC04NzIKICAgIC8vIGl0eG4uQXNzZXRUcmFuc2ZlcigKICAgIC8vICAgICB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICAvLyAgICAgYXNzZXRfcmVjZWl2ZXI9bGlzdGluZy5zZWxsZXIubmF0aXZlLAogICAgLy8gICAgIGFzc2V0X2Ftb3VudD1saXN0aW5nLmFtb3VudC5uYXRpdmUsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODY5CiAgICAvLyB4ZmVyX2Fzc2V0PXNlbGYuYWFybmFfYXNzZXQsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMSAvLyAiYWFybmFfYXNzZXQiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWFybmFfYXNzZXQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODcxCiAgICAvLyBhc3NldF9hbW91bnQ9bGlzdGluZy5hbW91bnQubmF0aXZlLAogICAgZGlnIDEKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpdHhuX2ZpZWxkIEFzc2V0QW1vdW50CiAgICBkaWcgMgogICAgaXR4bl9maWVsZCBBc3NldFJlY2VpdmVyCiAgICBpdHhuX2ZpZWxkIFhmZXJBc3NldAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg2OAogICAgLy8gaXR4bi5Bc3NldFRyYW5zZmVyKAogICAgcHVzaGludCA0IC8vIGF4ZmVyCiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NjgtODcyCiAgICAvLyBpdHhuLkFzc2V0VHJhbnNmZXIoCiAgICAvLyAgICAgeGZlcl9hc3NldD1zZWxmLmFhcm5hX2Fzc2V0LAogICAgLy8gICAgIGFzc2V0X3JlY2VpdmVyPWxpc3Rpbmcuc2VsbGVyLm5hdGl2ZSwKICAgIC8vICAgICBhc3NldF9hbW91bnQ9bGlzdGluZy5hbW91bnQubmF0aXZlLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKCl9leHBpcmVfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODc5CiAgICAvLyBhbW91bnQ9bGlzdGluZy5hbW91bnQsCiAgICBleHRyYWN0IDMyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NzYtODgwCiAgICAvLyBMaXN0aW5nRXhwaXJlZCgKICAgIC8vICAgICBsaXN0aW5nX2lkPWFyYzQuVUludDY0KGxpc3RpbmdfaWQpLAogICAgLy8gICAgIHNlbGxlcj1saXN0aW5nLnNlbGxlciwKICAgIC8vICAgICBhbW91bnQ9bGlzdGluZy5hbW91bnQsCiAgICAvLyApCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4NzUtODgxCiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgTGlzdGluZ0V4cGlyZWQoCiAgICAvLyAgICAgICAgIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQobGlzdGluZ19pZCksCiAgICAvLyAgICAgICAgIHNlbGxlcj1saXN0aW5nLnNlbGxlciwKICAgIC8vICAgICAgICAgYW1vdW50PWxpc3RpbmcuYW1vdW50LAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweDk2ODcyNDg4IC8vIG1ldGhvZCAiTGlzdGluZ0V4cGlyZWQodWludDY0LGFkZHJlc3MsdWludDY0KSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODgyCiAgICAvLyBfcmVsZWFzZWQgPSBzZWxmLl9kZWxldGVfbGlzdGluZyhsaXN0aW5nX2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBjYWxsc3ViIF9kZWxldGVfbGlzdGluZwogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODgzCiAgICAvLyBtYnJfYWZ0ZXIgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODg0CiAgICAvLyByZXR1cm4gbWJyX2JlZm9yZSAtIG1icl9hZnRlciBpZiBtYnJfYmVmb3JlID4gbWJyX2FmdGVyIGVsc2UgVUludDY0KDApCiAgICBkaWcgMgogICAgPAogICAgYnogX2V4cGlyZV9saXN0aW5nX3Rlcm5hcnlfZmFsc2VANgogICAgLQogICAgcmV0c3ViCgpfZXhwaXJlX2xpc3RpbmdfdGVybmFyeV9mYWxzZUA2OgogICAgcG9wbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODg0CiAgICAvLyByZXR1cm4gbWJyX2JlZm9yZSAtIG1icl9hZnRlciBpZiBtYnJfYmVmb3JlID4gbWJyX2FmdGVyIGVsc2UgVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgcmV0c3ViCgpfZXhwaXJlX2xpc3RpbmdfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODc0CiAgICAvLyBzZWxmLl9ob2xkX2NsYWltKGxpc3Rpbmcuc2VsbGVyLm5hdGl2ZSwgVUludDY0KDApLCBsaXN0aW5nLmFtb3VudC5uYXRpdmUpCiAgICBkdXAKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMgogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgY2FsbHN1YiBfaG9sZF9jbGFpbQogICAgYiBfZXhwaXJlX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2ZpbGxfbGlzdGluZyhsaXN0aW5nX2lkOiB1aW50NjQsIGxpc3Rpbmc6IGJ5dGVzLCBxdWFudGl0eTogdWludDY0KSAtPiB1aW50NjQsIGJ5dGVzOgpfZmlsbF9saXN0aW5nOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg4Ni04ODkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2ZpbGxfbGlzdGluZygKICAgIC8vICAgICBzZWxmLCBsaXN0aW5nX2lkOiBVSW50NjQsIGxpc3Rpbmc6IExpc3RpbmcsIHF1YW50aXR5OiBVSW50NjQKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gMyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODk2CiAgICAvLyBhc3NlcnQgcXVhbnRpdHkgPiBVSW50NjQoMCksICJxdWFudGl0eSBtdXN0IGJlID4gMCIKICAgIGZyYW1lX2RpZyAtMQogICAgYXNzZXJ0IC8vIHF1YW50aXR5IG11c3QgYmUgPiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6ODk3CiAgICAvLyBhc3NlcnQgcXVhbnRpdHkgPD0gbGlzdGluZy5hbW91bnQubmF0aXZlLCAicXVhbnRpdHkgZXhjZWVkcyBsaXN0aW5nIgogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgPD0KICAgIGFzc2VydCAvLyBxdWFudGl0eSBleGNlZWRzIGxpc3RpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo4OTgKICAgIC8vIHRvdGFsX2Nvc3QgPSBxdWFudGl0eSAqIGxpc3RpbmcucHJpY2UubmF0aXZlCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgNDAgOAogICAgZnJhbWVfZGlnIC0yCiAgICBwdXNoaW50IDQwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgKgogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojg5OQogICAgLy8gc2VsZi5fcmVjb3JkX3RyYWRlKHF1YW50aXR5LCBsaXN0aW5nLnByaWNlLm5hdGl2ZSkKICAgIGZyYW1lX2RpZyAtMQogICAgc3dhcAogICAgY2FsbHN1YiBfcmVjb3JkX3RyYWRlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTAyCiAgICAvLyByZW1haW5pbmcgPSBsaXN0aW5nLmFtb3VudC5uYXRpdmUgLSBxdWFudGl0eQogICAgc3dhcAogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTA1CiAgICAvLyBsaXN0aW5nX2lkPWFyYzQuVUludDY0KGxpc3RpbmdfaWQpLAogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGNvdmVyIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MDYKICAgIC8vIGJ1eWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MDcKICAgIC8vIHF1YW50aXR5PWFyYzQuVUludDY0KHF1YW50aXR5KSwKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkwOQogICAgLy8gcmVtYWluaW5nPWFyYzQuVUludDY0KHJlbWFpbmluZyksCiAgICBkaWcgMgogICAgaXRvYgogICAgZHVwCiAgICBjb3ZlciA0CiAgICBjb3ZlciA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTA0LTkxMAogICAgLy8gTGlzdGluZ0ZpbGxlZCgKICAgIC8vICAgICBsaXN0aW5nX2lkPWFyYzQuVUludDY0KGxpc3RpbmdfaWQpLAogICAgLy8gICAgIGJ1eWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBxdWFudGl0eT1hcmM0LlVJbnQ2NChxdWFudGl0eSksCiAgICAvLyAgICAgcHJpY2U9bGlzdGluZy5wcmljZSwKICAgIC8vICAgICByZW1haW5pbmc9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICkKICAgIHVuY292ZXIgNAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgdW5jb3ZlciAzCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTAzLTkxMQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIExpc3RpbmdGaWxsZWQoCiAgICAvLyAgICAgICAgIGxpc3RpbmdfaWQ9YXJjNC5VSW50NjQobGlzdGluZ19pZCksCiAgICAvLyAgICAgICAgIGJ1eWVyPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgcXVhbnRpdHk9YXJjNC5VSW50NjQocXVhbnRpdHkpLAogICAgLy8gICAgICAgICBwcmljZT1saXN0aW5nLnByaWNlLAogICAgLy8gICAgICAgICByZW1haW5pbmc9YXJjNC5VSW50NjQocmVtYWluaW5nKSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg2ODJlNGZmOSAvLyBtZXRob2QgIkxpc3RpbmdGaWxsZWQodWludDY0LGFkZHJlc3MsdWludDY0LHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MTIKICAgIC8vIGlmIHJlbWFpbmluZzoKICAgIGJ6IF9maWxsX2xpc3RpbmdfZWxzZV9ib2R5QDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5MTMKICAgIC8vIGxpc3RpbmcuYW1vdW50ID0gYXJjNC5VSW50NjQocmVtYWluaW5nKQogICAgZnJhbWVfZGlnIC0yCiAgICBzd2FwCiAgICByZXBsYWNlMiAzMgogICAgZnJhbWVfYnVyeSAtMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxNAogICAgLy8gc2VsZi5saXN0aW5nc1tsaXN0aW5nX2lkXSA9IGxpc3RpbmcuY29weSgpCiAgICBieXRlY18yIC8vIDB4NmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0yCiAgICBib3hfcHV0CiAgICBkdXAKCl9maWxsX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkxOC05MTkKICAgIC8vICMgRm9yd2FyZCBBTEdPIHRvIHNlbGxlcgogICAgLy8gc2VsZi5fcGF5X291dChsaXN0aW5nLnNlbGxlci5uYXRpdmUsIHNlbGxlcl9wYXlvdXQpCiAgICBmcmFtZV9kaWcgLTIKICAgIGV4dHJhY3QgMCAzMgogICAgc3dhcAogICAgY2FsbHN1YiBfcGF5X291dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjkyMAogICAgLy8gcmV0dXJuIHRvdGFsX2Nvc3QKICAgIGZyYW1lX2RpZyAtMgogICAgcmV0c3ViCgpfZmlsbF9saXN0aW5nX2Vsc2VfYm9keUA0OgogICAgcG9wbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTE2LTkxNwogICAgLy8gIyBTb2xkIG91dDogdGhlIHJlbGVhc2VkIGxpc3RpbmcgTUJSIGdvZXMgYmFjayB0byB0aGUgc2VsbGVyCiAgICAvLyBzZWxsZXJfcGF5b3V0ICs9IHNlbGYuX2RlbGV0ZV9saXN0aW5nKGxpc3RpbmdfaWQpCiAgICBmcmFtZV9kaWcgLTMKICAgIGNhbGxzdWIgX2RlbGV0ZV9saXN0aW5nCiAgICBkaWcgMQogICAgKwogICAgYiBfZmlsbF9saXN0aW5nX2FmdGVyX2lmX2Vsc2VANQoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9zZXRfYXNrX25leHQobGlzdGluZ19pZDogdWludDY0LCBuZXh0X2lkOiB1aW50NjQpIC0+IHZvaWQ6Cl9zZXRfYXNrX25leHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTQ2LTk0NwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfc2V0X2Fza19uZXh0KHNlbGYsIGxpc3RpbmdfaWQ6IFVJbnQ2NCwgbmV4dF9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTQ5CiAgICAvLyBpZiBsaXN0aW5nX2lkID09IE5PX0xJU1RJTkc6CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgPT0KICAgIGJ6IF9zZXRfYXNrX25leHRfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NTAKICAgIC8vIHNlbGYuYmVzdF9hc2tfaWQgPSBuZXh0X2lkCiAgICBieXRlYyA1IC8vICJiZXN0X2Fza19pZCIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKX3NldF9hc2tfbmV4dF9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NTIKICAgIC8vIGxpc3RpbmcgPSBzZWxmLmxpc3RpbmdzW2xpc3RpbmdfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4NmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk1MwogICAgLy8gbGlzdGluZy5uZXh0X2FzayA9IGFyYzQuVUludDY0KG5leHRfaWQpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NTMtOTU0CiAgICAvLyBsaXN0aW5nLm5leHRfYXNrID0gYXJjNC5VSW50NjQobmV4dF9pZCkKICAgIC8vIHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0gPSBsaXN0aW5nLmNvcHkoKQogICAgcHVzaGludCA2NAogICAgc3dhcAogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9zZXRfYXNrX3ByZXYobGlzdGluZ19pZDogdWludDY0LCBwcmV2X2lkOiB1aW50NjQpIC0+IHZvaWQ6Cl9zZXRfYXNrX3ByZXY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTU2LTk1NwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfc2V0X2Fza19wcmV2KHNlbGYsIGxpc3RpbmdfaWQ6IFVJbnQ2NCwgcHJldl9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTU5CiAgICAvLyBpZiBsaXN0aW5nX2lkICE9IE5PX0xJU1RJTkc6CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgIT0KICAgIGJ6IF9zZXRfYXNrX3ByZXZfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTYwCiAgICAvLyBsaXN0aW5nID0gc2VsZi5saXN0aW5nc1tsaXN0aW5nX2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDZjCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NjEKICAgIC8vIGxpc3RpbmcucHJldl9hc2sgPSBhcmM0LlVJbnQ2NChwcmV2X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTYxLTk2MgogICAgLy8gbGlzdGluZy5wcmV2X2FzayA9IGFyYzQuVUludDY0KHByZXZfaWQpCiAgICAvLyBzZWxmLmxpc3RpbmdzW2xpc3RpbmdfaWRdID0gbGlzdGluZy5jb3B5KCkKICAgIHB1c2hpbnQgNTYKICAgIHN3YXAKICAgIGJveF9yZXBsYWNlIC8vIG9uIGVycm9yOiBpbmRleCBvdXQgb2YgYm91bmRzCgpfc2V0X2Fza19wcmV2X2FmdGVyX2lmX2Vsc2VAMjoKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9pbmRleF9sZW5ndGgoa2V5OiBieXRlcykgLT4gdWludDY0OgpfaW5kZXhfbGVuZ3RoOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2NC05NjUKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2luZGV4X2xlbmd0aChzZWxmLCBrZXk6IEJ5dGVzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NjcKICAgIC8vIGxlbmd0aCwgZXhpc3RzID0gb3AuQm94LmdldChrZXkpCiAgICBmcmFtZV9kaWcgLTEKICAgIGJveF9nZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NjgKICAgIC8vIHJldHVybiBvcC5idG9pKGxlbmd0aCkgaWYgZXhpc3RzIGVsc2UgVUludDY0KDApCiAgICBieiBfaW5kZXhfbGVuZ3RoX3Rlcm5hcnlfZmFsc2VAMgogICAgYnRvaQogICAgcmV0c3ViCgpfaW5kZXhfbGVuZ3RoX3Rlcm5hcnlfZmFsc2VAMjoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk2OAogICAgLy8gcmV0dXJuIG9wLmJ0b2kobGVuZ3RoKSBpZiBleGlzdHMgZWxzZSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5faW5kZXhfYXBwZW5kKGtleTogYnl0ZXMsIGl0ZW1faWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpfaW5kZXhfYXBwZW5kOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3NS05NzYKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2luZGV4X2FwcGVuZChzZWxmLCBrZXk6IEJ5dGVzLCBpdGVtX2lkOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3OAogICAgLy8gc2xvdCA9IHNlbGYuX2luZGV4X2xlbmd0aChrZXkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGNhbGxzdWIgX2luZGV4X2xlbmd0aAogICAgZHVwbiAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTczCiAgICAvLyByZXR1cm4ga2V5ICsgb3AuZXh0cmFjdChvcC5pdG9iKHNsb3QgLy8gSU5ERVhfUEFHRV9FTlRSSUVTKSwgNiwgMikKICAgIGludGMgNSAvLyAxMjgKICAgIC8KICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgLTIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgc3dhcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4MAogICAgLy8gb2Zmc2V0ID0gKHNsb3QgJSBJTkRFWF9QQUdFX0VOVFJJRVMpICogVUludDY0KDgpCiAgICBpbnRjIDUgLy8gMTI4CiAgICAlCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTgxCiAgICAvLyBpZiBvZmZzZXQ6CiAgICBieiBfaW5kZXhfYXBwZW5kX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTgyCiAgICAvLyBvcC5Cb3gucmVzaXplKHBhZ2Vfa2V5LCBvZmZzZXQgKyBVSW50NjQoOCkpCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICArCiAgICB1bmNvdmVyIDIKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBib3hfcmVzaXplCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTgzCiAgICAvLyBvcC5Cb3gucmVwbGFjZShwYWdlX2tleSwgb2Zmc2V0LCBvcC5pdG9iKGl0ZW1faWQpKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBib3hfcmVwbGFjZQoKX2luZGV4X2FwcGVuZF9hZnRlcl9pZl9lbHNlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTg2CiAgICAvLyBvcC5Cb3gucHV0KGtleSwgb3AuaXRvYihzbG90ICsgVUludDY0KDEpKSkKICAgIGR1cAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGZyYW1lX2RpZyAtMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4NwogICAgLy8gcmV0dXJuIHNsb3QKICAgIHJldHN1YgoKX2luZGV4X2FwcGVuZF9lbHNlX2JvZHlAMjoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk4NQogICAgLy8gb3AuQm94LnB1dChwYWdlX2tleSwgb3AuaXRvYihpdGVtX2lkKSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgYm94X3B1dAogICAgYiBfaW5kZXhfYXBwZW5kX2FmdGVyX2lmX2Vsc2VAMwoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9pbmRleF9wYWdlKGtleTogYnl0ZXMsIHN0YXJ0OiB1aW50NjQsIGNvdW50OiB1aW50NjQpIC0+IGJ5dGVzOgpfaW5kZXhfcGFnZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDE5LTEwMjIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2luZGV4X3BhZ2UoCiAgICAvLyAgICAgc2VsZiwga2V5OiBCeXRlcywgc3RhcnQ6IFVJbnQ2NCwgY291bnQ6IFVJbnQ2NAogICAgLy8gKSAtPiBhcmM0LkR5bmFtaWNBcnJheVthcmM0LlVJbnQ2NF06CiAgICBwcm90byAzIDEKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDI0CiAgICAvLyBlbmQgPSBzZWxmLl9wYWdlX2VuZChzdGFydCwgY291bnQsIHNlbGYuX2luZGV4X2xlbmd0aChrZXkpKQogICAgZnJhbWVfZGlnIC0zCiAgICBjYWxsc3ViIF9pbmRleF9sZW5ndGgKICAgIGZyYW1lX2RpZyAtMgogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDIKICAgIGNhbGxzdWIgX3BhZ2VfZW5kCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDI3CiAgICAvLyBpZiBlbmQgLSBzdGFydCA+IG1heF9lbnRyaWVzOgogICAgZnJhbWVfZGlnIC0yCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyNS0xMDI2CiAgICAvLyAjIEtlZXAgdGhlIHBhZ2Ugd2l0aGluIHRoZSBBQkkgcmV0dXJuIHZhbHVlCiAgICAvLyBtYXhfZW50cmllcyA9IFVJbnQ2NChNQVhfUEFHRV9CWVRFUyAvLyA4KQogICAgcHVzaGludCAxMjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDI3CiAgICAvLyBpZiBlbmQgLSBzdGFydCA+IG1heF9lbnRyaWVzOgogICAgPgogICAgYnogX2luZGV4X3BhZ2VfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyOAogICAgLy8gZW5kID0gc3RhcnQgKyBtYXhfZW50cmllcwogICAgZnJhbWVfZGlnIC0yCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAyNS0xMDI2CiAgICAvLyAjIEtlZXAgdGhlIHBhZ2Ugd2l0aGluIHRoZSBBQkkgcmV0dXJuIHZhbHVlCiAgICAvLyBtYXhfZW50cmllcyA9IFVJbnQ2NChNQVhfUEFHRV9CWVRFUyAvLyA4KQogICAgcHVzaGludCAxMjUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDI4CiAgICAvLyBlbmQgPSBzdGFydCArIG1heF9lbnRyaWVzCiAgICArCiAgICBmcmFtZV9idXJ5IDEKCl9pbmRleF9wYWdlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDI5CiAgICAvLyBwYWNrZWQgPSBCeXRlcygpCiAgICBieXRlY18zIC8vIDB4CiAgICBmcmFtZV9kaWcgLTIKCl9pbmRleF9wYWdlX3doaWxlX3RvcEAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMzEKICAgIC8vIHdoaWxlIHNsb3QgPCBlbmQ6CiAgICBkdXAKICAgIGZyYW1lX2RpZyAxCiAgICA8CiAgICBieiBfaW5kZXhfcGFnZV9hZnRlcl93aGlsZUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAzMi0xMDMzCiAgICAvLyAjIFJlYWQgdXAgdG8gdGhlIGVuZCBvZiB0aGUgaW5kZXggcGFnZSBob2xkaW5nIGBzbG90YAogICAgLy8gcGFnZV9lbmQgPSAoc2xvdCAvLyBJTkRFWF9QQUdFX0VOVFJJRVMgKyAxKSAqIElOREVYX1BBR0VfRU5UUklFUwogICAgZHVwCiAgICBpbnRjIDUgLy8gMTI4CiAgICAvCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBpbnRjIDUgLy8gMTI4CiAgICAqCiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMzQKICAgIC8vIGlmIHBhZ2VfZW5kID4gZW5kOgogICAgZnJhbWVfZGlnIDEKICAgID4KICAgIGJ6IF9pbmRleF9wYWdlX2FmdGVyX2lmX2Vsc2VANgogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMAoKX2luZGV4X3BhZ2VfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5Ojk3MwogICAgLy8gcmV0dXJuIGtleSArIG9wLmV4dHJhY3Qob3AuaXRvYihzbG90IC8vIElOREVYX1BBR0VfRU5UUklFUyksIDYsIDIpCiAgICBzd2FwCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIC0zCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDM4CiAgICAvLyAoc2xvdCAlIElOREVYX1BBR0VfRU5UUklFUykgKiBVSW50NjQoOCksCiAgICBzd2FwCiAgICBkdXAKICAgIGludGMgNSAvLyAxMjgKICAgICUKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAzOQogICAgLy8gKHBhZ2VfZW5kIC0gc2xvdCkgKiBVSW50NjQoOCksCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciA0CiAgICB1bmNvdmVyIDIKICAgIC0KICAgIGludGNfMiAvLyA4CiAgICAqCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAzNi0xMDQwCiAgICAvLyBwYWNrZWQgKz0gb3AuQm94LmV4dHJhY3QoCiAgICAvLyAgICAgc2VsZi5faW5kZXhfcGFnZV9rZXkoa2V5LCBzbG90KSwKICAgIC8vICAgICAoc2xvdCAlIElOREVYX1BBR0VfRU5UUklFUykgKiBVSW50NjQoOCksCiAgICAvLyAgICAgKHBhZ2VfZW5kIC0gc2xvdCkgKiBVSW50NjQoOCksCiAgICAvLyApCiAgICBib3hfZXh0cmFjdAogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGIgX2luZGV4X3BhZ2Vfd2hpbGVfdG9wQDMKCl9pbmRleF9wYWdlX2FmdGVyX3doaWxlQDc6CiAgICBwb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDQzCiAgICAvLyBhcmM0LlVJbnQxNihlbmQgLSBzdGFydCkuYnl0ZXMgKyBwYWNrZWQKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgLTIKICAgIC0KICAgIGl0b2IKICAgIGR1cAogICAgYml0bGVuCiAgICBwdXNoaW50IDE2CiAgICA8PQogICAgYXNzZXJ0IC8vIG92ZXJmbG93CiAgICBleHRyYWN0IDYgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA0Mi0xMDQ0CiAgICAvLyByZXR1cm4gYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdLmZyb21fYnl0ZXMoCiAgICAvLyAgICAgYXJjNC5VSW50MTYoZW5kIC0gc3RhcnQpLmJ5dGVzICsgcGFja2VkCiAgICAvLyApCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9wYWdlX2VuZChzdGFydDogdWludDY0LCBjb3VudDogdWludDY0LCBsaW1pdDogdWludDY0KSAtPiB1aW50NjQ6Cl9wYWdlX2VuZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDQ2LTEwNDcKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3BhZ2VfZW5kKHNlbGYsIHN0YXJ0OiBVSW50NjQsIGNvdW50OiBVSW50NjQsIGxpbWl0OiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNDkKICAgIC8vIGlmIHN0YXJ0ID49IGxpbWl0OgogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTEKICAgID49CiAgICBieiBfcGFnZV9lbmRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA1MAogICAgLy8gcmV0dXJuIHN0YXJ0CiAgICBmcmFtZV9kaWcgLTMKICAgIHJldHN1YgoKX3BhZ2VfZW5kX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDUxCiAgICAvLyByZXR1cm4gc3RhcnQgKyBjb3VudCBpZiBjb3VudCA8IGxpbWl0IC0gc3RhcnQgZWxzZSBsaW1pdAogICAgZnJhbWVfZGlnIC0xCiAgICBmcmFtZV9kaWcgLTMKICAgIC0KICAgIGZyYW1lX2RpZyAtMgogICAgPgogICAgYnogX3BhZ2VfZW5kX3Rlcm5hcnlfZmFsc2VANAogICAgZnJhbWVfZGlnIC0zCiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIHJldHN1YgoKX3BhZ2VfZW5kX3Rlcm5hcnlfZmFsc2VANDoKICAgIGZyYW1lX2RpZyAtMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNTEKICAgIC8vIHJldHVybiBzdGFydCArIGNvdW50IGlmIGNvdW50IDwgbGltaXQgLSBzdGFydCBlbHNlIGxpbWl0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fZGVsZXRlX2xpc3RpbmcobGlzdGluZ19pZDogdWludDY0KSAtPiB1aW50NjQ6Cl9kZWxldGVfbGlzdGluZzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDUzLTEwNTQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2RlbGV0ZV9saXN0aW5nKHNlbGYsIGxpc3RpbmdfaWQ6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2MQogICAgLy8gbGlzdGluZyA9IHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNjIKICAgIC8vIHNlbGYuX3NldF9hc2tfbmV4dChsaXN0aW5nLnByZXZfYXNrLm5hdGl2ZSwgbGlzdGluZy5uZXh0X2Fzay5uYXRpdmUpCiAgICBkdXAKICAgIHB1c2hpbnQgNTYKICAgIGV4dHJhY3RfdWludDY0CiAgICBkaWcgMQogICAgcHVzaGludCA2NAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cDIKICAgIGNhbGxzdWIgX3NldF9hc2tfbmV4dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNjMKICAgIC8vIHNlbGYuX3NldF9hc2tfcHJldihsaXN0aW5nLm5leHRfYXNrLm5hdGl2ZSwgbGlzdGluZy5wcmV2X2Fzay5uYXRpdmUpCiAgICBzd2FwCiAgICBjYWxsc3ViIF9zZXRfYXNrX3ByZXYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDY1CiAgICAvLyBtYnJfYmVmb3JlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgc3dhcAogICAgY292ZXIgMgogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA2NwogICAgLy8gQnl0ZXMoU0VMTEVSX0lOREVYX1BSRUZJWCkgKyBsaXN0aW5nLnNlbGxlci5ieXRlcywKICAgIGR1cAogICAgZXh0cmFjdCAwIDMyCiAgICBieXRlYyAyOSAvLyAweDczNmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDY4CiAgICAvLyBsaXN0aW5nLnNlbGxlcl9zbG90Lm5hdGl2ZSwKICAgIGR1cAogICAgZXh0cmFjdCA3MiA4CiAgICBjb3ZlciA1CiAgICBwdXNoaW50IDcyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjb3ZlciA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTk3CiAgICAvLyBsYXN0ID0gc2VsZi5faW5kZXhfbGVuZ3RoKGtleSkgLSBVSW50NjQoMSkKICAgIGR1cAogICAgY2FsbHN1YiBfaW5kZXhfbGVuZ3RoCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTczCiAgICAvLyByZXR1cm4ga2V5ICsgb3AuZXh0cmFjdChvcC5pdG9iKHNsb3QgLy8gSU5ERVhfUEFHRV9FTlRSSUVTKSwgNiwgMikKICAgIGR1cAogICAgaW50YyA1IC8vIDEyOAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6OTk5CiAgICAvLyBsYXN0X29mZnNldCA9IChsYXN0ICUgSU5ERVhfUEFHRV9FTlRSSUVTKSAqIFVJbnQ2NCg4KQogICAgZHVwCiAgICBpbnRjIDUgLy8gMTI4CiAgICAlCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgY292ZXIgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDAKICAgIC8vIG1vdmVkX2lkID0gVUludDY0KE5PX0xJU1RJTkcpCiAgICBpbnRjIDQgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgIGNvdmVyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDAxCiAgICAvLyBpZiBzbG90ICE9IGxhc3Q6CiAgICAhPQogICAgYnogX2RlbGV0ZV9saXN0aW5nX2FmdGVyX2lmX2Vsc2VANQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDIKICAgIC8vIG1vdmVkID0gb3AuQm94LmV4dHJhY3QobGFzdF9rZXksIGxhc3Rfb2Zmc2V0LCBVSW50NjQoOCkpCiAgICBkdXAKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weTo5NzMKICAgIC8vIHJldHVybiBrZXkgKyBvcC5leHRyYWN0KG9wLml0b2Ioc2xvdCAvLyBJTkRFWF9QQUdFX0VOVFJJRVMpLCA2LCAyKQogICAgZnJhbWVfZGlnIDEKICAgIGR1cAogICAgaW50YyA1IC8vIDEyOAogICAgLwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGRpZyA2CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDA1CiAgICAvLyAoc2xvdCAlIElOREVYX1BBR0VfRU5UUklFUykgKiBVSW50NjQoOCksCiAgICBzd2FwCiAgICBpbnRjIDUgLy8gMTI4CiAgICAlCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMDMtMTAwNwogICAgLy8gb3AuQm94LnJlcGxhY2UoCiAgICAvLyAgICAgc2VsZi5faW5kZXhfcGFnZV9rZXkoa2V5LCBzbG90KSwKICAgIC8vICAgICAoc2xvdCAlIElOREVYX1BBR0VfRU5UUklFUykgKiBVSW50NjQoOCksCiAgICAvLyAgICAgbW92ZWQsCiAgICAvLyApCiAgICBkaWcgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDA4CiAgICAvLyBtb3ZlZF9pZCA9IG9wLmJ0b2kobW92ZWQpCiAgICBidG9pCiAgICBmcmFtZV9idXJ5IDIKCl9kZWxldGVfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAwOQogICAgLy8gaWYgbGFzdF9vZmZzZXQ6CiAgICBkaWcgMQogICAgYnogX2RlbGV0ZV9saXN0aW5nX2Vsc2VfYm9keUA3CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxMAogICAgLy8gb3AuQm94LnJlc2l6ZShsYXN0X2tleSwgbGFzdF9vZmZzZXQpCiAgICBzd2FwCiAgICBib3hfcmVzaXplCgpfZGVsZXRlX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwMTMKICAgIC8vIGlmIGxhc3Q6CiAgICBkdXAKICAgIGJ6IF9kZWxldGVfbGlzdGluZ19lbHNlX2JvZHlAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDE0CiAgICAvLyBvcC5Cb3gucHV0KGtleSwgb3AuaXRvYihsYXN0KSkKICAgIGl0b2IKICAgIGJveF9wdXQKCl9kZWxldGVfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNzAKICAgIC8vIGlmIG1vdmVkX2lkICE9IE5PX0xJU1RJTkc6CiAgICBmcmFtZV9kaWcgMgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICAhPQogICAgYnogX2RlbGV0ZV9saXN0aW5nX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwNzEKICAgIC8vIG1vdmVkID0gc2VsZi5saXN0aW5nc1ttb3ZlZF9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgMgogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDZjCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDcyLTEwNzMKICAgIC8vIG1vdmVkLnNlbGxlcl9zbG90ID0gbGlzdGluZy5zZWxsZXJfc2xvdAogICAgLy8gc2VsZi5saXN0aW5nc1ttb3ZlZF9pZF0gPSBtb3ZlZC5jb3B5KCkKICAgIHB1c2hpbnQgNzIKICAgIGZyYW1lX2RpZyAwCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwoKX2RlbGV0ZV9saXN0aW5nX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDc0CiAgICAvLyBkZWwgc2VsZi5saXN0aW5nc1tsaXN0aW5nX2lkXQogICAgc3dhcAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA3NQogICAgLy8gcmV0dXJuIG1icl9iZWZvcmUgLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC0KICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgpfZGVsZXRlX2xpc3RpbmdfZWxzZV9ib2R5QDEwOgogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxNgogICAgLy8gX2RlbGV0ZWQgPSBvcC5Cb3guZGVsZXRlKGtleSkKICAgIGJveF9kZWwKICAgIHBvcAogICAgYiBfZGVsZXRlX2xpc3RpbmdfYWZ0ZXJfaWZfZWxzZUAxMQoKX2RlbGV0ZV9saXN0aW5nX2Vsc2VfYm9keUA3OgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTAxMgogICAgLy8gX2RlbGV0ZWQgPSBvcC5Cb3guZGVsZXRlKGxhc3Rfa2V5KQogICAgYm94X2RlbAogICAgcG9wCiAgICBiIF9kZWxldGVfbGlzdGluZ19hZnRlcl9pZl9lbHNlQDgKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fc3dlZXBfYXNrcyhtYXhfcXVhbnRpdHk6IHVpbnQ2NCwgbWF4X3ByaWNlOiB1aW50NjQsIG1heF9maWxsczogdWludDY0KSAtPiB1aW50NjQsIHVpbnQ2NDoKX3N3ZWVwX2Fza3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA3Ny0xMDgwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zd2VlcF9hc2tzKAogICAgLy8gICAgIHNlbGYsIG1heF9xdWFudGl0eTogVUludDY0LCBtYXhfcHJpY2U6IFVJbnQ2NCwgbWF4X2ZpbGxzOiBVSW50NjQKICAgIC8vICkgLT4gdHVwbGVbVUludDY0LCBVSW50NjRdOgogICAgcHJvdG8gMyAyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTAKICAgIC8vIHJlY2xhaW1lZCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMDg5CiAgICAvLyBzcGVudCA9IFVJbnQ2NCgwKQogICAgZHVwbiAyCiAgICBmcmFtZV9kaWcgLTMKCl9zd2VlcF9hc2tzX3doaWxlX3RvcEAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTIKICAgIC8vIHdoaWxlIHJlbWFpbmluZyBhbmQgc2VsZi5iZXN0X2Fza19pZCAhPSBOT19MSVNUSU5HIGFuZCBmaWxscyA8IG1heF9maWxsczoKICAgIGR1cAogICAgYnogX3N3ZWVwX2Fza3NfYWZ0ZXJfd2hpbGVAMTIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJiZXN0X2Fza19pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iZXN0X2Fza19pZCBleGlzdHMKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgIT0KICAgIGJ6IF9zd2VlcF9hc2tzX2FmdGVyX3doaWxlQDEyCiAgICBkaWcgMQogICAgZnJhbWVfZGlnIC0xCiAgICA8CiAgICBieiBfc3dlZXBfYXNrc19hZnRlcl93aGlsZUAxMgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTMKICAgIC8vIGZpbGxzICs9IDEKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5NAogICAgLy8gbGlzdGluZ19pZCA9IHNlbGYuYmVzdF9hc2tfaWQKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJiZXN0X2Fza19pZCIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMQogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYmVzdF9hc2tfaWQgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5NQogICAgLy8gbGlzdGluZyA9IHNlbGYubGlzdGluZ3NbbGlzdGluZ19pZF0uY29weSgpCiAgICBpdG9iCiAgICBieXRlY18yIC8vIDB4NmMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDAKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpc3RpbmdzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOTYKICAgIC8vIGlmIGxpc3RpbmcucHJpY2UubmF0aXZlID4gbWF4X3ByaWNlOgogICAgcHVzaGludCA0MAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMgogICAgPgogICAgYm56IF9zd2VlcF9hc2tzX2FmdGVyX3doaWxlQDEyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5OAogICAgLy8gaWYgc2VsZi5faXNfZXhwaXJlZChsaXN0aW5nLmV4cGlyZXNfcm91bmQubmF0aXZlKToKICAgIGZyYW1lX2RpZyAwCiAgICBwdXNoaW50IDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgY2FsbHN1YiBfaXNfZXhwaXJlZAogICAgYnogX3N3ZWVwX2Fza3NfYWZ0ZXJfaWZfZWxzZUA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5OQogICAgLy8gcmVjbGFpbWVkICs9IHNlbGYuX2V4cGlyZV9saXN0aW5nKGxpc3RpbmdfaWQpCiAgICBmcmFtZV9kaWcgMQogICAgY2FsbHN1YiBfZXhwaXJlX2xpc3RpbmcKICAgIGZyYW1lX2RpZyAyCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTAwCiAgICAvLyBjb250aW51ZQogICAgYiBfc3dlZXBfYXNrc193aGlsZV90b3BAMQoKX3N3ZWVwX2Fza3NfYWZ0ZXJfaWZfZWxzZUA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDEKICAgIC8vIHF1YW50aXR5ID0gcmVtYWluaW5nIGlmIHJlbWFpbmluZyA8IGxpc3RpbmcuYW1vdW50Lm5hdGl2ZSBlbHNlIGxpc3RpbmcuYW1vdW50Lm5hdGl2ZQogICAgZnJhbWVfZGlnIDAKICAgIHB1c2hpbnQgMzIKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGRpZyAyCiAgICA+CiAgICBieiBfc3dlZXBfYXNrc190ZXJuYXJ5X2ZhbHNlQDEwCiAgICBwb3AKICAgIGR1cAoKX3N3ZWVwX2Fza3NfdGVybmFyeV9tZXJnZUAxMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTAyCiAgICAvLyBzcGVudCArPSBzZWxmLl9maWxsX2xpc3RpbmcobGlzdGluZ19pZCwgbGlzdGluZywgcXVhbnRpdHkpCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfZGlnIDAKICAgIGRpZyAyCiAgICBjYWxsc3ViIF9maWxsX2xpc3RpbmcKICAgIHBvcAogICAgdW5jb3ZlciA0CiAgICArCiAgICBjb3ZlciAzCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwMwogICAgLy8gcmVtYWluaW5nIC09IHF1YW50aXR5CiAgICAtCiAgICBiIF9zd2VlcF9hc2tzX3doaWxlX3RvcEAxCgpfc3dlZXBfYXNrc190ZXJuYXJ5X2ZhbHNlQDEwOgogICAgYiBfc3dlZXBfYXNrc190ZXJuYXJ5X21lcmdlQDExCgpfc3dlZXBfYXNrc19hZnRlcl93aGlsZUAxMjoKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMDQKICAgIC8vIGlmIHJlY2xhaW1lZDoKICAgIGZyYW1lX2RpZyAyCiAgICBieiBfc3dlZXBfYXNrc19hZnRlcl9pZl9lbHNlQDE1CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwNQogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1yZWNsYWltZWQpLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICB0eG4gU2VuZGVyCiAgICBmcmFtZV9kaWcgMgogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKCl9zd2VlcF9hc2tzX2FmdGVyX2lmX2Vsc2VAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEwNgogICAgLy8gcmV0dXJuIG1heF9xdWFudGl0eSAtIHJlbWFpbmluZywgc3BlbnQKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgLQogICAgZnJhbWVfYnVyeSAwCiAgICBmcmFtZV9idXJ5IDEKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9yZWNvcmRfdHJhZGUocXVhbnRpdHk6IHVpbnQ2NCwgcHJpY2U6IHVpbnQ2NCkgLT4gdm9pZDoKX3JlY29yZF90cmFkZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTA4LTExMDkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3JlY29yZF90cmFkZShzZWxmLCBxdWFudGl0eTogVUludDY0LCBwcmljZTogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTExMQogICAgLy8gbm90aW9uYWwgPSBxdWFudGl0eSAqIHByaWNlCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTIKICAgIC8vIHNlbGYudHJhZGVfdm9sdW1lICs9IHF1YW50aXR5CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgOSAvLyAidHJhZGVfdm9sdW1lIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYWRlX3ZvbHVtZSBleGlzdHMKICAgIGZyYW1lX2RpZyAtMgogICAgKwogICAgYnl0ZWMgOSAvLyAidHJhZGVfdm9sdW1lIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTEzCiAgICAvLyBzZWxmLnRyYWRlX25vdGlvbmFsICs9IG5vdGlvbmFsCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMTIgLy8gInRyYWRlX25vdGlvbmFsIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYWRlX25vdGlvbmFsIGV4aXN0cwogICAgZGlnIDEKICAgICsKICAgIGJ5dGVjIDEyIC8vICJ0cmFkZV9ub3Rpb25hbCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTExNAogICAgLy8gc2VsZi50cmFkZV9jb3VudCArPSAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgMjAgLy8gInRyYWRlX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnRyYWRlX2NvdW50IGV4aXN0cwogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGJ5dGVjIDIwIC8vICJ0cmFkZV9jb3VudCIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTExNQogICAgLy8gc2VsZi5sYXN0X3ByaWNlID0gcHJpY2UKICAgIGJ5dGVjIDI0IC8vICJsYXN0X3ByaWNlIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTYKICAgIC8vIHNlbGYubGFzdF90cmFkZV90aW1lID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGJ5dGVjIDI1IC8vICJsYXN0X3RyYWRlX3RpbWUiCiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMTgKICAgIC8vIGN1cnJlbnQsIHByZXZpb3VzID0gc2VsZi5fdHJhZGVfd2luZG93cygpCiAgICBjYWxsc3ViIF90cmFkZV93aW5kb3dzCiAgICBjb3ZlciAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTExOQogICAgLy8gY3VycmVudC52b2x1bWUgPSBhcmM0LlVJbnQ2NChjdXJyZW50LnZvbHVtZS5uYXRpdmUgKyBxdWFudGl0eSkKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTIKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTIwCiAgICAvLyBjdXJyZW50Lm5vdGlvbmFsID0gYXJjNC5VSW50NjQoY3VycmVudC5ub3Rpb25hbC5uYXRpdmUgKyBub3Rpb25hbCkKICAgIGR1cAogICAgcHVzaGludCAxNgogICAgZXh0cmFjdF91aW50NjQKICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgMTYKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMjEKICAgIC8vIGlmIHByaWNlID4gY3VycmVudC5oaWdoLm5hdGl2ZToKICAgIHB1c2hpbnQgMjQKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgIDwKICAgIGJ6IF9yZWNvcmRfdHJhZGVfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyMgogICAgLy8gY3VycmVudC5oaWdoID0gYXJjNC5VSW50NjQocHJpY2UpCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIHJlcGxhY2UyIDI0CgpfcmVjb3JkX3RyYWRlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTIzCiAgICAvLyBpZiBub3QgY3VycmVudC5sb3cubmF0aXZlIG9yIHByaWNlIDwgY3VycmVudC5sb3cubmF0aXZlOgogICAgZHVwCiAgICBwdXNoaW50IDMyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ6IF9yZWNvcmRfdHJhZGVfaWZfYm9keUA0CiAgICBmcmFtZV9kaWcgLTEKICAgIGZyYW1lX2RpZyAwCiAgICA8CiAgICBieiBfcmVjb3JkX3RyYWRlX2FmdGVyX2lmX2Vsc2VANQoKX3JlY29yZF90cmFkZV9pZl9ib2R5QDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyNAogICAgLy8gY3VycmVudC5sb3cgPSBhcmM0LlVJbnQ2NChwcmljZSkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgcmVwbGFjZTIgMzIKCl9yZWNvcmRfdHJhZGVfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMjUKICAgIC8vIHNlbGYuY3VycmVudF93aW5kb3cgPSBjdXJyZW50LmNvcHkoKQogICAgYnl0ZWMgMjYgLy8gImN1cnJlbnRfd2luZG93IgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTI2CiAgICAvLyBzZWxmLnByZXZpb3VzX3dpbmRvdyA9IHByZXZpb3VzLmNvcHkoKQogICAgYnl0ZWMgMjcgLy8gInByZXZpb3VzX3dpbmRvdyIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fdHJhZGVfd2luZG93cygpIC0+IGJ5dGVzLCBieXRlczoKX3RyYWRlX3dpbmRvd3M6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTEyOC0xMTI5CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF90cmFkZV93aW5kb3dzKHNlbGYpIC0+IHR1cGxlW1RyYWRlV2luZG93LCBUcmFkZVdpbmRvd106CiAgICBwcm90byAwIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTM0CiAgICAvLyBub3cgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMzUKICAgIC8vIHN0YXJ0ID0gbm93IC0gbm93ICUgU1RBVFNfV0lORE9XX1NFQ09ORFMKICAgIGR1cAogICAgaW50YyAxMCAvLyAzNjAwCiAgICAlCiAgICAtCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTM2CiAgICAvLyBjdXJyZW50ID0gc2VsZi5jdXJyZW50X3dpbmRvdy5jb3B5KCkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyAyNiAvLyAiY3VycmVudF93aW5kb3ciCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBjb3ZlciAzCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jdXJyZW50X3dpbmRvdyBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTM3CiAgICAvLyBwcmV2aW91cyA9IHNlbGYucHJldmlvdXNfd2luZG93LmNvcHkoKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDI3IC8vICJwcmV2aW91c193aW5kb3ciCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgc3dhcAogICAgY292ZXIgNAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucHJldmlvdXNfd2luZG93IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMzgKICAgIC8vIGlmIGN1cnJlbnQuc3RhcnQubmF0aXZlICE9IHN0YXJ0OgogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGNvdmVyIDQKICAgICE9CiAgICBieiBfdHJhZGVfd2luZG93c19hZnRlcl9pZl9lbHNlQDUKICAgIGJ1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExMzkKICAgIC8vIGlmIGN1cnJlbnQuc3RhcnQubmF0aXZlICsgU1RBVFNfV0lORE9XX1NFQ09ORFMgPT0gc3RhcnQ6CiAgICBmcmFtZV9kaWcgMQogICAgaW50YyAxMCAvLyAzNjAwCiAgICArCiAgICBmcmFtZV9kaWcgMAogICAgPT0KICAgIGJ6IF90cmFkZV93aW5kb3dzX2Vsc2VfYm9keUAzCgpfdHJhZGVfd2luZG93c19hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE0NAogICAgLy8gY3VycmVudCA9IFRyYWRlV2luZG93LmZyb21fYnl0ZXMob3AuYnplcm8oNSAqIDgpKQogICAgcHVzaGludCA0MAogICAgYnplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMTQ1CiAgICAvLyBjdXJyZW50LnN0YXJ0ID0gYXJjNC5VSW50NjQoc3RhcnQpCiAgICBmcmFtZV9kaWcgMAogICAgaXRvYgogICAgcmVwbGFjZTIgMAoKX3RyYWRlX3dpbmRvd3NfYWZ0ZXJfaWZfZWxzZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDYKICAgIC8vIHJldHVybiBjdXJyZW50LmNvcHkoKSwgcHJldmlvdXMuY29weSgpCiAgICBzd2FwCiAgICB1bmNvdmVyIDMKICAgIHVuY292ZXIgMwogICAgcmV0c3ViCgpfdHJhZGVfd2luZG93c19lbHNlX2JvZHlAMzoKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDIKICAgIC8vIHByZXZpb3VzID0gVHJhZGVXaW5kb3cuZnJvbV9ieXRlcyhvcC5iemVybyg1ICogOCkpCiAgICBwdXNoaW50IDQwCiAgICBiemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDMKICAgIC8vIHByZXZpb3VzLnN0YXJ0ID0gYXJjNC5VSW50NjQoc3RhcnQgLSBTVEFUU19XSU5ET1dfU0VDT05EUykKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjIDEwIC8vIDM2MDAKICAgIC0KICAgIGl0b2IKICAgIHJlcGxhY2UyIDAKICAgIGIgX3RyYWRlX3dpbmRvd3NfYWZ0ZXJfaWZfZWxzZUA0CgoKLy8gc21hcnRfY29udHJhY3RzLmFhcm5hX3JlZ2lzdHJ5LmNvbnRyYWN0LkFhcm5hUmVnaXN0cnkuX2xvYWRfYmlkKGJpZF9pZDogdWludDY0KSAtPiBieXRlczoKX2xvYWRfYmlkOgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNDgtMTE0OQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfbG9hZF9iaWQoc2VsZiwgYmlkX2lkOiBVSW50NjQpIC0+IEJpZDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjExNTAKICAgIC8vIGFzc2VydCBiaWRfaWQgaW4gc2VsZi5iaWRzLCAiYmlkIG5vdCBhY3RpdmUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHg2MgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgYXNzZXJ0IC8vIGJpZCBub3QgYWN0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTE1MQogICAgLy8gcmV0dXJuIHNlbGYuYmlkc1tiaWRfaWRdLmNvcHkoKQogICAgYm94X2dldAogICAgcG9wCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fc2V0X2JpZF9uZXh0KGJpZF9pZDogdWludDY0LCBuZXh0X2lkOiB1aW50NjQpIC0+IHZvaWQ6Cl9zZXRfYmlkX25leHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxMS0xMjEyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9zZXRfYmlkX25leHQoc2VsZiwgYmlkX2lkOiBVSW50NjQsIG5leHRfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTQKICAgIC8vIGlmIGJpZF9pZCA9PSBOT19CSUQ6CiAgICBmcmFtZV9kaWcgLTIKICAgIGludGMgNCAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgPT0KICAgIGJ6IF9zZXRfYmlkX25leHRfZWxzZV9ib2R5QDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjE1CiAgICAvLyBzZWxmLmJlc3RfYmlkX2lkID0gbmV4dF9pZAogICAgYnl0ZWMgNiAvLyAiYmVzdF9iaWRfaWQiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCl9zZXRfYmlkX25leHRfZWxzZV9ib2R5QDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxNwogICAgLy8gYmlkID0gc2VsZi5iaWRzW2JpZF9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGJ5dGVjIDQgLy8gMHg2MgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIxOAogICAgLy8gYmlkLm5leHRfYmlkID0gYXJjNC5VSW50NjQobmV4dF9pZCkKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMTgtMTIxOQogICAgLy8gYmlkLm5leHRfYmlkID0gYXJjNC5VSW50NjQobmV4dF9pZCkKICAgIC8vIHNlbGYuYmlkc1tiaWRfaWRdID0gYmlkLmNvcHkoKQogICAgcHVzaGludCA1NgogICAgc3dhcAogICAgYm94X3JlcGxhY2UgLy8gb24gZXJyb3I6IGluZGV4IG91dCBvZiBib3VuZHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9zZXRfYmlkX3ByZXYoYmlkX2lkOiB1aW50NjQsIHByZXZfaWQ6IHVpbnQ2NCkgLT4gdm9pZDoKX3NldF9iaWRfcHJldjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjIxLTEyMjIKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3NldF9iaWRfcHJldihzZWxmLCBiaWRfaWQ6IFVJbnQ2NCwgcHJldl9pZDogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMiAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIyNAogICAgLy8gaWYgYmlkX2lkICE9IE5PX0JJRDoKICAgIGZyYW1lX2RpZyAtMgogICAgaW50YyA0IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICAhPQogICAgYnogX3NldF9iaWRfcHJldl9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjI1CiAgICAvLyBiaWQgPSBzZWxmLmJpZHNbYmlkX2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWMgNCAvLyAweDYyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjI2CiAgICAvLyBiaWQucHJldl9iaWQgPSBhcmM0LlVJbnQ2NChwcmV2X2lkKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIyNi0xMjI3CiAgICAvLyBiaWQucHJldl9iaWQgPSBhcmM0LlVJbnQ2NChwcmV2X2lkKQogICAgLy8gc2VsZi5iaWRzW2JpZF9pZF0gPSBiaWQuY29weSgpCiAgICBwdXNoaW50IDQ4CiAgICBzd2FwCiAgICBib3hfcmVwbGFjZSAvLyBvbiBlcnJvcjogaW5kZXggb3V0IG9mIGJvdW5kcwoKX3NldF9iaWRfcHJldl9hZnRlcl9pZl9lbHNlQDI6CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuYWFybmFfcmVnaXN0cnkuY29udHJhY3QuQWFybmFSZWdpc3RyeS5fZGVsZXRlX2JpZChiaWRfaWQ6IHVpbnQ2NCkgLT4gdWludDY0OgpfZGVsZXRlX2JpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjI5LTEyMzAKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2RlbGV0ZV9iaWQoc2VsZiwgYmlkX2lkOiBVSW50NjQpIC0+IFVJbnQ2NDoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzUKICAgIC8vIGJpZCA9IHNlbGYuYmlkc1tiaWRfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlYyA0IC8vIDB4NjIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5iaWRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzYKICAgIC8vIHNlbGYuX3NldF9iaWRfbmV4dChiaWQucHJldl9iaWQubmF0aXZlLCBiaWQubmV4dF9iaWQubmF0aXZlKQogICAgZHVwCiAgICBwdXNoaW50IDQ4CiAgICBleHRyYWN0X3VpbnQ2NAogICAgc3dhcAogICAgcHVzaGludCA1NgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cDIKICAgIGNhbGxzdWIgX3NldF9iaWRfbmV4dAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyMzcKICAgIC8vIHNlbGYuX3NldF9iaWRfcHJldihiaWQubmV4dF9iaWQubmF0aXZlLCBiaWQucHJldl9iaWQubmF0aXZlKQogICAgc3dhcAogICAgY2FsbHN1YiBfc2V0X2JpZF9wcmV2CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTIzOQogICAgLy8gbWJyX2JlZm9yZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNDAKICAgIC8vIGRlbCBzZWxmLmJpZHNbYmlkX2lkXQogICAgc3dhcAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI0MQogICAgLy8gcmV0dXJuIG1icl9iZWZvcmUgLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9wYXlfb3V0KHJlY2VpdmVyOiBieXRlcywgYW1vdW50OiB1aW50NjQpIC0+IHZvaWQ6Cl9wYXlfb3V0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNTYtMTI1NwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfcGF5X291dChzZWxmLCByZWNlaXZlcjogQWNjb3VudCwgYW1vdW50OiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjYzCiAgICAvLyBpZiByZWNlaXZlci5iYWxhbmNlICsgYW1vdW50ID49IHJlY2VpdmVyLm1pbl9iYWxhbmNlOgogICAgZnJhbWVfZGlnIC0yCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdEJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBmcmFtZV9kaWcgLTIKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICA+PQogICAgYnogX3BheV9vdXRfZWxzZV9ib2R5QDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjY0CiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9cmVjZWl2ZXIsIGFtb3VudD1hbW91bnQpLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBmcmFtZV9kaWcgLTIKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIHJldHN1YgoKX3BheV9vdXRfZWxzZV9ib2R5QDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2NgogICAgLy8gc2VsZi5faG9sZF9jbGFpbShyZWNlaXZlciwgYW1vdW50LCBVSW50NjQoMCkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgaW50Y18wIC8vIDAKICAgIGNhbGxzdWIgX2hvbGRfY2xhaW0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5hYXJuYV9yZWdpc3RyeS5jb250cmFjdC5BYXJuYVJlZ2lzdHJ5Ll9ob2xkX2NsYWltKGFjY291bnQ6IGJ5dGVzLCBhbGdvOiB1aW50NjQsIHRva2VuczogdWludDY0KSAtPiB2b2lkOgpfaG9sZF9jbGFpbToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjY4LTEyNjkKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX2hvbGRfY2xhaW0oc2VsZiwgYWNjb3VudDogQWNjb3VudCwgYWxnbzogVUludDY0LCB0b2tlbnM6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDMgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzUKICAgIC8vIGlmIGFjY291bnQgaW4gc2VsZi5jbGFpbXM6CiAgICBieXRlYyAxMyAvLyAweDZiCiAgICBmcmFtZV9kaWcgLTMKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgIGJ6IF9ob2xkX2NsYWltX2Vsc2VfYm9keUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI3NgogICAgLy8gY2xhaW0gPSBzZWxmLmNsYWltc1thY2NvdW50XS5jb3B5KCkKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY2xhaW1zIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzcKICAgIC8vIGNsYWltLmFsZ28gPSBhcmM0LlVJbnQ2NChjbGFpbS5hbGdvLm5hdGl2ZSArIGFsZ28pCiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0yCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiAwCgpfaG9sZF9jbGFpbV9hZnRlcl9pZl9lbHNlQDk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvYWFybmFfcmVnaXN0cnkvY29udHJhY3QucHk6MTI4NAogICAgLy8gY2xhaW0udG9rZW5zID0gYXJjNC5VSW50NjQoY2xhaW0udG9rZW5zLm5hdGl2ZSArIHRva2VucykKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIGl0b2IKICAgIHJlcGxhY2UyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjg1CiAgICAvLyBzZWxmLmNsYWltc1thY2NvdW50XSA9IGNsYWltLmNvcHkoKQogICAgYm94X3B1dAogICAgcmV0c3ViCgpfaG9sZF9jbGFpbV9lbHNlX2JvZHlAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9hYXJuYV9yZWdpc3RyeS9jb250cmFjdC5weToxMjc4CiAgICAvLyBlbGlmIGFsZ28gPiBDTEFJTV9CT1hfTUJSOgogICAgZnJhbWVfZGlnIC0yCiAgICBpbnRjIDExIC8vIDIyMTAwCiAgICA+CiAgICBieiBfaG9sZF9jbGFpbV9lbHNlX2JvZHlANAogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyNzkKICAgIC8vIGNsYWltID0gQ2xhaW0oYWxnbz1hcmM0LlVJbnQ2NChhbGdvIC0gQ0xBSU1fQk9YX01CUiksIHRva2Vucz1hcmM0LlVJbnQ2NCgwKSkKICAgIGZyYW1lX2RpZyAtMgogICAgaW50YyAxMSAvLyAyMjEwMAogICAgLQogICAgaXRvYgogICAgaW50Y18wIC8vIDAKICAgIGl0b2IKICAgIGNvbmNhdAogICAgYiBfaG9sZF9jbGFpbV9hZnRlcl9pZl9lbHNlQDkKCl9ob2xkX2NsYWltX2Vsc2VfYm9keUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyODAKICAgIC8vIGVsaWYgdG9rZW5zOgogICAgZnJhbWVfZGlnIC0xCiAgICBieiBfaG9sZF9jbGFpbV9lbHNlX2JvZHlANgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyODEKICAgIC8vIGNsYWltID0gQ2xhaW0oYWxnbz1hcmM0LlVJbnQ2NCgwKSwgdG9rZW5zPWFyYzQuVUludDY0KDApKQogICAgYnl0ZWMgMzQgLy8gMHgwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMAogICAgYiBfaG9sZF9jbGFpbV9hZnRlcl9pZl9lbHNlQDkKCl9ob2xkX2NsYWltX2Vsc2VfYm9keUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2Fhcm5hX3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEyODMKICAgIC8vIHJldHVybgogICAgcmV0c3ViCg==","clear":"I3ByYWdtYSB2ZXJzaW9uIDExCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMQogICAgcmV0dXJuCg=="},"byteCode":{"approval":"CyAMAAEIAv///////////wGAAawCvAXoB/////////9/kBzUrAEmKAQVH3x1C2Fhcm5hX2Fzc2V0AWwAAWILYmVzdF9hc2tfaWQLYmVzdF9iaWRfaWQNcHJvamVjdF9jb3VudBR0b3RhbF9jcmVkaXRzX2lzc3VlZAx0cmFkZV92b2x1bWUBcAVhZG1pbg50cmFkZV9ub3Rpb25hbAFrAXEJdmFsaWRhdG9yDXN0YXR1c19jb3VudHMMcGVuZGluZ19oZWFkDHBlbmRpbmdfdGFpbA1saXN0aW5nX2NvdW50C3RyYWRlX2NvdW50AgAAAQEJYmlkX2NvdW50Cmxhc3RfcHJpY2UPbGFzdF90cmFkZV90aW1lDmN1cnJlbnRfd2luZG93D3ByZXZpb3VzX3dpbmRvdwFtAnNsAwaBAQTlh0YJMAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAJzcBAAAAAAAAAAAAAAAAAAAAAACE1hbmdyb3ZlCFNlYWdyYXNzB1dldGxhbmQKU2FsdCBNYXJzaCBhYmNkZWZnaGlqa2xtbm9wcXJzdHV2d3h5ejIzNDU2NzEYQABWJwsyA2cnDzIDZykiZycHImcnCCJngSivJxBLAWcnESEEZycSIQRnJxMiZycFIQRnJxciZycGIQRnJwkiZycMImcnFCJnJxgiZycZImcnGksBZycbTGcxGRREMRhBAS6CKgTxJtBLBNNI+7MECPt7fASCDWihBOHWU/gEVFaXDQRmRfL5BCGXmUMEYmKQZQSW5eKfBMLAeFAECSZUJATYio97BPiZa/wEjUZ/0wRj1VtsBEqeHQEEWIiGCQQ7yw28BPFXdyYEMF51vQRboiqEBDRrPbwE845pQQRfHNLcBBf7moUEvpWHhQQKHGVuBNpGvFYE3runxgTUV70gBFXyLUEEd2x04wQYjPDcBJ7Ff/wEIvmKtgRSVlPtBB3rpOkEOzfUwwTaX3taBPl/52sE1YsaiDYaAI4qAHoAjACjARMBegL+A20DhwOYA9YEHwReBPgH9ghkCPsJaAnoC5ML3QxODFoMZQxwDHsMhwySDK0Mvg2IDe8OCg4lDk0Oig8YDz0PlA+gD/4QEBCDAIAEg/FHSDYaAI4BAGUAigIAi/6BCghJMgwNQQAqsYEGshCBBbIZJx6yHicesh+L/40CAAsABLNC/9wyALIBQv/1IrIBQv/viYoCAYv+VwIAi/4iWYv/JQtLAkxZSwIVi/8jCEklC0sFTFlPBE8CCU1SiScLMQBnI0M2GgFJFYEgEkSIEG0nD0xnI0M2GgFJFYEgEkSIEFtJMgMTRCcLTGcjQ4gQTSIpZURAAFuxMgpHA7IssiuyKrIpgBFodHRwczovL2Fhcm5hLmVjb7IngBNBYXJuYSBDYXJib24gQ3JlZGl0siaABUFBUk5BsiUisiQisiOBgK3iBLIigQOyECKyAbMptDxnIillRBYoTFCwI0M2GgFJIlklCEsBFRJENhoCSSJZJQhLARUSRDYaA0kiWSUISwEVEkQ2GgRJIlklCEsBFRJEMRYjCUk4ECMSREsBVwIAFYE8C4GmBAgiiP6tMgpzAUROBU4FiA+vTgKIFSEWKExQsCNDK0k2GgFHAiJZSU4CJQtMSRVOAlcCACJJSwUMQQBwSSULSwJJTwJZSU8FSU4EEkRLARVSSRVLASJZSSQSREsCTEsCUiJZgQoISwIlWUlLAhJESwNMSwNSIlklCAhLAoEEWUlLAhJESwNMSwNSIlklCAhLAoEGWUlLAhJETwNMTwNSIlklCAgITgIjCEL/iUYCJQgSRDEWIwlJRQQ4ECMSREkkDkQiSUUFSwRLAgxBACFLAksFSU4CiP4VSYEGWUsBFVJXAgAVTwIITCMIRQVC/9eBpgRLAklOAguBPE8DCwgiiP2xMgpzAUxOBEQnFU4DJAuBBghMIkUHSwZLAQxBAHRLAklLCElOA4j9w0mBBllLARVSSVcCABWBMAhPBQhJTgWBgAgOREsBSwOI/aFJIllLASVZUksCSwSI/ZJJJVlLAYEEWVJPA0sEiP2CSYEEWUsBgQZZUk8DiA5HFk8FSSJZIwgWVwYAXABMUE4EIwhFB0L/hEYDSwJPAogTnChMULAjQzYaAUkVJBJESRc2GgJJFYEgEkQ2GgNJFSQSREkXMRYjCUk4ECMSREsEiA3dMQBLAVcAIBJEgSBbgTiRIxJETwQWJxxMUEm9RQEURE8CRDIKcwFESwRLBFBPAky/iBM3TgJQTFCABOPEqdFMULAjQzYaAUkVJBJEFzYaAkkVJBJEF4gNe4gOqiNDNhoBSRUkEkQXiA1qiA71I0M2GgFJFSQSRBeIDVkiKWVERIgPLLEiKWVESwGyEk8CshSyEYEEshAisgGzIicIZURLAQgnCExnFihMULAjQzYaAUcCIllJTgJJgRALJQhPAhUSRIgND0mBIA5EIQYLIoj8FSJJSwIMQQAbSwJXAgBLAYEQC4EQWEkiW0wkW4gOFyMIQv/eI0M2GgFHAiJZSU4CSSQLJQhPAhUSRIgMx0mBIA5EIQYLIoj7zSJJSwIMQQASSwJXAgBLASQLW4gONCMIQv/nI0M2GgFHAiJZSU4CSSQLJQhPAhUSRIgMiCIpZURESYETDkSByAELIoj7iCJJTgMiSUsDDEEAR0sDVwIASwEkC1uIDjhOA0sGQAAvsYEEshAisgEiKWVEshGyFEsCshJLBSMISUUHgRASQQAEsyJFBkxPAghMIwhC/7a2Qv/OSEUBRQFLAUEAAbMiJwhlREsBCCcITGcWKExQsCNDIkcEK0cDNhoBSRUkEkQXNhoCSU4CSRUkEkQXSU4CNhoDSU4DSRUkEkQXNhoESRUkEkQXTgM2GgVJFSQSRBdJTgQxFiMJSU4FSTgQIxJEIillRERLBERPA0RPAogRWBREOAcyChJESYEODkQhBwsiiPqlIkwiTE4CSwJBATIiJwZlRCEEE0EBJ0lLBQxBASAiJwZlTElOAkUPRBZJRREnBExQSUUPvkxJTgJFE0SBKFtLCAxAAPkjCEsQVwAgIillRHAARQFAADJLDb5ESVcgCEsBgSBbSwKBKFsLSw+IFeYITwJXACBJTwKIFgZLEUxQTFAnH0xQsEL/fksQgSBbSUsEDUEApUhLAkwxAEsOiBVpSUUUSVcoCEsBgShbSwVJTwKIFIexIillREsDVwAgSUUZSwKyErIUSwSyE7IRgQSyECKyAbNPAoEgW0sBCUwWSwEWSU4CTgVLFk8FUExQTwNQTFCABEprOWhMULBBACVLEkxcIElFE0sPTL9LEYEoW08CSU8CC08DCE4CSwNMCUUDQv7jSEsNiBUrSUUNQf/bSxJLDIgVSkL/0UxC/1tISwFBACMiJwZlRCEEE0EAGCInBmVEFicETFC+RIEoW0sHD0EAAyJFAiEESwM4CE4CSwNBAN1IsSIpZUQxADIKSwWyErIUshOyEYEEshAisgGzMgpzAUxOA0RLBiEEEkEA0iInBWVESwdFDkkhBBNBACFJFipMUL5MSU4CRRNEgShbSwoNQAALSxCBQFtMRQ5C/9giJxNlTElPAkRJIwgnE0xnJx0xAFBLAYgREjEASwgWSxJJTgUWTwdJTgcWTwQWTwRLBFBLEklOCVBLEVBPA1BPAlBMUEsCFipLAVBPAr9PA0sDiBCRTwNPA4gQqTIKcwFETwcJTwZJTgJLAQ9ECU4FMQBQTFBMUIAECYzNr0xQsExPAghJRQpBABCxMQBLCbIIsgcjshAisgGzFihMULAjQ0sGFipMUEm9RQFEvkhJgShbSwoORIFAW0L/GDYaAUkVJBJEFzYaAkkVJBJEFzEWIwlJOBAjEkQiKWVEREk4BzIKEkRLAhYqTFBJvUUBRL5ISYEwW4gOfBRETDgISwGBKFtLAwsPRE8CTEsCiA9WRgKxIillRDEATwKyErIUshGBBLIQIrIBsyNDNhoBSRUkEkQXNhoCSRUkEkQXNhoDSRUkEkQXMRYjCUk4ECMSRCIpZURESTgHMgoSREsBREsBgQ4OREsBIQcLIoj3aE4DiBFXSU4CTgNJTgJOA08COAhJTgQOREEAF7EiKWVEMQBLArISshSyEYEEshAisgGzSwFLAw1BABOxMQBLAksECbIIsgcjshAisgGzFihMULAjQzYaAUcCFSQSRBdJFipMUEm9RQFEvkgxAEsBVwAgSU4ETEsBEkSxIillREsCVyAITgRPAoEgW7ISshGyFIEEshAisgGziBAESU4EQQAQsTEASwSyCLIHI7IQIrIBs04CUExQgARl8MWxTFCwI0MiKzYaAUcCIllJTgJJJAslCE8CFRJESYETDkQhBgsiiPaFIklJSwMMQQA1SwNXAgBLASQLW0lFBhYqTFBJRQe9RQFBABZLBb5EgTBbiAz3QQAJSwSIDWBPAghMIwhC/8RIRQFFAUlBABCxMQBLAbIIsgcjshAisgGzFihMULAjQyIrRwI2GgFJFSQSRBdJNhoCSU4DSRUkEkQXSU4DNhoDSRUkEkQXTgM2GgRJFSQSRBcxFiMJSU4ESTgQIxJEIillRElESwRESwNEMQBMcABFAUQ4BzIKEkRJgQ4OREkhBwsiiPXCiA+zTgNJQQAXsSIpZUQxAEsCshKyFLIRgQSyECKyAbMhBE8DTwIJSUUJQQAiIicFZUQhBBNBABciJwVlRBYqTFC+RIEoW0sFDkEAAyJFCEsHQQCzSDIKcwFMTgJESwMhBBJBAM4iJwZlREsERQpJIQQTQQAiSRYnBExQvkxJTgJFDUSBKFtLBgxAAAtLCoE4W0xFCkL/1yInF2VMSU8CREkjCCcXTGcxAEsLSU4DFksOSU4DFk8HSU4FFk8DSwNQSw5JTglQTwJQTFBLBBYnBEsBUE8Cv08CSwSIEFpPAk8DiBBzTwJLCQtLBwgyCnMBRE8HCQhFBjEAUExQTFCABDIIMUpMULBMOAhJRQdJSwNJTgMPRAxBABOxMQBLBksDCbIIsgcjshAisgGzFihMULAjQ0sDiA/tSYEoW0sGD0SBOFtC/yQ2GgFJFSQSREkXSYgP0TEASwFXACBMSwESREsBVyAISwKBIFtPA4EoWwtPA4gP/AixMQCyB7III7IQIrIBs04CUExQJx9MULAjQycNMQBQvUUBRCcNMQBQvkQyCnMBRCcNMQBQvEhLASJbCDIKcwFECUxJVwgITCRbSU4DQQAXsSIpZUQxAEsEshKyFLIRgQSyECKyAbOxMQBPAklOArIIsgcjshAisgGzMQBMFlBMUIAEu8xmCUxQsCNDIicHZUQWKExQsCNDIillRBYoTFCwI0MiJwtlRChMULAjQyInD2VEKExQsCNDIicIZUQWKExQsCNDIicQZUQoTFCwI0M2GgFXAgCIB3AWgAFlTFC+JyBOAk0oTFCwI0M2GgEXiARTiAZ+SChMULAjQyIrNhoBFzYaAhcnFU4CIicHZURLAk4CiAxMTgJJSwMMQQCgSRYnCkxQvkSIBklISUUGSwIVTBUIJQghCA1AAIOAAgACSwVQTE8CSSJZSSMIFlcGAE4DTFcCAEwlC04CIkUHSwZLAwxBABpJSwdJTgJZJQgWVwYATwVMUE4EJQhFB0L/3kkVTgMiRQhLByUMQQAcSwVLCElOAllLBQgWVwYATwZMUE4FJQhFCEL/3U8CTwNSTwJMUE8CVwIAUEwjCEL/WUgoTFCwI0MrNhoBFzYaAhcnFSInEWVEIksBIQQTQQBGSwIiWUlFB0sEDEEAOUlLBQxBABAjCEwWJw5MUL5EJFtMQv/USwIVJAghCA1AABdLARZLBiMIFlcGAE8ETFwATFBOAkL/0EYCKExQsCNDNhoBNhoCFzYaAxcnIU8DUE4CiAqiKExQsCNDNhoBNhoCFzYaAxcnHU8DUE4CiAqHKExQsCNDNhoBVwIASRWBPAsiiPHbiAYDAYABY0xQvkwXIQRMTwJNFihMULAjQzYaARcWJxxMUL6AKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABOAk0oTFCwI0M2GgEXNhoCNhoDTwIWJxxMUEm9RQFEvkhOAkkiWYE8C4GWAQgiiPFdTFcCAIABAExQAUxJFSVLAQ8lSwJPAk1MUklOAhVMIklLAwxBAClLA0sBgSBYSUsDpEEADycWTFBPAlABTIEgCEL/3CcWTwNQTFABTEL/7khFAUUBTFcAIBKAAQAiTwJUKExQsCNDNhoBF4gB6EmBKVlLAYErWVJXAgCIBdtJFRZXBgJMUChMULAjQ4gL4UwiTgIiJwllREEADSInDGVEIicJZUQKRQMiJwllRBYiJwxlRBYiJxRlRBZLBRYiJxhlRBYiJxllRBZPBU8FUE8EUE8DUE8CUExQTFBMUChMULAjQyInE2VEFihMULAjQyInBWVEiAcaSSEEE0EACYgHQChMULAjQ0iAQP//////////AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABC/7QnDTYaAVC+JyJOAk0oTFCwI0MiJwZlRCEEEkEAQIA4//////////8AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAoTFCwI0MiJwZlRBYnBEsBUL5ESVcAIEsBVyAITwJXKAhPA08DUE8CUExQQv/SKzYaARc2GgIXJxUiJwVlRIgGLCJLASEEE0EATEsCIllJRQdLBAxBAD9JSwUMQQATIwhMFipMUL5EgUBbiAYATEL/0UsCFYFACCEIDUAAGUsBiAYbSwYjCBZXBgBPBExcAExQTgJC/8pGAihMULAjQzEAIicLZUQSRIkxACInD2VEEkSJigEBIicHZUSL/w1Ei/8WJwpMUL5EiYoEAYv8VwIAFYFADkSL/VcCABWBQA5Ei/5XAgCIAs9HAkSL/1cCAIgC80kVSYFgDkQiJwdlTElOA04FREsCAYABY0xQSb1FARRESwIWSU4HTEsBvzEAgYCAgICAgICAARZPBhZJkyQORFcHAU8EFlcGAk8GUE8DTwNQTwJQgAIAL1BLARWBLwhJFlcGAk8CTFCL/BVPAggWVwYCUExQi/xQi/1QJwpLAlBJvEhMv0sBIwgnB0xnJyExAFBPAogGiUgiJxJlTElOAk4DREkWIQQWUCcOTwNQTL8hBBJBACtIJxFLAWcnEksBZ08CIiMiiAQNMQBPAkxQgAIAKlCL/1CABCQnYPRMULCJSwGIA4FC/9OKAgCL/0SL/yEJDkSL/oj+x0mBIFuBOJEjEkSBgICAgICAgIACi/8ZFlwgi/4WJwpLAVBJvEhLAr9LAVcAIIv+TIgDS0yBKFUjJSKIA5+L/xZQgAQPZj55TFCwiYoBAIv/iP50SYEgW4E4kSMSRIGAgICAgICAgAMWXCCL/xYnCksBUEm8SEsCv0sBVwAgi/9MiAL7TIEoVSOBAyKIA06ABAQrUjpMULCJigECi/+I/idJgSBbSYE4kSUSRCEJGoGAgICAgICAgARLARkWTwJMXCCL/xYnCksBUEm8SEsCv0sBgShVJYEESwWIAwBMVwAgSwIWTwJLAlBMUIAE2jcc4ExQsEyJigECi/9XACCL/4EpWYv/gStZi/9PAksCUlcCAIgBtkkVFlcGAkxQTIv/gS1Zi/9PAksCUkyL/xWL/04CUov/gShVSSMSQQBmSCcjSRUWVwYCTFCL/4EgW0mBOJEWTCEJGhZPBoACADhQTwZJTgIVgTgISRZXBgJPAkxQTwdJTgMVTwIISRZXBgJPAkxQTwdJTgMVTwIIFlcGAlBPBVBPBFBPA1BPAlBMUExQi/+JSSUSQQAGSCckQv+RSYEDEkEABkgnJUL/hIEEEkEABScmQv95K0L/dYoBAYv/JyMSQQACI4mL/yckEkEAAiWJi/8nJRJBAAOBA4mL/ycmEkEAA4EEiSKJigEBK4v/FUkjSwEPI04CTUmL/yJPAlInBBNBAAWL/4wAiYv/TE8CUkkrTCKMACJMFUwiSUsDDEEAaUsESwFVSYFhD0EAQ0mBeg5BADyBYQmLAIEFkBmMAEyBBQhJTgIkD0EAIEwkCUlOAosASU4CSwGRFlcHAU8GTFBOBSNMkCMJGowAIwhC/6pJgTIPQQAPSYE3DkEACCNEgRgJQv+xIkL/9UhFAU8CSIEFDEEAHYsAQAAYI0RJFSNLAQ8jTgJNSwEiTwJSJxYSREyJIkL/5YoBAStJi/8VSSNLAQ8jTgJNi/8iTwJSJxYSQQCBgTxLAQsiiOrfK0wijAEijAAiTEoMQQBJiwEkkIv/SwNVGYwBiwAkCIwAiwCBBQ9BAB2LAIEFCUmMAIsBTJGBHxonJ0wjWE8DTFBOAkL/2yOLAJAjCYsBGowBTCMITEL/skYCiwBBABKBBYsACYsBTJCBHxonJ0wjWFAnBExQjACJi/+MAImKAgCL/hYnDkxQi/8WJEy7iYoCAIv+FicOTFBJvkRJVwAITEkiW0lPAiRbTCEEEkEANicRSwFnSSEEEkEAHEhFAScSTGcyCnMBREy8SDIKcwFECYv/TIgF5IlFARYnDkxQIk8Cu0L/3UqI/5RC/8iKBAAiJxBlRIv9QQAKi/0kC0pbIwkWXYv+JAtJTwJJTgJLAVsjCBZdJxBMZ4v8FoABZUxQSb1FAUEAOEm+RIv9QQAQSVcAKIv9JAtKWyMJFl1cAElXAChJTwRJTgNbIwgWTE4CXVwASYEoW4v/CBZcKL+JJyBC/8aKAgCL/jgHMgoSRDIKcwFEi/8Ji/44CA5EiYoBAYv/QQAKMgaL/w1BAAIjiSKJigEBIov/IQQTQQAgi/8WKkxQSYwAvkSBMFuI/89BAAyLAL5EgUBbjP9C/9iL/0yJigEBi/8WKksBUL5ESVcAIEsBVyAISwJXKAhPA1cwCE8ETwRQTwNQTwJQTFCJigEBi/8WSSpMUL5MSU8CRDIKcwFMTgNEVwAgSU4CIillRHAARQFBAEixIillREsBgSBbshJLArIUshGBBLIQIrIBs1cgCE8DTwJQTFCABJaHJIhMULCL/4gBzEgyCnMBTElPAkRLAgxBAAIJiUYCIolJgSBbSwIiTwKIBHxC/8OKAwKL/0SL/oEgW4v/SwEORIv+VygIi/6BKFuL/0sBC04Di/9MiALdTIv/CYv9FklOAk4DMQCL/xZLAhZJTgROBk8ETwJQTFBPA1BPAlCABGguT/lMULBBABqL/kxcIIz+KkxQi/6/SYv+VwAgTIgD2ov+iUYCi/2IASxLAQhC/+eKAgCL/iEEEkEABicFi/9niYv+FipMUIv/FoFATLuJigIAi/4hBBNBAA2L/hYqTFCL/xaBOEy7iYoBAYv/vkEAAheJSCKJigIBi/6I/+pHAiEFChZXBgKL/kxQTCEFGCQLSUEAGUkkCE8CSU8C04v/FkxOArtJIwgWi/5Mv4lIi/8Wv0L/74oDASuL/Yj/qYv+i/9PAogAbEmL/gmBfQ1BAAeL/oF9CIwBK4v+SYsBDEEAPEkhBQpJTgIjCCEFC0mMAIsBDUEABIsBjABMFlcGAov9TFBMSSEFGCQLiwBJTgRPAgkkC7pPAkxQTEL/vUiLAYv+CRZJk4EQDkRXBgJMUIwAiYoDAYv9i/8PQQADi/2Ji/+L/QmL/g1BAAaL/Yv+CImL/4mKAQGL/xYqTFBJvkRJgThbSwGBQFtKiP7BTIj+3DIKcwFMTgJESVcAICcdTFBJTwJJV0gITgWBSFtJTgJOBUmI/tAjCUlOA0khBQoWVwYCTwJMUE4CSSEFGCQLTgMhBE4IE0EAH0lLAiS6iwFJIQUKFlcGAksGTFBMIQUYJAtLArsXjAJLAUEALUzTSUEAIRa/iwIhBBNBAAuLAhYqTFCBSIsAu0y8SDIKcwFECYwAiUi8SEL/20UBvEhC/86KAwIiKyJHAov9SUEAcyInBWVEIQQTQQBoSwGL/wxBAGBMIwhMIicFZUxJTgKMAUQWKkxQvkxJTgKMAESBKFuL/g1AADyLAIEwW4j8XkEADYsBiPzHiwIIjAJC/62LAIEgW0lLAg1BABVISYsBiwBLAoj9KEhPBAhOAwlC/4xC/+pFAYsCQQAQsTEAiwKyCLIHI7IQIrIBs4v9TAmMAIwBiYoCACuL/ov/CyInCWVEi/4IJwlMZyInDGVESwEIJwxMZyInFGVEIwgnFExnJxiL/2cnGTIHZ4gARE4CSSRbi/4IFlwISYEQW08CCBZcEEmBGFuL/wxBAAWL/xZcGEmBIFtJjABBAAiL/4sADEEABYv/FlwgJxpMZycbTGeJigACMgdJIQoYCUkiJxplTElOAk4DRCInG2VMTgREIltJTgQTQQAVRQGLASEKCIsAEkEADoEor4sAFlwATE8DTwOJSIEor4sAIQoJFlwAQv/jigEBi/8WJwRMUEm9RQFEvkiJigIAi/4hBBJBAAYnBov/Z4mL/hYnBExQi/8WgThMu4mKAgCL/iEEE0EADov+FicETFCL/xaBMEy7iYoBAYv/FicETFBJvkRJgTBbTIE4W0qI/61MiP/JMgpzAURMvEgyCnMBRAmJigIAi/5zAESL/wiL/nMBRA9BABGxi/+yCIv+sgcjshAisgGziYv+i/8iiAABiYoDACcNi/1QSb1FAUEAF0m+REkiW4v+CBZcAEkkW4v/CBZcCL+Ji/4hCw1BAAyL/iELCRYiFlBC/+GL/0EABSciQv/XiQ==","clear":"C4EBQw=="},"compilerInfo":{"compiler":"puya","compilerVersion":{"major":5,"minor":10,"patch":1}},"events":[{"name":"ProjectSubmitted","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"},{"type":"string","name":"cid"}]},{"name":"EvidenceCommitted","args":[{"type":"uint64","name":"project_id"},{"type":"byte[32]","name":"root"},{"type":"uint64","name":"leaf_count"}]},{"name":"ProjectApproved","args":[{"type":"uint64","name":"project_id"},{"type":"uint64","name":"credits"}]},{"name":"ProjectRejected","args":[{"type":"uint64","name":"project_id"}]},{"name":"CreditsIssued","args":[{"type":"uint64","name":"project_id"},{"type":"address","name":"submitter"},{"type":"uint64","name":"credits"}]},{"name":"BidCancelled","args":[{"type":"uint64","name":"bid_id"},{"type":"address","name":"bidder"},{"type":"uint64","name":"quantity"}]},{"name":"BidFilled","args":[{"type":"uint64","name":"bid_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"},{"type":"uint64","name":"remaining"}]},{"name":"Listed","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"},{"type":"uint64","name":"price"}]},{"name":"ListingFilled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"buyer"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"},{"type":"uint64","name":"remaining"}]},{"name":"ListingExpired","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]},{"name":"ListingCancelled","args":[{"type":"uint64","name":"listing_id"},{"type":"address","name":"seller"},{"type":"uint64","name":"amount"}]},{"name":"BidPlaced","args":[{"type":"uint64","name":"bid_id"},{"type":"address","name":"bidder"},{"type":"uint64","name":"quantity"},{"type":"uint64","name":"price"}]},{"name":"Claimed","args":[{"type":"address","name":"account"},{"type":"uint64","name":"algo"},{"type":"uint64","name":"tokens"}]}],"templateVariables":{}} as unknown as Arc56Contract
 
 /**
  * A state record containing binary data
@@ -63,6 +63,196 @@ export type Expand<T> = T extends (...args: infer A) => infer R
     : never
 
 
+// Type definitions for ARC-56 structs
+
+export type Bid = {
+  bidder: string,
+  quantity: bigint,
+  price: bigint,
+  prev_bid: bigint,
+  next_bid: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a Bid to the struct representation
+ */
+export function BidFromTuple(abiTuple: [string, bigint, bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.Bid, APP_SPEC.structs) as Bid
+}
+
+export type BidView = {
+  bid_id: bigint,
+  bidder: string,
+  quantity: bigint,
+  price: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a BidView to the struct representation
+ */
+export function BidViewFromTuple(abiTuple: [bigint, string, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.BidView, APP_SPEC.structs) as BidView
+}
+
+export type Claim = {
+  algo: bigint,
+  tokens: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a Claim to the struct representation
+ */
+export function ClaimFromTuple(abiTuple: [bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.Claim, APP_SPEC.structs) as Claim
+}
+
+export type EvidenceRoot = {
+  root: Uint8Array,
+  leaf_count: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a EvidenceRoot to the struct representation
+ */
+export function EvidenceRootFromTuple(abiTuple: [Uint8Array, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.EvidenceRoot, APP_SPEC.structs) as EvidenceRoot
+}
+
+export type Listing = {
+  seller: string,
+  amount: bigint,
+  price: bigint,
+  expires_round: bigint,
+  prev_ask: bigint,
+  next_ask: bigint,
+  seller_slot: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a Listing to the struct representation
+ */
+export function ListingFromTuple(abiTuple: [string, bigint, bigint, bigint, bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.Listing, APP_SPEC.structs) as Listing
+}
+
+export type ListingView = {
+  listing_id: bigint,
+  seller: string,
+  amount: bigint,
+  price: bigint,
+  expires_round: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ListingView to the struct representation
+ */
+export function ListingViewFromTuple(abiTuple: [bigint, string, bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ListingView, APP_SPEC.structs) as ListingView
+}
+
+export type MarketStats = {
+  volume: bigint,
+  notional: bigint,
+  trade_count: bigint,
+  vwap: bigint,
+  last_price: bigint,
+  last_trade_time: bigint,
+  current: TradeWindow,
+  previous: TradeWindow,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a MarketStats to the struct representation
+ */
+export function MarketStatsFromTuple(abiTuple: [bigint, bigint, bigint, bigint, bigint, bigint, [bigint, bigint, bigint, bigint, bigint], [bigint, bigint, bigint, bigint, bigint]]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.MarketStats, APP_SPEC.structs) as MarketStats
+}
+
+export type PendingLink = {
+  prev_pending: bigint,
+  next_pending: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a PendingLink to the struct representation
+ */
+export function PendingLinkFromTuple(abiTuple: [bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.PendingLink, APP_SPEC.structs) as PendingLink
+}
+
+export type Project = {
+  submitter: string,
+  cid: string,
+  name: string,
+  location: string,
+  ecosystem: string,
+  status: bigint,
+  credits: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a Project to the struct representation
+ */
+export function ProjectFromTuple(abiTuple: [string, string, string, string, string, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.Project, APP_SPEC.structs) as Project
+}
+
+export type ProjectRecord = {
+  submitter: string,
+  state: bigint,
+  ecosystem: number,
+  cid: Uint8Array,
+  name: string,
+  location: string,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ProjectRecord to the struct representation
+ */
+export function ProjectRecordFromTuple(abiTuple: [string, bigint, number, Uint8Array, string, string]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ProjectRecord, APP_SPEC.structs) as ProjectRecord
+}
+
+export type ProjectTotals = {
+  by_status: [bigint, bigint, bigint, bigint, bigint],
+  credits_issued: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a ProjectTotals to the struct representation
+ */
+export function ProjectTotalsFromTuple(abiTuple: [[bigint, bigint, bigint, bigint, bigint], bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.ProjectTotals, APP_SPEC.structs) as ProjectTotals
+}
+
+export type TradeWindow = {
+  start: bigint,
+  volume: bigint,
+  notional: bigint,
+  high: bigint,
+  low: bigint,
+}
+
+
+/**
+ * Converts the ABI tuple representation of a TradeWindow to the struct representation
+ */
+export function TradeWindowFromTuple(abiTuple: [bigint, bigint, bigint, bigint, bigint]) {
+  return getABIStructFromABITuple(abiTuple, APP_SPEC.structs.TradeWindow, APP_SPEC.structs) as TradeWindow
+}
+
+
 /**
  * The argument types for the AarnaRegistry contract
  */
@@ -79,11 +269,22 @@ export type AarnaRegistryArgs = {
       newAdmin: string
     }
     'ensure_token()uint64': Record<string, never>
-    'submit_project(string,string,string,string)uint64': {
+    'submit_project(string,string,string,string,pay)uint64': {
       name: string
       location: string
       ecosystem: string
       cid: string
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'submit_projects_batch((string,string,string,string)[],pay)uint64[]': {
+      submissions: [string, string, string, string][]
+      mbrPayment: AppMethodCallTransactionArgument
+    }
+    'commit_evidence_root(uint64,byte[32],uint64,pay)void': {
+      projectId: bigint | number
+      root: Uint8Array
+      leafCount: bigint | number
+      mbrPayment: AppMethodCallTransactionArgument
     }
     'approve_project(uint64,uint64)void': {
       projectId: bigint | number
@@ -95,7 +296,16 @@ export type AarnaRegistryArgs = {
     'issue_credits(uint64)uint64': {
       projectId: bigint | number
     }
-    'list_for_sale(uint64,uint64)uint64': {
+    'approve_projects_batch((uint64,uint64)[])void': {
+      approvals: [bigint | number, bigint | number][]
+    }
+    'reject_projects_batch(uint64[])void': {
+      projectIds: bigint | number[]
+    }
+    'issue_credits_batch(uint64[])uint64': {
+      projectIds: bigint | number[]
+    }
+    'list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64': {
       /**
        * number of AARNA tokens to sell
        */
@@ -104,52 +314,120 @@ export type AarnaRegistryArgs = {
        * price per token in microALGO
        */
       pricePerToken: bigint | number
+      /**
+       * last round the listing can be bought in, or 0 to keep it open until sold out or cancelled
+       */
+      expiresRound: bigint | number
+      /**
+       * the last active listing priced at or below `price_per_token`, or NO_LISTING if there is none; the ask index is walked forward from here
+       */
+      afterHint: bigint | number
+      /**
+       * most crossing bids to fill or close, up to MAX_FILLS; FILL_BUDGET opcodes per fill are drawn from the group's fee credit
+       */
+      maxFills: bigint | number
+      /**
+       * covers the MBR of the new listing box, if any; whatever it does not cover is refunded with the proceeds
+       */
+      mbrPayment: AppMethodCallTransactionArgument
     }
-    'buy_listing(uint64,pay)void': {
+    'buy_listing(uint64,uint64,pay)void': {
       listingId: bigint | number
+      quantity: bigint | number
+      payment: AppMethodCallTransactionArgument
+    }
+    'market_buy(uint64,uint64,uint64,pay)uint64': {
+      maxQuantity: bigint | number
+      maxPrice: bigint | number
+      maxFills: bigint | number
       payment: AppMethodCallTransactionArgument
     }
     'cancel_listing(uint64)void': {
       listingId: bigint | number
     }
+    'sweep_expired(uint64[])uint64': {
+      listingIds: bigint | number[]
+    }
+    'place_bid(uint64,uint64,uint64,uint64,pay)uint64': {
+      /**
+       * number of AARNA tokens wanted
+       */
+      quantity: bigint | number
+      /**
+       * highest price per token in microALGO
+       */
+      maxPrice: bigint | number
+      /**
+       * the last active bid priced at or above `max_price`, or NO_BID if there is none; the bid index is walked forward from here
+       */
+      afterHint: bigint | number
+      /**
+       * most asks to fill first, up to MAX_FILLS; FILL_BUDGET opcodes per fill are drawn from the group's fee credit
+       */
+      maxFills: bigint | number
+      /**
+       * covers immediate fills, the escrow and the bid box MBR; any excess is refunded
+       */
+      payment: AppMethodCallTransactionArgument
+    }
+    'cancel_bid(uint64)void': {
+      bidId: bigint | number
+    }
+    'claim()void': Record<string, never>
     'get_project_count()uint64': Record<string, never>
     'get_asset_id()uint64': Record<string, never>
     'get_admin()address': Record<string, never>
     'get_validator()address': Record<string, never>
     'get_total_credits_issued()uint64': Record<string, never>
-    'get_project_status(uint64)uint64': {
-      projectId: bigint | number
+    'get_status_counts()uint64[5]': Record<string, never>
+    'get_ecosystem_totals(string)(uint64[5],uint64)': {
+      ecosystem: string
     }
-    'get_project_cid(uint64)string': {
+    'get_project(uint64)(address,string,string,string,string,uint64,uint64)': {
       projectId: bigint | number
     }
-    'get_project_name(uint64)string': {
-      projectId: bigint | number
+    'get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]': {
+      start: bigint | number
+      count: bigint | number
     }
-    'get_project_location(uint64)string': {
-      projectId: bigint | number
+    'get_pending(uint64,uint64)uint64[]': {
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_account_projects(address,uint64,uint64)uint64[]': {
+      account: string
+      start: bigint | number
+      count: bigint | number
+    }
+    'get_account_listings(address,uint64,uint64)uint64[]': {
+      account: string
+      start: bigint | number
+      count: bigint | number
+    }
+    'find_project_by_cid(string)uint64': {
+      cid: string
     }
-    'get_project_credits(uint64)uint64': {
+    'get_evidence_root(uint64)(byte[32],uint64)': {
       projectId: bigint | number
     }
-    'get_project_submitter(uint64)address': {
+    'verify_inclusion(uint64,byte[],byte[32][])bool': {
       projectId: bigint | number
+      leaf: Uint8Array
+      proof: Uint8Array[]
     }
-    'get_project_ecosystem(uint64)string': {
+    'get_project_cid(uint64)string': {
       projectId: bigint | number
     }
+    'get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))': Record<string, never>
     'get_listing_count()uint64': Record<string, never>
-    'get_listing_seller(uint64)address': {
-      listingId: bigint | number
-    }
-    'get_listing_amount(uint64)uint64': {
-      listingId: bigint | number
-    }
-    'get_listing_price(uint64)uint64': {
-      listingId: bigint | number
+    'get_best_ask()(uint64,address,uint64,uint64,uint64)': Record<string, never>
+    'get_claim(address)(uint64,uint64)': {
+      account: string
     }
-    'get_listing_active(uint64)uint64': {
-      listingId: bigint | number
+    'get_best_bid()(uint64,address,uint64,uint64)': Record<string, never>
+    'get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]': {
+      start: bigint | number
+      count: bigint | number
     }
   }
   /**
@@ -160,30 +438,45 @@ export type AarnaRegistryArgs = {
     'set_validator(address)void': [addr: string]
     'transfer_admin(address)void': [newAdmin: string]
     'ensure_token()uint64': []
-    'submit_project(string,string,string,string)uint64': [name: string, location: string, ecosystem: string, cid: string]
+    'submit_project(string,string,string,string,pay)uint64': [name: string, location: string, ecosystem: string, cid: string, mbrPayment: AppMethodCallTransactionArgument]
+    'submit_projects_batch((string,string,string,string)[],pay)uint64[]': [submissions: [string, string, string, string][], mbrPayment: AppMethodCallTransactionArgument]
+    'commit_evidence_root(uint64,byte[32],uint64,pay)void': [projectId: bigint | number, root: Uint8Array, leafCount: bigint | number, mbrPayment: AppMethodCallTransactionArgument]
     'approve_project(uint64,uint64)void': [projectId: bigint | number, credits: bigint | number]
     'reject_project(uint64)void': [projectId: bigint | number]
     'issue_credits(uint64)uint64': [projectId: bigint | number]
-    'list_for_sale(uint64,uint64)uint64': [amount: bigint | number, pricePerToken: bigint | number]
-    'buy_listing(uint64,pay)void': [listingId: bigint | number, payment: AppMethodCallTransactionArgument]
+    'approve_projects_batch((uint64,uint64)[])void': [approvals: [bigint | number, bigint | number][]]
+    'reject_projects_batch(uint64[])void': [projectIds: bigint | number[]]
+    'issue_credits_batch(uint64[])uint64': [projectIds: bigint | number[]]
+    'list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64': [amount: bigint | number, pricePerToken: bigint | number, expiresRound: bigint | number, afterHint: bigint | number, maxFills: bigint | number, mbrPayment: AppMethodCallTransactionArgument]
+    'buy_listing(uint64,uint64,pay)void': [listingId: bigint | number, quantity: bigint | number, payment: AppMethodCallTransactionArgument]
+    'market_buy(uint64,uint64,uint64,pay)uint64': [maxQuantity: bigint | number, maxPrice: bigint | number, maxFills: bigint | number, payment: AppMethodCallTransactionArgument]
     'cancel_listing(uint64)void': [listingId: bigint | number]
+    'sweep_expired(uint64[])uint64': [listingIds: bigint | number[]]
+    'place_bid(uint64,uint64,uint64,uint64,pay)uint64': [quantity: bigint | number, maxPrice: bigint | number, afterHint: bigint | number, maxFills: bigint | number, payment: AppMethodCallTransactionArgument]
+    'cancel_bid(uint64)void': [bidId: bigint | number]
+    'claim()void': []
     'get_project_count()uint64': []
     'get_asset_id()uint64': []
     'get_admin()address': []
     'get_validator()address': []
     'get_total_credits_issued()uint64': []
-    'get_project_status(uint64)uint64': [projectId: bigint | number]
+    'get_status_counts()uint64[5]': []
+    'get_ecosystem_totals(string)(uint64[5],uint64)': [ecosystem: string]
+    'get_project(uint64)(address,string,string,string,string,uint64,uint64)': [projectId: bigint | number]
+    'get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]': [start: bigint | number, count: bigint | number]
+    'get_pending(uint64,uint64)uint64[]': [start: bigint | number, count: bigint | number]
+    'get_account_projects(address,uint64,uint64)uint64[]': [account: string, start: bigint | number, count: bigint | number]
+    'get_account_listings(address,uint64,uint64)uint64[]': [account: string, start: bigint | number, count: bigint | number]
+    'find_project_by_cid(string)uint64': [cid: string]
+    'get_evidence_root(uint64)(byte[32],uint64)': [projectId: bigint | number]
+    'verify_inclusion(uint64,byte[],byte[32][])bool': [projectId: bigint | number, leaf: Uint8Array, proof: Uint8Array[]]
     'get_project_cid(uint64)string': [projectId: bigint | number]
-    'get_project_name(uint64)string': [projectId: bigint | number]
-    'get_project_location(uint64)string': [projectId: bigint | number]
-    'get_project_credits(uint64)uint64': [projectId: bigint | number]
-    'get_project_submitter(uint64)address': [projectId: bigint | number]
-    'get_project_ecosystem(uint64)string': [projectId: bigint | number]
+    'get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))': []
     'get_listing_count()uint64': []
-    'get_listing_seller(uint64)address': [listingId: bigint | number]
-    'get_listing_amount(uint64)uint64': [listingId: bigint | number]
-    'get_listing_price(uint64)uint64': [listingId: bigint | number]
-    'get_listing_active(uint64)uint64': [listingId: bigint | number]
+    'get_best_ask()(uint64,address,uint64,uint64,uint64)': []
+    'get_claim(address)(uint64,uint64)': [account: string]
+    'get_best_bid()(uint64,address,uint64,uint64)': []
+    'get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]': [start: bigint | number, count: bigint | number]
   }
 }
 
@@ -195,30 +488,45 @@ export type AarnaRegistryReturns = {
   'set_validator(address)void': void
   'transfer_admin(address)void': void
   'ensure_token()uint64': bigint
-  'submit_project(string,string,string,string)uint64': bigint
+  'submit_project(string,string,string,string,pay)uint64': bigint
+  'submit_projects_batch((string,string,string,string)[],pay)uint64[]': bigint[]
+  'commit_evidence_root(uint64,byte[32],uint64,pay)void': void
   'approve_project(uint64,uint64)void': void
   'reject_project(uint64)void': void
   'issue_credits(uint64)uint64': bigint
-  'list_for_sale(uint64,uint64)uint64': bigint
-  'buy_listing(uint64,pay)void': void
+  'approve_projects_batch((uint64,uint64)[])void': void
+  'reject_projects_batch(uint64[])void': void
+  'issue_credits_batch(uint64[])uint64': bigint
+  'list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64': bigint
+  'buy_listing(uint64,uint64,pay)void': void
+  'market_buy(uint64,uint64,uint64,pay)uint64': bigint
   'cancel_listing(uint64)void': void
+  'sweep_expired(uint64[])uint64': bigint
+  'place_bid(uint64,uint64,uint64,uint64,pay)uint64': bigint
+  'cancel_bid(uint64)void': void
+  'claim()void': void
   'get_project_count()uint64': bigint
   'get_asset_id()uint64': bigint
   'get_admin()address': string
   'get_validator()address': string
   'get_total_credits_issued()uint64': bigint
-  'get_project_status(uint64)uint64': bigint
+  'get_status_counts()uint64[5]': [bigint, bigint, bigint, bigint, bigint]
+  'get_ecosystem_totals(string)(uint64[5],uint64)': ProjectTotals
+  'get_project(uint64)(address,string,string,string,string,uint64,uint64)': Project
+  'get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]': [string, string, string, string, string, bigint, bigint][]
+  'get_pending(uint64,uint64)uint64[]': bigint[]
+  'get_account_projects(address,uint64,uint64)uint64[]': bigint[]
+  'get_account_listings(address,uint64,uint64)uint64[]': bigint[]
+  'find_project_by_cid(string)uint64': bigint
+  'get_evidence_root(uint64)(byte[32],uint64)': EvidenceRoot
+  'verify_inclusion(uint64,byte[],byte[32][])bool': boolean
   'get_project_cid(uint64)string': string
-  'get_project_name(uint64)string': string
-  'get_project_location(uint64)string': string
-  'get_project_credits(uint64)uint64': bigint
-  'get_project_submitter(uint64)address': string
-  'get_project_ecosystem(uint64)string': string
+  'get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))': MarketStats
   'get_listing_count()uint64': bigint
-  'get_listing_seller(uint64)address': string
-  'get_listing_amount(uint64)uint64': bigint
-  'get_listing_price(uint64)uint64': bigint
-  'get_listing_active(uint64)uint64': bigint
+  'get_best_ask()(uint64,address,uint64,uint64,uint64)': ListingView
+  'get_claim(address)(uint64,uint64)': Claim
+  'get_best_bid()(uint64,address,uint64,uint64)': BidView
+  'get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]': [bigint, string, bigint, bigint, bigint][]
 }
 
 /**
@@ -249,10 +557,20 @@ export type AarnaRegistryTypes = {
       argsTuple: AarnaRegistryArgs['tuple']['ensure_token()uint64']
       returns: AarnaRegistryReturns['ensure_token()uint64']
     }>
-    & Record<'submit_project(string,string,string,string)uint64' | 'submit_project', {
-      argsObj: AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']
-      returns: AarnaRegistryReturns['submit_project(string,string,string,string)uint64']
+    & Record<'submit_project(string,string,string,string,pay)uint64' | 'submit_project', {
+      argsObj: AarnaRegistryArgs['obj']['submit_project(string,string,string,string,pay)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['submit_project(string,string,string,string,pay)uint64']
+      returns: AarnaRegistryReturns['submit_project(string,string,string,string,pay)uint64']
+    }>
+    & Record<'submit_projects_batch((string,string,string,string)[],pay)uint64[]' | 'submit_projects_batch', {
+      argsObj: AarnaRegistryArgs['obj']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']
+      returns: AarnaRegistryReturns['submit_projects_batch((string,string,string,string)[],pay)uint64[]']
+    }>
+    & Record<'commit_evidence_root(uint64,byte[32],uint64,pay)void' | 'commit_evidence_root', {
+      argsObj: AarnaRegistryArgs['obj']['commit_evidence_root(uint64,byte[32],uint64,pay)void']
+      argsTuple: AarnaRegistryArgs['tuple']['commit_evidence_root(uint64,byte[32],uint64,pay)void']
+      returns: AarnaRegistryReturns['commit_evidence_root(uint64,byte[32],uint64,pay)void']
     }>
     & Record<'approve_project(uint64,uint64)void' | 'approve_project', {
       argsObj: AarnaRegistryArgs['obj']['approve_project(uint64,uint64)void']
@@ -269,21 +587,61 @@ export type AarnaRegistryTypes = {
       argsTuple: AarnaRegistryArgs['tuple']['issue_credits(uint64)uint64']
       returns: AarnaRegistryReturns['issue_credits(uint64)uint64']
     }>
-    & Record<'list_for_sale(uint64,uint64)uint64' | 'list_for_sale', {
-      argsObj: AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']
-      returns: AarnaRegistryReturns['list_for_sale(uint64,uint64)uint64']
+    & Record<'approve_projects_batch((uint64,uint64)[])void' | 'approve_projects_batch', {
+      argsObj: AarnaRegistryArgs['obj']['approve_projects_batch((uint64,uint64)[])void']
+      argsTuple: AarnaRegistryArgs['tuple']['approve_projects_batch((uint64,uint64)[])void']
+      returns: AarnaRegistryReturns['approve_projects_batch((uint64,uint64)[])void']
+    }>
+    & Record<'reject_projects_batch(uint64[])void' | 'reject_projects_batch', {
+      argsObj: AarnaRegistryArgs['obj']['reject_projects_batch(uint64[])void']
+      argsTuple: AarnaRegistryArgs['tuple']['reject_projects_batch(uint64[])void']
+      returns: AarnaRegistryReturns['reject_projects_batch(uint64[])void']
+    }>
+    & Record<'issue_credits_batch(uint64[])uint64' | 'issue_credits_batch', {
+      argsObj: AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64']
+      returns: AarnaRegistryReturns['issue_credits_batch(uint64[])uint64']
     }>
-    & Record<'buy_listing(uint64,pay)void' | 'buy_listing', {
-      argsObj: AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void']
-      argsTuple: AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']
-      returns: AarnaRegistryReturns['buy_listing(uint64,pay)void']
+    & Record<'list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64' | 'list_for_sale', {
+      argsObj: AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']
+      returns: AarnaRegistryReturns['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']
+    }>
+    & Record<'buy_listing(uint64,uint64,pay)void' | 'buy_listing', {
+      argsObj: AarnaRegistryArgs['obj']['buy_listing(uint64,uint64,pay)void']
+      argsTuple: AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64,pay)void']
+      returns: AarnaRegistryReturns['buy_listing(uint64,uint64,pay)void']
+    }>
+    & Record<'market_buy(uint64,uint64,uint64,pay)uint64' | 'market_buy', {
+      argsObj: AarnaRegistryArgs['obj']['market_buy(uint64,uint64,uint64,pay)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['market_buy(uint64,uint64,uint64,pay)uint64']
+      returns: AarnaRegistryReturns['market_buy(uint64,uint64,uint64,pay)uint64']
     }>
     & Record<'cancel_listing(uint64)void' | 'cancel_listing', {
       argsObj: AarnaRegistryArgs['obj']['cancel_listing(uint64)void']
       argsTuple: AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']
       returns: AarnaRegistryReturns['cancel_listing(uint64)void']
     }>
+    & Record<'sweep_expired(uint64[])uint64' | 'sweep_expired', {
+      argsObj: AarnaRegistryArgs['obj']['sweep_expired(uint64[])uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['sweep_expired(uint64[])uint64']
+      returns: AarnaRegistryReturns['sweep_expired(uint64[])uint64']
+    }>
+    & Record<'place_bid(uint64,uint64,uint64,uint64,pay)uint64' | 'place_bid', {
+      argsObj: AarnaRegistryArgs['obj']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']
+      returns: AarnaRegistryReturns['place_bid(uint64,uint64,uint64,uint64,pay)uint64']
+    }>
+    & Record<'cancel_bid(uint64)void' | 'cancel_bid', {
+      argsObj: AarnaRegistryArgs['obj']['cancel_bid(uint64)void']
+      argsTuple: AarnaRegistryArgs['tuple']['cancel_bid(uint64)void']
+      returns: AarnaRegistryReturns['cancel_bid(uint64)void']
+    }>
+    & Record<'claim()void' | 'claim', {
+      argsObj: AarnaRegistryArgs['obj']['claim()void']
+      argsTuple: AarnaRegistryArgs['tuple']['claim()void']
+      returns: AarnaRegistryReturns['claim()void']
+    }>
     & Record<'get_project_count()uint64' | 'get_project_count', {
       argsObj: AarnaRegistryArgs['obj']['get_project_count()uint64']
       argsTuple: AarnaRegistryArgs['tuple']['get_project_count()uint64']
@@ -309,65 +667,90 @@ export type AarnaRegistryTypes = {
       argsTuple: AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']
       returns: AarnaRegistryReturns['get_total_credits_issued()uint64']
     }>
-    & Record<'get_project_status(uint64)uint64' | 'get_project_status', {
-      argsObj: AarnaRegistryArgs['obj']['get_project_status(uint64)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']
-      returns: AarnaRegistryReturns['get_project_status(uint64)uint64']
+    & Record<'get_status_counts()uint64[5]' | 'get_status_counts', {
+      argsObj: AarnaRegistryArgs['obj']['get_status_counts()uint64[5]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']
+      returns: AarnaRegistryReturns['get_status_counts()uint64[5]']
     }>
-    & Record<'get_project_cid(uint64)string' | 'get_project_cid', {
-      argsObj: AarnaRegistryArgs['obj']['get_project_cid(uint64)string']
-      argsTuple: AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']
-      returns: AarnaRegistryReturns['get_project_cid(uint64)string']
+    & Record<'get_ecosystem_totals(string)(uint64[5],uint64)' | 'get_ecosystem_totals', {
+      argsObj: AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']
+      returns: AarnaRegistryReturns['get_ecosystem_totals(string)(uint64[5],uint64)']
+    }>
+    & Record<'get_project(uint64)(address,string,string,string,string,uint64,uint64)' | 'get_project', {
+      argsObj: AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']
+      returns: AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)']
+    }>
+    & Record<'get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]' | 'get_projects_page', {
+      argsObj: AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']
+      returns: AarnaRegistryReturns['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']
     }>
-    & Record<'get_project_name(uint64)string' | 'get_project_name', {
-      argsObj: AarnaRegistryArgs['obj']['get_project_name(uint64)string']
-      argsTuple: AarnaRegistryArgs['tuple']['get_project_name(uint64)string']
-      returns: AarnaRegistryReturns['get_project_name(uint64)string']
+    & Record<'get_pending(uint64,uint64)uint64[]' | 'get_pending', {
+      argsObj: AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']
+      returns: AarnaRegistryReturns['get_pending(uint64,uint64)uint64[]']
     }>
-    & Record<'get_project_location(uint64)string' | 'get_project_location', {
-      argsObj: AarnaRegistryArgs['obj']['get_project_location(uint64)string']
-      argsTuple: AarnaRegistryArgs['tuple']['get_project_location(uint64)string']
-      returns: AarnaRegistryReturns['get_project_location(uint64)string']
+    & Record<'get_account_projects(address,uint64,uint64)uint64[]' | 'get_account_projects', {
+      argsObj: AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']
+      returns: AarnaRegistryReturns['get_account_projects(address,uint64,uint64)uint64[]']
     }>
-    & Record<'get_project_credits(uint64)uint64' | 'get_project_credits', {
-      argsObj: AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']
-      returns: AarnaRegistryReturns['get_project_credits(uint64)uint64']
+    & Record<'get_account_listings(address,uint64,uint64)uint64[]' | 'get_account_listings', {
+      argsObj: AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']
+      returns: AarnaRegistryReturns['get_account_listings(address,uint64,uint64)uint64[]']
     }>
-    & Record<'get_project_submitter(uint64)address' | 'get_project_submitter', {
-      argsObj: AarnaRegistryArgs['obj']['get_project_submitter(uint64)address']
-      argsTuple: AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']
-      returns: AarnaRegistryReturns['get_project_submitter(uint64)address']
+    & Record<'find_project_by_cid(string)uint64' | 'find_project_by_cid', {
+      argsObj: AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64']
+      argsTuple: AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']
+      returns: AarnaRegistryReturns['find_project_by_cid(string)uint64']
+    }>
+    & Record<'get_evidence_root(uint64)(byte[32],uint64)' | 'get_evidence_root', {
+      argsObj: AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']
+      returns: AarnaRegistryReturns['get_evidence_root(uint64)(byte[32],uint64)']
+    }>
+    & Record<'verify_inclusion(uint64,byte[],byte[32][])bool' | 'verify_inclusion', {
+      argsObj: AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool']
+      argsTuple: AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']
+      returns: AarnaRegistryReturns['verify_inclusion(uint64,byte[],byte[32][])bool']
+    }>
+    & Record<'get_project_cid(uint64)string' | 'get_project_cid', {
+      argsObj: AarnaRegistryArgs['obj']['get_project_cid(uint64)string']
+      argsTuple: AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']
+      returns: AarnaRegistryReturns['get_project_cid(uint64)string']
     }>
-    & Record<'get_project_ecosystem(uint64)string' | 'get_project_ecosystem', {
-      argsObj: AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string']
-      argsTuple: AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']
-      returns: AarnaRegistryReturns['get_project_ecosystem(uint64)string']
+    & Record<'get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))' | 'get_market_stats', {
+      argsObj: AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']
+      argsTuple: AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']
+      returns: AarnaRegistryReturns['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']
     }>
     & Record<'get_listing_count()uint64' | 'get_listing_count', {
       argsObj: AarnaRegistryArgs['obj']['get_listing_count()uint64']
       argsTuple: AarnaRegistryArgs['tuple']['get_listing_count()uint64']
       returns: AarnaRegistryReturns['get_listing_count()uint64']
     }>
-    & Record<'get_listing_seller(uint64)address' | 'get_listing_seller', {
-      argsObj: AarnaRegistryArgs['obj']['get_listing_seller(uint64)address']
-      argsTuple: AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']
-      returns: AarnaRegistryReturns['get_listing_seller(uint64)address']
+    & Record<'get_best_ask()(uint64,address,uint64,uint64,uint64)' | 'get_best_ask', {
+      argsObj: AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']
+      returns: AarnaRegistryReturns['get_best_ask()(uint64,address,uint64,uint64,uint64)']
     }>
-    & Record<'get_listing_amount(uint64)uint64' | 'get_listing_amount', {
-      argsObj: AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']
-      returns: AarnaRegistryReturns['get_listing_amount(uint64)uint64']
+    & Record<'get_claim(address)(uint64,uint64)' | 'get_claim', {
+      argsObj: AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']
+      returns: AarnaRegistryReturns['get_claim(address)(uint64,uint64)']
     }>
-    & Record<'get_listing_price(uint64)uint64' | 'get_listing_price', {
-      argsObj: AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']
-      returns: AarnaRegistryReturns['get_listing_price(uint64)uint64']
+    & Record<'get_best_bid()(uint64,address,uint64,uint64)' | 'get_best_bid', {
+      argsObj: AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)']
+      argsTuple: AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']
+      returns: AarnaRegistryReturns['get_best_bid()(uint64,address,uint64,uint64)']
     }>
-    & Record<'get_listing_active(uint64)uint64' | 'get_listing_active', {
-      argsObj: AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64']
-      argsTuple: AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']
-      returns: AarnaRegistryReturns['get_listing_active(uint64)uint64']
+    & Record<'get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]' | 'get_active_listings', {
+      argsObj: AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']
+      argsTuple: AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']
+      returns: AarnaRegistryReturns['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']
     }>
   /**
    * Defines the shape of the state of the application.
@@ -380,54 +763,36 @@ export type AarnaRegistryTypes = {
         aarnaAsset: bigint
         projectCount: bigint
         totalCreditsIssued: bigint
-        p0Submitter: string
-        p0Cid: string
-        p0Name: string
-        p0Location: string
-        p0Ecosystem: string
-        p0Status: bigint
-        p0Credits: bigint
-        p1Submitter: string
-        p1Cid: string
-        p1Name: string
-        p1Location: string
-        p1Ecosystem: string
-        p1Status: bigint
-        p1Credits: bigint
-        p2Submitter: string
-        p2Cid: string
-        p2Name: string
-        p2Location: string
-        p2Ecosystem: string
-        p2Status: bigint
-        p2Credits: bigint
-        p3Submitter: string
-        p3Cid: string
-        p3Name: string
-        p3Location: string
-        p3Ecosystem: string
-        p3Status: bigint
-        p3Credits: bigint
+        statusCounts: [bigint, bigint, bigint, bigint, bigint]
+        pendingHead: bigint
+        pendingTail: bigint
         listingCount: bigint
-        l0Seller: string
-        l0Amount: bigint
-        l0Price: bigint
-        l0Active: bigint
-        l1Seller: string
-        l1Amount: bigint
-        l1Price: bigint
-        l1Active: bigint
-        l2Seller: string
-        l2Amount: bigint
-        l2Price: bigint
-        l2Active: bigint
-        l3Seller: string
-        l3Amount: bigint
-        l3Price: bigint
-        l3Active: bigint
+        bestAskId: bigint
+        bidCount: bigint
+        bestBidId: bigint
+        tradeVolume: bigint
+        tradeNotional: bigint
+        tradeCount: bigint
+        lastPrice: bigint
+        lastTradeTime: bigint
+        currentWindow: TradeWindow
+        previousWindow: TradeWindow
       }
       maps: {}
     }
+    box: {
+      keys: {}
+      maps: {
+        projects: Map<bigint | number, ProjectRecord>
+        ecosystemTotals: Map<bigint | number, ProjectTotals>
+        cidIndex: Map<Uint8Array, bigint>
+        evidenceRoots: Map<bigint | number, EvidenceRoot>
+        pendingQueue: Map<bigint | number, PendingLink>
+        listings: Map<bigint | number, Listing>
+        bids: Map<bigint | number, Bid>
+        claims: Map<string, Claim>
+      }
+    }
   }
 }
 
@@ -463,6 +828,11 @@ export type MethodReturn<TSignature extends AarnaRegistrySignatures> = AarnaRegi
  */
 export type GlobalKeysState = AarnaRegistryTypes['state']['global']['keys']
 
+/**
+ * Defines the shape of the box maps of the application.
+ */
+export type BoxMaps = AarnaRegistryTypes['state']['box']['maps']
+
 
 /**
  * Defines supported create method params for this smart contract
@@ -563,26 +933,62 @@ export abstract class AarnaRegistryParamsFactory {
     }
   }
   /**
-   * Constructs a no op call for the submit_project(string,string,string,string)uint64 ABI method
+   * Constructs a no op call for the submit_project(string,string,string,string,pay)uint64 ABI method
    *
   * Developer submits a new project for review.
-  Returns the project index (0-3).
+  `mbr_payment` must cover the MBR of the new project box. Extra opcode budget for packing the CID is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the project id.
 
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static submitProject(params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static submitProject(params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string,pay)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string,pay)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'submit_project(string,string,string,string)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.name, params.args.location, params.args.ecosystem, params.args.cid],
+      method: 'submit_project(string,string,string,string,pay)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.name, params.args.location, params.args.ecosystem, params.args.cid, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the submit_projects_batch((string,string,string,string)[],pay)uint64[] ABI method
+   *
+  * Submit up to MAX_SUBMIT_BATCH projects in one call; they get
+  consecutive ids. Each emits a ProjectSubmitted event, so batches of CIDs longer than a base32 CIDv1 may have to be smaller still to stay within MAX_LOG_BYTES. `mbr_payment` must cover the MBR of all new project boxes, and the box references for every new id must be spread over the group. Extra opcode budget is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the new project ids.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static submitProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['submit_projects_batch((string,string,string,string)[],pay)uint64[]'] | AarnaRegistryArgs['tuple']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'submit_projects_batch((string,string,string,string)[],pay)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.submissions, params.args.mbrPayment],
+    }
+  }
+  /**
+   * Constructs a no op call for the commit_evidence_root(uint64,byte[32],uint64,pay)void ABI method
+   *
+  * Submitter commits the Merkle root of a pending project's measurement
+  records, once. Records are hashed as leaves and paired as described at MERKLE_LEAF_PREFIX; `mbr_payment` must cover the MBR of the root box.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static commitEvidenceRoot(params: CallParams<AarnaRegistryArgs['obj']['commit_evidence_root(uint64,byte[32],uint64,pay)void'] | AarnaRegistryArgs['tuple']['commit_evidence_root(uint64,byte[32],uint64,pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'commit_evidence_root(uint64,byte[32],uint64,pay)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectId, params.args.root, params.args.leafCount, params.args.mbrPayment],
     }
   }
   /**
    * Constructs a no op call for the approve_project(uint64,uint64)void ABI method
    *
-   * Validator approves a project and assigns credit amount.
+  * Validator approves a project and assigns credit amount.
+  The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
@@ -597,7 +1003,9 @@ export abstract class AarnaRegistryParamsFactory {
   /**
    * Constructs a no op call for the reject_project(uint64)void ABI method
    *
-   * Validator rejects a pending project.
+  * Validator rejects a pending project.
+  The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
@@ -627,212 +1035,446 @@ export abstract class AarnaRegistryParamsFactory {
     }
   }
   /**
-   * Constructs a no op call for the list_for_sale(uint64,uint64)uint64 ABI method
+   * Constructs a no op call for the approve_projects_batch((uint64,uint64)[])void ABI method
    *
-  * List AARNA tokens for sale. Uses clawback to escrow tokens
-  from seller into the contract. Returns the listing index.
+  * Validator approves up to MAX_APPROVE_BATCH pending projects in one
+  call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
 
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static approveProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['approve_projects_batch((uint64,uint64)[])void'] | AarnaRegistryArgs['tuple']['approve_projects_batch((uint64,uint64)[])void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'list_for_sale(uint64,uint64)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.amount, params.args.pricePerToken],
+      method: 'approve_projects_batch((uint64,uint64)[])void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.approvals],
     }
   }
   /**
-   * Constructs a no op call for the buy_listing(uint64,pay)void ABI method
+   * Constructs a no op call for the reject_projects_batch(uint64[])void ABI method
    *
-  * Buy tokens from a listing. Buyer sends ALGO payment,
-  contract transfers escrowed tokens to buyer and forwards ALGO to seller.
+  * Validator rejects up to MAX_REJECT_BATCH pending projects in one
+  call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
 
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static rejectProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['reject_projects_batch(uint64[])void'] | AarnaRegistryArgs['tuple']['reject_projects_batch(uint64[])void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'buy_listing(uint64,pay)void' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.listingId, params.args.payment],
+      method: 'reject_projects_batch(uint64[])void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectIds],
     }
   }
   /**
-   * Constructs a no op call for the cancel_listing(uint64)void ABI method
+   * Constructs a no op call for the issue_credits_batch(uint64[])uint64 ABI method
    *
-   * Seller cancels their listing. Escrowed tokens returned.
+  * Validator issues credits for up to MAX_ISSUE_BATCH verified projects
+  in one call.
+  The ASA transfers are submitted as inner groups of up to 16 with a zero fee, so the outer transaction must pay for them through fee pooling. Extra opcode budget is drawn the same way. Submitter accounts and project boxes must be referenced across the group. Returns the number of credits issued by this call.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static cancelListing(params: CallParams<AarnaRegistryArgs['obj']['cancel_listing(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static issueCreditsBatch(params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'cancel_listing(uint64)void' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
+      method: 'issue_credits_batch(uint64[])uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectIds],
     }
   }
   /**
-   * Constructs a no op call for the get_project_count()uint64 ABI method
+   * Constructs a no op call for the list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64 ABI method
+   *
+  * List AARNA tokens for sale. Standing bids priced at or above
+  `price_per_token` are filled first, best price first, at the bid's price; tokens move by clawback straight to each bidder. Bids whose bidder has opted out of the token are closed and refunded on the way. Whatever is left is escrowed into the contract by clawback and listed, unless bids past `max_fills` still cross it, in which case it stays with the seller. Returns the listing id, or NO_LISTING if nothing was listed.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectCount(params: CallParams<AarnaRegistryArgs['obj']['get_project_count()uint64'] | AarnaRegistryArgs['tuple']['get_project_count()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_count()uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [],
+      method: 'list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.amount, params.args.pricePerToken, params.args.expiresRound, params.args.afterHint, params.args.maxFills, params.args.mbrPayment],
     }
   }
   /**
-   * Constructs a no op call for the get_asset_id()uint64 ABI method
+   * Constructs a no op call for the buy_listing(uint64,uint64,pay)void ABI method
+   *
+  * Buy `quantity` tokens from a listing. Buyer sends ALGO payment,
+  contract transfers escrowed tokens to buyer and forwards ALGO to seller. The listing stays open with the remainder; once sold out its box is deleted and the MBR returned to the seller.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getAssetId(params: CallParams<AarnaRegistryArgs['obj']['get_asset_id()uint64'] | AarnaRegistryArgs['tuple']['get_asset_id()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64,pay)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_asset_id()uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [],
+      method: 'buy_listing(uint64,uint64,pay)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.listingId, params.args.quantity, params.args.payment],
     }
   }
   /**
-   * Constructs a no op call for the get_admin()address ABI method
+   * Constructs a no op call for the market_buy(uint64,uint64,uint64,pay)uint64 ABI method
+   *
+  * Buy up to `max_quantity` tokens from the cheapest asks priced at or
+  below `max_price`, filling across at most `max_fills` listings (1 to MAX_FILLS) from the best ask down. Each seller is paid in turn, the tokens arrive in one transfer and any unspent payment is refunded. FILL_BUDGET opcodes per fill are drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the quantity bought.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getAdmin(params: CallParams<AarnaRegistryArgs['obj']['get_admin()address'] | AarnaRegistryArgs['tuple']['get_admin()address']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static marketBuy(params: CallParams<AarnaRegistryArgs['obj']['market_buy(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['market_buy(uint64,uint64,uint64,pay)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_admin()address' as const,
-      args: Array.isArray(params.args) ? params.args : [],
+      method: 'market_buy(uint64,uint64,uint64,pay)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.maxQuantity, params.args.maxPrice, params.args.maxFills, params.args.payment],
     }
   }
   /**
-   * Constructs a no op call for the get_validator()address ABI method
+   * Constructs a no op call for the cancel_listing(uint64)void ABI method
+   *
+  * Seller cancels their listing, expired or not. Escrowed tokens and
+  MBR returned.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getValidator(params: CallParams<AarnaRegistryArgs['obj']['get_validator()address'] | AarnaRegistryArgs['tuple']['get_validator()address']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static cancelListing(params: CallParams<AarnaRegistryArgs['obj']['cancel_listing(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_validator()address' as const,
-      args: Array.isArray(params.args) ? params.args : [],
+      method: 'cancel_listing(uint64)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
     }
   }
   /**
-   * Constructs a no op call for the get_total_credits_issued()uint64 ABI method
+   * Constructs a no op call for the sweep_expired(uint64[])uint64 ABI method
+   *
+  * Close any of `listing_ids` (up to MAX_SWEEP_BATCH) that have expired,
+  returning each escrow to its seller. Anyone may call this; the released MBR is paid to the caller. Ids that are not open and expired are skipped, so a sweep does not fail if another closed a listing first. Extra opcode budget is drawn from the group's fee credit. Returns the MBR paid out.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getTotalCreditsIssued(params: CallParams<AarnaRegistryArgs['obj']['get_total_credits_issued()uint64'] | AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static sweepExpired(params: CallParams<AarnaRegistryArgs['obj']['sweep_expired(uint64[])uint64'] | AarnaRegistryArgs['tuple']['sweep_expired(uint64[])uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_total_credits_issued()uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [],
+      method: 'sweep_expired(uint64[])uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.listingIds],
     }
   }
   /**
-   * Constructs a no op call for the get_project_status(uint64)uint64 ABI method
+   * Constructs a no op call for the place_bid(uint64,uint64,uint64,uint64,pay)uint64 ABI method
+   *
+  * Post a standing buy order for `quantity` tokens at up to `max_price`.
+  Asks already at or below `max_price` are bought straight away; the rest is escrowed (remaining quantity * max_price) and rests in the bid index until a matching list_for_sale fills it. If asks past `max_fills` still cross it, nothing rests and the unfilled part of the payment is refunded.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectStatus(params: CallParams<AarnaRegistryArgs['obj']['get_project_status(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static placeBid(params: CallParams<AarnaRegistryArgs['obj']['place_bid(uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_status(uint64)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+      method: 'place_bid(uint64,uint64,uint64,uint64,pay)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.quantity, params.args.maxPrice, params.args.afterHint, params.args.maxFills, params.args.payment],
     }
   }
   /**
-   * Constructs a no op call for the get_project_cid(uint64)string ABI method
+   * Constructs a no op call for the cancel_bid(uint64)void ABI method
+   *
+   * Bidder cancels their bid. Escrowed ALGO and MBR returned.
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectCid(params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static cancelBid(params: CallParams<AarnaRegistryArgs['obj']['cancel_bid(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_bid(uint64)void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_cid(uint64)string' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+      method: 'cancel_bid(uint64)void' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.bidId],
     }
   }
   /**
-   * Constructs a no op call for the get_project_name(uint64)string ABI method
+   * Constructs a no op call for the claim()void ABI method
+   *
+  * Withdraw the ALGO and AARNA tokens held for the caller because
+  paying them out failed, with the claim box's MBR. The caller must be opted in to the token if any tokens are held.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectName(params: CallParams<AarnaRegistryArgs['obj']['get_project_name(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_name(uint64)string']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static claim(params: CallParams<AarnaRegistryArgs['obj']['claim()void'] | AarnaRegistryArgs['tuple']['claim()void']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_name(uint64)string' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+      method: 'claim()void' as const,
+      args: Array.isArray(params.args) ? params.args : [],
     }
   }
   /**
-   * Constructs a no op call for the get_project_location(uint64)string ABI method
+   * Constructs a no op call for the get_project_count()uint64 ABI method
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectLocation(params: CallParams<AarnaRegistryArgs['obj']['get_project_location(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_location(uint64)string']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getProjectCount(params: CallParams<AarnaRegistryArgs['obj']['get_project_count()uint64'] | AarnaRegistryArgs['tuple']['get_project_count()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_location(uint64)string' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+      method: 'get_project_count()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
     }
   }
   /**
-   * Constructs a no op call for the get_project_credits(uint64)uint64 ABI method
+   * Constructs a no op call for the get_asset_id()uint64 ABI method
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectCredits(params: CallParams<AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getAssetId(params: CallParams<AarnaRegistryArgs['obj']['get_asset_id()uint64'] | AarnaRegistryArgs['tuple']['get_asset_id()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_credits(uint64)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+      method: 'get_asset_id()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
     }
   }
   /**
-   * Constructs a no op call for the get_project_submitter(uint64)address ABI method
+   * Constructs a no op call for the get_admin()address ABI method
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectSubmitter(params: CallParams<AarnaRegistryArgs['obj']['get_project_submitter(uint64)address'] | AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getAdmin(params: CallParams<AarnaRegistryArgs['obj']['get_admin()address'] | AarnaRegistryArgs['tuple']['get_admin()address']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_submitter(uint64)address' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+      method: 'get_admin()address' as const,
+      args: Array.isArray(params.args) ? params.args : [],
     }
   }
   /**
-   * Constructs a no op call for the get_project_ecosystem(uint64)string ABI method
+   * Constructs a no op call for the get_validator()address ABI method
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getProjectEcosystem(params: CallParams<AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getValidator(params: CallParams<AarnaRegistryArgs['obj']['get_validator()address'] | AarnaRegistryArgs['tuple']['get_validator()address']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_project_ecosystem(uint64)string' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+      method: 'get_validator()address' as const,
+      args: Array.isArray(params.args) ? params.args : [],
     }
   }
   /**
-   * Constructs a no op call for the get_listing_count()uint64 ABI method
+   * Constructs a no op call for the get_total_credits_issued()uint64 ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getTotalCreditsIssued(params: CallParams<AarnaRegistryArgs['obj']['get_total_credits_issued()uint64'] | AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_total_credits_issued()uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_status_counts()uint64[5] ABI method
+   *
+   * Project count per status code (index 0 unused).
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getStatusCounts(params: CallParams<AarnaRegistryArgs['obj']['get_status_counts()uint64[5]'] | AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_status_counts()uint64[5]' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_ecosystem_totals(string)(uint64[5],uint64) ABI method
+   *
+   * Per-status project counts and credits issued for one ecosystem.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getEcosystemTotals(params: CallParams<AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)'] | AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_ecosystem_totals(string)(uint64[5],uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.ecosystem],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_project(uint64)(address,string,string,string,string,uint64,uint64) ABI method
+   *
+   * Full project record in one call.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getProject(params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_project(uint64)(address,string,string,string,string,uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[] ABI method
+   *
+  * Projects `start` .. `start + count - 1` in one call.
+  The page is cut short if it would not fit in the ABI return value; the next page starts at `start + len(result)`.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getProjectsPage(params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_pending(uint64,uint64)uint64[] ABI method
+   *
+  * Ids of up to `count` pending projects, oldest first, skipping the
+  first `start` entries of the review queue. The walk never leaves the queue, so the cost depends only on how many projects are pending.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getPending(params: CallParams<AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_pending(uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_account_projects(address,uint64,uint64)uint64[] ABI method
+   *
+   * Ids of projects submitted by `account`, in submission order, paged.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getAccountProjects(params: CallParams<AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_account_projects(address,uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.account, params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_account_listings(address,uint64,uint64)uint64[] ABI method
+   *
+   * Ids of `account`'s open listings, paged (order not preserved).
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getAccountListings(params: CallParams<AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_account_listings(address,uint64,uint64)uint64[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.account, params.args.start, params.args.count],
+    }
+  }
+  /**
+   * Constructs a no op call for the find_project_by_cid(string)uint64 ABI method
+   *
+  * Id of the project whose evidence is `cid`, or NO_PROJECT if none.
+  The opcode budget for decoding a base32 CID is drawn from the group's fee credit when the call does not already have it.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static findProjectByCid(params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'find_project_by_cid(string)uint64' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.cid],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_evidence_root(uint64)(byte[32],uint64) ABI method
+   *
+   * The committed evidence root; `leaf_count` is 0 if there is none.
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getEvidenceRoot(params: CallParams<AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)'] | AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_evidence_root(uint64)(byte[32],uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+    }
+  }
+  /**
+   * Constructs a no op call for the verify_inclusion(uint64,byte[],byte[32][])bool ABI method
+   *
+  * Whether measurement record `leaf` is covered by the project's
+  evidence root, given the sibling hashes from the leaf up. Each level costs one sha256; extra opcode budget for deep proofs is drawn from the group's fee credit when the call does not already have it.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static verifyInclusion(params: CallParams<AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool'] | AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'verify_inclusion(uint64,byte[],byte[32][])bool' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectId, params.args.leaf, params.args.proof],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_project_cid(uint64)string ABI method
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getProjectCid(params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_project_cid(uint64)string' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.projectId],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64)) ABI method
+   *
+  * Running totals, VWAP and last price, plus the current and previous
+  STATS_WINDOW_SECONDS trade windows as of the latest block.
+
+   *
+   * @param params Parameters for the call
+   * @returns An `AppClientMethodCallParams` object for the call
+   */
+  static getMarketStats(params: CallParams<AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+    return {
+      ...params,
+      method: 'get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))' as const,
+      args: Array.isArray(params.args) ? params.args : [],
+    }
+  }
+  /**
+   * Constructs a no op call for the get_listing_count()uint64 ABI method
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
@@ -845,55 +1487,69 @@ export abstract class AarnaRegistryParamsFactory {
     }
   }
   /**
-   * Constructs a no op call for the get_listing_seller(uint64)address ABI method
+   * Constructs a no op call for the get_best_ask()(uint64,address,uint64,uint64,uint64) ABI method
+   *
+  * The cheapest active listing (oldest first among equal prices),
+  passing over expired listings not yet swept. With an empty order book, `listing_id` is NO_LISTING and `amount` 0.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getListingSeller(params: CallParams<AarnaRegistryArgs['obj']['get_listing_seller(uint64)address'] | AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getBestAsk(params: CallParams<AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_listing_seller(uint64)address' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
+      method: 'get_best_ask()(uint64,address,uint64,uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [],
     }
   }
   /**
-   * Constructs a no op call for the get_listing_amount(uint64)uint64 ABI method
+   * Constructs a no op call for the get_claim(address)(uint64,uint64) ABI method
+   *
+   * What the app holds for `account` to `claim`; zero if nothing.
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getListingAmount(params: CallParams<AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getClaim(params: CallParams<AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_listing_amount(uint64)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
+      method: 'get_claim(address)(uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.account],
     }
   }
   /**
-   * Constructs a no op call for the get_listing_price(uint64)uint64 ABI method
+   * Constructs a no op call for the get_best_bid()(uint64,address,uint64,uint64) ABI method
+   *
+  * The highest standing bid (oldest first among equal prices).
+  With no bids, `bid_id` is NO_BID and `quantity` 0.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getListingPrice(params: CallParams<AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getBestBid(params: CallParams<AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_listing_price(uint64)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
+      method: 'get_best_bid()(uint64,address,uint64,uint64)' as const,
+      args: Array.isArray(params.args) ? params.args : [],
     }
   }
   /**
-   * Constructs a no op call for the get_listing_active(uint64)uint64 ABI method
+   * Constructs a no op call for the get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[] ABI method
+   *
+  * Up to `count` active listings in ask order (cheapest first, oldest
+  first among equal prices), skipping the first `start`. The walk follows the ask index past expired listings not yet swept, so the cost depends only on how many listings are open. A page of up to MAX_LISTING_PAGE listings always fits the ABI return value; a longer one may be cut short, and the next page starts at `start + len(result)`.
+
    *
    * @param params Parameters for the call
    * @returns An `AppClientMethodCallParams` object for the call
    */
-  static getListingActive(params: CallParams<AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
+  static getActiveListings(params: CallParams<AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']> & CallOnComplete): AppClientMethodCallParams & CallOnComplete {
     return {
       ...params,
-      method: 'get_listing_active(uint64)uint64' as const,
-      args: Array.isArray(params.args) ? params.args : [params.args.listingId],
+      method: 'get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]' as const,
+      args: Array.isArray(params.args) ? params.args : [params.args.start, params.args.count],
     }
   }
 }
@@ -1182,23 +1838,53 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string,pay)uint64` ABI method.
      *
     * Developer submits a new project for review.
-    Returns the project index (0-3).
+    `mbr_payment` must cover the MBR of the new project box. Extra opcode budget for packing the CID is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the project id.
 
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    submitProject: (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    submitProject: (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string,pay)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.params.call(AarnaRegistryParamsFactory.submitProject(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `submit_projects_batch((string,string,string,string)[],pay)uint64[]` ABI method.
+     *
+    * Submit up to MAX_SUBMIT_BATCH projects in one call; they get
+    consecutive ids. Each emits a ProjectSubmitted event, so batches of CIDs longer than a base32 CIDv1 may have to be smaller still to stay within MAX_LOG_BYTES. `mbr_payment` must cover the MBR of all new project boxes, and the box references for every new id must be spread over the group. Extra opcode budget is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the new project ids.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    submitProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['submit_projects_batch((string,string,string,string)[],pay)uint64[]'] | AarnaRegistryArgs['tuple']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.submitProjectsBatch(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `commit_evidence_root(uint64,byte[32],uint64,pay)void` ABI method.
+     *
+    * Submitter commits the Merkle root of a pending project's measurement
+    records, once. Records are hashed as leaves and paired as described at MERKLE_LEAF_PREFIX; `mbr_payment` must cover the MBR of the root box.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    commitEvidenceRoot: (params: CallParams<AarnaRegistryArgs['obj']['commit_evidence_root(uint64,byte[32],uint64,pay)void'] | AarnaRegistryArgs['tuple']['commit_evidence_root(uint64,byte[32],uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.commitEvidenceRoot(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `approve_project(uint64,uint64)void` ABI method.
      *
-     * Validator approves a project and assigns credit amount.
+    * Validator approves a project and assigns credit amount.
+    The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
@@ -1210,7 +1896,9 @@ export class AarnaRegistryClient {
     /**
      * Makes a call to the AarnaRegistry smart contract using the `reject_project(uint64)void` ABI method.
      *
-     * Validator rejects a pending project.
+    * Validator rejects a pending project.
+    The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
@@ -1234,247 +1922,466 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `approve_projects_batch((uint64,uint64)[])void` ABI method.
      *
-    * List AARNA tokens for sale. Uses clawback to escrow tokens
-    from seller into the contract. Returns the listing index.
+    * Validator approves up to MAX_APPROVE_BATCH pending projects in one
+    call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
 
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.listForSale(params))
+    approveProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['approve_projects_batch((uint64,uint64)[])void'] | AarnaRegistryArgs['tuple']['approve_projects_batch((uint64,uint64)[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.approveProjectsBatch(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,pay)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `reject_projects_batch(uint64[])void` ABI method.
      *
-    * Buy tokens from a listing. Buyer sends ALGO payment,
-    contract transfers escrowed tokens to buyer and forwards ALGO to seller.
+    * Validator rejects up to MAX_REJECT_BATCH pending projects in one
+    call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
 
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.buyListing(params))
+    rejectProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['reject_projects_batch(uint64[])void'] | AarnaRegistryArgs['tuple']['reject_projects_batch(uint64[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.rejectProjectsBatch(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `issue_credits_batch(uint64[])uint64` ABI method.
      *
-     * Seller cancels their listing. Escrowed tokens returned.
+    * Validator issues credits for up to MAX_ISSUE_BATCH verified projects
+    in one call.
+    The ASA transfers are submitted as inner groups of up to 16 with a zero fee, so the outer transaction must pay for them through fee pooling. Extra opcode budget is drawn the same way. Submitter accounts and project boxes must be referenced across the group. Returns the number of credits issued by this call.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    cancelListing: (params: CallParams<AarnaRegistryArgs['obj']['cancel_listing(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.cancelListing(params))
+    issueCreditsBatch: (params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.issueCreditsBatch(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_count()uint64` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64` ABI method.
+     *
+    * List AARNA tokens for sale. Standing bids priced at or above
+    `price_per_token` are filled first, best price first, at the bid's price; tokens move by clawback straight to each bidder. Bids whose bidder has opted out of the token are closed and refunded on the way. Whatever is left is escrowed into the contract by clawback and listed, unless bids past `max_fills` still cross it, in which case it stays with the seller. Returns the listing id, or NO_LISTING if nothing was listed.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectCount: (params: CallParams<AarnaRegistryArgs['obj']['get_project_count()uint64'] | AarnaRegistryArgs['tuple']['get_project_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectCount(params))
+    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.listForSale(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_asset_id()uint64` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,uint64,pay)void` ABI method.
+     *
+    * Buy `quantity` tokens from a listing. Buyer sends ALGO payment,
+    contract transfers escrowed tokens to buyer and forwards ALGO to seller. The listing stays open with the remainder; once sold out its box is deleted and the MBR returned to the seller.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getAssetId: (params: CallParams<AarnaRegistryArgs['obj']['get_asset_id()uint64'] | AarnaRegistryArgs['tuple']['get_asset_id()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getAssetId(params))
+    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.buyListing(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_admin()address` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `market_buy(uint64,uint64,uint64,pay)uint64` ABI method.
+     *
+    * Buy up to `max_quantity` tokens from the cheapest asks priced at or
+    below `max_price`, filling across at most `max_fills` listings (1 to MAX_FILLS) from the best ask down. Each seller is paid in turn, the tokens arrive in one transfer and any unspent payment is refunded. FILL_BUDGET opcodes per fill are drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the quantity bought.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getAdmin: (params: CallParams<AarnaRegistryArgs['obj']['get_admin()address'] | AarnaRegistryArgs['tuple']['get_admin()address']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getAdmin(params))
+    marketBuy: (params: CallParams<AarnaRegistryArgs['obj']['market_buy(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['market_buy(uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.marketBuy(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_validator()address` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
+     *
+    * Seller cancels their listing, expired or not. Escrowed tokens and
+    MBR returned.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getValidator: (params: CallParams<AarnaRegistryArgs['obj']['get_validator()address'] | AarnaRegistryArgs['tuple']['get_validator()address']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getValidator(params))
+    cancelListing: (params: CallParams<AarnaRegistryArgs['obj']['cancel_listing(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.cancelListing(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_total_credits_issued()uint64` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `sweep_expired(uint64[])uint64` ABI method.
+     *
+    * Close any of `listing_ids` (up to MAX_SWEEP_BATCH) that have expired,
+    returning each escrow to its seller. Anyone may call this; the released MBR is paid to the caller. Ids that are not open and expired are skipped, so a sweep does not fail if another closed a listing first. Extra opcode budget is drawn from the group's fee credit. Returns the MBR paid out.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getTotalCreditsIssued: (params: CallParams<AarnaRegistryArgs['obj']['get_total_credits_issued()uint64'] | AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getTotalCreditsIssued(params))
+    sweepExpired: (params: CallParams<AarnaRegistryArgs['obj']['sweep_expired(uint64[])uint64'] | AarnaRegistryArgs['tuple']['sweep_expired(uint64[])uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.sweepExpired(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_status(uint64)uint64` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `place_bid(uint64,uint64,uint64,uint64,pay)uint64` ABI method.
+     *
+    * Post a standing buy order for `quantity` tokens at up to `max_price`.
+    Asks already at or below `max_price` are bought straight away; the rest is escrowed (remaining quantity * max_price) and rests in the bid index until a matching list_for_sale fills it. If asks past `max_fills` still cross it, nothing rests and the unfilled part of the payment is refunded.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectStatus: (params: CallParams<AarnaRegistryArgs['obj']['get_project_status(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectStatus(params))
+    placeBid: (params: CallParams<AarnaRegistryArgs['obj']['place_bid(uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.placeBid(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `cancel_bid(uint64)void` ABI method.
+     *
+     * Bidder cancels their bid. Escrowed ALGO and MBR returned.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectCid: (params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectCid(params))
+    cancelBid: (params: CallParams<AarnaRegistryArgs['obj']['cancel_bid(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_bid(uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.cancelBid(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_name(uint64)string` ABI method.
-     * 
-     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     * Makes a call to the AarnaRegistry smart contract using the `claim()void` ABI method.
+     *
+    * Withdraw the ALGO and AARNA tokens held for the caller because
+    paying them out failed, with the claim box's MBR. The caller must be opted in to the token if any tokens are held.
+
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectName: (params: CallParams<AarnaRegistryArgs['obj']['get_project_name(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_name(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectName(params))
+    claim: (params: CallParams<AarnaRegistryArgs['obj']['claim()void'] | AarnaRegistryArgs['tuple']['claim()void']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.claim(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_location(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_project_count()uint64` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectLocation: (params: CallParams<AarnaRegistryArgs['obj']['get_project_location(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_location(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectLocation(params))
+    getProjectCount: (params: CallParams<AarnaRegistryArgs['obj']['get_project_count()uint64'] | AarnaRegistryArgs['tuple']['get_project_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectCount(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_credits(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_asset_id()uint64` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectCredits: (params: CallParams<AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectCredits(params))
+    getAssetId: (params: CallParams<AarnaRegistryArgs['obj']['get_asset_id()uint64'] | AarnaRegistryArgs['tuple']['get_asset_id()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getAssetId(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_submitter(uint64)address` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_admin()address` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectSubmitter: (params: CallParams<AarnaRegistryArgs['obj']['get_project_submitter(uint64)address'] | AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectSubmitter(params))
+    getAdmin: (params: CallParams<AarnaRegistryArgs['obj']['get_admin()address'] | AarnaRegistryArgs['tuple']['get_admin()address']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getAdmin(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_ecosystem(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_validator()address` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getProjectEcosystem: (params: CallParams<AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectEcosystem(params))
+    getValidator: (params: CallParams<AarnaRegistryArgs['obj']['get_validator()address'] | AarnaRegistryArgs['tuple']['get_validator()address']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getValidator(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_total_credits_issued()uint64` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingCount(params))
-    },
+    getTotalCreditsIssued: (params: CallParams<AarnaRegistryArgs['obj']['get_total_credits_issued()uint64'] | AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getTotalCreditsIssued(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_status_counts()uint64[5]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Project count per status code (index 0 unused).
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getStatusCounts: (params: CallParams<AarnaRegistryArgs['obj']['get_status_counts()uint64[5]'] | AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getStatusCounts(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_ecosystem_totals(string)(uint64[5],uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Per-status project counts and credits issued for one ecosystem.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getEcosystemTotals: (params: CallParams<AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)'] | AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getEcosystemTotals(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_project(uint64)(address,string,string,string,string,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Full project record in one call.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getProject: (params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getProject(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Projects `start` .. `start + count - 1` in one call.
+    The page is cut short if it would not fit in the ABI return value; the next page starts at `start + len(result)`.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getProjectsPage: (params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_pending(uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Ids of up to `count` pending projects, oldest first, skipping the
+    first `start` entries of the review queue. The walk never leaves the queue, so the cost depends only on how many projects are pending.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getPending: (params: CallParams<AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getPending(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_account_projects(address,uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Ids of projects submitted by `account`, in submission order, paged.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getAccountProjects: (params: CallParams<AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getAccountProjects(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_account_listings(address,uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Ids of `account`'s open listings, paged (order not preserved).
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getAccountListings: (params: CallParams<AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getAccountListings(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Id of the project whose evidence is `cid`, or NO_PROJECT if none.
+    The opcode budget for decoding a base32 CID is drawn from the group's fee credit when the call does not already have it.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    findProjectByCid: (params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.findProjectByCid(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_evidence_root(uint64)(byte[32],uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * The committed evidence root; `leaf_count` is 0 if there is none.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getEvidenceRoot: (params: CallParams<AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)'] | AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getEvidenceRoot(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `verify_inclusion(uint64,byte[],byte[32][])bool` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Whether measurement record `leaf` is covered by the project's
+    evidence root, given the sibling hashes from the leaf up. Each level costs one sha256; extra opcode budget for deep proofs is drawn from the group's fee credit when the call does not already have it.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    verifyInclusion: (params: CallParams<AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool'] | AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.verifyInclusion(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getProjectCid: (params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getProjectCid(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Running totals, VWAP and last price, plus the current and previous
+    STATS_WINDOW_SECONDS trade windows as of the latest block.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getMarketStats: (params: CallParams<AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getMarketStats(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_listing_count()uint64` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call params
+     */
+    getListingCount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingCount(params))
+    },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_seller(uint64)address` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_ask()(uint64,address,uint64,uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * The cheapest active listing (oldest first among equal prices),
+    passing over expired listings not yet swept. With an empty order book, `listing_id` is NO_LISTING and `amount` 0.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getListingSeller: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_seller(uint64)address'] | AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingSeller(params))
+    getBestAsk: (params: CallParams<AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getBestAsk(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_amount(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_claim(address)(uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * What the app holds for `account` to `claim`; zero if nothing.
+     *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getListingAmount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingAmount(params))
+    getClaim: (params: CallParams<AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getClaim(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_price(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_bid()(uint64,address,uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * The highest standing bid (oldest first among equal prices).
+    With no bids, `bid_id` is NO_BID and `quantity` 0.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getListingPrice: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingPrice(params))
+    getBestBid: (params: CallParams<AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getBestBid(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_active(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Up to `count` active listings in ask order (cheapest first, oldest
+    first among equal prices), skipping the first `start`. The walk follows the ask index past expired listings not yet swept, so the cost depends only on how many listings are open. A page of up to MAX_LISTING_PAGE listings always fits the ABI return value; a longer one may be cut short, and the next page starts at `start + len(result)`.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call params
      */
-    getListingActive: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.params.call(AarnaRegistryParamsFactory.getListingActive(params))
+    getActiveListings: (params: CallParams<AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.params.call(AarnaRegistryParamsFactory.getActiveListings(params))
     },
 
   }
@@ -1532,23 +2439,53 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string,pay)uint64` ABI method.
      *
     * Developer submits a new project for review.
-    Returns the project index (0-3).
+    `mbr_payment` must cover the MBR of the new project box. Extra opcode budget for packing the CID is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the project id.
 
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    submitProject: (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    submitProject: (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string,pay)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.submitProject(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `submit_projects_batch((string,string,string,string)[],pay)uint64[]` ABI method.
+     *
+    * Submit up to MAX_SUBMIT_BATCH projects in one call; they get
+    consecutive ids. Each emits a ProjectSubmitted event, so batches of CIDs longer than a base32 CIDv1 may have to be smaller still to stay within MAX_LOG_BYTES. `mbr_payment` must cover the MBR of all new project boxes, and the box references for every new id must be spread over the group. Extra opcode budget is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the new project ids.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    submitProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['submit_projects_batch((string,string,string,string)[],pay)uint64[]'] | AarnaRegistryArgs['tuple']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.submitProjectsBatch(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `commit_evidence_root(uint64,byte[32],uint64,pay)void` ABI method.
+     *
+    * Submitter commits the Merkle root of a pending project's measurement
+    records, once. Records are hashed as leaves and paired as described at MERKLE_LEAF_PREFIX; `mbr_payment` must cover the MBR of the root box.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    commitEvidenceRoot: (params: CallParams<AarnaRegistryArgs['obj']['commit_evidence_root(uint64,byte[32],uint64,pay)void'] | AarnaRegistryArgs['tuple']['commit_evidence_root(uint64,byte[32],uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.commitEvidenceRoot(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `approve_project(uint64,uint64)void` ABI method.
      *
-     * Validator approves a project and assigns credit amount.
+    * Validator approves a project and assigns credit amount.
+    The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
@@ -1560,7 +2497,9 @@ export class AarnaRegistryClient {
     /**
      * Makes a call to the AarnaRegistry smart contract using the `reject_project(uint64)void` ABI method.
      *
-     * Validator rejects a pending project.
+    * Validator rejects a pending project.
+    The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
@@ -1584,37 +2523,96 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `approve_projects_batch((uint64,uint64)[])void` ABI method.
+     *
+    * Validator approves up to MAX_APPROVE_BATCH pending projects in one
+    call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    approveProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['approve_projects_batch((uint64,uint64)[])void'] | AarnaRegistryArgs['tuple']['approve_projects_batch((uint64,uint64)[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.approveProjectsBatch(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `reject_projects_batch(uint64[])void` ABI method.
+     *
+    * Validator rejects up to MAX_REJECT_BATCH pending projects in one
+    call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    rejectProjectsBatch: (params: CallParams<AarnaRegistryArgs['obj']['reject_projects_batch(uint64[])void'] | AarnaRegistryArgs['tuple']['reject_projects_batch(uint64[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.rejectProjectsBatch(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `issue_credits_batch(uint64[])uint64` ABI method.
+     *
+    * Validator issues credits for up to MAX_ISSUE_BATCH verified projects
+    in one call.
+    The ASA transfers are submitted as inner groups of up to 16 with a zero fee, so the outer transaction must pay for them through fee pooling. Extra opcode budget is drawn the same way. Submitter accounts and project boxes must be referenced across the group. Returns the number of credits issued by this call.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    issueCreditsBatch: (params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.issueCreditsBatch(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64` ABI method.
      *
-    * List AARNA tokens for sale. Uses clawback to escrow tokens
-    from seller into the contract. Returns the listing index.
+    * List AARNA tokens for sale. Standing bids priced at or above
+    `price_per_token` are filled first, best price first, at the bid's price; tokens move by clawback straight to each bidder. Bids whose bidder has opted out of the token are closed and refunded on the way. Whatever is left is escrowed into the contract by clawback and listed, unless bids past `max_fills` still cross it, in which case it stays with the seller. Returns the listing id, or NO_LISTING if nothing was listed.
 
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    listForSale: (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.listForSale(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,pay)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,uint64,pay)void` ABI method.
      *
-    * Buy tokens from a listing. Buyer sends ALGO payment,
-    contract transfers escrowed tokens to buyer and forwards ALGO to seller.
+    * Buy `quantity` tokens from a listing. Buyer sends ALGO payment,
+    contract transfers escrowed tokens to buyer and forwards ALGO to seller. The listing stays open with the remainder; once sold out its box is deleted and the MBR returned to the seller.
 
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+    buyListing: (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
       return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.buyListing(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `market_buy(uint64,uint64,uint64,pay)uint64` ABI method.
+     *
+    * Buy up to `max_quantity` tokens from the cheapest asks priced at or
+    below `max_price`, filling across at most `max_fills` listings (1 to MAX_FILLS) from the best ask down. Each seller is paid in turn, the tokens arrive in one transfer and any unspent payment is refunded. FILL_BUDGET opcodes per fill are drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the quantity bought.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    marketBuy: (params: CallParams<AarnaRegistryArgs['obj']['market_buy(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['market_buy(uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.marketBuy(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
      *
-     * Seller cancels their listing. Escrowed tokens returned.
+    * Seller cancels their listing, expired or not. Escrowed tokens and
+    MBR returned.
+
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
@@ -1623,6 +2621,60 @@ export class AarnaRegistryClient {
       return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.cancelListing(params))
     },
 
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `sweep_expired(uint64[])uint64` ABI method.
+     *
+    * Close any of `listing_ids` (up to MAX_SWEEP_BATCH) that have expired,
+    returning each escrow to its seller. Anyone may call this; the released MBR is paid to the caller. Ids that are not open and expired are skipped, so a sweep does not fail if another closed a listing first. Extra opcode budget is drawn from the group's fee credit. Returns the MBR paid out.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    sweepExpired: (params: CallParams<AarnaRegistryArgs['obj']['sweep_expired(uint64[])uint64'] | AarnaRegistryArgs['tuple']['sweep_expired(uint64[])uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.sweepExpired(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `place_bid(uint64,uint64,uint64,uint64,pay)uint64` ABI method.
+     *
+    * Post a standing buy order for `quantity` tokens at up to `max_price`.
+    Asks already at or below `max_price` are bought straight away; the rest is escrowed (remaining quantity * max_price) and rests in the bid index until a matching list_for_sale fills it. If asks past `max_fills` still cross it, nothing rests and the unfilled part of the payment is refunded.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    placeBid: (params: CallParams<AarnaRegistryArgs['obj']['place_bid(uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.placeBid(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `cancel_bid(uint64)void` ABI method.
+     *
+     * Bidder cancels their bid. Escrowed ALGO and MBR returned.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    cancelBid: (params: CallParams<AarnaRegistryArgs['obj']['cancel_bid(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_bid(uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.cancelBid(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `claim()void` ABI method.
+     *
+    * Withdraw the ALGO and AARNA tokens held for the caller because
+    paying them out failed, with the claim box's MBR. The caller must be opted in to the token if any tokens are held.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    claim: (params: CallParams<AarnaRegistryArgs['obj']['claim()void'] | AarnaRegistryArgs['tuple']['claim()void']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.claim(params))
+    },
+
     /**
      * Makes a call to the AarnaRegistry smart contract using the `get_project_count()uint64` ABI method.
      * 
@@ -1684,87 +2736,179 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_status(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_status_counts()uint64[5]` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * Project count per status code (index 0 unused).
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getProjectStatus: (params: CallParams<AarnaRegistryArgs['obj']['get_project_status(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectStatus(params))
+    getStatusCounts: (params: CallParams<AarnaRegistryArgs['obj']['get_status_counts()uint64[5]'] | AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getStatusCounts(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_ecosystem_totals(string)(uint64[5],uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * Per-status project counts and credits issued for one ecosystem.
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getProjectCid: (params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectCid(params))
+    getEcosystemTotals: (params: CallParams<AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)'] | AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getEcosystemTotals(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_project(uint64)(address,string,string,string,string,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Full project record in one call.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getProject: (params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProject(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Projects `start` .. `start + count - 1` in one call.
+    The page is cut short if it would not fit in the ABI return value; the next page starts at `start + len(result)`.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getProjectsPage: (params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_pending(uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Ids of up to `count` pending projects, oldest first, skipping the
+    first `start` entries of the review queue. The walk never leaves the queue, so the cost depends only on how many projects are pending.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getPending: (params: CallParams<AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getPending(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_account_projects(address,uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Ids of projects submitted by `account`, in submission order, paged.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getAccountProjects: (params: CallParams<AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getAccountProjects(params))
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_account_listings(address,uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Ids of `account`'s open listings, paged (order not preserved).
+     *
+     * @param params The params for the smart contract call
+     * @returns The call transaction
+     */
+    getAccountListings: (params: CallParams<AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getAccountListings(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_name(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Id of the project whose evidence is `cid`, or NO_PROJECT if none.
+    The opcode budget for decoding a base32 CID is drawn from the group's fee credit when the call does not already have it.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getProjectName: (params: CallParams<AarnaRegistryArgs['obj']['get_project_name(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_name(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectName(params))
+    findProjectByCid: (params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.findProjectByCid(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_location(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_evidence_root(uint64)(byte[32],uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * The committed evidence root; `leaf_count` is 0 if there is none.
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getProjectLocation: (params: CallParams<AarnaRegistryArgs['obj']['get_project_location(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_location(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectLocation(params))
+    getEvidenceRoot: (params: CallParams<AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)'] | AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getEvidenceRoot(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_credits(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `verify_inclusion(uint64,byte[],byte[32][])bool` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Whether measurement record `leaf` is covered by the project's
+    evidence root, given the sibling hashes from the leaf up. Each level costs one sha256; extra opcode budget for deep proofs is drawn from the group's fee credit when the call does not already have it.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getProjectCredits: (params: CallParams<AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectCredits(params))
+    verifyInclusion: (params: CallParams<AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool'] | AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.verifyInclusion(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_submitter(uint64)address` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getProjectSubmitter: (params: CallParams<AarnaRegistryArgs['obj']['get_project_submitter(uint64)address'] | AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectSubmitter(params))
+    getProjectCid: (params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectCid(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_ecosystem(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Running totals, VWAP and last price, plus the current and previous
+    STATS_WINDOW_SECONDS trade windows as of the latest block.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getProjectEcosystem: (params: CallParams<AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getProjectEcosystem(params))
+    getMarketStats: (params: CallParams<AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getMarketStats(params))
     },
 
     /**
@@ -1780,51 +2924,65 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_seller(uint64)address` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_ask()(uint64,address,uint64,uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * The cheapest active listing (oldest first among equal prices),
+    passing over expired listings not yet swept. With an empty order book, `listing_id` is NO_LISTING and `amount` 0.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getListingSeller: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_seller(uint64)address'] | AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingSeller(params))
+    getBestAsk: (params: CallParams<AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getBestAsk(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_amount(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_claim(address)(uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * What the app holds for `account` to `claim`; zero if nothing.
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getListingAmount: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingAmount(params))
+    getClaim: (params: CallParams<AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getClaim(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_price(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_bid()(uint64,address,uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * The highest standing bid (oldest first among equal prices).
+    With no bids, `bid_id` is NO_BID and `quantity` 0.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getListingPrice: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingPrice(params))
+    getBestBid: (params: CallParams<AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getBestBid(params))
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_active(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Up to `count` active listings in ask order (cheapest first, oldest
+    first among equal prices), skipping the first `start`. The walk follows the ask index past expired listings not yet swept, so the cost depends only on how many listings are open. A page of up to MAX_LISTING_PAGE listings always fits the ABI return value; a longer one may be cut short, and the next page starts at `start + len(result)`.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call transaction
      */
-    getListingActive: (params: CallParams<AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getListingActive(params))
+    getActiveListings: (params: CallParams<AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      return this.appClient.createTransaction.call(AarnaRegistryParamsFactory.getActiveListings(params))
     },
 
   }
@@ -1857,130 +3015,285 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `transfer_admin(address)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `transfer_admin(address)void` ABI method.
+     *
+     * Admin transfers ownership to a new admin account.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    transferAdmin: async (params: CallParams<AarnaRegistryArgs['obj']['transfer_admin(address)void'] | AarnaRegistryArgs['tuple']['transfer_admin(address)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.transferAdmin(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['transfer_admin(address)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `ensure_token()uint64` ABI method.
+     *
+    * Create the AARNA ASA if it doesn't exist.
+    Returns the ASA ID.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    ensureToken: async (params: CallParams<AarnaRegistryArgs['obj']['ensure_token()uint64'] | AarnaRegistryArgs['tuple']['ensure_token()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.ensureToken(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['ensure_token()uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string,pay)uint64` ABI method.
+     *
+    * Developer submits a new project for review.
+    `mbr_payment` must cover the MBR of the new project box. Extra opcode budget for packing the CID is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the project id.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    submitProject: async (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string,pay)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string,pay)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.submitProject(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['submit_project(string,string,string,string,pay)uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `submit_projects_batch((string,string,string,string)[],pay)uint64[]` ABI method.
+     *
+    * Submit up to MAX_SUBMIT_BATCH projects in one call; they get
+    consecutive ids. Each emits a ProjectSubmitted event, so batches of CIDs longer than a base32 CIDv1 may have to be smaller still to stay within MAX_LOG_BYTES. `mbr_payment` must cover the MBR of all new project boxes, and the box references for every new id must be spread over the group. Extra opcode budget is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the new project ids.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    submitProjectsBatch: async (params: CallParams<AarnaRegistryArgs['obj']['submit_projects_batch((string,string,string,string)[],pay)uint64[]'] | AarnaRegistryArgs['tuple']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.submitProjectsBatch(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['submit_projects_batch((string,string,string,string)[],pay)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `commit_evidence_root(uint64,byte[32],uint64,pay)void` ABI method.
+     *
+    * Submitter commits the Merkle root of a pending project's measurement
+    records, once. Records are hashed as leaves and paired as described at MERKLE_LEAF_PREFIX; `mbr_payment` must cover the MBR of the root box.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    commitEvidenceRoot: async (params: CallParams<AarnaRegistryArgs['obj']['commit_evidence_root(uint64,byte[32],uint64,pay)void'] | AarnaRegistryArgs['tuple']['commit_evidence_root(uint64,byte[32],uint64,pay)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.commitEvidenceRoot(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['commit_evidence_root(uint64,byte[32],uint64,pay)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `approve_project(uint64,uint64)void` ABI method.
+     *
+    * Validator approves a project and assigns credit amount.
+    The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    approveProject: async (params: CallParams<AarnaRegistryArgs['obj']['approve_project(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['approve_project(uint64,uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.approveProject(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['approve_project(uint64,uint64)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `reject_project(uint64)void` ABI method.
+     *
+    * Validator rejects a pending project.
+    The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    rejectProject: async (params: CallParams<AarnaRegistryArgs['obj']['reject_project(uint64)void'] | AarnaRegistryArgs['tuple']['reject_project(uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.rejectProject(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['reject_project(uint64)void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `issue_credits(uint64)uint64` ABI method.
+     *
+    * Validator issues AARNA tokens to submitter.
+    Status: 2 (verified) → 4 (issued). Prevents double-issuance.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    issueCredits: async (params: CallParams<AarnaRegistryArgs['obj']['issue_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['issue_credits(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.issueCredits(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['issue_credits(uint64)uint64'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `approve_projects_batch((uint64,uint64)[])void` ABI method.
+     *
+    * Validator approves up to MAX_APPROVE_BATCH pending projects in one
+    call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    approveProjectsBatch: async (params: CallParams<AarnaRegistryArgs['obj']['approve_projects_batch((uint64,uint64)[])void'] | AarnaRegistryArgs['tuple']['approve_projects_batch((uint64,uint64)[])void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.approveProjectsBatch(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['approve_projects_batch((uint64,uint64)[])void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `reject_projects_batch(uint64[])void` ABI method.
+     *
+    * Validator rejects up to MAX_REJECT_BATCH pending projects in one
+    call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    rejectProjectsBatch: async (params: CallParams<AarnaRegistryArgs['obj']['reject_projects_batch(uint64[])void'] | AarnaRegistryArgs['tuple']['reject_projects_batch(uint64[])void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.rejectProjectsBatch(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['reject_projects_batch(uint64[])void'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `issue_credits_batch(uint64[])uint64` ABI method.
      *
-     * Admin transfers ownership to a new admin account.
+    * Validator issues credits for up to MAX_ISSUE_BATCH verified projects
+    in one call.
+    The ASA transfers are submitted as inner groups of up to 16 with a zero fee, so the outer transaction must pay for them through fee pooling. Extra opcode budget is drawn the same way. Submitter accounts and project boxes must be referenced across the group. Returns the number of credits issued by this call.
+
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    transferAdmin: async (params: CallParams<AarnaRegistryArgs['obj']['transfer_admin(address)void'] | AarnaRegistryArgs['tuple']['transfer_admin(address)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.transferAdmin(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['transfer_admin(address)void'])}
+    issueCreditsBatch: async (params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.issueCreditsBatch(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['issue_credits_batch(uint64[])uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `ensure_token()uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64` ABI method.
      *
-    * Create the AARNA ASA if it doesn't exist.
-    Returns the ASA ID.
+    * List AARNA tokens for sale. Standing bids priced at or above
+    `price_per_token` are filled first, best price first, at the bid's price; tokens move by clawback straight to each bidder. Bids whose bidder has opted out of the token are closed and refunded on the way. Whatever is left is escrowed into the contract by clawback and listed, unless bids past `max_fills` still cross it, in which case it stays with the seller. Returns the listing id, or NO_LISTING if nothing was listed.
 
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    ensureToken: async (params: CallParams<AarnaRegistryArgs['obj']['ensure_token()uint64'] | AarnaRegistryArgs['tuple']['ensure_token()uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.ensureToken(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['ensure_token()uint64'])}
+    listForSale: async (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.listForSale(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `submit_project(string,string,string,string)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,uint64,pay)void` ABI method.
      *
-    * Developer submits a new project for review.
-    Returns the project index (0-3).
+    * Buy `quantity` tokens from a listing. Buyer sends ALGO payment,
+    contract transfers escrowed tokens to buyer and forwards ALGO to seller. The listing stays open with the remainder; once sold out its box is deleted and the MBR returned to the seller.
 
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    submitProject: async (params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.submitProject(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['submit_project(string,string,string,string)uint64'])}
+    buyListing: async (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64,pay)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.buyListing(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['buy_listing(uint64,uint64,pay)void'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `approve_project(uint64,uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `market_buy(uint64,uint64,uint64,pay)uint64` ABI method.
      *
-     * Validator approves a project and assigns credit amount.
+    * Buy up to `max_quantity` tokens from the cheapest asks priced at or
+    below `max_price`, filling across at most `max_fills` listings (1 to MAX_FILLS) from the best ask down. Each seller is paid in turn, the tokens arrive in one transfer and any unspent payment is refunded. FILL_BUDGET opcodes per fill are drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the quantity bought.
+
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    approveProject: async (params: CallParams<AarnaRegistryArgs['obj']['approve_project(uint64,uint64)void'] | AarnaRegistryArgs['tuple']['approve_project(uint64,uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.approveProject(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['approve_project(uint64,uint64)void'])}
+    marketBuy: async (params: CallParams<AarnaRegistryArgs['obj']['market_buy(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['market_buy(uint64,uint64,uint64,pay)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.marketBuy(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['market_buy(uint64,uint64,uint64,pay)uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `reject_project(uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
      *
-     * Validator rejects a pending project.
+    * Seller cancels their listing, expired or not. Escrowed tokens and
+    MBR returned.
+
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    rejectProject: async (params: CallParams<AarnaRegistryArgs['obj']['reject_project(uint64)void'] | AarnaRegistryArgs['tuple']['reject_project(uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.rejectProject(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['reject_project(uint64)void'])}
+    cancelListing: async (params: CallParams<AarnaRegistryArgs['obj']['cancel_listing(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.cancelListing(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['cancel_listing(uint64)void'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `issue_credits(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `sweep_expired(uint64[])uint64` ABI method.
      *
-    * Validator issues AARNA tokens to submitter.
-    Status: 2 (verified) → 4 (issued). Prevents double-issuance.
+    * Close any of `listing_ids` (up to MAX_SWEEP_BATCH) that have expired,
+    returning each escrow to its seller. Anyone may call this; the released MBR is paid to the caller. Ids that are not open and expired are skipped, so a sweep does not fail if another closed a listing first. Extra opcode budget is drawn from the group's fee credit. Returns the MBR paid out.
 
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    issueCredits: async (params: CallParams<AarnaRegistryArgs['obj']['issue_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['issue_credits(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.issueCredits(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['issue_credits(uint64)uint64'])}
+    sweepExpired: async (params: CallParams<AarnaRegistryArgs['obj']['sweep_expired(uint64[])uint64'] | AarnaRegistryArgs['tuple']['sweep_expired(uint64[])uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.sweepExpired(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['sweep_expired(uint64[])uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `list_for_sale(uint64,uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `place_bid(uint64,uint64,uint64,uint64,pay)uint64` ABI method.
      *
-    * List AARNA tokens for sale. Uses clawback to escrow tokens
-    from seller into the contract. Returns the listing index.
+    * Post a standing buy order for `quantity` tokens at up to `max_price`.
+    Asks already at or below `max_price` are bought straight away; the rest is escrowed (remaining quantity * max_price) and rests in the bid index until a matching list_for_sale fills it. If asks past `max_fills` still cross it, nothing rests and the unfilled part of the payment is refunded.
 
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    listForSale: async (params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.listForSale(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['list_for_sale(uint64,uint64)uint64'])}
+    placeBid: async (params: CallParams<AarnaRegistryArgs['obj']['place_bid(uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.placeBid(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['place_bid(uint64,uint64,uint64,uint64,pay)uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `buy_listing(uint64,pay)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `cancel_bid(uint64)void` ABI method.
      *
-    * Buy tokens from a listing. Buyer sends ALGO payment,
-    contract transfers escrowed tokens to buyer and forwards ALGO to seller.
-
+     * Bidder cancels their bid. Escrowed ALGO and MBR returned.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    buyListing: async (params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.buyListing(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['buy_listing(uint64,pay)void'])}
+    cancelBid: async (params: CallParams<AarnaRegistryArgs['obj']['cancel_bid(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_bid(uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.cancelBid(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['cancel_bid(uint64)void'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `cancel_listing(uint64)void` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `claim()void` ABI method.
      *
-     * Seller cancels their listing. Escrowed tokens returned.
+    * Withdraw the ALGO and AARNA tokens held for the caller because
+    paying them out failed, with the claim box's MBR. The caller must be opted in to the token if any tokens are held.
+
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    cancelListing: async (params: CallParams<AarnaRegistryArgs['obj']['cancel_listing(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.cancelListing(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['cancel_listing(uint64)void'])}
+    claim: async (params: CallParams<AarnaRegistryArgs['obj']['claim()void'] | AarnaRegistryArgs['tuple']['claim()void']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.claim(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['claim()void'])}
     },
 
     /**
@@ -2049,94 +3362,191 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_status(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_status_counts()uint64[5]` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * Project count per status code (index 0 unused).
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProjectStatus: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_status(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectStatus(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_status(uint64)uint64'])}
+    getStatusCounts: async (params: CallParams<AarnaRegistryArgs['obj']['get_status_counts()uint64[5]'] | AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getStatusCounts(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_status_counts()uint64[5]'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_ecosystem_totals(string)(uint64[5],uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * Per-status project counts and credits issued for one ecosystem.
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProjectCid: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectCid(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_cid(uint64)string'])}
+    getEcosystemTotals: async (params: CallParams<AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)'] | AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getEcosystemTotals(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_ecosystem_totals(string)(uint64[5],uint64)'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_project(uint64)(address,string,string,string,string,uint64,uint64)` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Full project record in one call.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getProject: async (params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProject(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Projects `start` .. `start + count - 1` in one call.
+    The page is cut short if it would not fit in the ABI return value; the next page starts at `start + len(result)`.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getProjectsPage: async (params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_pending(uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+    * Ids of up to `count` pending projects, oldest first, skipping the
+    first `start` entries of the review queue. The walk never leaves the queue, so the cost depends only on how many projects are pending.
+
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getPending: async (params: CallParams<AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getPending(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_pending(uint64,uint64)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_account_projects(address,uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Ids of projects submitted by `account`, in submission order, paged.
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getAccountProjects: async (params: CallParams<AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getAccountProjects(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_account_projects(address,uint64,uint64)uint64[]'])}
+    },
+
+    /**
+     * Makes a call to the AarnaRegistry smart contract using the `get_account_listings(address,uint64,uint64)uint64[]` ABI method.
+     * 
+     * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+     *
+     * Ids of `account`'s open listings, paged (order not preserved).
+     *
+     * @param params The params for the smart contract call
+     * @returns The call result
+     */
+    getAccountListings: async (params: CallParams<AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getAccountListings(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_account_listings(address,uint64,uint64)uint64[]'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_name(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Id of the project whose evidence is `cid`, or NO_PROJECT if none.
+    The opcode budget for decoding a base32 CID is drawn from the group's fee credit when the call does not already have it.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProjectName: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_name(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_name(uint64)string']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectName(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_name(uint64)string'])}
+    findProjectByCid: async (params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.findProjectByCid(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['find_project_by_cid(string)uint64'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_location(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_evidence_root(uint64)(byte[32],uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * The committed evidence root; `leaf_count` is 0 if there is none.
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProjectLocation: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_location(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_location(uint64)string']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectLocation(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_location(uint64)string'])}
+    getEvidenceRoot: async (params: CallParams<AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)'] | AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getEvidenceRoot(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_evidence_root(uint64)(byte[32],uint64)'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_credits(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `verify_inclusion(uint64,byte[],byte[32][])bool` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Whether measurement record `leaf` is covered by the project's
+    evidence root, given the sibling hashes from the leaf up. Each level costs one sha256; extra opcode budget for deep proofs is drawn from the group's fee credit when the call does not already have it.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProjectCredits: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectCredits(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_credits(uint64)uint64'])}
+    verifyInclusion: async (params: CallParams<AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool'] | AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.verifyInclusion(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['verify_inclusion(uint64,byte[],byte[32][])bool'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_submitter(uint64)address` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProjectSubmitter: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_submitter(uint64)address'] | AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectSubmitter(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_submitter(uint64)address'])}
+    getProjectCid: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectCid(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_cid(uint64)string'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_project_ecosystem(uint64)string` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Running totals, VWAP and last price, plus the current and previous
+    STATS_WINDOW_SECONDS trade windows as of the latest block.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getProjectEcosystem: async (params: CallParams<AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectEcosystem(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_project_ecosystem(uint64)string'])}
+    getMarketStats: async (params: CallParams<AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getMarketStats(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'])}
     },
 
     /**
@@ -2153,55 +3563,69 @@ export class AarnaRegistryClient {
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_seller(uint64)address` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_ask()(uint64,address,uint64,uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * The cheapest active listing (oldest first among equal prices),
+    passing over expired listings not yet swept. With an empty order book, `listing_id` is NO_LISTING and `amount` 0.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getListingSeller: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing_seller(uint64)address'] | AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingSeller(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing_seller(uint64)address'])}
+    getBestAsk: async (params: CallParams<AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getBestAsk(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_best_ask()(uint64,address,uint64,uint64,uint64)'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_amount(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_claim(address)(uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+     * What the app holds for `account` to `claim`; zero if nothing.
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getListingAmount: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingAmount(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing_amount(uint64)uint64'])}
+    getClaim: async (params: CallParams<AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getClaim(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_claim(address)(uint64,uint64)'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_price(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_best_bid()(uint64,address,uint64,uint64)` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * The highest standing bid (oldest first among equal prices).
+    With no bids, `bid_id` is NO_BID and `quantity` 0.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getListingPrice: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingPrice(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing_price(uint64)uint64'])}
+    getBestBid: async (params: CallParams<AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC} = {args: []}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getBestBid(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_best_bid()(uint64,address,uint64,uint64)'])}
     },
 
     /**
-     * Makes a call to the AarnaRegistry smart contract using the `get_listing_active(uint64)uint64` ABI method.
+     * Makes a call to the AarnaRegistry smart contract using the `get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]` ABI method.
      * 
      * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
      *
+    * Up to `count` active listings in ask order (cheapest first, oldest
+    first among equal prices), skipping the first `start`. The walk follows the ask index past expired listings not yet swept, so the cost depends only on how many listings are open. A page of up to MAX_LISTING_PAGE listings always fits the ABI return value; a longer one may be cut short, and the next page starts at `start + len(result)`.
+
+     *
      * @param params The params for the smart contract call
      * @returns The call result
      */
-    getListingActive: async (params: CallParams<AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
-      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingActive(params))
-      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_listing_active(uint64)uint64'])}
+    getActiveListings: async (params: CallParams<AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']> & SendParams & {onComplete?: OnApplicationComplete.NoOpOC}) => {
+      const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getActiveListings(params))
+      return {...result, return: result.return as unknown as (undefined | AarnaRegistryReturns['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'])}
     },
 
   }
@@ -2282,94 +3706,191 @@ export class AarnaRegistryClient {
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_status(uint64)uint64` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_status_counts()uint64[5]` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+   * Project count per status code (index 0 unused).
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getProjectStatus(params: CallParams<AarnaRegistryArgs['obj']['get_project_status(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectStatus(params))
-    return result.return as unknown as AarnaRegistryReturns['get_project_status(uint64)uint64']
+  async getStatusCounts(params: CallParams<AarnaRegistryArgs['obj']['get_status_counts()uint64[5]'] | AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']> = {args: []}) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getStatusCounts(params))
+    return result.return as unknown as AarnaRegistryReturns['get_status_counts()uint64[5]']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_ecosystem_totals(string)(uint64[5],uint64)` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+   * Per-status project counts and credits issued for one ecosystem.
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getProjectCid(params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectCid(params))
-    return result.return as unknown as AarnaRegistryReturns['get_project_cid(uint64)string']
+  async getEcosystemTotals(params: CallParams<AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)'] | AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getEcosystemTotals(params))
+    return result.return as unknown as AarnaRegistryReturns['get_ecosystem_totals(string)(uint64[5],uint64)']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project(uint64)(address,string,string,string,string,uint64,uint64)` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * Full project record in one call.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getProject(params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProject(params))
+    return result.return as unknown as AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+  * Projects `start` .. `start + count - 1` in one call.
+  The page is cut short if it would not fit in the ABI return value; the next page starts at `start + len(result)`.
+
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getProjectsPage(params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectsPage(params))
+    return result.return as unknown as AarnaRegistryReturns['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_pending(uint64,uint64)uint64[]` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+  * Ids of up to `count` pending projects, oldest first, skipping the
+  first `start` entries of the review queue. The walk never leaves the queue, so the cost depends only on how many projects are pending.
+
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getPending(params: CallParams<AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getPending(params))
+    return result.return as unknown as AarnaRegistryReturns['get_pending(uint64,uint64)uint64[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_account_projects(address,uint64,uint64)uint64[]` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * Ids of projects submitted by `account`, in submission order, paged.
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getAccountProjects(params: CallParams<AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getAccountProjects(params))
+    return result.return as unknown as AarnaRegistryReturns['get_account_projects(address,uint64,uint64)uint64[]']
+  }
+
+  /**
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_account_listings(address,uint64,uint64)uint64[]` ABI method.
+   * 
+   * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
+   *
+   * Ids of `account`'s open listings, paged (order not preserved).
+   *
+   * @param params The params for the smart contract call
+   * @returns The call result
+   */
+  async getAccountListings(params: CallParams<AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getAccountListings(params))
+    return result.return as unknown as AarnaRegistryReturns['get_account_listings(address,uint64,uint64)uint64[]']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_name(uint64)string` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `find_project_by_cid(string)uint64` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+  * Id of the project whose evidence is `cid`, or NO_PROJECT if none.
+  The opcode budget for decoding a base32 CID is drawn from the group's fee credit when the call does not already have it.
+
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getProjectName(params: CallParams<AarnaRegistryArgs['obj']['get_project_name(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_name(uint64)string']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectName(params))
-    return result.return as unknown as AarnaRegistryReturns['get_project_name(uint64)string']
+  async findProjectByCid(params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.findProjectByCid(params))
+    return result.return as unknown as AarnaRegistryReturns['find_project_by_cid(string)uint64']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_location(uint64)string` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_evidence_root(uint64)(byte[32],uint64)` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+   * The committed evidence root; `leaf_count` is 0 if there is none.
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getProjectLocation(params: CallParams<AarnaRegistryArgs['obj']['get_project_location(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_location(uint64)string']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectLocation(params))
-    return result.return as unknown as AarnaRegistryReturns['get_project_location(uint64)string']
+  async getEvidenceRoot(params: CallParams<AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)'] | AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getEvidenceRoot(params))
+    return result.return as unknown as AarnaRegistryReturns['get_evidence_root(uint64)(byte[32],uint64)']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_credits(uint64)uint64` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `verify_inclusion(uint64,byte[],byte[32][])bool` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+  * Whether measurement record `leaf` is covered by the project's
+  evidence root, given the sibling hashes from the leaf up. Each level costs one sha256; extra opcode budget for deep proofs is drawn from the group's fee credit when the call does not already have it.
+
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getProjectCredits(params: CallParams<AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectCredits(params))
-    return result.return as unknown as AarnaRegistryReturns['get_project_credits(uint64)uint64']
+  async verifyInclusion(params: CallParams<AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool'] | AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.verifyInclusion(params))
+    return result.return as unknown as AarnaRegistryReturns['verify_inclusion(uint64,byte[],byte[32][])bool']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_submitter(uint64)address` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_cid(uint64)string` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getProjectSubmitter(params: CallParams<AarnaRegistryArgs['obj']['get_project_submitter(uint64)address'] | AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectSubmitter(params))
-    return result.return as unknown as AarnaRegistryReturns['get_project_submitter(uint64)address']
+  async getProjectCid(params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectCid(params))
+    return result.return as unknown as AarnaRegistryReturns['get_project_cid(uint64)string']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_project_ecosystem(uint64)string` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+  * Running totals, VWAP and last price, plus the current and previous
+  STATS_WINDOW_SECONDS trade windows as of the latest block.
+
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getProjectEcosystem(params: CallParams<AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getProjectEcosystem(params))
-    return result.return as unknown as AarnaRegistryReturns['get_project_ecosystem(uint64)string']
+  async getMarketStats(params: CallParams<AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']> = {args: []}) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getMarketStats(params))
+    return result.return as unknown as AarnaRegistryReturns['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']
   }
 
   /**
@@ -2386,55 +3907,69 @@ export class AarnaRegistryClient {
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listing_seller(uint64)address` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_best_ask()(uint64,address,uint64,uint64,uint64)` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+  * The cheapest active listing (oldest first among equal prices),
+  passing over expired listings not yet swept. With an empty order book, `listing_id` is NO_LISTING and `amount` 0.
+
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getListingSeller(params: CallParams<AarnaRegistryArgs['obj']['get_listing_seller(uint64)address'] | AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingSeller(params))
-    return result.return as unknown as AarnaRegistryReturns['get_listing_seller(uint64)address']
+  async getBestAsk(params: CallParams<AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']> = {args: []}) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getBestAsk(params))
+    return result.return as unknown as AarnaRegistryReturns['get_best_ask()(uint64,address,uint64,uint64,uint64)']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listing_amount(uint64)uint64` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_claim(address)(uint64,uint64)` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+   * What the app holds for `account` to `claim`; zero if nothing.
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getListingAmount(params: CallParams<AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingAmount(params))
-    return result.return as unknown as AarnaRegistryReturns['get_listing_amount(uint64)uint64']
+  async getClaim(params: CallParams<AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getClaim(params))
+    return result.return as unknown as AarnaRegistryReturns['get_claim(address)(uint64,uint64)']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listing_price(uint64)uint64` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_best_bid()(uint64,address,uint64,uint64)` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+  * The highest standing bid (oldest first among equal prices).
+  With no bids, `bid_id` is NO_BID and `quantity` 0.
+
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getListingPrice(params: CallParams<AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingPrice(params))
-    return result.return as unknown as AarnaRegistryReturns['get_listing_price(uint64)uint64']
+  async getBestBid(params: CallParams<AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']> = {args: []}) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getBestBid(params))
+    return result.return as unknown as AarnaRegistryReturns['get_best_bid()(uint64,address,uint64,uint64)']
   }
 
   /**
-   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_listing_active(uint64)uint64` ABI method.
+   * Makes a readonly (simulated) call to the AarnaRegistry smart contract using the `get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]` ABI method.
    * 
    * This method is a readonly method; calling it with onComplete of NoOp will result in a simulated transaction rather than a real transaction.
    *
+  * Up to `count` active listings in ask order (cheapest first, oldest
+  first among equal prices), skipping the first `start`. The walk follows the ask index past expired listings not yet swept, so the cost depends only on how many listings are open. A page of up to MAX_LISTING_PAGE listings always fits the ABI return value; a longer one may be cut short, and the next page starts at `start + len(result)`.
+
+   *
    * @param params The params for the smart contract call
    * @returns The call result
    */
-  async getListingActive(params: CallParams<AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']>) {
-    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getListingActive(params))
-    return result.return as unknown as AarnaRegistryReturns['get_listing_active(uint64)uint64']
+  async getActiveListings(params: CallParams<AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']>) {
+    const result = await this.appClient.send.call(AarnaRegistryParamsFactory.getActiveListings(params))
+    return result.return as unknown as AarnaRegistryReturns['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']
   }
 
   /**
@@ -2455,254 +3990,208 @@ export class AarnaRegistryClient {
           validator: result.validator,
           aarnaAsset: result.aarna_asset,
           projectCount: result.project_count,
-          totalCreditsIssued: result.total_credits_issued,
-          p0Submitter: result.p0_submitter,
-          p0Cid: result.p0_cid,
-          p0Name: result.p0_name,
-          p0Location: result.p0_location,
-          p0Ecosystem: result.p0_ecosystem,
-          p0Status: result.p0_status,
-          p0Credits: result.p0_credits,
-          p1Submitter: result.p1_submitter,
-          p1Cid: result.p1_cid,
-          p1Name: result.p1_name,
-          p1Location: result.p1_location,
-          p1Ecosystem: result.p1_ecosystem,
-          p1Status: result.p1_status,
-          p1Credits: result.p1_credits,
-          p2Submitter: result.p2_submitter,
-          p2Cid: result.p2_cid,
-          p2Name: result.p2_name,
-          p2Location: result.p2_location,
-          p2Ecosystem: result.p2_ecosystem,
-          p2Status: result.p2_status,
-          p2Credits: result.p2_credits,
-          p3Submitter: result.p3_submitter,
-          p3Cid: result.p3_cid,
-          p3Name: result.p3_name,
-          p3Location: result.p3_location,
-          p3Ecosystem: result.p3_ecosystem,
-          p3Status: result.p3_status,
-          p3Credits: result.p3_credits,
-          listingCount: result.listing_count,
-          l0Seller: result.l0_seller,
-          l0Amount: result.l0_amount,
-          l0Price: result.l0_price,
-          l0Active: result.l0_active,
-          l1Seller: result.l1_seller,
-          l1Amount: result.l1_amount,
-          l1Price: result.l1_price,
-          l1Active: result.l1_active,
-          l2Seller: result.l2_seller,
-          l2Amount: result.l2_amount,
-          l2Price: result.l2_price,
-          l2Active: result.l2_active,
-          l3Seller: result.l3_seller,
-          l3Amount: result.l3_amount,
-          l3Price: result.l3_price,
-          l3Active: result.l3_active,
-        }
-      },
-      /**
-       * Get the current value of the admin key in global state
-       */
-      admin: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("admin")) as string | undefined },
-      /**
-       * Get the current value of the validator key in global state
-       */
-      validator: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("validator")) as string | undefined },
-      /**
-       * Get the current value of the aarna_asset key in global state
-       */
-      aarnaAsset: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("aarna_asset")) as bigint | undefined },
-      /**
-       * Get the current value of the project_count key in global state
-       */
-      projectCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("project_count")) as bigint | undefined },
-      /**
-       * Get the current value of the total_credits_issued key in global state
-       */
-      totalCreditsIssued: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("total_credits_issued")) as bigint | undefined },
-      /**
-       * Get the current value of the p0_submitter key in global state
-       */
-      p0Submitter: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p0_submitter")) as string | undefined },
-      /**
-       * Get the current value of the p0_cid key in global state
-       */
-      p0Cid: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p0_cid")) as string | undefined },
-      /**
-       * Get the current value of the p0_name key in global state
-       */
-      p0Name: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p0_name")) as string | undefined },
-      /**
-       * Get the current value of the p0_location key in global state
-       */
-      p0Location: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p0_location")) as string | undefined },
-      /**
-       * Get the current value of the p0_ecosystem key in global state
-       */
-      p0Ecosystem: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p0_ecosystem")) as string | undefined },
-      /**
-       * Get the current value of the p0_status key in global state
-       */
-      p0Status: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p0_status")) as bigint | undefined },
-      /**
-       * Get the current value of the p0_credits key in global state
-       */
-      p0Credits: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p0_credits")) as bigint | undefined },
-      /**
-       * Get the current value of the p1_submitter key in global state
-       */
-      p1Submitter: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p1_submitter")) as string | undefined },
-      /**
-       * Get the current value of the p1_cid key in global state
-       */
-      p1Cid: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p1_cid")) as string | undefined },
-      /**
-       * Get the current value of the p1_name key in global state
-       */
-      p1Name: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p1_name")) as string | undefined },
-      /**
-       * Get the current value of the p1_location key in global state
-       */
-      p1Location: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p1_location")) as string | undefined },
-      /**
-       * Get the current value of the p1_ecosystem key in global state
-       */
-      p1Ecosystem: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p1_ecosystem")) as string | undefined },
-      /**
-       * Get the current value of the p1_status key in global state
-       */
-      p1Status: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p1_status")) as bigint | undefined },
-      /**
-       * Get the current value of the p1_credits key in global state
-       */
-      p1Credits: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p1_credits")) as bigint | undefined },
-      /**
-       * Get the current value of the p2_submitter key in global state
-       */
-      p2Submitter: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p2_submitter")) as string | undefined },
-      /**
-       * Get the current value of the p2_cid key in global state
-       */
-      p2Cid: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p2_cid")) as string | undefined },
-      /**
-       * Get the current value of the p2_name key in global state
-       */
-      p2Name: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p2_name")) as string | undefined },
-      /**
-       * Get the current value of the p2_location key in global state
-       */
-      p2Location: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p2_location")) as string | undefined },
+          totalCreditsIssued: result.total_credits_issued,
+          statusCounts: result.status_counts,
+          pendingHead: result.pending_head,
+          pendingTail: result.pending_tail,
+          listingCount: result.listing_count,
+          bestAskId: result.best_ask_id,
+          bidCount: result.bid_count,
+          bestBidId: result.best_bid_id,
+          tradeVolume: result.trade_volume,
+          tradeNotional: result.trade_notional,
+          tradeCount: result.trade_count,
+          lastPrice: result.last_price,
+          lastTradeTime: result.last_trade_time,
+          currentWindow: result.current_window,
+          previousWindow: result.previous_window,
+        }
+      },
       /**
-       * Get the current value of the p2_ecosystem key in global state
+       * Get the current value of the admin key in global state
        */
-      p2Ecosystem: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p2_ecosystem")) as string | undefined },
+      admin: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("admin")) as string | undefined },
       /**
-       * Get the current value of the p2_status key in global state
+       * Get the current value of the validator key in global state
        */
-      p2Status: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p2_status")) as bigint | undefined },
+      validator: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("validator")) as string | undefined },
       /**
-       * Get the current value of the p2_credits key in global state
+       * Get the current value of the aarna_asset key in global state
        */
-      p2Credits: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p2_credits")) as bigint | undefined },
+      aarnaAsset: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("aarna_asset")) as bigint | undefined },
       /**
-       * Get the current value of the p3_submitter key in global state
+       * Get the current value of the project_count key in global state
        */
-      p3Submitter: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p3_submitter")) as string | undefined },
+      projectCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("project_count")) as bigint | undefined },
       /**
-       * Get the current value of the p3_cid key in global state
+       * Get the current value of the total_credits_issued key in global state
        */
-      p3Cid: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p3_cid")) as string | undefined },
+      totalCreditsIssued: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("total_credits_issued")) as bigint | undefined },
       /**
-       * Get the current value of the p3_name key in global state
+       * Get the current value of the status_counts key in global state
        */
-      p3Name: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p3_name")) as string | undefined },
+      statusCounts: async (): Promise<[bigint, bigint, bigint, bigint, bigint] | undefined> => { return (await this.appClient.state.global.getValue("status_counts")) as [bigint, bigint, bigint, bigint, bigint] | undefined },
       /**
-       * Get the current value of the p3_location key in global state
+       * Get the current value of the pending_head key in global state
        */
-      p3Location: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p3_location")) as string | undefined },
+      pendingHead: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("pending_head")) as bigint | undefined },
       /**
-       * Get the current value of the p3_ecosystem key in global state
+       * Get the current value of the pending_tail key in global state
        */
-      p3Ecosystem: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("p3_ecosystem")) as string | undefined },
+      pendingTail: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("pending_tail")) as bigint | undefined },
       /**
-       * Get the current value of the p3_status key in global state
+       * Get the current value of the listing_count key in global state
        */
-      p3Status: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p3_status")) as bigint | undefined },
+      listingCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("listing_count")) as bigint | undefined },
       /**
-       * Get the current value of the p3_credits key in global state
+       * Get the current value of the best_ask_id key in global state
        */
-      p3Credits: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("p3_credits")) as bigint | undefined },
+      bestAskId: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("best_ask_id")) as bigint | undefined },
       /**
-       * Get the current value of the listing_count key in global state
+       * Get the current value of the bid_count key in global state
        */
-      listingCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("listing_count")) as bigint | undefined },
+      bidCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("bid_count")) as bigint | undefined },
       /**
-       * Get the current value of the l0_seller key in global state
+       * Get the current value of the best_bid_id key in global state
        */
-      l0Seller: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("l0_seller")) as string | undefined },
+      bestBidId: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("best_bid_id")) as bigint | undefined },
       /**
-       * Get the current value of the l0_amount key in global state
+       * Get the current value of the trade_volume key in global state
        */
-      l0Amount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l0_amount")) as bigint | undefined },
+      tradeVolume: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("trade_volume")) as bigint | undefined },
       /**
-       * Get the current value of the l0_price key in global state
+       * Get the current value of the trade_notional key in global state
        */
-      l0Price: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l0_price")) as bigint | undefined },
+      tradeNotional: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("trade_notional")) as bigint | undefined },
       /**
-       * Get the current value of the l0_active key in global state
+       * Get the current value of the trade_count key in global state
        */
-      l0Active: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l0_active")) as bigint | undefined },
+      tradeCount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("trade_count")) as bigint | undefined },
       /**
-       * Get the current value of the l1_seller key in global state
+       * Get the current value of the last_price key in global state
        */
-      l1Seller: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("l1_seller")) as string | undefined },
+      lastPrice: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("last_price")) as bigint | undefined },
       /**
-       * Get the current value of the l1_amount key in global state
+       * Get the current value of the last_trade_time key in global state
        */
-      l1Amount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l1_amount")) as bigint | undefined },
+      lastTradeTime: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("last_trade_time")) as bigint | undefined },
       /**
-       * Get the current value of the l1_price key in global state
+       * Get the current value of the current_window key in global state
        */
-      l1Price: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l1_price")) as bigint | undefined },
+      currentWindow: async (): Promise<TradeWindow | undefined> => { return (await this.appClient.state.global.getValue("current_window")) as TradeWindow | undefined },
       /**
-       * Get the current value of the l1_active key in global state
+       * Get the current value of the previous_window key in global state
        */
-      l1Active: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l1_active")) as bigint | undefined },
+      previousWindow: async (): Promise<TradeWindow | undefined> => { return (await this.appClient.state.global.getValue("previous_window")) as TradeWindow | undefined },
+    },
+    /**
+     * Methods to access box state for the current AarnaRegistry app
+     */
+    box: {
       /**
-       * Get the current value of the l2_seller key in global state
+       * Get values from the projects map in box state
        */
-      l2Seller: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("l2_seller")) as string | undefined },
+      projects: {
+        /**
+         * Get all current values of the projects map in box state
+         */
+        getMap: async (): Promise<Map<bigint, ProjectRecord>> => { return (await this.appClient.state.box.getMap("projects")) as Map<bigint, ProjectRecord> },
+        /**
+         * Get a current value of the projects map by key from box state
+         */
+        value: async (key: bigint | number): Promise<ProjectRecord | undefined> => { return await this.appClient.state.box.getMapValue("projects", key) as ProjectRecord | undefined },
+      },
       /**
-       * Get the current value of the l2_amount key in global state
+       * Get values from the ecosystem_totals map in box state
        */
-      l2Amount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l2_amount")) as bigint | undefined },
+      ecosystemTotals: {
+        /**
+         * Get all current values of the ecosystem_totals map in box state
+         */
+        getMap: async (): Promise<Map<bigint, ProjectTotals>> => { return (await this.appClient.state.box.getMap("ecosystem_totals")) as Map<bigint, ProjectTotals> },
+        /**
+         * Get a current value of the ecosystem_totals map by key from box state
+         */
+        value: async (key: bigint | number): Promise<ProjectTotals | undefined> => { return await this.appClient.state.box.getMapValue("ecosystem_totals", key) as ProjectTotals | undefined },
+      },
       /**
-       * Get the current value of the l2_price key in global state
+       * Get values from the cid_index map in box state
        */
-      l2Price: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l2_price")) as bigint | undefined },
+      cidIndex: {
+        /**
+         * Get all current values of the cid_index map in box state
+         */
+        getMap: async (): Promise<Map<Uint8Array, bigint>> => { return (await this.appClient.state.box.getMap("cid_index")) as Map<Uint8Array, bigint> },
+        /**
+         * Get a current value of the cid_index map by key from box state
+         */
+        value: async (key: Uint8Array): Promise<bigint | undefined> => { return await this.appClient.state.box.getMapValue("cid_index", key) as bigint | undefined },
+      },
       /**
-       * Get the current value of the l2_active key in global state
+       * Get values from the evidence_roots map in box state
        */
-      l2Active: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l2_active")) as bigint | undefined },
+      evidenceRoots: {
+        /**
+         * Get all current values of the evidence_roots map in box state
+         */
+        getMap: async (): Promise<Map<bigint, EvidenceRoot>> => { return (await this.appClient.state.box.getMap("evidence_roots")) as Map<bigint, EvidenceRoot> },
+        /**
+         * Get a current value of the evidence_roots map by key from box state
+         */
+        value: async (key: bigint | number): Promise<EvidenceRoot | undefined> => { return await this.appClient.state.box.getMapValue("evidence_roots", key) as EvidenceRoot | undefined },
+      },
       /**
-       * Get the current value of the l3_seller key in global state
+       * Get values from the pending_queue map in box state
        */
-      l3Seller: async (): Promise<string | undefined> => { return (await this.appClient.state.global.getValue("l3_seller")) as string | undefined },
+      pendingQueue: {
+        /**
+         * Get all current values of the pending_queue map in box state
+         */
+        getMap: async (): Promise<Map<bigint, PendingLink>> => { return (await this.appClient.state.box.getMap("pending_queue")) as Map<bigint, PendingLink> },
+        /**
+         * Get a current value of the pending_queue map by key from box state
+         */
+        value: async (key: bigint | number): Promise<PendingLink | undefined> => { return await this.appClient.state.box.getMapValue("pending_queue", key) as PendingLink | undefined },
+      },
       /**
-       * Get the current value of the l3_amount key in global state
+       * Get values from the listings map in box state
        */
-      l3Amount: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l3_amount")) as bigint | undefined },
+      listings: {
+        /**
+         * Get all current values of the listings map in box state
+         */
+        getMap: async (): Promise<Map<bigint, Listing>> => { return (await this.appClient.state.box.getMap("listings")) as Map<bigint, Listing> },
+        /**
+         * Get a current value of the listings map by key from box state
+         */
+        value: async (key: bigint | number): Promise<Listing | undefined> => { return await this.appClient.state.box.getMapValue("listings", key) as Listing | undefined },
+      },
       /**
-       * Get the current value of the l3_price key in global state
+       * Get values from the bids map in box state
        */
-      l3Price: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l3_price")) as bigint | undefined },
+      bids: {
+        /**
+         * Get all current values of the bids map in box state
+         */
+        getMap: async (): Promise<Map<bigint, Bid>> => { return (await this.appClient.state.box.getMap("bids")) as Map<bigint, Bid> },
+        /**
+         * Get a current value of the bids map by key from box state
+         */
+        value: async (key: bigint | number): Promise<Bid | undefined> => { return await this.appClient.state.box.getMapValue("bids", key) as Bid | undefined },
+      },
       /**
-       * Get the current value of the l3_active key in global state
+       * Get values from the claims map in box state
        */
-      l3Active: async (): Promise<bigint | undefined> => { return (await this.appClient.state.global.getValue("l3_active")) as bigint | undefined },
+      claims: {
+        /**
+         * Get all current values of the claims map in box state
+         */
+        getMap: async (): Promise<Map<string, Claim>> => { return (await this.appClient.state.box.getMap("claims")) as Map<string, Claim> },
+        /**
+         * Get a current value of the claims map by key from box state
+         */
+        value: async (key: string): Promise<Claim | undefined> => { return await this.appClient.state.box.getMapValue("claims", key) as Claim | undefined },
+      },
     },
   }
 
@@ -2737,11 +4226,27 @@ export class AarnaRegistryClient {
         return this
       },
       /**
-       * Add a submit_project(string,string,string,string)uint64 method call against the AarnaRegistry contract
+       * Add a submit_project(string,string,string,string,pay)uint64 method call against the AarnaRegistry contract
        */
-      submitProject(params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+      submitProject(params: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string,pay)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.submitProject(params)))
-        resultMappers.push((v) => client.decodeReturnValue('submit_project(string,string,string,string)uint64', v))
+        resultMappers.push((v) => client.decodeReturnValue('submit_project(string,string,string,string,pay)uint64', v))
+        return this
+      },
+      /**
+       * Add a submit_projects_batch((string,string,string,string)[],pay)uint64[] method call against the AarnaRegistry contract
+       */
+      submitProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['submit_projects_batch((string,string,string,string)[],pay)uint64[]'] | AarnaRegistryArgs['tuple']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.submitProjectsBatch(params)))
+        resultMappers.push((v) => client.decodeReturnValue('submit_projects_batch((string,string,string,string)[],pay)uint64[]', v))
+        return this
+      },
+      /**
+       * Add a commit_evidence_root(uint64,byte[32],uint64,pay)void method call against the AarnaRegistry contract
+       */
+      commitEvidenceRoot(params: CallParams<AarnaRegistryArgs['obj']['commit_evidence_root(uint64,byte[32],uint64,pay)void'] | AarnaRegistryArgs['tuple']['commit_evidence_root(uint64,byte[32],uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.commitEvidenceRoot(params)))
+        resultMappers.push(undefined)
         return this
       },
       /**
@@ -2769,21 +4274,53 @@ export class AarnaRegistryClient {
         return this
       },
       /**
-       * Add a list_for_sale(uint64,uint64)uint64 method call against the AarnaRegistry contract
+       * Add a approve_projects_batch((uint64,uint64)[])void method call against the AarnaRegistry contract
+       */
+      approveProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['approve_projects_batch((uint64,uint64)[])void'] | AarnaRegistryArgs['tuple']['approve_projects_batch((uint64,uint64)[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.approveProjectsBatch(params)))
+        resultMappers.push(undefined)
+        return this
+      },
+      /**
+       * Add a reject_projects_batch(uint64[])void method call against the AarnaRegistry contract
+       */
+      rejectProjectsBatch(params: CallParams<AarnaRegistryArgs['obj']['reject_projects_batch(uint64[])void'] | AarnaRegistryArgs['tuple']['reject_projects_batch(uint64[])void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.rejectProjectsBatch(params)))
+        resultMappers.push(undefined)
+        return this
+      },
+      /**
+       * Add a issue_credits_batch(uint64[])uint64 method call against the AarnaRegistry contract
        */
-      listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+      issueCreditsBatch(params: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.issueCreditsBatch(params)))
+        resultMappers.push((v) => client.decodeReturnValue('issue_credits_batch(uint64[])uint64', v))
+        return this
+      },
+      /**
+       * Add a list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64 method call against the AarnaRegistry contract
+       */
+      listForSale(params: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.listForSale(params)))
-        resultMappers.push((v) => client.decodeReturnValue('list_for_sale(uint64,uint64)uint64', v))
+        resultMappers.push((v) => client.decodeReturnValue('list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64', v))
         return this
       },
       /**
-       * Add a buy_listing(uint64,pay)void method call against the AarnaRegistry contract
+       * Add a buy_listing(uint64,uint64,pay)void method call against the AarnaRegistry contract
        */
-      buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+      buyListing(params: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64,pay)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
         promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.buyListing(params)))
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a market_buy(uint64,uint64,uint64,pay)uint64 method call against the AarnaRegistry contract
+       */
+      marketBuy(params: CallParams<AarnaRegistryArgs['obj']['market_buy(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['market_buy(uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.marketBuy(params)))
+        resultMappers.push((v) => client.decodeReturnValue('market_buy(uint64,uint64,uint64,pay)uint64', v))
+        return this
+      },
       /**
        * Add a cancel_listing(uint64)void method call against the AarnaRegistry contract
        */
@@ -2792,6 +4329,38 @@ export class AarnaRegistryClient {
         resultMappers.push(undefined)
         return this
       },
+      /**
+       * Add a sweep_expired(uint64[])uint64 method call against the AarnaRegistry contract
+       */
+      sweepExpired(params: CallParams<AarnaRegistryArgs['obj']['sweep_expired(uint64[])uint64'] | AarnaRegistryArgs['tuple']['sweep_expired(uint64[])uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.sweepExpired(params)))
+        resultMappers.push((v) => client.decodeReturnValue('sweep_expired(uint64[])uint64', v))
+        return this
+      },
+      /**
+       * Add a place_bid(uint64,uint64,uint64,uint64,pay)uint64 method call against the AarnaRegistry contract
+       */
+      placeBid(params: CallParams<AarnaRegistryArgs['obj']['place_bid(uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.placeBid(params)))
+        resultMappers.push((v) => client.decodeReturnValue('place_bid(uint64,uint64,uint64,uint64,pay)uint64', v))
+        return this
+      },
+      /**
+       * Add a cancel_bid(uint64)void method call against the AarnaRegistry contract
+       */
+      cancelBid(params: CallParams<AarnaRegistryArgs['obj']['cancel_bid(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_bid(uint64)void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.cancelBid(params)))
+        resultMappers.push(undefined)
+        return this
+      },
+      /**
+       * Add a claim()void method call against the AarnaRegistry contract
+       */
+      claim(params: CallParams<AarnaRegistryArgs['obj']['claim()void'] | AarnaRegistryArgs['tuple']['claim()void']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.claim(params)))
+        resultMappers.push(undefined)
+        return this
+      },
       /**
        * Add a get_project_count()uint64 method call against the AarnaRegistry contract
        */
@@ -2833,59 +4402,99 @@ export class AarnaRegistryClient {
         return this
       },
       /**
-       * Add a get_project_status(uint64)uint64 method call against the AarnaRegistry contract
+       * Add a get_status_counts()uint64[5] method call against the AarnaRegistry contract
        */
-      getProjectStatus(params: CallParams<AarnaRegistryArgs['obj']['get_project_status(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectStatus(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_project_status(uint64)uint64', v))
+      getStatusCounts(params: CallParams<AarnaRegistryArgs['obj']['get_status_counts()uint64[5]'] | AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getStatusCounts(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_status_counts()uint64[5]', v))
         return this
       },
       /**
-       * Add a get_project_cid(uint64)string method call against the AarnaRegistry contract
+       * Add a get_ecosystem_totals(string)(uint64[5],uint64) method call against the AarnaRegistry contract
        */
-      getProjectCid(params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectCid(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_project_cid(uint64)string', v))
+      getEcosystemTotals(params: CallParams<AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)'] | AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getEcosystemTotals(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_ecosystem_totals(string)(uint64[5],uint64)', v))
+        return this
+      },
+      /**
+       * Add a get_project(uint64)(address,string,string,string,string,uint64,uint64) method call against the AarnaRegistry contract
+       */
+      getProject(params: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProject(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_project(uint64)(address,string,string,string,string,uint64,uint64)', v))
+        return this
+      },
+      /**
+       * Add a get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[] method call against the AarnaRegistry contract
+       */
+      getProjectsPage(params: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectsPage(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]', v))
+        return this
+      },
+      /**
+       * Add a get_pending(uint64,uint64)uint64[] method call against the AarnaRegistry contract
+       */
+      getPending(params: CallParams<AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getPending(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_pending(uint64,uint64)uint64[]', v))
+        return this
+      },
+      /**
+       * Add a get_account_projects(address,uint64,uint64)uint64[] method call against the AarnaRegistry contract
+       */
+      getAccountProjects(params: CallParams<AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getAccountProjects(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_account_projects(address,uint64,uint64)uint64[]', v))
+        return this
+      },
+      /**
+       * Add a get_account_listings(address,uint64,uint64)uint64[] method call against the AarnaRegistry contract
+       */
+      getAccountListings(params: CallParams<AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getAccountListings(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_account_listings(address,uint64,uint64)uint64[]', v))
         return this
       },
       /**
-       * Add a get_project_name(uint64)string method call against the AarnaRegistry contract
+       * Add a find_project_by_cid(string)uint64 method call against the AarnaRegistry contract
        */
-      getProjectName(params: CallParams<AarnaRegistryArgs['obj']['get_project_name(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_name(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectName(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_project_name(uint64)string', v))
+      findProjectByCid(params: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.findProjectByCid(params)))
+        resultMappers.push((v) => client.decodeReturnValue('find_project_by_cid(string)uint64', v))
         return this
       },
       /**
-       * Add a get_project_location(uint64)string method call against the AarnaRegistry contract
+       * Add a get_evidence_root(uint64)(byte[32],uint64) method call against the AarnaRegistry contract
        */
-      getProjectLocation(params: CallParams<AarnaRegistryArgs['obj']['get_project_location(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_location(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectLocation(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_project_location(uint64)string', v))
+      getEvidenceRoot(params: CallParams<AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)'] | AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getEvidenceRoot(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_evidence_root(uint64)(byte[32],uint64)', v))
         return this
       },
       /**
-       * Add a get_project_credits(uint64)uint64 method call against the AarnaRegistry contract
+       * Add a verify_inclusion(uint64,byte[],byte[32][])bool method call against the AarnaRegistry contract
        */
-      getProjectCredits(params: CallParams<AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectCredits(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_project_credits(uint64)uint64', v))
+      verifyInclusion(params: CallParams<AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool'] | AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.verifyInclusion(params)))
+        resultMappers.push((v) => client.decodeReturnValue('verify_inclusion(uint64,byte[],byte[32][])bool', v))
         return this
       },
       /**
-       * Add a get_project_submitter(uint64)address method call against the AarnaRegistry contract
+       * Add a get_project_cid(uint64)string method call against the AarnaRegistry contract
        */
-      getProjectSubmitter(params: CallParams<AarnaRegistryArgs['obj']['get_project_submitter(uint64)address'] | AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectSubmitter(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_project_submitter(uint64)address', v))
+      getProjectCid(params: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectCid(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_project_cid(uint64)string', v))
         return this
       },
       /**
-       * Add a get_project_ecosystem(uint64)string method call against the AarnaRegistry contract
+       * Add a get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64)) method call against the AarnaRegistry contract
        */
-      getProjectEcosystem(params: CallParams<AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getProjectEcosystem(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_project_ecosystem(uint64)string', v))
+      getMarketStats(params: CallParams<AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getMarketStats(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))', v))
         return this
       },
       /**
@@ -2897,35 +4506,35 @@ export class AarnaRegistryClient {
         return this
       },
       /**
-       * Add a get_listing_seller(uint64)address method call against the AarnaRegistry contract
+       * Add a get_best_ask()(uint64,address,uint64,uint64,uint64) method call against the AarnaRegistry contract
        */
-      getListingSeller(params: CallParams<AarnaRegistryArgs['obj']['get_listing_seller(uint64)address'] | AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getListingSeller(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_listing_seller(uint64)address', v))
+      getBestAsk(params: CallParams<AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getBestAsk(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_best_ask()(uint64,address,uint64,uint64,uint64)', v))
         return this
       },
       /**
-       * Add a get_listing_amount(uint64)uint64 method call against the AarnaRegistry contract
+       * Add a get_claim(address)(uint64,uint64) method call against the AarnaRegistry contract
        */
-      getListingAmount(params: CallParams<AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getListingAmount(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_listing_amount(uint64)uint64', v))
+      getClaim(params: CallParams<AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getClaim(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_claim(address)(uint64,uint64)', v))
         return this
       },
       /**
-       * Add a get_listing_price(uint64)uint64 method call against the AarnaRegistry contract
+       * Add a get_best_bid()(uint64,address,uint64,uint64) method call against the AarnaRegistry contract
        */
-      getListingPrice(params: CallParams<AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getListingPrice(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_listing_price(uint64)uint64', v))
+      getBestBid(params: CallParams<AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getBestBid(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_best_bid()(uint64,address,uint64,uint64)', v))
         return this
       },
       /**
-       * Add a get_listing_active(uint64)uint64 method call against the AarnaRegistry contract
+       * Add a get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[] method call against the AarnaRegistry contract
        */
-      getListingActive(params: CallParams<AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
-        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getListingActive(params)))
-        resultMappers.push((v) => client.decodeReturnValue('get_listing_active(uint64)uint64', v))
+      getActiveListings(params: CallParams<AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']> & {onComplete?: OnApplicationComplete.NoOpOC}) {
+        promiseChain = promiseChain.then(async () => composer.addAppCallMethodCall(await client.params.getActiveListings(params)))
+        resultMappers.push((v) => client.decodeReturnValue('get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]', v))
         return this
       },
       /**
@@ -2999,22 +4608,50 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   ensureToken(params?: CallParams<AarnaRegistryArgs['obj']['ensure_token()uint64'] | AarnaRegistryArgs['tuple']['ensure_token()uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['ensure_token()uint64'] | undefined]>
 
   /**
-   * Calls the submit_project(string,string,string,string)uint64 ABI method.
+   * Calls the submit_project(string,string,string,string,pay)uint64 ABI method.
    *
   * Developer submits a new project for review.
-  Returns the project index (0-3).
+  `mbr_payment` must cover the MBR of the new project box. Extra opcode budget for packing the CID is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the project id.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  submitProject(params?: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string,pay)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string,pay)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['submit_project(string,string,string,string,pay)uint64'] | undefined]>
+
+  /**
+   * Calls the submit_projects_batch((string,string,string,string)[],pay)uint64[] ABI method.
+   *
+  * Submit up to MAX_SUBMIT_BATCH projects in one call; they get
+  consecutive ids. Each emits a ProjectSubmitted event, so batches of CIDs longer than a base32 CIDv1 may have to be smaller still to stay within MAX_LOG_BYTES. `mbr_payment` must cover the MBR of all new project boxes, and the box references for every new id must be spread over the group. Extra opcode budget is drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the new project ids.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  submitProjectsBatch(params?: CallParams<AarnaRegistryArgs['obj']['submit_projects_batch((string,string,string,string)[],pay)uint64[]'] | AarnaRegistryArgs['tuple']['submit_projects_batch((string,string,string,string)[],pay)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['submit_projects_batch((string,string,string,string)[],pay)uint64[]'] | undefined]>
+
+  /**
+   * Calls the commit_evidence_root(uint64,byte[32],uint64,pay)void ABI method.
+   *
+  * Submitter commits the Merkle root of a pending project's measurement
+  records, once. Records are hashed as leaves and paired as described at MERKLE_LEAF_PREFIX; `mbr_payment` must cover the MBR of the root box.
 
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  submitProject(params?: CallParams<AarnaRegistryArgs['obj']['submit_project(string,string,string,string)uint64'] | AarnaRegistryArgs['tuple']['submit_project(string,string,string,string)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['submit_project(string,string,string,string)uint64'] | undefined]>
+  commitEvidenceRoot(params?: CallParams<AarnaRegistryArgs['obj']['commit_evidence_root(uint64,byte[32],uint64,pay)void'] | AarnaRegistryArgs['tuple']['commit_evidence_root(uint64,byte[32],uint64,pay)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['commit_evidence_root(uint64,byte[32],uint64,pay)void'] | undefined]>
 
   /**
    * Calls the approve_project(uint64,uint64)void ABI method.
    *
-   * Validator approves a project and assigns credit amount.
+  * Validator approves a project and assigns credit amount.
+  The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
@@ -3025,7 +4662,9 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   /**
    * Calls the reject_project(uint64)void ABI method.
    *
-   * Validator rejects a pending project.
+  * Validator rejects a pending project.
+  The project leaves the review queue, and an inner payment with a zero fee refunds the queue entry's MBR to the submitter. The outer transaction pays that fee (one extra minimum fee) and must reference the submitter's account.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
@@ -3047,35 +4686,90 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   issueCredits(params?: CallParams<AarnaRegistryArgs['obj']['issue_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['issue_credits(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['issue_credits(uint64)uint64'] | undefined]>
 
   /**
-   * Calls the list_for_sale(uint64,uint64)uint64 ABI method.
+   * Calls the approve_projects_batch((uint64,uint64)[])void ABI method.
+   *
+  * Validator approves up to MAX_APPROVE_BATCH pending projects in one
+  call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  approveProjectsBatch(params?: CallParams<AarnaRegistryArgs['obj']['approve_projects_batch((uint64,uint64)[])void'] | AarnaRegistryArgs['tuple']['approve_projects_batch((uint64,uint64)[])void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['approve_projects_batch((uint64,uint64)[])void'] | undefined]>
+
+  /**
+   * Calls the reject_projects_batch(uint64[])void ABI method.
+   *
+  * Validator rejects up to MAX_REJECT_BATCH pending projects in one
+  call. Each project's MBR refund is a zero-fee inner payment to its submitter; those fees and the extra opcode budget are drawn from the group's fee credit. Submitter accounts must be referenced across the group.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  rejectProjectsBatch(params?: CallParams<AarnaRegistryArgs['obj']['reject_projects_batch(uint64[])void'] | AarnaRegistryArgs['tuple']['reject_projects_batch(uint64[])void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['reject_projects_batch(uint64[])void'] | undefined]>
+
+  /**
+   * Calls the issue_credits_batch(uint64[])uint64 ABI method.
+   *
+  * Validator issues credits for up to MAX_ISSUE_BATCH verified projects
+  in one call.
+  The ASA transfers are submitted as inner groups of up to 16 with a zero fee, so the outer transaction must pay for them through fee pooling. Extra opcode budget is drawn the same way. Submitter accounts and project boxes must be referenced across the group. Returns the number of credits issued by this call.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  issueCreditsBatch(params?: CallParams<AarnaRegistryArgs['obj']['issue_credits_batch(uint64[])uint64'] | AarnaRegistryArgs['tuple']['issue_credits_batch(uint64[])uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['issue_credits_batch(uint64[])uint64'] | undefined]>
+
+  /**
+   * Calls the list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64 ABI method.
+   *
+  * List AARNA tokens for sale. Standing bids priced at or above
+  `price_per_token` are filled first, best price first, at the bid's price; tokens move by clawback straight to each bidder. Bids whose bidder has opted out of the token are closed and refunded on the way. Whatever is left is escrowed into the contract by clawback and listed, unless bids past `max_fills` still cross it, in which case it stays with the seller. Returns the listing id, or NO_LISTING if nothing was listed.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  listForSale(params?: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['list_for_sale(uint64,uint64,uint64,uint64,uint64,pay)uint64'] | undefined]>
+
+  /**
+   * Calls the buy_listing(uint64,uint64,pay)void ABI method.
    *
-  * List AARNA tokens for sale. Uses clawback to escrow tokens
-  from seller into the contract. Returns the listing index.
+  * Buy `quantity` tokens from a listing. Buyer sends ALGO payment,
+  contract transfers escrowed tokens to buyer and forwards ALGO to seller. The listing stays open with the remainder; once sold out its box is deleted and the MBR returned to the seller.
 
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  listForSale(params?: CallParams<AarnaRegistryArgs['obj']['list_for_sale(uint64,uint64)uint64'] | AarnaRegistryArgs['tuple']['list_for_sale(uint64,uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['list_for_sale(uint64,uint64)uint64'] | undefined]>
+  buyListing(params?: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,uint64,pay)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['buy_listing(uint64,uint64,pay)void'] | undefined]>
 
   /**
-   * Calls the buy_listing(uint64,pay)void ABI method.
+   * Calls the market_buy(uint64,uint64,uint64,pay)uint64 ABI method.
    *
-  * Buy tokens from a listing. Buyer sends ALGO payment,
-  contract transfers escrowed tokens to buyer and forwards ALGO to seller.
+  * Buy up to `max_quantity` tokens from the cheapest asks priced at or
+  below `max_price`, filling across at most `max_fills` listings (1 to MAX_FILLS) from the best ask down. Each seller is paid in turn, the tokens arrive in one transfer and any unspent payment is refunded. FILL_BUDGET opcodes per fill are drawn from the group's fee credit, so the outer transaction must cover the resulting inner fees. Returns the quantity bought.
 
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  buyListing(params?: CallParams<AarnaRegistryArgs['obj']['buy_listing(uint64,pay)void'] | AarnaRegistryArgs['tuple']['buy_listing(uint64,pay)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['buy_listing(uint64,pay)void'] | undefined]>
+  marketBuy(params?: CallParams<AarnaRegistryArgs['obj']['market_buy(uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['market_buy(uint64,uint64,uint64,pay)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['market_buy(uint64,uint64,uint64,pay)uint64'] | undefined]>
 
   /**
    * Calls the cancel_listing(uint64)void ABI method.
    *
-   * Seller cancels their listing. Escrowed tokens returned.
+  * Seller cancels their listing, expired or not. Escrowed tokens and
+  MBR returned.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
@@ -3083,6 +4777,56 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
    */
   cancelListing(params?: CallParams<AarnaRegistryArgs['obj']['cancel_listing(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_listing(uint64)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['cancel_listing(uint64)void'] | undefined]>
 
+  /**
+   * Calls the sweep_expired(uint64[])uint64 ABI method.
+   *
+  * Close any of `listing_ids` (up to MAX_SWEEP_BATCH) that have expired,
+  returning each escrow to its seller. Anyone may call this; the released MBR is paid to the caller. Ids that are not open and expired are skipped, so a sweep does not fail if another closed a listing first. Extra opcode budget is drawn from the group's fee credit. Returns the MBR paid out.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  sweepExpired(params?: CallParams<AarnaRegistryArgs['obj']['sweep_expired(uint64[])uint64'] | AarnaRegistryArgs['tuple']['sweep_expired(uint64[])uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['sweep_expired(uint64[])uint64'] | undefined]>
+
+  /**
+   * Calls the place_bid(uint64,uint64,uint64,uint64,pay)uint64 ABI method.
+   *
+  * Post a standing buy order for `quantity` tokens at up to `max_price`.
+  Asks already at or below `max_price` are bought straight away; the rest is escrowed (remaining quantity * max_price) and rests in the bid index until a matching list_for_sale fills it. If asks past `max_fills` still cross it, nothing rests and the unfilled part of the payment is refunded.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  placeBid(params?: CallParams<AarnaRegistryArgs['obj']['place_bid(uint64,uint64,uint64,uint64,pay)uint64'] | AarnaRegistryArgs['tuple']['place_bid(uint64,uint64,uint64,uint64,pay)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['place_bid(uint64,uint64,uint64,uint64,pay)uint64'] | undefined]>
+
+  /**
+   * Calls the cancel_bid(uint64)void ABI method.
+   *
+   * Bidder cancels their bid. Escrowed ALGO and MBR returned.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  cancelBid(params?: CallParams<AarnaRegistryArgs['obj']['cancel_bid(uint64)void'] | AarnaRegistryArgs['tuple']['cancel_bid(uint64)void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['cancel_bid(uint64)void'] | undefined]>
+
+  /**
+   * Calls the claim()void ABI method.
+   *
+  * Withdraw the ALGO and AARNA tokens held for the caller because
+  paying them out failed, with the claim box's MBR. The caller must be opted in to the token if any tokens are held.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  claim(params?: CallParams<AarnaRegistryArgs['obj']['claim()void'] | AarnaRegistryArgs['tuple']['claim()void']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['claim()void'] | undefined]>
+
   /**
    * Calls the get_project_count()uint64 ABI method.
    *
@@ -3129,67 +4873,144 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   getTotalCreditsIssued(params?: CallParams<AarnaRegistryArgs['obj']['get_total_credits_issued()uint64'] | AarnaRegistryArgs['tuple']['get_total_credits_issued()uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_total_credits_issued()uint64'] | undefined]>
 
   /**
-   * Calls the get_project_status(uint64)uint64 ABI method.
+   * Calls the get_status_counts()uint64[5] ABI method.
+   *
+   * Project count per status code (index 0 unused).
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getProjectStatus(params?: CallParams<AarnaRegistryArgs['obj']['get_project_status(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_status(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_status(uint64)uint64'] | undefined]>
+  getStatusCounts(params?: CallParams<AarnaRegistryArgs['obj']['get_status_counts()uint64[5]'] | AarnaRegistryArgs['tuple']['get_status_counts()uint64[5]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_status_counts()uint64[5]'] | undefined]>
 
   /**
-   * Calls the get_project_cid(uint64)string ABI method.
+   * Calls the get_ecosystem_totals(string)(uint64[5],uint64) ABI method.
+   *
+   * Per-status project counts and credits issued for one ecosystem.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getProjectCid(params?: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_cid(uint64)string'] | undefined]>
+  getEcosystemTotals(params?: CallParams<AarnaRegistryArgs['obj']['get_ecosystem_totals(string)(uint64[5],uint64)'] | AarnaRegistryArgs['tuple']['get_ecosystem_totals(string)(uint64[5],uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_ecosystem_totals(string)(uint64[5],uint64)'] | undefined]>
+
+  /**
+   * Calls the get_project(uint64)(address,string,string,string,string,uint64,uint64) ABI method.
+   *
+   * Full project record in one call.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getProject(params?: CallParams<AarnaRegistryArgs['obj']['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_project(uint64)(address,string,string,string,string,uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project(uint64)(address,string,string,string,string,uint64,uint64)'] | undefined]>
+
+  /**
+   * Calls the get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[] ABI method.
+   *
+  * Projects `start` .. `start + count - 1` in one call.
+  The page is cut short if it would not fit in the ABI return value; the next page starts at `start + len(result)`.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getProjectsPage(params?: CallParams<AarnaRegistryArgs['obj']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_projects_page(uint64,uint64)(address,string,string,string,string,uint64,uint64)[]'] | undefined]>
+
+  /**
+   * Calls the get_pending(uint64,uint64)uint64[] ABI method.
+   *
+  * Ids of up to `count` pending projects, oldest first, skipping the
+  first `start` entries of the review queue. The walk never leaves the queue, so the cost depends only on how many projects are pending.
+
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getPending(params?: CallParams<AarnaRegistryArgs['obj']['get_pending(uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_pending(uint64,uint64)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_pending(uint64,uint64)uint64[]'] | undefined]>
 
   /**
-   * Calls the get_project_name(uint64)string ABI method.
+   * Calls the get_account_projects(address,uint64,uint64)uint64[] ABI method.
+   *
+   * Ids of projects submitted by `account`, in submission order, paged.
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getAccountProjects(params?: CallParams<AarnaRegistryArgs['obj']['get_account_projects(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_projects(address,uint64,uint64)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_account_projects(address,uint64,uint64)uint64[]'] | undefined]>
+
+  /**
+   * Calls the get_account_listings(address,uint64,uint64)uint64[] ABI method.
+   *
+   * Ids of `account`'s open listings, paged (order not preserved).
+   *
+   * @param args The arguments for the contract call
+   * @param params Any additional parameters for the call
+   * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
+   */
+  getAccountListings(params?: CallParams<AarnaRegistryArgs['obj']['get_account_listings(address,uint64,uint64)uint64[]'] | AarnaRegistryArgs['tuple']['get_account_listings(address,uint64,uint64)uint64[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_account_listings(address,uint64,uint64)uint64[]'] | undefined]>
+
+  /**
+   * Calls the find_project_by_cid(string)uint64 ABI method.
+   *
+  * Id of the project whose evidence is `cid`, or NO_PROJECT if none.
+  The opcode budget for decoding a base32 CID is drawn from the group's fee credit when the call does not already have it.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getProjectName(params?: CallParams<AarnaRegistryArgs['obj']['get_project_name(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_name(uint64)string']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_name(uint64)string'] | undefined]>
+  findProjectByCid(params?: CallParams<AarnaRegistryArgs['obj']['find_project_by_cid(string)uint64'] | AarnaRegistryArgs['tuple']['find_project_by_cid(string)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['find_project_by_cid(string)uint64'] | undefined]>
 
   /**
-   * Calls the get_project_location(uint64)string ABI method.
+   * Calls the get_evidence_root(uint64)(byte[32],uint64) ABI method.
+   *
+   * The committed evidence root; `leaf_count` is 0 if there is none.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getProjectLocation(params?: CallParams<AarnaRegistryArgs['obj']['get_project_location(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_location(uint64)string']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_location(uint64)string'] | undefined]>
+  getEvidenceRoot(params?: CallParams<AarnaRegistryArgs['obj']['get_evidence_root(uint64)(byte[32],uint64)'] | AarnaRegistryArgs['tuple']['get_evidence_root(uint64)(byte[32],uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_evidence_root(uint64)(byte[32],uint64)'] | undefined]>
 
   /**
-   * Calls the get_project_credits(uint64)uint64 ABI method.
+   * Calls the verify_inclusion(uint64,byte[],byte[32][])bool ABI method.
+   *
+  * Whether measurement record `leaf` is covered by the project's
+  evidence root, given the sibling hashes from the leaf up. Each level costs one sha256; extra opcode budget for deep proofs is drawn from the group's fee credit when the call does not already have it.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getProjectCredits(params?: CallParams<AarnaRegistryArgs['obj']['get_project_credits(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_project_credits(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_credits(uint64)uint64'] | undefined]>
+  verifyInclusion(params?: CallParams<AarnaRegistryArgs['obj']['verify_inclusion(uint64,byte[],byte[32][])bool'] | AarnaRegistryArgs['tuple']['verify_inclusion(uint64,byte[],byte[32][])bool']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['verify_inclusion(uint64,byte[],byte[32][])bool'] | undefined]>
 
   /**
-   * Calls the get_project_submitter(uint64)address ABI method.
+   * Calls the get_project_cid(uint64)string ABI method.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getProjectSubmitter(params?: CallParams<AarnaRegistryArgs['obj']['get_project_submitter(uint64)address'] | AarnaRegistryArgs['tuple']['get_project_submitter(uint64)address']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_submitter(uint64)address'] | undefined]>
+  getProjectCid(params?: CallParams<AarnaRegistryArgs['obj']['get_project_cid(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_cid(uint64)string']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_cid(uint64)string'] | undefined]>
 
   /**
-   * Calls the get_project_ecosystem(uint64)string ABI method.
+   * Calls the get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64)) ABI method.
+   *
+  * Running totals, VWAP and last price, plus the current and previous
+  STATS_WINDOW_SECONDS trade windows as of the latest block.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getProjectEcosystem(params?: CallParams<AarnaRegistryArgs['obj']['get_project_ecosystem(uint64)string'] | AarnaRegistryArgs['tuple']['get_project_ecosystem(uint64)string']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_project_ecosystem(uint64)string'] | undefined]>
+  getMarketStats(params?: CallParams<AarnaRegistryArgs['obj']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | AarnaRegistryArgs['tuple']['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_market_stats()(uint64,uint64,uint64,uint64,uint64,uint64,(uint64,uint64,uint64,uint64,uint64),(uint64,uint64,uint64,uint64,uint64))'] | undefined]>
 
   /**
    * Calls the get_listing_count()uint64 ABI method.
@@ -3201,40 +5022,54 @@ export type AarnaRegistryComposer<TReturns extends [...any[]] = []> = {
   getListingCount(params?: CallParams<AarnaRegistryArgs['obj']['get_listing_count()uint64'] | AarnaRegistryArgs['tuple']['get_listing_count()uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listing_count()uint64'] | undefined]>
 
   /**
-   * Calls the get_listing_seller(uint64)address ABI method.
+   * Calls the get_best_ask()(uint64,address,uint64,uint64,uint64) ABI method.
+   *
+  * The cheapest active listing (oldest first among equal prices),
+  passing over expired listings not yet swept. With an empty order book, `listing_id` is NO_LISTING and `amount` 0.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getListingSeller(params?: CallParams<AarnaRegistryArgs['obj']['get_listing_seller(uint64)address'] | AarnaRegistryArgs['tuple']['get_listing_seller(uint64)address']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listing_seller(uint64)address'] | undefined]>
+  getBestAsk(params?: CallParams<AarnaRegistryArgs['obj']['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_ask()(uint64,address,uint64,uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_best_ask()(uint64,address,uint64,uint64,uint64)'] | undefined]>
 
   /**
-   * Calls the get_listing_amount(uint64)uint64 ABI method.
+   * Calls the get_claim(address)(uint64,uint64) ABI method.
+   *
+   * What the app holds for `account` to `claim`; zero if nothing.
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getListingAmount(params?: CallParams<AarnaRegistryArgs['obj']['get_listing_amount(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_amount(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listing_amount(uint64)uint64'] | undefined]>
+  getClaim(params?: CallParams<AarnaRegistryArgs['obj']['get_claim(address)(uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_claim(address)(uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_claim(address)(uint64,uint64)'] | undefined]>
 
   /**
-   * Calls the get_listing_price(uint64)uint64 ABI method.
+   * Calls the get_best_bid()(uint64,address,uint64,uint64) ABI method.
+   *
+  * The highest standing bid (oldest first among equal prices).
+  With no bids, `bid_id` is NO_BID and `quantity` 0.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getListingPrice(params?: CallParams<AarnaRegistryArgs['obj']['get_listing_price(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_price(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listing_price(uint64)uint64'] | undefined]>
+  getBestBid(params?: CallParams<AarnaRegistryArgs['obj']['get_best_bid()(uint64,address,uint64,uint64)'] | AarnaRegistryArgs['tuple']['get_best_bid()(uint64,address,uint64,uint64)']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_best_bid()(uint64,address,uint64,uint64)'] | undefined]>
 
   /**
-   * Calls the get_listing_active(uint64)uint64 ABI method.
+   * Calls the get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[] ABI method.
+   *
+  * Up to `count` active listings in ask order (cheapest first, oldest
+  first among equal prices), skipping the first `start`. The walk follows the ask index past expired listings not yet swept, so the cost depends only on how many listings are open. A page of up to MAX_LISTING_PAGE listings always fits the ABI return value; a longer one may be cut short, and the next page starts at `start + len(result)`.
+
    *
    * @param args The arguments for the contract call
    * @param params Any additional parameters for the call
    * @returns The typed transaction composer so you can fluently chain multiple calls or call execute to execute all queued up transactions
    */
-  getListingActive(params?: CallParams<AarnaRegistryArgs['obj']['get_listing_active(uint64)uint64'] | AarnaRegistryArgs['tuple']['get_listing_active(uint64)uint64']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_listing_active(uint64)uint64'] | undefined]>
+  getActiveListings(params?: CallParams<AarnaRegistryArgs['obj']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | AarnaRegistryArgs['tuple']['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]']>): AarnaRegistryComposer<[...TReturns, AarnaRegistryReturns['get_active_listings(uint64,uint64)(uint64,address,uint64,uint64,uint64)[]'] | undefined]>
 
   /**
    * Makes a clear_state call to an existing instance of the AarnaRegistry smart contract.
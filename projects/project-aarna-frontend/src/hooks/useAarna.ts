@@ -7,7 +7,7 @@ import {
     getAlgodConfigFromViteEnvironment,
     getIndexerConfigFromViteEnvironment,
 } from '../utils/network/getAlgoClientConfigs'
-import { AarnaRegistryFactory } from '../contracts/AarnaRegistry'
+import { AarnaRegistryFactory, ListingViewFromTuple, ProjectFromTuple } from '../contracts/AarnaRegistry'
 import { VALIDATOR_ADDRESS } from '../constants/roles'
 
 export interface AarnaProject {
@@ -32,6 +32,38 @@ export interface AarnaListing {
 const LS_APP_ID = 'aarna_app_id'
 const LS_ASSET_ID = 'aarna_asset_id'
 
+// Sentinel id the contract uses for "no listing" (an empty ask index)
+const NO_LISTING = 0xFFFF_FFFF_FFFF_FFFFn
+// Crossing bids a new listing may fill before it rests (contract MAX_FILLS is 14)
+const LIST_MAX_FILLS = 4n
+// Ids requested per page; the contract cuts a page short to fit its return value
+const PAGE_SIZE = 64n
+// Listings per page: the contract's MAX_LISTING_PAGE, which is never cut short
+const LISTING_PAGE = 15n
+// Listing pages simulated together in one group
+const LISTING_PAGES_PER_GROUP = 8
+// The most extra opcode budget simulate grants a group (16 x 20,000)
+const SIMULATE_EXTRA_BUDGET = 320_000
+
+// Box MBR, as the contract's box layouts: 2500 + 400 per key and value byte
+const boxMbr = (keyBytes: number, valueBytes: number) => 2_500 + 400 * (keyBytes + valueBytes)
+// An account index ("sp"/"sl" + address): its length box plus a new page holding one id
+const INDEX_MBR = boxMbr(2 + 32, 8) + boxMbr(2 + 32 + 2, 8)
+const LISTING_MBR = boxMbr(1 + 8, 32 + 6 * 8) + INDEX_MBR
+
+const utf8 = new TextEncoder()
+
+/** Bytes the contract stores for `cid`: a base32 CIDv1 ("b…") is kept binary. */
+function packedCidLength(cid: string): number {
+    return cid.startsWith('b') ? Math.floor(((cid.length - 1) * 5) / 8) : utf8.encode(cid).length
+}
+
+/** The most MBR a submission can add: its record, CID index, queue link, ecosystem totals and submitter index. */
+function submitMbr(name: string, location: string, cid: string): number {
+    const record = 32 + 8 + 1 + 3 * (2 + 2) + packedCidLength(cid) + utf8.encode(name).length + utf8.encode(location).length
+    return boxMbr(1 + 8, record) + boxMbr(1 + 32, 8) + boxMbr(1 + 8, 16) + boxMbr(1 + 8, 5 * 8 + 8) + INDEX_MBR
+}
+
 export function useAarna() {
     const { transactionSigner, activeAddress } = useWallet()
     const { enqueueSnackbar } = useSnackbar()
@@ -84,18 +116,20 @@ export function useAarna() {
         const msg = e?.message || String(e)
         if (msg.includes('unauthorized: admin only')) return 'Only the admin can perform this action'
         if (msg.includes('unauthorized: validator only')) return 'Only the validator can perform this action'
-        if (msg.includes('max projects reached')) return 'Maximum of 4 projects reached'
-        if (msg.includes('max listings reached')) return 'Maximum of 4 listings reached'
+        if (msg.includes('duplicate evidence cid')) return 'A project with this evidence CID already exists'
+        if (msg.includes('unknown ecosystem')) return 'Unsupported ecosystem'
+        if (msg.includes('invalid cid') || msg.includes('cid too long')) return 'The evidence CID is not valid'
         if (msg.includes('project not pending')) return 'Project is not in pending status'
         if (msg.includes('project not verified')) return 'Project must be verified before issuing credits'
-        if (msg.includes('listing not active')) return 'This listing is no longer active'
+        if (msg.includes('listing not active') || msg.includes('listing expired')) return 'This listing is no longer active'
+        if (msg.includes('insufficient mbr payment')) return 'Not enough ALGO sent to cover the storage deposit'
         if (msg.includes('insufficient payment')) return 'Not enough ALGO sent for this purchase'
         if (msg.includes('only seller can cancel')) return 'Only the seller can cancel this listing'
         if (msg.includes('no AARNA token')) return 'Create the AARNA token first'
         // Catch raw AVM assert failures from simulate
         if (msg.includes('assert failed') || msg.includes('Error resolving execution info via simulate')) {
-            if (msg.includes('pc=4245') || msg.includes('pc=3507')) return 'Unauthorized: only the validator wallet can approve/reject projects'
-            if (msg.includes('pc=3497') || msg.includes('pc=2757')) return 'Unauthorized: only the admin wallet can perform this action'
+            if (msg.includes('pc=5221')) return 'Unauthorized: only the validator wallet can approve/reject projects'
+            if (msg.includes('pc=5211')) return 'Unauthorized: only the admin wallet can perform this action'
             return 'Transaction failed â€” the project may already be processed, or your wallet is not authorized'
         }
         return msg.length > 120 ? msg.slice(0, 120) + 'â€¦' : msg
@@ -115,25 +149,22 @@ export function useAarna() {
         try {
             const state = await client.state.global.getAll()
             const count = Number(state.projectCount ?? 0)
+            // Projects live in boxes; page through them with the batch getter
             const onChain: AarnaProject[] = []
-            for (let i = 0; i < Math.min(count, 4); i++) {
-                const name = state[`p${i}Name`]?.asString?.() ?? state[`p${i}Name`] ?? ''
-                const location = state[`p${i}Location`]?.asString?.() ?? state[`p${i}Location`] ?? ''
-                const ecosystem = state[`p${i}Ecosystem`]?.asString?.() ?? state[`p${i}Ecosystem`] ?? ''
-                const cid = state[`p${i}Cid`]?.asString?.() ?? state[`p${i}Cid`] ?? ''
-                const statusNum = Number(state[`p${i}Status`] ?? 0)
-                const credits = Number(state[`p${i}Credits`] ?? 0)
-                const submitter = state[`p${i}Submitter`] ?? ''
-                if (name) {
+            while (onChain.length < count) {
+                const page = await client.getProjectsPage({ args: { start: BigInt(onChain.length), count: PAGE_SIZE } })
+                if (!page.length) break
+                for (const tuple of page) {
+                    const project = ProjectFromTuple(tuple)
                     onChain.push({
-                        id: i,
-                        name: typeof name === 'string' ? name : String(name),
-                        location: typeof location === 'string' ? location : String(location),
-                        ecosystem: typeof ecosystem === 'string' ? ecosystem : String(ecosystem),
-                        cid: typeof cid === 'string' ? cid : String(cid),
-                        status: STATUS_MAP[statusNum] ?? 'pending',
-                        credits,
-                        submitter: typeof submitter === 'string' ? submitter : String(submitter),
+                        id: onChain.length,
+                        name: project.name,
+                        location: project.location,
+                        ecosystem: project.ecosystem,
+                        cid: project.cid,
+                        status: STATUS_MAP[Number(project.status)] ?? 'pending',
+                        credits: Number(project.credits),
+                        submitter: project.submitter,
                     })
                 }
             }
@@ -148,24 +179,40 @@ export function useAarna() {
                 localStorage.setItem(LS_ASSET_ID, onChainAssetId.toString())
             }
 
-            // Fetch listings
-            const lCount = Number(state.listingCount ?? 0)
+            // Walk the ask index for open listings. Full pages are never cut
+            // short, so several are simulated in one group and the first
+            // short page ends the book.
             const onChainListings: AarnaListing[] = []
-            for (let i = 0; i < Math.min(lCount, 4); i++) {
-                const seller = state[`l${i}Seller`] ?? ''
-                const amount = Number(state[`l${i}Amount`] ?? 0)
-                const price = Number(state[`l${i}Price`] ?? 0)
-                const active = Number(state[`l${i}Active`] ?? 0) === 1
-                onChainListings.push({
-                    id: i,
-                    seller: typeof seller === 'string' ? seller : String(seller),
-                    amount,
-                    pricePerToken: price,
-                    active,
+            for (let done = false; !done;) {
+                const first = BigInt(onChainListings.length)
+                const group = client.newGroup()
+                for (let i = 0; i < LISTING_PAGES_PER_GROUP; i++) {
+                    group.getActiveListings({ args: { start: first + BigInt(i) * LISTING_PAGE, count: LISTING_PAGE } })
+                }
+                const { returns } = await group.simulate({
+                    skipSignatures: true,
+                    allowUnnamedResources: true,
+                    extraOpcodeBudget: SIMULATE_EXTRA_BUDGET,
                 })
+                for (const page of returns) {
+                    for (const tuple of page) {
+                        const listing = ListingViewFromTuple(tuple)
+                        onChainListings.push({
+                            id: Number(listing.listing_id),
+                            seller: listing.seller,
+                            amount: Number(listing.amount),
+                            pricePerToken: Number(listing.price),
+                            active: true,
+                        })
+                    }
+                    if (BigInt(page.length) < LISTING_PAGE) {
+                        done = true
+                        break
+                    }
+                }
             }
             setListings(onChainListings)
-            setListingCount(lCount)
+            setListingCount(Number(state.listingCount ?? 0))
         } catch (e) {
             console.warn('Could not fetch on-chain state:', e)
         }
@@ -271,7 +318,18 @@ export function useAarna() {
         if (!ensureWallet() || !needClient()) return undefined
         setBusy(true)
         try {
-            const r = await appClient.send.submitProject({ args: { name, location, ecosystem, cid }, sender: activeAddress!, signer: transactionSigner })
+            // The payment covers the boxes the project adds; packing the CID
+            // draws op-up budget from the group's fee credit
+            const mbrPayment = algorand.createTransaction.payment({
+                sender: activeAddress!, receiver: appClient.appAddress,
+                amount: AlgoAmount.MicroAlgo(submitMbr(name, location, cid)),
+            })
+            const r = await appClient.send.submitProject({
+                args: { name, location, ecosystem, cid, mbrPayment },
+                sender: activeAddress!, signer: transactionSigner,
+                populateAppCallResources: true,
+                extraFee: AlgoAmount.MicroAlgo(4_000),
+            })
             const idx = Number(r?.return ?? 0)
             setProjects(prev => [...prev, { id: idx, name, location, ecosystem, cid, status: 'pending', credits: 0, submitter: activeAddress || '' }])
             setProjectCount(idx + 1)
@@ -279,7 +337,7 @@ export function useAarna() {
             return idx
         } catch (e: any) { enqueueSnackbar(parseError(e), { variant: 'error' }); return undefined }
         finally { setBusy(false) }
-    }, [ensureWallet, needClient, appClient, activeAddress, enqueueSnackbar, parseError])
+    }, [ensureWallet, needClient, appClient, algorand, activeAddress, transactionSigner, enqueueSnackbar, parseError])
 
     const approveProject = useCallback(async (projectId: number, credits: number) => {
         if (!ensureWallet() || !needClient()) return
@@ -299,17 +357,23 @@ export function useAarna() {
                 console.log('[Aarna] Validator synced before approve')
             } catch (_) { /* not admin â€” skip */ }
 
+            // The queue entry's MBR is refunded to the submitter by an inner
+            // payment: reference their account and cover its fee
+            const submitter = projects.find(p => p.id === projectId)?.submitter
             await appClient.send.approveProject({
                 args: { projectId: BigInt(projectId), credits: BigInt(credits) },
                 sender: activeAddress!,
                 signer: transactionSigner,
+                populateAppCallResources: true,
+                extraFee: AlgoAmount.MicroAlgo(1_000),
+                accountReferences: submitter ? [submitter] : [],
             })
             updateProjectStatus(projectId, 'verified', credits)
             await refreshProjects()
             enqueueSnackbar(`Project #${projectId} approved!`, { variant: 'success' })
         } catch (e: any) { enqueueSnackbar(parseError(e), { variant: 'error' }) }
         finally { setBusy(false) }
-    }, [ensureWallet, needClient, appClient, activeAddress, transactionSigner, updateProjectStatus, refreshProjects, enqueueSnackbar, parseError])
+    }, [ensureWallet, needClient, appClient, activeAddress, transactionSigner, projects, updateProjectStatus, refreshProjects, enqueueSnackbar, parseError])
 
     const rejectProject = useCallback(async (projectId: number) => {
         if (!ensureWallet() || !needClient()) return
@@ -329,17 +393,23 @@ export function useAarna() {
                 console.log('[Aarna] Validator synced before reject')
             } catch (_) { /* not admin â€” skip */ }
 
+            // The queue entry's MBR is refunded to the submitter by an inner
+            // payment: reference their account and cover its fee
+            const submitter = projects.find(p => p.id === projectId)?.submitter
             await appClient.send.rejectProject({
                 args: { projectId: BigInt(projectId) },
                 sender: activeAddress!,
                 signer: transactionSigner,
+                populateAppCallResources: true,
+                extraFee: AlgoAmount.MicroAlgo(1_000),
+                accountReferences: submitter ? [submitter] : [],
             })
             updateProjectStatus(projectId, 'rejected')
             await refreshProjects()
             enqueueSnackbar(`Project #${projectId} rejected`, { variant: 'info' })
         } catch (e: any) { enqueueSnackbar(parseError(e), { variant: 'error' }) }
         finally { setBusy(false) }
-    }, [ensureWallet, needClient, appClient, activeAddress, transactionSigner, updateProjectStatus, refreshProjects, enqueueSnackbar, parseError])
+    }, [ensureWallet, needClient, appClient, activeAddress, transactionSigner, projects, updateProjectStatus, refreshProjects, enqueueSnackbar, parseError])
 
     const issueCredits = useCallback(async (projectId: number) => {
         if (!ensureWallet() || !needClient()) return
@@ -396,10 +466,8 @@ export function useAarna() {
 
 
     const [onChainBalance, setOnChainBalance] = useState<number>(0)
-    const [balanceAdjustments, setBalanceAdjustments] = useState<Record<string, number>>({})
-
 
-    const tokenBalance = onChainBalance + (activeAddress ? (balanceAdjustments[activeAddress] || 0) : 0)
+    const tokenBalance = onChainBalance
 
     const fetchTokenBalance = useCallback(async () => {
         if (!activeAddress || !assetId) { setOnChainBalance(0); return }
@@ -420,20 +488,45 @@ export function useAarna() {
     }, [activeAddress, assetId])
 
     const listForSale = useCallback(async (amount: number, pricePerToken: number) => {
-        if (!ensureWallet()) return
+        if (!ensureWallet() || !needClient()) return
         setBusy(true)
         try {
-            await new Promise(r => setTimeout(r, 600))
-            const idx = listingCount
-            setListings(prev => [...prev, { id: idx, seller: activeAddress || '', amount, pricePerToken, active: true }])
-            setListingCount(idx + 1)
-            enqueueSnackbar(`Listed ${amount} AARNA tokens at ${pricePerToken} ÂµALGO each!`, { variant: 'success' })
+            // Hint the ask index with the dearest open listing at or below our price
+            const hint = listings
+                .filter(l => l.active && l.pricePerToken <= pricePerToken)
+                .reduce<AarnaListing | undefined>((best, l) => (!best || l.pricePerToken >= best.pricePerToken ? l : best), undefined)
+            const mbrPayment = algorand.createTransaction.payment({
+                sender: activeAddress!, receiver: appClient.appAddress,
+                amount: AlgoAmount.MicroAlgo(LISTING_MBR),
+            })
+            const r = await appClient.send.listForSale({
+                args: {
+                    amount: BigInt(amount),
+                    pricePerToken: BigInt(pricePerToken),
+                    expiresRound: 0n,
+                    afterHint: hint ? BigInt(hint.id) : NO_LISTING,
+                    maxFills: LIST_MAX_FILLS,
+                    mbrPayment,
+                },
+                sender: activeAddress!, signer: transactionSigner,
+                populateAppCallResources: true,
+                // Crossing bids are filled first, with op-up budget drawn from the fee
+                coverAppCallInnerTransactionFees: true,
+                maxFee: AlgoAmount.MicroAlgo(17_000),
+            })
+            await refreshProjects()
+            await fetchTokenBalance()
+            if (r?.return === NO_LISTING) {
+                enqueueSnackbar(`Sold ${amount} AARNA tokens to standing bids!`, { variant: 'success' })
+            } else {
+                enqueueSnackbar(`Listed ${amount} AARNA tokens at ${pricePerToken} ÂµALGO each!`, { variant: 'success' })
+            }
         } catch (e: any) { enqueueSnackbar(parseError(e), { variant: 'error' }) }
         finally { setBusy(false) }
-    }, [ensureWallet, activeAddress, listingCount, enqueueSnackbar, parseError])
+    }, [ensureWallet, needClient, appClient, algorand, activeAddress, transactionSigner, listings, refreshProjects, fetchTokenBalance, enqueueSnackbar, parseError])
 
     const buyListing = useCallback(async (listingId: number) => {
-        if (!ensureWallet()) return
+        if (!ensureWallet() || !needClient()) return
         const listing = listings.find(l => l.id === listingId)
         if (!listing || !listing.active) {
             enqueueSnackbar('Listing not available', { variant: 'warning' })
@@ -441,29 +534,40 @@ export function useAarna() {
         }
         setBusy(true)
         try {
-            await new Promise(r => setTimeout(r, 600))
-            setListings(prev => prev.map(l => l.id === listingId ? { ...l, active: false } : l))
-
-            setBalanceAdjustments(prev => ({
-                ...prev,
-                [listing.seller]: (prev[listing.seller] || 0) - listing.amount,
-                [activeAddress!]: (prev[activeAddress!] || 0) + listing.amount,
-            }))
+            const payment = algorand.createTransaction.payment({
+                sender: activeAddress!, receiver: appClient.appAddress,
+                amount: AlgoAmount.MicroAlgo(listing.amount * listing.pricePerToken),
+            })
+            await appClient.send.buyListing({
+                args: { listingId: BigInt(listingId), quantity: BigInt(listing.amount), payment },
+                sender: activeAddress!, signer: transactionSigner,
+                populateAppCallResources: true,
+                coverAppCallInnerTransactionFees: true,
+                maxFee: AlgoAmount.MicroAlgo(4_000),
+            })
+            await refreshProjects()
+            await fetchTokenBalance()
             enqueueSnackbar(`Bought ${listing.amount} AARNA tokens from ${listing.seller.slice(0, 6)}â€¦!`, { variant: 'success' })
         } catch (e: any) { enqueueSnackbar(parseError(e), { variant: 'error' }) }
         finally { setBusy(false) }
-    }, [ensureWallet, activeAddress, listings, enqueueSnackbar, parseError])
+    }, [ensureWallet, needClient, appClient, algorand, activeAddress, transactionSigner, listings, refreshProjects, fetchTokenBalance, enqueueSnackbar, parseError])
 
     const cancelListing = useCallback(async (listingId: number) => {
-        if (!ensureWallet()) return
+        if (!ensureWallet() || !needClient()) return
         setBusy(true)
         try {
-            await new Promise(r => setTimeout(r, 400))
-            setListings(prev => prev.map(l => l.id === listingId ? { ...l, active: false } : l))
+            await appClient.send.cancelListing({
+                args: { listingId: BigInt(listingId) },
+                sender: activeAddress!, signer: transactionSigner,
+                populateAppCallResources: true,
+                extraFee: AlgoAmount.MicroAlgo(2_000),
+            })
+            await refreshProjects()
+            await fetchTokenBalance()
             enqueueSnackbar('Listing cancelled', { variant: 'info' })
         } catch (e: any) { enqueueSnackbar(parseError(e), { variant: 'error' }) }
         finally { setBusy(false) }
-    }, [ensureWallet, enqueueSnackbar, parseError])
+    }, [ensureWallet, needClient, appClient, activeAddress, transactionSigner, refreshProjects, fetchTokenBalance, enqueueSnackbar, parseError])
 
     return {
         appId, assetId, busy, projectCount, projects, totalCreditsIssued,